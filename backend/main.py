@@ -6,7 +6,9 @@ All routes require valid JWT with tenant context.
 """
 
 import os
+import asyncio
 import logging
+import signal
 from pathlib import Path
 from contextlib import asynccontextmanager
 
@@ -22,6 +24,7 @@ from src.api.routes import health
 from src.api.routes import debug
 from src.api.routes import billing
 from src.api.routes import webhooks_shopify
+from src.api.routes import webhooks_airbyte
 from src.api.routes import admin_plans
 from src.api.routes import admin_backfills
 from src.api.routes import backfills_status
@@ -58,8 +61,12 @@ from src.api.routes import datasets
 from src.api.routes import custom_dashboards
 from src.api.routes import dashboard_shares
 from src.api.routes import report_templates
+from src.api.routes import live_events
 from src.platform.db_readiness import REQUIRED_IDENTITY_TABLES, check_required_tables
-from src.database.session import get_db_session_sync
+from src.database.session import get_db_session_sync, dispose_engines
+from src.monitoring.cache_metrics import CACHE_METRICS_INTERVAL_SECONDS, CacheMetrics
+from src.platform.audit_writer import AUDIT_WRITER_ENABLED, get_audit_writer
+from src.config.registry import get_config_registry
 
 # Configure structured logging
 logging.basicConfig(
@@ -176,10 +183,33 @@ async def lifespan(app: FastAPI):
         },
     )
 
+    # Background group-commit audit writer (drained on shutdown)
+    if AUDIT_WRITER_ENABLED and app.state.database_configured:
+        get_audit_writer().start()
+
+    # Periodic in-process cache hit/miss/eviction metrics
+    cache_metrics_task = None
+    if CACHE_METRICS_INTERVAL_SECONDS > 0:
+        cache_metrics_task = asyncio.create_task(
+            CacheMetrics.get_instance().run_periodic(CACHE_METRICS_INTERVAL_SECONDS)
+        )
+
+    # SIGHUP re-reads config files held by the config registry
+    try:
+        asyncio.get_running_loop().add_signal_handler(
+            signal.SIGHUP, get_config_registry().request_reload
+        )
+    except (AttributeError, NotImplementedError, RuntimeError):
+        logger.debug("SIGHUP config reload not available on this platform")
+
     yield
 
     # Shutdown
     logger.info("Shutting down MarkInsight API")
+    if cache_metrics_task is not None:
+        cache_metrics_task.cancel()
+    await asyncio.to_thread(get_audit_writer().drain)
+    await dispose_engines()
 
 
 # Create FastAPI app
@@ -226,6 +256,9 @@ app.include_router(billing.router)
 # Include Shopify webhook routes (uses HMAC verification, not JWT)
 app.include_router(webhooks_shopify.router)
 
+# Include Airbyte sync notification webhook (shared-secret token, not JWT)
+app.include_router(webhooks_airbyte.router)
+
 # Include admin routes (requires admin role)
 app.include_router(admin_plans.router)
 
@@ -335,6 +368,9 @@ app.include_router(custom_dashboards.router)
 app.include_router(dashboard_shares.router)
 app.include_router(report_templates.router)
 
+# Include live event stream (SSE push for counts and sync progress)
+app.include_router(live_events.router)
+
 # Include dataset discovery + chart preview routes (requires authentication)
 # Phase 2A/2B - Dataset Discovery & Chart Preview
 app.include_router(datasets.router)
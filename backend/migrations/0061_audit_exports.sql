@@ -0,0 +1,55 @@
+-- GA Audit Log Streaming Export
+-- Migration 0061 - Async export job queue + keyset export indexes
+--
+-- Exports stream ga_audit_logs in (created_at, id) order with keyset
+-- pagination, so every page is an index range scan regardless of depth.
+-- Exports above the sync threshold are queued in ga_audit_exports and
+-- produced by the audit export worker (FOR UPDATE SKIP LOCKED claiming).
+--
+-- Usage: psql $DATABASE_URL -f 0061_audit_exports.sql
+
+-- ==========================================================================
+-- Keyset export indexes
+-- ==========================================================================
+
+CREATE INDEX IF NOT EXISTS ix_ga_audit_tenant_created_id
+    ON ga_audit_logs(tenant_id, created_at, id);
+
+CREATE INDEX IF NOT EXISTS ix_ga_audit_created_id
+    ON ga_audit_logs(created_at, id);
+
+-- ==========================================================================
+-- Create ga_audit_exports table
+-- ==========================================================================
+
+CREATE TABLE IF NOT EXISTS ga_audit_exports (
+    id              VARCHAR(36)     PRIMARY KEY,
+    tenant_id       VARCHAR(255)    NOT NULL,
+    is_super_admin  BOOLEAN         NOT NULL DEFAULT FALSE,
+    format          VARCHAR(20)     NOT NULL,
+    compress        BOOLEAN         NOT NULL DEFAULT FALSE,
+    filters         JSONB           NOT NULL DEFAULT '{}',
+    status          VARCHAR(20)     NOT NULL DEFAULT 'queued',
+    record_count    INTEGER,
+    storage_key     VARCHAR(512),
+    error           TEXT,
+    claimed_by      VARCHAR(255),
+    created_at      TIMESTAMPTZ     NOT NULL DEFAULT NOW(),
+    started_at      TIMESTAMPTZ,
+    completed_at    TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS ix_ga_audit_exports_tenant_id
+    ON ga_audit_exports(tenant_id);
+
+CREATE INDEX IF NOT EXISTS ix_ga_audit_exports_status_created
+    ON ga_audit_exports(status, created_at);
+
+COMMENT ON TABLE ga_audit_exports IS
+    'Queued GA audit log exports produced by the audit export worker';
+
+-- ==========================================================================
+-- Migration Complete
+-- ==========================================================================
+
+SELECT 'GA audit export migration completed successfully' AS status;
@@ -0,0 +1,49 @@
+-- Tenant Health Snapshots
+-- Migration 0062 - Materialized per-tenant data health
+--
+-- One row per tenant with the merchant health state and the per-source
+-- availability it was derived from. Guards and health endpoints read this
+-- row (via Redis) instead of recomputing freshness on every request.
+-- Recomputed on sync completion/failure and DQ incident open/resolve;
+-- the periodic sweep recomputes rows whose refresh_due_at has passed.
+--
+-- Usage: psql $DATABASE_URL -f 0062_tenant_health_snapshots.sql
+
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+
+-- ==========================================================================
+-- Create tenant_health_snapshots table
+-- ==========================================================================
+
+CREATE TABLE IF NOT EXISTS tenant_health_snapshots (
+    id                  VARCHAR(255) PRIMARY KEY DEFAULT uuid_generate_v4()::TEXT,
+    tenant_id           VARCHAR(255) NOT NULL,
+
+    -- Computed states
+    merchant_state      VARCHAR(20)  NOT NULL,
+    availability_state  VARCHAR(20)  NOT NULL,
+    quality_state       VARCHAR(20)  NOT NULL,
+    sources             JSON         NOT NULL DEFAULT '[]',
+
+    -- Evaluation metadata
+    billing_tier        VARCHAR(50)  NOT NULL DEFAULT 'free',
+    trigger             VARCHAR(50),
+    computed_at         TIMESTAMP WITH TIME ZONE NOT NULL,
+    refresh_due_at      TIMESTAMP WITH TIME ZONE NOT NULL,
+
+    -- Standard timestamps
+    created_at          TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    updated_at          TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+);
+
+-- One row per tenant (upsert target)
+CREATE UNIQUE INDEX IF NOT EXISTS ix_tenant_health_snapshots_tenant
+    ON tenant_health_snapshots(tenant_id);
+
+-- Sweep: rows whose state can change with time alone
+CREATE INDEX IF NOT EXISTS ix_tenant_health_snapshots_refresh_due
+    ON tenant_health_snapshots(refresh_due_at);
+
+COMMENT ON TABLE tenant_health_snapshots IS
+    'Materialized merchant data health per tenant. '
+    'Written by TenantHealthSnapshotService.refresh(); read by health guards.';
@@ -0,0 +1,261 @@
+-- Monthly Range Partitioning for Operational Tables
+-- Migration 0063 - Partition dq_results, sync_runs and audit_logs by month
+--
+-- Retention on these tables deleted rows in 1000-row batches, which churns
+-- WAL, bloats the heap and leaves vacuum behind. After this migration each
+-- table is range-partitioned by month on its timestamp column and retention
+-- detaches and drops whole partitions (src/database/partitioning.py).
+--
+-- Conversion is online. The existing table is not rewritten; it is renamed
+-- to <table>_legacy and attached as the partition covering everything
+-- before the first monthly partition:
+--   1. prepare_partition_conversion() records the boundary (start of the
+--      next month) and adds a NOT VALID CHECK bounding existing rows
+--   2. VALIDATE CONSTRAINT and CREATE UNIQUE INDEX CONCURRENTLY scan the
+--      table without blocking writes
+--   3. convert_to_partitioned() swaps in the partitioned parent in one short
+--      transaction; the validated CHECK and pre-built indexes mean ATTACH
+--      does not scan or build anything
+--
+-- Primary keys gain the partition column (PostgreSQL requires it), so
+-- dq_incidents.result_id becomes a soft reference to dq_results.
+-- dq_incidents and backfill_jobs are not partitioned: only resolved or
+-- completed rows expire, so whole months cannot be dropped.
+--
+-- The raw.* tables are not partitioned either: their deduplication keys
+-- (e.g. tenant_id, source_account_id, shopify_order_id) do not include
+-- extracted_at, and a unique constraint on a partitioned table must.
+--
+-- Requires PostgreSQL 13+ (row triggers on partitioned tables).
+-- Not transactional as a whole (CONCURRENTLY); run once, without -1:
+-- Usage: psql $DATABASE_URL -f 0063_partition_operational_tables.sql
+
+-- ==========================================================================
+-- Conversion bookkeeping
+-- ==========================================================================
+
+CREATE TABLE IF NOT EXISTS partition_conversions (
+    table_name      VARCHAR(255) PRIMARY KEY,
+    column_name     VARCHAR(255) NOT NULL,
+    boundary        TIMESTAMP WITH TIME ZONE NOT NULL,
+    prepared_at     TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    converted_at    TIMESTAMP WITH TIME ZONE
+);
+
+COMMENT ON TABLE partition_conversions IS
+    'Tables converted to monthly range partitions; boundary is the upper bound of the <table>_legacy partition.';
+
+-- ==========================================================================
+-- Step 1: bound existing rows with a NOT VALID check
+-- ==========================================================================
+
+CREATE OR REPLACE FUNCTION prepare_partition_conversion(
+    p_table TEXT,
+    p_column TEXT
+)
+RETURNS TIMESTAMP WITH TIME ZONE AS $$
+DECLARE
+    v_boundary TIMESTAMP WITH TIME ZONE;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(p_table)
+    ) THEN
+        RAISE NOTICE '% is already partitioned', p_table;
+        RETURN NULL;
+    END IF;
+
+    -- Start of the next UTC month; pushed one month further near month end
+    -- so the steps below cannot straddle the boundary
+    v_boundary := date_trunc('month', (NOW() + INTERVAL '7 days') AT TIME ZONE 'UTC')
+        AT TIME ZONE 'UTC' + INTERVAL '1 month';
+
+    INSERT INTO partition_conversions (table_name, column_name, boundary)
+    VALUES (p_table, p_column, v_boundary)
+    ON CONFLICT (table_name) DO UPDATE
+        SET column_name = EXCLUDED.column_name,
+            boundary = EXCLUDED.boundary,
+            prepared_at = NOW();
+
+    EXECUTE format('ALTER TABLE %I DROP CONSTRAINT IF EXISTS %I',
+        p_table, p_table || '_legacy_bound');
+    EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I CHECK (%I IS NOT NULL AND %I < %L) NOT VALID',
+        p_table, p_table || '_legacy_bound', p_column, p_column, v_boundary);
+
+    RETURN v_boundary;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ==========================================================================
+-- Step 3: swap in the partitioned parent
+-- ==========================================================================
+
+CREATE OR REPLACE FUNCTION convert_to_partitioned(
+    p_table TEXT,
+    p_key TEXT[],
+    p_months_ahead INTEGER DEFAULT 3
+)
+RETURNS VOID AS $$
+DECLARE
+    v_legacy TEXT := p_table || '_legacy';
+    v_column TEXT;
+    v_boundary TIMESTAMP WITH TIME ZONE;
+    v_old_pkey TEXT;
+    v_comment TEXT;
+    v_indexes TEXT[];
+    v_fkeys TEXT[];
+    v_triggers TEXT[];
+    v_grants TEXT[];
+    v_stmt TEXT;
+    v_rec RECORD;
+    v_month TIMESTAMP WITH TIME ZONE;
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(p_table)
+    ) THEN
+        RAISE NOTICE '% is already partitioned', p_table;
+        RETURN;
+    END IF;
+
+    SELECT column_name, boundary INTO v_column, v_boundary
+    FROM partition_conversions WHERE table_name = p_table;
+    IF NOT FOUND THEN
+        RAISE EXCEPTION 'Run prepare_partition_conversion(%) first', p_table;
+    END IF;
+
+    EXECUTE format('LOCK TABLE %I IN ACCESS EXCLUSIVE MODE', p_table);
+
+    -- Capture definitions while they still name the original table, so they
+    -- can be replayed against the new parent
+    SELECT conname INTO v_old_pkey FROM pg_constraint
+    WHERE conrelid = p_table::regclass AND contype = 'p';
+
+    SELECT array_agg(pg_get_indexdef(i.indexrelid)) INTO v_indexes
+    FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+    WHERE i.indrelid = p_table::regclass
+      AND NOT i.indisprimary
+      AND c.relname <> v_legacy || '_pkey';
+
+    SELECT array_agg(format('ALTER TABLE %I ADD CONSTRAINT %I %s',
+            p_table, conname, pg_get_constraintdef(oid)))
+    INTO v_fkeys
+    FROM pg_constraint WHERE conrelid = p_table::regclass AND contype = 'f';
+
+    SELECT array_agg(pg_get_triggerdef(oid)) INTO v_triggers
+    FROM pg_trigger WHERE tgrelid = p_table::regclass AND NOT tgisinternal;
+
+    SELECT array_agg(format('GRANT %s ON %I TO %s', privilege_type, p_table,
+            CASE WHEN grantee = 'PUBLIC' THEN 'PUBLIC' ELSE quote_ident(grantee) END))
+    INTO v_grants
+    FROM information_schema.role_table_grants
+    WHERE table_schema = current_schema() AND table_name = p_table
+      AND grantee <> current_user;
+
+    v_comment := obj_description(p_table::regclass, 'pg_class');
+
+    -- Retire the original table as the legacy partition
+    EXECUTE format('ALTER TABLE %I RENAME TO %I', p_table, v_legacy);
+
+    FOR v_rec IN
+        SELECT c.relname FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = v_legacy::regclass
+          AND NOT i.indisprimary
+          AND c.relname <> v_legacy || '_pkey'
+    LOOP
+        EXECUTE format('ALTER INDEX %I RENAME TO %I',
+            v_rec.relname, left(v_rec.relname, 56) || '_legacy');
+    END LOOP;
+
+    FOR v_rec IN
+        SELECT tgname FROM pg_trigger
+        WHERE tgrelid = v_legacy::regclass AND NOT tgisinternal
+    LOOP
+        EXECUTE format('DROP TRIGGER %I ON %I', v_rec.tgname, v_legacy);
+    END LOOP;
+
+    EXECUTE format('ALTER TABLE %I DROP CONSTRAINT %I', v_legacy, v_old_pkey);
+    EXECUTE format('ALTER TABLE %I ADD CONSTRAINT %I PRIMARY KEY USING INDEX %I',
+        v_legacy, v_legacy || '_pkey', v_legacy || '_pkey');
+
+    -- Partitioned parent: same columns, key extended with the partition column
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE %I INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING STORAGE INCLUDING COMMENTS, '
+        'CONSTRAINT %I PRIMARY KEY (%s)) PARTITION BY RANGE (%I)',
+        p_table, v_legacy, p_table || '_pkey',
+        (SELECT string_agg(quote_ident(k), ', ') FROM unnest(p_key || v_column) AS k),
+        v_column
+    );
+
+    -- Foreign keys go on the empty parent first so ATTACH adopts the
+    -- legacy table's existing (validated) constraints
+    FOREACH v_stmt IN ARRAY COALESCE(v_fkeys, '{}') LOOP
+        EXECUTE v_stmt;
+    END LOOP;
+
+    EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I FOR VALUES FROM (MINVALUE) TO (%L)',
+        p_table, v_legacy, v_boundary);
+
+    -- Matching legacy indexes are attached rather than rebuilt
+    FOREACH v_stmt IN ARRAY COALESCE(v_indexes, '{}') LOOP
+        EXECUTE v_stmt;
+    END LOOP;
+
+    FOREACH v_stmt IN ARRAY COALESCE(v_triggers, '{}') LOOP
+        EXECUTE v_stmt;
+    END LOOP;
+
+    FOREACH v_stmt IN ARRAY COALESCE(v_grants, '{}') LOOP
+        EXECUTE v_stmt;
+    END LOOP;
+
+    IF v_comment IS NOT NULL THEN
+        EXECUTE format('COMMENT ON TABLE %I IS %L', p_table, v_comment);
+    END IF;
+
+    -- First monthly partitions; src.jobs.partition_maintenance keeps
+    -- PARTITION_PREMAKE_MONTHS ahead from here on
+    FOR i IN 0..p_months_ahead LOOP
+        v_month := v_boundary + make_interval(months => i);
+        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            p_table || '_p' || to_char(v_month AT TIME ZONE 'UTC', 'YYYYMM'),
+            p_table, v_month, v_month + INTERVAL '1 month');
+    END LOOP;
+
+    UPDATE partition_conversions SET converted_at = NOW() WHERE table_name = p_table;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ==========================================================================
+-- dq_incidents.result_id: soft reference from here on
+-- ==========================================================================
+
+ALTER TABLE dq_incidents DROP CONSTRAINT IF EXISTS dq_incidents_result_id_fkey;
+
+-- ==========================================================================
+-- dq_results (executed_at)
+-- ==========================================================================
+
+SELECT prepare_partition_conversion('dq_results', 'executed_at');
+ALTER TABLE dq_results VALIDATE CONSTRAINT dq_results_legacy_bound;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS dq_results_legacy_pkey
+    ON dq_results (id, executed_at);
+SELECT convert_to_partitioned('dq_results', ARRAY['id']);
+
+-- ==========================================================================
+-- sync_runs (started_at)
+-- ==========================================================================
+
+SELECT prepare_partition_conversion('sync_runs', 'started_at');
+ALTER TABLE sync_runs VALIDATE CONSTRAINT sync_runs_legacy_bound;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS sync_runs_legacy_pkey
+    ON sync_runs (run_id, started_at);
+SELECT convert_to_partitioned('sync_runs', ARRAY['run_id']);
+
+-- ==========================================================================
+-- audit_logs (timestamp)
+-- ==========================================================================
+
+SELECT prepare_partition_conversion('audit_logs', 'timestamp');
+ALTER TABLE audit_logs VALIDATE CONSTRAINT audit_logs_legacy_bound;
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS audit_logs_legacy_pkey
+    ON audit_logs (id, timestamp);
+SELECT convert_to_partitioned('audit_logs', ARRAY['id']);
@@ -0,0 +1,60 @@
+-- Webhook Inbox
+-- Migration 0064 - Durable inbox for Shopify and Clerk webhooks
+--
+-- Webhook routes verify the signature, insert the raw payload here and
+-- return 200 right away; the webhook inbox worker
+-- (python -m src.workers.webhook_inbox_worker) processes events in arrival
+-- order per ordering_key (shop domain / Clerk organization) with retries.
+-- (source, event_id) is unique so redeliveries are dropped on insert.
+--
+-- Usage: psql $DATABASE_URL -f 0064_webhook_inbox.sql
+
+CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
+
+-- ==========================================================================
+-- Create webhook_inbox_events table
+-- ==========================================================================
+
+CREATE TABLE IF NOT EXISTS webhook_inbox_events (
+    id                  VARCHAR(36)  PRIMARY KEY DEFAULT uuid_generate_v4()::TEXT,
+
+    -- Delivery identity
+    source              VARCHAR(20)  NOT NULL,
+    event_id            VARCHAR(255) NOT NULL,
+    topic               VARCHAR(255) NOT NULL,
+    ordering_key        VARCHAR(255) NOT NULL,
+
+    -- Raw request body, never modified
+    payload             TEXT         NOT NULL,
+
+    -- Processing state
+    status              VARCHAR(20)  NOT NULL DEFAULT 'pending',
+    attempts            INTEGER      NOT NULL DEFAULT 0,
+    last_error          TEXT,
+    claimed_by          VARCHAR(255),
+
+    received_at         TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    next_attempt_at     TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    locked_until        TIMESTAMP WITH TIME ZONE,
+    processed_at        TIMESTAMP WITH TIME ZONE,
+
+    CONSTRAINT uq_webhook_inbox_source_event UNIQUE (source, event_id),
+    CONSTRAINT ck_webhook_inbox_status
+        CHECK (status IN ('pending', 'processing', 'retry', 'processed', 'dead'))
+);
+
+-- Claim scan: due events
+CREATE INDEX IF NOT EXISTS ix_webhook_inbox_status_next_attempt
+    ON webhook_inbox_events(status, next_attempt_at);
+
+-- Head-of-line check per ordering key
+CREATE INDEX IF NOT EXISTS ix_webhook_inbox_ordering
+    ON webhook_inbox_events(source, ordering_key, received_at);
+
+-- Lag metrics: oldest open event
+CREATE INDEX IF NOT EXISTS ix_webhook_inbox_open_received
+    ON webhook_inbox_events(received_at)
+    WHERE status IN ('pending', 'processing', 'retry');
+
+COMMENT ON TABLE webhook_inbox_events IS
+    'Verified Shopify/Clerk webhooks acknowledged on receipt and processed asynchronously by the webhook inbox worker.';
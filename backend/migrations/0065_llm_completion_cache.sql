@@ -0,0 +1,25 @@
+-- LLM Completion Cache
+-- Migration 0065 - Record completion cache outcomes in llm_usage_log
+--
+-- LLMRoutingService answers identical requests (same model, template
+-- version and rendered prompt) from a completion cache, or lets them
+-- share one in-flight upstream call. Those calls are logged with zero
+-- tokens/cost, cache_status 'hit' or 'coalesced' and the tokens they
+-- saved; the call that reached the model is logged with 'miss'.
+-- cache_status is NULL when the cache is disabled.
+--
+-- Usage: psql $DATABASE_URL -f 0065_llm_completion_cache.sql
+
+ALTER TABLE llm_usage_log
+    ADD COLUMN IF NOT EXISTS cache_status VARCHAR(20),
+    ADD COLUMN IF NOT EXISTS saved_tokens INTEGER NOT NULL DEFAULT 0;
+
+-- Hit ratio / saved tokens per tenant over a period
+CREATE INDEX IF NOT EXISTS ix_llm_usage_log_tenant_cache
+    ON llm_usage_log(tenant_id, created_at DESC)
+    WHERE cache_status IS NOT NULL;
+
+COMMENT ON COLUMN llm_usage_log.cache_status IS
+    'Completion cache outcome: hit, coalesced, miss (NULL if bypassed)';
+COMMENT ON COLUMN llm_usage_log.saved_tokens IS
+    'Tokens not spent because the completion was served from cache';
@@ -0,0 +1,54 @@
+-- Tenant Groups
+-- Migration 0066 - Server-side tenant sets for agency RLS
+--
+-- Agency embed JWTs used to carry every allowed tenant id, and Superset
+-- RLS rendered them into an inline IN-list. Tokens now carry a
+-- tenant_group_id instead and RLS filters with
+--     tenant_id = ANY(group_members('<tenant_group_id>'))
+-- so the clause (and Superset's cache key) is the same for every user
+-- with the same tenant set, and tokens no longer grow with the list.
+--
+-- group_id is derived from the sorted member list (tg_ + 32 hex chars),
+-- so a group's members never change. Unknown group ids resolve to an
+-- empty array, i.e. zero rows (deny by default).
+--
+-- These tables must live in the database Superset queries.
+--
+-- Usage: psql $DATABASE_URL -f 0066_tenant_groups.sql
+
+CREATE TABLE IF NOT EXISTS tenant_groups (
+    group_id        VARCHAR(64)  PRIMARY KEY,
+    member_count    INTEGER      NOT NULL,
+    created_at      TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+
+    CONSTRAINT ck_tenant_groups_group_id CHECK (group_id ~ '^tg_[0-9a-f]{32}$')
+);
+
+CREATE TABLE IF NOT EXISTS tenant_group_members (
+    group_id        VARCHAR(64)  NOT NULL
+        REFERENCES tenant_groups(group_id) ON DELETE CASCADE,
+    tenant_id       VARCHAR(255) NOT NULL,
+
+    PRIMARY KEY (group_id, tenant_id)
+);
+
+-- Groups containing a tenant (cleanup when a tenant is removed)
+CREATE INDEX IF NOT EXISTS ix_tenant_group_members_tenant
+    ON tenant_group_members(tenant_id);
+
+-- Members of a group, resolved once per query by the planner (STABLE)
+CREATE OR REPLACE FUNCTION group_members(p_group_id TEXT)
+RETURNS TEXT[]
+LANGUAGE sql
+STABLE
+PARALLEL SAFE
+AS $$
+    SELECT COALESCE(array_agg(tenant_id::TEXT), ARRAY[]::TEXT[])
+    FROM tenant_group_members
+    WHERE group_id = p_group_id
+$$;
+
+COMMENT ON TABLE tenant_groups IS
+    'Immutable tenant sets referenced by agency embed JWTs (tenant_group_id)';
+COMMENT ON FUNCTION group_members(TEXT) IS
+    'Tenant ids of a tenant group; empty for unknown groups (RLS deny by default)';
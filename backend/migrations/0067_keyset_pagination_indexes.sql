@@ -0,0 +1,92 @@
+-- Keyset Pagination Indexes
+-- Migration 0067 - (tenant, sort column, id) indexes for list endpoints
+--
+-- List endpoints page with a cursor over (sort column, id) instead of
+-- OFFSET (src/platform/pagination.py):
+--     WHERE tenant_id = $1
+--       AND (created_at < $2 OR (created_at = $2 AND id < $3))
+--     ORDER BY created_at DESC, id DESC
+--     LIMIT n + 1
+-- An index ending in (sort column, id) serves this with one backward index
+-- range scan at any page depth. The (tenant_id, sort column) indexes they
+-- extend are dropped afterwards; the new indexes cover the same queries.
+--
+-- audit_logs is partitioned (0063): the parent index is created ON ONLY
+-- (metadata only), each partition is indexed CONCURRENTLY and attached,
+-- which makes the parent index valid. Partitions created later inherit it.
+--
+-- Not transactional (CONCURRENTLY); run once, without -1, with psql
+-- (uses \gexec):
+-- Usage: psql $DATABASE_URL -f 0067_keyset_pagination_indexes.sql
+
+-- ==========================================================================
+-- ga_audit_logs: GET /api/v1/audit-logs
+-- ==========================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_ga_audit_tenant_created_id
+    ON ga_audit_logs (tenant_id, created_at, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_ga_audit_tenant_created;
+
+-- ==========================================================================
+-- data_change_events: GET /api/what-changed
+-- ==========================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_data_change_events_tenant_occurred_id
+    ON data_change_events (tenant_id, occurred_at, id);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_data_change_events_tenant_occurred;
+
+-- ==========================================================================
+-- notifications: GET /api/notifications (always filtered by user)
+-- ==========================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_notifications_tenant_user_created_id
+    ON notifications (tenant_id, user_id, created_at, id);
+
+-- ==========================================================================
+-- custom_dashboards: GET /api/v1/dashboards
+-- ==========================================================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_custom_dashboards_tenant_updated_id
+    ON custom_dashboards (tenant_id, updated_at, id);
+
+-- ==========================================================================
+-- audit_logs: audit export (partitioned)
+-- ==========================================================================
+
+SELECT CASE c.relkind
+    WHEN 'p' THEN 'CREATE INDEX IF NOT EXISTS ix_audit_logs_tenant_timestamp_id '
+                  'ON ONLY audit_logs (tenant_id, "timestamp", id)'
+    ELSE 'CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_tenant_timestamp_id '
+         'ON audit_logs (tenant_id, "timestamp", id)'
+    END
+FROM pg_class c
+WHERE c.oid = 'audit_logs'::regclass
+\gexec
+
+SELECT format(
+    'CREATE INDEX CONCURRENTLY IF NOT EXISTS %I ON %s (tenant_id, "timestamp", id)',
+    left(c.relname, 50) || '_tenant_ts_id', c.oid::regclass
+)
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+WHERE i.inhparent = 'audit_logs'::regclass
+\gexec
+
+SELECT format(
+    'ALTER INDEX ix_audit_logs_tenant_timestamp_id ATTACH PARTITION %s',
+    ci.oid::regclass
+)
+FROM pg_inherits i
+JOIN pg_class c ON c.oid = i.inhrelid
+JOIN pg_class ci
+    ON ci.relname = left(c.relname, 50) || '_tenant_ts_id'
+   AND ci.relnamespace = c.relnamespace
+WHERE i.inhparent = 'audit_logs'::regclass
+  AND NOT EXISTS (
+      SELECT 1 FROM pg_inherits a WHERE a.inhrelid = ci.oid
+  )
+\gexec
+
+DROP INDEX IF EXISTS ix_audit_logs_tenant_timestamp;
@@ -0,0 +1,33 @@
+-- Default Partitions for Operational Tables
+-- Migration 0068 - DEFAULT partitions for dq_results, sync_runs and audit_logs
+--
+-- Migration 0063 left these tables with monthly partitions only, so an
+-- insert past the last pre-created month (partition maintenance not
+-- running, or a clock-skewed timestamp) failed with "no partition of
+-- relation found for row" and lost the audit event, sync run or DQ result.
+--
+-- Each table now gets a <table>_default DEFAULT partition that accepts
+-- such rows. src.jobs.partition_maintenance moves them into the month's
+-- partition when it creates it, and alerts when the monthly partitions
+-- reach less than one month ahead (src/database/partitioning.py).
+--
+-- Tables not yet converted by 0063 are skipped; re-run after converting.
+-- Usage: psql $DATABASE_URL -f 0068_default_partitions.sql
+
+DO $$
+DECLARE
+    v_table TEXT;
+BEGIN
+    FOREACH v_table IN ARRAY ARRAY['dq_results', 'sync_runs', 'audit_logs'] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(v_table)
+        ) THEN
+            RAISE NOTICE '% is not partitioned; run 0063 first', v_table;
+            CONTINUE;
+        END IF;
+
+        EXECUTE format('CREATE TABLE IF NOT EXISTS %I PARTITION OF %I DEFAULT',
+            v_table || '_default', v_table);
+    END LOOP;
+END;
+$$;
@@ -0,0 +1,41 @@
+-- Ingestion Jobs Claim Lease Migration
+-- Version: 1.0.0
+-- Date: 2026-10-16
+--
+-- Adds claim lease columns to ingestion_jobs so several sync executor
+-- processes can drain the queue in parallel. Executors lock candidate rows
+-- with SELECT ... FOR UPDATE SKIP LOCKED and stamp claimed_by/claimed_at
+-- before triggering the Airbyte sync. Claims older than the lease are
+-- reclaimable, so a crashed executor never strands a queued job.
+--
+-- Usage: psql $DATABASE_URL -f ingestion_jobs_claiming.sql
+
+-- =============================================================================
+-- Claim columns
+-- =============================================================================
+
+ALTER TABLE ingestion_jobs
+    ADD COLUMN IF NOT EXISTS claimed_by VARCHAR(255);
+
+ALTER TABLE ingestion_jobs
+    ADD COLUMN IF NOT EXISTS claimed_at TIMESTAMP WITH TIME ZONE;
+
+COMMENT ON COLUMN ingestion_jobs.claimed_by IS
+    'Executor worker ID holding the claim on this job';
+
+COMMENT ON COLUMN ingestion_jobs.claimed_at IS
+    'When the executor claimed the job (lease start)';
+
+-- =============================================================================
+-- Index for FIFO claiming of queued jobs
+-- =============================================================================
+
+CREATE INDEX IF NOT EXISTS ix_ingestion_jobs_claimable
+    ON ingestion_jobs(status, created_at)
+    WHERE status = 'queued';
+
+-- =============================================================================
+-- Migration Complete
+-- =============================================================================
+
+SELECT 'Ingestion jobs claim lease migration completed successfully' AS status;
@@ -0,0 +1,143 @@
+"""
+Async vs Sync Database Session Load Benchmark.
+
+Serves two equivalent endpoints from one FastAPI app and sends requests at
+a fixed arrival rate through an in-process ASGI client:
+
+- /sync:  async handler using a blocking Session (get_db_session style)
+- /async: async handler using an AsyncSession via run_db (get_async_db_session)
+
+Each request runs one query that takes --query-ms on the database
+(pg_sleep on PostgreSQL, a sleeping SQL function on SQLite). With the
+blocking Session every query stalls the event loop, so latency grows with
+concurrency; the async path overlaps them up to the pool size. Latency is
+measured from each request's scheduled send time (open loop), so time spent
+waiting on a blocked event loop counts. Reports p50/p99 latency and
+throughput per mode.
+
+Usage:
+    python -m scripts.benchmark_async_db
+    python -m scripts.benchmark_async_db --requests 400 --rate 300 --query-ms 20
+    python -m scripts.benchmark_async_db --database-url postgresql://localhost/app
+
+Environment variables:
+    DB_POOL_SIZE / DB_MAX_OVERFLOW: Pool sizing for both engines
+
+Async SQLAlchemy engine and session path
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import event, text
+
+from src.database import session as db_session
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+
+def _install_sqlite_sleep(sync_engine) -> None:
+    """Register sleep_ms(ms) on SQLite connections to simulate query latency."""
+
+    @event.listens_for(sync_engine, "connect")
+    def _register(dbapi_connection, connection_record):
+        dbapi_connection.create_function("sleep_ms", 1, lambda ms: time.sleep(ms / 1000) or 0)
+
+
+def build_app(query_ms: int, is_postgres: bool) -> FastAPI:
+    """FastAPI app exposing the same query over both session paths."""
+    if is_postgres:
+        query = text("SELECT pg_sleep(:seconds)").bindparams(seconds=query_ms / 1000)
+    else:
+        query = text("SELECT sleep_ms(:ms)").bindparams(ms=query_ms)
+        _install_sqlite_sleep(db_session.get_engine())
+        _install_sqlite_sleep(db_session.get_async_engine().sync_engine)
+
+    app = FastAPI()
+
+    @app.get("/sync")
+    async def sync_route(db=Depends(db_session.get_db_session)):
+        db.execute(query)
+        return {"ok": True}
+
+    @app.get("/async")
+    async def async_route(db=Depends(db_session.get_async_db_session)):
+        await db_session.run_db(db, lambda s: s.execute(query))
+        return {"ok": True}
+
+    return app
+
+
+async def run_load(app: FastAPI, path: str, requests: int, rate: float) -> dict:
+    """Send `requests` GETs at `rate` per second; latency from scheduled send time."""
+    latencies: list[float] = []
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        started = time.perf_counter()
+
+        async def _one(index: int):
+            scheduled = started + index / rate
+            await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+            response = await client.get(path)
+            latencies.append(time.perf_counter() - scheduled)
+            response.raise_for_status()
+
+        await asyncio.gather(*(_one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        "rps": requests / elapsed,
+    }
+
+
+async def main_async(args) -> None:
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp()}/async_bench.db"
+    db_session.os.environ["DATABASE_URL"] = database_url
+    db_session.DB_ASYNC_ENABLED = True
+
+    is_postgres = database_url.startswith(("postgres://", "postgresql"))
+    app = build_app(args.query_ms, is_postgres)
+
+    # Warm both pools so connection setup is not measured
+    await run_load(app, "/sync", 10, args.rate)
+    await run_load(app, "/async", 10, args.rate)
+
+    print(
+        f"requests={args.requests} rate={args.rate}/s "
+        f"query_ms={args.query_ms} pool_size={db_session.DB_POOL_SIZE}"
+    )
+    print(f"{'mode':<8}{'p50 ms':>10}{'p99 ms':>10}{'req/s':>10}")
+    for mode in ("sync", "async"):
+        result = await run_load(app, f"/{mode}", args.requests, args.rate)
+        print(f"{mode:<8}{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}{result['rps']:>10.1f}")
+
+    await db_session.dispose_engines()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare sync and async DB session latency")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=150.0, help="Arrivals per second")
+    parser.add_argument("--query-ms", type=int, default=10)
+    parser.add_argument("--database-url", help="Database to query (default: temporary SQLite file)")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+DQ Statistics Kernel Micro-Benchmark.
+
+Times the shared pure-Python kernels in src.api.dq.kernels on synthetic inputs shaped
+like production checks (a few dozen categories per dimension, 28 days of
+daily volume per connector), next to the previous per-call
+implementations they replaced:
+
+- jsd:       per-pair dict JSD (two KL passes) vs jensen_shannon_divergences
+- volume:    per-connector rolling mean + pct change vs means + pct_changes
+- robust:    median/MAD, robust z-scores and same-weekday baselines (new)
+
+Usage:
+    python -m scripts.benchmark_dq_kernels
+    python -m scripts.benchmark_dq_kernels --sizes 100 1000 10000 --repeat 5
+
+DQ - Shared Statistics Kernels
+"""
+
+import argparse
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from src.api.dq import kernels
+
+
+def _legacy_jsd(p: Dict[str, float], q: Dict[str, float]) -> float:
+    """Per-pair implementation previously duplicated in DQService and diagnostics."""
+    all_keys = set(p) | set(q)
+    if not all_keys:
+        return 0.0
+    epsilon = 1e-10
+    p_vec = [p.get(k, 0.0) + epsilon for k in all_keys]
+    q_vec = [q.get(k, 0.0) + epsilon for k in all_keys]
+    p_sum = sum(p_vec)
+    q_sum = sum(q_vec)
+    p_vec = [x / p_sum for x in p_vec]
+    q_vec = [x / q_sum for x in q_vec]
+    m_vec = [(pi + qi) / 2 for pi, qi in zip(p_vec, q_vec)]
+
+    def _kl(a, b):
+        return sum(ai * math.log2(ai / bi) for ai, bi in zip(a, b))
+
+    return (_kl(p_vec, m_vec) + _kl(q_vec, m_vec)) / 2
+
+
+def _distribution(rng: random.Random, categories: int) -> Dict[str, float]:
+    weights = [rng.random() for _ in range(categories)]
+    total = sum(weights)
+    return {f"cat-{i}": w / total for i, w in enumerate(weights)}
+
+
+def _best_of(repeat: int, fn: Callable[[], object]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def run(sizes: List[int], categories: int, days: int, repeat: int) -> None:
+    rng = random.Random(42)
+    print(f"{'kernel':<10}{'size':>8}{'legacy ms':>12}{'batch ms':>12}{'speedup':>10}")
+
+    for size in sizes:
+        pairs = [
+            (_distribution(rng, categories), _distribution(rng, categories))
+            for _ in range(size)
+        ]
+        series = [
+            [rng.randint(800, 1200) for _ in range(days)] for _ in range(size)
+        ]
+        todays = [rng.randint(0, 1500) for _ in range(size)]
+
+        legacy = _best_of(repeat, lambda: [_legacy_jsd(p, q) for p, q in pairs])
+        batch = _best_of(repeat, lambda: kernels.jensen_shannon_divergences(pairs))
+        _report("jsd", size, legacy, batch)
+
+        def legacy_volume():
+            out = []
+            for counts, today in zip(series, todays):
+                avg = sum(counts) / len(counts)
+                out.append((avg - today) / avg * 100 if avg else None)
+            return out
+
+        batch = _best_of(
+            repeat,
+            lambda: kernels.pct_changes(kernels.means(series), todays),
+        )
+        _report("volume", size, _best_of(repeat, legacy_volume), batch)
+
+        def robust():
+            kernels.robust_z_scores(series, todays)
+            kernels.seasonal_baselines(series)
+
+        _report("robust", size, None, _best_of(repeat, robust))
+
+
+def _report(name: str, size: int, legacy: float, batch: float) -> None:
+    legacy_ms = f"{legacy * 1000:.2f}" if legacy is not None else "-"
+    speedup = f"{legacy / batch:.2f}x" if legacy is not None and batch else "-"
+    print(f"{name:<10}{size:>8}{legacy_ms:>12}{batch * 1000:>12.2f}{speedup:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark DQ statistics kernels")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--categories", type=int, default=20)
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.categories, args.days, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,267 @@
+"""
+Insight Generation Benchmark.
+
+Seeds a scratch database with marketing and revenue mart rows for N
+tenants (two periods per period type, so the latest-period lookup has
+something to skip), then generates insights for every tenant in batched
+mode and, optionally, through the per-tenant InsightGenerationService.
+Reports SQL statements issued, insights persisted and wall time. Both
+modes should persist the same insights.
+
+Usage:
+    python -m scripts.benchmark_insight_batch
+    python -m scripts.benchmark_insight_batch --sizes 1000 10000 --per-tenant
+    python -m scripts.benchmark_insight_batch --database-url postgresql://localhost/insight_bench
+
+WARNING: --database-url must point at a scratch database. Tables are
+created and truncated between runs.
+
+Story 8.1 - AI Insight Generation (Read-Only Analytics)
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import (
+    Column,
+    DateTime,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    create_engine,
+    delete,
+    event,
+    insert,
+    text,
+)
+from sqlalchemy.orm import sessionmaker
+
+from src.models.ai_insight import AIInsight
+from src.services.insight_batch import (
+    DEFAULT_PERIOD_TYPES,
+    INSIGHT_BATCH_TENANT_CHUNK,
+    MARKETING_COLUMNS,
+    REVENUE_COLUMNS,
+    InsightBatchGenerator,
+    InsightBatchJob,
+)
+from src.services.insight_generation_service import InsightGenerationService
+from src.services.insight_thresholds import DEFAULT_THRESHOLDS, ENTERPRISE_THRESHOLDS
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger(__name__)
+
+TEXT_COLUMNS = {"platform", "currency", "campaign_id", "period_type", "comparison_type"}
+DATE_COLUMNS = {"period_start", "period_end"}
+PLATFORMS = ["meta_ads", "google_ads"]
+
+marts = MetaData(schema="marts")
+
+
+def _mart_table(name: str, columns) -> Table:
+    def column_type(column):
+        if column in TEXT_COLUMNS:
+            return String(64)
+        if column in DATE_COLUMNS:
+            return DateTime(timezone=True)
+        return Numeric(18, 4)
+
+    return Table(
+        name,
+        marts,
+        Column("tenant_id", String(64), index=True),
+        *[Column(c, column_type(c)) for c in columns],
+    )
+
+
+MARKETING = _mart_table("mart_marketing_metrics", MARKETING_COLUMNS)
+REVENUE = _mart_table("mart_revenue_metrics", REVENUE_COLUMNS)
+
+
+def _change(rng: random.Random, current: float) -> tuple[float, float, float]:
+    """(prior, change, change_pct) with roughly one in four rows moving a lot."""
+    pct = rng.uniform(-40, 40) if rng.random() < 0.25 else rng.uniform(-8, 8)
+    prior = current / (1 + pct / 100)
+    return prior, current - prior, pct
+
+
+def seed(session, tenant_count: int, now: datetime) -> None:
+    """Insert mart rows for one benchmark size."""
+    for table in (AIInsight.__table__, MARKETING, REVENUE):
+        session.execute(delete(table))
+
+    rng = random.Random(42)
+    marketing_rows, revenue_rows = [], []
+    for t in range(tenant_count):
+        tenant_id = f"tenant-{t}"
+        for period_type in DEFAULT_PERIOD_TYPES:
+            for weeks_ago in (1, 0):
+                period_end = now - timedelta(weeks=weeks_ago)
+                period = {
+                    "tenant_id": tenant_id,
+                    "currency": "USD",
+                    "period_type": period_type,
+                    "period_start": period_end - timedelta(days=7),
+                    "period_end": period_end,
+                    "comparison_type": "week_over_week",
+                }
+                for platform in PLATFORMS:
+                    spend = rng.uniform(50, 5000)
+                    roas = rng.uniform(0.5, 5)
+                    cac = rng.uniform(10, 80)
+                    prior_spend, spend_change, spend_pct = _change(rng, spend)
+                    prior_roas, roas_change, roas_pct = _change(rng, roas)
+                    prior_cac, cac_change, cac_pct = _change(rng, cac)
+                    marketing_rows.append({
+                        **period,
+                        "platform": platform,
+                        "campaign_id": None,
+                        "spend": spend,
+                        "prior_spend": prior_spend,
+                        "spend_change": spend_change,
+                        "spend_change_pct": spend_pct,
+                        "gross_roas": roas,
+                        "prior_gross_roas": prior_roas,
+                        "gross_roas_change": roas_change,
+                        "gross_roas_change_pct": roas_pct,
+                        "cac": cac,
+                        "prior_cac": prior_cac,
+                        "cac_change": cac_change,
+                        "cac_change_pct": cac_pct,
+                    })
+
+                revenue = rng.uniform(500, 50000)
+                aov = rng.uniform(20, 200)
+                prior_revenue, revenue_change, revenue_pct = _change(rng, revenue)
+                prior_aov, aov_change, aov_pct = _change(rng, aov)
+                revenue_rows.append({
+                    **period,
+                    "net_revenue": revenue,
+                    "prior_net_revenue": prior_revenue,
+                    "net_revenue_change": revenue_change,
+                    "net_revenue_change_pct": revenue_pct,
+                    "aov": aov,
+                    "prior_aov": prior_aov,
+                    "aov_change": aov_change,
+                    "aov_change_pct": aov_pct,
+                })
+
+    for table, rows in ((MARKETING, marketing_rows), (REVENUE, revenue_rows)):
+        for start in range(0, len(rows), 5000):
+            session.execute(insert(table), rows[start:start + 5000])
+    session.commit()
+
+
+def _jobs(tenant_count: int) -> list[InsightBatchJob]:
+    return [
+        InsightBatchJob(
+            job_id=f"job-{t}",
+            tenant_id=f"tenant-{t}",
+            thresholds=ENTERPRISE_THRESHOLDS if t % 4 == 0 else DEFAULT_THRESHOLDS,
+        )
+        for t in range(tenant_count)
+    ]
+
+
+def run_batched(session, jobs) -> int:
+    generator = InsightBatchGenerator(session)
+    persisted = 0
+    for start in range(0, len(jobs), INSIGHT_BATCH_TENANT_CHUNK):
+        results = generator.generate(jobs[start:start + INSIGHT_BATCH_TENANT_CHUNK])
+        persisted += sum(len(insights) for insights in results.values())
+    session.commit()
+    return persisted
+
+
+def run_per_tenant(session, jobs) -> int:
+    persisted = 0
+    for job in jobs:
+        service = InsightGenerationService(session, job.tenant_id, job.thresholds)
+        persisted += len(service.generate_insights(job_id=job.job_id))
+    session.commit()
+    return persisted
+
+
+def time_run(session, run, jobs) -> tuple[float, int, int]:
+    """Run one mode and return (seconds, statement_count, insights_persisted)."""
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        started = time.perf_counter()
+        persisted = run(session, jobs)
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return elapsed, len(statements), persisted
+
+
+def create_engine_with_marts(database_url: str):
+    engine = create_engine(database_url)
+    if engine.dialect.name == "sqlite":
+        # SQLite has no schemas; attach a second file as "marts"
+        marts_path = Path(engine.url.database).with_name("marts.db")
+
+        @event.listens_for(engine, "connect")
+        def _attach_marts(dbapi_connection, connection_record):
+            dbapi_connection.execute(f"ATTACH DATABASE '{marts_path}' AS marts")
+    else:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE SCHEMA IF NOT EXISTS marts"))
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched insight generation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument(
+        "--per-tenant", action="store_true", help="Also time the per-tenant service",
+    )
+    parser.add_argument("--database-url", help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = f"sqlite:///{tempfile.mkdtemp()}/insight_bench.db"
+
+    engine = create_engine_with_marts(database_url)
+    AIInsight.__table__.create(bind=engine, checkfirst=True)
+    marts.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+
+    print(f"{'mode':<12}{'tenants':>10}{'insights':>10}{'statements':>12}{'seconds':>10}")
+    try:
+        for size in args.sizes:
+            modes = [("batched", run_batched)]
+            if args.per_tenant:
+                modes.append(("per_tenant", run_per_tenant))
+
+            for mode, run in modes:
+                seed(session, size, now)
+                elapsed, statement_count, persisted = time_run(session, run, _jobs(size))
+                print(
+                    f"{mode:<12}{size:>10}{persisted:>10}"
+                    f"{statement_count:>12}{elapsed:>10.2f}"
+                )
+    finally:
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Sync Scheduler Benchmark.
+
+Seeds a scratch database with N enabled connections spread over tenants
+on mixed plans, then times one scheduler tick in batched mode (and,
+optionally, the legacy per-connection mode) and reports the number of SQL
+statements issued. The batched tick should issue the same handful of
+statements at every size.
+
+Usage:
+    python -m scripts.benchmark_sync_scheduler
+    python -m scripts.benchmark_sync_scheduler --sizes 1000 10000 50000
+    python -m scripts.benchmark_sync_scheduler --legacy --sizes 500 2000
+    python -m scripts.benchmark_sync_scheduler --database-url postgresql://localhost/scheduler_bench
+
+WARNING: --database-url must point at a scratch database. Tables are
+created and truncated between runs.
+
+Ingestion Orchestration - Batched Scheduler
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from sqlalchemy import create_engine, delete, event, insert
+from sqlalchemy.orm import sessionmaker
+
+from src.db_base import Base
+from src.ingestion.jobs.models import IngestionJob
+from src.models.airbyte_connection import TenantAirbyteConnection
+from src.models.plan import Plan, PlanFeature
+from src.models.subscription import Subscription, SubscriptionStatus
+from src.workers import sync_scheduler
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+TABLES = [
+    Plan.__table__,
+    PlanFeature.__table__,
+    Subscription.__table__,
+    TenantAirbyteConnection.__table__,
+    IngestionJob.__table__,
+]
+
+PLAN_NAMES = ["free", "growth", "pro", "enterprise"]
+CONNECTIONS_PER_TENANT = 5
+
+
+def seed(session, connection_count: int, now: datetime) -> None:
+    """Insert plans, subscriptions and connections for one benchmark size."""
+    for table in reversed(TABLES):
+        session.execute(delete(table))
+
+    session.execute(insert(Plan), [
+        {"id": f"plan_{name}", "name": name, "display_name": name.title(), "is_active": True}
+        for name in PLAN_NAMES
+    ])
+    session.execute(insert(PlanFeature), [
+        {
+            "id": str(uuid.uuid4()),
+            "plan_id": f"plan_{name}",
+            "feature_key": "premium_analytics",
+            "is_enabled": True,
+        }
+        for name in PLAN_NAMES[1:]
+    ])
+
+    tenant_count = max(1, connection_count // CONNECTIONS_PER_TENANT)
+    session.execute(insert(Subscription), [
+        {
+            "id": str(uuid.uuid4()),
+            "tenant_id": f"tenant-{i}",
+            "plan_id": f"plan_{PLAN_NAMES[i % len(PLAN_NAMES)]}",
+            "status": SubscriptionStatus.ACTIVE.value,
+        }
+        for i in range(tenant_count)
+    ])
+
+    # Spread last_sync_at over the past day so some connections are due
+    rows = []
+    for i in range(connection_count):
+        rows.append({
+            "id": f"conn-{i}",
+            "tenant_id": f"tenant-{i % tenant_count}",
+            "airbyte_connection_id": f"ab-{i}",
+            "connection_name": f"Connection {i}",
+            "source_type": "shopify",
+            "last_sync_at": None if i % 10 == 0 else now - timedelta(minutes=(i * 7) % 1440),
+        })
+    for start in range(0, len(rows), 5000):
+        session.execute(insert(TenantAirbyteConnection), rows[start:start + 5000])
+    session.commit()
+
+
+def time_tick(session, run) -> tuple[float, int, object]:
+    """Run one scheduler tick and return (seconds, statement_count, stats)."""
+    statements = []
+
+    def _count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        started = time.perf_counter()
+        stats = run(session)
+        elapsed = time.perf_counter() - started
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+    return elapsed, len(statements), stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the sync scheduler tick")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--legacy", action="store_true", help="Also time the per-connection mode")
+    parser.add_argument("--database-url", help="Scratch database (default: temporary SQLite file)")
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = f"sqlite:///{tempfile.mkdtemp()}/scheduler_bench.db"
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine, tables=TABLES)
+    session = sessionmaker(bind=engine)()
+    now = datetime.now(timezone.utc)
+
+    # The legacy mode caps work per run; lift it so both modes see every row
+    get_enabled_connections = sync_scheduler._get_enabled_connections
+    sync_scheduler._get_enabled_connections = (
+        lambda db, limit=max(args.sizes): get_enabled_connections(db, limit)
+    )
+
+    print(f"{'mode':<16}{'connections':>12}{'dispatched':>12}{'statements':>12}{'seconds':>10}")
+    try:
+        for size in args.sizes:
+            modes = [("batched", lambda s: sync_scheduler.run_scheduler_batched(s, now=now))]
+            if args.legacy:
+                modes.append(("per_connection", sync_scheduler.run_scheduler))
+
+            for mode, run in modes:
+                seed(session, size, now)
+                elapsed, statement_count, stats = time_tick(session, run)
+                print(
+                    f"{mode:<16}{size:>12}{stats.jobs_dispatched:>12}"
+                    f"{statement_count:>12}{elapsed:>10.2f}"
+                )
+    finally:
+        session.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -16,6 +16,9 @@ Usage:
     # Process queued jobs (run every 5 minutes via cron)
     python -m scripts.insight_worker process --limit 10
 
+    # Process the nightly fleet-wide dispatch in cross-tenant batches
+    python -m scripts.insight_worker process --batch --limit 20000
+
 Cron Examples:
     # Daily dispatch at 2am UTC
     0 2 * * * cd /app && python -m scripts.insight_worker dispatch --cadence daily
@@ -90,12 +93,12 @@ def cmd_process(args) -> int:
     """Process queued insight jobs."""
     logger.info(
         "insight_worker.process.start",
-        extra={"limit": args.limit},
+        extra={"limit": args.limit, "batched": args.batch},
     )
 
     try:
         with get_db_session() as db:
-            result = run_insight_worker_cycle(db, limit=args.limit)
+            result = run_insight_worker_cycle(db, limit=args.limit, batched=args.batch)
 
         logger.info(
             "insight_worker.process.complete",
@@ -159,6 +162,11 @@ Examples:
         default=10,
         help="Maximum number of jobs to process (default: 10)",
     )
+    process_parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Generate insights for many tenants per query (nightly runs)",
+    )
     process_parser.set_defaults(func=cmd_process)
 
     args = parser.parse_args()
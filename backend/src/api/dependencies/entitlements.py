@@ -11,7 +11,7 @@ from typing import Callable
 from fastapi import Request, HTTPException, status, Depends
 
 from src.platform.tenant_context import get_tenant_context
-from src.database.session import get_db_session
+from src.database.session import get_db_session, get_async_db_session, run_db
 from src.services.billing_entitlements import (
     BillingEntitlementsService,
     BillingFeature,
@@ -25,6 +25,7 @@ def create_entitlement_check(
     feature: BillingFeature,
     feature_name: str,
     default_required_tier: str = "paid",
+    use_async_session: bool = False,
 ) -> Callable:
     """
     Factory function to create an entitlement check dependency.
@@ -33,30 +34,22 @@ def create_entitlement_check(
         feature: The BillingFeature to check
         feature_name: Human-readable name for error messages (e.g., "AI Insights")
         default_required_tier: Default tier name for error message if none specified
+        use_async_session: Check against (and return) a session from
+            get_async_db_session; routes must use run_db() with it
 
     Returns:
         A FastAPI dependency function that checks entitlement and returns db_session
     """
 
-    def check_entitlement(
-        request: Request,
-        db_session=Depends(get_db_session),
-    ):
-        """
-        Dependency to check feature entitlement.
-
-        Raises 402 Payment Required if tenant is not entitled.
-        Returns db_session if entitled.
-        """
-        tenant_ctx = get_tenant_context(request)
-        service = BillingEntitlementsService(db_session, tenant_ctx.tenant_id)
-        result = service.check_feature_entitlement(feature)
+    def _check(db_session, tenant_id: str):
+        return BillingEntitlementsService(db_session, tenant_id).check_feature_entitlement(feature)
 
+    def _deny_if_not_entitled(result, tenant_id: str) -> None:
         if not result.is_entitled:
             logger.warning(
                 f"{feature_name} access denied - not entitled",
                 extra={
-                    "tenant_id": tenant_ctx.tenant_id,
+                    "tenant_id": tenant_id,
                     "current_tier": result.current_tier,
                     "feature": feature.value,
                 },
@@ -66,6 +59,36 @@ def create_entitlement_check(
                 detail=f"{feature_name} requires a {result.required_tier or default_required_tier} plan",
             )
 
+    if use_async_session:
+        async def check_entitlement_async(
+            request: Request,
+            db_session=Depends(get_async_db_session),
+        ):
+            """
+            Dependency to check feature entitlement without blocking the event loop.
+
+            Raises 402 Payment Required if tenant is not entitled.
+            Returns db_session if entitled.
+            """
+            tenant_ctx = get_tenant_context(request)
+            result = await run_db(db_session, _check, tenant_ctx.tenant_id)
+            _deny_if_not_entitled(result, tenant_ctx.tenant_id)
+            return db_session
+
+        return check_entitlement_async
+
+    def check_entitlement(
+        request: Request,
+        db_session=Depends(get_db_session),
+    ):
+        """
+        Dependency to check feature entitlement.
+
+        Raises 402 Payment Required if tenant is not entitled.
+        Returns db_session if entitled.
+        """
+        tenant_ctx = get_tenant_context(request)
+        _deny_if_not_entitled(_check(db_session, tenant_ctx.tenant_id), tenant_ctx.tenant_id)
         return db_session
 
     return check_entitlement
@@ -78,6 +101,14 @@ check_ai_insights_entitlement = create_entitlement_check(
     default_required_tier="paid",
 )
 
+# Async-session variant for routes migrated to get_async_db_session
+check_ai_insights_entitlement_async = create_entitlement_check(
+    feature=BillingFeature.AI_INSIGHTS,
+    feature_name="AI Insights",
+    default_required_tier="paid",
+    use_async_session=True,
+)
+
 check_ai_recommendations_entitlement = create_entitlement_check(
     feature=BillingFeature.AI_RECOMMENDATIONS,
     feature_name="AI Recommendations",
@@ -0,0 +1,154 @@
+"""
+Shared pure-Python statistics kernels for data quality checks.
+
+Used by DQService (volume anomaly, distribution drift, cardinality
+shift) and the root-cause diagnostics, which previously each carried
+their own copy. Each kernel takes a list of series or distribution
+pairs and returns one score per input, in input order, computed with
+plain Python loops.
+
+Inputs are small (days of history, a handful of categories per
+dimension), and NumPy is not a dependency of this service.
+
+Robust baselines:
+- Median / MAD: a single outage day or backfill spike in the lookback
+  window does not move the baseline the way it moves the mean
+- Day-of-week seasonality: median of the same weekday in previous weeks,
+  so a normal weekend dip is not compared against weekday volume
+"""
+
+import math
+import statistics
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+# Smoothing for categories present in only one distribution
+EPSILON = 1e-10
+
+# Scales MAD to a standard deviation for normally distributed data
+MAD_SCALE = 1.4826
+
+Distribution = Mapping[str, float]
+
+
+def jensen_shannon_divergences(
+    pairs: Sequence[Tuple[Distribution, Distribution]],
+) -> List[float]:
+    """
+    Jensen-Shannon divergence (base 2) for each (p, q) pair.
+
+    Categories are aligned over the union of both distributions and
+    smoothed with EPSILON. Returns values in [0, 1]: 0 = identical,
+    1 = maximally different; 0.0 when both are empty.
+    """
+    log2 = math.log2
+    scores = []
+    for p, q in pairs:
+        keys = set(p) | set(q)
+        if not keys:
+            scores.append(0.0)
+            continue
+
+        p_vec = [p.get(k, 0.0) + EPSILON for k in keys]
+        q_vec = [q.get(k, 0.0) + EPSILON for k in keys]
+        p_sum = sum(p_vec)
+        q_sum = sum(q_vec)
+
+        # JSD = (KL(P||M) + KL(Q||M)) / 2 with M = (P + Q) / 2, summed together
+        total = 0.0
+        for pi, qi in zip(p_vec, q_vec):
+            pi /= p_sum
+            qi /= q_sum
+            mi = (pi + qi) / 2
+            total += pi * log2(pi / mi) + qi * log2(qi / mi)
+        scores.append(total / 2)
+    return scores
+
+
+def jensen_shannon_divergence(p: Distribution, q: Distribution) -> float:
+    """Jensen-Shannon divergence of a single pair."""
+    return jensen_shannon_divergences([(p, q)])[0]
+
+
+def top_movers(
+    baseline: Distribution,
+    current: Distribution,
+    top_n: int = 3,
+) -> List[Dict[str, Any]]:
+    """Top N categories by absolute proportion change (baseline -> current)."""
+    changes = [
+        (k, current.get(k, 0.0) - baseline.get(k, 0.0))
+        for k in set(baseline) | set(current)
+    ]
+    changes.sort(key=lambda x: abs(x[1]), reverse=True)
+    return [{"category": k, "change": round(v, 4)} for k, v in changes[:top_n]]
+
+
+def means(series: Sequence[Sequence[float]]) -> List[Optional[float]]:
+    """Mean of each series; None for an empty series."""
+    return [sum(s) / len(s) if s else None for s in series]
+
+
+def pct_changes(
+    baselines: Sequence[Optional[float]],
+    observed: Sequence[float],
+) -> List[Optional[float]]:
+    """
+    Signed percentage change of each observation vs its baseline.
+
+    (baseline - observed) / baseline * 100, so positive is a drop.
+    None where the baseline is missing or zero.
+    """
+    return [
+        (b - x) / b * 100 if b else None
+        for b, x in zip(baselines, observed)
+    ]
+
+
+def median_mads(
+    series: Sequence[Sequence[float]],
+) -> List[Tuple[Optional[float], Optional[float]]]:
+    """(median, median absolute deviation) of each series; Nones if empty."""
+    median = statistics.median
+    results = []
+    for s in series:
+        if not s:
+            results.append((None, None))
+            continue
+        med = median(s)
+        results.append((med, median([abs(v - med) for v in s])))
+    return results
+
+
+def robust_z_scores(
+    series: Sequence[Sequence[float]],
+    observed: Sequence[float],
+) -> List[Optional[float]]:
+    """
+    Robust z-score of each observation against its series.
+
+    (x - median) / (MAD_SCALE * MAD). None where the series is empty or
+    has zero MAD (the score is undefined).
+    """
+    scores = []
+    for (med, mad), x in zip(median_mads(series), observed):
+        scores.append((x - med) / (MAD_SCALE * mad) if mad else None)
+    return scores
+
+
+def seasonal_baselines(
+    series: Sequence[Sequence[float]],
+    period: int = 7,
+) -> List[Optional[float]]:
+    """
+    Same-phase baseline for the point following each series.
+
+    With daily series (oldest first, ending yesterday) and period=7 this
+    is the median of the same weekday in previous weeks. None when the
+    series is shorter than one period.
+    """
+    median = statistics.median
+    baselines = []
+    for s in series:
+        same_phase = s[len(s) - period::-period] if len(s) >= period else []
+        baselines.append(median(same_phase) if same_phase else None)
+    return baselines
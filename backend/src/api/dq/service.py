@@ -24,7 +24,6 @@ Severity Multipliers:
 """
 
 import logging
-import math
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta, date
@@ -43,10 +42,19 @@ from src.models.dq_models import (
 )
 from src.models.airbyte_connection import TenantAirbyteConnection
 from src.config.quality_thresholds import get_quality_thresholds_loader
+from src.api.dq import kernels
+from src.services.tenant_health_snapshot import (
+    HealthSnapshotTrigger,
+    mark_tenant_health_dirty,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def _round_or_none(value: Optional[float], digits: int) -> Optional[float]:
+    return round(value, digits) if value is not None else None
+
+
 # Event types for alerting
 class DQEventType(str, Enum):
     """Data quality event types for alerting."""
@@ -205,6 +213,30 @@ class DQService:
         self.db = db_session
         self.tenant_id = tenant_id
         self._event_queue: List[DQEvent] = []
+        # connector_id -> connection, filled by prefetch_connectors()
+        self._connectors: Optional[Dict[str, TenantAirbyteConnection]] = None
+
+    def prefetch_connectors(self) -> Dict[str, TenantAirbyteConnection]:
+        """
+        Load every connector of the tenant in one query.
+
+        After prefetching, per-connector checks resolve connector metadata
+        from the map instead of querying TenantAirbyteConnection per call.
+        """
+        connectors = self.db.query(TenantAirbyteConnection).filter(
+            TenantAirbyteConnection.tenant_id == self.tenant_id,
+        ).all()
+        self._connectors = {c.id: c for c in connectors}
+        return self._connectors
+
+    def _get_connector(self, connector_id: str) -> Optional[TenantAirbyteConnection]:
+        """Connector by ID (tenant-scoped), from the prefetched map if loaded."""
+        if self._connectors is not None:
+            return self._connectors.get(connector_id)
+        return self.db.query(TenantAirbyteConnection).filter(
+            TenantAirbyteConnection.tenant_id == self.tenant_id,
+            TenantAirbyteConnection.id == connector_id,
+        ).first()
 
     def _generate_run_id(self) -> str:
         """Generate a unique run ID."""
@@ -301,10 +333,7 @@ class DQService:
         correlation_id = correlation_id or self._generate_correlation_id()
 
         # Get connector info (tenant-scoped query)
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         if not connector:
             return FreshnessCheckResult(
@@ -433,11 +462,17 @@ class DQService:
         correlation_id = correlation_id or self._generate_correlation_id()
 
         # Get all active connectors for tenant
-        connectors = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.is_enabled == True,
-            TenantAirbyteConnection.status != "deleted",
-        ).all()
+        if self._connectors is not None:
+            connectors = [
+                c for c in self._connectors.values()
+                if c.is_enabled and c.status != "deleted"
+            ]
+        else:
+            connectors = self.db.query(TenantAirbyteConnection).filter(
+                TenantAirbyteConnection.tenant_id == self.tenant_id,
+                TenantAirbyteConnection.is_enabled == True,
+                TenantAirbyteConnection.status != "deleted",
+            ).all()
 
         results = []
         for connector in connectors:
@@ -465,10 +500,7 @@ class DQService:
         Returns:
             AnomalyCheckResult
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
@@ -545,17 +577,80 @@ class DQService:
         Returns:
             AnomalyCheckResult with anomaly_score in metadata
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        return self.check_volume_anomalies(
+            {connector_id: (daily_counts, today_count)}, billing_tier,
+        )[0]
 
-        connector_name = connector.connection_name if connector else "Unknown"
+    def check_volume_anomalies(
+        self,
+        series: Dict[str, Tuple[List[int], int]],
+        billing_tier: str = "free",
+    ) -> List[AnomalyCheckResult]:
+        """
+        Volume anomaly check for many connectors.
+
+        Args:
+            series: {connector_id: (daily_counts, today_count)}, as in
+                check_volume_anomaly
+            billing_tier: 'free', 'growth', or 'enterprise'
 
+        Returns:
+            AnomalyCheckResult per connector, in input order. Besides the
+            rolling-average verdict, metadata carries robust baselines
+            (rolling median, MAD, robust z-score, same-weekday baseline).
+        """
         # Load plan-tier threshold
         loader = get_quality_thresholds_loader()
         threshold_pct = loader.get_volume_anomaly_threshold(billing_tier)
 
+        connector_ids = list(series)
+        baselines = [list(series[c][0]) for c in connector_ids]
+        todays = [series[c][1] for c in connector_ids]
+
+        averages = kernels.means(baselines)
+        changes = kernels.pct_changes(averages, todays)
+        median_mads = kernels.median_mads(baselines)
+        robust_z = kernels.robust_z_scores(baselines, todays)
+        seasonal = kernels.seasonal_baselines(baselines)
+
+        results = []
+        for i, connector_id in enumerate(connector_ids):
+            median, mad = median_mads[i]
+            robust_baseline = {
+                "rolling_median": _round_or_none(median, 2),
+                "mad": _round_or_none(mad, 2),
+                "robust_z": _round_or_none(robust_z[i], 2),
+                "seasonal_baseline": _round_or_none(seasonal[i], 2),
+            }
+            results.append(self._volume_anomaly_result(
+                loader,
+                connector_id,
+                baselines[i],
+                todays[i],
+                billing_tier,
+                threshold_pct,
+                averages[i],
+                changes[i],
+                robust_baseline,
+            ))
+        return results
+
+    def _volume_anomaly_result(
+        self,
+        loader,
+        connector_id: str,
+        daily_counts: List[int],
+        today_count: int,
+        billing_tier: str,
+        threshold_pct: float,
+        avg_count: Optional[float],
+        pct_change: Optional[float],
+        robust_baseline: Dict[str, Any],
+    ) -> AnomalyCheckResult:
+        connector = self._get_connector(connector_id)
+
+        connector_name = connector.connection_name if connector else "Unknown"
+
         # Need at least 2 days of baseline data
         if len(daily_counts) < 2:
             return AnomalyCheckResult(
@@ -572,9 +667,6 @@ class DQService:
                 metadata={"anomaly_score": 0.0, "billing_tier": billing_tier},
             )
 
-        # Compute rolling average
-        avg_count = sum(daily_counts) / len(daily_counts)
-
         if avg_count == 0:
             return AnomalyCheckResult(
                 connector_id=connector_id,
@@ -590,8 +682,6 @@ class DQService:
                 metadata={"anomaly_score": 0.0, "billing_tier": billing_tier},
             )
 
-        # Compute deviation
-        pct_change = ((avg_count - today_count) / avg_count) * 100
         anomaly_score = min(abs(pct_change) / threshold_pct, 1.0)
         is_anomaly = abs(pct_change) >= threshold_pct
 
@@ -607,6 +697,7 @@ class DQService:
             "billing_tier": billing_tier,
             "lookback_days": len(daily_counts),
             "rolling_avg": round(avg_count, 2),
+            **robust_baseline,
         }
 
         if is_anomaly:
@@ -821,29 +912,7 @@ class DQService:
         Returns:
             JSD value in [0, 1]. 0 = identical, 1 = maximally different.
         """
-        all_keys = set(p) | set(q)
-        if not all_keys:
-            return 0.0
-
-        # Build aligned vectors with smoothing for missing categories
-        epsilon = 1e-10
-        p_vec = [p.get(k, 0.0) + epsilon for k in all_keys]
-        q_vec = [q.get(k, 0.0) + epsilon for k in all_keys]
-
-        # Normalize
-        p_sum = sum(p_vec)
-        q_sum = sum(q_vec)
-        p_vec = [x / p_sum for x in p_vec]
-        q_vec = [x / q_sum for x in q_vec]
-
-        # M = (P + Q) / 2
-        m_vec = [(pi + qi) / 2 for pi, qi in zip(p_vec, q_vec)]
-
-        # JSD = (KL(P||M) + KL(Q||M)) / 2
-        def _kl(a, b):
-            return sum(ai * math.log2(ai / bi) for ai, bi in zip(a, b))
-
-        return (_kl(p_vec, m_vec) + _kl(q_vec, m_vec)) / 2
+        return kernels.jensen_shannon_divergence(p, q)
 
     def check_distribution_drift(
         self,
@@ -869,16 +938,58 @@ class DQService:
         Returns:
             AnomalyCheckResult with JSD and top movers in metadata
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        return self.check_distribution_drifts(
+            connector_id, {dimension: (baseline_dist, current_dist)}, billing_tier,
+        )[0]
+
+    def check_distribution_drifts(
+        self,
+        connector_id: str,
+        distributions: Dict[str, Tuple[Dict[str, float], Dict[str, float]]],
+        billing_tier: str = "free",
+    ) -> List[AnomalyCheckResult]:
+        """
+        Distribution drift check for many dimensions.
+
+        Args:
+            connector_id: Connector ID
+            distributions: {dimension: (baseline_dist, current_dist)}
+            billing_tier: 'free', 'growth', or 'enterprise'
+
+        Returns:
+            AnomalyCheckResult per dimension, in input order
+        """
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
         loader = get_quality_thresholds_loader()
         threshold = loader.get_distribution_drift_threshold(billing_tier)
 
+        pairs = list(distributions.values())
+        scores = kernels.jensen_shannon_divergences(pairs)
+
+        return [
+            self._distribution_drift_result(
+                loader, connector_id, connector_name, dimension,
+                baseline_dist, current_dist, billing_tier, threshold, jsd,
+            )
+            for dimension, (baseline_dist, current_dist), jsd
+            in zip(distributions, pairs, scores)
+        ]
+
+    def _distribution_drift_result(
+        self,
+        loader,
+        connector_id: str,
+        connector_name: str,
+        dimension: str,
+        baseline_dist: Dict[str, float],
+        current_dist: Dict[str, float],
+        billing_tier: str,
+        threshold: float,
+        jsd: float,
+    ) -> AnomalyCheckResult:
         # Both empty → nothing to compare
         if not baseline_dist and not current_dist:
             return AnomalyCheckResult(
@@ -901,20 +1012,11 @@ class DQService:
                 },
             )
 
-        jsd = self._jensen_shannon_divergence(baseline_dist, current_dist)
         anomaly_score = min(jsd / threshold, 1.0) if threshold > 0 else 1.0
         is_anomaly = jsd >= threshold
 
-        # Compute top movers (top 3 categories by absolute proportion change)
-        all_keys = set(baseline_dist) | set(current_dist)
-        changes = [
-            (k, current_dist.get(k, 0.0) - baseline_dist.get(k, 0.0))
-            for k in all_keys
-        ]
-        changes.sort(key=lambda x: abs(x[1]), reverse=True)
-        top_movers = [
-            {"category": k, "change": round(v, 4)} for k, v in changes[:3]
-        ]
+        # Top 3 categories by absolute proportion change
+        top_movers = kernels.top_movers(baseline_dist, current_dist)
 
         severity_label = loader.resolve_severity_label(anomaly_score)
         severity = DQSeverity.HIGH if severity_label == "high" else DQSeverity.WARNING
@@ -992,16 +1094,62 @@ class DQService:
         Returns:
             AnomalyCheckResult with pct_change in metadata
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        return self.check_cardinality_shifts(
+            connector_id, {dimension: (baseline_count, current_count)}, billing_tier,
+        )[0]
+
+    def check_cardinality_shifts(
+        self,
+        connector_id: str,
+        counts: Dict[str, Tuple[int, int]],
+        billing_tier: str = "free",
+    ) -> List[AnomalyCheckResult]:
+        """
+        Cardinality shift check for many dimensions.
+
+        Args:
+            connector_id: Connector ID
+            counts: {dimension: (baseline_count, current_count)}
+            billing_tier: 'free', 'growth', or 'enterprise'
+
+        Returns:
+            AnomalyCheckResult per dimension, in input order
+        """
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
         loader = get_quality_thresholds_loader()
         threshold_pct = loader.get_cardinality_shift_threshold(billing_tier)
 
+        pairs = list(counts.values())
+        changes = kernels.pct_changes(
+            [baseline for baseline, _ in pairs],
+            [current for _, current in pairs],
+        )
+
+        return [
+            self._cardinality_shift_result(
+                loader, connector_id, connector_name, dimension,
+                baseline_count, current_count, billing_tier, threshold_pct,
+                abs(change) if change is not None else None,
+            )
+            for dimension, (baseline_count, current_count), change
+            in zip(counts, pairs, changes)
+        ]
+
+    def _cardinality_shift_result(
+        self,
+        loader,
+        connector_id: str,
+        connector_name: str,
+        dimension: str,
+        baseline_count: int,
+        current_count: int,
+        billing_tier: str,
+        threshold_pct: float,
+        pct_change: Optional[float],
+    ) -> AnomalyCheckResult:
         if baseline_count == 0:
             return AnomalyCheckResult(
                 connector_id=connector_id,
@@ -1025,7 +1173,6 @@ class DQService:
                 },
             )
 
-        pct_change = abs(current_count - baseline_count) / baseline_count * 100
         anomaly_score = min(pct_change / threshold_pct, 1.0) if threshold_pct > 0 else 1.0
         is_anomaly = pct_change >= threshold_pct
 
@@ -1096,10 +1243,7 @@ class DQService:
         """
         Check for zero spend anomaly (spend = 0 when previously non-zero).
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
@@ -1145,10 +1289,7 @@ class DQService:
         """
         Check for zero orders anomaly (orders = 0 when previously non-zero).
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
@@ -1193,10 +1334,7 @@ class DQService:
         """
         Check for missing days in time series data.
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
@@ -1249,10 +1387,7 @@ class DQService:
         """
         Check for negative values in fields that should be positive.
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
@@ -1298,10 +1433,7 @@ class DQService:
         """
         Check for duplicate primary keys in data.
         """
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == connector_id,
-        ).first()
+        connector = self._get_connector(connector_id)
 
         connector_name = connector.connection_name if connector else "Unknown"
 
@@ -1355,9 +1487,14 @@ class DQService:
         merchant_message: str = "",
         support_details: str = "",
         metadata: Optional[Dict[str, Any]] = None,
+        commit: bool = True,
     ) -> DQResult:
         """
         Record a DQ check result to the database.
+
+        With commit=False the result is only added to the session, so a
+        caller recording many results flushes them as one batched INSERT
+        and commits once.
         """
         result = DQResult(
             check_id=check.id,
@@ -1377,7 +1514,8 @@ class DQService:
             context_metadata=metadata or {},
         )
         self.db.add(result)
-        self.db.commit()
+        if commit:
+            self.db.commit()
 
         logger.info(
             "DQ result recorded",
@@ -1428,6 +1566,9 @@ class DQService:
             recommended_actions=recommended_actions or [],
         )
         self.db.add(incident)
+        mark_tenant_health_dirty(
+            self.db, self.tenant_id, HealthSnapshotTrigger.DQ_INCIDENT_OPENED,
+        )
         self.db.commit()
 
         logger.warning(
@@ -1468,6 +1609,9 @@ class DQService:
         incident.resolved_at = datetime.now(timezone.utc)
         incident.resolved_by = resolved_by
         incident.resolution_notes = resolution_notes
+        mark_tenant_health_dirty(
+            self.db, self.tenant_id, HealthSnapshotTrigger.DQ_INCIDENT_RESOLVED,
+        )
         self.db.commit()
 
         logger.info(
@@ -1779,10 +1923,7 @@ class DQService:
             Human-readable scope string (e.g., "Meta Ads connector")
         """
         # Try to get connector name
-        connector = self.db.query(TenantAirbyteConnection).filter(
-            TenantAirbyteConnection.tenant_id == self.tenant_id,
-            TenantAirbyteConnection.id == incident.connector_id,
-        ).first()
+        connector = self._get_connector(incident.connector_id)
 
         if connector:
             return f"{connector.connection_name} connector"
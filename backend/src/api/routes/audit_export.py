@@ -2,11 +2,14 @@
 GA Audit Log Export API.
 
 LOCKED RULES:
-- Formats: CSV + JSON
+- Formats: CSV + JSON (+ NDJSON), optional gzip
 - Rate-limited (3 exports per tenant per 24h)
 - Tenant-scoped or global depending on role
 - Async job for large exports (>10K rows)
 
+/download streams the export straight from a DB cursor (constant memory);
+queued exports are fetched from the export file store once produced.
+
 Export attempts are themselves audited.
 """
 
@@ -15,13 +18,20 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
-from fastapi.responses import PlainTextResponse
+from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.platform.tenant_context import get_tenant_context
 from src.constants.permissions import Role
 from src.database.session import get_db_session
-from src.services.audit_exporter import AuditExporterService, ExportFormat
+from src.models.audit_export import AuditExportStatus, GAAuditExport
+from src.services.audit_exporter import (
+    EXPORT_MEDIA_TYPES,
+    AuditExporterService,
+    ExportFormat,
+    export_filename,
+)
+from src.services.export_store import get_export_store
 
 logger = logging.getLogger(__name__)
 
@@ -144,28 +154,31 @@ async def export_audit_logs(
     )
 
 
-@router.post("/download", response_class=PlainTextResponse)
+@router.post("/download")
 async def download_audit_export(
     request: Request,
     db_session=Depends(get_db_session),
     format: ExportFormat = Query(ExportFormat.CSV, description="Export format"),
+    gzip: bool = Query(False, description="Gzip-compress the export"),
     event_type: Optional[str] = Query(None, description="Filter by event type"),
     dashboard_id: Optional[str] = Query(None, description="Filter by dashboard ID"),
     start_date: Optional[datetime] = Query(None, description="Start of date range"),
     end_date: Optional[datetime] = Query(None, description="End of date range"),
 ):
     """
-    Download audit logs directly as CSV or JSON content.
+    Stream audit logs as CSV, JSON or NDJSON.
 
-    Same rate limiting and access control as /export.
-    Returns the file content directly.
+    Same rate limiting and access control as /export. Rows are streamed
+    from a keyset-paginated cursor, so any export size is served with
+    constant memory.
     """
     is_super_admin, tenant_id = _check_export_access(request)
 
     service = AuditExporterService(db_session)
-    result = service.export(
+    result, chunks = service.stream_export(
         tenant_id=tenant_id,
         fmt=format,
+        compress=gzip,
         is_super_admin=is_super_admin,
         event_type=event_type,
         dashboard_id=dashboard_id,
@@ -173,32 +186,64 @@ async def download_audit_export(
         end_date=end_date,
     )
 
-    if not result.success:
-        if "rate limit" in (result.error or "").lower():
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail=result.error,
-            )
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=result.error or "Export failed",
-        )
-
-    if result.is_async:
+    if chunks is None:
         raise HTTPException(
-            status_code=status.HTTP_202_ACCEPTED,
-            detail="Export queued for async processing. Use /export endpoint.",
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=result.error,
         )
 
-    content_type = (
-        "text/csv" if format == ExportFormat.CSV else "application/json"
-    )
-    return PlainTextResponse(
-        content=result.content,
-        media_type=content_type,
+    return StreamingResponse(
+        chunks,
+        media_type="application/gzip" if gzip else EXPORT_MEDIA_TYPES[format],
         headers={
             "Content-Disposition": (
-                f"attachment; filename=audit-logs.{format.value}"
+                f"attachment; filename={export_filename(format, gzip)}"
             ),
+            "X-Export-Id": result.export_id,
         },
     )
+
+
+@router.get("/{export_id}/download")
+async def download_queued_export(
+    export_id: str,
+    request: Request,
+    db_session=Depends(get_db_session),
+):
+    """
+    Download a queued (async) export once the worker has produced it.
+
+    Returns 202 while the export is still queued or running.
+    """
+    is_super_admin, tenant_id = _check_export_access(request)
+
+    export = db_session.get(GAAuditExport, export_id)
+    if export is None or (not is_super_admin and export.tenant_id != tenant_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Export not found",
+        )
+
+    if export.status == AuditExportStatus.FAILED.value:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=export.error or "Export failed",
+        )
+    if export.status != AuditExportStatus.COMPLETED.value:
+        raise HTTPException(
+            status_code=status.HTTP_202_ACCEPTED,
+            detail=f"Export is {export.status}",
+        )
+
+    fmt = ExportFormat(export.format)
+    path = get_export_store().local_path(export.storage_key)
+    if path is None or not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Export file is no longer available",
+        )
+    return FileResponse(
+        path,
+        media_type="application/gzip" if export.compress else EXPORT_MEDIA_TYPES[fmt],
+        filename=export_filename(fmt, export.compress),
+    )
@@ -25,6 +25,7 @@ from src.platform.tenant_context import get_tenant_context
 from src.constants.permissions import Role
 from src.database.session import get_db_session
 from src.models.audit_log import GAAuditLog
+from src.platform.pagination import CountMode, InvalidCursorError
 from src.services.audit_query_service import AuditQueryService
 
 logger = logging.getLogger(__name__)
@@ -53,10 +54,12 @@ class AuditLogEntryResponse(BaseModel):
 class AuditLogsListResponse(BaseModel):
     """Paginated list of audit log entries."""
     logs: list[AuditLogEntryResponse]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
     has_more: bool
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -147,6 +150,12 @@ async def list_audit_logs(
     ),
     limit: int = Query(50, le=500, ge=1, description="Page size"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides offset)"
+    ),
+    count: CountMode = Query(
+        CountMode.ESTIMATED, description="How to compute total: exact, estimated or none"
+    ),
 ):
     """
     Query GA audit logs with filters and pagination.
@@ -169,20 +178,25 @@ async def list_audit_logs(
     effective_tenant = tenant_id if is_super_admin else caller_tenant_id
 
     service = AuditQueryService(db_session)
-    result = service.query_logs(
-        tenant_id=effective_tenant if not is_super_admin or tenant_id else tenant_id,
-        accessible_tenants=accessible_tenants if not is_super_admin else None,
-        is_super_admin=is_super_admin,
-        event_type=event_type,
-        dashboard_id=dashboard_id,
-        user_id=user_id,
-        success=success,
-        start_date=start_date,
-        end_date=end_date,
-        correlation_id=correlation_id,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        result = service.query_logs(
+            tenant_id=effective_tenant if not is_super_admin or tenant_id else tenant_id,
+            accessible_tenants=accessible_tenants if not is_super_admin else None,
+            is_super_admin=is_super_admin,
+            event_type=event_type,
+            dashboard_id=dashboard_id,
+            user_id=user_id,
+            success=success,
+            start_date=start_date,
+            end_date=end_date,
+            correlation_id=correlation_id,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return AuditLogsListResponse(
         logs=[_log_entry_from_row(row) for row in result.items],
@@ -190,6 +204,8 @@ async def list_audit_logs(
         limit=result.limit,
         offset=result.offset,
         has_more=result.has_more,
+        next_cursor=result.next_cursor,
+        total_is_estimate=result.total_is_estimate,
     )
 
 
@@ -18,6 +18,7 @@ from fastapi import APIRouter, Request, HTTPException, Depends, Query, status
 
 from src.platform.tenant_context import get_tenant_context
 from src.database.session import get_db_session
+from src.platform.pagination import CountMode, InvalidCursorError
 from src.services.billing_entitlements import BillingEntitlementsService, BillingFeature
 from src.services.custom_dashboard_service import (
     CustomDashboardService,
@@ -103,23 +104,32 @@ async def list_dashboards(
     status_filter: Optional[str] = Query(None, alias="status"),
     offset: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None),
+    count: CountMode = Query(CountMode.EXACT),
     service: CustomDashboardService = Depends(_get_dashboard_service),
 ):
     """List custom dashboards for the current tenant."""
-    dashboards, total = service.list_dashboards(
-        status_filter=status_filter,
-        offset=offset,
-        limit=limit,
-    )
+    try:
+        page = service.list_dashboards(
+            status_filter=status_filter,
+            offset=offset,
+            limit=limit,
+            cursor=cursor,
+            count=count,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return DashboardListResponse(
         dashboards=[
-            _dashboard_to_response(d, service) for d in dashboards
+            _dashboard_to_response(d, service) for d in page.items
         ],
-        total=total,
+        total=page.total,
         offset=offset,
         limit=limit,
-        has_more=(offset + limit) < total,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
@@ -16,7 +16,6 @@ SECURITY:
 """
 
 import logging
-from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
@@ -24,6 +23,12 @@ from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 from src.platform.tenant_context import get_tenant_context
 from src.platform.rbac import require_permission
 from src.constants.permissions import Permission
+from src.config.registry import (
+    CONSUMERS_CONFIG_PATH,
+    METRICS_VERSIONS_CONFIG_PATH,
+    get_consumers_config,
+    get_metrics_versions_config,
+)
 from src.database.session import get_db_session
 from src.governance.metric_versioning import MetricVersionResolver
 from src.services.dashboard_metric_binding_service import DashboardMetricBindingService
@@ -41,18 +46,18 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/dashboard-bindings", tags=["dashboard-bindings"])
 
-# Config paths
-CONSUMERS_CONFIG_PATH = Path(__file__).resolve().parents[4] / "config" / "governance" / "consumers.yaml"
-METRICS_CONFIG_PATH = Path(__file__).resolve().parents[4] / "config" / "governance" / "metrics_versions.yaml"
-
 
 def _get_binding_service(db_session) -> DashboardMetricBindingService:
-    """Create a DashboardMetricBindingService instance."""
-    metric_resolver = MetricVersionResolver(config_path=METRICS_CONFIG_PATH)
+    """Create a DashboardMetricBindingService on the registry's parsed config."""
+    metric_resolver = MetricVersionResolver(
+        config_path=METRICS_VERSIONS_CONFIG_PATH,
+        config=get_metrics_versions_config(),
+    )
     return DashboardMetricBindingService(
         db=db_session,
         consumers_config_path=CONSUMERS_CONFIG_PATH,
         metric_resolver=metric_resolver,
+        consumers_config=get_consumers_config(),
     )
 
 
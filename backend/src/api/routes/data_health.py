@@ -7,6 +7,9 @@ Provides endpoints for:
 - Stale data warnings
 - Freshness SLA configuration (per source, per billing tier)
 
+Routes use the async session path (get_async_db_session); service calls run
+through run_db() so health queries do not block the event loop.
+
 SECURITY: All routes require valid tenant context from JWT.
 Health data is tenant-scoped - users can only see their own connections.
 
@@ -118,25 +121,19 @@ class DatasetHealthResponse(BaseModel):
 # Dependencies
 # =============================================================================
 
-# Import shared database session dependency
-from src.database.session import get_db_session
+# Import shared async database session dependency
+from src.database.session import get_async_db_session, run_db
 
 
-def get_data_health_service(
-    request: Request,
-    db_session=Depends(get_db_session),
-):
-    """Get data health service instance scoped to current tenant."""
+def _data_health_service(db_session, tenant_id: str):
+    """Build the tenant-scoped data health service on the session run_db provides."""
     from src.services.data_health_service import DataHealthService
 
-    tenant_ctx = get_tenant_context(request)
-    return DataHealthService(db_session, tenant_ctx.tenant_id)
+    return DataHealthService(db_session, tenant_id)
 
 
-def get_dataset_observability_service(
-    db_session=Depends(get_db_session),
-):
-    """Get dataset observability service (platform-level, no tenant)."""
+def _dataset_observability_service(db_session):
+    """Build the dataset observability service (platform-level, no tenant)."""
     from src.services.dataset_observability import DatasetObservabilityService
 
     return DatasetObservabilityService(db_session)
@@ -182,7 +179,7 @@ def _source_health_to_response(health_info) -> SourceHealthResponse:
 )
 async def get_data_health_summary(
     request: Request,
-    service=Depends(get_data_health_service),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get overall data health summary for the current tenant.
@@ -206,7 +203,10 @@ async def get_data_health_summary(
         },
     )
 
-    summary = service.get_data_health_summary()
+    summary = await run_db(
+        db_session,
+        lambda s: _data_health_service(s, tenant_ctx.tenant_id).get_data_health_summary(),
+    )
 
     return DataHealthSummaryResponse(
         total_sources=summary.total_sources,
@@ -231,7 +231,7 @@ async def get_data_health_summary(
 async def get_source_health(
     request: Request,
     connection_id: str,
-    service=Depends(get_data_health_service),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get health information for a specific data source.
@@ -252,7 +252,10 @@ async def get_source_health(
         },
     )
 
-    health = service.get_source_health(connection_id)
+    health = await run_db(
+        db_session,
+        lambda s: _data_health_service(s, tenant_ctx.tenant_id).get_source_health(connection_id),
+    )
 
     if not health:
         raise HTTPException(
@@ -269,7 +272,7 @@ async def get_source_health(
 )
 async def get_stale_sources(
     request: Request,
-    service=Depends(get_data_health_service),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get all data sources with stale data.
@@ -288,7 +291,10 @@ async def get_stale_sources(
         extra={"tenant_id": tenant_ctx.tenant_id},
     )
 
-    stale = service.get_stale_sources()
+    stale = await run_db(
+        db_session,
+        lambda s: _data_health_service(s, tenant_ctx.tenant_id).get_stale_sources(),
+    )
 
     return StaleSourcesResponse(
         stale_sources=[
@@ -304,7 +310,7 @@ async def get_stale_sources(
 )
 async def get_all_sources_health(
     request: Request,
-    service=Depends(get_data_health_service),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get health information for all data sources.
@@ -322,7 +328,10 @@ async def get_all_sources_health(
         extra={"tenant_id": tenant_ctx.tenant_id},
     )
 
-    sources = service.get_all_sources_health()
+    sources = await run_db(
+        db_session,
+        lambda s: _data_health_service(s, tenant_ctx.tenant_id).get_all_sources_health(),
+    )
 
     return [_source_health_to_response(s) for s in sources]
 
@@ -422,7 +431,7 @@ async def get_source_freshness_sla(
 )
 async def get_merchant_data_health(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get the merchant-facing data health state.
@@ -433,12 +442,14 @@ async def get_merchant_data_health(
     - delayed: Some data delayed, AI insights paused
     - unavailable: Data temporarily unavailable
 
+    Served from the precomputed tenant health snapshot.
+
     Response fields are merchant-safe and never expose internal
     system details, SLA thresholds, or error codes.
 
     SECURITY: tenant_id from JWT only. Response scoped to tenant.
     """
-    from src.services.merchant_data_health import MerchantDataHealthService
+    from src.services.tenant_health_snapshot import TenantHealthSnapshotService
 
     tenant_ctx = get_tenant_context(request)
 
@@ -450,12 +461,13 @@ async def get_merchant_data_health(
         },
     )
 
-    service = MerchantDataHealthService(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
-        billing_tier=getattr(tenant_ctx, "billing_tier", "free"),
+    billing_tier = getattr(tenant_ctx, "billing_tier", "free")
+    result = await run_db(
+        db_session,
+        lambda s: TenantHealthSnapshotService(s).get(
+            tenant_ctx.tenant_id, billing_tier=billing_tier,
+        ).merchant_result(),
     )
-    result = service.evaluate()
 
     return MerchantDataHealthResponse(
         health_state=result.state.value,
@@ -477,7 +489,7 @@ async def get_merchant_data_health(
 )
 async def get_dataset_health(
     request: Request,
-    observability=Depends(get_dataset_observability_service),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get Superset dataset sync status for monitoring.
@@ -492,8 +504,12 @@ async def get_dataset_health(
         "Dataset health requested",
         extra={"tenant_id": tenant_ctx.tenant_id},
     )
-    all_health = observability.get_all_dataset_health()
-    unhealthy = observability.get_unhealthy_datasets()
+
+    def _collect(session):
+        observability = _dataset_observability_service(session)
+        return observability.get_all_dataset_health(), observability.get_unhealthy_datasets()
+
+    all_health, unhealthy = await run_db(db_session, _collect)
     return DatasetHealthResponse(
         datasets=[DatasetHealthEntry(**h) for h in all_health],
         unhealthy_count=len(unhealthy),
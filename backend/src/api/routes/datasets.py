@@ -337,7 +337,8 @@ async def chart_preview(
     Constraints:
     - 100-row limit enforced
     - 10-second query timeout
-    - Results cached for 60s keyed by (dataset_name, config_hash, tenant_id)
+    - Results cached for 60s keyed by (dataset_name, config_hash, tenant_id),
+      then served stale while a background query refreshes them
     - High-cardinality GROUP BY truncated to 100 unique values
 
     All column names are parameterized via Superset column references.
@@ -384,7 +385,7 @@ async def chart_preview(
     )
 
     service = _get_chart_query_service()
-    result = service.execute_preview(config, tenant_ctx.tenant_id)
+    result = await service.execute_preview(config, tenant_ctx.tenant_id)
 
     return ChartPreviewResponse(
         data=result.data,
@@ -6,6 +6,9 @@ Provides endpoints for:
 - Marking insights as read
 - Dismissing insights
 
+Routes use the async session path (get_async_db_session); query code runs
+through run_db() so it does not block the event loop.
+
 SECURITY: All routes require valid tenant context from JWT.
 Insights are tenant-scoped - users can only see their own insights.
 Entitlement check enforced for AI_INSIGHTS feature.
@@ -21,9 +24,12 @@ from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 from pydantic import BaseModel, ConfigDict, Field
 
 from src.platform.tenant_context import get_tenant_context
-from src.database.session import get_db_session
+from src.database.session import run_db
 from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
-from src.api.dependencies.entitlements import check_ai_insights_entitlement
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
+from src.api.dependencies.entitlements import (
+    check_ai_insights_entitlement_async as check_ai_insights_entitlement,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -129,6 +135,119 @@ def _insight_to_response(insight: AIInsight) -> InsightResponse:
     )
 
 
+# =============================================================================
+# Query Helpers (run via run_db)
+# =============================================================================
+
+
+def _query_insights(
+    db_session,
+    tenant_id: str,
+    insight_type: Optional[str],
+    severity: Optional[str],
+    include_dismissed: bool,
+    include_read: bool,
+    limit: int,
+    offset: int,
+) -> tuple[List[AIInsight], int, bool]:
+    """Filter, count and page a tenant's insights (newest first)."""
+    query = db_session.query(AIInsight).filter(
+        AIInsight.tenant_id == tenant_id
+    )
+
+    # Apply filters
+    if insight_type:
+        try:
+            type_enum = InsightType(insight_type)
+            query = query.filter(AIInsight.insight_type == type_enum)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid insight_type: {insight_type}",
+            )
+
+    if severity:
+        try:
+            severity_enum = InsightSeverity(severity)
+            query = query.filter(AIInsight.severity == severity_enum)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid severity: {severity}",
+            )
+
+    if not include_dismissed:
+        query = query.filter(AIInsight.is_dismissed == 0)
+
+    if not include_read:
+        query = query.filter(AIInsight.is_read == 0)
+
+    # Get total count
+    total = query.count()
+
+    # Get paginated results (fetch one extra to check has_more)
+    insights = (
+        query.order_by(AIInsight.generated_at.desc())
+        .offset(offset)
+        .limit(limit + 1)
+        .all()
+    )
+
+    has_more = len(insights) > limit
+    insights = insights[:limit]
+
+    return insights, total, has_more
+
+
+def _get_tenant_insight(db_session, tenant_id: str, insight_id: str) -> Optional[AIInsight]:
+    """Load a single insight, scoped to the tenant."""
+    return (
+        db_session.query(AIInsight)
+        .filter(
+            AIInsight.id == insight_id,
+            AIInsight.tenant_id == tenant_id,
+        )
+        .first()
+    )
+
+
+def _publish_insights_changed(db_session, tenant_id: str) -> None:
+    """Tell the tenant's other open tabs to refetch unread insight counts."""
+    publish_live_event(
+        LiveEvent(type=LiveEventType.INSIGHTS, tenant_id=tenant_id),
+        db=db_session,
+    )
+
+
+def _update_tenant_insight(db_session, tenant_id: str, insight_id: str, method: str) -> bool:
+    """Apply a state change (mark_read / mark_dismissed) and commit."""
+    insight = _get_tenant_insight(db_session, tenant_id, insight_id)
+    if not insight:
+        return False
+
+    getattr(insight, method)()
+    _publish_insights_changed(db_session, tenant_id)
+    db_session.commit()
+    return True
+
+
+def _mark_insights_read(db_session, tenant_id: str, insight_ids: List[str]) -> int:
+    """Mark the tenant's matching insights as read; returns rows updated."""
+    updated = (
+        db_session.query(AIInsight)
+        .filter(
+            AIInsight.id.in_(insight_ids),
+            AIInsight.tenant_id == tenant_id,
+        )
+        .update({AIInsight.is_read: 1}, synchronize_session=False)
+    )
+
+    if updated:
+        _publish_insights_changed(db_session, tenant_id)
+    db_session.commit()
+    return updated
+
+
 # =============================================================================
 # Routes
 # =============================================================================
@@ -177,52 +296,18 @@ async def list_insights(
         },
     )
 
-    # Build query
-    query = db_session.query(AIInsight).filter(
-        AIInsight.tenant_id == tenant_ctx.tenant_id
+    insights, total, has_more = await run_db(
+        db_session,
+        _query_insights,
+        tenant_ctx.tenant_id,
+        insight_type=insight_type,
+        severity=severity,
+        include_dismissed=include_dismissed,
+        include_read=include_read,
+        limit=limit,
+        offset=offset,
     )
 
-    # Apply filters
-    if insight_type:
-        try:
-            type_enum = InsightType(insight_type)
-            query = query.filter(AIInsight.insight_type == type_enum)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid insight_type: {insight_type}",
-            )
-
-    if severity:
-        try:
-            severity_enum = InsightSeverity(severity)
-            query = query.filter(AIInsight.severity == severity_enum)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid severity: {severity}",
-            )
-
-    if not include_dismissed:
-        query = query.filter(AIInsight.is_dismissed == 0)
-
-    if not include_read:
-        query = query.filter(AIInsight.is_read == 0)
-
-    # Get total count
-    total = query.count()
-
-    # Get paginated results (fetch one extra to check has_more)
-    insights = (
-        query.order_by(AIInsight.generated_at.desc())
-        .offset(offset)
-        .limit(limit + 1)
-        .all()
-    )
-
-    has_more = len(insights) > limit
-    insights = insights[:limit]
-
     return InsightsListResponse(
         insights=[_insight_to_response(i) for i in insights],
         total=total,
@@ -247,14 +332,7 @@ async def get_insight(
     """
     tenant_ctx = get_tenant_context(request)
 
-    insight = (
-        db_session.query(AIInsight)
-        .filter(
-            AIInsight.id == insight_id,
-            AIInsight.tenant_id == tenant_ctx.tenant_id,
-        )
-        .first()
-    )
+    insight = await run_db(db_session, _get_tenant_insight, tenant_ctx.tenant_id, insight_id)
 
     if not insight:
         raise HTTPException(
@@ -282,24 +360,16 @@ async def mark_insight_read(
     """
     tenant_ctx = get_tenant_context(request)
 
-    insight = (
-        db_session.query(AIInsight)
-        .filter(
-            AIInsight.id == insight_id,
-            AIInsight.tenant_id == tenant_ctx.tenant_id,
-        )
-        .first()
+    found = await run_db(
+        db_session, _update_tenant_insight, tenant_ctx.tenant_id, insight_id, "mark_read"
     )
 
-    if not insight:
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Insight not found",
         )
 
-    insight.mark_read()
-    db_session.commit()
-
     logger.info(
         "Insight marked as read",
         extra={
@@ -331,24 +401,16 @@ async def dismiss_insight(
     """
     tenant_ctx = get_tenant_context(request)
 
-    insight = (
-        db_session.query(AIInsight)
-        .filter(
-            AIInsight.id == insight_id,
-            AIInsight.tenant_id == tenant_ctx.tenant_id,
-        )
-        .first()
+    found = await run_db(
+        db_session, _update_tenant_insight, tenant_ctx.tenant_id, insight_id, "mark_dismissed"
     )
 
-    if not insight:
+    if not found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Insight not found",
         )
 
-    insight.mark_dismissed()
-    db_session.commit()
-
     logger.info(
         "Insight dismissed",
         extra={
@@ -389,18 +451,10 @@ async def mark_insights_read_batch(
             detail="Maximum 100 insights per batch",
         )
 
-    # Update all matching insights
-    updated = (
-        db_session.query(AIInsight)
-        .filter(
-            AIInsight.id.in_(insight_ids),
-            AIInsight.tenant_id == tenant_ctx.tenant_id,
-        )
-        .update({AIInsight.is_read: 1}, synchronize_session=False)
+    updated = await run_db(
+        db_session, _mark_insights_read, tenant_ctx.tenant_id, insight_ids
     )
 
-    db_session.commit()
-
     logger.info(
         "Insights marked as read (batch)",
         extra={
@@ -0,0 +1,88 @@
+"""
+Live event stream (server-sent events).
+
+One long-lived GET per browser tab replaces the timer polling of
+notification counts, pending approvals, What Changed status and sync
+progress. Events are refetch hints published via
+src.platform.live_events; the stream itself never touches the database,
+so an open stream holds no pooled connection.
+
+Streams close after LIVE_EVENTS_MAX_STREAM_SECONDS and the client
+reconnects, which re-runs authentication with a fresh token.
+
+SECURITY:
+- tenant_id and user_id from JWT only
+- A stream only receives its tenant's events, and user-scoped events
+  only for the authenticated user
+
+Environment variables:
+    LIVE_EVENTS_HEARTBEAT_SECONDS: Keep-alive comment interval (default 15)
+    LIVE_EVENTS_MAX_STREAM_SECONDS: Stream lifetime before reconnect (default 300)
+"""
+
+import asyncio
+import logging
+import os
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from src.platform.live_events import get_live_event_broker
+from src.platform.tenant_context import get_tenant_context
+
+logger = logging.getLogger(__name__)
+
+LIVE_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("LIVE_EVENTS_HEARTBEAT_SECONDS", "15"))
+LIVE_EVENTS_MAX_STREAM_SECONDS = float(os.getenv("LIVE_EVENTS_MAX_STREAM_SECONDS", "300"))
+
+# Client reconnect delay hint (ms) for the SSE "retry" field
+RECONNECT_DELAY_MS = 3000
+
+router = APIRouter(prefix="/api/events", tags=["live-events"])
+
+
+@router.get("/stream")
+async def stream_events(request: Request):
+    """
+    Stream the tenant's live events as text/event-stream.
+
+    Frames:
+    - event: ready          sent once on connect
+    - event: <topic>        notifications | approvals | sync | changes
+    - ": keepalive"         comment every LIVE_EVENTS_HEARTBEAT_SECONDS
+    """
+    tenant_ctx = get_tenant_context(request)
+    broker = get_live_event_broker()
+
+    async def event_frames():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + LIVE_EVENTS_MAX_STREAM_SECONDS
+        with broker.subscription(tenant_ctx.tenant_id, tenant_ctx.user_id) as queue:
+            yield f"retry: {RECONNECT_DELAY_MS}\nevent: ready\ndata: {{}}\n\n"
+            while True:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                try:
+                    live_event = await asyncio.wait_for(
+                        queue.get(), timeout=min(LIVE_EVENTS_HEARTBEAT_SECONDS, remaining)
+                    )
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+                yield live_event.to_sse()
+
+    logger.info(
+        "Live event stream opened",
+        extra={"tenant_id": tenant_ctx.tenant_id, "user_id": tenant_ctx.user_id},
+    )
+    return StreamingResponse(
+        event_frames(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",
+        },
+    )
@@ -30,6 +30,7 @@ from src.models.llm_routing import (
     LLMUsageLog,
 )
 from src.services.billing_entitlements import BillingEntitlementsService
+from src.services.llm_completion_cache import invalidate_llm_config
 from src.api.dependencies.entitlements import check_ai_insights_entitlement as check_llm_routing_entitlement
 
 logger = logging.getLogger(__name__)
@@ -108,6 +109,9 @@ class UsageStatsResponse(BaseModel):
     request_count: int
     success_count: int
     fallback_count: int
+    cache_hit_count: int = 0
+    cache_hit_ratio: float = 0.0
+    saved_tokens: int = 0
     period_days: int
 
 
@@ -126,6 +130,8 @@ class UsageLogResponse(BaseModel):
     cost_usd: float
     was_fallback: bool
     response_status: str
+    cache_status: Optional[str] = None
+    saved_tokens: int = 0
     created_at: datetime
 
 
@@ -313,6 +319,7 @@ async def update_org_config(
 
     db_session.commit()
     db_session.refresh(config)
+    invalidate_llm_config(tenant_ctx.tenant_id)
 
     logger.info(
         "Org LLM config updated",
@@ -508,6 +515,7 @@ async def create_prompt_template(
     db_session.add(template)
     db_session.commit()
     db_session.refresh(template)
+    invalidate_llm_config(tenant_ctx.tenant_id, template_req.template_key)
 
     logger.info(
         "Custom prompt template created",
@@ -610,6 +618,8 @@ async def list_usage_logs(
                 cost_usd=float(log.cost_usd),
                 was_fallback=log.was_fallback,
                 response_status=log.response_status,
+                cache_status=log.cache_status,
+                saved_tokens=log.saved_tokens or 0,
                 created_at=log.created_at,
             )
             for log in logs
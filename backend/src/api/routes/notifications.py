@@ -21,6 +21,7 @@ from fastapi import APIRouter, Request, HTTPException, status, Depends, Query
 
 from src.platform.tenant_context import get_tenant_context
 from src.database.session import get_db_session
+from src.platform.pagination import CountMode, InvalidCursorError
 from src.models.notification import (
     Notification,
     NotificationEventType,
@@ -73,6 +74,12 @@ async def list_notifications(
     ),
     limit: int = Query(50, le=100, description="Maximum notifications to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page (overrides offset)"
+    ),
+    count: CountMode = Query(
+        CountMode.ESTIMATED, description="How to compute total: exact, estimated or none"
+    ),
 ):
     """
     List notifications for the current user.
@@ -106,20 +113,28 @@ async def list_notifications(
                 detail=f"Invalid event type: {event_type}",
             )
 
-    notifications, total = service.get_notifications(
-        user_id=tenant_ctx.user_id,
-        event_type=parsed_event_type,
-        status=parsed_status,
-        limit=limit,
-        offset=offset,
-    )
+    try:
+        page = service.get_notifications(
+            user_id=tenant_ctx.user_id,
+            event_type=parsed_event_type,
+            status=parsed_status,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            count=count,
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     unread_count = service.get_unread_count(tenant_ctx.user_id)
 
     return NotificationListResponse(
-        notifications=[_notification_to_response(n) for n in notifications],
-        total=total,
+        notifications=[_notification_to_response(n) for n in page.items],
+        total=page.total,
         unread_count=unread_count,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
@@ -0,0 +1,67 @@
+"""
+Airbyte sync notification webhook.
+
+Airbyte posts a notification when a sync succeeds or fails. The payload is
+handed to the in-process AirbyteJobWatcher instances, releasing any waiter
+on that job without waiting for the next poll. Waiters in other processes
+are unaffected and still resolve on their watcher's next poll.
+
+SECURITY: Airbyte cannot sign notifications, so the webhook URL carries a
+shared secret: configure it in Airbyte as
+    https://<host>/api/webhooks/airbyte?token=<AIRBYTE_WEBHOOK_SECRET>
+(or send it in the X-Webhook-Token header). The endpoint is disabled
+(404) when AIRBYTE_WEBHOOK_SECRET is not set.
+"""
+
+import hmac
+import logging
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query, Request, status
+from pydantic import BaseModel
+
+from src.integrations.airbyte.job_watcher import handle_webhook
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/api/webhooks/airbyte", tags=["webhooks"])
+
+
+class WebhookResponse(BaseModel):
+    """Airbyte webhook acknowledgement."""
+    received: bool = True
+    resolved: bool = False
+
+
+def _verify_token(token: Optional[str]) -> None:
+    secret = os.getenv("AIRBYTE_WEBHOOK_SECRET")
+    if not secret:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if not token or not hmac.compare_digest(token.encode(), secret.encode()):
+        logger.warning("Airbyte webhook with invalid token rejected")
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+
+
+@router.post("", response_model=WebhookResponse)
+async def handle_sync_notification(
+    request: Request,
+    token: Optional[str] = Query(None),
+    x_webhook_token: Optional[str] = Header(None, alias="X-Webhook-Token"),
+):
+    """
+    Receive an Airbyte sync success/failure notification.
+
+    Always acknowledges a valid request; resolved reports whether a waiter
+    in this process was released.
+    """
+    _verify_token(x_webhook_token or token)
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid JSON")
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid payload")
+
+    return WebhookResponse(resolved=handle_webhook(payload))
@@ -10,6 +10,11 @@ Supported Events:
 - user.created, user.updated, user.deleted
 - organization.created, organization.updated, organization.deleted
 - organizationMembership.created, organizationMembership.updated, organizationMembership.deleted
+
+Verified events are written to the webhook inbox and acknowledged
+immediately; the webhook inbox worker applies them in order per
+organization (or user, for user events). Set WEBHOOK_INBOX_ENABLED=false
+to process them inline instead.
 """
 
 import os
@@ -21,7 +26,13 @@ from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from src.database.session import get_db_session_sync
+from src.models.webhook_inbox import WebhookSource
 from src.services.clerk_webhook_handler import ClerkWebhookHandler
+from src.services.webhook_inbox import (
+    WEBHOOK_INBOX_ENABLED,
+    enqueue_webhook,
+    payload_fingerprint,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -166,6 +177,23 @@ def _verify_signature_manual(
         return False
 
 
+def clerk_ordering_key(event_type: str, payload: dict) -> str:
+    """
+    Key whose events must be applied in order.
+
+    Organization and membership events order per organization; user
+    events order per user.
+    """
+    data = payload.get("data") or {}
+    if event_type.startswith("organizationMembership."):
+        org_id = (data.get("organization") or {}).get("id")
+        if org_id:
+            return org_id
+    elif event_type.startswith("organization.") and data.get("id"):
+        return data["id"]
+    return data.get("id") or "clerk"
+
+
 @router.post("/clerk", response_model=WebhookResponse)
 async def handle_clerk_webhook(
     request: Request,
@@ -260,6 +288,21 @@ async def handle_clerk_webhook(
     try:
         session = next(get_db_session_sync())
         try:
+            if WEBHOOK_INBOX_ENABLED:
+                queued = enqueue_webhook(
+                    session,
+                    source=WebhookSource.CLERK,
+                    event_id=svix_id or payload_fingerprint(body),
+                    topic=event_type,
+                    ordering_key=clerk_ordering_key(event_type, payload),
+                    payload=body,
+                )
+                return WebhookResponse(
+                    received=True,
+                    status="queued" if queued else "duplicate",
+                    message=f"Event {event_type} queued" if queued else "Duplicate event ignored",
+                )
+
             handler = ClerkWebhookHandler(session)
             result = handler.handle_event(event_type, payload)
 
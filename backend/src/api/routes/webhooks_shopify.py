@@ -4,6 +4,11 @@ Shopify webhook handlers for billing events.
 SECURITY: All webhooks MUST verify HMAC signature before processing.
 Shopify signs webhooks with the app's API secret.
 
+Billing, uninstall and shop redact webhooks are written to the webhook
+inbox and acknowledged immediately; the webhook inbox worker applies them
+(src.services.shopify_webhook_processor). Set WEBHOOK_INBOX_ENABLED=false
+to process them inline instead.
+
 Documentation: https://shopify.dev/docs/apps/webhooks/configuration/https
 """
 
@@ -12,21 +17,31 @@ import hmac
 import hashlib
 import base64
 import logging
-from datetime import datetime, timezone
 from typing import Optional
 
 from fastapi import APIRouter, Request, HTTPException, status, Header, Depends
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
+from src.models.webhook_inbox import WebhookSource
+from src.services.shopify_webhook_processor import (
+    WEBHOOK_TOPIC_APP_UNINSTALLED,
+    WEBHOOK_TOPIC_SHOP_REDACT,
+    WEBHOOK_TOPIC_SUBSCRIPTION_UPDATE,
+    process_app_uninstalled,
+    process_shop_redact,
+    process_subscription_update,
+)
+from src.services.webhook_inbox import (
+    WEBHOOK_INBOX_ENABLED,
+    enqueue_webhook,
+    payload_fingerprint,
+)
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/webhooks/shopify", tags=["webhooks"])
 
-# Webhook topics we handle
-WEBHOOK_TOPIC_SUBSCRIPTION_UPDATE = "app_subscriptions/update"
-WEBHOOK_TOPIC_APP_UNINSTALLED = "app/uninstalled"
-
 
 class WebhookResponse(BaseModel):
     """Standard webhook response."""
@@ -142,6 +157,34 @@ async def get_verified_webhook_body(request: Request) -> tuple[dict, str]:
 from src.database.session import get_db_session
 
 
+async def _enqueue_webhook(
+    request: Request,
+    session: Session,
+    topic: str,
+    shop_domain: str,
+) -> WebhookResponse:
+    """
+    Write a verified webhook to the inbox and acknowledge it.
+
+    Redeliveries of an event already in the inbox are acknowledged
+    without being queued again. Deliveries without X-Shopify-Webhook-Id
+    are deduplicated on a hash of topic, shop and body.
+    """
+    body = await request.body()
+    event_id = request.headers.get("X-Shopify-Webhook-Id") or payload_fingerprint(
+        topic.encode("utf-8"), shop_domain.encode("utf-8"), body
+    )
+    queued = enqueue_webhook(
+        session,
+        source=WebhookSource.SHOPIFY,
+        event_id=event_id,
+        topic=topic,
+        ordering_key=shop_domain,
+        payload=body,
+    )
+    return WebhookResponse(message="Webhook queued" if queued else "Duplicate webhook ignored")
+
+
 @router.post("/subscription-update", response_model=WebhookResponse)
 async def handle_subscription_update(
     request: Request,
@@ -158,6 +201,9 @@ async def handle_subscription_update(
     - Payment fails and subscription is frozen
     - Subscription is renewed
 
+    Queued to the webhook inbox and acknowledged immediately unless
+    WEBHOOK_INBOX_ENABLED=false.
+
     SECURITY: Verifies HMAC signature before processing.
     """
     data, shop_domain = await get_verified_webhook_body(request)
@@ -168,98 +214,14 @@ async def handle_subscription_update(
         "api_version": x_shopify_api_version
     })
 
-    # Extract subscription data
-    subscription_gid = data.get("app_subscription", {}).get("admin_graphql_api_id")
-    subscription_status = data.get("app_subscription", {}).get("status")
-    subscription_name = data.get("app_subscription", {}).get("name")
-
-    if not subscription_gid:
-        logger.warning("Webhook missing subscription ID", extra={
-            "shop_domain": shop_domain,
-            "data_keys": list(data.keys())
-        })
-        return WebhookResponse(message="Missing subscription ID")
-
-    logger.info("Processing subscription update", extra={
-        "shop_domain": shop_domain,
-        "subscription_gid": subscription_gid,
-        "status": subscription_status
-    })
+    if WEBHOOK_INBOX_ENABLED:
+        return await _enqueue_webhook(
+            request, session, WEBHOOK_TOPIC_SUBSCRIPTION_UPDATE, shop_domain
+        )
 
     try:
-        # Find store by shop domain
-        from src.models.store import ShopifyStore
-        store = session.query(ShopifyStore).filter(
-            ShopifyStore.shop_domain == shop_domain
-        ).first()
-
-        if not store:
-            logger.warning("Store not found for webhook", extra={
-                "shop_domain": shop_domain
-            })
-            return WebhookResponse(message="Store not found")
-
-        # Process based on status
-        from src.services.billing_service import BillingService
-
-        billing_service = BillingService(session, store.tenant_id)
-
-        if subscription_status == "ACTIVE":
-            # Subscription activated
-            current_period_end = None
-            if data.get("app_subscription", {}).get("current_period_end"):
-                current_period_end = datetime.fromisoformat(
-                    data["app_subscription"]["current_period_end"].replace("Z", "+00:00")
-                )
-
-            billing_service.activate_subscription(
-                shopify_subscription_id=subscription_gid,
-                current_period_end=current_period_end
-            )
-            logger.info("Subscription activated via webhook", extra={
-                "shop_domain": shop_domain,
-                "subscription_gid": subscription_gid
-            })
-
-        elif subscription_status == "CANCELLED":
-            # Subscription cancelled
-            billing_service.cancel_subscription(
-                shopify_subscription_id=subscription_gid,
-                cancelled_at=datetime.now(timezone.utc)
-            )
-            logger.info("Subscription cancelled via webhook", extra={
-                "shop_domain": shop_domain,
-                "subscription_gid": subscription_gid
-            })
-
-        elif subscription_status == "FROZEN":
-            # Payment failed
-            billing_service.freeze_subscription(
-                shopify_subscription_id=subscription_gid,
-                reason="payment_failed"
-            )
-            logger.warning("Subscription frozen via webhook", extra={
-                "shop_domain": shop_domain,
-                "subscription_gid": subscription_gid
-            })
-
-        elif subscription_status == "DECLINED":
-            # Merchant declined charge
-            billing_service.cancel_subscription(
-                shopify_subscription_id=subscription_gid
-            )
-            logger.info("Subscription declined via webhook", extra={
-                "shop_domain": shop_domain,
-                "subscription_gid": subscription_gid
-            })
-
-        else:
-            logger.info("Unhandled subscription status", extra={
-                "shop_domain": shop_domain,
-                "status": subscription_status
-            })
-
-        return WebhookResponse(message=f"Processed status: {subscription_status}")
+        message = process_subscription_update(session, shop_domain, data)
+        return WebhookResponse(message=message)
 
     except Exception as e:
         logger.error("Error processing subscription webhook", extra={
@@ -286,6 +248,9 @@ async def handle_app_uninstalled(
     - Mark the store as uninstalled
     - Retain data for potential reinstallation (per GDPR)
 
+    Queued to the webhook inbox and acknowledged immediately unless
+    WEBHOOK_INBOX_ENABLED=false.
+
     SECURITY: Verifies HMAC signature before processing.
     """
     data, shop_domain = await get_verified_webhook_body(request)
@@ -295,48 +260,14 @@ async def handle_app_uninstalled(
         "topic": x_shopify_topic
     })
 
+    if WEBHOOK_INBOX_ENABLED:
+        return await _enqueue_webhook(
+            request, session, WEBHOOK_TOPIC_APP_UNINSTALLED, shop_domain
+        )
+
     try:
-        from src.models.store import ShopifyStore
-        from src.models.subscription import Subscription, SubscriptionStatus
-
-        # Find and update store
-        store = session.query(ShopifyStore).filter(
-            ShopifyStore.shop_domain == shop_domain
-        ).first()
-
-        if store:
-            store.status = "uninstalled"
-            store.uninstalled_at = datetime.now(timezone.utc)
-            # Clear access token for security
-            store.access_token_encrypted = None
-
-            # Cancel any active subscriptions
-            subscriptions = session.query(Subscription).filter(
-                Subscription.store_id == store.id,
-                Subscription.status.in_([
-                    SubscriptionStatus.ACTIVE.value,
-                    SubscriptionStatus.PENDING.value,
-                    SubscriptionStatus.FROZEN.value
-                ])
-            ).all()
-
-            for sub in subscriptions:
-                sub.status = SubscriptionStatus.CANCELLED.value
-                sub.cancelled_at = datetime.now(timezone.utc)
-
-            session.commit()
-
-            logger.info("Store marked as uninstalled", extra={
-                "shop_domain": shop_domain,
-                "store_id": store.id,
-                "subscriptions_cancelled": len(subscriptions)
-            })
-        else:
-            logger.warning("Store not found for uninstall webhook", extra={
-                "shop_domain": shop_domain
-            })
-
-        return WebhookResponse(message="App uninstalled processed")
+        message = process_app_uninstalled(session, shop_domain, data)
+        return WebhookResponse(message=message)
 
     except Exception as e:
         logger.error("Error processing uninstall webhook", extra={
@@ -387,6 +318,9 @@ async def handle_shop_redact(
 
     Shopify requires apps to handle this mandatory webhook.
     Deletes all data associated with the shop (triggered 48 hours after uninstall).
+
+    Queued to the webhook inbox and acknowledged immediately unless
+    WEBHOOK_INBOX_ENABLED=false.
     """
     data, shop_domain = await get_verified_webhook_body(request)
 
@@ -394,52 +328,14 @@ async def handle_shop_redact(
         "shop_domain": shop_domain
     })
 
+    if WEBHOOK_INBOX_ENABLED:
+        return await _enqueue_webhook(
+            request, session, WEBHOOK_TOPIC_SHOP_REDACT, shop_domain
+        )
+
     try:
-        from src.models.store import ShopifyStore
-        from src.models.subscription import Subscription
-        from src.models.billing_event import BillingEvent
-        from src.models.usage import UsageRecord
-
-        # Find the store
-        store = session.query(ShopifyStore).filter(
-            ShopifyStore.shop_domain == shop_domain
-        ).first()
-
-        if store:
-            store_id = store.id
-            tenant_id = store.tenant_id
-
-            # Delete related records (order matters for foreign keys)
-            usage_deleted = session.query(UsageRecord).filter(
-                UsageRecord.store_id == store_id
-            ).delete(synchronize_session=False)
-
-            billing_events_deleted = session.query(BillingEvent).filter(
-                BillingEvent.store_id == store_id
-            ).delete(synchronize_session=False)
-
-            subscriptions_deleted = session.query(Subscription).filter(
-                Subscription.store_id == store_id
-            ).delete(synchronize_session=False)
-
-            # Delete the store itself
-            session.delete(store)
-            session.commit()
-
-            logger.info("Shop data deleted per GDPR request", extra={
-                "shop_domain": shop_domain,
-                "store_id": store_id,
-                "tenant_id": tenant_id,
-                "usage_records_deleted": usage_deleted,
-                "billing_events_deleted": billing_events_deleted,
-                "subscriptions_deleted": subscriptions_deleted
-            })
-        else:
-            logger.info("Shop not found for redact - may already be deleted", extra={
-                "shop_domain": shop_domain
-            })
-
-        return WebhookResponse(message="Shop redact completed - all data deleted")
+        message = process_shop_redact(session, shop_domain, data)
+        return WebhookResponse(message=message)
 
     except Exception as e:
         logger.error("Error processing shop redact webhook", extra={
@@ -4,6 +4,9 @@ What Changed API routes for Story 9.8.
 Read-only endpoints for the "What Changed?" debug panel.
 Provides merchant-safe aggregated data about recent changes.
 
+Routes use the async session path (get_async_db_session); aggregator
+queries run through run_db() so they do not block the event loop.
+
 SECURITY:
 - All endpoints are read-only (GET only)
 - tenant_id from JWT only
@@ -16,10 +19,11 @@ Story 9.8 - "What Changed?" Debug Panel
 import logging
 from typing import Optional
 
-from fastapi import APIRouter, Request, Depends, Query
+from fastapi import APIRouter, HTTPException, Request, Depends, Query, status
 
 from src.platform.tenant_context import get_tenant_context
-from src.database.session import get_db_session
+from src.database.session import get_async_db_session, run_db
+from src.platform.pagination import CountMode, InvalidCursorError
 from src.services.data_change_aggregator import DataChangeAggregator
 from src.api.schemas.what_changed import (
     DataChangeEventResponse,
@@ -41,6 +45,11 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/what-changed", tags=["what-changed", "debug"])
 
 
+def _aggregator(db_session, tenant_id: str) -> DataChangeAggregator:
+    """Build a tenant-scoped aggregator on the (sync) session run_db provides."""
+    return DataChangeAggregator(db_session=db_session, tenant_id=tenant_id)
+
+
 # =============================================================================
 # What Changed Debug Panel Routes (read-only)
 # =============================================================================
@@ -52,7 +61,7 @@ router = APIRouter(prefix="/api/what-changed", tags=["what-changed", "debug"])
 )
 async def list_change_events(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     event_type: Optional[str] = Query(
         None,
         description="Filter by event type"
@@ -68,6 +77,14 @@ async def list_change_events(
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
     limit: int = Query(50, le=100, description="Maximum events to return"),
     offset: int = Query(0, ge=0, description="Offset for pagination"),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor from the previous page (overrides offset)"
+    ),
+    count: CountMode = Query(
+        CountMode.ESTIMATED,
+        description="How to compute total: exact, estimated or none"
+    ),
 ):
     """
     List aggregated data change events.
@@ -76,21 +93,22 @@ async def list_change_events(
     """
     tenant_ctx = get_tenant_context(request)
 
-    aggregator = DataChangeAggregator(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
-    )
-
-    events, total = aggregator.get_change_events(
-        event_type=event_type,
-        connector_id=connector_id,
-        metric=metric,
-        days=days,
-        limit=limit,
-        offset=offset,
-    )
-
-    has_more = offset + len(events) < total
+    try:
+        page = await run_db(
+            db_session,
+            lambda s: _aggregator(s, tenant_ctx.tenant_id).get_change_events(
+                event_type=event_type,
+                connector_id=connector_id,
+                metric=metric,
+                days=days,
+                limit=limit,
+                offset=offset,
+                cursor=cursor,
+                count=count,
+            ),
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
     return ChangeEventsListResponse(
         events=[
@@ -106,10 +124,12 @@ async def list_change_events(
                 affected_date_end=event.affected_date_end,
                 occurred_at=event.occurred_at,
             )
-            for event in events
+            for event in page.items
         ],
-        total=total,
-        has_more=has_more,
+        total=page.total,
+        has_more=page.has_more,
+        next_cursor=page.next_cursor,
+        total_is_estimate=page.total_is_estimate,
     )
 
 
@@ -119,7 +139,7 @@ async def list_change_events(
 )
 async def get_summary(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
 ):
     """
@@ -134,13 +154,11 @@ async def get_summary(
     """
     tenant_ctx = get_tenant_context(request)
 
-    aggregator = DataChangeAggregator(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
+    summary = await run_db(
+        db_session,
+        lambda s: _aggregator(s, tenant_ctx.tenant_id).get_summary(days=days),
     )
 
-    summary = aggregator.get_summary(days=days)
-
     return WhatChangedSummaryResponse(
         data_freshness=FreshnessStatusResponse(
             overall_status=summary["data_freshness"]["overall_status"],
@@ -172,7 +190,7 @@ async def get_summary(
 )
 async def get_freshness_status(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
 ):
     """
     Get data freshness status.
@@ -181,13 +199,11 @@ async def get_freshness_status(
     """
     tenant_ctx = get_tenant_context(request)
 
-    aggregator = DataChangeAggregator(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
+    freshness = await run_db(
+        db_session,
+        lambda s: _aggregator(s, tenant_ctx.tenant_id).get_freshness_status(),
     )
 
-    freshness = aggregator.get_freshness_status()
-
     return FreshnessStatusResponse(
         overall_status=freshness["overall_status"],
         last_sync_at=freshness["last_sync_at"],
@@ -212,7 +228,7 @@ async def get_freshness_status(
 )
 async def get_recent_syncs(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
     limit: int = Query(20, le=50, description="Maximum syncs to return"),
 ):
@@ -223,13 +239,11 @@ async def get_recent_syncs(
     """
     tenant_ctx = get_tenant_context(request)
 
-    aggregator = DataChangeAggregator(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
+    syncs = await run_db(
+        db_session,
+        lambda s: _aggregator(s, tenant_ctx.tenant_id).get_recent_syncs(days=days, limit=limit),
     )
 
-    syncs = aggregator.get_recent_syncs(days=days, limit=limit)
-
     return RecentSyncsListResponse(
         syncs=[
             RecentSyncResponse(
@@ -256,7 +270,7 @@ async def get_recent_syncs(
 )
 async def get_ai_actions(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
     limit: int = Query(20, le=50, description="Maximum actions to return"),
 ):
@@ -268,13 +282,11 @@ async def get_ai_actions(
     """
     tenant_ctx = get_tenant_context(request)
 
-    aggregator = DataChangeAggregator(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
+    actions = await run_db(
+        db_session,
+        lambda s: _aggregator(s, tenant_ctx.tenant_id).get_ai_actions_summary(days=days, limit=limit),
     )
 
-    actions = aggregator.get_ai_actions_summary(days=days, limit=limit)
-
     return AIActionsListResponse(
         actions=[
             AIActionSummaryResponse(
@@ -298,7 +310,7 @@ async def get_ai_actions(
 )
 async def get_connector_status_changes(
     request: Request,
-    db_session=Depends(get_db_session),
+    db_session=Depends(get_async_db_session),
     days: int = Query(7, ge=1, le=30, description="Number of days to look back"),
 ):
     """
@@ -308,13 +320,11 @@ async def get_connector_status_changes(
     """
     tenant_ctx = get_tenant_context(request)
 
-    aggregator = DataChangeAggregator(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
+    changes = await run_db(
+        db_session,
+        lambda s: _aggregator(s, tenant_ctx.tenant_id).get_connector_status_changes(days=days),
     )
 
-    changes = aggregator.get_connector_status_changes(days=days)
-
     return ConnectorStatusChangesResponse(
         changes=[
             ConnectorStatusChangeResponse(
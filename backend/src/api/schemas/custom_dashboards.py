@@ -321,10 +321,12 @@ class DashboardListResponse(BaseModel):
     """Paginated response for listing dashboards."""
 
     dashboards: List[DashboardResponse]
-    total: int
+    total: Optional[int]
     offset: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class DashboardVersionResponse(BaseModel):
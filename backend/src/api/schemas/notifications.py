@@ -37,8 +37,11 @@ class NotificationListResponse(BaseModel):
     """Response model for notification list."""
 
     notifications: List[NotificationResponse] = Field(..., description="List of notifications")
-    total: int = Field(..., description="Total count of matching notifications")
+    total: Optional[int] = Field(..., description="Total count of matching notifications")
     unread_count: int = Field(..., description="Count of unread notifications")
+    has_more: bool = Field(False, description="Whether another page exists")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+    total_is_estimate: bool = Field(False, description="Whether total is a planner estimate")
 
 
 class UnreadCountResponse(BaseModel):
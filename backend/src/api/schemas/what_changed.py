@@ -34,8 +34,10 @@ class ChangeEventsListResponse(BaseModel):
     """Response for change events list queries."""
 
     events: List[DataChangeEventResponse]
-    total: int
+    total: Optional[int]
     has_more: bool
+    next_cursor: Optional[str] = None
+    total_is_estimate: bool = False
 
 
 class ConnectorFreshnessStatus(BaseModel):
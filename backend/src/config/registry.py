@@ -0,0 +1,348 @@
+"""
+Process-wide registry of parsed configuration files.
+
+Config files (config/plans.json, config/governance/*.yaml) used to be
+re-read and re-parsed by request-scoped objects on construction. The
+registry parses each file once into an immutable structure and hands the
+same object to every caller, so looking up config never touches disk on
+the request path.
+
+Changes are picked up without a restart:
+
+- a watcher thread stats the registered files every
+  CONFIG_RELOAD_CHECK_SECONDS and recompiles the ones whose mtime changed
+- SIGHUP (installed in the app lifespan) or request_reload() asks the
+  watcher to re-read every file immediately
+
+A reload compiles the new value fully before swapping it in with a single
+assignment, so readers see either the old or the new config, never a mix.
+If the new file fails to parse, the previous value is kept and a warning
+is logged.
+
+Usage:
+    from src.config.registry import get_plans_config
+
+    plans = get_plans_config()
+    rule = plans.premium_jobs.get("sync")
+
+Environment variables:
+    CONFIG_RELOAD_CHECK_SECONDS: mtime check interval (default 10, 0 disables
+        the watcher; reload() still works)
+"""
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Mapping, Optional, Tuple, TypeVar
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+CONFIG_RELOAD_CHECK_SECONDS = float(os.getenv("CONFIG_RELOAD_CHECK_SECONDS", "10"))
+
+CONFIG_DIR = Path(__file__).resolve().parents[3] / "config"
+PLANS_CONFIG_PATH = CONFIG_DIR / "plans.json"
+CONSUMERS_CONFIG_PATH = CONFIG_DIR / "governance" / "consumers.yaml"
+METRICS_VERSIONS_CONFIG_PATH = CONFIG_DIR / "governance" / "metrics_versions.yaml"
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+# ----------------------------------------------------------------------
+# Immutable structures
+# ----------------------------------------------------------------------
+
+class FrozenDict(dict):
+    """
+    Read-only dict.
+
+    Subclasses dict so existing ``isinstance(x, dict)`` checks and ``.get``
+    lookups keep working; every mutating method raises TypeError.
+    """
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("Config is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts to FrozenDict and lists to tuples."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def _read_file(path: Path) -> Any:
+    with open(path) as f:
+        if path.suffix == ".json":
+            return json.load(f)
+        return yaml.safe_load(f)
+
+
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+
+
+# ----------------------------------------------------------------------
+# Registry
+# ----------------------------------------------------------------------
+
+class _Entry:
+    """One registered (file, compiler) pair and its current value."""
+
+    __slots__ = ("path", "compile", "default", "mtime", "value")
+
+    def __init__(self, path: Path, compile: Callable[[Any], Any], default: Any):
+        self.path = path
+        self.compile = compile
+        self.default = default
+        self.mtime: Optional[float] = None
+        self.value: Any = None
+
+    def load(self) -> None:
+        """Read and compile the file, then swap the value in."""
+        mtime = _mtime(self.path)
+        if mtime is None:
+            if self.default is _MISSING:
+                raise FileNotFoundError(f"Config not found: {self.path}")
+            value = self.compile(self.default)
+        else:
+            value = self.compile(_read_file(self.path))
+        self.value = value
+        self.mtime = mtime
+
+
+class ConfigRegistry:
+    """
+    Parsed, immutable config values keyed by (path, compiler).
+
+    Thread-safe. get() is a dict lookup once a file has been loaded.
+    """
+
+    def __init__(self, check_interval_seconds: float = CONFIG_RELOAD_CHECK_SECONDS):
+        self._check_interval = check_interval_seconds
+        self._entries: Dict[Tuple[str, Hashable], _Entry] = {}
+        self._lock = threading.Lock()
+        self._reload_requested = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_pid: Optional[int] = None
+
+    def get(
+        self,
+        path: str | Path,
+        compile: Callable[[Any], T] = freeze,
+        default: Any = _MISSING,
+    ) -> T:
+        """
+        Compiled value of a config file.
+
+        Args:
+            path: JSON (.json) or YAML file
+            compile: Turns the parsed file into the cached value; must
+                return an immutable structure (default: freeze)
+            default: Parsed content to compile when the file is missing or
+                unreadable; when omitted those raise instead
+
+        Raises:
+            FileNotFoundError: File missing and no default given
+        """
+        key = (str(path), compile)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry.value
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = _Entry(Path(path), compile, default)
+                try:
+                    entry.load()
+                except Exception as e:
+                    if default is _MISSING:
+                        raise
+                    logger.warning(
+                        "Failed to load config, using defaults",
+                        extra={"path": str(path), "error": str(e)},
+                    )
+                    entry.value = compile(default)
+                    entry.mtime = _mtime(entry.path)
+                self._entries[key] = entry
+                logger.info("Loaded config", extra={"path": str(path)})
+        self._ensure_watching()
+        return entry.value
+
+    def check_for_changes(self) -> int:
+        """Recompile entries whose file mtime changed. Returns the count."""
+        return self._reload(only_changed=True)
+
+    def reload(self) -> int:
+        """Recompile every registered entry now. Returns the count."""
+        return self._reload(only_changed=False)
+
+    def request_reload(self) -> None:
+        """
+        Ask the watcher thread to reload everything.
+
+        Reloads inline when no watcher is running.
+        """
+        if self._watching():
+            self._reload_requested.set()
+        else:
+            self.reload()
+
+    def clear(self) -> None:
+        """Forget every entry (tests)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._reload_requested.set()
+
+    def _reload(self, only_changed: bool) -> int:
+        with self._lock:
+            entries = list(self._entries.values())
+        reloaded = 0
+        for entry in entries:
+            if only_changed and _mtime(entry.path) == entry.mtime:
+                continue
+            try:
+                entry.load()
+            except Exception as e:
+                logger.warning(
+                    "Config reload failed, keeping previous value",
+                    extra={"path": str(entry.path), "error": str(e)},
+                )
+                continue
+            reloaded += 1
+            logger.info("Reloaded config", extra={"path": str(entry.path)})
+        return reloaded
+
+    # ------------------------------------------------------------------
+    # Watcher
+    # ------------------------------------------------------------------
+
+    def _watching(self) -> bool:
+        return (
+            self._thread is not None
+            and self._thread_pid == os.getpid()
+            and self._thread.is_alive()
+        )
+
+    def _ensure_watching(self) -> None:
+        """Start the watcher thread (once per process, after fork too)."""
+        if self._check_interval <= 0 or self._watching():
+            return
+        with self._lock:
+            if self._watching():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="config-registry-watcher", daemon=True,
+            )
+            self._thread_pid = os.getpid()
+            self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            requested = self._reload_requested.wait(self._check_interval)
+            if self._stop.is_set():
+                return
+            self._reload_requested.clear()
+            try:
+                if requested:
+                    self.reload()
+                else:
+                    self.check_for_changes()
+            except Exception:
+                logger.warning("Config watcher check failed", exc_info=True)
+
+
+_registry: Optional[ConfigRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_config_registry() -> ConfigRegistry:
+    """Get the process-wide config registry."""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = ConfigRegistry()
+    return _registry
+
+
+# ----------------------------------------------------------------------
+# Typed accessors
+# ----------------------------------------------------------------------
+
+DEFAULT_PREMIUM_JOBS = {
+    "sync": {"required_feature": "premium_analytics", "skip_on_deny": True},
+    "export": {"required_feature": "data_export", "skip_on_deny": True},
+    "ai_action": {"required_feature": "ai_actions", "skip_on_deny": True},
+    "backfill": {"required_feature": "premium_analytics", "skip_on_deny": True},
+    "attribution_model": {"required_feature": "advanced_analytics", "skip_on_deny": True},
+}
+
+
+@dataclass(frozen=True)
+class PlansConfig:
+    """Compiled config/plans.json."""
+
+    raw: Mapping[str, Any]
+    premium_jobs: Mapping[str, Mapping[str, Any]]
+    grace_period_days: Optional[int]
+    canceled_behavior: str
+
+
+def compile_plans_config(raw: Optional[dict]) -> PlansConfig:
+    """Compile plans.json content (None when the file is missing)."""
+    if raw is None:
+        raw = {"premium_jobs": DEFAULT_PREMIUM_JOBS}
+    raw = dict(raw)
+    raw.setdefault("premium_jobs", {})
+    grace = raw.get("grace_period_days")
+    frozen = freeze(raw)
+    return PlansConfig(
+        raw=frozen,
+        premium_jobs=frozen["premium_jobs"],
+        grace_period_days=int(grace) if grace is not None else None,
+        canceled_behavior=frozen.get("canceled_behavior", "immediate"),
+    )
+
+
+def get_plans_config() -> PlansConfig:
+    """config/plans.json; built-in premium job rules when the file is missing."""
+    return get_config_registry().get(PLANS_CONFIG_PATH, compile_plans_config, default=None)
+
+
+def get_yaml_config(path: str | Path) -> Mapping[str, Any]:
+    """Frozen contents of a YAML config file (FileNotFoundError if missing)."""
+    return get_config_registry().get(path)
+
+
+def get_consumers_config() -> Mapping[str, Any]:
+    """config/governance/consumers.yaml."""
+    return get_yaml_config(CONSUMERS_CONFIG_PATH)
+
+
+def get_metrics_versions_config() -> Mapping[str, Any]:
+    """config/governance/metrics_versions.yaml."""
+    return get_yaml_config(METRICS_VERSIONS_CONFIG_PATH)
@@ -43,3 +43,16 @@ def get_retention_days(plan_id: str) -> int:
     """
     days = PLAN_RETENTION_DEFAULTS.get(plan_id, DEFAULT_RETENTION_DAYS)
     return max(MINIMUM_RETENTION_DAYS, min(days, MAXIMUM_RETENTION_DAYS))
+
+
+def get_max_retention_days() -> int:
+    """
+    Get the longest retention period across billing plans.
+
+    audit_logs partitions hold every tenant's rows for a month, so whole
+    partitions can only be dropped once they pass this horizon.
+
+    Returns:
+        Longest plan retention in days, clamped to compliance constraints
+    """
+    return max(get_retention_days(plan_id) for plan_id in PLAN_RETENTION_DEFAULTS)
@@ -0,0 +1,393 @@
+"""
+Monthly range partitioning for high-volume operational tables.
+
+dq_results, sync_runs and audit_logs are range-partitioned by month on
+their timestamp column (migration 0063). This module keeps them healthy:
+
+- ensure_future_partitions() pre-creates the next few monthly partitions
+  so inserts never land outside a defined range
+- drop_partitions_before() detaches and drops whole partitions once every
+  row in them is past retention, instead of deleting rows in batches
+- trim_partition() deletes expired rows from the unbounded legacy partition
+  (the pre-conversion table) until it ages out and can be dropped
+- horizon() reports how far ahead the monthly partitions reach, so the
+  maintenance job can alert before inserts start falling into DEFAULT
+
+Partitions are named <table>_pYYYYMM; the table that existed before the
+conversion is attached as <table>_legacy covering (MINVALUE, first month).
+Each table also has a <table>_default DEFAULT partition (migration 0068)
+that catches rows outside every monthly range instead of failing the
+insert; ensure_future_partitions() moves such rows into the month's
+partition when it creates it.
+
+Every method is a no-op on databases that are not PostgreSQL or on tables
+that have not been converted yet, so callers can fall back to their
+batched-delete path.
+
+Usage:
+    from src.database.partitioning import PartitionManager
+
+    manager = PartitionManager(session)
+    manager.ensure_future_partitions("dq_results", months_ahead=3)
+    manager.drop_partitions_before("dq_results", cutoff)
+"""
+
+import logging
+import os
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Monthly partitions kept ready ahead of the current month
+PARTITION_PREMAKE_MONTHS = int(os.getenv("PARTITION_PREMAKE_MONTHS", "3"))
+
+
+@dataclass(frozen=True)
+class PartitionedTable:
+    """A table range-partitioned by month on a timestamp column."""
+    name: str
+    column: str
+    schema: str = "public"
+
+
+@dataclass(frozen=True)
+class Partition:
+    """One attached partition and its range bounds (None = unbounded)."""
+    name: str
+    lower: Optional[datetime]
+    upper: Optional[datetime]
+    is_default: bool = False
+
+
+# Tables converted by migration 0063. Status-conditioned retention
+# (dq_incidents, backfill_jobs) cannot drop whole months and stays unpartitioned.
+PARTITIONED_TABLES: Dict[str, PartitionedTable] = {
+    "dq_results": PartitionedTable("dq_results", "executed_at"),
+    "sync_runs": PartitionedTable("sync_runs", "started_at"),
+    "audit_logs": PartitionedTable("audit_logs", "timestamp"),
+}
+
+_BOUND_RE = re.compile(r"FROM \((.+?)\) TO \((.+?)\)")
+
+
+def month_start(value: datetime) -> datetime:
+    """Return the first instant of value's month in UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    value = value.astimezone(timezone.utc)
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Name of the monthly partition of table starting at month."""
+    return f"{table}_p{month:%Y%m}"
+
+
+def _parse_bound_value(raw: str) -> Optional[datetime]:
+    raw = raw.strip()
+    if raw.upper() in ("MINVALUE", "MAXVALUE"):
+        return None
+    value = datetime.fromisoformat(raw.strip("'"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def parse_partition_bound(
+    expr: str,
+) -> Tuple[Optional[datetime], Optional[datetime], bool]:
+    """
+    Parse pg_get_expr(relpartbound) output for a range partition.
+
+    Returns:
+        (lower, upper, is_default); unbounded sides are None
+    """
+    if expr.strip().upper() == "DEFAULT":
+        return None, None, True
+    match = _BOUND_RE.search(expr)
+    if not match:
+        raise ValueError(f"Unrecognised partition bound: {expr}")
+    return _parse_bound_value(match.group(1)), _parse_bound_value(match.group(2)), False
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+class PartitionManager:
+    """Creates, lists and retires monthly partitions of PARTITIONED_TABLES."""
+
+    def __init__(self, db_session: Session):
+        self.db = db_session
+
+    def _spec(self, table: str) -> PartitionedTable:
+        try:
+            return PARTITIONED_TABLES[table]
+        except KeyError:
+            raise ValueError(f"{table} is not a registered partitioned table")
+
+    def _qualified(self, spec: PartitionedTable, name: Optional[str] = None) -> str:
+        return f"{_quote(spec.schema)}.{_quote(name or spec.name)}"
+
+    def is_partitioned(self, table: str) -> bool:
+        """True if table has been converted to a partitioned table."""
+        spec = self._spec(table)
+        if self.db.get_bind().dialect.name != "postgresql":
+            return False
+        row = self.db.execute(
+            text("""
+                SELECT 1
+                FROM pg_partitioned_table pt
+                JOIN pg_class c ON c.oid = pt.partrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relname = :table AND n.nspname = :schema
+            """),
+            {"table": spec.name, "schema": spec.schema},
+        ).first()
+        return row is not None
+
+    def list_partitions(self, table: str) -> List[Partition]:
+        """Attached partitions of table ordered by lower bound (legacy first)."""
+        spec = self._spec(table)
+        rows = self.db.execute(
+            text("""
+                SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+                FROM pg_inherits i
+                JOIN pg_class c ON c.oid = i.inhrelid
+                JOIN pg_class p ON p.oid = i.inhparent
+                JOIN pg_namespace n ON n.oid = p.relnamespace
+                WHERE p.relname = :table AND n.nspname = :schema
+            """),
+            {"table": spec.name, "schema": spec.schema},
+        ).fetchall()
+
+        partitions = []
+        for name, bound in rows:
+            lower, upper, is_default = parse_partition_bound(bound)
+            partitions.append(Partition(name, lower, upper, is_default))
+
+        floor = datetime.min.replace(tzinfo=timezone.utc)
+        return sorted(partitions, key=lambda p: p.lower or floor)
+
+    def horizon(self, table: str) -> Optional[datetime]:
+        """Upper bound of the latest monthly partition (None if there is none)."""
+        if not self.is_partitioned(table):
+            return None
+        uppers = [
+            p.upper for p in self.list_partitions(table)
+            if not p.is_default and p.upper is not None
+        ]
+        return max(uppers, default=None)
+
+    def _create_partition(
+        self,
+        spec: PartitionedTable,
+        name: str,
+        lower: datetime,
+        upper: datetime,
+        default: Optional[Partition],
+    ) -> int:
+        """
+        Create one monthly partition, moving any rows for that month out of
+        the DEFAULT partition first (PostgreSQL refuses to create a partition
+        whose range overlaps rows already in DEFAULT).
+
+        Returns:
+            Number of rows moved out of DEFAULT
+        """
+        create = text(
+            f"CREATE TABLE IF NOT EXISTS {self._qualified(spec, name)} "
+            f"PARTITION OF {self._qualified(spec)} "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        if default is None:
+            self.db.execute(create)
+            self.db.commit()
+            return 0
+
+        relation = self._qualified(spec, default.name)
+        in_range = f"{_quote(spec.column)} >= :lower AND {_quote(spec.column)} < :upper"
+        params = {"lower": lower, "upper": upper}
+        stranded = self.db.execute(
+            text(f"SELECT 1 FROM {relation} WHERE {in_range} LIMIT 1"), params,
+        ).first()
+        if stranded is None:
+            self.db.execute(create)
+            self.db.commit()
+            return 0
+
+        self.db.execute(
+            text(
+                f"CREATE TEMP TABLE _partition_move "
+                f"(LIKE {self._qualified(spec)}) ON COMMIT DROP"
+            )
+        )
+        moved = self.db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {relation} WHERE {in_range} RETURNING *) "
+                f"INSERT INTO _partition_move SELECT * FROM moved"
+            ),
+            params,
+        ).rowcount
+        self.db.execute(create)
+        self.db.execute(
+            text(f"INSERT INTO {self._qualified(spec)} SELECT * FROM _partition_move")
+        )
+        self.db.commit()
+        logger.warning(
+            "Moved rows out of default partition",
+            extra={"table": spec.name, "partition": name, "rows": moved},
+        )
+        return moved
+
+    def ensure_future_partitions(
+        self,
+        table: str,
+        months_ahead: int,
+        now: Optional[datetime] = None,
+    ) -> List[str]:
+        """
+        Create monthly partitions from the current month through months_ahead.
+
+        Months already covered by an attached partition are skipped. Rows
+        that landed in the DEFAULT partition for a month being created are
+        moved into the new partition in the same transaction.
+
+        Returns:
+            Names of the partitions created
+        """
+        if not self.is_partitioned(table):
+            return []
+
+        spec = self._spec(table)
+        partitions = self.list_partitions(table)
+        default = next((p for p in partitions if p.is_default), None)
+        existing = [p for p in partitions if not p.is_default]
+        current = month_start(now or datetime.now(timezone.utc))
+        created = []
+
+        for offset in range(months_ahead + 1):
+            lower = current + relativedelta(months=offset)
+            upper = lower + relativedelta(months=1)
+            if any(
+                (p.lower is None or p.lower < upper) and (p.upper is None or p.upper > lower)
+                for p in existing
+            ):
+                continue
+
+            name = partition_name(spec.name, lower)
+            self._create_partition(spec, name, lower, upper, default)
+            existing.append(Partition(name, lower, upper))
+            created.append(name)
+            logger.info(
+                "Created partition",
+                extra={"table": spec.name, "partition": name},
+            )
+
+        return created
+
+    def expired_partitions(self, table: str, cutoff: datetime) -> List[Partition]:
+        """Partitions whose whole range lies before cutoff."""
+        if not self.is_partitioned(table):
+            return []
+        cutoff = cutoff.astimezone(timezone.utc)
+        return [
+            p for p in self.list_partitions(table)
+            if not p.is_default and p.upper is not None and p.upper <= cutoff
+        ]
+
+    def drop_partitions_before(
+        self,
+        table: str,
+        cutoff: datetime,
+        dry_run: bool = False,
+    ) -> List[str]:
+        """
+        Detach and drop every partition whose whole range lies before cutoff.
+
+        Each partition is retired in its own transaction so a failure leaves
+        the remaining partitions attached.
+
+        Returns:
+            Names of the partitions dropped (or that would be, on dry_run)
+        """
+        spec = self._spec(table)
+        dropped = []
+
+        for partition in self.expired_partitions(table, cutoff):
+            if not dry_run:
+                self.db.execute(
+                    text(
+                        f"ALTER TABLE {self._qualified(spec)} "
+                        f"DETACH PARTITION {self._qualified(spec, partition.name)}"
+                    )
+                )
+                self.db.execute(
+                    text(f"DROP TABLE {self._qualified(spec, partition.name)}")
+                )
+                self.db.commit()
+            dropped.append(partition.name)
+            logger.info(
+                "Dropped expired partition",
+                extra={
+                    "table": spec.name,
+                    "partition": partition.name,
+                    "upper_bound": partition.upper.isoformat(),
+                    "dry_run": dry_run,
+                },
+            )
+
+        return dropped
+
+    def trim_partition(
+        self,
+        table: str,
+        partition: str,
+        cutoff: datetime,
+        batch_size: int,
+    ) -> int:
+        """
+        Delete rows older than cutoff from one partition in batches.
+
+        Only meant for the unbounded legacy partition, which holds the
+        pre-conversion rows and cannot be dropped until all of them expire.
+
+        Returns:
+            Number of rows deleted
+        """
+        spec = self._spec(table)
+        relation = self._qualified(spec, partition)
+        total_deleted = 0
+
+        while True:
+            result = self.db.execute(
+                text(
+                    f"DELETE FROM {relation} WHERE ctid = ANY(ARRAY("
+                    f"SELECT ctid FROM {relation} "
+                    f"WHERE {_quote(spec.column)} < :cutoff LIMIT :batch_size))"
+                ),
+                {"cutoff": cutoff, "batch_size": batch_size},
+            )
+            deleted = result.rowcount
+            self.db.commit()
+            total_deleted += deleted
+            if deleted < batch_size:
+                break
+
+        return total_deleted
+
+    def unbounded_partitions(self, table: str) -> List[Partition]:
+        """Partitions with no lower bound (the attached legacy table)."""
+        if not self.is_partitioned(table):
+            return []
+        return [
+            p for p in self.list_partitions(table)
+            if not p.is_default and p.lower is None
+        ]
@@ -1,31 +1,92 @@
 """
 Database session management with connection pooling.
 
-Provides a shared FastAPI dependency for database sessions across all routes.
+Provides shared FastAPI dependencies for database sessions across all routes.
 Uses SQLAlchemy with connection pooling for production workloads.
 
+Two engines are available:
+- Sync (psycopg2): get_db_session / get_db_session_sync hand out blocking
+  Sessions. Used by most routes, workers and scripts.
+- Async (asyncpg): get_async_db_session hands out AsyncSessions so hot
+  routes and middleware stop blocking the event loop.
+
+Migration path for a route:
+1. Depend on get_async_db_session instead of get_db_session
+2. Wrap existing Session-based service calls in run_db(); on an
+   AsyncSession they run through AsyncSession.run_sync without blocking
+3. Optionally rewrite the queries as native `await db.execute(select(...))`
+
+Setting DB_ASYNC_ENABLED=false makes get_async_db_session yield sync
+Sessions instead; run_db() accepts either, so migrated routes keep working.
+
+Pool sizing (per engine, per process) comes from DB_POOL_SIZE,
+DB_MAX_OVERFLOW, DB_POOL_TIMEOUT_SECONDS and DB_POOL_RECYCLE_SECONDS; the
+async engine can be sized separately with DB_ASYNC_POOL_SIZE and
+DB_ASYNC_MAX_OVERFLOW.
+
 Usage:
     from src.database.session import get_db_session
 
     @router.get("/items")
     async def get_items(db: Session = Depends(get_db_session)):
         return db.query(Item).all()
+
+    from src.database.session import get_async_db_session, run_db
+
+    @router.get("/items")
+    async def get_items(db=Depends(get_async_db_session)):
+        return await run_db(db, lambda s: s.query(Item).all())
 """
 
 import os
 import logging
-from typing import Generator
+from typing import Any, AsyncGenerator, Callable, Generator, TypeVar, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import QueuePool
 from fastapi import HTTPException, status
 
 logger = logging.getLogger(__name__)
 
-# Module-level engine singleton
+T = TypeVar("T")
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer from the environment, falling back on bad values."""
+    raw = os.getenv(name)
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        logger.warning("Invalid integer env var, using default", extra={"var": name, "value": raw})
+        return default
+
+
+# Connection pool sizing (per engine, per process)
+DB_POOL_SIZE = _env_int("DB_POOL_SIZE", 5)
+DB_MAX_OVERFLOW = _env_int("DB_MAX_OVERFLOW", 10)
+DB_POOL_TIMEOUT_SECONDS = _env_int("DB_POOL_TIMEOUT_SECONDS", 30)
+DB_POOL_RECYCLE_SECONDS = _env_int("DB_POOL_RECYCLE_SECONDS", 1800)
+DB_ASYNC_POOL_SIZE = _env_int("DB_ASYNC_POOL_SIZE", DB_POOL_SIZE)
+DB_ASYNC_MAX_OVERFLOW = _env_int("DB_ASYNC_MAX_OVERFLOW", DB_MAX_OVERFLOW)
+
+# Kill switch for the async engine (falls back to sync Sessions)
+DB_ASYNC_ENABLED = os.getenv("DB_ASYNC_ENABLED", "true").lower() not in ("false", "0", "no")
+
+# Module-level engine singletons
 _engine = None
 _SessionLocal = None
+_async_engine = None
+_AsyncSessionLocal = None
 
 
 def _get_database_url() -> str:
@@ -49,9 +110,9 @@ def get_engine():
     """
     Get or create the database engine singleton.
 
-    Uses connection pooling with sensible defaults for production:
-    - pool_size: 5 connections
-    - max_overflow: 10 additional connections under load
+    Uses connection pooling sized from the environment:
+    - pool_size: DB_POOL_SIZE connections (default 5)
+    - max_overflow: DB_MAX_OVERFLOW additional connections under load (default 10)
     - pool_pre_ping: Verify connections before use
     """
     global _engine
@@ -61,12 +122,16 @@ def get_engine():
             _engine = create_engine(
                 database_url,
                 poolclass=QueuePool,
-                pool_size=5,
-                max_overflow=10,
+                pool_size=DB_POOL_SIZE,
+                max_overflow=DB_MAX_OVERFLOW,
+                pool_timeout=DB_POOL_TIMEOUT_SECONDS,
                 pool_pre_ping=True,  # Verify connection health
-                pool_recycle=1800,   # Recycle connections after 30 minutes
+                pool_recycle=DB_POOL_RECYCLE_SECONDS,
+            )
+            logger.info(
+                "Database engine created with connection pooling",
+                extra={"pool_size": DB_POOL_SIZE, "max_overflow": DB_MAX_OVERFLOW},
             )
-            logger.info("Database engine created with connection pooling")
         except ValueError as e:
             logger.error("Failed to create database engine", extra={"error": str(e)})
             raise
@@ -131,3 +196,152 @@ def get_db_session_sync() -> Generator[Session, None, None]:
         yield session
     finally:
         session.close()
+
+
+# =============================================================================
+# Async engine (asyncpg)
+# =============================================================================
+
+
+def _get_async_database_url() -> str:
+    """
+    Get the database URL rewritten for an async driver.
+
+    postgresql:// becomes postgresql+asyncpg:// (libpq's sslmode query
+    parameter is renamed to asyncpg's ssl), and sqlite:// becomes
+    sqlite+aiosqlite:// for local development and tests.
+    """
+    database_url = _get_database_url()
+
+    if database_url.startswith("postgresql://") or database_url.startswith("postgresql+psycopg2://"):
+        database_url = "postgresql+asyncpg://" + database_url.split("://", 1)[1]
+        parts = urlsplit(database_url)
+        query = [
+            ("ssl" if key == "sslmode" else key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        ]
+        database_url = urlunsplit(parts._replace(query=urlencode(query)))
+    elif database_url.startswith("sqlite://"):
+        database_url = "sqlite+aiosqlite://" + database_url[len("sqlite://"):]
+
+    return database_url
+
+
+def is_async_db_enabled() -> bool:
+    """Whether get_async_db_session hands out AsyncSessions."""
+    return DB_ASYNC_ENABLED and bool(os.getenv("DATABASE_URL"))
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Get or create the async database engine singleton.
+
+    Sized by DB_ASYNC_POOL_SIZE / DB_ASYNC_MAX_OVERFLOW (defaulting to the
+    sync pool settings). SQLite URLs use the driver's default pool.
+    """
+    global _async_engine
+    if _async_engine is None:
+        database_url = _get_async_database_url()
+        pool_kwargs = {}
+        if not database_url.startswith("sqlite"):
+            pool_kwargs = {
+                "pool_size": DB_ASYNC_POOL_SIZE,
+                "max_overflow": DB_ASYNC_MAX_OVERFLOW,
+                "pool_timeout": DB_POOL_TIMEOUT_SECONDS,
+                "pool_recycle": DB_POOL_RECYCLE_SECONDS,
+            }
+        _async_engine = create_async_engine(
+            database_url,
+            pool_pre_ping=True,
+            **pool_kwargs,
+        )
+        logger.info(
+            "Async database engine created",
+            extra={"pool_size": DB_ASYNC_POOL_SIZE, "max_overflow": DB_ASYNC_MAX_OVERFLOW},
+        )
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Get or create the async session factory singleton."""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            bind=get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _AsyncSessionLocal
+
+
+async def get_async_db_session() -> AsyncGenerator[Union[AsyncSession, Session], None]:
+    """
+    FastAPI dependency for async database sessions.
+
+    Yields an AsyncSession bound to the asyncpg engine. When the async
+    engine is disabled (DB_ASYNC_ENABLED=false) a sync Session is yielded
+    instead, so callers should go through run_db() unless they only run
+    with async enabled. Raises HTTP 503 if database is not configured.
+
+    Usage:
+        @router.get("/items")
+        async def get_items(db=Depends(get_async_db_session)):
+            return await run_db(db, lambda s: s.query(Item).all())
+    """
+    if not os.getenv("DATABASE_URL"):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Database not configured"
+        )
+
+    if not is_async_db_enabled():
+        session = get_session_factory()()
+        try:
+            yield session
+        finally:
+            session.close()
+        return
+
+    session = get_async_session_factory()()
+    try:
+        yield session
+    finally:
+        await session.close()
+
+
+async def run_db(
+    db: Union[AsyncSession, Session],
+    fn: Callable[..., T],
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """
+    Run Session-based code against either session type.
+
+    On an AsyncSession, fn runs via AsyncSession.run_sync: it receives a
+    regular Session whose I/O is driven by the async driver, so legacy
+    query code and services do not block the event loop. On a sync
+    Session, fn is called directly.
+
+    Args:
+        db: Session from get_async_db_session (or any sync Session)
+        fn: Callable taking the Session as its first argument
+        *args: Extra positional arguments for fn
+        **kwargs: Extra keyword arguments for fn
+
+    Returns:
+        Whatever fn returns
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return fn(db, *args, **kwargs)
+
+
+async def dispose_engines() -> None:
+    """Dispose both engines (application shutdown)."""
+    global _engine, _SessionLocal, _async_engine, _AsyncSessionLocal
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    if _engine is not None:
+        _engine.dispose()
+    _engine = _SessionLocal = _async_engine = _AsyncSessionLocal = None
@@ -15,7 +15,6 @@ SECURITY: All queries are tenant-scoped via tenant_id from JWT.
 """
 
 import logging
-import math
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -23,6 +22,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
+from src.api.dq import kernels
 from src.models.dq_models import DQResult, SyncRun, SyncRunStatus
 
 logger = logging.getLogger(__name__)
@@ -39,53 +39,6 @@ class UpstreamShiftResult:
     suggested_next_step: str = ""
 
 
-def _jensen_shannon_divergence(
-    p: Dict[str, float],
-    q: Dict[str, float],
-) -> float:
-    """
-    Compute Jensen-Shannon divergence between two categorical distributions.
-
-    Returns a value in [0, 1]. 0 = identical, 1 = maximally different.
-    """
-    all_keys = set(p) | set(q)
-    if not all_keys:
-        return 0.0
-
-    epsilon = 1e-10
-    p_vec = [p.get(k, 0.0) + epsilon for k in all_keys]
-    q_vec = [q.get(k, 0.0) + epsilon for k in all_keys]
-
-    p_sum = sum(p_vec)
-    q_sum = sum(q_vec)
-    p_vec = [x / p_sum for x in p_vec]
-    q_vec = [x / q_sum for x in q_vec]
-
-    m_vec = [(pi + qi) / 2 for pi, qi in zip(p_vec, q_vec)]
-
-    def _kl(a: List[float], b: List[float]) -> float:
-        return sum(ai * math.log2(ai / bi) for ai, bi in zip(a, b))
-
-    return (_kl(p_vec, m_vec) + _kl(q_vec, m_vec)) / 2
-
-
-def _compute_top_movers(
-    current: Dict[str, float],
-    baseline: Dict[str, float],
-    top_n: int = 3,
-) -> List[Dict[str, Any]]:
-    """Compute top N categories by absolute proportion change."""
-    all_keys = set(current) | set(baseline)
-    changes = [
-        (k, current.get(k, 0.0) - baseline.get(k, 0.0))
-        for k in all_keys
-    ]
-    changes.sort(key=lambda x: abs(x[1]), reverse=True)
-    return [
-        {"category": k, "change": round(v, 4)} for k, v in changes[:top_n]
-    ]
-
-
 def _check_ingestion_healthy(
     db_session: Session,
     tenant_id: str,
@@ -183,7 +136,7 @@ def diagnose_upstream_shift(
 
     # --- Signal 1: Direct distribution drift ---
     if current_distribution and baseline_distribution:
-        jsd = _jensen_shannon_divergence(
+        jsd = kernels.jensen_shannon_divergence(
             baseline_distribution, current_distribution,
         )
         # Threshold: JSD > 0.1 indicates meaningful drift
@@ -192,8 +145,8 @@ def diagnose_upstream_shift(
             if not ingestion_healthy:
                 confidence *= 0.7  # Dampen: could be ingestion issue
 
-            top_movers = _compute_top_movers(
-                current_distribution, baseline_distribution,
+            top_movers = kernels.top_movers(
+                baseline_distribution, current_distribution,
             )
 
             return UpstreamShiftResult(
@@ -214,14 +167,17 @@ def diagnose_upstream_shift(
 
     # --- Signal 2: Cardinality explosion ---
     if current_cardinality and baseline_cardinality:
-        for dimension in current_cardinality:
-            current_count = current_cardinality[dimension]
-            baseline_count = baseline_cardinality.get(dimension, 0)
-
+        dimensions = list(current_cardinality)
+        baseline_counts = [baseline_cardinality.get(d, 0) for d in dimensions]
+        current_counts = [current_cardinality[d] for d in dimensions]
+        changes = kernels.pct_changes(baseline_counts, current_counts)
+
+        for dimension, baseline_count, current_count, change in zip(
+            dimensions, baseline_counts, current_counts, changes,
+        ):
             if baseline_count > 0:
-                pct_change = (
-                    (current_count - baseline_count) / baseline_count * 100
-                )
+                # pct_changes is positive for drops; growth is the signal here
+                pct_change = -change
                 if pct_change > 50:
                     confidence = 0.70 + min(pct_change / 500, 0.15)
                     if not ingestion_healthy:
@@ -18,6 +18,8 @@ from typing import Optional, Dict, Any, List
 from threading import Lock
 import hashlib
 
+from src.platform.ttl_cache import CacheStats, TTLCache
+
 logger = logging.getLogger(__name__)
 
 # Cache configuration
@@ -131,6 +133,16 @@ class RedisClient:
             logger.warning(f"Redis GET failed: {e}")
             return None
 
+    def mget(self, keys: List[str]) -> List[Optional[str]]:
+        """Get many values in one round trip (None for missing keys)."""
+        if not self.available or not keys:
+            return [None] * len(keys)
+        try:
+            return list(self._redis.mget(keys))
+        except Exception as e:
+            logger.warning(f"Redis MGET failed: {e}")
+            return [None] * len(keys)
+
     def set(self, key: str, value: str, ttl_seconds: int) -> bool:
         """Set value in Redis with TTL."""
         if not self.available:
@@ -175,60 +187,118 @@ class RedisClient:
             logger.warning(f"Redis PUBLISH failed: {e}")
             return 0
 
+    def hget(self, key: str, field: str) -> Optional[str]:
+        """Get one field of a hash."""
+        if not self.available:
+            return None
+        try:
+            return self._redis.hget(key, field)
+        except Exception as e:
+            logger.warning(f"Redis HGET failed: {e}")
+            return None
+
+    def hset(self, key: str, field: str, value: str, ttl_seconds: int) -> bool:
+        """Set one field of a hash and refresh the hash TTL."""
+        if not self.available:
+            return False
+        try:
+            pipe = self._redis.pipeline()
+            pipe.hset(key, field, value)
+            pipe.expire(key, ttl_seconds)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Redis HSET failed: {e}")
+            return False
+
+    def sadd(self, key: str, members: List[str], ttl_seconds: int) -> bool:
+        """Add members to a set and refresh the set TTL."""
+        if not self.available or not members:
+            return False
+        try:
+            pipe = self._redis.pipeline()
+            pipe.sadd(key, *members)
+            pipe.expire(key, ttl_seconds)
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning(f"Redis SADD failed: {e}")
+            return False
+
+    def smembers(self, key: str) -> set:
+        """Get all members of a set."""
+        if not self.available:
+            return set()
+        try:
+            return set(self._redis.smembers(key))
+        except Exception as e:
+            logger.warning(f"Redis SMEMBERS failed: {e}")
+            return set()
+
+    def subscribe(self, channel: str, handler) -> bool:
+        """
+        Call handler(message) for every message published on channel.
+
+        Messages are consumed on a daemon thread owned by redis-py.
+
+        Returns:
+            True if the subscription was started
+        """
+        if not self.available:
+            return False
+        try:
+            pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{channel: handler})
+            pubsub.run_in_thread(
+                sleep_time=1.0,
+                daemon=True,
+                exception_handler=lambda exc, ps, thread: logger.warning(
+                    f"Redis subscription on {channel} failed: {exc}"
+                ),
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Redis SUBSCRIBE failed: {e}")
+            return False
+
 
 class InMemoryCache:
     """
     In-memory fallback cache when Redis is unavailable.
 
-    Thread-safe with basic TTL support.
+    Thread-safe LRU (see src.platform.ttl_cache.TTLCache): O(1) get/set,
+    lazy heap-based expiry, and prefix-indexed delete_pattern, so cache
+    writes stay constant-time while Redis is down.
     """
 
-    def __init__(self, max_size: int = 10000):
-        self._cache: Dict[str, tuple[str, datetime]] = {}
-        self._lock = Lock()
-        self._max_size = max_size
+    def __init__(self, max_size: int = 10000, ttl_seconds: int = DEFAULT_CACHE_TTL_SECONDS):
+        self._cache: TTLCache[str, str] = TTLCache(
+            max_entries=max_size, ttl_seconds=ttl_seconds, name="entitlements_memory"
+        )
 
     def get(self, key: str, ttl_seconds: int) -> Optional[str]:
-        """Get value if not expired."""
-        with self._lock:
-            if key not in self._cache:
-                return None
-            value, cached_at = self._cache[key]
-            if (datetime.now(timezone.utc) - cached_at).total_seconds() > ttl_seconds:
-                del self._cache[key]
-                return None
-            return value
+        """Get value if cached less than ttl_seconds ago."""
+        return self._cache.get(key, max_age=ttl_seconds)
 
     def set(self, key: str, value: str) -> None:
         """Set value with current timestamp."""
-        with self._lock:
-            # Evict oldest if at capacity
-            if len(self._cache) >= self._max_size:
-                oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-                del self._cache[oldest_key]
-            self._cache[key] = (value, datetime.now(timezone.utc))
+        self._cache.set(key, value)
 
     def delete(self, key: str) -> bool:
         """Delete a key."""
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-                return True
-            return False
+        return self._cache.delete(key)
 
     def delete_pattern(self, pattern: str) -> int:
-        """Delete keys matching pattern (simple prefix match)."""
-        import fnmatch
-        with self._lock:
-            keys_to_delete = [k for k in self._cache.keys() if fnmatch.fnmatch(k, pattern)]
-            for key in keys_to_delete:
-                del self._cache[key]
-            return len(keys_to_delete)
+        """Delete keys matching pattern ("prefix:*" uses the prefix index)."""
+        return self._cache.delete_pattern(pattern)
 
     def clear(self) -> None:
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
+        self._cache.clear()
+
+    def stats(self) -> CacheStats:
+        """Hit/miss/eviction counters."""
+        return self._cache.stats()
 
 
 class EntitlementCache:
@@ -260,8 +330,8 @@ class EntitlementCache:
     def __init__(self):
         """Initialize cache with Redis or in-memory fallback."""
         self._redis = RedisClient()
-        self._memory_cache = InMemoryCache()
         self._ttl_seconds = int(os.getenv("ENTITLEMENT_CACHE_TTL", DEFAULT_CACHE_TTL_SECONDS))
+        self._memory_cache = InMemoryCache(ttl_seconds=self._ttl_seconds)
 
     def _cache_key(self, tenant_id: str) -> str:
         """Generate cache key for tenant."""
@@ -422,8 +492,8 @@ class EntitlementCache:
                 })
             )
 
-        # Clear memory
-        self._memory_cache.clear()
+        # Clear memory (prefix index: only entitlement keys, no scan)
+        count = max(count, self._memory_cache.delete_pattern(f"{self.CACHE_KEY_PREFIX}*"))
 
         logger.warning(
             f"Mass invalidation of entitlement cache ({count} entries)",
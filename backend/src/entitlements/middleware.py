@@ -356,28 +356,40 @@ class EntitlementMiddleware(BaseHTTPMiddleware):
         return EntitlementContext(tenant_id, access_rules)
 
     async def _get_subscription(self, request: Request, tenant_id: str):
-        """Get subscription from database."""
-        # Try to get DB session from request
+        """
+        Get subscription from database.
+
+        Uses the request's session (request.state.db) through run_db, so an
+        AsyncSession does not block the event loop. Without one, returns
+        None rather than opening a session per request.
+        """
+        from src.database.session import run_db
+
         db_session = getattr(request.state, 'db', None)
         if not db_session:
             return None
 
         try:
-            from src.models.subscription import Subscription, SubscriptionStatus
-
-            return db_session.query(Subscription).filter(
-                Subscription.tenant_id == tenant_id,
-                Subscription.status.in_([
-                    SubscriptionStatus.ACTIVE.value,
-                    SubscriptionStatus.PENDING.value,
-                    SubscriptionStatus.FROZEN.value,
-                ])
-            ).first()
+            return await run_db(db_session, _query_subscription, tenant_id)
         except Exception as e:
             logger.warning(f"Failed to get subscription: {e}")
             return None
 
 
+def _query_subscription(db_session, tenant_id: str):
+    """Current (active, pending or frozen) subscription for a tenant."""
+    from src.models.subscription import Subscription, SubscriptionStatus
+
+    return db_session.query(Subscription).filter(
+        Subscription.tenant_id == tenant_id,
+        Subscription.status.in_([
+            SubscriptionStatus.ACTIVE.value,
+            SubscriptionStatus.PENDING.value,
+            SubscriptionStatus.FROZEN.value,
+        ])
+    ).first()
+
+
 def require_entitlement(
     feature_key: str,
     operation: str = "read",
@@ -4,17 +4,16 @@ Entitlement policy evaluation.
 Determines billing_state from subscription and evaluates feature access.
 """
 
-import json
 import os
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Any, Mapping
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
 
 from sqlalchemy.orm import Session
 
+from src.config.registry import get_plans_config
 from src.models.subscription import Subscription, SubscriptionStatus
 from src.models.plan import Plan, PlanFeature
 
@@ -60,36 +59,14 @@ class EntitlementPolicy:
             db_session: Database session for querying PlanFeature
         """
         self.db = db_session
-        self._config_cache: Optional[Dict[str, Any]] = None
         self._grace_period_days = 3  # Default grace period
     
-    def _load_config(self) -> Dict[str, Any]:
-        """Load configuration from config/plans.json if it exists."""
-        if self._config_cache is not None:
-            return self._config_cache
-        
-        config_path = Path(__file__).parent.parent.parent.parent / "config" / "plans.json"
-        
-        if not config_path.exists():
-            logger.debug("config/plans.json not found, using database PlanFeature table only")
-            self._config_cache = {}
-            return self._config_cache
-        
-        try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            
-            # Extract grace period if configured
-            if "grace_period_days" in config:
-                self._grace_period_days = int(config["grace_period_days"])
-            
-            self._config_cache = config
-            logger.info("Loaded entitlement config from config/plans.json")
-            return config
-        except Exception as e:
-            logger.warning(f"Failed to load config/plans.json: {e}, using database only")
-            self._config_cache = {}
-            return self._config_cache
+    def _load_config(self) -> Mapping[str, Any]:
+        """Policy overrides from config/plans.json (via the config registry)."""
+        plans = get_plans_config()
+        if plans.grace_period_days is not None:
+            self._grace_period_days = plans.grace_period_days
+        return plans.raw
     
     def get_billing_state(self, subscription: Optional[Subscription]) -> BillingState:
         """
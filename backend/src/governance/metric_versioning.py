@@ -9,7 +9,7 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Mapping
 
 from .base import load_yaml_config, serialize_dataclass
 
@@ -139,6 +139,7 @@ class MetricVersionResolver:
         self,
         config_path: str | Path,
         alert_hooks: list[Callable[[MerchantAlert], None]] | None = None,
+        config: Mapping[str, Any] | None = None,
     ):
         """
         Initialize the metric version resolver.
@@ -146,14 +147,18 @@ class MetricVersionResolver:
         Args:
             config_path: Path to metrics_versions.yaml
             alert_hooks: Optional list of callback functions for merchant alerts
+            config: Already-parsed metrics_versions.yaml (skips reading config_path)
         """
         self.config_path = Path(config_path)
         self.alert_hooks = alert_hooks or []
 
-        self._config: dict[str, Any] = {}
+        self._config: Mapping[str, Any] = {}
         self._warnings_emitted: list[DeprecationWarning] = []
 
-        self._load_config()
+        if config is not None:
+            self._config = config
+        else:
+            self._load_config()
 
     def _load_config(self) -> None:
         """Load metrics configuration from YAML."""
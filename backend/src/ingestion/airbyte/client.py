@@ -18,6 +18,7 @@ from datetime import datetime, timezone
 from typing import Optional
 
 from src.integrations.airbyte.client import AirbyteClient, get_airbyte_client
+from src.integrations.airbyte.job_watcher import AirbyteJobWatcher, watcher_for_client
 from src.integrations.airbyte.exceptions import (
     AirbyteError,
     AirbyteAuthenticationError,
@@ -96,6 +97,7 @@ class IngestionAirbyteClient:
         self,
         airbyte_client: Optional[AirbyteClient] = None,
         min_interval_seconds: float = DEFAULT_MIN_INTERVAL_SECONDS,
+        job_watcher: Optional[AirbyteJobWatcher] = None,
     ):
         """
         Initialize ingestion Airbyte client.
@@ -103,8 +105,11 @@ class IngestionAirbyteClient:
         Args:
             airbyte_client: Optional base client (creates default if not provided)
             min_interval_seconds: Minimum interval between requests per key
+            job_watcher: Optional job watcher (defaults to the watcher shared by
+                all clients for the same Airbyte account)
         """
         self._client = airbyte_client
+        self._job_watcher = job_watcher
         self._min_interval_seconds = min_interval_seconds
         # In-memory rate limit state (consider Redis for distributed deployments)
         self._rate_limits: dict[str, RateLimitState] = {}
@@ -115,6 +120,12 @@ class IngestionAirbyteClient:
             self._client = get_airbyte_client()
         return self._client
 
+    def _get_job_watcher(self) -> AirbyteJobWatcher:
+        """Get the watcher that tracks sync completion."""
+        if self._job_watcher is None:
+            self._job_watcher = watcher_for_client(self._client)
+        return self._job_watcher
+
     async def close(self) -> None:
         """Close the underlying HTTP client."""
         if self._client is not None:
@@ -333,29 +344,28 @@ class IngestionAirbyteClient:
         run_id: str,
         connection_id: str,
         timeout_seconds: float = 3600,
-        poll_interval_seconds: float = 30,
     ) -> SyncJobResult:
         """
         Wait for an Airbyte sync to complete.
 
+        Subscribes to the shared AirbyteJobWatcher instead of polling, so
+        concurrent waits cost one batched status lookup per watcher tick.
+
         Args:
             run_id: Airbyte job ID
             connection_id: Airbyte connection ID
             timeout_seconds: Maximum wait time
-            poll_interval_seconds: Interval between status checks
 
         Returns:
             SyncJobResult with final status and metrics
         """
-        client = self._get_client()
         start_time = time.time()
         started_at = datetime.now(timezone.utc)
 
         try:
-            result = await client.wait_for_sync(
+            result = await self._get_job_watcher().wait_for_job(
                 job_id=run_id,
                 timeout_seconds=timeout_seconds,
-                poll_interval_seconds=poll_interval_seconds,
                 connection_id=connection_id,
             )
 
@@ -398,7 +408,6 @@ class IngestionAirbyteClient:
         connector_id: str,
         external_account_id: Optional[str] = None,
         timeout_seconds: float = 3600,
-        poll_interval_seconds: float = 30,
     ) -> SyncJobResult:
         """
         Trigger a sync and wait for completion.
@@ -410,7 +419,6 @@ class IngestionAirbyteClient:
             connector_id: Internal connector ID
             external_account_id: External account ID
             timeout_seconds: Maximum wait time
-            poll_interval_seconds: Status check interval
 
         Returns:
             SyncJobResult with final status and metrics
@@ -439,5 +447,4 @@ class IngestionAirbyteClient:
             run_id=trigger_result.run_id,
             connection_id=airbyte_connection_id,
             timeout_seconds=timeout_seconds,
-            poll_interval_seconds=poll_interval_seconds,
         )
@@ -6,24 +6,38 @@ Handles:
 - Job queueing with isolation (one active job per tenant+connector)
 - Job entitlement checks
 - Manual requeue from dead letter queue (support-only)
+- Cross-process job claiming (SELECT ... FOR UPDATE SKIP LOCKED)
 
 SECURITY: All operations are tenant-scoped via tenant_id from JWT.
 """
 
 import logging
 import uuid
-from datetime import datetime, timezone
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional
 
 from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 
 from src.ingestion.jobs.models import IngestionJob, JobStatus
+from src.models.airbyte_connection import TenantAirbyteConnection
 from src.platform.audit import AuditAction
 
 logger = logging.getLogger(__name__)
 
+# A claim older than this is considered abandoned (executor crashed between
+# claiming and triggering the sync) and the job becomes claimable again.
+DEFAULT_CLAIM_LEASE_SECONDS = 600
+
+# How many candidate rows to lock per requested claim, so that jobs rejected
+# by concurrency caps do not starve the batch.
+CLAIM_SCAN_FACTOR = 4
+
+# Predicate deciding whether a candidate job may be claimed now.
+# Receives the job and its connection source_type (None if unknown).
+ClaimFilter = Callable[[IngestionJob, Optional[str]], bool]
+
 
 class JobIsolationError(Exception):
     """Raised when job isolation constraints are violated."""
@@ -455,3 +469,198 @@ def get_global_failed_jobs_for_retry(
         .limit(limit)
         .all()
     )
+
+
+def _claim_candidates_query(db_session: Session):
+    """Base query for claim candidates, joined to their connection source type."""
+    return (
+        db_session.query(IngestionJob, TenantAirbyteConnection.source_type)
+        .outerjoin(
+            TenantAirbyteConnection,
+            and_(
+                TenantAirbyteConnection.id == IngestionJob.connector_id,
+                TenantAirbyteConnection.tenant_id == IngestionJob.tenant_id,
+            ),
+        )
+        .with_for_update(skip_locked=True, of=IngestionJob)
+    )
+
+
+def _accept_candidates(
+    candidates: list[tuple[IngestionJob, Optional[str]]],
+    limit: int,
+    can_claim: Optional[ClaimFilter],
+) -> list[tuple[IngestionJob, Optional[str]]]:
+    """Select up to ``limit`` candidates in order, honoring ``can_claim``."""
+    accepted = []
+    for job, source_type in candidates:
+        if len(accepted) >= limit:
+            break
+        if can_claim is not None and not can_claim(job, source_type):
+            continue
+        accepted.append((job, source_type))
+    return accepted
+
+
+def claim_global_queued_jobs(
+    db_session: Session,
+    worker_id: str,
+    limit: int = 10,
+    lease_seconds: float = DEFAULT_CLAIM_LEASE_SECONDS,
+    can_claim: Optional[ClaimFilter] = None,
+) -> list[tuple[IngestionJob, Optional[str]]]:
+    """
+    Claim queued jobs across all tenants for execution by one worker.
+
+    Candidate rows are locked with FOR UPDATE SKIP LOCKED, so concurrent
+    executor processes never see the same row. Accepted jobs are stamped
+    with claimed_by/claimed_at and the transaction is committed, which
+    releases the row locks while the claim itself keeps other executors
+    away until the lease expires.
+
+    Args:
+        db_session: Database session (committed by this function)
+        worker_id: Identifier of the claiming executor worker
+        limit: Maximum jobs to claim
+        lease_seconds: Age after which an existing claim is considered stale
+        can_claim: Optional predicate used to enforce concurrency caps
+
+    Returns:
+        List of (IngestionJob, source_type) tuples that were claimed
+    """
+    if limit <= 0:
+        return []
+
+    now = datetime.now(timezone.utc)
+    stale_before = now - timedelta(seconds=lease_seconds)
+
+    candidates = (
+        _claim_candidates_query(db_session)
+        .filter(
+            IngestionJob.status == JobStatus.QUEUED,
+            or_(
+                IngestionJob.claimed_at.is_(None),
+                IngestionJob.claimed_at < stale_before,
+            ),
+        )
+        .order_by(IngestionJob.created_at.asc())
+        .limit(limit * CLAIM_SCAN_FACTOR)
+        .all()
+    )
+
+    claimed = _accept_candidates(candidates, limit, can_claim)
+    for job, _source_type in claimed:
+        job.mark_claimed(worker_id)
+
+    db_session.commit()
+
+    if claimed:
+        logger.info(
+            "job.claimed",
+            extra={
+                "worker_id": worker_id,
+                "count": len(claimed),
+                "job_ids": [job.job_id for job, _ in claimed],
+            },
+        )
+
+    return claimed
+
+
+def claim_global_failed_jobs_for_retry(
+    db_session: Session,
+    worker_id: str,
+    limit: int = 10,
+    can_claim: Optional[ClaimFilter] = None,
+) -> list[tuple[IngestionJob, Optional[str]]]:
+    """
+    Claim failed jobs due for retry and reset them to QUEUED.
+
+    Uses the same FOR UPDATE SKIP LOCKED protocol as
+    claim_global_queued_jobs. Jobs whose connector already has another
+    active job are left untouched (isolation is preserved).
+
+    Args:
+        db_session: Database session (committed by this function)
+        worker_id: Identifier of the claiming executor worker
+        limit: Maximum jobs to claim
+        can_claim: Optional predicate used to enforce concurrency caps
+
+    Returns:
+        List of (IngestionJob, source_type) tuples that were claimed
+    """
+    if limit <= 0:
+        return []
+
+    now = datetime.now(timezone.utc)
+
+    candidates = (
+        _claim_candidates_query(db_session)
+        .filter(
+            IngestionJob.status == JobStatus.FAILED,
+            IngestionJob.next_retry_at <= now,
+            IngestionJob.retry_count < 5,
+        )
+        .order_by(IngestionJob.next_retry_at.asc())
+        .limit(limit * CLAIM_SCAN_FACTOR)
+        .all()
+    )
+
+    if not candidates:
+        db_session.commit()
+        return []
+
+    # One lookup for active jobs on any candidate connector
+    active_pairs = {
+        (tenant_id, connector_id)
+        for tenant_id, connector_id in (
+            db_session.query(IngestionJob.tenant_id, IngestionJob.connector_id)
+            .filter(
+                IngestionJob.connector_id.in_({job.connector_id for job, _ in candidates}),
+                IngestionJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+            )
+            .all()
+        )
+    }
+
+    def _can_retry(job: IngestionJob, source_type: Optional[str]) -> bool:
+        if (job.tenant_id, job.connector_id) in active_pairs:
+            logger.info(
+                "Retry skipped - active job exists",
+                extra={
+                    "job_id": job.job_id,
+                    "tenant_id": job.tenant_id,
+                    "connector_id": job.connector_id,
+                },
+            )
+            return False
+        return can_claim is None or can_claim(job, source_type)
+
+    claimed = _accept_candidates(candidates, limit, _can_retry)
+    for job, _source_type in claimed:
+        job.status = JobStatus.QUEUED
+        job.next_retry_at = None
+        job.mark_claimed(worker_id)
+
+    try:
+        db_session.commit()
+    except IntegrityError:
+        # A new job was dispatched for one of these connectors concurrently
+        db_session.rollback()
+        logger.warning(
+            "Retry claim race condition - concurrent job created",
+            extra={"worker_id": worker_id, "count": len(claimed)},
+        )
+        return []
+
+    if claimed:
+        logger.info(
+            "job.retry_claimed",
+            extra={
+                "worker_id": worker_id,
+                "count": len(claimed),
+                "job_ids": [job.job_id for job, _ in claimed],
+            },
+        )
+
+    return claimed
@@ -0,0 +1,386 @@
+"""
+Concurrent executor for ingestion jobs.
+
+Runs many ingestion jobs at once instead of one after another:
+- Keeps up to N jobs in flight in an asyncio task group
+- Enforces per-tenant and per-source-type concurrency caps
+- Claims rows with SELECT ... FOR UPDATE SKIP LOCKED so several executor
+  processes can drain the queue without double-running a connector
+- Runs each job on its own database session
+
+Job semantics (entitlements, retries, DLQ, audit logging) are unchanged:
+every job is still executed by JobRunner.execute_job.
+
+SECURITY: All operations are tenant-isolated.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+
+from src.ingestion.jobs.models import IngestionJob, JobStatus
+from src.ingestion.jobs.dispatcher import (
+    DEFAULT_CLAIM_LEASE_SECONDS,
+    claim_global_queued_jobs,
+    claim_global_failed_jobs_for_retry,
+)
+from src.ingestion.jobs.retry import RetryPolicy
+from src.ingestion.airbyte.client import IngestionAirbyteClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_IN_FLIGHT = 5
+DEFAULT_MAX_PER_TENANT = 2
+
+
+def _parse_source_type_limits(raw: str) -> dict[str, int]:
+    """
+    Parse per-source-type caps from "shopify=3,meta_ads=2" format.
+
+    Malformed entries are ignored with a warning.
+    """
+    limits: dict[str, int] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, value = entry.partition("=")
+        try:
+            if not sep:
+                raise ValueError(entry)
+            limits[name.strip()] = int(value)
+        except ValueError:
+            logger.warning(
+                "Ignoring malformed source type limit",
+                extra={"entry": entry},
+            )
+    return limits
+
+
+@dataclass(frozen=True)
+class ExecutorConfig:
+    """
+    Concurrency limits for the ingestion executor.
+
+    A cap of 0 means unlimited.
+
+    Attributes:
+        max_in_flight: Maximum jobs running at once in this process
+        max_per_tenant: Maximum jobs running at once for one tenant
+        max_per_source_type: Default cap for each source type
+        source_type_limits: Per-source-type overrides (e.g. {"shopify": 3})
+        claim_lease_seconds: Age after which another executor may reclaim a job
+    """
+
+    max_in_flight: int = DEFAULT_MAX_IN_FLIGHT
+    max_per_tenant: int = DEFAULT_MAX_PER_TENANT
+    max_per_source_type: int = 0
+    source_type_limits: dict[str, int] = field(default_factory=dict)
+    claim_lease_seconds: float = DEFAULT_CLAIM_LEASE_SECONDS
+
+    @classmethod
+    def from_env(cls) -> "ExecutorConfig":
+        """
+        Build config from environment variables.
+
+        WORKER_MAX_CONCURRENT_SYNCS: max_in_flight
+        WORKER_MAX_SYNCS_PER_TENANT: max_per_tenant
+        WORKER_MAX_SYNCS_PER_SOURCE_TYPE: max_per_source_type
+        WORKER_SOURCE_TYPE_SYNC_LIMITS: "shopify=3,meta_ads=2"
+        WORKER_CLAIM_LEASE_SECONDS: claim_lease_seconds
+        """
+        return cls(
+            max_in_flight=int(
+                os.getenv("WORKER_MAX_CONCURRENT_SYNCS", str(DEFAULT_MAX_IN_FLIGHT))
+            ),
+            max_per_tenant=int(
+                os.getenv("WORKER_MAX_SYNCS_PER_TENANT", str(DEFAULT_MAX_PER_TENANT))
+            ),
+            max_per_source_type=int(
+                os.getenv("WORKER_MAX_SYNCS_PER_SOURCE_TYPE", "0")
+            ),
+            source_type_limits=_parse_source_type_limits(
+                os.getenv("WORKER_SOURCE_TYPE_SYNC_LIMITS", "")
+            ),
+            claim_lease_seconds=float(
+                os.getenv(
+                    "WORKER_CLAIM_LEASE_SECONDS", str(DEFAULT_CLAIM_LEASE_SECONDS)
+                )
+            ),
+        )
+
+    def limit_for_source_type(self, source_type: Optional[str]) -> int:
+        """Get the cap for a source type (0 = unlimited)."""
+        if source_type and source_type in self.source_type_limits:
+            return self.source_type_limits[source_type]
+        return self.max_per_source_type
+
+
+def default_worker_id() -> str:
+    """Build a worker ID unique to this executor process."""
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class ConcurrentJobExecutor:
+    """
+    Bounded-concurrency executor for ingestion jobs.
+
+    Claims jobs as slots free up and keeps up to max_in_flight of them
+    running, so one slow backfill no longer stalls every other tenant.
+
+    SECURITY: Enforces tenant isolation and job entitlements via JobRunner.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        airbyte_client: Optional[IngestionAirbyteClient] = None,
+        config: Optional[ExecutorConfig] = None,
+        worker_id: Optional[str] = None,
+        retry_policy: RetryPolicy = RetryPolicy(),
+        sync_timeout_seconds: Optional[float] = None,
+    ):
+        """
+        Initialize concurrent executor.
+
+        Args:
+            session_factory: Callable returning a new database session
+            airbyte_client: Shared Airbyte client (creates default if not provided)
+            config: Concurrency limits (defaults to ExecutorConfig.from_env())
+            worker_id: Claim owner identifier (defaults to host:pid:random)
+            retry_policy: Retry policy configuration
+            sync_timeout_seconds: Maximum sync wait time per job
+        """
+        self._session_factory = session_factory
+        self._airbyte_client = airbyte_client
+        self.config = config or ExecutorConfig.from_env()
+        self.worker_id = worker_id or default_worker_id()
+        self.retry_policy = retry_policy
+        self._runner_kwargs = {}
+        if sync_timeout_seconds is not None:
+            self._runner_kwargs["sync_timeout_seconds"] = sync_timeout_seconds
+
+        self._in_flight: dict[str, tuple[str, Optional[str]]] = {}
+        self._tenant_counts: Counter = Counter()
+        self._source_type_counts: Counter = Counter()
+        self._slot_freed = asyncio.Event()
+
+    @property
+    def in_flight_count(self) -> int:
+        """Number of jobs currently running in this executor."""
+        return len(self._in_flight)
+
+    def _get_airbyte_client(self) -> IngestionAirbyteClient:
+        """Get or create the shared Airbyte client."""
+        if self._airbyte_client is None:
+            self._airbyte_client = IngestionAirbyteClient()
+        return self._airbyte_client
+
+    def _can_claim(
+        self,
+        pending: Counter,
+        pending_sources: Counter,
+    ) -> Callable[[IngestionJob, Optional[str]], bool]:
+        """
+        Build a claim predicate enforcing tenant and source-type caps.
+
+        Counts include jobs already in flight plus jobs accepted earlier in
+        the same claim batch (tracked in ``pending``/``pending_sources``).
+        """
+        max_per_tenant = self.config.max_per_tenant
+
+        def _predicate(job: IngestionJob, source_type: Optional[str]) -> bool:
+            tenant_count = self._tenant_counts[job.tenant_id] + pending[job.tenant_id]
+            if max_per_tenant and tenant_count >= max_per_tenant:
+                return False
+
+            source_limit = self.config.limit_for_source_type(source_type)
+            if source_limit:
+                source_count = (
+                    self._source_type_counts[source_type] + pending_sources[source_type]
+                )
+                if source_count >= source_limit:
+                    return False
+
+            pending[job.tenant_id] += 1
+            pending_sources[source_type] += 1
+            return True
+
+        return _predicate
+
+    def _claim(self, retry: bool, limit: int) -> list[tuple[str, str, Optional[str]]]:
+        """
+        Claim up to ``limit`` jobs on a short-lived session.
+
+        Returns:
+            List of (job_id, tenant_id, source_type) tuples
+        """
+        predicate = self._can_claim(Counter(), Counter())
+        session = self._session_factory()
+        try:
+            if retry:
+                claimed = claim_global_failed_jobs_for_retry(
+                    session,
+                    worker_id=self.worker_id,
+                    limit=limit,
+                    can_claim=predicate,
+                )
+            else:
+                claimed = claim_global_queued_jobs(
+                    session,
+                    worker_id=self.worker_id,
+                    limit=limit,
+                    lease_seconds=self.config.claim_lease_seconds,
+                    can_claim=predicate,
+                )
+            return [(job.job_id, job.tenant_id, source_type) for job, source_type in claimed]
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _register(self, job_id: str, tenant_id: str, source_type: Optional[str]) -> None:
+        self._in_flight[job_id] = (tenant_id, source_type)
+        self._tenant_counts[tenant_id] += 1
+        self._source_type_counts[source_type] += 1
+
+    def _unregister(self, job_id: str) -> None:
+        tenant_id, source_type = self._in_flight.pop(job_id)
+        self._tenant_counts[tenant_id] -= 1
+        self._source_type_counts[source_type] -= 1
+        self._slot_freed.set()
+
+    async def _run_claimed_job(self, job_id: str, retry: bool) -> bool:
+        """
+        Execute one claimed job on its own session.
+
+        Returns:
+            True if the job was executed, False if it was skipped
+        """
+        from src.ingestion.jobs.runner import JobRunner
+
+        session = self._session_factory()
+        try:
+            job = session.get(IngestionJob, job_id)
+            if (
+                job is None
+                or job.status != JobStatus.QUEUED
+                or job.claimed_by != self.worker_id
+            ):
+                logger.info(
+                    "job.claim_lost",
+                    extra={"job_id": job_id, "worker_id": self.worker_id},
+                )
+                return False
+
+            runner = JobRunner(
+                db_session=session,
+                airbyte_client=self._get_airbyte_client(),
+                retry_policy=self.retry_policy,
+                commit_on_running=True,
+                **self._runner_kwargs,
+            )
+            await runner.execute_job_safely(
+                job,
+                failure_prefix="Retry failed" if retry else "Unexpected error",
+            )
+            job.release_claim()
+            session.commit()
+            return True
+
+        except Exception:
+            session.rollback()
+            logger.exception(
+                "Unexpected error finalizing job",
+                extra={"job_id": job_id, "worker_id": self.worker_id},
+            )
+            return False
+        finally:
+            session.close()
+            self._unregister(job_id)
+
+    async def _drain(self, retry: bool, limit: int) -> int:
+        """
+        Claim and run up to ``limit`` jobs, keeping the pool full.
+
+        New jobs are claimed whenever a slot frees up, so long-running syncs
+        only occupy their own slot.
+        """
+        results: list[asyncio.Task] = []
+        claimed_total = 0
+        max_in_flight = max(self.config.max_in_flight, 1)
+
+        async with asyncio.TaskGroup() as task_group:
+            while claimed_total < limit:
+                free_slots = min(
+                    max_in_flight - self.in_flight_count,
+                    limit - claimed_total,
+                )
+                batch = []
+                if free_slots > 0:
+                    try:
+                        batch = self._claim(retry, free_slots)
+                    except Exception:
+                        # Stop claiming but let in-flight syncs finish
+                        logger.exception(
+                            "executor.claim_error",
+                            extra={"worker_id": self.worker_id, "retry": retry},
+                        )
+                        break
+                    for job_id, tenant_id, source_type in batch:
+                        self._register(job_id, tenant_id, source_type)
+                        results.append(
+                            task_group.create_task(self._run_claimed_job(job_id, retry))
+                        )
+                    claimed_total += len(batch)
+
+                if not batch and self.in_flight_count == 0:
+                    # Nothing claimable and nothing running
+                    break
+                if not batch or self.in_flight_count >= max_in_flight:
+                    self._slot_freed.clear()
+                    await self._slot_freed.wait()
+
+        processed = sum(1 for task in results if task.result())
+        logger.info(
+            "executor.drain_completed",
+            extra={
+                "worker_id": self.worker_id,
+                "retry": retry,
+                "claimed": claimed_total,
+                "processed": processed,
+            },
+        )
+        return processed
+
+    async def process_queued_jobs(self, limit: int = 10) -> int:
+        """
+        Claim and execute queued jobs concurrently.
+
+        Args:
+            limit: Maximum jobs to claim in this call
+
+        Returns:
+            Number of jobs processed
+        """
+        return await self._drain(retry=False, limit=limit)
+
+    async def process_retry_jobs(self, limit: int = 10) -> int:
+        """
+        Claim and execute failed jobs due for retry concurrently.
+
+        Args:
+            limit: Maximum jobs to claim in this call
+
+        Returns:
+            Number of jobs retried
+        """
+        return await self._drain(retry=True, limit=limit)
@@ -64,6 +64,8 @@ class IngestionJob(Base, TimestampMixin, TenantScopedMixin):
         started_at: When the job started running
         completed_at: When the job finished (success or final failure)
         job_metadata: Additional job metadata (sync type, etc)
+        claimed_by: Executor worker that claimed the job (lease holder)
+        claimed_at: When the job was claimed (lease start)
     """
 
     __tablename__ = "ingestion_jobs"
@@ -152,6 +154,18 @@ class IngestionJob(Base, TimestampMixin, TenantScopedMixin):
         comment="Scheduled time for next retry attempt"
     )
 
+    # Executor claim lease (see ConcurrentJobExecutor)
+    claimed_by = Column(
+        String(255),
+        nullable=True,
+        comment="Executor worker ID holding the claim on this job"
+    )
+    claimed_at = Column(
+        DateTime(timezone=True),
+        nullable=True,
+        comment="When the executor claimed the job"
+    )
+
     # Additional job metadata
     job_metadata = Column(
         JSONType,
@@ -181,6 +195,13 @@ class IngestionJob(Base, TimestampMixin, TenantScopedMixin):
             "next_retry_at",
             postgresql_where=(status == JobStatus.FAILED)
         ),
+        # Index for claiming queued jobs in FIFO order
+        Index(
+            "ix_ingestion_jobs_claimable",
+            "status",
+            "created_at",
+            postgresql_where=(status == JobStatus.QUEUED)
+        ),
         # Index for dead letter queue queries
         Index(
             "ix_ingestion_jobs_dlq",
@@ -215,6 +236,16 @@ class IngestionJob(Base, TimestampMixin, TenantScopedMixin):
         """Check if job can be retried (failed and under max retries)."""
         return self.status == JobStatus.FAILED and self.retry_count < 5
 
+    def mark_claimed(self, worker_id: str) -> None:
+        """Record that an executor worker has claimed this job."""
+        self.claimed_by = worker_id
+        self.claimed_at = datetime.now(timezone.utc)
+
+    def release_claim(self) -> None:
+        """Release the executor claim once the job has been handled."""
+        self.claimed_by = None
+        self.claimed_at = None
+
     def mark_running(self, run_id: str) -> None:
         """Mark job as running with Airbyte run ID."""
         self.status = JobStatus.RUNNING
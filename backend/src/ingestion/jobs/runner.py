@@ -15,7 +15,7 @@ SECURITY: All operations are tenant-isolated.
 import asyncio
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
 from sqlalchemy.orm import Session
 
@@ -36,12 +36,19 @@ from src.ingestion.airbyte.client import IngestionAirbyteClient, SyncJobResult
 from src.services.airbyte_service import AirbyteService
 from src.jobs.job_entitlements import JobEntitlementChecker, JobType
 from src.integrations.airbyte.models import AirbyteJobStatus
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
+from src.services.tenant_health_snapshot import (
+    HealthSnapshotTrigger,
+    mark_tenant_health_dirty,
+)
+
+if TYPE_CHECKING:
+    from src.ingestion.jobs.executor import ConcurrentJobExecutor, ExecutorConfig
 
 logger = logging.getLogger(__name__)
 
 # Default execution timeouts
 DEFAULT_SYNC_TIMEOUT_SECONDS = 3600  # 1 hour
-DEFAULT_POLL_INTERVAL_SECONDS = 30
 
 
 class JobRunner:
@@ -63,7 +70,9 @@ class JobRunner:
         airbyte_client: Optional[IngestionAirbyteClient] = None,
         retry_policy: RetryPolicy = RetryPolicy(),
         sync_timeout_seconds: float = DEFAULT_SYNC_TIMEOUT_SECONDS,
-        poll_interval_seconds: float = DEFAULT_POLL_INTERVAL_SECONDS,
+        session_factory: Optional[Callable[[], Session]] = None,
+        executor_config: Optional["ExecutorConfig"] = None,
+        commit_on_running: bool = False,
     ):
         """
         Initialize job runner.
@@ -73,13 +82,20 @@ class JobRunner:
             airbyte_client: Optional Airbyte client (creates default if not provided)
             retry_policy: Retry policy configuration
             sync_timeout_seconds: Maximum sync wait time
-            poll_interval_seconds: Status check interval
+            session_factory: Optional session factory. When provided, batch
+                processing runs jobs concurrently via ConcurrentJobExecutor,
+                each job on its own session.
+            executor_config: Concurrency caps for the concurrent executor
+            commit_on_running: Commit (rather than flush) when a job moves to
+                RUNNING, so other executor processes see the transition
         """
         self.db = db_session
         self._airbyte_client = airbyte_client
         self.retry_policy = retry_policy
         self.sync_timeout = sync_timeout_seconds
-        self.poll_interval = poll_interval_seconds
+        self._session_factory = session_factory
+        self._executor_config = executor_config
+        self.commit_on_running = commit_on_running
 
     def _get_airbyte_client(self) -> IngestionAirbyteClient:
         """Get or create Airbyte client."""
@@ -120,6 +136,21 @@ class JobRunner:
         result = checker.check_job_entitlement(tenant_id, JobType.SYNC)
         return result.is_allowed
 
+    def _publish_job_state(self, job: IngestionJob) -> None:
+        """Push the job's new state to open event streams (sent on commit)."""
+        publish_live_event(
+            LiveEvent(
+                type=LiveEventType.SYNC,
+                tenant_id=job.tenant_id,
+                data={
+                    "job_id": job.job_id,
+                    "connector_id": job.connector_id,
+                    "status": job.status.value if job.status else None,
+                },
+            ),
+            db=self.db,
+        )
+
     def _log_job_started(self, job: IngestionJob) -> None:
         """Log job.started audit event."""
         logger.info(
@@ -133,6 +164,7 @@ class JobRunner:
                 "correlation_id": job.correlation_id,
             },
         )
+        self._publish_job_state(job)
 
     def _log_job_retry(
         self,
@@ -154,6 +186,7 @@ class JobRunner:
                 "correlation_id": job.correlation_id,
             },
         )
+        self._publish_job_state(job)
 
     def _log_job_failed(self, job: IngestionJob) -> None:
         """Log job.failed audit event."""
@@ -169,6 +202,8 @@ class JobRunner:
                 "correlation_id": job.correlation_id,
             },
         )
+        self._publish_job_state(job)
+        mark_tenant_health_dirty(self.db, job.tenant_id, HealthSnapshotTrigger.SYNC_FAILED)
 
     def _log_job_dead_lettered(self, job: IngestionJob) -> None:
         """Log job.dead_lettered audit event."""
@@ -184,6 +219,8 @@ class JobRunner:
                 "correlation_id": job.correlation_id,
             },
         )
+        self._publish_job_state(job)
+        mark_tenant_health_dirty(self.db, job.tenant_id, HealthSnapshotTrigger.SYNC_FAILED)
 
     def _log_job_completed(
         self,
@@ -204,6 +241,8 @@ class JobRunner:
                 "correlation_id": job.correlation_id,
             },
         )
+        self._publish_job_state(job)
+        mark_tenant_health_dirty(self.db, job.tenant_id, HealthSnapshotTrigger.SYNC_COMPLETED)
 
     async def execute_job(self, job: IngestionJob) -> None:
         """
@@ -230,6 +269,7 @@ class JobRunner:
                 error_code="entitlement_denied",
             )
             self.db.flush()
+            self._publish_job_state(job)
             return
 
         # Get Airbyte connection ID
@@ -269,7 +309,10 @@ class JobRunner:
         # Mark job as running
         if result.run_id:
             job.mark_running(result.run_id)
-            self.db.flush()
+            if self.commit_on_running:
+                self.db.commit()
+            else:
+                self.db.flush()
             self._log_job_started(job)
 
         # Wait for sync completion
@@ -277,7 +320,6 @@ class JobRunner:
             run_id=result.run_id,
             connection_id=airbyte_connection_id,
             timeout_seconds=self.sync_timeout,
-            poll_interval_seconds=self.poll_interval,
         )
 
         # Handle result
@@ -356,6 +398,49 @@ class JobRunner:
             self.db.flush()
             self._log_job_failed(job)
 
+    async def execute_job_safely(
+        self,
+        job: IngestionJob,
+        failure_prefix: str = "Unexpected error",
+    ) -> None:
+        """
+        Execute a job, converting unexpected exceptions into job failures.
+
+        Args:
+            job: IngestionJob to execute
+            failure_prefix: Prefix for the recorded error message
+        """
+        try:
+            await self.execute_job(job)
+        except Exception as e:
+            logger.error(
+                "Unexpected error executing job",
+                extra={
+                    "job_id": job.job_id,
+                    "tenant_id": job.tenant_id,
+                    "error": str(e),
+                },
+                exc_info=True,
+            )
+            # Mark as failed with unknown error
+            self._handle_job_failure(
+                job=job,
+                error_category=ErrorCategory.UNKNOWN,
+                error_message=f"{failure_prefix}: {str(e)[:500]}",
+            )
+
+    def _get_concurrent_executor(self) -> "ConcurrentJobExecutor":
+        """Build a concurrent executor sharing this runner's configuration."""
+        from src.ingestion.jobs.executor import ConcurrentJobExecutor
+
+        return ConcurrentJobExecutor(
+            session_factory=self._session_factory,
+            airbyte_client=self._get_airbyte_client(),
+            config=self._executor_config,
+            retry_policy=self.retry_policy,
+            sync_timeout_seconds=self.sync_timeout,
+        )
+
     async def process_queued_jobs(
         self,
         limit: int = 10,
@@ -366,12 +451,19 @@ class JobRunner:
         Picks up and executes queued jobs across all tenants.
         Respects job isolation - only one job per tenant+connector.
 
+        When the runner was built with a session_factory, jobs are claimed
+        with FOR UPDATE SKIP LOCKED and run concurrently under the
+        executor's caps; otherwise they run one at a time on db_session.
+
         Args:
             limit: Maximum jobs to process in this batch
 
         Returns:
             Number of jobs processed
         """
+        if self._session_factory is not None:
+            return await self._get_concurrent_executor().process_queued_jobs(limit=limit)
+
         jobs = get_global_queued_jobs(self.db, limit=limit)
 
         if not jobs:
@@ -380,30 +472,12 @@ class JobRunner:
 
         processed = 0
         for job in jobs:
-            try:
-                # Check isolation - skip if another job started
-                if job.status != JobStatus.QUEUED:
-                    continue
+            # Check isolation - skip if another job started
+            if job.status != JobStatus.QUEUED:
+                continue
 
-                await self.execute_job(job)
-                processed += 1
-
-            except Exception as e:
-                logger.error(
-                    "Unexpected error executing job",
-                    extra={
-                        "job_id": job.job_id,
-                        "tenant_id": job.tenant_id,
-                        "error": str(e),
-                    },
-                    exc_info=True,
-                )
-                # Mark as failed with unknown error
-                self._handle_job_failure(
-                    job=job,
-                    error_category=ErrorCategory.UNKNOWN,
-                    error_message=f"Unexpected error: {str(e)[:500]}",
-                )
+            await self.execute_job_safely(job)
+            processed += 1
 
         self.db.commit()
         return processed
@@ -416,6 +490,7 @@ class JobRunner:
         Process failed jobs due for retry.
 
         Picks up jobs in FAILED status with next_retry_at in the past.
+        Runs concurrently when the runner was built with a session_factory.
 
         Args:
             limit: Maximum jobs to process
@@ -423,6 +498,9 @@ class JobRunner:
         Returns:
             Number of jobs retried
         """
+        if self._session_factory is not None:
+            return await self._get_concurrent_executor().process_retry_jobs(limit=limit)
+
         jobs = get_global_failed_jobs_for_retry(self.db, limit=limit)
 
         if not jobs:
@@ -452,9 +530,6 @@ class JobRunner:
                 job.next_retry_at = None
                 self.db.flush()
 
-                await self.execute_job(job)
-                processed += 1
-
             except Exception as e:
                 logger.error(
                     "Unexpected error retrying job",
@@ -470,6 +545,10 @@ class JobRunner:
                     error_category=ErrorCategory.UNKNOWN,
                     error_message=f"Retry failed: {str(e)[:500]}",
                 )
+                continue
+
+            await self.execute_job_safely(job, failure_prefix="Retry failed")
+            processed += 1
 
         self.db.commit()
         return processed
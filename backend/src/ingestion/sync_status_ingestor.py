@@ -26,6 +26,10 @@ from src.integrations.airbyte.client import AirbyteClient, get_airbyte_client
 from src.integrations.airbyte.exceptions import AirbyteError, AirbyteNotFoundError
 from src.integrations.airbyte.models import AirbyteJobStatus
 from src.models.airbyte_connection import TenantAirbyteConnection, ConnectionStatus
+from src.services.tenant_health_snapshot import (
+    HealthSnapshotTrigger,
+    mark_tenant_health_dirty,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -404,16 +408,37 @@ class SyncStatusIngestor:
 
         Only updates last_sync_at when a successful sync timestamp is
         available. The last_sync_status is always updated to reflect the
-        most recent observation.
+        most recent observation. When either changed, the tenant's health
+        snapshot is recomputed once the session commits; repeat
+        observations of the same state leave it alone.
 
         Args:
             connection: The TenantAirbyteConnection to update
             result: The ingested SyncStatusResult
         """
-        if result.last_successful_sync_at is not None:
+        changed = False
+        if (
+            result.last_successful_sync_at is not None
+            and connection.last_sync_at != result.last_successful_sync_at
+        ):
             connection.last_sync_at = result.last_successful_sync_at
+            changed = True
 
-        if result.last_sync_status is not None:
+        if (
+            result.last_sync_status is not None
+            and connection.last_sync_status != result.last_sync_status
+        ):
             connection.last_sync_status = result.last_sync_status
+            changed = True
+
+        if not changed:
+            return
 
         self.db.flush()
+        mark_tenant_health_dirty(
+            self.db,
+            connection.tenant_id,
+            HealthSnapshotTrigger.SYNC_FAILED
+            if result.last_sync_status == "failed"
+            else HealthSnapshotTrigger.SYNC_COMPLETED,
+        )
@@ -6,6 +6,11 @@ to manage data synchronization pipelines.
 """
 
 from src.integrations.airbyte.client import AirbyteClient, get_airbyte_client
+from src.integrations.airbyte.job_watcher import (
+    AirbyteJobWatcher,
+    get_job_watcher,
+    watcher_for_client,
+)
 from src.integrations.airbyte.exceptions import (
     AirbyteError,
     AirbyteAuthenticationError,
@@ -25,6 +30,10 @@ __all__ = [
     # Client
     "AirbyteClient",
     "get_airbyte_client",
+    # Job watcher
+    "AirbyteJobWatcher",
+    "get_job_watcher",
+    "watcher_for_client",
     # Exceptions
     "AirbyteError",
     "AirbyteAuthenticationError",
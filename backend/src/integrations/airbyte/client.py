@@ -13,6 +13,7 @@ import asyncio
 import logging
 import os
 import time
+from datetime import datetime, timezone
 from typing import Optional, List, Dict, Any
 
 import httpx
@@ -102,6 +103,11 @@ class AirbyteClient:
             },
         )
 
+    @property
+    def is_closed(self) -> bool:
+        """Whether close() has been called."""
+        return self._client.is_closed
+
     async def close(self) -> None:
         """Close the HTTP client."""
         await self._client.aclose()
@@ -334,6 +340,50 @@ class AirbyteClient:
         data = await self._request("GET", f"/jobs/{job_id}")
         return AirbyteJob.from_dict(data)
 
+    async def list_jobs(
+        self,
+        workspace_id: Optional[str] = None,
+        updated_at_start: Optional[datetime] = None,
+        job_type: str = "sync",
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[AirbyteJob]:
+        """
+        List jobs in the workspace, oldest update first.
+
+        Used for batched status lookups: one request returns every job
+        updated since ``updated_at_start``.
+
+        Args:
+            workspace_id: Override workspace ID (uses default if not provided)
+            updated_at_start: Only return jobs updated at or after this time
+            job_type: Job type filter (sync, reset)
+            limit: Page size (Airbyte maximum is 100)
+            offset: Page offset
+
+        Returns:
+            List of AirbyteJob objects
+
+        Raises:
+            AirbyteError: On API errors
+        """
+        params: Dict[str, Any] = {
+            "workspaceIds": workspace_id or self.workspace_id,
+            "jobType": job_type,
+            "limit": limit,
+            "offset": offset,
+            "orderBy": "updatedAt|ASC",
+        }
+        if updated_at_start is not None:
+            params["updatedAtStart"] = (
+                updated_at_start.astimezone(timezone.utc)
+                .isoformat()
+                .replace("+00:00", "Z")
+            )
+
+        data = await self._request("GET", "/jobs", params=params)
+        return [AirbyteJob.from_dict(job_data) for job_data in data.get("data", [])]
+
     async def cancel_job(self, job_id: str) -> AirbyteJob:
         """
         Cancel a running job.
@@ -404,13 +454,7 @@ class AirbyteClient:
 
             if job.is_complete:
                 duration = time.time() - start_time
-
-                records_synced = 0
-                bytes_synced = 0
-                if job.attempts:
-                    last_attempt = job.attempts[-1]
-                    records_synced = last_attempt.records_synced
-                    bytes_synced = last_attempt.bytes_synced
+                records_synced, bytes_synced = job.sync_totals
 
                 result = AirbyteSyncResult(
                     job_id=job_id,
@@ -0,0 +1,541 @@
+"""
+Shared watcher for in-flight Airbyte sync jobs.
+
+Replaces one polling loop per running sync with a single component that:
+- Tracks every in-flight Airbyte job ID in the process
+- Refreshes their status in batches on one timer (one paginated
+  GET /jobs?updatedAtStart=... call per tick instead of one GET /jobs/{id}
+  per job)
+- Resolves per-job futures and callbacks when a job completes
+- Accepts pushed completions (Airbyte webhook notifications, received by
+  POST /api/webhooks/airbyte) so waiters can be released without waiting
+  for the next poll
+
+One watcher is shared per Airbyte account (base URL, workspace and API
+token), so every client configured for the same account subscribes to the
+same poller; see watcher_for_client().
+
+Jobs missing from the batched listing for longer than the reconcile window
+are looked up individually as a safety net.
+
+SECURITY: API token must be stored securely and never logged.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from src.integrations.airbyte.client import (
+    DEFAULT_BASE_URL,
+    AirbyteClient,
+    get_airbyte_client,
+)
+from src.integrations.airbyte.exceptions import AirbyteError, AirbyteSyncError
+from src.integrations.airbyte.models import (
+    AirbyteJob,
+    AirbyteJobStatus,
+    AirbyteSyncResult,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATCH_INTERVAL_SECONDS = float(
+    os.getenv("AIRBYTE_JOB_WATCH_INTERVAL_SECONDS", "15")
+)
+DEFAULT_RECONCILE_AFTER_SECONDS = 300
+DEFAULT_MAX_CONCURRENT_LOOKUPS = 10
+DEFAULT_SYNC_TIMEOUT_SECONDS = 3600
+
+# Batched listing parameters
+LIST_PAGE_SIZE = 100
+MAX_LIST_PAGES = 20
+LIST_OVERLAP_SECONDS = 60
+
+JobCallback = Callable[[AirbyteSyncResult], Any]
+
+
+@dataclass
+class _WatchedJob:
+    """Book-keeping for one in-flight Airbyte job."""
+
+    job_id: str
+    connection_id: Optional[str]
+    subscribed_at: float
+    subscribed_at_wall: datetime
+    last_seen_at: float
+    futures: List[asyncio.Future] = field(default_factory=list)
+    callbacks: List[JobCallback] = field(default_factory=list)
+
+
+class AirbyteJobWatcher:
+    """
+    Process-wide tracker for Airbyte sync completion.
+
+    Callers subscribe to a job ID and await the returned future (or use
+    wait_for_job). A single background task refreshes all watched jobs per
+    tick and exits once nothing is being watched.
+    """
+
+    def __init__(
+        self,
+        client: Optional[AirbyteClient] = None,
+        poll_interval_seconds: float = DEFAULT_WATCH_INTERVAL_SECONDS,
+        reconcile_after_seconds: float = DEFAULT_RECONCILE_AFTER_SECONDS,
+        max_concurrent_lookups: int = DEFAULT_MAX_CONCURRENT_LOOKUPS,
+    ):
+        """
+        Initialize job watcher.
+
+        Args:
+            client: Airbyte client used for lookups (creates default if not provided)
+            poll_interval_seconds: Interval between batched status refreshes
+            reconcile_after_seconds: Fetch a job individually if the batched
+                listing has not reported it for this long
+            max_concurrent_lookups: Cap on parallel individual lookups
+        """
+        self._client = client
+        self.poll_interval = poll_interval_seconds
+        self.reconcile_after = reconcile_after_seconds
+        self._lookup_semaphore = asyncio.Semaphore(max_concurrent_lookups)
+        self._watched: Dict[str, _WatchedJob] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._last_listed_at: Optional[datetime] = None
+        self._listing_supported = True
+
+    def _get_client(self) -> AirbyteClient:
+        """Get or create the Airbyte client, replacing it if it was closed."""
+        if self._client is None:
+            self._client = get_airbyte_client()
+        elif getattr(self._client, "is_closed", False) is True:
+            # The watcher outlives the caller whose client it borrowed
+            self._client = get_airbyte_client(
+                base_url=self._client.base_url,
+                api_token=self._client.api_token,
+                workspace_id=self._client.workspace_id,
+            )
+        return self._client
+
+    @property
+    def watched_job_ids(self) -> List[str]:
+        """IDs of jobs currently being watched."""
+        return list(self._watched)
+
+    # =========================================================================
+    # Subscription
+    # =========================================================================
+
+    def subscribe(
+        self,
+        job_id: str,
+        connection_id: Optional[str] = None,
+        callback: Optional[JobCallback] = None,
+    ) -> asyncio.Future:
+        """
+        Start watching a job.
+
+        Args:
+            job_id: Airbyte job ID
+            connection_id: Optional Airbyte connection ID (for results/logging)
+            callback: Optional callable invoked with the final AirbyteSyncResult
+
+        Returns:
+            Future resolved with the AirbyteSyncResult when the job completes
+        """
+        job_id = str(job_id)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        watched = self._watched.get(job_id)
+        if watched is None:
+            now = time.monotonic()
+            watched = _WatchedJob(
+                job_id=job_id,
+                connection_id=connection_id,
+                subscribed_at=now,
+                subscribed_at_wall=datetime.now(timezone.utc),
+                last_seen_at=now,
+            )
+            self._watched[job_id] = watched
+        elif connection_id and not watched.connection_id:
+            watched.connection_id = connection_id
+
+        watched.futures.append(future)
+        if callback is not None:
+            watched.callbacks.append(callback)
+
+        self._ensure_running()
+        return future
+
+    def unsubscribe(self, job_id: str, future: asyncio.Future) -> None:
+        """Stop waiting on ``future``; stops watching the job if no waiters remain."""
+        watched = self._watched.get(str(job_id))
+        if watched is None:
+            return
+        if future in watched.futures:
+            watched.futures.remove(future)
+        if not watched.futures and not watched.callbacks:
+            del self._watched[watched.job_id]
+
+    async def wait_for_job(
+        self,
+        job_id: str,
+        timeout_seconds: float = DEFAULT_SYNC_TIMEOUT_SECONDS,
+        connection_id: Optional[str] = None,
+    ) -> AirbyteSyncResult:
+        """
+        Wait for a job to complete.
+
+        Drop-in replacement for AirbyteClient.wait_for_sync that shares one
+        poller across all waiters.
+
+        Args:
+            job_id: Airbyte job ID
+            timeout_seconds: Maximum wait time
+            connection_id: Optional Airbyte connection ID
+
+        Returns:
+            AirbyteSyncResult with final status
+
+        Raises:
+            AirbyteSyncError: On timeout
+        """
+        future = self.subscribe(job_id, connection_id=connection_id)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=timeout_seconds)
+        except asyncio.TimeoutError:
+            raise AirbyteSyncError(
+                message=f"Sync timed out after {timeout_seconds} seconds",
+                job_id=str(job_id),
+                connection_id=connection_id,
+            )
+        finally:
+            self.unsubscribe(job_id, future)
+
+    # =========================================================================
+    # Completion
+    # =========================================================================
+
+    def handle_job_update(self, job: AirbyteJob) -> bool:
+        """
+        Apply a job status observation.
+
+        Called by the poller for every job it sees and by push entry points.
+
+        Returns:
+            True if a watched job completed and its waiters were resolved
+        """
+        watched = self._watched.get(str(job.job_id))
+        if watched is None:
+            return False
+
+        watched.last_seen_at = time.monotonic()
+        if not job.is_complete:
+            return False
+
+        del self._watched[watched.job_id]
+        result = self._build_result(watched, job)
+        self._log_completion(result)
+
+        for future in watched.futures:
+            if not future.done():
+                future.set_result(result)
+        for callback in watched.callbacks:
+            try:
+                callback(result)
+            except Exception:
+                logger.exception(
+                    "Airbyte job watcher callback failed",
+                    extra={"job_id": watched.job_id},
+                )
+        return True
+
+    def handle_webhook(self, payload: Dict[str, Any]) -> bool:
+        """
+        Push entry point for Airbyte sync notifications.
+
+        Accepts the Airbyte webhook notification body ("data" envelope with
+        jobId/success/recordsCommitted/bytesEmitted) or a flat job payload
+        with an explicit "status".
+
+        Args:
+            payload: Parsed webhook JSON body
+
+        Returns:
+            True if a watched job was resolved
+        """
+        data = payload.get("data", payload) if isinstance(payload, dict) else {}
+        job_id = data.get("jobId", data.get("job_id"))
+        if job_id is None:
+            logger.warning("Airbyte webhook without job ID ignored")
+            return False
+
+        if "status" in data:
+            try:
+                status = AirbyteJobStatus(str(data["status"]).lower())
+            except ValueError:
+                logger.warning(
+                    "Airbyte webhook with unknown status ignored",
+                    extra={"job_id": job_id, "status": data["status"]},
+                )
+                return False
+        else:
+            status = (
+                AirbyteJobStatus.SUCCEEDED if data.get("success")
+                else AirbyteJobStatus.FAILED
+            )
+
+        connection = data.get("connection") or {}
+        job = AirbyteJob(
+            job_id=str(job_id),
+            config_type="sync",
+            config_id=connection.get("id", data.get("connectionId", "")),
+            status=status,
+            records_synced=data.get("recordsCommitted", data.get("rowsSynced", 0)) or 0,
+            bytes_synced=data.get("bytesEmitted", data.get("bytesSynced", 0)) or 0,
+        )
+        return self.handle_job_update(job)
+
+    def _build_result(self, watched: _WatchedJob, job: AirbyteJob) -> AirbyteSyncResult:
+        """Build the final sync result for a completed job."""
+        records_synced, bytes_synced = job.sync_totals
+        return AirbyteSyncResult(
+            job_id=watched.job_id,
+            status=job.status,
+            connection_id=watched.connection_id or job.config_id,
+            records_synced=records_synced,
+            bytes_synced=bytes_synced,
+            duration_seconds=time.monotonic() - watched.subscribed_at,
+        )
+
+    def _log_completion(self, result: AirbyteSyncResult) -> None:
+        if result.is_successful:
+            logger.info(
+                "Airbyte sync completed successfully",
+                extra={
+                    "job_id": result.job_id,
+                    "connection_id": result.connection_id,
+                    "records_synced": result.records_synced,
+                    "bytes_synced": result.bytes_synced,
+                    "duration_seconds": result.duration_seconds,
+                },
+            )
+        else:
+            logger.warning(
+                "Airbyte sync completed with status",
+                extra={
+                    "job_id": result.job_id,
+                    "connection_id": result.connection_id,
+                    "status": result.status.value,
+                    "duration_seconds": result.duration_seconds,
+                },
+            )
+
+    # =========================================================================
+    # Polling
+    # =========================================================================
+
+    def _ensure_running(self) -> None:
+        """Start the background poll task if it is not running."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Poll until nothing is watched."""
+        while self._watched:
+            await asyncio.sleep(self.poll_interval)
+            if not self._watched:
+                break
+            await self.poll_once()
+        self._last_listed_at = None
+
+    async def poll_once(self) -> int:
+        """
+        Refresh all watched jobs with one batched lookup.
+
+        Returns:
+            Number of jobs that completed in this tick
+        """
+        job_ids = set(self._watched)
+        if not job_ids:
+            return 0
+
+        completed = 0
+        seen: set[str] = set()
+
+        if self._listing_supported:
+            try:
+                for job in await self._list_recent_jobs():
+                    if job.job_id in job_ids:
+                        seen.add(job.job_id)
+                        completed += self.handle_job_update(job)
+            except AirbyteError as e:
+                logger.warning(
+                    "Batched Airbyte job listing failed, using per-job lookups",
+                    extra={"error": str(e), "watched_jobs": len(job_ids)},
+                )
+                if e.status_code in (400, 404, 405):
+                    self._listing_supported = False
+
+        now = time.monotonic()
+        to_reconcile = [
+            watched.job_id
+            for watched in list(self._watched.values())
+            if watched.job_id not in seen
+            and (
+                not self._listing_supported
+                or now - watched.last_seen_at >= self.reconcile_after
+            )
+        ]
+        if to_reconcile:
+            jobs = await asyncio.gather(
+                *(self._get_job(job_id) for job_id in to_reconcile)
+            )
+            for job in jobs:
+                if job is not None:
+                    completed += self.handle_job_update(job)
+
+        logger.debug(
+            "Airbyte job watcher tick",
+            extra={
+                "watched_jobs": len(job_ids),
+                "listed_jobs": len(seen),
+                "individual_lookups": len(to_reconcile),
+                "completed": completed,
+            },
+        )
+        return completed
+
+    async def _list_recent_jobs(self) -> Iterable[AirbyteJob]:
+        """List jobs updated since the previous tick (paginated)."""
+        started_at = datetime.now(timezone.utc)
+        since = self._last_listed_at or min(
+            watched.subscribed_at_wall for watched in self._watched.values()
+        )
+        since -= timedelta(seconds=LIST_OVERLAP_SECONDS)
+
+        client = self._get_client()
+        jobs: List[AirbyteJob] = []
+        for page in range(MAX_LIST_PAGES):
+            batch = await client.list_jobs(
+                updated_at_start=since,
+                limit=LIST_PAGE_SIZE,
+                offset=page * LIST_PAGE_SIZE,
+            )
+            jobs.extend(batch)
+            if len(batch) < LIST_PAGE_SIZE:
+                break
+
+        self._last_listed_at = started_at
+        return jobs
+
+    async def _get_job(self, job_id: str) -> Optional[AirbyteJob]:
+        """Fetch one job, bounded by the lookup semaphore."""
+        async with self._lookup_semaphore:
+            try:
+                return await self._get_client().get_job(job_id)
+            except AirbyteError as e:
+                logger.warning(
+                    "Airbyte job lookup failed",
+                    extra={"job_id": job_id, "error": str(e)},
+                )
+                return None
+
+    async def close(self) -> None:
+        """Stop polling and fail any remaining waiters."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        for watched in self._watched.values():
+            for future in watched.futures:
+                if not future.done():
+                    future.set_exception(
+                        AirbyteSyncError(
+                            message="Job watcher closed",
+                            job_id=watched.job_id,
+                            connection_id=watched.connection_id,
+                        )
+                    )
+        self._watched.clear()
+
+
+# One watcher per Airbyte account
+_watchers: Dict[Any, AirbyteJobWatcher] = {}
+_watchers_lock = threading.Lock()
+
+
+def _account_key(
+    base_url: Optional[str],
+    api_token: Optional[str],
+    workspace_id: Optional[str],
+) -> tuple:
+    """Registry key for an Airbyte account (the token is only hashed)."""
+    token_hash = hashlib.sha256((api_token or "").encode()).hexdigest()
+    return ((base_url or DEFAULT_BASE_URL).rstrip("/"), workspace_id, token_hash)
+
+
+def _client_key(client: Optional[AirbyteClient]) -> Any:
+    """Registry key for a client; clients without string settings (mocks) get their own."""
+    if client is None:
+        return _account_key(
+            os.getenv("AIRBYTE_BASE_URL"),
+            os.getenv("AIRBYTE_API_TOKEN"),
+            os.getenv("AIRBYTE_WORKSPACE_ID"),
+        )
+    settings = [getattr(client, name, None) for name in ("base_url", "api_token", "workspace_id")]
+    if not all(isinstance(value, str) for value in settings):
+        return ("client", id(client))
+    return _account_key(*settings)
+
+
+def watcher_for_client(client: Optional[AirbyteClient] = None) -> AirbyteJobWatcher:
+    """
+    Get the shared watcher for the Airbyte account a client talks to.
+
+    Clients configured for the same base URL, workspace and API token share
+    one watcher (and one poll loop); None means the account configured in
+    the environment. The first client registered for an account is used for
+    lookups.
+    """
+    key = _client_key(client)
+    with _watchers_lock:
+        watcher = _watchers.get(key)
+        if watcher is None:
+            watcher = AirbyteJobWatcher(client=client)
+            _watchers[key] = watcher
+        return watcher
+
+
+def get_job_watcher() -> AirbyteJobWatcher:
+    """Get the watcher for the Airbyte account configured in the environment."""
+    return watcher_for_client(None)
+
+
+def handle_webhook(payload: Dict[str, Any]) -> bool:
+    """
+    Deliver an Airbyte webhook notification to every watcher in the process.
+
+    Returns:
+        True if any watcher resolved a job
+    """
+    with _watchers_lock:
+        watchers = list(_watchers.values())
+    resolved = False
+    for watcher in watchers:
+        resolved = watcher.handle_webhook(payload) or resolved
+    return resolved
+
+
+def reset_job_watchers() -> None:
+    """Forget all shared watchers (tests)."""
+    with _watchers_lock:
+        _watchers.clear()
@@ -145,6 +145,8 @@ class AirbyteJob:
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     attempts: List[AirbyteJobAttempt] = field(default_factory=list)
+    records_synced: int = 0
+    bytes_synced: int = 0
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AirbyteJob":
@@ -163,12 +165,16 @@ class AirbyteJob:
 
         return cls(
             job_id=str(job_data.get("id", job_data.get("jobId", ""))),
-            config_type=job_data.get("configType", "sync"),
-            config_id=job_data.get("configId", ""),
+            config_type=job_data.get("configType", job_data.get("jobType", "sync")),
+            config_id=job_data.get("configId", job_data.get("connectionId", "")),
             status=AirbyteJobStatus(job_data.get("status", "pending")),
             created_at=parse_timestamp(job_data.get("createdAt")),
-            updated_at=parse_timestamp(job_data.get("updatedAt")),
+            updated_at=parse_timestamp(
+                job_data.get("updatedAt", job_data.get("lastUpdatedAt"))
+            ),
             attempts=attempts,
+            records_synced=job_data.get("rowsSynced", 0) or 0,
+            bytes_synced=job_data.get("bytesSynced", 0) or 0,
         )
 
     @property
@@ -187,6 +193,14 @@ class AirbyteJob:
     def is_successful(self) -> bool:
         return self.status == AirbyteJobStatus.SUCCEEDED
 
+    @property
+    def sync_totals(self) -> tuple[int, int]:
+        """(records_synced, bytes_synced) from the last attempt, else job totals."""
+        if self.attempts:
+            last_attempt = self.attempts[-1]
+            return last_attempt.records_synced, last_attempt.bytes_synced
+        return self.records_synced, self.bytes_synced
+
 
 @dataclass
 class AirbyteSyncResult:
@@ -4,6 +4,10 @@ Audit Log Retention Enforcement Job.
 Runs daily to hard-delete audit logs past their retention window.
 Retention periods are configurable per billing plan.
 
+audit_logs is partitioned by month (migration 0063). Partitions older than
+the longest plan retention are detached and dropped whole; tenants on
+plans with shorter retention are then trimmed with batched deletes.
+
 Run as a daily cron job:
     python -m src.jobs.audit_retention_job
 
@@ -26,9 +30,11 @@ from sqlalchemy.orm import Session
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.database.partitioning import PartitionManager
 from src.database.session import get_db_session_sync
 from src.config.retention import (
     get_retention_days,
+    get_max_retention_days,
     DELETION_BATCH_SIZE,
     RETENTION_DRY_RUN,
     DEFAULT_RETENTION_DAYS,
@@ -57,11 +63,12 @@ class AuditRetentionJob:
     Enforces audit log retention policy.
 
     Process:
-    1. Query distinct tenant_ids from audit_logs
-    2. For each tenant, get their plan's retention period
-    3. Calculate cutoff date (now - retention_days)
-    4. Delete logs older than cutoff in batches
-    5. Log deletion stats as audit event
+    1. Drop audit_logs partitions older than the longest plan retention
+    2. Query distinct tenant_ids from audit_logs
+    3. For each tenant, get their plan's retention period
+    4. Calculate cutoff date (now - retention_days)
+    5. Delete logs older than cutoff in batches
+    6. Log deletion stats as audit event
     """
 
     def __init__(self, db_session: Session, dry_run: bool = RETENTION_DRY_RUN):
@@ -75,9 +82,11 @@ class AuditRetentionJob:
         self.db = db_session
         self.dry_run = dry_run
         self.metrics = get_audit_metrics()
+        self.partitions = PartitionManager(db_session)
         self.stats: Dict = {
             "tenants_processed": 0,
             "total_deleted": 0,
+            "partitions_dropped": 0,
             "dry_run": dry_run,
             "errors": [],
         }
@@ -206,6 +215,31 @@ class AuditRetentionJob:
 
         return total_deleted
 
+    def drop_expired_partitions(self) -> int:
+        """
+        Drop audit_logs partitions past the longest plan retention.
+
+        Dropping a partition removes every tenant's rows for that month
+        (system events included) without firing the immutability trigger.
+        Shorter per-tenant retention is left to delete_expired_logs.
+
+        Returns:
+            Number of partitions dropped (or that would be, on dry run)
+        """
+        cutoff_date = datetime.now(timezone.utc) - timedelta(days=get_max_retention_days())
+        dropped = self.partitions.drop_partitions_before(
+            "audit_logs", cutoff_date, dry_run=self.dry_run,
+        )
+
+        if dropped:
+            prefix = "[DRY RUN] Would drop" if self.dry_run else "Dropped"
+            logger.info(
+                f"{prefix} {len(dropped)} audit log partitions",
+                extra={"partitions": dropped, "cutoff_date": cutoff_date.isoformat()},
+            )
+
+        return len(dropped)
+
     def process_tenant(self, tenant_id: str) -> int:
         """
         Process retention for a single tenant.
@@ -259,6 +293,8 @@ class AuditRetentionJob:
         )
 
         try:
+            self.stats["partitions_dropped"] = self.drop_expired_partitions()
+
             tenants = self.get_distinct_tenants()
             logger.info(f"Found {len(tenants)} tenants to process")
 
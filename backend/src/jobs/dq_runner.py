@@ -7,20 +7,30 @@ Background worker that executes DQ checks for all tenants:
 - Incident creation for severe failures
 - Alert routing based on severity
 
+Tenants run in parallel on a thread pool, each on its own session, with
+connector metadata prefetched once per tenant and check results flushed
+as one batched INSERT per tenant. Several cron instances can split the
+fleet with --shard i/n (tenants are assigned by a stable hash).
+
 Run as a cron job or background worker:
     python -m src.jobs.dq_runner
+    python -m src.jobs.dq_runner --shard 0/4 --workers 8
 
 Configuration:
 - DQ_RUN_INTERVAL_MINUTES: How often to run (default: 15)
-- DQ_BATCH_SIZE: Number of tenants to process per batch (default: 50)
+- DQ_BATCH_SIZE: Number of tenants to process per batch in serial mode (default: 50)
+- DQ_WORKERS: Tenants checked concurrently (default: 4)
 """
 
 import os
 import sys
 import logging
 import asyncio
+import argparse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict
+from typing import Callable, List, Optional, Dict, Tuple
 import uuid
 
 from sqlalchemy.orm import Session
@@ -29,7 +39,7 @@ from sqlalchemy import func
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.database.session import get_db_session_sync
+from src.database.session import get_db_session_sync, get_session_factory
 from src.api.dq.service import DQService, DQEvent, DQEventType
 from src.api.dq.alerts.router import get_alert_router
 from src.models.dq_models import (
@@ -38,6 +48,10 @@ from src.models.dq_models import (
     ConnectorSourceType, is_critical_source,
 )
 from src.models.airbyte_connection import TenantAirbyteConnection
+from src.services.tenant_health_snapshot import (
+    HealthSnapshotTrigger,
+    mark_tenant_health_dirty,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -48,6 +62,24 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 DQ_BATCH_SIZE = int(os.getenv("DQ_BATCH_SIZE", "50"))
+DQ_WORKERS = int(os.getenv("DQ_WORKERS", "4"))
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an "i/n" shard spec (0 <= i < n)."""
+    try:
+        index, count = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise ValueError(f"Invalid shard {value!r}, expected i/n")
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"Invalid shard {value!r}, expected 0 <= i < n")
+    return index, count
+
+
+def tenant_in_shard(tenant_id: str, shard: Tuple[int, int]) -> bool:
+    """Stable tenant -> shard assignment (same on every instance)."""
+    index, count = shard
+    return zlib.crc32(tenant_id.encode()) % count == index
 
 
 class DQRunner:
@@ -58,16 +90,30 @@ class DQRunner:
     records results, creates incidents, and routes alerts.
     """
 
-    def __init__(self, db_session: Session):
+    def __init__(
+        self,
+        db_session: Session,
+        session_factory: Optional[Callable[[], Session]] = None,
+        workers: int = DQ_WORKERS,
+        shard: Tuple[int, int] = (0, 1),
+    ):
         """
         Initialize DQ runner.
 
         Args:
-            db_session: Database session
+            db_session: Database session (tenant listing, serial mode)
+            session_factory: Enables parallel mode; each tenant gets its own session
+            workers: Tenants checked concurrently in parallel mode
+            shard: (index, count) slice of the tenant list handled by this run
         """
         self.db = db_session
+        self.session_factory = session_factory
+        self.workers = workers
+        self.shard = shard
         self.alert_router = get_alert_router()
         self.run_id = str(uuid.uuid4())
+        # check_type -> DQCheck definitions, loaded once per session
+        self._checks_by_type: Dict[str, List[DQCheck]] = {}
         self.stats = {
             "tenants_processed": 0,
             "connectors_checked": 0,
@@ -95,6 +141,27 @@ class DQRunner:
             DQCheck.is_enabled == True,
         ).all()
 
+    def _get_checks(self, check_type: DQCheckType) -> List[DQCheck]:
+        """Check definitions of a type (cached for this runner's session)."""
+        if check_type.value not in self._checks_by_type:
+            self._checks_by_type[check_type.value] = self.db.query(DQCheck).filter(
+                DQCheck.check_type == check_type.value,
+            ).all()
+        return self._checks_by_type[check_type.value]
+
+    def _find_check(
+        self,
+        check_type: DQCheckType,
+        source_type: Optional[ConnectorSourceType] = None,
+    ) -> Optional[DQCheck]:
+        """Source-specific check definition, else the generic one for the type."""
+        checks = self._get_checks(check_type)
+        if source_type is not None:
+            for check in checks:
+                if check.source_type == source_type.value:
+                    return check
+        return checks[0] if checks else None
+
     def _should_block_dashboard(
         self,
         severity: DQSeverity,
@@ -128,9 +195,7 @@ class DQRunner:
         resolved_count = 0
 
         # Find open incidents for this connector and check type
-        check = self.db.query(DQCheck).filter(
-            DQCheck.check_type == check_type.value,
-        ).first()
+        check = self._find_check(check_type)
 
         if not check:
             return 0
@@ -162,6 +227,9 @@ class DQRunner:
             )
 
         if resolved_count > 0:
+            mark_tenant_health_dirty(
+                self.db, tenant_id, HealthSnapshotTrigger.DQ_INCIDENT_RESOLVED,
+            )
             self.db.commit()
 
         return resolved_count
@@ -172,26 +240,21 @@ class DQRunner:
 
         Returns list of events to be routed to alerting.
         """
+        return self._check_freshness(tenant_id)
+
+    def _check_freshness(self, tenant_id: str) -> List[DQEvent]:
         events = []
         correlation_id = str(uuid.uuid4())
 
         service = DQService(self.db, tenant_id)
+        service.prefetch_connectors()
         results = service.check_all_freshness(self.run_id, correlation_id)
 
         for result in results:
             self.stats["connectors_checked"] += 1
 
-            # Get or create check definition
-            check = self.db.query(DQCheck).filter(
-                DQCheck.check_type == DQCheckType.FRESHNESS.value,
-                DQCheck.source_type == result.source_type.value if result.source_type else None,
-            ).first()
-
-            # If no specific check, use a generic one
-            if not check:
-                check = self.db.query(DQCheck).filter(
-                    DQCheck.check_type == DQCheckType.FRESHNESS.value,
-                ).first()
+            # Source-specific check definition, else the generic one
+            check = self._find_check(DQCheckType.FRESHNESS, result.source_type)
 
             if not check:
                 logger.warning(
@@ -233,6 +296,7 @@ class DQRunner:
                     status=DQResultStatus.PASSED,
                     minutes_since_sync=result.minutes_since_sync,
                     message=result.message,
+                    commit=False,
                 )
             else:
                 # Check failed
@@ -258,6 +322,7 @@ class DQRunner:
                     message=result.message,
                     merchant_message=result.merchant_message,
                     support_details=result.support_details,
+                    commit=False,
                 )
 
                 # Create incident for high/critical severity
@@ -319,13 +384,19 @@ class DQRunner:
 
         Returns list of events to be routed to alerting.
         """
+        return self._run_tenant(tenant_id)
+
+    def _run_tenant(self, tenant_id: str) -> List[DQEvent]:
         events = []
 
         try:
             # Run freshness checks
-            freshness_events = await self.run_freshness_checks(tenant_id)
+            freshness_events = self._check_freshness(tenant_id)
             events.extend(freshness_events)
 
+            # One flush/commit for all of the tenant's results
+            self.db.commit()
+
             self.stats["tenants_processed"] += 1
 
             logger.info(
@@ -337,6 +408,7 @@ class DQRunner:
             )
 
         except Exception as e:
+            self.db.rollback()
             self.stats["errors"] += 1
             logger.error(
                 "Error running DQ checks for tenant",
@@ -349,6 +421,29 @@ class DQRunner:
 
         return events
 
+    def _run_tenant_isolated(self, tenant_id: str) -> Tuple[List[DQEvent], Dict]:
+        """Run one tenant on its own session (parallel mode worker)."""
+        session = self.session_factory()
+        try:
+            worker = DQRunner(session, workers=1)
+            worker.run_id = self.run_id
+            worker.alert_router = self.alert_router
+            events = worker._run_tenant(tenant_id)
+            return events, worker.stats
+        finally:
+            session.close()
+
+    def _run_tenants_parallel(self, tenants: List[str]) -> List[DQEvent]:
+        all_events = []
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dq-runner"
+        ) as pool:
+            for events, stats in pool.map(self._run_tenant_isolated, tenants):
+                all_events.extend(events)
+                for key, value in stats.items():
+                    self.stats[key] += value
+        return all_events
+
     async def route_events(self, events: List[DQEvent]) -> None:
         """Route events to alerting system."""
         for event in events:
@@ -388,23 +483,32 @@ class DQRunner:
         all_events = []
 
         try:
-            # Get all tenants
-            tenants = self._get_all_tenants()
+            # Get all tenants in this run's shard
+            tenants = [
+                tenant_id for tenant_id in self._get_all_tenants()
+                if tenant_in_shard(tenant_id, self.shard)
+            ]
             logger.info(
                 f"Found {len(tenants)} tenants to process",
-                extra={"run_id": self.run_id},
+                extra={
+                    "run_id": self.run_id,
+                    "shard": f"{self.shard[0]}/{self.shard[1]}",
+                    "workers": self.workers,
+                },
             )
 
-            # Process tenants in batches
-            for i in range(0, len(tenants), DQ_BATCH_SIZE):
-                batch = tenants[i:i + DQ_BATCH_SIZE]
-
-                for tenant_id in batch:
-                    events = await self.run_for_tenant(tenant_id)
-                    all_events.extend(events)
+            if self.session_factory is not None and self.workers > 1:
+                all_events = await asyncio.to_thread(
+                    self._run_tenants_parallel, tenants
+                )
+            else:
+                # Process tenants in batches
+                for i in range(0, len(tenants), DQ_BATCH_SIZE):
+                    batch = tenants[i:i + DQ_BATCH_SIZE]
 
-                # Commit after each batch
-                self.db.commit()
+                    for tenant_id in batch:
+                        events = await self.run_for_tenant(tenant_id)
+                        all_events.extend(events)
 
             # Route all events to alerting
             await self.route_events(all_events)
@@ -438,13 +542,29 @@ class DQRunner:
         return self.stats
 
 
-async def main():
+async def main(argv: Optional[List[str]] = None):
     """Main entry point for DQ runner job."""
-    logger.info("DQ Runner starting")
+    parser = argparse.ArgumentParser(description="Run data quality checks")
+    parser.add_argument(
+        "--shard", type=parse_shard, default=(0, 1),
+        help="Process only tenant shard i of n, e.g. 0/4",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=DQ_WORKERS,
+        help="Tenants checked concurrently",
+    )
+    args = parser.parse_args(argv)
+
+    logger.info("DQ Runner starting", extra={"shard": args.shard, "workers": args.workers})
 
     try:
         for session in get_db_session_sync():
-            runner = DQRunner(session)
+            runner = DQRunner(
+                session,
+                session_factory=get_session_factory(),
+                workers=args.workers,
+                shard=args.shard,
+            )
             stats = await runner.run()
             logger.info("DQ Runner stats", extra=stats)
     except Exception as e:
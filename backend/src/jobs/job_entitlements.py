@@ -8,15 +8,14 @@ Story 6.5.3 - Background Job Entitlement Enforcement
 """
 
 import logging
-import json
-from typing import Optional, Callable
-from pathlib import Path
+from typing import Any, Callable, Mapping, Optional
 from functools import wraps
 from dataclasses import dataclass
 from enum import Enum
 
 from sqlalchemy.orm import Session
 
+from src.config.registry import get_plans_config
 from src.entitlements.policy import EntitlementPolicy, BillingState
 from src.models.subscription import Subscription
 from src.platform.audit import AuditAction, log_system_audit_event
@@ -77,43 +76,10 @@ class JobEntitlementChecker:
             db_session: Database session for querying subscriptions
         """
         self.db = db_session
-        self._config_cache: Optional[dict] = None
     
-    def _load_config(self) -> dict:
-        """Load premium job configuration from config/plans.json."""
-        if self._config_cache is not None:
-            return self._config_cache
-        
-        config_path = Path(__file__).parent.parent.parent.parent / "config" / "plans.json"
-        
-        if not config_path.exists():
-            logger.warning("config/plans.json not found, using default premium job rules")
-            self._config_cache = {
-                "premium_jobs": {
-                    "sync": {"required_feature": "premium_analytics", "skip_on_deny": True},
-                    "export": {"required_feature": "data_export", "skip_on_deny": True},
-                    "ai_action": {"required_feature": "ai_actions", "skip_on_deny": True},
-                    "backfill": {"required_feature": "premium_analytics", "skip_on_deny": True},
-                    "attribution_model": {"required_feature": "advanced_analytics", "skip_on_deny": True},
-                }
-            }
-            return self._config_cache
-        
-        try:
-            with open(config_path, "r") as f:
-                config = json.load(f)
-            
-            # Ensure premium_jobs section exists
-            if "premium_jobs" not in config:
-                config["premium_jobs"] = {}
-            
-            self._config_cache = config
-            logger.info("Loaded premium job config from config/plans.json")
-            return config
-        except Exception as e:
-            logger.warning(f"Failed to load config/plans.json: {e}, using defaults")
-            self._config_cache = {"premium_jobs": {}}
-            return self._config_cache
+    def _load_config(self) -> Mapping[str, Any]:
+        """Premium job configuration from config/plans.json (via the config registry)."""
+        return get_plans_config().raw
     
     def check_job_entitlement(
         self,
@@ -0,0 +1,126 @@
+"""
+Partition Maintenance Job.
+
+Pre-creates monthly partitions for the range-partitioned operational
+tables (dq_results, sync_runs, audit_logs) so inserts always have a
+partition to land in. Expired partitions are dropped by the retention
+jobs (retention_cleanup, audit_retention_job), not here.
+
+If a table's monthly partitions reach less than one month ahead after the
+run, an error is logged and the job exits non-zero: inserts past the
+horizon fall into the DEFAULT partition, which every later partition
+creation has to scan and drain.
+
+Run as a daily cron job:
+    python -m src.jobs.partition_maintenance
+
+Configuration:
+- PARTITION_PREMAKE_MONTHS: Months of partitions kept ahead of the current month (default: 3)
+"""
+
+import os
+import sys
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from dateutil.relativedelta import relativedelta
+
+# Add the backend directory to the path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.database.partitioning import (
+    PARTITIONED_TABLES,
+    PARTITION_PREMAKE_MONTHS,
+    PartitionManager,
+)
+from src.database.session import get_db_session_sync
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+# Alert when monthly partitions reach less than this far ahead
+MIN_PARTITION_HORIZON = relativedelta(months=1)
+
+
+def ensure_partitions(
+    db_session,
+    months_ahead: int = PARTITION_PREMAKE_MONTHS,
+    now: Optional[datetime] = None,
+) -> Dict:
+    """
+    Create missing future partitions for every partitioned table.
+
+    A failure on one table is logged and does not stop the others. Tables
+    whose partitions end less than MIN_PARTITION_HORIZON from now are
+    counted in horizon_alerts.
+
+    Args:
+        db_session: Database session
+        months_ahead: Months of partitions to keep ahead of the current month
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        Statistics dictionary
+    """
+    manager = PartitionManager(db_session)
+    stats: Dict = {
+        "partitions_created": 0, "tables_skipped": 0, "horizon_alerts": 0, "errors": 0,
+    }
+    required = (now or datetime.now(timezone.utc)) + MIN_PARTITION_HORIZON
+
+    for table in PARTITIONED_TABLES:
+        try:
+            if not manager.is_partitioned(table):
+                stats["tables_skipped"] += 1
+                continue
+            created = manager.ensure_future_partitions(table, months_ahead, now=now)
+            stats["partitions_created"] += len(created)
+        except Exception as e:
+            db_session.rollback()
+            stats["errors"] += 1
+            logger.error(
+                "Error creating partitions",
+                extra={"table": table, "error": str(e)},
+                exc_info=True,
+            )
+
+        horizon = manager.horizon(table)
+        if horizon is None or horizon < required:
+            stats["horizon_alerts"] += 1
+            logger.error(
+                "Partition horizon below one month",
+                extra={
+                    "table": table,
+                    "horizon": horizon.isoformat() if horizon else None,
+                    "required": required.isoformat(),
+                },
+            )
+
+    return stats
+
+
+def main():
+    """Main entry point for partition maintenance job."""
+    logger.info("Partition Maintenance starting")
+
+    try:
+        for session in get_db_session_sync():
+            stats = ensure_partitions(session)
+            logger.info("Partition Maintenance stats", extra=stats)
+            if stats["errors"] or stats["horizon_alerts"]:
+                sys.exit(1)
+    except Exception as e:
+        logger.error("Partition Maintenance failed", extra={"error": str(e)}, exc_info=True)
+        sys.exit(1)
+
+    logger.info("Partition Maintenance finished")
+
+
+if __name__ == "__main__":
+    main()
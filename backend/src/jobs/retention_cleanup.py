@@ -7,6 +7,12 @@ Background worker that enforces 13-month retention policy on DQ data:
 - sync_runs: Delete records older than 13 months
 - backfill_jobs: Delete completed jobs older than 13 months
 
+dq_results and sync_runs are partitioned by month (migration 0063); for
+them whole partitions past the cutoff are detached and dropped instead of
+deleting rows, so a row is kept for up to one extra month. Rows still in
+the pre-conversion legacy partition are deleted in batches until it ages
+out. Unpartitioned databases fall back to batched deletes.
+
 Run as a daily cron job:
     python -m src.jobs.retention_cleanup
 
@@ -20,13 +26,14 @@ import sys
 import logging
 from datetime import datetime, timezone
 from dateutil.relativedelta import relativedelta
-from typing import Dict
+from typing import Dict, Optional
 
 from sqlalchemy import delete, and_
 
 # Add the backend directory to the path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from src.database.partitioning import PartitionManager
 from src.database.session import get_db_session_sync
 from src.models.dq_models import (
     DQResult, DQIncident, SyncRun, BackfillJob,
@@ -65,11 +72,13 @@ class RetentionCleanup:
         self.db = db_session
         self.retention_months = retention_months
         self.cutoff_date = datetime.now(timezone.utc) - relativedelta(months=retention_months)
+        self.partitions = PartitionManager(db_session)
         self.stats = {
             "dq_results_deleted": 0,
             "dq_incidents_deleted": 0,
             "sync_runs_deleted": 0,
             "backfill_jobs_deleted": 0,
+            "partitions_dropped": 0,
             "errors": 0,
         }
 
@@ -126,6 +135,30 @@ class RetentionCleanup:
 
         return total_deleted
 
+    def _cleanup_partitioned(self, table: str) -> Optional[int]:
+        """
+        Drop expired monthly partitions of a partitioned table.
+
+        Args:
+            table: Registered partitioned table name
+
+        Returns:
+            Rows deleted from the legacy partition, or None if the table is
+            not partitioned and the caller should delete in batches
+        """
+        if not self.partitions.is_partitioned(table):
+            return None
+
+        dropped = self.partitions.drop_partitions_before(table, self.cutoff_date)
+        self.stats["partitions_dropped"] += len(dropped)
+
+        deleted = 0
+        for partition in self.partitions.unbounded_partitions(table):
+            deleted += self.partitions.trim_partition(
+                table, partition.name, self.cutoff_date, DQ_CLEANUP_BATCH_SIZE,
+            )
+        return deleted
+
     def cleanup_dq_results(self) -> int:
         """
         Delete DQ results older than retention period.
@@ -142,13 +175,15 @@ class RetentionCleanup:
         )
 
         try:
-            # Delete old results
-            deleted = self._delete_in_batches(
-                DQResult,
-                None,  # No additional condition
-                DQResult.executed_at,
-                "dq_results",
-            )
+            deleted = self._cleanup_partitioned("dq_results")
+            if deleted is None:
+                # Delete old results
+                deleted = self._delete_in_batches(
+                    DQResult,
+                    None,  # No additional condition
+                    DQResult.executed_at,
+                    "dq_results",
+                )
             self.stats["dq_results_deleted"] = deleted
             return deleted
 
@@ -217,12 +252,14 @@ class RetentionCleanup:
         )
 
         try:
-            deleted = self._delete_in_batches(
-                SyncRun,
-                None,
-                SyncRun.started_at,
-                "sync_runs",
-            )
+            deleted = self._cleanup_partitioned("sync_runs")
+            if deleted is None:
+                deleted = self._delete_in_batches(
+                    SyncRun,
+                    None,
+                    SyncRun.started_at,
+                    "sync_runs",
+                )
             self.stats["sync_runs_deleted"] = deleted
             return deleted
 
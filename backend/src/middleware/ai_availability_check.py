@@ -40,11 +40,9 @@ from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from src.models.data_availability import AvailabilityState
-from src.services.data_availability_service import (
-    DataAvailabilityResult,
-    DataAvailabilityService,
-)
+from src.services.data_availability_service import DataAvailabilityResult
 from src.services.freshness_service import FreshnessService, FreshnessGateResult
+from src.services.tenant_health_snapshot import snapshot_availability_results
 
 logger = logging.getLogger(__name__)
 
@@ -124,7 +122,8 @@ class AIAvailabilityCheck:
     and FreshnessService freshness gate.
 
     Decision matrix:
-    1. Evaluate DataAvailabilityService for the requested sources.
+    1. Read DataAvailability state for the requested sources from the
+       tenant health snapshot.
     2. If **any** source is UNAVAILABLE -> AI DISABLED.
     3. If **any** source is STALE -> AI DISABLED (stale data produces
        unreliable insights).
@@ -172,21 +171,14 @@ class AIAvailabilityCheck:
         """
         now = datetime.now(timezone.utc)
 
-        # Step 1: Evaluate DataAvailability state machine.
-        availability_service = DataAvailabilityService(
-            db_session=self.db,
+        # Step 1: DataAvailability state from the tenant health snapshot.
+        results = snapshot_availability_results(
+            self.db,
             tenant_id=self.tenant_id,
             billing_tier=self.billing_tier,
+            source_types=required_sources,
         )
 
-        if required_sources:
-            results = [
-                availability_service.get_data_availability(st)
-                for st in required_sources
-            ]
-        else:
-            results = availability_service.evaluate_all()
-
         # Build state map for the response.
         availability_states: Dict[str, str] = {
             r.source_type: r.state for r in results
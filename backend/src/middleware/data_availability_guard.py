@@ -49,9 +49,9 @@ from sqlalchemy.orm import Session
 from src.models.data_availability import AvailabilityState
 from src.services.data_availability_service import (
     DataAvailabilityResult,
-    DataAvailabilityService,
     resolve_sla_key,
 )
+from src.services.tenant_health_snapshot import snapshot_availability_results
 from src.database.session import get_db_session
 from src.platform.tenant_context import get_tenant_context
 
@@ -148,15 +148,15 @@ def check_data_availability(
     Evaluate data availability for the current tenant and attach the result
     to ``request.state.data_availability``.
 
-    When *source_types* is ``None``, all enabled sources for the tenant are
-    evaluated.
+    Reads the precomputed tenant health snapshot rather than re-evaluating
+    each source. When *source_types* is ``None``, all enabled sources for
+    the tenant are included.
 
     Args:
         request:      The incoming FastAPI request (must have tenant context
                       and a database session on ``request.state``).
         source_types: Optional list of SLA source keys to evaluate.  When
-                      ``None``, :meth:`DataAvailabilityService.evaluate_all`
-                      is used instead.
+                      ``None``, every source in the snapshot is used.
 
     Returns:
         :class:`DataAvailabilityCheckResult` summarising the evaluation.
@@ -178,17 +178,13 @@ def check_data_availability(
         request.state.data_availability = result
         return result
 
-    service = DataAvailabilityService(
-        db_session=db_session,
+    results = snapshot_availability_results(
+        db_session,
         tenant_id=tenant_ctx.tenant_id,
         billing_tier=tenant_ctx.billing_tier,
+        source_types=source_types,
     )
 
-    if source_types:
-        results = [service.get_data_availability(st) for st in source_types]
-    else:
-        results = service.evaluate_all()
-
     unavailable: List[str] = []
     stale: List[str] = []
     fresh: List[str] = []
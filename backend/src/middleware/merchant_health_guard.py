@@ -77,14 +77,17 @@ def _evaluate_merchant_health(
     request: Request,
 ) -> "MerchantDataHealthResult":
     """
-    Evaluate merchant health and cache on request.state.
+    Read merchant health from the tenant health snapshot and cache it on
+    request.state.
 
     Returns the cached result if already evaluated for this request.
+    Falls back to a direct evaluation if the snapshot cannot be read.
     """
     from src.services.merchant_data_health import (
         MerchantDataHealthResult,
         MerchantDataHealthService,
     )
+    from src.services.tenant_health_snapshot import TenantHealthSnapshotService
 
     cached = getattr(request.state, "merchant_health", None)
     if cached is not None:
@@ -114,12 +117,22 @@ def _evaluate_merchant_health(
         request.state.merchant_health = result
         return result
 
-    service = MerchantDataHealthService(
-        db_session=db_session,
-        tenant_id=tenant_ctx.tenant_id,
-        billing_tier=getattr(tenant_ctx, "billing_tier", "free"),
-    )
-    result = service.evaluate()
+    billing_tier = getattr(tenant_ctx, "billing_tier", "free")
+    try:
+        result = TenantHealthSnapshotService(db_session).get(
+            tenant_ctx.tenant_id, billing_tier=billing_tier,
+        ).merchant_result()
+    except Exception:
+        logger.warning(
+            "Tenant health snapshot unavailable; evaluating directly",
+            extra={"tenant_id": tenant_ctx.tenant_id},
+            exc_info=True,
+        )
+        result = MerchantDataHealthService(
+            db_session=db_session,
+            tenant_id=tenant_ctx.tenant_id,
+            billing_tier=billing_tier,
+        ).evaluate()
     request.state.merchant_health = result
     return result
 
@@ -35,10 +35,8 @@ from typing import Dict, List, Optional
 from sqlalchemy.orm import Session
 
 from src.models.data_availability import AvailabilityState
-from src.services.data_availability_service import (
-    DataAvailabilityResult,
-    DataAvailabilityService,
-)
+from src.services.data_availability_service import DataAvailabilityResult
+from src.services.tenant_health_snapshot import snapshot_availability_results
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +118,7 @@ class SupersetAvailabilityHook:
     """
     Backend service that Superset calls before executing queries.
 
-    Evaluates the DataAvailabilityService state machine for the tenant and
+    Reads the tenant health snapshot (DataAvailability states) and
     returns a :class:`QueryAccessResult` indicating whether the query may
     proceed, must be blocked, or should carry a warning.
 
@@ -152,8 +150,8 @@ class SupersetAvailabilityHook:
         Check whether a Superset query may execute.
 
         Evaluation rules:
-        1. Evaluate all enabled sources for the tenant (or just
-           *required_sources* when provided).
+        1. Read all enabled sources for the tenant (or just
+           *required_sources* when provided) from the health snapshot.
         2. If **any** source is UNAVAILABLE -> BLOCKED.
         3. If **any** source is STALE -> ALLOWED with warning.
         4. Otherwise -> ALLOWED.
@@ -170,19 +168,13 @@ class SupersetAvailabilityHook:
         """
         now = datetime.now(timezone.utc)
 
-        service = DataAvailabilityService(
-            db_session=self.db,
+        results = snapshot_availability_results(
+            self.db,
             tenant_id=tenant_id,
             billing_tier=self.billing_tier,
+            source_types=required_sources,
         )
 
-        if required_sources:
-            results = [
-                service.get_data_availability(st) for st in required_sources
-            ]
-        else:
-            results = service.evaluate_all()
-
         unavailable_sources: List[str] = []
         stale_sources: List[str] = []
 
@@ -79,6 +79,7 @@ from src.models.llm_routing import (
     LLMPromptTemplate,
     LLMUsageLog,
     LLMResponseStatus,
+    LLMCacheStatus,
 )
 from src.models.changelog_entry import (
     ChangelogEntry,
@@ -104,6 +105,13 @@ from src.models.data_availability import (
     AvailabilityState,
     AvailabilityReason,
 )
+from src.models.tenant_health_snapshot import TenantHealthSnapshot
+from src.models.tenant_group import TenantGroup, TenantGroupMember
+from src.models.webhook_inbox import (
+    WebhookInboxEvent,
+    WebhookInboxStatus,
+    WebhookSource,
+)
 from src.models.dataset_version import (
     DatasetVersion,
     DatasetVersionStatus,
@@ -227,6 +235,7 @@ __all__ = [
     "LLMPromptTemplate",
     "LLMUsageLog",
     "LLMResponseStatus",
+    "LLMCacheStatus",
     # Changelog models (Story 9.7)
     "ChangelogEntry",
     "ReleaseType",
@@ -242,6 +251,12 @@ __all__ = [
     "DataAvailability",
     "AvailabilityState",
     "AvailabilityReason",
+    "TenantHealthSnapshot",
+    "TenantGroup",
+    "TenantGroupMember",
+    "WebhookInboxEvent",
+    "WebhookInboxStatus",
+    "WebhookSource",
     # Merchant Data Health (Story 4.3)
     "MerchantHealthState",
     "MerchantDataHealthResponse",
@@ -0,0 +1,72 @@
+"""
+GA audit log export job model.
+
+Exports larger than AuditExporterService.ASYNC_THRESHOLD are queued as a
+row here and produced by the audit export worker, which claims queued
+rows with SELECT ... FOR UPDATE SKIP LOCKED and streams the export into
+the export file store.
+
+SECURITY: tenant_id is ONLY extracted from JWT, never from client input.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Index,
+    Integer,
+    JSON,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.db_base import Base
+
+# Use JSON with PostgreSQL variant for JSONB - allows SQLite in tests
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+class AuditExportStatus(str, Enum):
+    """Lifecycle of a queued audit export."""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class GAAuditExport(Base):
+    """
+    A queued (async) GA audit log export.
+
+    filters holds the export() keyword filters (event_type, dashboard_id,
+    start_date, end_date as ISO strings). storage_key is the file store
+    key of the finished export.
+    """
+    __tablename__ = "ga_audit_exports"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    tenant_id = Column(String(255), nullable=False, index=True)
+    is_super_admin = Column(Boolean, nullable=False, default=False)
+    format = Column(String(20), nullable=False)
+    compress = Column(Boolean, nullable=False, default=False)
+    filters = Column(JSONType, nullable=False, default=dict)
+    status = Column(String(20), nullable=False, default=AuditExportStatus.QUEUED.value)
+    record_count = Column(Integer, nullable=True)
+    storage_key = Column(String(512), nullable=True)
+    error = Column(Text, nullable=True)
+    claimed_by = Column(String(255), nullable=True)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_ga_audit_exports_status_created", "status", "created_at"),
+    )
@@ -233,10 +233,10 @@ class GAAuditLog(Base):
     )
 
     __table_args__ = (
-        # Primary query: Recent logs by tenant
+        # Primary query: Recent logs by tenant (keyset-paginated on created_at, id)
         Index(
-            "ix_ga_audit_tenant_created",
-            "tenant_id", "created_at",
+            "ix_ga_audit_tenant_created_id",
+            "tenant_id", "created_at", "id",
             postgresql_using="btree",
         ),
         # Query by event type within tenant
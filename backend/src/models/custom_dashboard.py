@@ -149,6 +149,11 @@ class CustomDashboard(Base, TimestampMixin, TenantScopedMixin):
             "idx_custom_dashboards_tenant_status",
             "tenant_id", "status",
         ),
+        # Dashboard list, keyset-paginated on (updated_at, id)
+        Index(
+            "idx_custom_dashboards_tenant_updated_id",
+            "tenant_id", "updated_at", "id",
+        ),
         # Common query: list dashboards created by a user
         Index(
             "idx_custom_dashboards_tenant_created_by",
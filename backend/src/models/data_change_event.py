@@ -189,8 +189,8 @@ class DataChangeEvent(Base, TimestampMixin, TenantScopedMixin):
 
     __table_args__ = (
         Index(
-            "ix_data_change_events_tenant_occurred",
-            "tenant_id", "occurred_at"
+            "ix_data_change_events_tenant_occurred_id",
+            "tenant_id", "occurred_at", "id"
         ),
         Index(
             "ix_data_change_events_tenant_type",
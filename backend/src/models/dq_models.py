@@ -238,7 +238,8 @@ class DQIncident(Base, TenantScopedMixin, TimestampMixin):
     id = Column(String(255), primary_key=True, default=generate_uuid)
     connector_id = Column(String(255), nullable=False)
     check_id = Column(String(255), ForeignKey("dq_checks.id"), nullable=False)
-    result_id = Column(String(255), ForeignKey("dq_results.id"), nullable=True)
+    # Soft reference: dq_results is partitioned by month (migration 0063)
+    result_id = Column(String(255), nullable=True)
     run_id = Column(String(255), nullable=True)
     correlation_id = Column(String(255), nullable=True)
 
@@ -55,6 +55,13 @@ class LLMResponseStatus(str, enum.Enum):
     RATE_LIMITED = "rate_limited"
 
 
+class LLMCacheStatus(str, enum.Enum):
+    """Completion cache outcome for an LLM call."""
+    HIT = "hit"
+    COALESCED = "coalesced"
+    MISS = "miss"
+
+
 class LLMModelRegistry(Base, TimestampMixin):
     """
     Registry of available LLM models via OpenRouter.
@@ -353,6 +360,7 @@ class LLMUsageLog(Base):
     - Token usage and cost
     - Latency metrics
     - Fallback information
+    - Completion cache outcome and tokens saved
     - Error details if applicable
 
     SECURITY:
@@ -459,6 +467,19 @@ class LLMUsageLog(Base):
         comment="Error message if status is not success"
     )
 
+    cache_status = Column(
+        String(20),
+        nullable=True,
+        comment="Completion cache outcome: hit, coalesced, miss (NULL if bypassed)"
+    )
+
+    saved_tokens = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Tokens not spent because the completion was served from cache"
+    )
+
     created_at = Column(
         DateTime(timezone=True),
         nullable=False,
@@ -126,6 +126,10 @@ class Notification(Base, TimestampMixin, TenantScopedMixin):
     __table_args__ = (
         Index("ix_notifications_tenant_user_status", "tenant_id", "user_id", "status"),
         Index("ix_notifications_entity", "tenant_id", "entity_type", "entity_id"),
+        Index(
+            "ix_notifications_tenant_user_created_id",
+            "tenant_id", "user_id", "created_at", "id",
+        ),
     )
 
     def __repr__(self) -> str:
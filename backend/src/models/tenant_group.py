@@ -0,0 +1,54 @@
+"""
+Tenant group models.
+
+A tenant group is a set of tenant ids an agency user may see in embedded
+analytics. Embed JWTs carry the group id instead of the full
+allowed_tenants list, and Superset RLS resolves it server-side with
+tenant_id = ANY(group_members(group_id)).
+
+Group ids are derived from the sorted member list, so a group's
+membership never changes: a different tenant set is a different group,
+and cached dashboard results are shared by every user with the same set.
+"""
+
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String
+
+from src.db_base import Base
+
+
+class TenantGroup(Base):
+    """An immutable set of tenants, identified by a hash of its members."""
+
+    __tablename__ = "tenant_groups"
+
+    group_id = Column(String(64), primary_key=True)
+    member_count = Column(Integer, nullable=False)
+    created_at = Column(
+        DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TenantGroup(group_id={self.group_id}, members={self.member_count})>"
+
+
+class TenantGroupMember(Base):
+    """Membership of one tenant in a tenant group."""
+
+    __tablename__ = "tenant_group_members"
+
+    group_id = Column(
+        String(64),
+        ForeignKey("tenant_groups.group_id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    tenant_id = Column(String(255), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_tenant_group_members_tenant", "tenant_id"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<TenantGroupMember(group_id={self.group_id}, tenant_id={self.tenant_id})>"
@@ -0,0 +1,97 @@
+"""
+Materialized per-tenant data health snapshot.
+
+One row per tenant holding the merchant health state, the availability and
+quality aggregates it was derived from, and the per-source availability
+results. Guards and health endpoints read this row (through the Redis cache
+in src.services.tenant_health_snapshot) instead of re-evaluating freshness
+from TenantAirbyteConnection rows on every request.
+
+Rows are recomputed when a sync completes or fails, when a DQ incident
+opens or resolves, and by the periodic sweep once refresh_due_at passes
+(the next time a source crosses an SLA threshold on its own).
+
+SECURITY: All rows are tenant-scoped via tenant_id from JWT.
+"""
+
+from sqlalchemy import Column, String, DateTime, JSON, Index
+
+from src.db_base import Base
+from src.models.base import TimestampMixin, TenantScopedMixin, generate_uuid
+
+
+class TenantHealthSnapshot(Base, TenantScopedMixin, TimestampMixin):
+    """
+    Latest computed data health for one tenant.
+
+    Written by TenantHealthSnapshotService.refresh(); never written directly.
+
+    SECURITY: tenant_id is from JWT only.
+    """
+    __tablename__ = "tenant_health_snapshots"
+
+    id = Column(
+        String(255),
+        primary_key=True,
+        default=generate_uuid,
+        comment="Primary key (UUID)"
+    )
+    merchant_state = Column(
+        String(20),
+        nullable=False,
+        comment="Merchant health state: healthy, delayed, unavailable"
+    )
+    availability_state = Column(
+        String(20),
+        nullable=False,
+        comment="Worst-case availability across sources: fresh, stale, unavailable"
+    )
+    quality_state = Column(
+        String(20),
+        nullable=False,
+        comment="Aggregate data quality state: pass, warn, fail"
+    )
+    sources = Column(
+        JSON,
+        nullable=False,
+        default=list,
+        comment="Per-source availability results (DataAvailabilityResult.to_dict)"
+    )
+    billing_tier = Column(
+        String(50),
+        nullable=False,
+        default="free",
+        comment="Billing tier used for SLA lookup"
+    )
+    trigger = Column(
+        String(50),
+        nullable=True,
+        comment="What caused the last recompute (sync_completed, dq_incident, sweep, ...)"
+    )
+    computed_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="Timestamp of the evaluation that produced this snapshot"
+    )
+    refresh_due_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        comment="When time alone can change the state; picked up by the sweep"
+    )
+
+    __table_args__ = (
+        Index(
+            "ix_tenant_health_snapshots_tenant",
+            "tenant_id",
+            unique=True,
+        ),
+        Index("ix_tenant_health_snapshots_refresh_due", "refresh_due_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<TenantHealthSnapshot("
+            f"tenant_id={self.tenant_id}, "
+            f"merchant_state={self.merchant_state}"
+            f")>"
+        )
@@ -0,0 +1,89 @@
+"""
+Webhook inbox model.
+
+Verified Shopify and Clerk webhooks are written here as soon as their
+signature checks out and acknowledged immediately; the webhook inbox
+worker processes them afterwards. The raw payload is never modified -
+only the delivery bookkeeping columns change.
+
+Rows are unique per (source, event_id), so redeliveries of the same
+webhook are dropped at insert time.
+"""
+
+import uuid
+from datetime import datetime, timezone
+from enum import Enum
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text, UniqueConstraint
+
+from src.db_base import Base
+
+
+class WebhookSource(str, Enum):
+    """Provider that delivered the webhook."""
+    SHOPIFY = "shopify"
+    CLERK = "clerk"
+
+
+class WebhookInboxStatus(str, Enum):
+    """Processing state of an inbox event."""
+    PENDING = "pending"
+    PROCESSING = "processing"
+    RETRY = "retry"
+    PROCESSED = "processed"
+    DEAD = "dead"
+
+
+# Events that still hold their ordering key (later events for the key wait)
+OPEN_INBOX_STATUSES = (
+    WebhookInboxStatus.PENDING.value,
+    WebhookInboxStatus.PROCESSING.value,
+    WebhookInboxStatus.RETRY.value,
+)
+
+
+class WebhookInboxEvent(Base):
+    """
+    A received webhook awaiting (or done with) asynchronous processing.
+
+    ordering_key groups events that must be applied in arrival order
+    (shop domain for Shopify, organization/user id for Clerk); only the
+    oldest open event per key is ever claimable.
+    """
+
+    __tablename__ = "webhook_inbox_events"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    source = Column(String(20), nullable=False)
+    event_id = Column(String(255), nullable=False)
+    topic = Column(String(255), nullable=False)
+    ordering_key = Column(String(255), nullable=False)
+    payload = Column(Text, nullable=False)
+
+    status = Column(String(20), nullable=False, default=WebhookInboxStatus.PENDING.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    last_error = Column(Text, nullable=True)
+    claimed_by = Column(String(255), nullable=True)
+
+    received_at = Column(
+        DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    next_attempt_at = Column(
+        DateTime(timezone=True), nullable=False,
+        default=lambda: datetime.now(timezone.utc),
+    )
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    processed_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("source", "event_id", name="uq_webhook_inbox_source_event"),
+        Index("ix_webhook_inbox_status_next_attempt", "status", "next_attempt_at"),
+        Index("ix_webhook_inbox_ordering", "source", "ordering_key", "received_at"),
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<WebhookInboxEvent(id={self.id}, source={self.source}, "
+            f"topic={self.topic}, status={self.status})>"
+        )
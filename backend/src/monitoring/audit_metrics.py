@@ -24,6 +24,8 @@ class AuditMetrics:
     - audit_event_recorded: Successful audit event write
     - audit_event_failed: Failed audit event write (used fallback)
     - audit_retention_deleted: Records deleted by retention job
+    - audit_batch_flushed: Batch written by the background audit writer
+    - audit_queue_overflow: Event diverted to fallback because the writer queue was full
     """
 
     _instance: Optional["AuditMetrics"] = None
@@ -85,6 +87,43 @@ class AuditMetrics:
         )
 
 
+    def record_batch_flush(
+        self,
+        batch_size: int,
+        flush_latency_ms: float,
+        max_queue_latency_ms: float,
+        queue_depth: int,
+        failed: int = 0,
+    ) -> None:
+        """Record a group-committed batch from the background audit writer."""
+        metrics_logger.info(
+            "audit_batch_flushed",
+            extra={
+                "metric": "audit_batch_flushed",
+                "batch_size": batch_size,
+                "flush_latency_ms": round(flush_latency_ms, 2),
+                "max_queue_latency_ms": round(max_queue_latency_ms, 2),
+                "queue_depth": queue_depth,
+                "failed": failed,
+            }
+        )
+
+    def record_queue_overflow(
+        self,
+        tenant_id: str,
+        queue_depth: int,
+    ) -> None:
+        """Record an event diverted to the fallback log by a full writer queue."""
+        metrics_logger.warning(
+            "audit_queue_overflow",
+            extra={
+                "metric": "audit_queue_overflow",
+                "tenant_id": tenant_id,
+                "queue_depth": queue_depth,
+            }
+        )
+
+
 def get_audit_metrics() -> AuditMetrics:
     """Get the audit metrics singleton."""
     return AuditMetrics.get_instance()
@@ -0,0 +1,67 @@
+"""
+In-process cache metrics for monitoring.
+
+Emits one structured log event per named TTLCache (entitlements memory
+fallback, chart preview, tenant-resolution LRU front) with its size and
+hit/miss/eviction/expiration counters, for dashboards and alerting on
+hit ratio and eviction churn.
+
+Environment variables:
+    CACHE_METRICS_INTERVAL_SECONDS: Emit interval for the background
+        reporter started in the app lifespan (default 60, 0 disables)
+"""
+
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from src.platform.ttl_cache import CacheStats, get_cache_stats
+
+logger = logging.getLogger(__name__)
+
+# Dedicated metrics logger for easy filtering
+metrics_logger = logging.getLogger("cache.metrics")
+
+CACHE_METRICS_INTERVAL_SECONDS = int(os.getenv("CACHE_METRICS_INTERVAL_SECONDS", "60"))
+
+
+class CacheMetrics:
+    """
+    Emits in-process cache counters via structured logging.
+
+    Metrics emitted:
+    - cache_stats: Size and cumulative counters for one named cache
+    """
+
+    _instance: Optional["CacheMetrics"] = None
+
+    @classmethod
+    def get_instance(cls) -> "CacheMetrics":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def record_stats(self, stats: CacheStats) -> None:
+        """Record a snapshot of one cache's counters."""
+        metrics_logger.info(
+            "cache_stats",
+            extra={"metric": "cache_stats", **stats.to_dict()},
+        )
+
+    def emit_all(self) -> list[CacheStats]:
+        """Record every registered cache. Returns the snapshots."""
+        snapshots = get_cache_stats()
+        for stats in snapshots:
+            self.record_stats(stats)
+        return snapshots
+
+    async def run_periodic(self, interval_seconds: int = CACHE_METRICS_INTERVAL_SECONDS) -> None:
+        """Emit all cache stats every interval_seconds until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                self.emit_all()
+            except Exception:
+                logger.exception("Failed to emit cache metrics")
@@ -0,0 +1,116 @@
+"""
+Webhook inbox metrics for monitoring.
+
+Emits structured log events that can be picked up by log aggregators
+(Datadog, Splunk, CloudWatch, etc.) for dashboards and alerting on
+webhook ingestion lag.
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Dedicated metrics logger for easy filtering
+metrics_logger = logging.getLogger("webhook.metrics")
+
+
+class WebhookInboxMetrics:
+    """
+    Collects and emits webhook inbox metrics via structured logging.
+
+    Metrics emitted:
+    - webhook_inbox_received: Webhook written to the inbox (or dropped as duplicate)
+    - webhook_inbox_processed: Event processed; lag_ms is receipt-to-completion
+    - webhook_inbox_retry: Event failed and was rescheduled
+    - webhook_inbox_dead: Event gave up after max attempts or a non-retryable error
+    - webhook_inbox_lag: Periodic gauge of open events and the oldest one's age
+    """
+
+    _instance: Optional["WebhookInboxMetrics"] = None
+
+    @classmethod
+    def get_instance(cls) -> "WebhookInboxMetrics":
+        """Get singleton instance."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def record_received(self, source: str, topic: str, duplicate: bool) -> None:
+        """Record a verified webhook accepted into the inbox."""
+        metrics_logger.info(
+            "webhook_inbox_received",
+            extra={
+                "metric": "webhook_inbox_received",
+                "source": source,
+                "topic": topic,
+                "duplicate": duplicate,
+            }
+        )
+
+    def record_processed(
+        self,
+        source: str,
+        topic: str,
+        attempts: int,
+        lag_ms: float,
+    ) -> None:
+        """Record an event processed successfully."""
+        metrics_logger.info(
+            "webhook_inbox_processed",
+            extra={
+                "metric": "webhook_inbox_processed",
+                "source": source,
+                "topic": topic,
+                "attempts": attempts,
+                "lag_ms": round(lag_ms, 2),
+            }
+        )
+
+    def record_retry(
+        self,
+        source: str,
+        topic: str,
+        attempts: int,
+        delay_seconds: float,
+    ) -> None:
+        """Record a failed event rescheduled for another attempt."""
+        metrics_logger.warning(
+            "webhook_inbox_retry",
+            extra={
+                "metric": "webhook_inbox_retry",
+                "source": source,
+                "topic": topic,
+                "attempts": attempts,
+                "delay_seconds": round(delay_seconds, 2),
+            }
+        )
+
+    def record_dead(self, source: str, topic: str, attempts: int, error: str) -> None:
+        """Record an event moved to the dead state."""
+        metrics_logger.error(
+            "webhook_inbox_dead",
+            extra={
+                "metric": "webhook_inbox_dead",
+                "source": source,
+                "topic": topic,
+                "attempts": attempts,
+                "error": error,
+            }
+        )
+
+    def record_lag(self, open_events: int, oldest_age_seconds: float) -> None:
+        """Record the inbox backlog gauge."""
+        metrics_logger.info(
+            "webhook_inbox_lag",
+            extra={
+                "metric": "webhook_inbox_lag",
+                "open_events": open_events,
+                "oldest_age_seconds": round(oldest_age_seconds, 2),
+            }
+        )
+
+
+def get_webhook_metrics() -> WebhookInboxMetrics:
+    """Get the webhook inbox metrics singleton."""
+    return WebhookInboxMetrics.get_instance()
@@ -40,6 +40,7 @@ JSONType = JSON().with_variant(JSONB(), "postgresql")
 from sqlalchemy.orm import Session
 
 from src.db_base import Base
+from src.platform.pagination import CountMode, count_rows, estimate_count, paginate
 from src.monitoring.audit_metrics import get_audit_metrics
 from src.monitoring.audit_alerts import get_audit_alert_manager
 
@@ -418,7 +419,7 @@ class AuditLog(Base):
     error_code = Column(String(50), nullable=True)
 
     __table_args__ = (
-        Index("ix_audit_logs_tenant_timestamp", "tenant_id", "timestamp"),
+        Index("ix_audit_logs_tenant_timestamp_id", "tenant_id", "timestamp", "id"),
         Index("ix_audit_logs_tenant_action", "tenant_id", "action"),
         Index("ix_audit_logs_event_type", "event_type"),
         Index("ix_audit_logs_tenant_user", "tenant_id", "user_id"),
@@ -523,15 +524,28 @@ def write_audit_log_sync(
     CRITICAL: This is an append-only operation. Events cannot be modified or deleted.
     On failure, writes to fallback logger and returns None (never crashes request flow).
 
+    When the background audit writer is running and db has no other
+    uncommitted work, the event is queued for a group-committed batch
+    instead of committing db (see src.platform.audit_writer).
+
     Args:
         db: SQLAlchemy Session
         event: The audit event to write
 
     Returns:
-        The created AuditLog record, or None if fallback was used
+        The created AuditLog record (transient when queued), or None if
+        fallback was used
 
     Story 10.1 - Audit Event Schema & Logging Foundation
     """
+    from src.platform.audit_writer import get_audit_writer, session_has_uncommitted_work
+
+    writer = get_audit_writer()
+    if writer.running and not session_has_uncommitted_work(db):
+        queued_id = writer.submit(event)
+        if queued_id is not None:
+            return AuditLog(id=queued_id, **event.to_dict())
+
     audit_id = str(uuid.uuid4())
     try:
         audit_log = AuditLog(
@@ -1656,6 +1670,7 @@ class AuditExportRequest:
     user_id: Optional[str] = None
     limit: int = 10000
     offset: int = 0
+    cursor: Optional[str] = None
 
 
 @dataclass
@@ -1736,6 +1751,29 @@ class AuditExportService:
             self._export_counts[tenant_id] = []
         self._export_counts[tenant_id].append(datetime.now(timezone.utc))
 
+    def _filtered_audit_logs(
+        self,
+        tenant_id: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        actions: Optional[list[AuditAction]] = None,
+        user_id: Optional[str] = None,
+    ):
+        """Unordered query for the tenant's audit logs matching filters."""
+        query = self.db.query(AuditLog).filter(AuditLog.tenant_id == tenant_id)
+
+        if start_date:
+            query = query.filter(AuditLog.timestamp >= start_date)
+        if end_date:
+            query = query.filter(AuditLog.timestamp <= end_date)
+        if actions:
+            action_values = [a.value for a in actions]
+            query = query.filter(AuditLog.action.in_(action_values))
+        if user_id:
+            query = query.filter(AuditLog.user_id == user_id)
+
+        return query
+
     def query_audit_logs(
         self,
         tenant_id: str,
@@ -1745,9 +1783,10 @@ class AuditExportService:
         user_id: Optional[str] = None,
         limit: int = 10000,
         offset: int = 0,
+        cursor: Optional[str] = None,
     ) -> list[AuditLog]:
         """
-        Query audit logs with filters.
+        Query audit logs with filters, newest first.
 
         Args:
             tenant_id: Required tenant ID
@@ -1756,27 +1795,29 @@ class AuditExportService:
             actions: Optional list of actions to filter
             user_id: Optional user ID filter
             limit: Maximum records to return
-            offset: Offset for pagination
+            offset: Offset for pagination (ignored when cursor is given)
+            cursor: Keyset cursor over (timestamp, id); see
+                src.platform.pagination
 
         Returns:
             List of AuditLog records
-        """
-        query = self.db.query(AuditLog).filter(AuditLog.tenant_id == tenant_id)
-
-        if start_date:
-            query = query.filter(AuditLog.timestamp >= start_date)
-        if end_date:
-            query = query.filter(AuditLog.timestamp <= end_date)
-        if actions:
-            action_values = [a.value for a in actions]
-            query = query.filter(AuditLog.action.in_(action_values))
-        if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
-
-        query = query.order_by(AuditLog.timestamp.desc())
-        query = query.offset(offset).limit(limit)
 
-        return query.all()
+        Raises:
+            InvalidCursorError: cursor cannot be decoded
+        """
+        query = self._filtered_audit_logs(
+            tenant_id, start_date, end_date, actions, user_id,
+        )
+        page = paginate(
+            query,
+            sort_column=AuditLog.timestamp,
+            id_column=AuditLog.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            count=CountMode.NONE,
+        )
+        return page.items
 
     def count_audit_logs(
         self,
@@ -1785,25 +1826,18 @@ class AuditExportService:
         end_date: Optional[datetime] = None,
         actions: Optional[list[AuditAction]] = None,
         user_id: Optional[str] = None,
+        max_count: Optional[int] = None,
     ) -> int:
-        """Count audit logs matching filters."""
-        from sqlalchemy import func
+        """
+        Count audit logs matching filters.
 
-        query = self.db.query(func.count(AuditLog.id)).filter(
-            AuditLog.tenant_id == tenant_id
+        With max_count, stops after max_count rows (enough to tell whether a
+        threshold is exceeded without scanning the tenant's full history).
+        """
+        query = self._filtered_audit_logs(
+            tenant_id, start_date, end_date, actions, user_id,
         )
-
-        if start_date:
-            query = query.filter(AuditLog.timestamp >= start_date)
-        if end_date:
-            query = query.filter(AuditLog.timestamp <= end_date)
-        if actions:
-            action_values = [a.value for a in actions]
-            query = query.filter(AuditLog.action.in_(action_values))
-        if user_id:
-            query = query.filter(AuditLog.user_id == user_id)
-
-        return query.scalar() or 0
+        return count_rows(query, limit=max_count)
 
     def format_csv(self, logs: list[AuditLog]) -> str:
         """
@@ -1926,17 +1960,27 @@ class AuditExportService:
             )
 
         try:
-            # Count total records
+            # Count only as far as the async threshold
             total_count = self.count_audit_logs(
                 tenant_id=request.tenant_id,
                 start_date=request.start_date,
                 end_date=request.end_date,
                 actions=request.actions,
                 user_id=request.user_id,
+                max_count=self.ASYNC_THRESHOLD_ROWS + 1,
             )
 
             # Check if async export is needed
             if total_count > self.ASYNC_THRESHOLD_ROWS:
+                # Report the planner's size estimate rather than counting
+                # the full history
+                total_count, _ = estimate_count(self._filtered_audit_logs(
+                    request.tenant_id,
+                    request.start_date,
+                    request.end_date,
+                    request.actions,
+                    request.user_id,
+                ))
                 # Log async export request
                 log_system_audit_event_sync(
                     db=self.db,
@@ -1983,6 +2027,7 @@ class AuditExportService:
                 user_id=request.user_id,
                 limit=request.limit,
                 offset=request.offset,
+                cursor=request.cursor,
             )
 
             # Format output
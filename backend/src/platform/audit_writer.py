@@ -0,0 +1,315 @@
+"""
+Background batched audit log writer.
+
+write_audit_log_sync used to db.add + db.commit() every event on the
+caller's session, putting a full commit round-trip on the request path.
+When the writer is running, events whose caller session has nothing else
+to commit are queued instead and a background thread group-commits them:
+one multi-row INSERT ... VALUES and one COMMIT per batch, on its own
+session.
+
+Guarantees:
+- Append-only: the writer only ever INSERTs; audit IDs are assigned at
+  enqueue time so callers can reference them immediately
+- PII is redacted at enqueue time (AuditEvent.to_dict), so later mutation
+  of the caller's metadata dict cannot leak into the row
+- Backpressure: a full queue blocks the producer for at most
+  AUDIT_WRITER_ENQUEUE_TIMEOUT_MS, then the event overflows to the
+  audit fallback logger (never dropped silently)
+- A failed batch is retried row by row; rows that still fail go to the
+  fallback logger
+- drain() on shutdown flushes everything queued (main.py lifespan)
+
+Sessions with pending or flushed-but-uncommitted changes keep the old
+inline write: their callers rely on the audit commit to commit their own
+work as well.
+
+Environment variables:
+    AUDIT_WRITER_ENABLED: Set to "false" to always write inline (default true)
+    AUDIT_WRITER_QUEUE_SIZE: Queue capacity (default 10000)
+    AUDIT_WRITER_BATCH_SIZE: Max events per INSERT/COMMIT (default 500)
+    AUDIT_WRITER_FLUSH_INTERVAL_MS: Max time an event waits for a batch (default 200)
+    AUDIT_WRITER_ENQUEUE_TIMEOUT_MS: Max producer block on a full queue (default 50)
+    AUDIT_WRITER_DRAIN_TIMEOUT_SECONDS: Shutdown drain budget (default 10)
+"""
+
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from src.monitoring.audit_metrics import get_audit_metrics
+from src.platform.audit import (
+    AuditEvent,
+    AuditLog,
+    _write_fallback_log,
+)
+
+logger = logging.getLogger(__name__)
+
+AUDIT_WRITER_ENABLED = os.getenv("AUDIT_WRITER_ENABLED", "true").lower() == "true"
+AUDIT_WRITER_QUEUE_SIZE = int(os.getenv("AUDIT_WRITER_QUEUE_SIZE", "10000"))
+AUDIT_WRITER_BATCH_SIZE = int(os.getenv("AUDIT_WRITER_BATCH_SIZE", "500"))
+AUDIT_WRITER_FLUSH_INTERVAL_MS = int(os.getenv("AUDIT_WRITER_FLUSH_INTERVAL_MS", "200"))
+AUDIT_WRITER_ENQUEUE_TIMEOUT_MS = int(os.getenv("AUDIT_WRITER_ENQUEUE_TIMEOUT_MS", "50"))
+AUDIT_WRITER_DRAIN_TIMEOUT_SECONDS = float(os.getenv("AUDIT_WRITER_DRAIN_TIMEOUT_SECONDS", "10"))
+
+# session.info flag: the session flushed changes that are not committed yet
+_FLUSHED_KEY = "audit_writer_uncommitted_flush"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flushed(session: Session, flush_context) -> None:
+    session.info[_FLUSHED_KEY] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_flushed(session: Session, transaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_FLUSHED_KEY, None)
+
+
+def session_has_uncommitted_work(db: Optional[Session]) -> bool:
+    """
+    True if committing db would persist more than the audit row.
+
+    Anything that is not a real Session (e.g. test doubles) counts as
+    having work, so it keeps the inline write path.
+    """
+    if db is None:
+        return False
+    if not isinstance(db, Session):
+        return True
+    return bool(db.new or db.dirty or db.deleted or db.info.get(_FLUSHED_KEY))
+
+
+@dataclass
+class _QueuedAudit:
+    audit_id: str
+    event: AuditEvent
+    row: dict[str, Any]
+    enqueued_at: float
+
+
+class AuditWriter:
+    """
+    Bounded queue + background flusher for audit events.
+
+    Usage:
+        writer = get_audit_writer()
+        writer.start()                   # app startup
+        audit_id = writer.submit(event)  # None if not running
+        writer.drain()                   # app shutdown
+    """
+
+    def __init__(
+        self,
+        session_factory: Optional[Callable[[], Session]] = None,
+        queue_size: int = AUDIT_WRITER_QUEUE_SIZE,
+        batch_size: int = AUDIT_WRITER_BATCH_SIZE,
+        flush_interval_ms: int = AUDIT_WRITER_FLUSH_INTERVAL_MS,
+        enqueue_timeout_ms: int = AUDIT_WRITER_ENQUEUE_TIMEOUT_MS,
+    ):
+        self._session_factory = session_factory
+        self._queue: "queue.Queue[Optional[_QueuedAudit]]" = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._enqueue_timeout = enqueue_timeout_ms / 1000
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and not self._stopping.is_set()
+        )
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the flusher thread (idempotent)."""
+        if self.running:
+            return
+        if self._session_factory is None:
+            from src.database.session import get_session_factory
+            self._session_factory = get_session_factory()
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="audit-writer", daemon=True
+        )
+        self._thread.start()
+        logger.info(
+            "Audit writer started",
+            extra={"batch_size": self._batch_size, "queue_size": self._queue.maxsize},
+        )
+
+    def submit(self, audit_event: AuditEvent) -> Optional[str]:
+        """
+        Queue an event for the next batch.
+
+        Returns:
+            The assigned audit ID, or None if the writer is not running
+            (the caller should write inline). An event that overflows a
+            full queue is written to the fallback log and still returns
+            its ID.
+        """
+        if not self.running:
+            return None
+
+        audit_id = str(uuid.uuid4())
+        item = _QueuedAudit(
+            audit_id=audit_id,
+            event=audit_event,
+            row={"id": audit_id, **audit_event.to_dict()},
+            enqueued_at=time.monotonic(),
+        )
+        try:
+            self._queue.put(item, timeout=self._enqueue_timeout)
+        except queue.Full:
+            get_audit_metrics().record_queue_overflow(
+                tenant_id=audit_event.tenant_id,
+                queue_depth=self._queue.qsize(),
+            )
+            _write_fallback_log(audit_event, audit_id, "audit_queue_full")
+        return audit_id
+
+    def drain(self, timeout: float = AUDIT_WRITER_DRAIN_TIMEOUT_SECONDS) -> None:
+        """Stop accepting events and flush everything queued."""
+        if self._thread is None:
+            return
+        self._stopping.set()
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.error("Audit writer did not drain in time; remaining events use fallback")
+        self._thread = None
+
+        # Anything left (drain timed out) goes to the fallback log
+        leftover = self._take_nowait(self._queue.qsize())
+        for item in leftover:
+            _write_fallback_log(item.event, item.audit_id, "audit_writer_shutdown")
+
+    # ------------------------------------------------------------------
+    # Flusher thread
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=self._flush_interval)
+            except queue.Empty:
+                if self._stopping.is_set():
+                    return
+                continue
+
+            batch = [] if first is None else [first]
+            stop = first is None
+            deadline = time.monotonic() + self._flush_interval
+            while not stop and len(batch) < self._batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = (
+                        self._queue.get(timeout=remaining)
+                        if remaining > 0 else self._queue.get_nowait()
+                    )
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                else:
+                    batch.append(item)
+
+            if stop:
+                # Sentinel: flush whatever is still queued, then exit
+                batch.extend(self._take_nowait(self._queue.qsize()))
+            for start in range(0, len(batch), self._batch_size):
+                self._flush(batch[start:start + self._batch_size])
+            if stop:
+                return
+
+    def _take_nowait(self, limit: int) -> list[_QueuedAudit]:
+        items = []
+        for _ in range(limit):
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                items.append(item)
+        return items
+
+    def _flush(self, batch: list[_QueuedAudit]) -> None:
+        if not batch:
+            return
+        started = time.monotonic()
+        failed = 0
+        session = self._session_factory()
+        try:
+            try:
+                # Group commit: one multi-row INSERT, one COMMIT
+                session.execute(insert(AuditLog.__table__), [item.row for item in batch])
+                session.commit()
+                written = batch
+            except Exception as e:
+                session.rollback()
+                logger.warning(
+                    "Audit batch insert failed; retrying row by row",
+                    extra={"batch_size": len(batch), "error": str(e)},
+                )
+                written = []
+                for item in batch:
+                    try:
+                        session.execute(insert(AuditLog.__table__), [item.row])
+                        session.commit()
+                        written.append(item)
+                    except Exception as row_error:
+                        session.rollback()
+                        failed += 1
+                        _write_fallback_log(item.event, item.audit_id, str(row_error))
+        finally:
+            session.close()
+
+        metrics = get_audit_metrics()
+        for item in written:
+            metrics.record_event(
+                action=item.row["action"],
+                outcome=item.row["outcome"],
+                tenant_id=item.row["tenant_id"],
+                source=item.row["source"],
+            )
+        finished = time.monotonic()
+        metrics.record_batch_flush(
+            batch_size=len(batch),
+            flush_latency_ms=(finished - started) * 1000,
+            max_queue_latency_ms=(finished - min(i.enqueued_at for i in batch)) * 1000,
+            queue_depth=self._queue.qsize(),
+            failed=failed,
+        )
+
+
+_audit_writer: Optional[AuditWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_audit_writer() -> AuditWriter:
+    """Get the process-wide audit writer (not started until start())."""
+    global _audit_writer
+    if _audit_writer is None:
+        with _writer_lock:
+            if _audit_writer is None:
+                _audit_writer = AuditWriter()
+    return _audit_writer
@@ -0,0 +1,244 @@
+"""
+Live event fan-out for the server-sent event stream.
+
+The frontend used to poll unread counts, pending approvals, What Changed
+status and sync progress on timers, each poll running the full
+auth/tenant/entitlement middleware stack plus COUNT queries. Instead,
+publishers call publish_live_event() when something changes:
+
+- NotificationService.notify                -> "notifications" (and "approvals")
+- JobRunner job state transitions           -> "sync"
+- DataChangeAggregator.record_*             -> "changes" (and "approvals")
+- Insight generation, insight read/dismiss   -> "insights"
+- ChangelogService.mark_*_as_read           -> "changelog" (current user)
+
+Events go out on one Redis pub/sub channel, so every API process sees
+them, and each process delivers them to its open /api/events/stream
+connections for the event's tenant (and user, for user-scoped events).
+Clients refetch only when an event arrives, so an idle dashboard issues
+no queries.
+
+Events published on a Session with an open transaction are held in
+session.info and sent after COMMIT (dropped on rollback): clients never
+refetch before the change is visible.
+
+Without Redis (local dev, single process) events are delivered to the
+local process only.
+
+Environment variables:
+    LIVE_EVENTS_QUEUE_SIZE: Buffered events per open stream (default 100)
+"""
+
+import asyncio
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from typing import Any, Dict, Iterator, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.entitlements.cache import RedisClient
+
+logger = logging.getLogger(__name__)
+
+LIVE_EVENTS_CHANNEL = "live:events"
+LIVE_EVENTS_QUEUE_SIZE = int(os.getenv("LIVE_EVENTS_QUEUE_SIZE", "100"))
+
+# session.info key for events waiting on COMMIT
+_PENDING_KEY = "live_events_pending"
+
+
+class LiveEventType(str, Enum):
+    """Topics pushed to the frontend."""
+    NOTIFICATIONS = "notifications"
+    APPROVALS = "approvals"
+    SYNC = "sync"
+    CHANGES = "changes"
+    INSIGHTS = "insights"
+    CHANGELOG = "changelog"
+
+
+@dataclass
+class LiveEvent:
+    """
+    One pushed event.
+
+    user_id scopes the event to one user's streams; None reaches every
+    stream of the tenant.
+    """
+    type: LiveEventType
+    tenant_id: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    user_id: Optional[str] = None
+
+    def to_json(self) -> str:
+        payload = asdict(self)
+        payload["type"] = self.type.value
+        return json.dumps(payload, default=str)
+
+    @classmethod
+    def from_json(cls, raw: str) -> "LiveEvent":
+        payload = json.loads(raw)
+        payload["type"] = LiveEventType(payload["type"])
+        return cls(**payload)
+
+    def to_sse(self) -> str:
+        """Server-sent event frame (event name = topic)."""
+        return f"event: {self.type.value}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+
+class _Subscriber:
+    """One open stream: a bounded queue on the event loop."""
+
+    def __init__(self, tenant_id: str, user_id: Optional[str], queue_size: int):
+        self.tenant_id = tenant_id
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[LiveEvent]" = asyncio.Queue(maxsize=queue_size)
+
+    def accepts(self, live_event: LiveEvent) -> bool:
+        return live_event.user_id is None or live_event.user_id == self.user_id
+
+    def put(self, live_event: LiveEvent) -> None:
+        if self.queue.full():
+            # Slow client: events are refetch hints, the oldest is redundant
+            self.queue.get_nowait()
+        self.queue.put_nowait(live_event)
+
+
+class LiveEventBroker:
+    """
+    Per-process registry of open streams, fed by the Redis channel.
+
+    Usage:
+        broker = get_live_event_broker()
+        with broker.subscription(tenant_id, user_id) as queue:
+            live_event = await queue.get()
+    """
+
+    def __init__(self, queue_size: int = LIVE_EVENTS_QUEUE_SIZE):
+        self._queue_size = queue_size
+        self._subscribers: Dict[str, Set[_Subscriber]] = {}
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._redis_subscribed = False
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return sum(len(subs) for subs in self._subscribers.values())
+
+    def start(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Bind to the serving event loop and subscribe to Redis (idempotent)."""
+        with self._lock:
+            self._loop = loop
+            if self._redis_subscribed:
+                return
+            self._redis_subscribed = RedisClient().subscribe(
+                LIVE_EVENTS_CHANNEL, self._on_redis_message
+            )
+
+    @contextmanager
+    def subscription(
+        self,
+        tenant_id: str,
+        user_id: Optional[str] = None,
+    ) -> Iterator["asyncio.Queue[LiveEvent]"]:
+        """Register a stream for the duration of the block (call on the loop)."""
+        self.start(asyncio.get_running_loop())
+        subscriber = _Subscriber(tenant_id, user_id, self._queue_size)
+        with self._lock:
+            self._subscribers.setdefault(tenant_id, set()).add(subscriber)
+        try:
+            yield subscriber.queue
+        finally:
+            with self._lock:
+                subs = self._subscribers.get(tenant_id)
+                if subs is not None:
+                    subs.discard(subscriber)
+                    if not subs:
+                        del self._subscribers[tenant_id]
+
+    def dispatch(self, live_event: LiveEvent) -> None:
+        """Deliver to local streams of the tenant (any thread)."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        with self._lock:
+            if live_event.tenant_id not in self._subscribers:
+                return
+        loop.call_soon_threadsafe(self._deliver, live_event)
+
+    def _deliver(self, live_event: LiveEvent) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(live_event.tenant_id, ()))
+        for subscriber in subscribers:
+            if subscriber.accepts(live_event):
+                subscriber.put(live_event)
+
+    def _on_redis_message(self, message: Dict[str, Any]) -> None:
+        try:
+            live_event = LiveEvent.from_json(message["data"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("Invalid live event message", extra={"error": str(e)})
+            return
+        self.dispatch(live_event)
+
+
+_broker: Optional[LiveEventBroker] = None
+_broker_lock = threading.Lock()
+
+
+def get_live_event_broker() -> LiveEventBroker:
+    """Get the process-wide live event broker."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = LiveEventBroker()
+    return _broker
+
+
+def _send(live_event: LiveEvent) -> None:
+    redis_client = RedisClient()
+    if redis_client.available:
+        # Every process, including this one, receives it via the channel
+        redis_client.publish(LIVE_EVENTS_CHANNEL, live_event.to_json())
+    else:
+        get_live_event_broker().dispatch(live_event)
+
+
+def publish_live_event(live_event: LiveEvent, db: Optional[Session] = None) -> None:
+    """
+    Publish an event to the tenant's open streams.
+
+    With a Session that has an open transaction, the event is sent after
+    that transaction commits and discarded if it rolls back. Never
+    raises: live events are hints, the polled endpoints stay the source
+    of truth.
+    """
+    if isinstance(db, Session) and db.in_transaction():
+        db.info.setdefault(_PENDING_KEY, []).append(live_event)
+        return
+    try:
+        _send(live_event)
+    except Exception as e:
+        logger.warning(
+            "Failed to publish live event",
+            extra={"tenant_id": live_event.tenant_id, "type": live_event.type.value, "error": str(e)},
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _send_pending(session: Session) -> None:
+    for live_event in session.info.pop(_PENDING_KEY, ()):
+        publish_live_event(live_event)
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
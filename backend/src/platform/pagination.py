@@ -0,0 +1,290 @@
+"""
+Keyset pagination and cheap totals for list endpoints.
+
+OFFSET/LIMIT makes the database walk and discard every skipped row, and an
+exact COUNT(*) per page scans every matching row; both grow with the
+tenant's history. paginate() instead:
+
+- pages with an opaque cursor over (sort column, id): the next page is
+  "rows strictly after the last one returned", which an index on
+  (tenant_id, <sort column>, id) serves directly at any depth
+- reports total according to CountMode: EXACT (COUNT(*)), ESTIMATED
+  (PostgreSQL planner row estimate, exact when the estimate is small) or
+  NONE (skip counting)
+
+offset is still accepted so existing clients keep working; a cursor wins
+when both are given.
+
+Usage:
+    page = paginate(
+        query,
+        sort_column=GAAuditLog.created_at,
+        id_column=GAAuditLog.id,
+        limit=50,
+        cursor=cursor,
+    )
+    page.items, page.next_cursor, page.total
+
+Environment variables:
+    PAGINATION_EXACT_COUNT_BELOW: ESTIMATED counts exactly when the planner
+        expects fewer rows than this (default 10000)
+"""
+
+import base64
+import binascii
+import json
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import and_, func, literal_column, or_, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+logger = logging.getLogger(__name__)
+
+PAGINATION_EXACT_COUNT_BELOW = int(os.getenv("PAGINATION_EXACT_COUNT_BELOW", "10000"))
+
+T = TypeVar("T")
+
+
+class CountMode(str, Enum):
+    """How a page reports the total number of matching rows."""
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of results."""
+    items: List[T]
+    total: Optional[int]
+    total_is_estimate: bool
+    has_more: bool
+    next_cursor: Optional[str]
+
+
+# ---------------------------------------------------------------------------
+# Cursors
+# ---------------------------------------------------------------------------
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """Opaque cursor for the row with (sort_value, row_id)."""
+    if isinstance(sort_value, datetime):
+        payload = ["t", sort_value.isoformat(), row_id]
+    else:
+        payload = ["v", sort_value, row_id]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _python_type(column) -> Optional[type]:
+    """The Python type column values load as, when SQLAlchemy knows it."""
+    try:
+        return column.type.python_type
+    except (AttributeError, NotImplementedError):
+        return None
+
+
+def _check_value(value: Any, column, what: str) -> None:
+    """Raise ValueError unless value can be compared with column."""
+    expected = _python_type(column)
+    if value is None:
+        raise ValueError(f"{what} is null")
+    if expected is None:
+        return
+    if expected is datetime:
+        if not isinstance(value, datetime):
+            raise ValueError(f"{what} is not a timestamp")
+    elif expected is float:
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ValueError(f"{what} is not a number")
+    elif (isinstance(value, bool) and expected is not bool) or not isinstance(value, expected):
+        raise ValueError(f"{what} is not a {expected.__name__}")
+
+
+def decode_cursor(
+    cursor: str,
+    sort_column=None,
+    id_column=None,
+) -> Tuple[Any, Any]:
+    """
+    Decode a cursor into (sort_value, row_id).
+
+    With sort_column / id_column, the decoded values must also match the
+    columns' types, so a tampered cursor is rejected here rather than
+    failing in the database.
+
+    Raises:
+        InvalidCursorError: Malformed or tampered cursor
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        kind, sort_value, row_id = json.loads(raw)
+        if kind == "t":
+            sort_value = datetime.fromisoformat(sort_value)
+        elif kind != "v":
+            raise ValueError(f"unknown cursor kind {kind!r}")
+        if sort_column is not None:
+            _check_value(sort_value, sort_column, "sort value")
+        if id_column is not None:
+            _check_value(row_id, id_column, "row id")
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid pagination cursor: {e}") from None
+    return sort_value, row_id
+
+
+# ---------------------------------------------------------------------------
+# Counting
+# ---------------------------------------------------------------------------
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) of a statement, executed like the statement."""
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _planner_row_estimate(query: Query) -> Optional[int]:
+    """PostgreSQL's row estimate for query (EXPLAIN, no execution)."""
+    session = query.session
+    # Compiled and executed through the session, so bind parameters (Enum,
+    # JSONB, expanding IN) go through their type's bind processing
+    explain = _Explain(query.order_by(None).statement)
+    try:
+        # Savepoint: a failed EXPLAIN must not abort the caller's transaction
+        with session.begin_nested():
+            plan = session.execute(explain).scalar()
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+    except Exception as e:
+        logger.debug("Planner row estimate unavailable", extra={"error": str(e)})
+        return None
+
+
+def count_rows(query: Query, limit: Optional[int] = None) -> int:
+    """
+    Exact COUNT(*) of query.
+
+    With limit, stops counting after limit rows: enough to answer "more than
+    N?" without scanning every match.
+    """
+    query = query.order_by(None)
+    if limit is None:
+        return query.count()
+    bounded = query.with_entities(literal_column("1")).limit(limit).subquery()
+    return query.session.execute(select(func.count()).select_from(bounded)).scalar() or 0
+
+
+def estimate_count(
+    query: Query,
+    exact_below: int = PAGINATION_EXACT_COUNT_BELOW,
+) -> Tuple[int, bool]:
+    """
+    Row count for query as (count, is_estimate).
+
+    Uses the PostgreSQL planner's estimate when it is at least exact_below;
+    otherwise (small results, other databases, no estimate) counts exactly.
+    """
+    bind = query.session.get_bind()
+    if bind.dialect.name == "postgresql":
+        estimate = _planner_row_estimate(query)
+        if estimate is not None and estimate >= exact_below:
+            return estimate, True
+    return query.order_by(None).count(), False
+
+
+# ---------------------------------------------------------------------------
+# Paging
+# ---------------------------------------------------------------------------
+
+def paginate(
+    query: Query,
+    *,
+    sort_column,
+    id_column,
+    limit: int,
+    cursor: Optional[str] = None,
+    offset: int = 0,
+    count: CountMode = CountMode.ESTIMATED,
+    descending: bool = True,
+) -> Page:
+    """
+    Fetch one page of query ordered by (sort_column, id_column).
+
+    Args:
+        query: Filtered query (no ORDER BY / LIMIT)
+        sort_column: Primary sort column (e.g. Model.created_at)
+        id_column: Unique tie-breaker (e.g. Model.id)
+        limit: Page size
+        cursor: next_cursor from the previous page
+        offset: Legacy offset, used only without a cursor
+        count: How to compute total
+        descending: Newest first (default)
+
+    Raises:
+        InvalidCursorError: cursor cannot be decoded
+    """
+    total: Optional[int] = None
+    total_is_estimate = False
+    if count == CountMode.EXACT:
+        total = query.order_by(None).count()
+    elif count == CountMode.ESTIMATED:
+        total, total_is_estimate = estimate_count(query)
+
+    page_query = query
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, sort_column, id_column)
+        if descending:
+            after = or_(
+                sort_column < sort_value,
+                and_(sort_column == sort_value, id_column < row_id),
+            )
+        else:
+            after = or_(
+                sort_column > sort_value,
+                and_(sort_column == sort_value, id_column > row_id),
+            )
+        page_query = page_query.filter(after)
+
+    if descending:
+        page_query = page_query.order_by(sort_column.desc(), id_column.desc())
+    else:
+        page_query = page_query.order_by(sort_column.asc(), id_column.asc())
+    if offset and not cursor:
+        page_query = page_query.offset(offset)
+
+    rows = page_query.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    items = rows[:limit]
+
+    next_cursor = None
+    if has_more and items:
+        last = items[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return Page(
+        items=items,
+        total=total,
+        total_is_estimate=total_is_estimate,
+        has_more=has_more,
+        next_cursor=next_cursor,
+    )
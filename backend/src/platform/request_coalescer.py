@@ -0,0 +1,69 @@
+"""
+In-flight request coalescing for asyncio callers.
+
+Concurrent identical requests (same key) in one event loop share a single
+upstream call: the first caller runs it, the others await its result.
+Used by the LLM completion cache and the chart preview pipeline.
+
+Usage:
+    coalescer = RequestCoalescer("chart preview")
+    result, shared = await coalescer.run(key, lambda: fetch(...))
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestCoalescer:
+    """Shares one in-flight call per key between concurrent callers."""
+
+    def __init__(self, name: str = "request"):
+        self._name = name
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """True if a call for key is running in the current event loop."""
+        future = self._inflight.get(key)
+        return future is not None and future.get_loop() is asyncio.get_running_loop()
+
+    async def run(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        """
+        Run compute() unless an identical request is already in flight.
+
+        Returns:
+            (result, shared) - shared is True when the result came from
+            another caller's in-flight request. Exceptions from the shared
+            call are raised to every waiter.
+        """
+        loop = asyncio.get_running_loop()
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is loop:
+            # shield: a cancelled waiter must not cancel the shared call
+            return await asyncio.shield(future), True
+
+        future = loop.create_future()
+        # Retrieve the exception when nobody else waited on it
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            result = await compute()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+            else:
+                future.set_exception(RuntimeError(f"Coalesced {self._name} was cancelled"))
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
@@ -42,6 +42,11 @@ from sqlalchemy.exc import SQLAlchemyError, DataError
 
 from src.constants.permissions import has_multi_tenant_access, RoleCategory, get_primary_role_category
 from src.database.session import get_db_session_sync
+from src.platform.tenant_resolution_cache import (
+    CachedTenantResolution,
+    claims_fingerprint,
+    get_tenant_resolution_cache,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -431,13 +436,32 @@ class TenantContextMiddleware:
             TenantSelectionRequiredException: User has >1 tenants and no selection
             NoTenantAccessException: User has no tenant access
         """
-        from src.database.session import get_db_session_sync
-        from src.models.user import User
-        from src.models.user_tenant_roles import UserTenantRole
-        from src.models.tenant import Tenant, TenantStatus
-        from src.services.clerk_sync_service import ClerkSyncService
+        from src.database.session import (
+            get_db_session_sync,
+            get_async_session_factory,
+            is_async_db_enabled,
+        )
 
-        from sqlalchemy.exc import IntegrityError as SAIntegrityError
+        resolve_args = (
+            user_id,
+            jwt_org_id,
+            jwt_org_role,
+            jwt_active_tenant_id,
+            jwt_allowed_tenants,
+        )
+
+        if is_async_db_enabled():
+            # Run the resolution on the asyncpg engine so the lookups (and any
+            # lazy provisioning) do not block the event loop.
+            try:
+                session = get_async_session_factory()()
+            except Exception:
+                # DB session unavailable - fall back to JWT
+                return jwt_active_tenant_id, []
+            try:
+                return await session.run_sync(self._resolve_tenant_in_session, *resolve_args)
+            finally:
+                await session.close()
 
         try:
             db = next(get_db_session_sync())
@@ -445,6 +469,34 @@ class TenantContextMiddleware:
             # DB session unavailable - fall back to JWT
             return jwt_active_tenant_id, []
 
+        try:
+            return self._resolve_tenant_in_session(db, *resolve_args)
+        finally:
+            db.close()
+
+    def _resolve_tenant_in_session(
+        self,
+        db,
+        user_id: str,
+        jwt_org_id: str,
+        jwt_org_role: str,
+        jwt_active_tenant_id: str,
+        jwt_allowed_tenants: list[str],
+    ) -> tuple[str, list[str]]:
+        """
+        Body of _resolve_tenant_from_db, run on a sync Session.
+
+        The Session is either a regular one or the sync facade of an
+        AsyncSession (via run_sync). See _resolve_tenant_from_db for the
+        resolution order, return value and exceptions.
+        """
+        from src.models.user import User
+        from src.models.user_tenant_roles import UserTenantRole
+        from src.models.tenant import Tenant, TenantStatus
+        from src.services.clerk_sync_service import ClerkSyncService
+
+        from sqlalchemy.exc import IntegrityError as SAIntegrityError
+
         try:
             # Find user by clerk_user_id
             user = db.query(User).filter(
@@ -689,8 +741,430 @@ class TenantContextMiddleware:
                 extra={"error": str(db_err), "error_type": type(db_err).__name__},
             )
             return jwt_active_tenant_id, []
+
+    async def _resolve_and_authorize(
+        self,
+        request: Request,
+        user_id: str,
+        org_id: str,
+        org_role: str,
+        roles: list[str],
+        allowed_tenants: list[str],
+        billing_tier: str,
+        active_tenant_id: str,
+    ):
+        """
+        Resolve the active tenant and enforce DB authorization for a token.
+
+        Runs on a tenant-resolution cache miss. Only a returned TenantContext
+        is cached; denials are returned as JSONResponse and never cached.
+        Neither is a context whose DB roles differ from the token's roles:
+        until the token is refreshed, every request re-enforces and emits
+        the role-change audit event.
+
+        Returns:
+            TenantContext on success, or the JSONResponse to send instead
+        """
+        # =========================================================================
+        # DB-BASED TENANT RESOLUTION
+        # If user has multiple tenants (via agency grants), resolve active tenant
+        # =========================================================================
+        try:
+            resolved_tenant_id, db_allowed_tenants = await self._resolve_tenant_from_db(
+                request=request,
+                user_id=str(user_id),
+                jwt_org_id=str(org_id),
+                jwt_org_role=org_role,
+                jwt_active_tenant_id=active_tenant_id,
+                jwt_allowed_tenants=allowed_tenants,
+            )
+            active_tenant_id = resolved_tenant_id
+            # Merge DB-based allowed_tenants with JWT-based
+            if db_allowed_tenants:
+                allowed_tenants = list(set(allowed_tenants + db_allowed_tenants))
+        except TenantSelectionRequiredException as e:
+            # Multi-tenant user has no active tenant selected
+            _emit_tenant_violation_audit_log(
+                request=request,
+                violation_type=TenantViolationType.TENANT_SELECTION_REQUIRED,
+                error_message=str(e),
+                user_id=str(user_id),
+                org_id=str(org_id),
+                extra_metadata={"tenant_count": e.tenant_count},
+            )
+            return JSONResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                content={
+                    "error": "TENANT_SELECTION_REQUIRED",
+                    "message": str(e),
+                    "tenant_count": e.tenant_count,
+                }
+            )
+        except NoTenantAccessException as e:
+            _emit_tenant_violation_audit_log(
+                request=request,
+                violation_type=TenantViolationType.NO_TENANT_ACCESS,
+                error_message=str(e),
+                user_id=str(user_id),
+                org_id=str(org_id),
+            )
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={"detail": "User has no tenant access"}
+            )
+
+        # Ensure active_tenant_id is in allowed_tenants for agency users
+        if allowed_tenants and active_tenant_id not in allowed_tenants:
+            # Default to first allowed tenant
+            active_tenant_id = allowed_tenants[0] if allowed_tenants else str(org_id)
+
+        # -----------------------------------------------------------------
+        # Validate that active_tenant_id is a real Tenant.id, not a Clerk
+        # org_id.  When _resolve_tenant_from_db falls back to JWT (DB
+        # unavailable or lazy sync failed), active_tenant_id may still be
+        # the raw Clerk org_id which does not exist in tenants.id.  Passing
+        # that to TenantGuard would cause FK violations or TENANT_NOT_FOUND
+        # errors that surface as 503s.
+        #
+        # Clerk org_ids typically start with "org_".  If we detect that
+        # pattern AND the value was NOT resolved to a DB tenant id, do a
+        # quick lookup to resolve it.  If that also fails, attempt a
+        # second-chance provisioning before returning 403.
+        # -----------------------------------------------------------------
+        if active_tenant_id == str(org_id) and str(org_id).startswith("org_"):
+            # Still the raw Clerk org_id — attempt one more lookup + provision
+            try:
+                from src.models.tenant import Tenant, TenantStatus
+                from src.services.clerk_sync_service import ClerkSyncService
+                from sqlalchemy.exc import IntegrityError as SAIntegrityError
+                _db = next(get_db_session_sync())
+                try:
+                    _t = _db.query(Tenant).filter(
+                        Tenant.clerk_org_id == str(org_id),
+                        Tenant.status == TenantStatus.ACTIVE,
+                    ).first()
+                    if _t:
+                        active_tenant_id = _t.id
+                    else:
+                        # Tenant doesn't exist — second-chance provisioning.
+                        # The first lazy sync in _resolve_tenant_from_db may
+                        # have failed. Try once more with a fresh session.
+                        logger.info(
+                            "Tenant not found — attempting second-chance provisioning",
+                            extra={"clerk_org_id": str(org_id), "user_id": str(user_id)},
+                        )
+                        try:
+                            sync = ClerkSyncService(_db, skip_audit=True)
+                            sync.get_or_create_user(clerk_user_id=str(user_id))
+                            sync.sync_tenant_from_org(
+                                clerk_org_id=str(org_id),
+                                name=f"Tenant {str(org_id)[-8:]}",
+                                source="lazy_sync",
+                            )
+                            sync.sync_membership(
+                                clerk_user_id=str(user_id),
+                                clerk_org_id=str(org_id),
+                                role=org_role or "org:member",
+                                source="lazy_sync",
+                                assigned_by="system",
+                            )
+                            _db.commit()
+                            # Re-query to get the tenant id
+                            _t = _db.query(Tenant).filter(
+                                Tenant.clerk_org_id == str(org_id),
+                                Tenant.status == TenantStatus.ACTIVE,
+                            ).first()
+                            if _t:
+                                active_tenant_id = _t.id
+                                logger.info(
+                                    "Second-chance provisioning succeeded",
+                                    extra={
+                                        "clerk_org_id": str(org_id),
+                                        "tenant_id": _t.id,
+                                    },
+                                )
+                            else:
+                                logger.error(
+                                    "Tenant not found after second-chance provisioning commit",
+                                    extra={"clerk_org_id": str(org_id)},
+                                )
+                                return JSONResponse(
+                                    status_code=status.HTTP_403_FORBIDDEN,
+                                    content={
+                                        "detail": "Your organization has not been provisioned yet. "
+                                        "Please try again in a moment or contact support.",
+                                        "error_code": "TENANT_NOT_PROVISIONED",
+                                    },
+                                )
+                        except SAIntegrityError:
+                            _db.rollback()
+                            # Concurrent create — re-query
+                            _t = _db.query(Tenant).filter(
+                                Tenant.clerk_org_id == str(org_id),
+                                Tenant.status == TenantStatus.ACTIVE,
+                            ).first()
+                            if _t:
+                                active_tenant_id = _t.id
+                            else:
+                                return JSONResponse(
+                                    status_code=status.HTTP_403_FORBIDDEN,
+                                    content={
+                                        "detail": "Your organization has not been provisioned yet. "
+                                        "Please try again in a moment or contact support.",
+                                        "error_code": "TENANT_NOT_PROVISIONED",
+                                    },
+                                )
+                        except Exception as provision_err:
+                            _db.rollback()
+                            logger.error(
+                                "Second-chance provisioning failed",
+                                extra={
+                                    "clerk_org_id": str(org_id),
+                                    "error": str(provision_err),
+                                    "error_type": type(provision_err).__name__,
+                                },
+                                exc_info=True,
+                            )
+                            return JSONResponse(
+                                status_code=status.HTTP_403_FORBIDDEN,
+                                content={
+                                    "detail": "Your organization has not been provisioned yet. "
+                                    "Please try again in a moment or contact support.",
+                                    "error_code": "TENANT_NOT_PROVISIONED",
+                                },
+                            )
+                finally:
+                    _db.close()
+            except Exception as resolve_err:
+                logger.warning(
+                    "Failed to resolve Clerk org_id to tenant_id",
+                    extra={
+                        "clerk_org_id": str(org_id),
+                        "error_type": type(resolve_err).__name__,
+                    },
+                    exc_info=True,
+                )
+                # DataError = type mismatch, not transient → 403 (stop retries)
+                # Other errors (connection lost, etc.) → 503 (may be transient)
+                if isinstance(resolve_err, DataError):
+                    return JSONResponse(
+                        status_code=status.HTTP_403_FORBIDDEN,
+                        content={
+                            "detail": "Your organization has not been fully provisioned yet. "
+                            "Please try again in a moment or contact support.",
+                            "error_code": "TENANT_NOT_PROVISIONED",
+                        },
+                    )
+                return JSONResponse(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    content={
+                        "detail": "Authorization service temporarily unavailable. Please retry.",
+                        "error_type": type(resolve_err).__name__,
+                    },
+                )
+
+        # CRITICAL: tenant_id = org_id (from JWT, never from request)
+        # For agency users: tenant_id is the currently active tenant
+        tenant_context = TenantContext(
+            tenant_id=active_tenant_id,
+            user_id=str(user_id),
+            roles=roles if isinstance(roles, list) else [],
+            org_id=str(org_id),
+            allowed_tenants=allowed_tenants if allowed_tenants else None,
+            billing_tier=billing_tier,
+        )
+
+        # =================================================================
+        # DB-AS-SOURCE-OF-TRUTH AUTHORIZATION ENFORCEMENT
+        # =================================================================
+        # Final safety check: if active_tenant_id is still a raw Clerk
+        # org_id (starts with "org_"), TenantGuard queries will throw
+        # DataError when PostgreSQL tries to cast it to UUID.
+        # The org_ check at line ~913 handles the common case, but if
+        # that lookup also failed, catch it here as a last resort.
+        # Note: we only reject "org_" prefixed values — other non-UUID
+        # strings (e.g. test fixtures) are allowed through since they
+        # won't hit real PostgreSQL UUID columns in test environments.
+        if str(active_tenant_id).startswith("org_") and not _is_uuid_format(active_tenant_id):
+            logger.warning(
+                "active_tenant_id is still a raw Clerk org_id after resolution — "
+                "cannot proceed to TenantGuard",
+                extra={
+                    "active_tenant_id": active_tenant_id,
+                    "org_id": str(org_id),
+                    "user_id": str(user_id),
+                },
+            )
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={
+                    "detail": (
+                        "Your organization has not been fully provisioned yet. "
+                        "Please try again in a moment or contact support."
+                    ),
+                    "error_code": "TENANT_NOT_PROVISIONED",
+                },
+            )
+
+        # Verify authorization against database on every request.
+        # This ensures immediate enforcement for:
+        # - Tenant access revoked mid-session
+        # - Role changes mid-session
+        # - Billing downgrades that invalidate roles
+        TenantGuard = _get_tenant_guard_class()
+        db = None
+        try:
+            db_gen = get_db_session_sync()
+            db = next(db_gen)
+
+            guard = TenantGuard(db)
+            authz_result = guard.enforce_authorization(
+                clerk_user_id=str(user_id),
+                active_tenant_id=active_tenant_id,
+                jwt_roles=roles if isinstance(roles, list) else [],
+                request_path=str(request.url.path),
+                request_method=request.method,
+            )
+
+            if not authz_result.is_authorized:
+                # Emit audit event for the enforcement (never crash on audit failure)
+                try:
+                    guard.emit_enforcement_audit_event(request, authz_result)
+                except Exception:
+                    logger.debug("Audit event emit failed (non-fatal)", exc_info=True)
+
+                # Emit violation audit log
+                _emit_tenant_violation_audit_log(
+                    request=request,
+                    violation_type=TenantViolationType.AUTHORIZATION_ENFORCEMENT_FAILED,
+                    error_message=authz_result.denial_reason or "Authorization denied",
+                    user_id=str(user_id),
+                    org_id=str(org_id),
+                    extra_metadata={
+                        "error_code": authz_result.error_code,
+                        "tenant_id": active_tenant_id,
+                    },
+                )
+
+                return JSONResponse(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    content={"detail": authz_result.denial_reason or "Access denied"},
+                    headers={
+                        "X-Error-Code": authz_result.error_code or "ACCESS_DENIED",
+                    },
+                )
+
+            # Update tenant context with DB-verified roles and billing tier
+            # This ensures the request uses current DB state, not stale JWT claims
+            if authz_result.roles:
+                tenant_context = TenantContext(
+                    tenant_id=active_tenant_id,
+                    user_id=str(user_id),
+                    roles=authz_result.roles,  # Use DB-verified roles
+                    org_id=str(org_id),
+                    allowed_tenants=allowed_tenants if allowed_tenants else None,
+                    billing_tier=authz_result.billing_tier or billing_tier,
+                )
+
+            # Emit audit event for role changes (if any, never crash on audit failure)
+            if authz_result.roles_changed:
+                request.state.tenant_resolution_cacheable = False
+            if authz_result.roles_changed and authz_result.audit_action:
+                try:
+                    guard.emit_enforcement_audit_event(request, authz_result)
+                except Exception:
+                    logger.debug("Role-change audit event failed (non-fatal)", exc_info=True)
+
+            # Resolve data-driven permissions from DB (Story 5.5.1)
+            # This populates resolved_permissions on TenantContext so RBAC
+            # decorators check DB-driven roles instead of the hardcoded matrix.
+            try:
+                from src.services.rbac import resolve_permissions_for_user
+                from src.models.user import User
+
+                user = db.query(User).filter(
+                    User.clerk_user_id == str(user_id)
+                ).first()
+                if user:
+                    perms = resolve_permissions_for_user(db, user.id, active_tenant_id)
+                    if perms:
+                        # Only override when DB has actual permission records.
+                        # Empty set means no data-driven roles exist yet;
+                        # leave as None to fall back to hardcoded matrix.
+                        tenant_context.resolved_permissions = perms
+            except Exception:
+                # Graceful degradation: if resolution fails, decorators
+                # fall back to the hardcoded ROLE_PERMISSIONS matrix.
+                logger.debug(
+                    "Data-driven permission resolution skipped",
+                    extra={
+                        "user_id": str(user_id),
+                        "tenant_id": active_tenant_id,
+                    },
+                    exc_info=True,
+                )
+        except DataError as data_error:
+            # DataError = type/value mismatch in a DB query (e.g., comparing
+            # a Clerk org_id string against a UUID-typed column).  Log the
+            # details so we can identify the exact column/value involved.
+            logger.error(
+                "DataError during authorization — likely tenant_id type mismatch: %s",
+                str(data_error),
+                extra={
+                    "user_id": str(user_id),
+                    "tenant_id": active_tenant_id,
+                    "tenant_id_is_uuid": _is_uuid_format(active_tenant_id),
+                    "org_id": str(org_id),
+                    "path": request.url.path,
+                },
+                exc_info=True,
+            )
+            # DataError is NOT transient — retrying will fail the same way.
+            # Return 403 so the frontend stops retrying.
+            return JSONResponse(
+                status_code=status.HTTP_403_FORBIDDEN,
+                content={
+                    "detail": (
+                        "Your organization has not been fully provisioned yet. "
+                        "Please try again in a moment or contact support."
+                    ),
+                    "error_code": "TENANT_NOT_PROVISIONED",
+                },
+            )
+        except (RuntimeError, ValueError, SQLAlchemyError) as db_error:
+            logger.error(
+                f"DB authorization enforcement failed (fail-closed): {type(db_error).__name__}: {str(db_error)}",
+                extra={
+                    "user_id": str(user_id),
+                    "tenant_id": active_tenant_id,
+                    "path": request.url.path,
+                },
+                exc_info=True,
+            )
+            _emit_tenant_violation_audit_log(
+                request=request,
+                violation_type=TenantViolationType.AUTHORIZATION_ENFORCEMENT_FAILED,
+                error_message=f"DB authorization unavailable: {type(db_error).__name__}",
+                user_id=str(user_id),
+                org_id=str(org_id),
+            )
+            # Include the exception class in the response so admins can
+            # diagnose whether this is a config issue (RuntimeError from
+            # missing DATABASE_URL), a connectivity issue (OperationalError),
+            # or a schema issue (ProgrammingError).
+            error_hint = type(db_error).__name__
+            return JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "detail": "Authorization service temporarily unavailable. Please retry.",
+                    "error_type": error_hint,
+                },
+            )
         finally:
-            db.close()
+            if db is not None:
+                db.close()
+
+        return tenant_context
 
     async def __call__(self, request: Request, call_next):
         """
@@ -853,401 +1327,60 @@ class TenantContextMiddleware:
             active_tenant_id = payload.get("active_tenant_id") or str(org_id)
 
             # =========================================================================
-            # DB-BASED TENANT RESOLUTION
-            # If user has multiple tenants (via agency grants), resolve active tenant
+            # TENANT RESOLUTION + DB AUTHORIZATION
+            # Cached per (user, org, JWT claims); see tenant_resolution_cache.
+            # Steady-state requests are served without touching the database.
             # =========================================================================
-            try:
-                resolved_tenant_id, db_allowed_tenants = await self._resolve_tenant_from_db(
-                    request=request,
-                    user_id=str(user_id),
-                    jwt_org_id=str(org_id),
-                    jwt_org_role=org_role,
-                    jwt_active_tenant_id=active_tenant_id,
-                    jwt_allowed_tenants=allowed_tenants,
-                )
-                active_tenant_id = resolved_tenant_id
-                # Merge DB-based allowed_tenants with JWT-based
-                if db_allowed_tenants:
-                    allowed_tenants = list(set(allowed_tenants + db_allowed_tenants))
-            except TenantSelectionRequiredException as e:
-                # Multi-tenant user has no active tenant selected
-                _emit_tenant_violation_audit_log(
-                    request=request,
-                    violation_type=TenantViolationType.TENANT_SELECTION_REQUIRED,
-                    error_message=str(e),
-                    user_id=str(user_id),
-                    org_id=str(org_id),
-                    extra_metadata={"tenant_count": e.tenant_count},
-                )
-                return JSONResponse(
-                    status_code=status.HTTP_409_CONFLICT,
-                    content={
-                        "error": "TENANT_SELECTION_REQUIRED",
-                        "message": str(e),
-                        "tenant_count": e.tenant_count,
-                    }
-                )
-            except NoTenantAccessException as e:
-                _emit_tenant_violation_audit_log(
-                    request=request,
-                    violation_type=TenantViolationType.NO_TENANT_ACCESS,
-                    error_message=str(e),
+            resolution_cache = get_tenant_resolution_cache()
+            fingerprint = claims_fingerprint(
+                active_tenant_id, org_role, allowed_tenants, roles, billing_tier
+            )
+            cached = resolution_cache.get(str(user_id), str(org_id), fingerprint)
+            if cached is not None:
+                tenant_context = TenantContext(
+                    tenant_id=cached.tenant_id,
                     user_id=str(user_id),
+                    roles=cached.roles,
                     org_id=str(org_id),
+                    allowed_tenants=cached.allowed_tenants or None,
+                    billing_tier=cached.billing_tier,
+                    resolved_permissions=(
+                        set(cached.resolved_permissions)
+                        if cached.resolved_permissions is not None
+                        else None
+                    ),
                 )
-                return JSONResponse(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    content={"detail": "User has no tenant access"}
-                )
-
-            # Ensure active_tenant_id is in allowed_tenants for agency users
-            if allowed_tenants and active_tenant_id not in allowed_tenants:
-                # Default to first allowed tenant
-                active_tenant_id = allowed_tenants[0] if allowed_tenants else str(org_id)
-
-            # -----------------------------------------------------------------
-            # Validate that active_tenant_id is a real Tenant.id, not a Clerk
-            # org_id.  When _resolve_tenant_from_db falls back to JWT (DB
-            # unavailable or lazy sync failed), active_tenant_id may still be
-            # the raw Clerk org_id which does not exist in tenants.id.  Passing
-            # that to TenantGuard would cause FK violations or TENANT_NOT_FOUND
-            # errors that surface as 503s.
-            #
-            # Clerk org_ids typically start with "org_".  If we detect that
-            # pattern AND the value was NOT resolved to a DB tenant id, do a
-            # quick lookup to resolve it.  If that also fails, attempt a
-            # second-chance provisioning before returning 403.
-            # -----------------------------------------------------------------
-            if active_tenant_id == str(org_id) and str(org_id).startswith("org_"):
-                # Still the raw Clerk org_id — attempt one more lookup + provision
-                try:
-                    from src.models.tenant import Tenant, TenantStatus
-                    from src.services.clerk_sync_service import ClerkSyncService
-                    from sqlalchemy.exc import IntegrityError as SAIntegrityError
-                    _db = next(get_db_session_sync())
-                    try:
-                        _t = _db.query(Tenant).filter(
-                            Tenant.clerk_org_id == str(org_id),
-                            Tenant.status == TenantStatus.ACTIVE,
-                        ).first()
-                        if _t:
-                            active_tenant_id = _t.id
-                        else:
-                            # Tenant doesn't exist — second-chance provisioning.
-                            # The first lazy sync in _resolve_tenant_from_db may
-                            # have failed. Try once more with a fresh session.
-                            logger.info(
-                                "Tenant not found — attempting second-chance provisioning",
-                                extra={"clerk_org_id": str(org_id), "user_id": str(user_id)},
-                            )
-                            try:
-                                sync = ClerkSyncService(_db, skip_audit=True)
-                                sync.get_or_create_user(clerk_user_id=str(user_id))
-                                sync.sync_tenant_from_org(
-                                    clerk_org_id=str(org_id),
-                                    name=f"Tenant {str(org_id)[-8:]}",
-                                    source="lazy_sync",
-                                )
-                                sync.sync_membership(
-                                    clerk_user_id=str(user_id),
-                                    clerk_org_id=str(org_id),
-                                    role=org_role or "org:member",
-                                    source="lazy_sync",
-                                    assigned_by="system",
-                                )
-                                _db.commit()
-                                # Re-query to get the tenant id
-                                _t = _db.query(Tenant).filter(
-                                    Tenant.clerk_org_id == str(org_id),
-                                    Tenant.status == TenantStatus.ACTIVE,
-                                ).first()
-                                if _t:
-                                    active_tenant_id = _t.id
-                                    logger.info(
-                                        "Second-chance provisioning succeeded",
-                                        extra={
-                                            "clerk_org_id": str(org_id),
-                                            "tenant_id": _t.id,
-                                        },
-                                    )
-                                else:
-                                    logger.error(
-                                        "Tenant not found after second-chance provisioning commit",
-                                        extra={"clerk_org_id": str(org_id)},
-                                    )
-                                    return JSONResponse(
-                                        status_code=status.HTTP_403_FORBIDDEN,
-                                        content={
-                                            "detail": "Your organization has not been provisioned yet. "
-                                            "Please try again in a moment or contact support.",
-                                            "error_code": "TENANT_NOT_PROVISIONED",
-                                        },
-                                    )
-                            except SAIntegrityError:
-                                _db.rollback()
-                                # Concurrent create — re-query
-                                _t = _db.query(Tenant).filter(
-                                    Tenant.clerk_org_id == str(org_id),
-                                    Tenant.status == TenantStatus.ACTIVE,
-                                ).first()
-                                if _t:
-                                    active_tenant_id = _t.id
-                                else:
-                                    return JSONResponse(
-                                        status_code=status.HTTP_403_FORBIDDEN,
-                                        content={
-                                            "detail": "Your organization has not been provisioned yet. "
-                                            "Please try again in a moment or contact support.",
-                                            "error_code": "TENANT_NOT_PROVISIONED",
-                                        },
-                                    )
-                            except Exception as provision_err:
-                                _db.rollback()
-                                logger.error(
-                                    "Second-chance provisioning failed",
-                                    extra={
-                                        "clerk_org_id": str(org_id),
-                                        "error": str(provision_err),
-                                        "error_type": type(provision_err).__name__,
-                                    },
-                                    exc_info=True,
-                                )
-                                return JSONResponse(
-                                    status_code=status.HTTP_403_FORBIDDEN,
-                                    content={
-                                        "detail": "Your organization has not been provisioned yet. "
-                                        "Please try again in a moment or contact support.",
-                                        "error_code": "TENANT_NOT_PROVISIONED",
-                                    },
-                                )
-                    finally:
-                        _db.close()
-                except Exception as resolve_err:
-                    logger.warning(
-                        "Failed to resolve Clerk org_id to tenant_id",
-                        extra={
-                            "clerk_org_id": str(org_id),
-                            "error_type": type(resolve_err).__name__,
-                        },
-                        exc_info=True,
-                    )
-                    # DataError = type mismatch, not transient → 403 (stop retries)
-                    # Other errors (connection lost, etc.) → 503 (may be transient)
-                    if isinstance(resolve_err, DataError):
-                        return JSONResponse(
-                            status_code=status.HTTP_403_FORBIDDEN,
-                            content={
-                                "detail": "Your organization has not been fully provisioned yet. "
-                                "Please try again in a moment or contact support.",
-                                "error_code": "TENANT_NOT_PROVISIONED",
-                            },
-                        )
-                    return JSONResponse(
-                        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                        content={
-                            "detail": "Authorization service temporarily unavailable. Please retry.",
-                            "error_type": type(resolve_err).__name__,
-                        },
-                    )
-
-            # CRITICAL: tenant_id = org_id (from JWT, never from request)
-            # For agency users: tenant_id is the currently active tenant
-            tenant_context = TenantContext(
-                tenant_id=active_tenant_id,
-                user_id=str(user_id),
-                roles=roles if isinstance(roles, list) else [],
-                org_id=str(org_id),
-                allowed_tenants=allowed_tenants if allowed_tenants else None,
-                billing_tier=billing_tier,
-            )
-
-            # =================================================================
-            # DB-AS-SOURCE-OF-TRUTH AUTHORIZATION ENFORCEMENT
-            # =================================================================
-            # Final safety check: if active_tenant_id is still a raw Clerk
-            # org_id (starts with "org_"), TenantGuard queries will throw
-            # DataError when PostgreSQL tries to cast it to UUID.
-            # The org_ check at line ~913 handles the common case, but if
-            # that lookup also failed, catch it here as a last resort.
-            # Note: we only reject "org_" prefixed values — other non-UUID
-            # strings (e.g. test fixtures) are allowed through since they
-            # won't hit real PostgreSQL UUID columns in test environments.
-            if str(active_tenant_id).startswith("org_") and not _is_uuid_format(active_tenant_id):
-                logger.warning(
-                    "active_tenant_id is still a raw Clerk org_id after resolution — "
-                    "cannot proceed to TenantGuard",
-                    extra={
-                        "active_tenant_id": active_tenant_id,
-                        "org_id": str(org_id),
-                        "user_id": str(user_id),
-                    },
-                )
-                return JSONResponse(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    content={
-                        "detail": (
-                            "Your organization has not been fully provisioned yet. "
-                            "Please try again in a moment or contact support."
-                        ),
-                        "error_code": "TENANT_NOT_PROVISIONED",
-                    },
-                )
-
-            # Verify authorization against database on every request.
-            # This ensures immediate enforcement for:
-            # - Tenant access revoked mid-session
-            # - Role changes mid-session
-            # - Billing downgrades that invalidate roles
-            TenantGuard = _get_tenant_guard_class()
-            db = None
-            try:
-                db_gen = get_db_session_sync()
-                db = next(db_gen)
-
-                guard = TenantGuard(db)
-                authz_result = guard.enforce_authorization(
-                    clerk_user_id=str(user_id),
+            else:
+                result = await self._resolve_and_authorize(
+                    request,
+                    user_id=user_id,
+                    org_id=org_id,
+                    org_role=org_role,
+                    roles=roles,
+                    allowed_tenants=allowed_tenants,
+                    billing_tier=billing_tier,
                     active_tenant_id=active_tenant_id,
-                    jwt_roles=roles if isinstance(roles, list) else [],
-                    request_path=str(request.url.path),
-                    request_method=request.method,
                 )
-
-                if not authz_result.is_authorized:
-                    # Emit audit event for the enforcement (never crash on audit failure)
-                    try:
-                        guard.emit_enforcement_audit_event(request, authz_result)
-                    except Exception:
-                        logger.debug("Audit event emit failed (non-fatal)", exc_info=True)
-
-                    # Emit violation audit log
-                    _emit_tenant_violation_audit_log(
-                        request=request,
-                        violation_type=TenantViolationType.AUTHORIZATION_ENFORCEMENT_FAILED,
-                        error_message=authz_result.denial_reason or "Authorization denied",
-                        user_id=str(user_id),
-                        org_id=str(org_id),
-                        extra_metadata={
-                            "error_code": authz_result.error_code,
-                            "tenant_id": active_tenant_id,
-                        },
-                    )
-
-                    return JSONResponse(
-                        status_code=status.HTTP_403_FORBIDDEN,
-                        content={"detail": authz_result.denial_reason or "Access denied"},
-                        headers={
-                            "X-Error-Code": authz_result.error_code or "ACCESS_DENIED",
-                        },
-                    )
-
-                # Update tenant context with DB-verified roles and billing tier
-                # This ensures the request uses current DB state, not stale JWT claims
-                if authz_result.roles:
-                    tenant_context = TenantContext(
-                        tenant_id=active_tenant_id,
-                        user_id=str(user_id),
-                        roles=authz_result.roles,  # Use DB-verified roles
-                        org_id=str(org_id),
-                        allowed_tenants=allowed_tenants if allowed_tenants else None,
-                        billing_tier=authz_result.billing_tier or billing_tier,
-                    )
-
-                # Emit audit event for role changes (if any, never crash on audit failure)
-                if authz_result.roles_changed and authz_result.audit_action:
-                    try:
-                        guard.emit_enforcement_audit_event(request, authz_result)
-                    except Exception:
-                        logger.debug("Role-change audit event failed (non-fatal)", exc_info=True)
-
-                # Resolve data-driven permissions from DB (Story 5.5.1)
-                # This populates resolved_permissions on TenantContext so RBAC
-                # decorators check DB-driven roles instead of the hardcoded matrix.
-                try:
-                    from src.services.rbac import resolve_permissions_for_user
-                    from src.models.user import User
-
-                    user = db.query(User).filter(
-                        User.clerk_user_id == str(user_id)
-                    ).first()
-                    if user:
-                        perms = resolve_permissions_for_user(db, user.id, active_tenant_id)
-                        if perms:
-                            # Only override when DB has actual permission records.
-                            # Empty set means no data-driven roles exist yet;
-                            # leave as None to fall back to hardcoded matrix.
-                            tenant_context.resolved_permissions = perms
-                except Exception:
-                    # Graceful degradation: if resolution fails, decorators
-                    # fall back to the hardcoded ROLE_PERMISSIONS matrix.
-                    logger.debug(
-                        "Data-driven permission resolution skipped",
-                        extra={
-                            "user_id": str(user_id),
-                            "tenant_id": active_tenant_id,
-                        },
-                        exc_info=True,
-                    )
-            except DataError as data_error:
-                # DataError = type/value mismatch in a DB query (e.g., comparing
-                # a Clerk org_id string against a UUID-typed column).  Log the
-                # details so we can identify the exact column/value involved.
-                logger.error(
-                    "DataError during authorization — likely tenant_id type mismatch: %s",
-                    str(data_error),
-                    extra={
-                        "user_id": str(user_id),
-                        "tenant_id": active_tenant_id,
-                        "tenant_id_is_uuid": _is_uuid_format(active_tenant_id),
-                        "org_id": str(org_id),
-                        "path": request.url.path,
-                    },
-                    exc_info=True,
-                )
-                # DataError is NOT transient — retrying will fail the same way.
-                # Return 403 so the frontend stops retrying.
-                return JSONResponse(
-                    status_code=status.HTTP_403_FORBIDDEN,
-                    content={
-                        "detail": (
-                            "Your organization has not been fully provisioned yet. "
-                            "Please try again in a moment or contact support."
+                if isinstance(result, JSONResponse):
+                    return result
+                tenant_context = result
+                if getattr(request.state, "tenant_resolution_cacheable", True):
+                    resolution_cache.set(
+                        str(user_id),
+                        str(org_id),
+                        fingerprint,
+                        CachedTenantResolution(
+                            tenant_id=tenant_context.tenant_id,
+                            roles=list(tenant_context.roles),
+                            billing_tier=tenant_context.billing_tier,
+                            allowed_tenants=list(tenant_context.allowed_tenants),
+                            resolved_permissions=(
+                                sorted(tenant_context.resolved_permissions)
+                                if tenant_context.resolved_permissions is not None
+                                else None
+                            ),
                         ),
-                        "error_code": "TENANT_NOT_PROVISIONED",
-                    },
-                )
-            except (RuntimeError, ValueError, SQLAlchemyError) as db_error:
-                logger.error(
-                    f"DB authorization enforcement failed (fail-closed): {type(db_error).__name__}: {str(db_error)}",
-                    extra={
-                        "user_id": str(user_id),
-                        "tenant_id": active_tenant_id,
-                        "path": request.url.path,
-                    },
-                    exc_info=True,
-                )
-                _emit_tenant_violation_audit_log(
-                    request=request,
-                    violation_type=TenantViolationType.AUTHORIZATION_ENFORCEMENT_FAILED,
-                    error_message=f"DB authorization unavailable: {type(db_error).__name__}",
-                    user_id=str(user_id),
-                    org_id=str(org_id),
-                )
-                # Include the exception class in the response so admins can
-                # diagnose whether this is a config issue (RuntimeError from
-                # missing DATABASE_URL), a connectivity issue (OperationalError),
-                # or a schema issue (ProgrammingError).
-                error_hint = type(db_error).__name__
-                return JSONResponse(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    content={
-                        "detail": "Authorization service temporarily unavailable. Please retry.",
-                        "error_type": error_hint,
-                    },
-                )
-            finally:
-                if db is not None:
-                    db.close()
+                    )
 
             # Attach to request state
             request.state.tenant_context = tenant_context
@@ -0,0 +1,393 @@
+"""
+Tenant-resolution cache for TenantContextMiddleware.
+
+Every authenticated request used to resolve the active tenant (User,
+Tenant and UserTenantRole lookups, occasionally a commit) and then run
+TenantGuard.enforce_authorization and RBAC permission resolution against
+the database. The outcome only changes when membership, roles, user or
+tenant status change, so it is cached per (clerk_user_id, org_id):
+
+- In-process LRU front (short TTL) absorbs bursts from one browser session
+- Redis behind it (longer TTL) is shared by all API instances
+
+Only successful authorizations are cached. Denials always go to the DB.
+
+Key schema (Redis):
+- tenant_resolution:user:{clerk_user_id}  -> HASH {org_id}:{claims_fingerprint} -> JSON
+- tenant_resolution:tenant:{tenant_id}    -> SET of clerk_user_ids with entries
+                                             touching that tenant
+
+The claims fingerprint covers the JWT inputs of the resolution (active
+tenant claim, org role, allowed_tenants, roles, billing tier), so a
+token with different claims never reuses another token's result.
+
+INVALIDATION:
+Services that change membership, roles, user or tenant status call
+invalidate_tenant_resolution(session, ...). Entries are dropped
+immediately and again after the session commits (closing the window in
+which a concurrent request could re-cache pre-commit state), and the
+invalidation is published on a Redis channel so every instance evicts
+its LRU front as well. Subscription status and plan changes invalidate
+their tenant automatically when flushed (billing gates which roles are
+valid), whatever code path writes them.
+
+Results whose DB roles differ from the token's roles are not cached, so
+the role-change audit event is emitted on every such request.
+
+Environment variables:
+    TENANT_RESOLUTION_CACHE_ENABLED: Set to "false" to always resolve from DB
+    TENANT_RESOLUTION_CACHE_TTL_SECONDS: Redis entry TTL (default 60)
+    TENANT_RESOLUTION_LOCAL_TTL_SECONDS: In-process entry TTL (default 5)
+    TENANT_RESOLUTION_LOCAL_MAX_ENTRIES: In-process LRU capacity (default 10000)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, asdict, field
+from threading import Lock
+from typing import Iterable, Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from src.platform.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+TENANT_RESOLUTION_CACHE_ENABLED = (
+    os.getenv("TENANT_RESOLUTION_CACHE_ENABLED", "true").lower() == "true"
+)
+TENANT_RESOLUTION_CACHE_TTL_SECONDS = int(
+    os.getenv("TENANT_RESOLUTION_CACHE_TTL_SECONDS", "60")
+)
+TENANT_RESOLUTION_LOCAL_TTL_SECONDS = int(
+    os.getenv("TENANT_RESOLUTION_LOCAL_TTL_SECONDS", "5")
+)
+TENANT_RESOLUTION_LOCAL_MAX_ENTRIES = int(
+    os.getenv("TENANT_RESOLUTION_LOCAL_MAX_ENTRIES", "10000")
+)
+
+INVALIDATION_CHANNEL = "tenant_resolution:invalidations"
+
+# session.info key holding invalidations to replay after commit
+_PENDING_INFO_KEY = "tenant_resolution_pending_invalidations"
+
+
+@dataclass
+class CachedTenantResolution:
+    """Outcome of tenant resolution + DB authorization for one token shape."""
+
+    tenant_id: str
+    roles: list[str]
+    billing_tier: Optional[str] = None
+    allowed_tenants: list[str] = field(default_factory=list)
+    resolved_permissions: Optional[list[str]] = None
+    expires_at: float = 0.0
+
+    @property
+    def tenant_ids(self) -> set[str]:
+        """All tenants this entry depends on."""
+        return {self.tenant_id, *self.allowed_tenants}
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> CachedTenantResolution:
+        """Deserialize from JSON."""
+        return cls(**json.loads(data))
+
+
+def claims_fingerprint(
+    active_tenant_id: str,
+    org_role: Optional[str],
+    allowed_tenants: Iterable[str],
+    roles: Iterable[str],
+    billing_tier: Optional[str],
+) -> str:
+    """Stable digest of the JWT claims that feed tenant resolution."""
+    material = json.dumps(
+        [
+            active_tenant_id,
+            org_role or "",
+            sorted(allowed_tenants or []),
+            sorted(roles or []),
+            billing_tier or "",
+        ]
+    )
+    return hashlib.sha256(material.encode()).hexdigest()[:16]
+
+
+class TenantResolutionCache:
+    """
+    Two-level cache of tenant resolution results.
+
+    Usage:
+        cache = get_tenant_resolution_cache()
+        fingerprint = claims_fingerprint(...)
+
+        cached = cache.get(clerk_user_id, org_id, fingerprint)
+        if cached is None:
+            ...  # resolve + authorize against DB
+            cache.set(clerk_user_id, org_id, fingerprint, CachedTenantResolution(...))
+    """
+
+    USER_KEY_PREFIX = "tenant_resolution:user:"
+    TENANT_KEY_PREFIX = "tenant_resolution:tenant:"
+
+    def __init__(
+        self,
+        ttl_seconds: int = TENANT_RESOLUTION_CACHE_TTL_SECONDS,
+        local_ttl_seconds: int = TENANT_RESOLUTION_LOCAL_TTL_SECONDS,
+        local_max_entries: int = TENANT_RESOLUTION_LOCAL_MAX_ENTRIES,
+        enabled: bool = TENANT_RESOLUTION_CACHE_ENABLED,
+    ):
+        from src.entitlements.cache import RedisClient
+
+        self._redis = RedisClient()
+        # (clerk_user_id, field) keys: delete_prefix(clerk_user_id) drops a user
+        self._local: TTLCache[tuple[str, str], CachedTenantResolution] = TTLCache(
+            max_entries=local_max_entries,
+            ttl_seconds=local_ttl_seconds,
+            name="tenant_resolution_local",
+        )
+        self._ttl_seconds = ttl_seconds
+        self._local_ttl_seconds = min(local_ttl_seconds, ttl_seconds)
+        self.enabled = enabled
+
+        if self.enabled:
+            self._redis.subscribe(INVALIDATION_CHANNEL, self._on_invalidation_message)
+
+    def _user_key(self, clerk_user_id: str) -> str:
+        return f"{self.USER_KEY_PREFIX}{clerk_user_id}"
+
+    def _tenant_key(self, tenant_id: str) -> str:
+        return f"{self.TENANT_KEY_PREFIX}{tenant_id}"
+
+    def get(
+        self, clerk_user_id: str, org_id: str, fingerprint: str
+    ) -> Optional[CachedTenantResolution]:
+        """
+        Get the cached resolution for a token, or None on miss/expiry.
+        """
+        if not self.enabled:
+            return None
+
+        field_name = f"{org_id}:{fingerprint}"
+        local_key = (clerk_user_id, field_name)
+
+        entry = self._local.get(local_key)
+        if entry is not None:
+            return entry
+
+        data = self._redis.hget(self._user_key(clerk_user_id), field_name)
+        if not data:
+            return None
+        try:
+            entry = CachedTenantResolution.from_json(data)
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached tenant resolution: {e}")
+            return None
+        if entry.expires_at <= time.time():
+            return None
+
+        # Promote to the LRU front without outliving the Redis entry
+        self._set_local(local_key, entry)
+        return entry
+
+    def set(
+        self,
+        clerk_user_id: str,
+        org_id: str,
+        fingerprint: str,
+        entry: CachedTenantResolution,
+    ) -> None:
+        """Cache a successful resolution for a token."""
+        if not self.enabled:
+            return
+
+        field_name = f"{org_id}:{fingerprint}"
+        entry.expires_at = time.time() + self._ttl_seconds
+
+        if self._redis.available:
+            self._redis.hset(
+                self._user_key(clerk_user_id), field_name, entry.to_json(), self._ttl_seconds
+            )
+            for tenant_id in entry.tenant_ids:
+                self._redis.sadd(self._tenant_key(tenant_id), [clerk_user_id], self._ttl_seconds)
+
+        self._set_local((clerk_user_id, field_name), entry)
+
+    def _set_local(self, key: tuple[str, str], entry: CachedTenantResolution) -> None:
+        ttl = min(entry.expires_at - time.time(), self._local_ttl_seconds)
+        self._local.set(key, CachedTenantResolution(**asdict(entry)), ttl_seconds=ttl)
+
+    def invalidate(
+        self,
+        clerk_user_ids: Iterable[str] = (),
+        tenant_ids: Iterable[str] = (),
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Drop cached resolutions for users and/or every user of tenants.
+
+        Args:
+            clerk_user_ids: Clerk user IDs whose entries are dropped
+            tenant_ids: Tenants whose users' entries are dropped
+            reason: Optional reason for logging
+        """
+        clerk_user_ids = {u for u in clerk_user_ids if u}
+        tenant_ids = {t for t in tenant_ids if t}
+        if not clerk_user_ids and not tenant_ids:
+            return
+
+        if self._redis.available:
+            users = set(clerk_user_ids)
+            for tenant_id in tenant_ids:
+                users |= self._redis.smembers(self._tenant_key(tenant_id))
+            keys = [self._user_key(u) for u in users]
+            keys += [self._tenant_key(t) for t in tenant_ids]
+            self._redis.delete(*keys)
+            self._redis.publish(
+                INVALIDATION_CHANNEL,
+                json.dumps({
+                    "clerk_user_ids": sorted(clerk_user_ids),
+                    "tenant_ids": sorted(tenant_ids),
+                }),
+            )
+
+        self._evict_local(clerk_user_ids, tenant_ids)
+
+        logger.info(
+            "Invalidated tenant resolution cache",
+            extra={
+                "clerk_user_ids": sorted(clerk_user_ids),
+                "tenant_ids": sorted(tenant_ids),
+                "reason": reason,
+            },
+        )
+
+    def _evict_local(self, clerk_user_ids: set[str], tenant_ids: set[str]) -> None:
+        for clerk_user_id in clerk_user_ids:
+            self._local.delete_prefix(clerk_user_id)
+        if tenant_ids:
+            self._local.delete_where(lambda _, entry: bool(entry.tenant_ids & tenant_ids))
+
+    def _on_invalidation_message(self, message: dict) -> None:
+        """Evict the LRU front when another instance invalidates."""
+        try:
+            payload = json.loads(message["data"])
+            self._evict_local(
+                set(payload.get("clerk_user_ids", [])),
+                set(payload.get("tenant_ids", [])),
+            )
+        except Exception as e:
+            logger.warning(f"Bad tenant resolution invalidation message: {e}")
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._local.clear()
+
+
+# Module-level singleton
+_cache_instance: Optional[TenantResolutionCache] = None
+_cache_lock = Lock()
+
+
+def get_tenant_resolution_cache() -> TenantResolutionCache:
+    """Get the singleton TenantResolutionCache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = TenantResolutionCache()
+    return _cache_instance
+
+
+def invalidate_tenant_resolution(
+    session: Optional[Session] = None,
+    *,
+    clerk_user_ids: Iterable[str] = (),
+    user_ids: Iterable[str] = (),
+    tenant_ids: Iterable[str] = (),
+    reason: Optional[str] = None,
+) -> None:
+    """
+    Invalidate cached tenant resolutions now and again after commit.
+
+    CRITICAL: Call this from every code path that changes a user's tenant
+    membership, roles, active status, or a tenant's status, so that
+    revocations take effect on the next request.
+
+    Args:
+        session: Session carrying the change; when given, the invalidation
+            is replayed after it commits
+        clerk_user_ids: Clerk user IDs affected
+        user_ids: Internal user IDs affected (mapped to Clerk IDs via session)
+        tenant_ids: Tenants whose every member is affected
+        reason: Reason for logging
+    """
+    clerk_user_ids = {u for u in clerk_user_ids if isinstance(u, str)}
+    tenant_ids = {t for t in tenant_ids if isinstance(t, str)}
+    user_ids = {u for u in user_ids if isinstance(u, str)}
+
+    if user_ids and session is not None:
+        from src.models.user import User
+
+        try:
+            rows = session.query(User.clerk_user_id).filter(User.id.in_(user_ids)).all()
+            clerk_user_ids |= {row[0] for row in rows if isinstance(row[0], str)}
+        except Exception as e:
+            # Entries for these users still expire via TTL
+            logger.warning(f"Clerk ID lookup for cache invalidation failed: {e}")
+
+    if not clerk_user_ids and not tenant_ids:
+        return
+
+    cache = get_tenant_resolution_cache()
+    cache.invalidate(clerk_user_ids, tenant_ids, reason=reason)
+
+    if isinstance(session, Session):
+        pending = session.info.get(_PENDING_INFO_KEY)
+        if pending is None:
+            pending = session.info[_PENDING_INFO_KEY] = {"clerk_user_ids": set(), "tenant_ids": set()}
+        pending["clerk_user_ids"] |= clerk_user_ids
+        pending["tenant_ids"] |= tenant_ids
+
+
+@event.listens_for(Session, "after_commit")
+def _replay_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_INFO_KEY, None)
+    if pending:
+        get_tenant_resolution_cache().invalidate(
+            pending["clerk_user_ids"], pending["tenant_ids"], reason="after_commit"
+        )
+
+
+@event.listens_for(Session, "after_rollback")
+def _drop_pending(session: Session) -> None:
+    # Already invalidated once; nothing was committed to replay for
+    session.info.pop(_PENDING_INFO_KEY, None)
+
+
+@event.listens_for(Session, "before_flush")
+def _invalidate_on_subscription_change(session: Session, flush_context, instances) -> None:
+    from src.models.subscription import Subscription
+
+    tenant_ids = set()
+    for obj in session.new:
+        if isinstance(obj, Subscription):
+            tenant_ids.add(obj.tenant_id)
+    for obj in session.dirty:
+        if isinstance(obj, Subscription):
+            attrs = inspect(obj).attrs
+            if attrs.status.history.has_changes() or attrs.plan_id.history.has_changes():
+                tenant_ids.add(obj.tenant_id)
+    if tenant_ids:
+        invalidate_tenant_resolution(session, tenant_ids=tenant_ids, reason="subscription_changed")
@@ -0,0 +1,276 @@
+"""
+Bounded in-process LRU cache with TTL expiry.
+
+Shared by the in-process caches that used to carry their own ad-hoc
+dict + timestamp implementations (entitlements InMemoryCache, chart
+preview cache, tenant-resolution LRU front).
+
+Complexity:
+- get / set / delete: O(1) (OrderedDict LRU)
+- expiry: lazy min-heap of expiry times, popped on writes, so expired
+  entries are reclaimed without scanning the keyspace
+- delete_prefix / delete_pattern("ns:*"): O(k) in the number of matching
+  keys via a per-namespace key index
+
+Namespaces: for string keys, everything up to and including the first
+":" ("entitlement:tenant_1" -> "entitlement:"); for tuple keys, the first
+element. Keys without a namespace are indexed under "".
+
+Every cache registers its hit/miss/eviction/expiration counters under a
+name; src.monitoring.cache_metrics emits them for dashboards.
+
+Usage:
+    cache = TTLCache(max_entries=1000, ttl_seconds=300, name="chart_preview")
+    cache.set(key, value)
+    value = cache.get(key)                 # None on miss or expiry
+    value = cache.get(key, max_age=60)     # stricter freshness for this read
+    cache.delete_prefix("entitlement:")
+"""
+
+from __future__ import annotations
+
+import fnmatch
+import heapq
+import itertools
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from threading import RLock
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Rebuild the expiry heap when stale heap items outnumber live entries by this factor
+_HEAP_COMPACTION_FACTOR = 2
+
+
+@dataclass
+class CacheStats:
+    """Counters for one cache since process start."""
+
+    name: str
+    size: int
+    max_entries: int
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["hit_ratio"] = round(self.hit_ratio, 4)
+        return data
+
+
+def _namespace(key: Hashable) -> Hashable:
+    if isinstance(key, str):
+        sep = key.find(":")
+        return key[: sep + 1] if sep >= 0 else ""
+    if isinstance(key, tuple) and key:
+        return key[0]
+    return ""
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Thread-safe LRU cache with per-entry TTL.
+
+    Args:
+        max_entries: Capacity; least recently used entries are evicted beyond it
+        ttl_seconds: Default TTL for set() without an explicit ttl_seconds
+        name: Registers the cache's counters for monitoring when given
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, name: Optional[str] = None):
+        # key -> (cached_at, expires_at, value)
+        self._entries: OrderedDict[K, tuple[float, float, V]] = OrderedDict()
+        self._expiry_heap: list[tuple[float, int, K]] = []
+        self._namespaces: dict[Hashable, set[K]] = {}
+        self._sequence = itertools.count()
+        self._lock = RLock()
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self.name = name or f"ttl_cache_{id(self):x}"
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        if name:
+            _register(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, key: K, max_age: Optional[float] = None) -> Optional[V]:
+        """
+        Get a value, or None if missing, expired, or older than max_age.
+
+        A max_age read that finds an entry older than max_age drops it.
+        """
+        entry = self.get_entry(key, max_age=max_age)
+        return entry[1] if entry is not None else None
+
+    def get_entry(self, key: K, max_age: Optional[float] = None) -> Optional[tuple[float, V]]:
+        """Get (cached_at, value) for a live entry, or None."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                cached_at, expires_at, value = entry
+                if expires_at <= now or (max_age is not None and now - cached_at >= max_age):
+                    self._remove(key)
+                    self._expirations += 1
+                    entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return cached_at, value
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def set(self, key: K, value: V, ttl_seconds: Optional[float] = None) -> None:
+        """Insert or replace a value, evicting the LRU entry when full."""
+        now = time.time()
+        expires_at = now + (self._ttl_seconds if ttl_seconds is None else ttl_seconds)
+        with self._lock:
+            self._purge_expired(now)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            else:
+                self._namespaces.setdefault(_namespace(key), set()).add(key)
+            self._entries[key] = (now, expires_at, value)
+            heapq.heappush(self._expiry_heap, (expires_at, next(self._sequence), key))
+
+            while len(self._entries) > self._max_entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._evictions += 1
+
+            if len(self._expiry_heap) > _HEAP_COMPACTION_FACTOR * max(len(self._entries), 64):
+                self._rebuild_heap()
+
+    def delete(self, key: K) -> bool:
+        """Delete a key. Returns True if it was present."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def delete_prefix(self, prefix: Hashable) -> int:
+        """Delete every key in a namespace ("entitlement:" or a tuple key's first element)."""
+        with self._lock:
+            return self._delete_namespace(prefix)
+
+    def delete_pattern(self, pattern: str) -> int:
+        """
+        Delete string keys matching an fnmatch pattern.
+
+        Only keys in the pattern's namespace are examined, and a pattern of
+        the form "namespace:*" deletes the whole namespace without matching.
+        """
+        namespace = _namespace(pattern)
+        with self._lock:
+            if any(c in (namespace or pattern) for c in "*?["):
+                # Wildcard before the first ":" can match any namespace
+                candidates = list(self._entries)
+            elif pattern == f"{namespace}*":
+                return self._delete_namespace(namespace)
+            else:
+                candidates = list(self._namespaces.get(namespace, ()))
+            matched = [k for k in candidates if isinstance(k, str) and fnmatch.fnmatch(k, pattern)]
+            for key in matched:
+                self._remove(key)
+            return len(matched)
+
+    def delete_where(self, predicate: Callable[[K, V], bool]) -> int:
+        """Delete entries for which predicate(key, value) is true. O(n)."""
+        with self._lock:
+            matched = [k for k, (_, _, v) in self._entries.items() if predicate(k, v)]
+            for key in matched:
+                self._remove(key)
+            return len(matched)
+
+    def clear(self) -> None:
+        """Remove all entries (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._expiry_heap.clear()
+            self._namespaces.clear()
+
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache's counters."""
+        with self._lock:
+            return CacheStats(
+                name=self.name,
+                size=len(self._entries),
+                max_entries=self._max_entries,
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    # ------------------------------------------------------------------
+    # Internals (caller holds the lock)
+    # ------------------------------------------------------------------
+
+    def _delete_namespace(self, namespace: Hashable) -> int:
+        keys = self._namespaces.pop(namespace, set())
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def _remove(self, key: K) -> None:
+        del self._entries[key]
+        namespace = _namespace(key)
+        keys = self._namespaces.get(namespace)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._namespaces[namespace]
+
+    def _purge_expired(self, now: float) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, _, key = heapq.heappop(heap)
+            entry = self._entries.get(key)
+            # Skip heap items superseded by a later set() of the same key
+            if entry is not None and entry[1] == expires_at:
+                self._remove(key)
+                self._expirations += 1
+
+    def _rebuild_heap(self) -> None:
+        self._expiry_heap = [
+            (expires_at, next(self._sequence), key)
+            for key, (_, expires_at, _) in self._entries.items()
+        ]
+        heapq.heapify(self._expiry_heap)
+
+
+# Registry of named caches for monitoring (weak so caches can be collected)
+_registry: "weakref.WeakValueDictionary[str, TTLCache]" = weakref.WeakValueDictionary()
+
+
+def _register(cache: TTLCache) -> None:
+    _registry[cache.name] = cache
+
+
+def get_cache_stats() -> list[CacheStats]:
+    """Stats for every live named cache, sorted by name."""
+    return [cache.stats() for _, cache in sorted(_registry.items())]
@@ -18,6 +18,10 @@ from src.models.airbyte_connection import (
     ConnectionStatus,
     ConnectionType,
 )
+from src.services.tenant_health_snapshot import (
+    HealthSnapshotTrigger,
+    mark_tenant_health_dirty,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -250,9 +254,24 @@ class AirbyteConnectionsRepository(BaseRepository[TenantAirbyteConnection]):
         connection.status = status
 
         if last_sync_status:
+            # A success always moves last_sync_at; otherwise only a new
+            # status or sync status changes the tenant's health
+            health_changed = (
+                last_sync_status == "success"
+                or last_sync_status != connection.last_sync_status
+                or status != old_status
+            )
             connection.last_sync_status = last_sync_status
             if last_sync_status == "success":
                 connection.last_sync_at = datetime.now(timezone.utc)
+            if health_changed:
+                mark_tenant_health_dirty(
+                    self.db_session,
+                    connection.tenant_id,
+                    HealthSnapshotTrigger.SYNC_COMPLETED
+                    if last_sync_status == "success"
+                    else HealthSnapshotTrigger.SYNC_FAILED,
+                )
 
         try:
             self.db_session.commit()
@@ -21,6 +21,7 @@ from sqlalchemy.orm import Session
 from src.models.access_revocation import AccessRevocation, RevocationStatus
 from src.models.user_role_assignment import UserRoleAssignment
 from src.models.user_tenant_roles import UserTenantRole
+from src.platform.tenant_resolution_cache import invalidate_tenant_resolution
 
 logger = logging.getLogger(__name__)
 
@@ -159,6 +160,13 @@ class AccessRevocationService:
 
             enforced.append(self._to_dict(revocation))
 
+        if expired:
+            invalidate_tenant_resolution(
+                self.session,
+                user_ids=[revocation.user_id for revocation in expired],
+                reason="access_revocation_enforced",
+            )
+
         logger.info(
             "Enforced expired revocations",
             extra={"count": len(enforced)},
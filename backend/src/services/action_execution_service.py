@@ -28,6 +28,7 @@ SECURITY:
 Story 8.5 - Action Execution (Scoped & Reversible)
 """
 
+import asyncio
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -42,6 +43,7 @@ from src.services.platform_credentials_service import (
     Platform,
 )
 from src.services.platform_executors import (
+    ActionRequest,
     BasePlatformExecutor,
     ExecutionResult,
     StateCapture,
@@ -55,6 +57,15 @@ from src.platform.feature_flags import is_kill_switch_active, FeatureFlag
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _PlatformOutcome:
+    """Platform-side outcome of one action in a batch, before it is recorded."""
+    before_state: Optional[StateCapture] = None
+    result: Optional[ExecutionResult] = None
+    after_state: Optional[StateCapture] = None
+    error: Optional[Exception] = None
+
+
 @dataclass
 class ActionExecutionResult:
     """Result of executing an action."""
@@ -174,8 +185,57 @@ class ActionExecutionService:
         self._validate_action_ready(action)
 
         # 1.5. Safety checks (Story 8.6)
-        # Check kill switch first
-        if await is_kill_switch_active(FeatureFlag.AI_WRITE_BACK):
+        kill_switch_active = await is_kill_switch_active(FeatureFlag.AI_WRITE_BACK)
+        blocked = self._check_safety(action, kill_switch_active)
+        if blocked is not None:
+            return blocked
+
+        # 2. Mark as executing
+        idempotency_key = self._start_execution(action)
+
+        try:
+            # 3. Get platform executor
+            executor = await self._get_executor(action)
+
+            # 4. Capture before state
+            before_state = await self._capture_before_state(action, executor)
+            self._log_state_captured(action, before_state, is_before=True)
+
+            # 5. Execute the action
+            result = await self._execute_on_platform(action, executor, idempotency_key)
+
+            if result.success:
+                # 6. Capture after state
+                after_state = await self._capture_after_state(action, executor)
+
+                # 7-9. Rollback instructions, status, bookkeeping
+                return self._complete_success(action, executor, result, before_state, after_state)
+
+            return self._complete_failure(action, result, before_state)
+
+        except Exception as e:
+            return self._complete_error(action, e)
+
+        finally:
+            # Always commit changes
+            self.db.commit()
+
+    # =========================================================================
+    # Execution Steps
+    # =========================================================================
+
+    def _check_safety(
+        self,
+        action: AIAction,
+        kill_switch_active: bool,
+    ) -> Optional[ActionExecutionResult]:
+        """
+        Run kill switch, rate limit, and cooldown checks (Story 8.6).
+
+        Returns:
+            A blocked result, or None if the action may run
+        """
+        if kill_switch_active:
             self._safety_service.log_action_blocked(
                 action_id=action.id,
                 reason="AI write-back kill switch is active",
@@ -189,7 +249,6 @@ class ActionExecutionService:
                 error_code="KILL_SWITCH_ACTIVE",
             )
 
-        # Check rate limits and cooldowns
         safety_result = self._safety_service.check_action_safety(
             platform=action.platform,
             entity_type=action.target_entity_type.value,
@@ -206,184 +265,188 @@ class ActionExecutionService:
                 error_code="SAFETY_CHECK_FAILED",
             )
 
-        # 2. Mark as executing
+        return None
+
+    def _start_execution(self, action: AIAction) -> str:
+        """Mark the action executing and log the start; returns its idempotency key."""
         idempotency_key = self._generate_idempotency_key(action)
         action.mark_executing(idempotency_key)
         self.db.flush()
 
-        # Log execution start
         self._log_event(action, ActionExecutionLog.log_execution_started(
             tenant_id=self.tenant_id,
             action_id=action.id,
             job_id=action.job_id,
         ))
+        return idempotency_key
 
-        try:
-            # 3. Get platform executor
-            executor = await self._get_executor(action)
-
-            # 4. Capture before state
-            before_state = await self._capture_before_state(action, executor)
-            self._log_event(action, ActionExecutionLog.log_state_captured(
-                tenant_id=self.tenant_id,
-                action_id=action.id,
-                state_snapshot=before_state.to_dict(),
-                is_before=True,
-            ))
+    def _log_state_captured(
+        self,
+        action: AIAction,
+        state: StateCapture,
+        is_before: bool,
+    ) -> None:
+        """Log a before/after state capture."""
+        self._log_event(action, ActionExecutionLog.log_state_captured(
+            tenant_id=self.tenant_id,
+            action_id=action.id,
+            state_snapshot=state.to_dict(),
+            is_before=is_before,
+        ))
 
-            # 5. Execute the action
-            result = await self._execute_on_platform(action, executor, idempotency_key)
+    def _complete_success(
+        self,
+        action: AIAction,
+        executor: BasePlatformExecutor,
+        result: ExecutionResult,
+        before_state: StateCapture,
+        after_state: StateCapture,
+    ) -> ActionExecutionResult:
+        """Record a successful execution: rollback instructions, status, audit."""
+        self._log_state_captured(action, after_state, is_before=False)
+
+        # Generate rollback instructions
+        rollback_instructions = executor.generate_rollback_instructions(
+            action_type=action.action_type.value,
+            before_state=before_state,
+            entity_id=action.target_entity_id,
+            entity_type=action.target_entity_type.value,
+        )
 
-            if result.success:
-                # 6. Capture after state
-                after_state = await self._capture_after_state(action, executor)
-                self._log_event(action, ActionExecutionLog.log_state_captured(
-                    tenant_id=self.tenant_id,
-                    action_id=action.id,
-                    state_snapshot=after_state.to_dict(),
-                    is_before=False,
-                ))
-
-                # 7. Generate rollback instructions
-                rollback_instructions = executor.generate_rollback_instructions(
-                    action_type=action.action_type.value,
-                    before_state=before_state,
-                    entity_id=action.target_entity_id,
-                    entity_type=action.target_entity_type.value,
-                )
+        # Mark as succeeded
+        action.mark_succeeded(
+            before_state=before_state.to_dict(),
+            after_state=after_state.to_dict(),
+            rollback_instructions=rollback_instructions,
+        )
 
-                # 8. Mark as succeeded
-                action.mark_succeeded(
-                    before_state=before_state.to_dict(),
-                    after_state=after_state.to_dict(),
-                    rollback_instructions=rollback_instructions,
-                )
+        self._log_event(action, ActionExecutionLog.log_execution_succeeded(
+            tenant_id=self.tenant_id,
+            action_id=action.id,
+            state_snapshot=result.confirmed_state,
+        ))
 
-                self._log_event(action, ActionExecutionLog.log_execution_succeeded(
-                    tenant_id=self.tenant_id,
-                    action_id=action.id,
-                    state_snapshot=result.confirmed_state,
-                ))
+        # Record successful execution for rate limiting and cooldowns (Story 8.6)
+        self._safety_service.record_action_execution(
+            platform=action.platform,
+            entity_type=action.target_entity_type.value,
+            entity_id=action.target_entity_id,
+            action_type=action.action_type.value,
+        )
 
-                # Record successful execution for rate limiting and cooldowns (Story 8.6)
-                self._safety_service.record_action_execution(
-                    platform=action.platform,
-                    entity_type=action.target_entity_type.value,
-                    entity_id=action.target_entity_id,
-                    action_type=action.action_type.value,
-                )
+        # Record data change event for "What Changed?" panel (Story 9.8)
+        try:
+            self._data_change_aggregator.record_ai_action_executed_simple(
+                action_id=action.id,
+                action_type=action.action_type.value,
+                target_name=action.target_entity_id,
+                platform=action.platform,
+                before_state=before_state.to_dict() if before_state else None,
+                after_state=after_state.to_dict() if after_state else None,
+            )
+        except Exception as e:
+            logger.warning(
+                "Failed to record AI action executed event",
+                extra={"error": str(e), "action_id": action.id},
+            )
 
-                # Record data change event for "What Changed?" panel (Story 9.8)
-                try:
-                    self._data_change_aggregator.record_ai_action_executed_simple(
-                        action_id=action.id,
-                        action_type=action.action_type.value,
-                        target_name=action.target_entity_id,
-                        platform=action.platform,
-                        before_state=before_state.to_dict() if before_state else None,
-                        after_state=after_state.to_dict() if after_state else None,
-                    )
-                except Exception as e:
-                    logger.warning(
-                        "Failed to record AI action executed event",
-                        extra={"error": str(e), "action_id": action.id},
-                    )
-
-                logger.info(
-                    "Action executed successfully",
-                    extra={
-                        "tenant_id": self.tenant_id,
-                        "action_id": action.id,
-                        "platform": action.platform,
-                    }
-                )
+        logger.info(
+            "Action executed successfully",
+            extra={
+                "tenant_id": self.tenant_id,
+                "action_id": action.id,
+                "platform": action.platform,
+            }
+        )
 
-                return ActionExecutionResult(
-                    success=True,
-                    action_id=action.id,
-                    status=action.status,
-                    message=result.message,
-                    before_state=before_state.to_dict(),
-                    after_state=after_state.to_dict(),
-                    rollback_instructions=rollback_instructions,
-                )
+        return ActionExecutionResult(
+            success=True,
+            action_id=action.id,
+            status=action.status,
+            message=result.message,
+            before_state=before_state.to_dict(),
+            after_state=after_state.to_dict(),
+            rollback_instructions=rollback_instructions,
+        )
 
-            else:
-                # Execution failed
-                action.mark_failed(
-                    error_message=result.message,
-                    error_code=result.error_code,
-                    before_state=before_state.to_dict() if before_state else None,
-                )
+    def _complete_failure(
+        self,
+        action: AIAction,
+        result: ExecutionResult,
+        before_state: Optional[StateCapture],
+    ) -> ActionExecutionResult:
+        """Record an execution the platform rejected."""
+        action.mark_failed(
+            error_message=result.message,
+            error_code=result.error_code,
+            before_state=before_state.to_dict() if before_state else None,
+        )
 
-                self._log_event(action, ActionExecutionLog.log_execution_failed(
-                    tenant_id=self.tenant_id,
-                    action_id=action.id,
-                    error_details={
-                        "message": result.message,
-                        "code": result.error_code,
-                        "details": result.error_details,
-                    },
-                    http_status_code=result.http_status_code,
-                ))
-
-                logger.warning(
-                    "Action execution failed",
-                    extra={
-                        "tenant_id": self.tenant_id,
-                        "action_id": action.id,
-                        "error": result.message,
-                        "error_code": result.error_code,
-                    }
-                )
+        self._log_event(action, ActionExecutionLog.log_execution_failed(
+            tenant_id=self.tenant_id,
+            action_id=action.id,
+            error_details={
+                "message": result.message,
+                "code": result.error_code,
+                "details": result.error_details,
+            },
+            http_status_code=result.http_status_code,
+        ))
 
-                return ActionExecutionResult(
-                    success=False,
-                    action_id=action.id,
-                    status=action.status,
-                    message=result.message,
-                    before_state=before_state.to_dict() if before_state else None,
-                    error_code=result.error_code,
-                    error_details=result.error_details,
-                )
+        logger.warning(
+            "Action execution failed",
+            extra={
+                "tenant_id": self.tenant_id,
+                "action_id": action.id,
+                "error": result.message,
+                "error_code": result.error_code,
+            }
+        )
 
-        except Exception as e:
-            # Unexpected error
-            error_message = str(e)
-            action.mark_failed(
-                error_message=error_message,
-                error_code="UNEXPECTED_ERROR",
-            )
+        return ActionExecutionResult(
+            success=False,
+            action_id=action.id,
+            status=action.status,
+            message=result.message,
+            before_state=before_state.to_dict() if before_state else None,
+            error_code=result.error_code,
+            error_details=result.error_details,
+        )
 
-            self._log_event(action, ActionExecutionLog.log_execution_failed(
-                tenant_id=self.tenant_id,
-                action_id=action.id,
-                error_details={
-                    "message": error_message,
-                    "type": type(e).__name__,
-                },
-            ))
+    def _complete_error(self, action: AIAction, error: Exception) -> ActionExecutionResult:
+        """Record an unexpected error during execution."""
+        error_message = str(error)
+        action.mark_failed(
+            error_message=error_message,
+            error_code="UNEXPECTED_ERROR",
+        )
 
-            logger.exception(
-                "Unexpected error during action execution",
-                extra={
-                    "tenant_id": self.tenant_id,
-                    "action_id": action.id,
-                }
-            )
+        self._log_event(action, ActionExecutionLog.log_execution_failed(
+            tenant_id=self.tenant_id,
+            action_id=action.id,
+            error_details={
+                "message": error_message,
+                "type": type(error).__name__,
+            },
+        ))
 
-            return ActionExecutionResult(
-                success=False,
-                action_id=action.id,
-                status=action.status,
-                message=error_message,
-                error_code="UNEXPECTED_ERROR",
-                error_details={"type": type(e).__name__},
-            )
+        logger.error(
+            "Unexpected error during action execution",
+            extra={
+                "tenant_id": self.tenant_id,
+                "action_id": action.id,
+            },
+            exc_info=error,
+        )
 
-        finally:
-            # Always commit changes
-            self.db.commit()
+        return ActionExecutionResult(
+            success=False,
+            action_id=action.id,
+            status=action.status,
+            message=error_message,
+            error_code="UNEXPECTED_ERROR",
+            error_details={"type": type(error).__name__},
+        )
 
     # =========================================================================
     # Helper Methods
@@ -480,7 +543,22 @@ class ActionExecutionService:
         idempotency_key: str,
     ) -> ExecutionResult:
         """Execute action on platform via executor."""
-        # Log the request
+        self._log_api_request(action, idempotency_key)
+
+        # Execute
+        result = await executor.execute_action(
+            action_type=action.action_type.value,
+            entity_id=action.target_entity_id,
+            entity_type=action.target_entity_type.value,
+            params=action.action_params,
+            idempotency_key=idempotency_key,
+        )
+
+        self._log_api_response(action, result)
+        return result
+
+    def _log_api_request(self, action: AIAction, idempotency_key: str) -> None:
+        """Log the request sent to the platform."""
         self._log_event(action, ActionExecutionLog.log_api_request(
             tenant_id=self.tenant_id,
             action_id=action.id,
@@ -493,16 +571,8 @@ class ActionExecutionService:
             },
         ))
 
-        # Execute
-        result = await executor.execute_action(
-            action_type=action.action_type.value,
-            entity_id=action.target_entity_id,
-            entity_type=action.target_entity_type.value,
-            params=action.action_params,
-            idempotency_key=idempotency_key,
-        )
-
-        # Log the response
+    def _log_api_response(self, action: AIAction, result: ExecutionResult) -> None:
+        """Log the platform's response."""
         self._log_event(action, ActionExecutionLog.log_api_response(
             tenant_id=self.tenant_id,
             action_id=action.id,
@@ -510,8 +580,6 @@ class ActionExecutionService:
             http_status_code=result.http_status_code or 0,
         ))
 
-        return result
-
     def _log_event(self, action: AIAction, log_entry: ActionExecutionLog) -> None:
         """Add log entry to database."""
         self.db.add(log_entry)
@@ -528,39 +596,238 @@ class ActionExecutionService:
         """
         Execute multiple actions.
 
-        Actions are executed sequentially (not in parallel) to avoid
-        rate limiting issues with external platforms.
+        Actions are grouped by platform and sent through each executor's
+        batch path: before/after state is read in batches, mutations use
+        the platform's native batch API where there is one, and requests
+        are dispatched concurrently within the ad account's or store's
+        token-bucket budget. Platforms run concurrently with each other.
+
+        Safety semantics match executing the actions one by one. Actions
+        run in waves: a wave never holds two actions on the same entity
+        or more actions than the tenant's remaining hourly quota, so the
+        cooldown and rate-limit checks for later actions see the effects
+        of earlier ones. All database work happens before and after the
+        platform calls of a wave, never during them.
 
         Args:
             action_ids: List of action IDs to execute
 
         Returns:
-            List of execution results
+            List of execution results, in action_ids order
+        """
+        results: list[Optional[ActionExecutionResult]] = [None] * len(action_ids)
+        pending = list(enumerate(action_ids))
+        executors: dict[str, BasePlatformExecutor] = {}
+
+        try:
+            while pending:
+                kill_switch_active = await is_kill_switch_active(FeatureFlag.AI_WRITE_BACK)
+                wave, pending = self._plan_wave(pending, results, kill_switch_active)
+                if wave:
+                    await self._execute_wave(wave, results, executors)
+        finally:
+            for executor in executors.values():
+                close = getattr(executor, "close", None)
+                if close is not None:
+                    try:
+                        await close()
+                    except Exception:
+                        logger.debug("Failed to close platform executor", exc_info=True)
+
+        return results
+
+    def _plan_wave(
+        self,
+        pending: list[tuple[int, str]],
+        results: list[Optional[ActionExecutionResult]],
+        kill_switch_active: bool,
+    ) -> tuple[list[tuple[int, AIAction]], list[tuple[int, str]]]:
         """
-        results = []
+        Pick the actions for the next wave.
 
-        for action_id in action_ids:
+        Actions that fail validation or safety checks get their result
+        recorded here. Returns the admitted (index, action) pairs and the
+        (index, action_id) pairs deferred to a later wave.
+        """
+        quota = self._safety_service.get_rate_limit_status("action_execution")
+        wave: list[tuple[int, AIAction]] = []
+        deferred: list[tuple[int, str]] = []
+        entities: set[tuple[str, str, str]] = set()
+
+        for index, action_id in pending:
             try:
-                result = await self.execute_action(action_id)
-                results.append(result)
+                action = self._get_action(action_id)
+                entity = (
+                    action.platform,
+                    action.target_entity_type.value,
+                    action.target_entity_id,
+                )
+                if entity in entities or (quota.remaining > 0 and len(wave) >= quota.remaining):
+                    deferred.append((index, action_id))
+                    continue
+
+                self._validate_action_ready(action)
+                blocked = self._check_safety(action, kill_switch_active)
+                if blocked is not None:
+                    results[index] = blocked
+                    continue
             except ActionExecutionError as e:
-                results.append(ActionExecutionResult(
+                results[index] = ActionExecutionResult(
                     success=False,
                     action_id=action_id,
                     status=ActionStatus.FAILED,
                     message=str(e),
                     error_code=e.code,
-                ))
+                )
+                continue
             except Exception as e:
-                results.append(ActionExecutionResult(
+                results[index] = ActionExecutionResult(
                     success=False,
                     action_id=action_id,
                     status=ActionStatus.FAILED,
                     message=str(e),
                     error_code="UNEXPECTED_ERROR",
-                ))
+                )
+                continue
 
-        return results
+            entities.add(entity)
+            wave.append((index, action))
+
+        return wave, deferred
+
+    async def _execute_wave(
+        self,
+        wave: list[tuple[int, AIAction]],
+        results: list[Optional[ActionExecutionResult]],
+        executors: dict[str, BasePlatformExecutor],
+    ) -> None:
+        """Execute one wave of admitted actions and record the outcomes."""
+        try:
+            # Database work before any platform call
+            by_platform: dict[str, list[tuple[int, AIAction, ActionRequest]]] = {}
+            for index, action in wave:
+                idempotency_key = self._start_execution(action)
+                self._log_api_request(action, idempotency_key)
+                request = ActionRequest(
+                    action_type=action.action_type.value,
+                    entity_id=action.target_entity_id,
+                    entity_type=action.target_entity_type.value,
+                    params=action.action_params,
+                    idempotency_key=idempotency_key,
+                )
+                by_platform.setdefault(action.platform.lower(), []).append(
+                    (index, action, request)
+                )
+
+            groups = []
+            for platform, items in by_platform.items():
+                if platform not in executors:
+                    try:
+                        executors[platform] = await self._get_executor(items[0][1])
+                    except Exception as e:
+                        for index, action, _ in items:
+                            results[index] = self._complete_error(action, e)
+                        continue
+                groups.append((executors[platform], items))
+
+            # Platform calls, concurrently per platform
+            outcomes = await asyncio.gather(*(
+                self._run_platform_batch(executor, [request for _, _, request in items])
+                for executor, items in groups
+            ))
+
+            # Database work after all platform calls
+            for (executor, items), platform_outcomes in zip(groups, outcomes):
+                for (index, action, _), outcome in zip(items, platform_outcomes):
+                    results[index] = self._record_outcome(action, executor, outcome)
+        finally:
+            self.db.commit()
+
+    async def _run_platform_batch(
+        self,
+        executor: BasePlatformExecutor,
+        requests: list[ActionRequest],
+    ) -> list["_PlatformOutcome"]:
+        """
+        Capture state and execute a batch of actions on one platform.
+
+        Makes no database calls and never raises: state that the batched
+        read could not return is captured per entity, so a failing entity
+        only fails its own action, and an unexpected error fails only this
+        platform's actions.
+        """
+        outcomes = [_PlatformOutcome() for _ in requests]
+
+        try:
+            before = await executor.get_entity_states(
+                [(r.entity_id, r.entity_type) for r in requests]
+            )
+            runnable: list[int] = []
+            for i, request in enumerate(requests):
+                try:
+                    outcomes[i].before_state = before.get(
+                        (request.entity_id, request.entity_type)
+                    ) or await executor.capture_before_state(request.entity_id, request.entity_type)
+                    runnable.append(i)
+                except Exception as e:
+                    outcomes[i].error = e
+
+            executed = await executor.execute_actions([requests[i] for i in runnable])
+            for i, result in zip(runnable, executed):
+                outcomes[i].result = result
+
+            succeeded = [i for i in runnable if outcomes[i].result.success]
+            after = await executor.get_entity_states(
+                [(requests[i].entity_id, requests[i].entity_type) for i in succeeded]
+            )
+            for i in succeeded:
+                request = requests[i]
+                try:
+                    outcomes[i].after_state = after.get(
+                        (request.entity_id, request.entity_type)
+                    ) or await executor.capture_after_state(request.entity_id, request.entity_type)
+                except Exception as e:
+                    outcomes[i].error = e
+        except Exception as e:
+            logger.warning(
+                "Platform batch failed",
+                extra={"tenant_id": self.tenant_id, "batch_size": len(requests)},
+                exc_info=True,
+            )
+            for outcome in outcomes:
+                if outcome.error is None:
+                    outcome.error = e
+
+        return outcomes
+
+    def _record_outcome(
+        self,
+        action: AIAction,
+        executor: BasePlatformExecutor,
+        outcome: "_PlatformOutcome",
+    ) -> ActionExecutionResult:
+        """Write the outcome of a batched execution, as execute_action would."""
+        try:
+            if outcome.before_state is None or outcome.result is None:
+                return self._complete_error(action, outcome.error)
+
+            self._log_state_captured(action, outcome.before_state, is_before=True)
+            self._log_api_response(action, outcome.result)
+
+            if not outcome.result.success:
+                return self._complete_failure(action, outcome.result, outcome.before_state)
+            if outcome.after_state is None:
+                return self._complete_error(action, outcome.error)
+
+            # Batched mutations skip the per-action verification read
+            if outcome.result.confirmed_state is None:
+                outcome.result.confirmed_state = outcome.after_state.state
+
+            return self._complete_success(
+                action, executor, outcome.result, outcome.before_state, outcome.after_state,
+            )
+        except Exception as e:
+            return self._complete_error(action, e)
 
     # =========================================================================
     # Query Methods
@@ -134,7 +134,7 @@ class ActionJobRunner:
                 retry_config=self.retry_config,
             )
 
-            # Execute actions sequentially
+            # Execute actions (batched per platform, rate limited per account)
             results = await execution_service.execute_batch(action_ids)
 
             # Collect results
@@ -20,12 +20,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from src.models.ai_recommendation import (
     AIRecommendation,
@@ -42,6 +42,7 @@ from src.models.action_proposal import (
     get_default_expiration,
 )
 from src.models.action_approval_audit import ActionApprovalAudit, AuditAction
+from src.services.bulk_insert import existing_content_hashes, insert_ignoring_duplicates
 from src.services.action_proposal_validation import (
     ActionProposalValidationService,
     calculate_risk_level_for_change,
@@ -153,11 +154,7 @@ class ActionProposalGenerationService:
             recommendations_processed += 1
 
         # Persist proposals
-        persisted = []
-        for detected in all_detected:
-            proposal = self._persist_proposal(detected, job_id)
-            if proposal:
-                persisted.append(proposal)
+        persisted = self._persist_proposals(all_detected, job_id)
 
         logger.info(
             "Action proposals generated",
@@ -428,14 +425,75 @@ class ActionProposalGenerationService:
         content = "|".join(parts)
         return hashlib.sha256(content.encode()).hexdigest()
 
-    def _persist_proposal(
+    def _persist_proposals(
         self,
-        detected: DetectedProposal,
+        detected_proposals: list[DetectedProposal],
         job_id: str,
-    ) -> ActionProposal | None:
-        """Persist proposal to database, handling deduplication."""
-        content_hash = self._generate_content_hash(detected)
+    ) -> list[ActionProposal]:
+        """
+        Persist detected proposals in batches, skipping duplicates.
+
+        Effect text and disclaimers are rendered only for hashes not
+        already stored; inserts use ON CONFLICT DO NOTHING so a duplicate
+        never discards the batch. CREATED audit entries are added for the
+        inserted proposals only.
+        """
+        by_hash: dict[str, DetectedProposal] = {}
+        for detected in detected_proposals:
+            by_hash.setdefault(self._generate_content_hash(detected), detected)
+
+        existing = existing_content_hashes(
+            self.db, ActionProposal, self.tenant_id, by_hash,
+        )
+        generated_at = datetime.now(timezone.utc)
+        expires_at = get_default_expiration()
+
+        rows = [
+            self._build_proposal_row(detected, content_hash, job_id, generated_at, expires_at)
+            for content_hash, detected in by_hash.items()
+            if content_hash not in existing
+        ]
+
+        inserted = insert_ignoring_duplicates(
+            self.db,
+            ActionProposal,
+            rows,
+            ("tenant_id", "content_hash", "source_recommendation_id"),
+        )
 
+        if inserted:
+            # Create audit entries for proposal creation
+            self.db.add_all([
+                ActionApprovalAudit.create_entry(
+                    tenant_id=self.tenant_id,
+                    action_proposal_id=proposal.id,
+                    action=AuditAction.CREATED,
+                    new_status=ActionStatus.PROPOSED,
+                    previous_status=None,
+                )
+                for proposal in inserted
+            ])
+            self.db.flush()
+
+        logger.debug(
+            "Proposals deduplicated",
+            extra={
+                "tenant_id": self.tenant_id,
+                "detected": len(detected_proposals),
+                "duplicates": len(detected_proposals) - len(inserted),
+            },
+        )
+        return inserted
+
+    def _build_proposal_row(
+        self,
+        detected: DetectedProposal,
+        content_hash: str,
+        job_id: str,
+        generated_at: datetime,
+        expires_at: datetime,
+    ) -> dict[str, Any]:
+        """Render texts and build column values for one new proposal."""
         # Generate risk disclaimer
         risk_disclaimer = get_risk_disclaimer(
             detected.action_type,
@@ -451,55 +509,28 @@ class ActionProposalGenerationService:
             currency=detected.currency or "USD",
         )
 
-        proposal = ActionProposal(
-            tenant_id=self.tenant_id,
-            source_recommendation_id=detected.source_recommendation_id,
-            action_type=detected.action_type,
-            status=ActionStatus.PROPOSED,
-            target_platform=detected.target_platform,
-            target_entity_type=detected.target_entity_type,
-            target_entity_id=detected.target_entity_id,
-            target_entity_name=detected.target_entity_name,
-            proposed_change=detected.proposed_change,
-            current_value=detected.current_value,
-            expected_effect=expected_effect,
-            risk_disclaimer=risk_disclaimer,
-            risk_level=detected.risk_level,
-            confidence_score=detected.confidence_score,
-            expires_at=get_default_expiration(),
-            content_hash=content_hash,
-            generated_at=datetime.now(timezone.utc),
-            job_id=job_id,
-            proposal_metadata={},
-        )
-
-        try:
-            self.db.add(proposal)
-            self.db.flush()
-
-            # Create audit entry for proposal creation
-            audit_entry = ActionApprovalAudit.create_entry(
-                tenant_id=self.tenant_id,
-                action_proposal_id=proposal.id,
-                action=AuditAction.CREATED,
-                new_status=ActionStatus.PROPOSED,
-                previous_status=None,
-            )
-            self.db.add(audit_entry)
-            self.db.flush()
-
-            return proposal
-        except IntegrityError:
-            self.db.rollback()
-            logger.debug(
-                "Proposal deduplicated",
-                extra={
-                    "tenant_id": self.tenant_id,
-                    "content_hash": content_hash,
-                    "recommendation_id": detected.source_recommendation_id,
-                },
-            )
-            return None
+        return {
+            "id": str(uuid.uuid4()),
+            "tenant_id": self.tenant_id,
+            "source_recommendation_id": detected.source_recommendation_id,
+            "action_type": detected.action_type,
+            "status": ActionStatus.PROPOSED,
+            "target_platform": detected.target_platform,
+            "target_entity_type": detected.target_entity_type,
+            "target_entity_id": detected.target_entity_id,
+            "target_entity_name": detected.target_entity_name,
+            "proposed_change": detected.proposed_change,
+            "current_value": detected.current_value,
+            "expected_effect": expected_effect,
+            "risk_disclaimer": risk_disclaimer,
+            "risk_level": detected.risk_level,
+            "confidence_score": detected.confidence_score,
+            "expires_at": expires_at,
+            "content_hash": content_hash,
+            "generated_at": generated_at,
+            "job_id": job_id,
+            "proposal_metadata": {},
+        }
 
     def generate_for_single_recommendation(
         self,
@@ -516,8 +547,6 @@ class ActionProposalGenerationService:
         Returns:
             Generated ActionProposal or None
         """
-        import uuid
-
         if not job_id:
             job_id = str(uuid.uuid4())
 
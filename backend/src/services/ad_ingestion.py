@@ -21,6 +21,7 @@ from typing import Optional, List
 from sqlalchemy.orm import Session
 
 from src.integrations.airbyte.client import AirbyteClient, get_airbyte_client
+from src.integrations.airbyte.job_watcher import AirbyteJobWatcher, watcher_for_client
 from src.integrations.airbyte.exceptions import (
     AirbyteError,
     AirbyteNotFoundError,
@@ -164,6 +165,7 @@ class AdIngestionService:
         db_session: Session,
         tenant_id: str,
         airbyte_client: Optional[AirbyteClient] = None,
+        job_watcher: Optional[AirbyteJobWatcher] = None,
     ):
         """
         Initialize ad ingestion service.
@@ -172,6 +174,7 @@ class AdIngestionService:
             db_session: Database session
             tenant_id: Tenant ID from JWT (org_id)
             airbyte_client: Optional Airbyte client (creates default if not provided)
+            job_watcher: Optional job watcher (uses the shared watcher if not provided)
 
         Raises:
             ValueError: If tenant_id is empty or None
@@ -183,6 +186,7 @@ class AdIngestionService:
         self.tenant_id = tenant_id
         self._airbyte_service = AirbyteService(db_session, tenant_id)
         self._airbyte_client = airbyte_client
+        self._job_watcher = job_watcher
 
     def _get_airbyte_client(self) -> AirbyteClient:
         """Get or create Airbyte client."""
@@ -190,6 +194,12 @@ class AdIngestionService:
             self._airbyte_client = get_airbyte_client()
         return self._airbyte_client
 
+    def _get_job_watcher(self) -> AirbyteJobWatcher:
+        """Get the watcher that tracks sync completion."""
+        if self._job_watcher is None:
+            self._job_watcher = watcher_for_client(self._airbyte_client)
+        return self._job_watcher
+
     def _validate_meta_credentials(self, credentials: AdAccountCredentials) -> None:
         """Validate Meta Ads credentials are complete."""
         if not credentials.access_token:
@@ -818,9 +828,11 @@ class AdIngestionService:
 
         try:
             client = self._get_airbyte_client()
-            result = await client.sync_and_wait(
-                connection_id=connection.airbyte_connection_id,
+            job_id = await client.trigger_sync(connection.airbyte_connection_id)
+            result = await self._get_job_watcher().wait_for_job(
+                job_id=job_id,
                 timeout_seconds=timeout_seconds,
+                connection_id=connection.airbyte_connection_id,
             )
 
             # Update connection status based on result
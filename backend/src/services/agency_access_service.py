@@ -31,6 +31,7 @@ from src.models.user_role_assignment import UserRoleAssignment
 from src.models.user_tenant_roles import UserTenantRole
 from src.models.user import User
 from src.models.tenant import Tenant, TenantStatus
+from src.platform.tenant_resolution_cache import invalidate_tenant_resolution
 
 logger = logging.getLogger(__name__)
 
@@ -286,6 +287,11 @@ class AgencyAccessService:
 
         self.session.flush()
 
+        # New tenant in the agency user's allowed list
+        invalidate_tenant_resolution(
+            self.session, user_ids=[request.requesting_user_id], reason="agency_access_approved"
+        )
+
         # Emit audit event
         try:
             from src.services.audit_logger import emit_agency_access_approved
@@ -1,12 +1,17 @@
 """
 GA Audit Log Export Service.
 
-Exports GA audit logs to CSV or JSON format with:
+Exports GA audit logs to CSV, JSON or NDJSON format with:
 - Tenant-scoped or global (depending on role)
 - Rate limiting (3 exports per tenant per 24h)
 - Sanitized output (PII already stripped at ingestion)
 - Async job support for large exports (>10K rows)
 
+Streaming exports (stream_export / export_to_store) read rows with
+keyset pagination on (created_at, id) through a server-side cursor and
+encode them chunk by chunk (optionally gzip), so memory stays flat
+regardless of export size.
+
 Export attempts are themselves audited.
 """
 
@@ -15,14 +20,19 @@ import io
 import json
 import logging
 import uuid
+import zlib
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional
 
+from sqlalchemy import select, tuple_
 from sqlalchemy.orm import Session
 
+from src.models.audit_export import AuditExportStatus, GAAuditExport
 from src.models.audit_log import GAAuditLog
+from src.platform.pagination import CountMode
 from src.services.audit_query_service import AuditQueryService
+from src.services.export_store import ExportStore
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +40,38 @@ logger = logging.getLogger(__name__)
 class ExportFormat(str, Enum):
     CSV = "csv"
     JSON = "json"
+    NDJSON = "ndjson"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.JSON: "application/json",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+EXPORT_HEADERS = [
+    "id", "event_type", "user_id", "tenant_id", "dashboard_id",
+    "access_surface", "success", "metadata", "correlation_id",
+    "created_at",
+]
+
+_EXPORT_COLUMNS = (
+    GAAuditLog.id,
+    GAAuditLog.event_type,
+    GAAuditLog.user_id,
+    GAAuditLog.tenant_id,
+    GAAuditLog.dashboard_id,
+    GAAuditLog.access_surface,
+    GAAuditLog.success,
+    GAAuditLog.event_metadata,
+    GAAuditLog.correlation_id,
+    GAAuditLog.created_at,
+)
+
+
+def export_filename(fmt: ExportFormat, compress: bool = False) -> str:
+    """Download filename for an export."""
+    return f"audit-logs.{fmt.value}" + (".gz" if compress else "")
 
 
 class ExportResult:
@@ -69,6 +111,10 @@ class AuditExporterService:
 
     RATE_LIMIT_MAX = 3
     ASYNC_THRESHOLD = 10_000
+    # Rows per keyset page / server-side cursor batch
+    EXPORT_PAGE_SIZE = 5_000
+    # Encoded text buffered before a chunk is emitted
+    EXPORT_CHUNK_BYTES = 64 * 1024
 
     def __init__(self, db: Session):
         self.db = db
@@ -145,7 +191,8 @@ class AuditExporterService:
             )
 
         try:
-            # Query logs
+            # Query logs; the async decision and the audited record_count
+            # need an exact total, not the planner estimate
             result = self._query_service.query_logs(
                 tenant_id=tenant_id if not is_super_admin else None,
                 accessible_tenants={tenant_id} if not is_super_admin else None,
@@ -156,10 +203,23 @@ class AuditExporterService:
                 end_date=end_date,
                 limit=self.ASYNC_THRESHOLD + 1,
                 offset=0,
+                count=CountMode.EXACT,
             )
 
             # Check if async is needed
             if result.total > self.ASYNC_THRESHOLD:
+                self._enqueue_export(
+                    export_id=export_id,
+                    tenant_id=tenant_id,
+                    fmt=fmt,
+                    is_super_admin=is_super_admin,
+                    filters={
+                        "event_type": event_type,
+                        "dashboard_id": dashboard_id,
+                        "start_date": start_date.isoformat() if start_date else None,
+                        "end_date": end_date.isoformat() if end_date else None,
+                    },
+                )
                 self._audit_export_attempt(
                     tenant_id=tenant_id,
                     export_id=export_id,
@@ -222,17 +282,256 @@ class AuditExporterService:
                 error=str(exc),
             )
 
+    def _enqueue_export(
+        self,
+        export_id: str,
+        tenant_id: str,
+        fmt: ExportFormat,
+        is_super_admin: bool,
+        filters: dict[str, Any],
+        compress: bool = False,
+    ) -> None:
+        """Queue a large export for the audit export worker."""
+        self.db.add(GAAuditExport(
+            id=export_id,
+            tenant_id=tenant_id,
+            is_super_admin=is_super_admin,
+            format=fmt.value,
+            compress=compress,
+            filters=filters,
+            status=AuditExportStatus.QUEUED.value,
+        ))
+        self.db.commit()
+
+    # ------------------------------------------------------------------
+    # Streaming export
+    # ------------------------------------------------------------------
+
+    def stream_export(
+        self,
+        tenant_id: str,
+        fmt: ExportFormat = ExportFormat.CSV,
+        *,
+        compress: bool = False,
+        is_super_admin: bool = False,
+        event_type: Optional[str] = None,
+        dashboard_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> tuple[ExportResult, Optional[Iterator[bytes]]]:
+        """
+        Start a streaming export.
+
+        Returns the ExportResult (record_count is unknown up front and
+        reported as 0) and an iterator of encoded byte chunks, or None if
+        the export was refused. The attempt is audited with the final
+        record count once the iterator is exhausted or closed.
+        """
+        export_id = str(uuid.uuid4())
+
+        allowed, _ = self.check_rate_limit(tenant_id)
+        if not allowed:
+            self._audit_export_attempt(
+                tenant_id=tenant_id,
+                export_id=export_id,
+                fmt=fmt,
+                success=False,
+                error="rate_limit_exceeded",
+            )
+            return ExportResult(
+                export_id=export_id,
+                success=False,
+                record_count=0,
+                fmt=fmt,
+                error=f"Rate limit exceeded. Max {self.RATE_LIMIT_MAX} exports/day.",
+            ), None
+
+        self._record_export(tenant_id)
+        rows = self.iter_export_rows(
+            tenant_id,
+            is_super_admin=is_super_admin,
+            event_type=event_type,
+            dashboard_id=dashboard_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+        result = ExportResult(export_id=export_id, success=True, record_count=0, fmt=fmt)
+        return result, self._audited_stream(result, rows, tenant_id, compress)
+
+    def export_to_store(self, export: GAAuditExport, store: ExportStore) -> int:
+        """
+        Stream a queued export into the file store.
+
+        Sets export.storage_key; the caller owns the status transition.
+
+        Returns:
+            Number of rows exported
+        """
+        fmt = ExportFormat(export.format)
+        filters = export.filters or {}
+        counter = [0]
+        rows = self._counted(
+            self.iter_export_rows(
+                export.tenant_id,
+                is_super_admin=export.is_super_admin,
+                event_type=filters.get("event_type"),
+                dashboard_id=filters.get("dashboard_id"),
+                start_date=_parse_datetime(filters.get("start_date")),
+                end_date=_parse_datetime(filters.get("end_date")),
+            ),
+            counter,
+        )
+        key = f"{export.tenant_id}/{export.id}.{fmt.value}" + (".gz" if export.compress else "")
+        store.write(key, self.encode_rows(rows, fmt, compress=export.compress))
+        export.storage_key = key
+        return counter[0]
+
+    def iter_export_rows(
+        self,
+        tenant_id: Optional[str],
+        *,
+        is_super_admin: bool = False,
+        event_type: Optional[str] = None,
+        dashboard_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[Any]:
+        """
+        Yield audit rows in (created_at, id) order using keyset pagination.
+
+        Each page is one index range scan read through a server-side
+        cursor, so neither the DB nor this process materializes the full
+        result. Rows are plain column tuples (no ORM identity map growth).
+        Without end_date the export is bounded at its start time so rows
+        appended while streaming are not chased.
+        """
+        base = select(*_EXPORT_COLUMNS)
+        if not is_super_admin:
+            base = base.where(GAAuditLog.tenant_id == tenant_id)
+        if event_type:
+            base = base.where(GAAuditLog.event_type == event_type)
+        if dashboard_id:
+            base = base.where(GAAuditLog.dashboard_id == dashboard_id)
+        if start_date:
+            base = base.where(GAAuditLog.created_at >= start_date)
+        base = base.where(GAAuditLog.created_at <= (end_date or datetime.now(timezone.utc)))
+        base = base.order_by(GAAuditLog.created_at, GAAuditLog.id).limit(self.EXPORT_PAGE_SIZE)
+
+        last_key = None
+        while True:
+            stmt = base
+            if last_key is not None:
+                stmt = stmt.where(
+                    tuple_(GAAuditLog.created_at, GAAuditLog.id) > tuple_(*last_key)
+                )
+            result = self.db.execute(
+                stmt.execution_options(stream_results=True, yield_per=1000)
+            )
+            page_rows = 0
+            for row in result:
+                page_rows += 1
+                last_key = (row.created_at, row.id)
+                yield row
+            if page_rows < self.EXPORT_PAGE_SIZE:
+                return
+
+    def encode_rows(
+        self,
+        rows: Iterable[Any],
+        fmt: ExportFormat,
+        *,
+        compress: bool = False,
+    ) -> Iterator[bytes]:
+        """Encode rows as CSV/JSON/NDJSON byte chunks, optionally gzip."""
+        chunks = (text.encode("utf-8") for text in self._encode_text(rows, fmt))
+        if not compress:
+            yield from chunks
+            return
+        gzipper = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+        for chunk in chunks:
+            compressed = gzipper.compress(chunk)
+            if compressed:
+                yield compressed
+        yield gzipper.flush()
+
+    def _encode_text(self, rows: Iterable[Any], fmt: ExportFormat) -> Iterator[str]:
+        buffer = io.StringIO()
+        count = 0
+
+        if fmt == ExportFormat.CSV:
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_HEADERS)
+        elif fmt == ExportFormat.JSON:
+            buffer.write('{"audit_logs": [')
+
+        for row in rows:
+            record = _export_record(row)
+            if fmt == ExportFormat.CSV:
+                writer.writerow([
+                    record["id"],
+                    record["event_type"],
+                    record["user_id"] or "",
+                    record["tenant_id"] or "",
+                    record["dashboard_id"] or "",
+                    record["access_surface"],
+                    record["success"],
+                    json.dumps(record["metadata"] or {}),
+                    record["correlation_id"],
+                    record["created_at"] or "",
+                ])
+            elif fmt == ExportFormat.JSON:
+                buffer.write(("," if count else "") + json.dumps(record))
+            else:
+                buffer.write(json.dumps(record) + "\n")
+            count += 1
+
+            if buffer.tell() >= self.EXPORT_CHUNK_BYTES:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        if fmt == ExportFormat.JSON:
+            buffer.write(f'], "count": {count}}}')
+        if buffer.tell():
+            yield buffer.getvalue()
+
+    @staticmethod
+    def _counted(rows: Iterable[Any], counter: list[int]) -> Iterator[Any]:
+        for row in rows:
+            counter[0] += 1
+            yield row
+
+    def _audited_stream(
+        self,
+        result: ExportResult,
+        rows: Iterator[Any],
+        tenant_id: str,
+        compress: bool,
+    ) -> Iterator[bytes]:
+        counter = [0]
+        completed = False
+        try:
+            yield from self.encode_rows(
+                self._counted(rows, counter), result.format, compress=compress
+            )
+            completed = True
+        finally:
+            result.record_count = counter[0]
+            self._audit_export_attempt(
+                tenant_id=tenant_id,
+                export_id=result.export_id,
+                fmt=result.format,
+                success=completed,
+                record_count=counter[0],
+                error=None if completed else "stream_aborted",
+            )
+
     def _format_csv(self, logs: list[GAAuditLog]) -> str:
         """Format audit logs as CSV."""
         output = io.StringIO()
         writer = csv.writer(output)
 
-        headers = [
-            "id", "event_type", "user_id", "tenant_id", "dashboard_id",
-            "access_surface", "success", "metadata", "correlation_id",
-            "created_at",
-        ]
-        writer.writerow(headers)
+        writer.writerow(EXPORT_HEADERS)
 
         for log in logs:
             metadata_str = json.dumps(log.metadata) if log.metadata else "{}"
@@ -331,3 +630,23 @@ class AuditExporterService:
                 extra={"export_id": export_id},
                 exc_info=True,
             )
+
+
+def _export_record(row: Any) -> dict[str, Any]:
+    """Serializable dict for one exported audit row."""
+    return {
+        "id": row.id,
+        "event_type": row.event_type,
+        "user_id": row.user_id,
+        "tenant_id": row.tenant_id,
+        "dashboard_id": row.dashboard_id,
+        "access_surface": row.access_surface,
+        "success": row.success,
+        "metadata": row.event_metadata,
+        "correlation_id": row.correlation_id,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+    }
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
@@ -7,7 +7,8 @@ Access rules:
 - Other users   → no access (403)
 
 Supports filters: date range, event_type, dashboard_id
-Pagination required on all list queries.
+Pagination required on all list queries: keyset cursors over
+(created_at, id), with offset kept for existing clients.
 """
 
 import logging
@@ -18,6 +19,7 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.models.audit_log import GAAuditLog, AuditEventType
+from src.platform.pagination import CountMode, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -25,20 +27,30 @@ logger = logging.getLogger(__name__)
 class AuditQueryResult:
     """Paginated audit query result."""
 
-    __slots__ = ("items", "total", "limit", "offset", "has_more")
+    __slots__ = (
+        "items", "total", "limit", "offset", "has_more",
+        "next_cursor", "total_is_estimate",
+    )
 
     def __init__(
         self,
         items: list[GAAuditLog],
-        total: int,
+        total: Optional[int],
         limit: int,
         offset: int,
+        has_more: Optional[bool] = None,
+        next_cursor: Optional[str] = None,
+        total_is_estimate: bool = False,
     ):
         self.items = items
         self.total = total
         self.limit = limit
         self.offset = offset
-        self.has_more = (offset + limit) < total
+        if has_more is None:
+            has_more = total is not None and (offset + limit) < total
+        self.has_more = has_more
+        self.next_cursor = next_cursor
+        self.total_is_estimate = total_is_estimate
 
 
 class AuditQueryService:
@@ -69,6 +81,8 @@ class AuditQueryService:
         correlation_id: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.ESTIMATED,
     ) -> AuditQueryResult:
         """
         Query audit logs with filters and pagination.
@@ -85,10 +99,15 @@ class AuditQueryService:
             end_date: End of date range filter
             correlation_id: Filter by correlation ID
             limit: Page size (max 500)
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: next_cursor of the previous page
+            count: How to compute total (estimated by default)
 
         Returns:
             AuditQueryResult with items, total count, pagination info
+
+        Raises:
+            InvalidCursorError: cursor cannot be decoded
         """
         limit = min(limit, self.MAX_PAGE_SIZE)
 
@@ -130,23 +149,25 @@ class AuditQueryService:
         if correlation_id:
             query = query.filter(GAAuditLog.correlation_id == correlation_id)
 
-        # Count total
-        total = query.count()
-
         # Paginated results ordered by most recent first
-        items = (
-            query
-            .order_by(GAAuditLog.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        page = paginate(
+            query,
+            sort_column=GAAuditLog.created_at,
+            id_column=GAAuditLog.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            count=count,
         )
 
         return AuditQueryResult(
-            items=items,
-            total=total,
+            items=page.items,
+            total=page.total,
             limit=limit,
             offset=offset,
+            has_more=page.has_more,
+            next_cursor=page.next_cursor,
+            total_is_estimate=page.total_is_estimate,
         )
 
     def count_by_event_type(
@@ -7,6 +7,10 @@ Understands the full dbt dependency chain:
 
 Produces an ordered execution plan with cost estimates.
 
+The dependency graph comes from the deployed dbt manifest (via the shared
+ManifestIndex) when one is available; MODEL_REGISTRY is the fallback for
+environments without dbt artifacts.
+
 Story 3.4 - Backfill Planning
 """
 
@@ -14,8 +18,11 @@ import logging
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
+from functools import lru_cache
 from typing import Optional
 
+from src.services.dbt_manifest_index import ManifestIndex, get_manifest_index
+
 logger = logging.getLogger(__name__)
 
 
@@ -98,7 +105,7 @@ SOURCE_TO_STAGING: dict[str, list[str]] = {
 }
 
 
-# Full model registry — encodes the dbt dependency graph.
+# Static model registry — fallback dependency graph when no manifest is deployed.
 MODEL_REGISTRY: dict[str, DbtModel] = {
     # --- Staging (Layer 2) ---
     "stg_shopify_orders": DbtModel(
@@ -272,6 +279,62 @@ for _model_name, _model in MODEL_REGISTRY.items():
         _DEPENDENTS.setdefault(_dep, set()).add(_model_name)
 
 
+# Top-level models/ directory (fqn[1]) -> pipeline layer.
+_LAYER_BY_MODEL_DIR: dict[str, ModelLayer] = {
+    "raw_sources": ModelLayer.RAW,
+    "staging": ModelLayer.STAGING,
+    "canonical": ModelLayer.CANONICAL,
+    "attribution": ModelLayer.ATTRIBUTION,
+    "semantic_views": ModelLayer.SEMANTIC,
+    "metrics": ModelLayer.METRICS,
+    "marts": ModelLayer.MARTS,
+}
+
+
+@lru_cache(maxsize=4)
+def _models_from_manifest(index: ManifestIndex) -> dict[str, DbtModel]:
+    """
+    DbtModel entries for every model in the manifest (built once per index).
+
+    The layer comes from the model's directory; models outside the known
+    layer directories keep their MODEL_REGISTRY layer, or else sit at the
+    latest layer of their parents.
+    """
+    nodes = {node.name: node for node in index.models()}
+    layers: dict[str, ModelLayer] = {}
+
+    def layer_of(name: str, visiting: frozenset = frozenset()) -> ModelLayer:
+        if name in layers:
+            return layers[name]
+        node = nodes[name]
+        if len(node.fqn) > 2 and node.fqn[1] in _LAYER_BY_MODEL_DIR:
+            layer = _LAYER_BY_MODEL_DIR[node.fqn[1]]
+        elif name in MODEL_REGISTRY:
+            layer = MODEL_REGISTRY[name].layer
+        else:
+            layer = max(
+                (
+                    layer_of(p, visiting | {name})
+                    for p in index.parents(name)
+                    if p in nodes and p not in visiting
+                ),
+                key=lambda parent_layer: parent_layer.order,
+                default=ModelLayer.STAGING,
+            )
+        layers[name] = layer
+        return layer
+
+    return {
+        name: DbtModel(
+            name=name,
+            layer=layer_of(name),
+            materialization=node.materialization or "view",
+            depends_on=tuple(p for p in index.parents(name) if p in nodes),
+        )
+        for name, node in nodes.items()
+    }
+
+
 # =============================================================================
 # Cost estimation constants
 # =============================================================================
@@ -352,6 +415,18 @@ class BackfillPlanner:
     to find all affected downstream models, then produces an ordered plan.
     """
 
+    def __init__(self, manifest_index: Optional[ManifestIndex] = None):
+        """
+        Args:
+            manifest_index: dbt manifest to plan against (default: the
+                deployed manifest, falling back to MODEL_REGISTRY)
+        """
+        self._index = manifest_index if manifest_index is not None else get_manifest_index()
+        if self._index is not None:
+            self._models = _models_from_manifest(self._index)
+        else:
+            self._models = MODEL_REGISTRY
+
     def plan(
         self,
         tenant_id: str,
@@ -379,7 +454,7 @@ class BackfillPlanner:
         affected_sorted = sorted(
             affected,
             key=lambda name: (
-                MODEL_REGISTRY[name].layer.order,
+                self._models[name].layer.order,
                 name,
             ),
         )
@@ -402,7 +477,7 @@ class BackfillPlanner:
         dbt_cmd = f"dbt run --select {model_selector} --vars '{dbt_vars}'"
 
         # Check if this is a partial rebuild (not all models in the graph).
-        is_partial = len(affected_sorted) < len(MODEL_REGISTRY)
+        is_partial = len(affected_sorted) < len(self._models)
 
         plan = BackfillPlan(
             tenant_id=tenant_id,
@@ -434,13 +509,17 @@ class BackfillPlanner:
     # Internal helpers
     # --------------------------------------------------------------------- #
 
-    @staticmethod
-    def _resolve_downstream(seed_models: list[str]) -> set[str]:
+    def _resolve_downstream(self, seed_models: list[str]) -> set[str]:
         """
         BFS forward through the dependency graph starting from *seed_models*.
 
         Returns the set of all affected models (including seeds).
         """
+        if self._index is not None:
+            return self._index.downstream(
+                [name for name in seed_models if name in self._models]
+            )
+
         visited: set[str] = set()
         queue = list(seed_models)
 
@@ -457,12 +536,11 @@ class BackfillPlanner:
 
         return visited
 
-    @staticmethod
-    def _build_steps(models_sorted: list[str]) -> list[BackfillStep]:
+    def _build_steps(self, models_sorted: list[str]) -> list[BackfillStep]:
         """Convert sorted model list into execution steps."""
         steps: list[BackfillStep] = []
         for idx, name in enumerate(models_sorted, start=1):
-            model = MODEL_REGISTRY[name]
+            model = self._models[name]
             steps.append(BackfillStep(
                 order=idx,
                 layer=model.layer.value,
@@ -473,8 +551,8 @@ class BackfillPlanner:
             ))
         return steps
 
-    @staticmethod
     def _estimate_cost(
+        self,
         source_system: str,
         start_date: date,
         end_date: date,
@@ -489,7 +567,7 @@ class BackfillPlanner:
         total_rows = raw_rows
         total_seconds = 0.0
         for name in affected_models:
-            model = MODEL_REGISTRY[name]
+            model = self._models[name]
             sec_per_k = _SECONDS_PER_1K_ROWS.get(
                 model.materialization, 1.0
             )
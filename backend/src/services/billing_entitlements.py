@@ -15,6 +15,7 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass
 from datetime import datetime, timezone
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from src.constants.permissions import (
@@ -102,6 +103,52 @@ BILLING_TIER_FEATURES = {
 }
 
 
+# Tenants per query when resolving billing tiers in bulk
+BILLING_TIER_LOOKUP_BATCH_SIZE = 1000
+
+
+def billing_tier_for_plan_name(plan_name: str) -> str:
+    """Map a plan name to its billing tier ('free', 'growth', 'enterprise')."""
+    plan_name = plan_name.lower()
+    if plan_name in ['enterprise', 'pro', 'business']:
+        return 'enterprise'
+    elif plan_name in ['growth', 'starter', 'professional']:
+        return 'growth'
+    return 'free'
+
+
+def resolve_billing_tiers(db_session: Session, tenant_ids: List[str]) -> Dict[str, str]:
+    """
+    Billing tier for many tenants with one query per batch.
+
+    Same rules as BillingEntitlementsService.get_billing_tier(): the plan
+    of the tenant's active subscription, 'free' without one.
+
+    Returns:
+        Mapping of every requested tenant_id to its billing tier
+    """
+    unique_ids = list(dict.fromkeys(tenant_ids))
+    tiers: Dict[str, str] = {}
+
+    for start in range(0, len(unique_ids), BILLING_TIER_LOOKUP_BATCH_SIZE):
+        batch = unique_ids[start:start + BILLING_TIER_LOOKUP_BATCH_SIZE]
+        stmt = (
+            select(Subscription.tenant_id, Plan.name)
+            .join(Plan, Subscription.plan_id == Plan.id)
+            .where(
+                Subscription.tenant_id.in_(batch),
+                Subscription.status == SubscriptionStatus.ACTIVE.value,
+            )
+            .order_by(Subscription.tenant_id, Subscription.created_at.desc())
+        )
+        for tenant_id, plan_name in db_session.execute(stmt):
+            tiers.setdefault(tenant_id, billing_tier_for_plan_name(plan_name))
+
+    for tenant_id in unique_ids:
+        tiers.setdefault(tenant_id, 'free')
+    return tiers
+
+
 @dataclass
 class EntitlementCheckResult:
     """Result of an entitlement check."""
@@ -175,14 +222,7 @@ class BillingEntitlementsService:
         plan = self._get_plan()
         if not plan:
             return 'free'
-
-        # Map plan name to billing tier
-        plan_name = plan.name.lower()
-        if plan_name in ['enterprise', 'pro', 'business']:
-            return 'enterprise'
-        elif plan_name in ['growth', 'starter', 'professional']:
-            return 'growth'
-        return 'free'
+        return billing_tier_for_plan_name(plan.name)
 
     def check_feature_entitlement(self, feature: str) -> EntitlementCheckResult:
         """
@@ -0,0 +1,160 @@
+"""
+Batched insert-or-skip persistence for generated AI artifacts.
+
+Insights, recommendations and action proposals are deduplicated on a
+per-tenant content hash. Persisting them one row at a time (add + flush,
+catch IntegrityError, rollback) costs a round-trip per row, and the
+rollback also discards every row flushed earlier in the same session.
+
+These helpers work a batch at a time instead:
+
+1. existing_content_hashes(): one SELECT per batch for hashes already
+   stored, so callers only render templates for new rows (or
+   existing_content_hashes_for_tenants() when a batch spans tenants)
+2. insert_ignoring_duplicates(): one
+   INSERT ... ON CONFLICT (dedup columns) DO NOTHING RETURNING * per batch,
+   returning the ORM objects that were actually inserted; rows that lost
+   a race to a concurrent job are skipped without affecting the rest
+
+Every content hash includes the columns it is unique alongside
+(period_end, related_insight_id, source_recommendation_id), so matching
+on tenant_id + content_hash is exact.
+
+Environment variables:
+    AI_BULK_INSERT_BATCH_SIZE: Rows per statement (default 500)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any, Iterable, Sequence, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+AI_BULK_INSERT_BATCH_SIZE = int(os.getenv("AI_BULK_INSERT_BATCH_SIZE", "500"))
+
+M = TypeVar("M")
+
+
+def _batches(items: Sequence[Any], size: int) -> Iterable[Sequence[Any]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _dialect_insert(db: Session):
+    """INSERT construct with on_conflict_do_nothing for the session's dialect."""
+    if db.get_bind().dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert
+
+
+def existing_content_hashes(
+    db: Session,
+    model: type,
+    tenant_id: str,
+    content_hashes: Iterable[str],
+    batch_size: int = AI_BULK_INSERT_BATCH_SIZE,
+) -> set[str]:
+    """
+    Content hashes already stored for a tenant.
+
+    Args:
+        db: Database session
+        model: Mapped class with tenant_id and content_hash columns
+        tenant_id: Tenant ID from JWT
+        content_hashes: Candidate hashes
+
+    Returns:
+        Subset of content_hashes present in model's table
+    """
+    hashes = sorted(set(content_hashes))
+    found: set[str] = set()
+    for batch in _batches(hashes, batch_size):
+        rows = db.execute(
+            select(model.content_hash).where(
+                model.tenant_id == tenant_id,
+                model.content_hash.in_(batch),
+            )
+        ).all()
+        found.update(row[0] for row in rows)
+    return found
+
+
+def existing_content_hashes_for_tenants(
+    db: Session,
+    model: type,
+    tenant_ids: Iterable[str],
+    content_hashes: Iterable[str],
+    batch_size: int = AI_BULK_INSERT_BATCH_SIZE,
+) -> set[str]:
+    """
+    Content hashes already stored for any of several tenants.
+
+    Content hashes include the tenant_id, so a hash match is exact; the
+    tenant filter keeps the lookup on the (tenant_id, content_hash) index.
+
+    Returns:
+        Subset of content_hashes present in model's table
+    """
+    tenants = sorted(set(tenant_ids))
+    hashes = sorted(set(content_hashes))
+    found: set[str] = set()
+    if not tenants:
+        return found
+    for batch in _batches(hashes, batch_size):
+        rows = db.execute(
+            select(model.content_hash).where(
+                model.tenant_id.in_(tenants),
+                model.content_hash.in_(batch),
+            )
+        ).all()
+        found.update(row[0] for row in rows)
+    return found
+
+
+def insert_ignoring_duplicates(
+    db: Session,
+    model: type[M],
+    rows: Sequence[dict[str, Any]],
+    conflict_columns: Sequence[str],
+    batch_size: int = AI_BULK_INSERT_BATCH_SIZE,
+) -> list[M]:
+    """
+    Insert rows, skipping those that violate the dedup constraint.
+
+    Args:
+        db: Database session (not committed)
+        model: Mapped class to insert into
+        rows: Column values per row; every row must have the same keys
+        conflict_columns: Columns of the unique constraint to skip on
+
+    Returns:
+        ORM objects for the rows actually inserted, in the session
+    """
+    if not rows:
+        return []
+
+    insert = _dialect_insert(db)
+    inserted: list[M] = []
+    for batch in _batches(rows, batch_size):
+        stmt = (
+            insert(model)
+            .values(list(batch))
+            .on_conflict_do_nothing(index_elements=list(conflict_columns))
+            .returning(model)
+        )
+        inserted.extend(db.scalars(stmt).all())
+
+    skipped = len(rows) - len(inserted)
+    if skipped:
+        logger.debug(
+            "Bulk insert skipped duplicates",
+            extra={"table": model.__tablename__, "skipped": skipped},
+        )
+    return inserted
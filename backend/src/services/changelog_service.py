@@ -18,6 +18,7 @@ from sqlalchemy import func, and_, or_
 
 from src.models.changelog_entry import ChangelogEntry, ReleaseType, FEATURE_AREAS
 from src.models.changelog_read_status import ChangelogReadStatus
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
 
 
 logger = logging.getLogger(__name__)
@@ -337,6 +338,7 @@ class ChangelogService:
         )
         self.db.add(read_status)
         self.db.flush()
+        self._publish_read_status_changed()
 
         logger.info(
             "Changelog entry marked as read",
@@ -390,6 +392,8 @@ class ChangelogService:
             count += 1
 
         self.db.flush()
+        if count:
+            self._publish_read_status_changed()
 
         logger.info(
             "All changelog entries marked as read",
@@ -402,6 +406,17 @@ class ChangelogService:
 
         return count
 
+    def _publish_read_status_changed(self) -> None:
+        """Refetch the user's unread badge in their other tabs (sent on commit)."""
+        publish_live_event(
+            LiveEvent(
+                type=LiveEventType.CHANGELOG,
+                tenant_id=self.tenant_id,
+                user_id=self.user_id,
+            ),
+            db=self.db,
+        )
+
     # =========================================================================
     # Admin Operations (requires ADMIN role, enforced at route level)
     # =========================================================================
@@ -9,26 +9,59 @@ Security: All metric/column names are parameterized via Superset's
 dataset API column references - never interpolated into raw SQL.
 Filter operators are validated against an allowlist.
 
+Dataset ids and column names come from the shared SupersetMetadataCatalog
+and requests go over its pooled, authenticated async session, so a preview
+with warm metadata makes a single Superset call (the chart data query) and
+never blocks the event loop.
+
+Results are cached in Redis (shared by all workers) behind a small
+in-process LRU, keyed by (tenant_id, dataset_name, config_hash):
+- Younger than PREVIEW_CACHE_TTL_SECONDS: served as is
+- Older, but within CHART_PREVIEW_STALE_TTL_SECONDS more: served
+  immediately while one background task re-runs the query
+  (stale-while-revalidate)
+- Concurrent identical previews share one in-flight Superset query
+Only successful results are cached; errors and timeouts never replace a
+cached result.
+
+Environment variables:
+    CHART_PREVIEW_CACHE_ENABLED: Set to "false" to skip the Redis cache
+    CHART_PREVIEW_STALE_TTL_SECONDS: How long past freshness a result may
+        still be served while refreshing (default 600)
+
 Phase 2B - Chart Preview Backend
 """
 
+import asyncio
 import hashlib
 import json
 import logging
 import os
 import time
-from collections import OrderedDict
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import Any, Optional
 
 import httpx
 
+from src.platform.request_coalescer import RequestCoalescer
+from src.platform.ttl_cache import TTLCache
+from src.services.superset_metadata_catalog import (
+    SupersetMetadataCatalog,
+    get_async_superset_http_session,
+    get_superset_http_session,
+    get_superset_metadata_catalog,
+)
+
 logger = logging.getLogger(__name__)
 
 PREVIEW_ROW_LIMIT = 100
 PREVIEW_TIMEOUT_SECONDS = 10
 PREVIEW_CACHE_TTL_SECONDS = 60
 MAX_CACHE_ENTRIES = 500
+CHART_PREVIEW_CACHE_ENABLED = (
+    os.getenv("CHART_PREVIEW_CACHE_ENABLED", "true").lower() == "true"
+)
+CHART_PREVIEW_STALE_TTL_SECONDS = int(os.getenv("CHART_PREVIEW_STALE_TTL_SECONDS", "600"))
 MAX_GROUPBY_CARDINALITY = 100
 
 # Abstract chart types mapped to current Superset viz_type plugins
@@ -126,29 +159,129 @@ def validate_filter_operator(operator: str) -> str:
     return upper_op
 
 
-class _PreviewCache:
-    """Bounded TTL cache for preview results. Evicts oldest when full."""
+@dataclass
+class CachedPreview:
+    """A cached preview result and when it was computed."""
 
-    def __init__(self, max_entries: int = MAX_CACHE_ENTRIES, ttl: int = PREVIEW_CACHE_TTL_SECONDS):
-        self._store: OrderedDict[tuple, tuple[float, ChartPreviewResult]] = OrderedDict()
-        self._max_entries = max_entries
-        self._ttl = ttl
+    result: ChartPreviewResult
+    cached_at: float
 
-    def get(self, key: tuple) -> Optional[ChartPreviewResult]:
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        cached_at, result = entry
-        if (time.time() - cached_at) > self._ttl:
-            return None
-        return result
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.cached_at
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        return json.dumps({"result": asdict(self.result), "cached_at": self.cached_at}, default=str)
 
-    def set(self, key: tuple, result: ChartPreviewResult) -> None:
-        if key in self._store:
-            self._store.move_to_end(key)
-        self._store[key] = (time.time(), result)
-        while len(self._store) > self._max_entries:
-            self._store.popitem(last=False)
+    @classmethod
+    def from_json(cls, data: str) -> "CachedPreview":
+        """Deserialize from JSON."""
+        payload = json.loads(data)
+        return cls(result=ChartPreviewResult(**payload["result"]), cached_at=payload["cached_at"])
+
+
+class ChartPreviewCache:
+    """
+    Preview results in Redis (shared across workers) behind an in-process LRU.
+
+    Entries are kept for fresh_ttl + stale_ttl seconds; callers decide from
+    CachedPreview.age_seconds whether an entry is fresh or stale.
+    """
+
+    KEY_PREFIX = "chart_preview:"
+
+    def __init__(
+        self,
+        fresh_ttl_seconds: int = PREVIEW_CACHE_TTL_SECONDS,
+        stale_ttl_seconds: int = CHART_PREVIEW_STALE_TTL_SECONDS,
+        max_local_entries: int = MAX_CACHE_ENTRIES,
+        enabled: bool = CHART_PREVIEW_CACHE_ENABLED,
+    ):
+        from src.entitlements.cache import RedisClient
+
+        self.fresh_ttl_seconds = fresh_ttl_seconds
+        self._retain_seconds = fresh_ttl_seconds + max(stale_ttl_seconds, 0)
+        self._redis = RedisClient()
+        # Keys start with the tenant id, so each tenant is its own namespace
+        self._local: TTLCache[str, CachedPreview] = TTLCache(
+            max_entries=max_local_entries,
+            ttl_seconds=self._retain_seconds,
+            name="chart_preview",
+        )
+        self.enabled = enabled
+
+    @staticmethod
+    def key(tenant_id: str, dataset_name: str, config_hash: str) -> str:
+        return f"{tenant_id}:{dataset_name}:{config_hash}"
+
+    def get(self, key: str) -> Optional[CachedPreview]:
+        """
+        Newest cached entry for key.
+
+        A fresh local entry is returned without touching Redis; a stale one
+        is compared with Redis in case another worker already refreshed it.
+        """
+        local = self._local.get(key)
+        if not self._check_shared(local):
+            return local
+        return self._merge_shared(key, local, self._redis.get(f"{self.KEY_PREFIX}{key}"))
+
+    async def aget(self, key: str) -> Optional[CachedPreview]:
+        """get() for the event loop: the Redis round trip runs in a worker thread."""
+        local = self._local.get(key)
+        if not self._check_shared(local):
+            return local
+        data = await asyncio.to_thread(self._redis.get, f"{self.KEY_PREFIX}{key}")
+        return self._merge_shared(key, local, data)
+
+    def set(self, key: str, result: ChartPreviewResult) -> CachedPreview:
+        entry = CachedPreview(result=result, cached_at=time.time())
+        self._local.set(key, entry)
+        if self.enabled:
+            self._redis.set(f"{self.KEY_PREFIX}{key}", entry.to_json(), self._retain_seconds)
+        return entry
+
+    async def aset(self, key: str, result: ChartPreviewResult) -> CachedPreview:
+        """set() for the event loop: the Redis write runs in a worker thread."""
+        entry = CachedPreview(result=result, cached_at=time.time())
+        self._local.set(key, entry)
+        if self.enabled and self._redis.available:
+            await asyncio.to_thread(
+                self._redis.set, f"{self.KEY_PREFIX}{key}", entry.to_json(), self._retain_seconds,
+            )
+        return entry
+
+    def _check_shared(self, local: Optional[CachedPreview]) -> bool:
+        """Whether Redis may hold a newer entry than local."""
+        if local is not None and local.age_seconds < self.fresh_ttl_seconds:
+            return False
+        return self.enabled and self._redis.available
+
+    def _merge_shared(
+        self,
+        key: str,
+        local: Optional[CachedPreview],
+        data: Optional[str],
+    ) -> Optional[CachedPreview]:
+        if not data:
+            return local
+        try:
+            shared = CachedPreview.from_json(data)
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached chart preview: {e}")
+            return local
+        if local is not None and local.cached_at >= shared.cached_at:
+            return local
+        self._local.set(key, shared, ttl_seconds=self._remaining_seconds(shared))
+        return shared
+
+    def _remaining_seconds(self, entry: CachedPreview) -> float:
+        return max(self._retain_seconds - entry.age_seconds, 1)
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._local.clear()
 
 
 def _build_query_payload(
@@ -213,87 +346,30 @@ class ChartQueryService:
         superset_url: Optional[str] = None,
         superset_username: Optional[str] = None,
         superset_password: Optional[str] = None,
+        catalog: Optional[SupersetMetadataCatalog] = None,
+        cache: Optional[ChartPreviewCache] = None,
     ):
-        self._superset_url = (superset_url or os.getenv("SUPERSET_EMBED_URL", "")).rstrip("/")
-        self._username = superset_username or os.getenv("SUPERSET_USERNAME", "admin")
-        self._password = superset_password or os.getenv("SUPERSET_PASSWORD", "admin")
-        self._token: Optional[str] = None
-        self._csrf: Optional[str] = None
-        self._token_obtained_at: float = 0.0
-        self._cache = _PreviewCache()
-
-    def _clear_auth(self) -> None:
-        self._token = None
-        self._csrf = None
-        self._token_obtained_at = 0.0
-
-    def _ensure_auth(self, client: httpx.Client) -> None:
-        """Authenticate with Superset. Re-authenticates if token is older than 30 minutes."""
-        token_age = time.time() - self._token_obtained_at
-        if self._token and token_age < 1800:
-            return
-        self._clear_auth()
-        resp = client.post(
-            f"{self._superset_url}/api/v1/security/login",
-            json={
-                "username": self._username,
-                "password": self._password,
-                "provider": "db",
-            },
-            timeout=PREVIEW_TIMEOUT_SECONDS,
-        )
-        resp.raise_for_status()
-        self._token = resp.json()["access_token"]
-        self._token_obtained_at = time.time()
-
-        csrf_resp = client.get(
-            f"{self._superset_url}/api/v1/security/csrf_token/",
-            headers={"Authorization": f"Bearer {self._token}"},
-            timeout=PREVIEW_TIMEOUT_SECONDS,
-        )
-        csrf_resp.raise_for_status()
-        self._csrf = csrf_resp.json().get("result", "")
-
-    def _auth_headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
-            "X-CSRFToken": self._csrf or "",
-            "Content-Type": "application/json",
-        }
+        if catalog is None and (superset_url or superset_username or superset_password):
+            credentials = (superset_url, superset_username, superset_password)
+            catalog = SupersetMetadataCatalog(
+                http=get_superset_http_session(*credentials),
+                async_http=get_async_superset_http_session(*credentials),
+            )
+        self._catalog = catalog or get_superset_metadata_catalog()
+        self._cache = cache or ChartPreviewCache()
+        self._inflight = RequestCoalescer("chart preview")
+        # cache_key -> background refresh (also keeps the task referenced)
+        self._refresh_tasks: dict[str, asyncio.Task] = {}
 
-    def _resolve_dataset_id(self, dataset_name: str, client: httpx.Client) -> Optional[int]:
+    async def _resolve_dataset_id(self, dataset_name: str) -> Optional[int]:
         """Look up Superset dataset ID by table name."""
-        resp = client.get(
-            f"{self._superset_url}/api/v1/dataset/",
-            headers=self._auth_headers(),
-            params={
-                "q": json.dumps({
-                    "filters": [{"col": "table_name", "opr": "eq", "value": dataset_name}],
-                })
-            },
-        )
-        if resp.status_code == 401:
-            self._clear_auth()
-        resp.raise_for_status()
-        results = resp.json().get("result", [])
-        if results:
-            return results[0]["id"]
-        return None
-
-    def _get_dataset_columns(self, dataset_id: int, client: httpx.Client) -> set[str]:
+        return await self._catalog.aget_dataset_id(dataset_name)
+
+    async def _get_dataset_columns(self, dataset_id: int) -> set[str]:
         """Fetch the set of valid column names for a dataset."""
         try:
-            resp = client.get(
-                f"{self._superset_url}/api/v1/dataset/{dataset_id}",
-                headers=self._auth_headers(),
-                params={"q": json.dumps({"columns": ["columns"]})},
-            )
-            if resp.status_code == 401:
-                self._clear_auth()
-            resp.raise_for_status()
-            result = resp.json().get("result", {})
-            columns = result.get("columns", [])
-            return {c.get("column_name", "") for c in columns if c.get("column_name")}
+            dataset = await self._catalog.aget_dataset(dataset_id)
+            return dataset.column_names if dataset is not None else set()
         except Exception:
             # If we can't fetch columns, skip validation rather than blocking
             return set()
@@ -324,7 +400,7 @@ class ChartQueryService:
         referenced.discard("")
         return sorted(referenced - valid_columns)
 
-    def execute_preview(
+    async def execute_preview(
         self,
         config: ChartConfig,
         tenant_id: str,
@@ -334,98 +410,134 @@ class ChartQueryService:
 
         - 100-row limit enforced
         - 10-second timeout
-        - Cached for 60s keyed by (dataset_name, config_hash, tenant_id)
+        - Cached for 60s keyed by (dataset_name, config_hash, tenant_id);
+          stale results are served while refreshing in the background
+        - Concurrent identical previews share one Superset query
         - High-cardinality GROUP BY truncated to MAX_GROUPBY_CARDINALITY
         """
         c_hash = config.config_hash()
-        cache_key = (config.dataset_name, c_hash, tenant_id)
+        cache_key = ChartPreviewCache.key(tenant_id, config.dataset_name, c_hash)
+        log_extra = {
+            "tenant_id": tenant_id,
+            "dataset_name": config.dataset_name,
+            "config_hash": c_hash,
+        }
 
-        cached = self._cache.get(cache_key)
+        cached = await self._cache.aget(cache_key)
         if cached is not None:
-            logger.info(
-                "chart_preview.cache_hit",
-                extra={
-                    "tenant_id": tenant_id,
-                    "dataset_name": config.dataset_name,
-                    "config_hash": c_hash,
-                },
-            )
-            return cached
+            if cached.age_seconds < self._cache.fresh_ttl_seconds:
+                logger.info("chart_preview.cache_hit", extra=log_extra)
+            else:
+                logger.info("chart_preview.cache_stale", extra=log_extra)
+                self._refresh_in_background(cache_key, config, tenant_id)
+            return cached.result
+
+        result, shared = await self._inflight.run(
+            cache_key, lambda: self._run_preview(config, tenant_id, cache_key),
+        )
+        if shared:
+            logger.info("chart_preview.coalesced", extra=log_extra)
+        return result
+
+    def _refresh_in_background(self, cache_key: str, config: ChartConfig, tenant_id: str) -> None:
+        """Re-run a stale preview once; concurrent stale hits share the refresh."""
+        if cache_key in self._refresh_tasks or self._inflight.in_flight(cache_key):
+            return
+        task = asyncio.create_task(
+            self._inflight.run(cache_key, lambda: self._run_preview(config, tenant_id, cache_key))
+        )
+        self._refresh_tasks[cache_key] = task
+        task.add_done_callback(lambda t: self._refresh_done(cache_key, t))
+
+    def _refresh_done(self, cache_key: str, task: asyncio.Task) -> None:
+        if self._refresh_tasks.get(cache_key) is task:
+            del self._refresh_tasks[cache_key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"chart_preview.refresh_failed: {task.exception()}")
 
+    async def _run_preview(
+        self,
+        config: ChartConfig,
+        tenant_id: str,
+        cache_key: str,
+    ) -> ChartPreviewResult:
+        """Query Superset and cache the result when it succeeded."""
         start_ms = time.time() * 1000
 
         try:
-            with httpx.Client(timeout=PREVIEW_TIMEOUT_SECONDS) as client:
-                self._ensure_auth(client)
-
-                dataset_id = self._resolve_dataset_id(config.dataset_name, client)
-                if dataset_id is None:
-                    return ChartPreviewResult(
-                        message=f"Dataset '{config.dataset_name}' not found",
-                        viz_type=_resolve_viz_type(config.viz_type),
-                    )
-
-                # Validate referenced columns exist in dataset
-                valid_columns = self._get_dataset_columns(dataset_id, client)
-                invalid_cols = self._validate_config_columns(config, valid_columns)
-                if invalid_cols:
-                    return ChartPreviewResult(
-                        message=f"Unknown columns referenced: {', '.join(invalid_cols)}. "
-                        "These columns may have been renamed or removed from the dataset.",
-                        viz_type=_resolve_viz_type(config.viz_type),
-                    )
-
-                payload = _build_query_payload(config, dataset_id)
-                resp = client.post(
-                    f"{self._superset_url}/api/v1/chart/data",
-                    headers=self._auth_headers(),
-                    json=payload,
+            dataset_id = await self._resolve_dataset_id(config.dataset_name)
+            if dataset_id is None:
+                return ChartPreviewResult(
+                    message=f"Dataset '{config.dataset_name}' not found",
+                    viz_type=_resolve_viz_type(config.viz_type),
+                )
+
+            # Validate referenced columns exist in dataset
+            valid_columns = await self._get_dataset_columns(dataset_id)
+            invalid_cols = self._validate_config_columns(config, valid_columns)
+            if invalid_cols:
+                return ChartPreviewResult(
+                    message=f"Unknown columns referenced: {', '.join(invalid_cols)}. "
+                    "These columns may have been renamed or removed from the dataset.",
+                    viz_type=_resolve_viz_type(config.viz_type),
+                )
+
+            payload = _build_query_payload(config, dataset_id)
+            resp = await self._catalog.async_http.request(
+                "POST",
+                "/api/v1/chart/data",
+                json=payload,
+                timeout=PREVIEW_TIMEOUT_SECONDS,
+            )
+            if resp.status_code == 404:
+                # Dataset recreated under a new id since it was cached
+                await asyncio.to_thread(
+                    self._catalog.invalidate,
+                    [config.dataset_name], [dataset_id], reason="chart_data_404",
+                )
+            resp.raise_for_status()
+
+            query_result = resp.json()
+            query_data = query_result.get("result", [{}])
+            if not query_data:
+                return ChartPreviewResult(
+                    message="No data available for the selected time range",
+                    viz_type=_resolve_viz_type(config.viz_type),
+                    query_duration_ms=time.time() * 1000 - start_ms,
                 )
-                if resp.status_code == 401:
-                    self._clear_auth()
-                resp.raise_for_status()
-
-                query_result = resp.json()
-                query_data = query_result.get("result", [{}])
-                if not query_data:
-                    return ChartPreviewResult(
-                        message="No data available for the selected time range",
-                        viz_type=_resolve_viz_type(config.viz_type),
-                        query_duration_ms=time.time() * 1000 - start_ms,
-                    )
-
-                first_result = query_data[0] if isinstance(query_data, list) else query_data
-                rows = first_result.get("data", [])
-                columns = list(first_result.get("colnames", []))
-
-                if not rows:
-                    result = ChartPreviewResult(
-                        data=[],
-                        columns=columns,
-                        row_count=0,
-                        message="No data available for the selected time range",
-                        viz_type=_resolve_viz_type(config.viz_type),
-                        query_duration_ms=time.time() * 1000 - start_ms,
-                    )
-                    self._cache.set(cache_key, result)
-                    return result
-
-                truncated = False
-                if config.dimensions and len(rows) > MAX_GROUPBY_CARDINALITY:
-                    rows = rows[:MAX_GROUPBY_CARDINALITY]
-                    truncated = True
 
+            first_result = query_data[0] if isinstance(query_data, list) else query_data
+            rows = first_result.get("data", [])
+            columns = list(first_result.get("colnames", []))
+
+            if not rows:
                 result = ChartPreviewResult(
-                    data=rows,
+                    data=[],
                     columns=columns,
-                    row_count=len(rows),
-                    truncated=truncated,
+                    row_count=0,
+                    message="No data available for the selected time range",
                     viz_type=_resolve_viz_type(config.viz_type),
                     query_duration_ms=time.time() * 1000 - start_ms,
                 )
-                self._cache.set(cache_key, result)
+                await self._cache.aset(cache_key, result)
                 return result
 
+            truncated = False
+            if config.dimensions and len(rows) > MAX_GROUPBY_CARDINALITY:
+                rows = rows[:MAX_GROUPBY_CARDINALITY]
+                truncated = True
+
+            result = ChartPreviewResult(
+                data=rows,
+                columns=columns,
+                row_count=len(rows),
+                truncated=truncated,
+                viz_type=_resolve_viz_type(config.viz_type),
+                query_duration_ms=time.time() * 1000 - start_ms,
+            )
+            await self._cache.aset(cache_key, result)
+            return result
+
         except httpx.TimeoutException:
             logger.warning(
                 "chart_preview.timeout",
@@ -31,6 +31,7 @@ from src.platform.audit import (
     AuditOutcome,
     write_audit_log_sync,
 )
+from src.platform.tenant_resolution_cache import invalidate_tenant_resolution
 from src.models.organization import Organization
 from src.models.tenant import Tenant, TenantStatus
 from src.models.user import User
@@ -253,6 +254,10 @@ class ClerkSyncService:
         for role in user.tenant_roles.all():
             role.is_active = False
 
+        invalidate_tenant_resolution(
+            self.session, clerk_user_ids=[clerk_user_id], reason="user_deactivated"
+        )
+
         logger.info(
             "Deactivated user",
             extra={"clerk_user_id": clerk_user_id, "user_id": user.id}
@@ -388,8 +393,12 @@ class ClerkSyncService:
             tenant.name = name
             if slug is not None:
                 tenant.slug = slug
-            if billing_tier is not None:
+            if billing_tier is not None and billing_tier != tenant.billing_tier:
                 tenant.billing_tier = billing_tier
+                # Billing tier gates which roles are valid
+                invalidate_tenant_resolution(
+                    self.session, tenant_ids=[tenant.id], reason="billing_tier_changed"
+                )
             if settings is not None:
                 tenant.settings = settings
 
@@ -466,6 +475,9 @@ class ClerkSyncService:
             return False
 
         tenant.status = TenantStatus.DEACTIVATED
+        invalidate_tenant_resolution(
+            self.session, tenant_ids=[tenant.id], reason=f"tenant_deactivated:{reason}"
+        )
 
         # Emit audit event for tenant deactivation
         self._emit_tenant_deactivated(
@@ -538,6 +550,10 @@ class ClerkSyncService:
         is_new_membership = existing_role is None
         was_reactivated = existing_role is not None and not existing_role.is_active
 
+        invalidate_tenant_resolution(
+            self.session, clerk_user_ids=[clerk_user_id], reason="membership_synced"
+        )
+
         if existing_role:
             # Reactivate if previously deactivated
             existing_role.is_active = True
@@ -638,6 +654,10 @@ class ClerkSyncService:
         if not roles:
             return False
 
+        invalidate_tenant_resolution(
+            self.session, clerk_user_ids=[clerk_user_id], reason=reason
+        )
+
         for role_assignment in roles:
             role_assignment.is_active = False
 
@@ -27,6 +27,7 @@ from src.models.custom_report import CustomReport
 from src.models.dashboard_version import DashboardVersion, MAX_DASHBOARD_VERSIONS
 from src.models.dashboard_audit import DashboardAudit, DashboardAuditAction
 from src.models.dashboard_share import DashboardShare
+from src.platform.pagination import CountMode, Page, paginate
 
 logger = logging.getLogger(__name__)
 
@@ -73,8 +74,18 @@ class CustomDashboardService:
         status_filter: Optional[str] = None,
         offset: int = 0,
         limit: int = 20,
-    ) -> Tuple[List[CustomDashboard], int]:
-        """List dashboards the user owns or has been shared with."""
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.EXACT,
+    ) -> Page:
+        """
+        List dashboards the user owns or has been shared with.
+
+        Most recently updated first. Counts exactly by default: the plan
+        limit keeps dashboards per tenant small.
+
+        Raises:
+            InvalidCursorError: cursor cannot be decoded
+        """
         # Owned dashboards
         query = self.db.query(CustomDashboard).filter(
             CustomDashboard.tenant_id == self.tenant_id,
@@ -86,17 +97,16 @@ class CustomDashboardService:
             # Exclude archived by default
             query = query.filter(CustomDashboard.status != DashboardStatus.ARCHIVED.value)
 
-        total = query.count()
-        dashboards = (
-            query
-            .order_by(CustomDashboard.updated_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        return paginate(
+            query,
+            sort_column=CustomDashboard.updated_at,
+            id_column=CustomDashboard.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            count=count,
         )
 
-        return dashboards, total
-
     def get_dashboard(self, dashboard_id: str) -> CustomDashboard:
         """Get a dashboard by ID with access check."""
         dashboard = self.db.query(CustomDashboard).filter(
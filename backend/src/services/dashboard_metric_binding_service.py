@@ -19,7 +19,7 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Mapping
 
 from sqlalchemy.orm import Session
 
@@ -90,11 +90,14 @@ class DashboardMetricBindingService:
         db: Session,
         consumers_config_path: str | Path,
         metric_resolver: MetricVersionResolver,
+        consumers_config: Mapping[str, Any] | None = None,
     ):
         self.db = db
         self.metric_resolver = metric_resolver
         self.audit = AuditLogger("dashboard_metric_binding_audit")
-        self._consumers_config = load_yaml_config(consumers_config_path, logger)
+        if consumers_config is None:
+            consumers_config = load_yaml_config(consumers_config_path, logger)
+        self._consumers_config = consumers_config
 
     # ========================================================================
     # Private helpers (eliminate duplicate queries and validation)
@@ -192,6 +192,28 @@ class DataAvailabilityResult:
             "billing_tier": self.billing_tier,
         }
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "DataAvailabilityResult":
+        """Inverse of to_dict (used by the tenant health snapshot)."""
+        def _ts(value: Optional[str]) -> Optional[datetime]:
+            return datetime.fromisoformat(value) if value else None
+
+        return cls(
+            tenant_id=data["tenant_id"],
+            source_type=data["source_type"],
+            state=data["state"],
+            reason=data["reason"],
+            warn_threshold_minutes=data["warn_threshold_minutes"],
+            error_threshold_minutes=data["error_threshold_minutes"],
+            last_sync_at=_ts(data.get("last_sync_at")),
+            last_sync_status=data.get("last_sync_status"),
+            minutes_since_sync=data.get("minutes_since_sync"),
+            state_changed_at=_ts(data["state_changed_at"]),
+            previous_state=data.get("previous_state"),
+            evaluated_at=_ts(data["evaluated_at"]),
+            billing_tier=data.get("billing_tier", "free"),
+        )
+
 
 # ─── Service ─────────────────────────────────────────────────────────────────
 
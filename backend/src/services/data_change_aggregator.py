@@ -13,7 +13,7 @@ SECURITY:
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Optional, List, Tuple
+from typing import Optional, List
 
 from sqlalchemy.orm import Session
 from sqlalchemy import func, and_, or_, desc
@@ -26,6 +26,8 @@ from src.models.dq_models import (
 from src.models.airbyte_connection import TenantAirbyteConnection, ConnectionStatus
 from src.models.action_approval_audit import ActionApprovalAudit, AuditAction
 from src.models.action_proposal import ActionProposal
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
+from src.platform.pagination import CountMode, Page, paginate
 
 
 logger = logging.getLogger(__name__)
@@ -35,6 +37,20 @@ logger = logging.getLogger(__name__)
 SYNC_AFFECTED_METRICS = ["revenue", "orders", "sessions", "ad_spend"]
 AI_ACTION_AFFECTED_METRICS = ["ad_spend", "roas", "cac"]
 
+# Event types that can flip the What Changed critical indicator
+CRITICAL_CHANGE_EVENT_TYPES = frozenset({
+    DataChangeEventType.SYNC_FAILED.value,
+    DataChangeEventType.DATA_QUALITY_INCIDENT.value,
+    DataChangeEventType.DATA_QUALITY_RESOLVED.value,
+    DataChangeEventType.CONNECTOR_STATUS_CHANGED.value,
+})
+
+# Event types that change the pending approvals count
+APPROVAL_CHANGE_EVENT_TYPES = frozenset({
+    DataChangeEventType.AI_ACTION_APPROVED.value,
+    DataChangeEventType.AI_ACTION_REJECTED.value,
+})
+
 
 class DataChangeAggregator:
     """
@@ -70,6 +86,32 @@ class DataChangeAggregator:
     # Event Aggregation Methods (called by sync/action services)
     # =========================================================================
 
+    def _save_event(self, event: DataChangeEvent) -> None:
+        """Persist an event and push it to open event streams (sent on commit)."""
+        self.db.add(event)
+        self.db.flush()
+
+        publish_live_event(
+            LiveEvent(
+                type=LiveEventType.CHANGES,
+                tenant_id=self.tenant_id,
+                data={
+                    "event_type": event.event_type,
+                    "critical": event.event_type in CRITICAL_CHANGE_EVENT_TYPES,
+                },
+            ),
+            db=self.db,
+        )
+        if event.event_type in APPROVAL_CHANGE_EVENT_TYPES:
+            publish_live_event(
+                LiveEvent(
+                    type=LiveEventType.APPROVALS,
+                    tenant_id=self.tenant_id,
+                    data={"event_type": event.event_type},
+                ),
+                db=self.db,
+            )
+
     def record_sync_completed(
         self,
         sync_run: SyncRun,
@@ -102,8 +144,7 @@ class DataChangeAggregator:
             occurred_at=sync_run.completed_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         logger.info(
             "Recorded sync completed event",
@@ -148,8 +189,7 @@ class DataChangeAggregator:
             occurred_at=sync_run.completed_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         logger.info(
             "Recorded sync failed event",
@@ -195,8 +235,7 @@ class DataChangeAggregator:
             occurred_at=backfill.completed_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -231,8 +270,7 @@ class DataChangeAggregator:
             occurred_at=audit.performed_at,
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -265,8 +303,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -304,8 +341,7 @@ class DataChangeAggregator:
             occurred_at=audit.performed_at,
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -345,8 +381,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -379,8 +414,7 @@ class DataChangeAggregator:
             occurred_at=incident.opened_at,
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -413,8 +447,7 @@ class DataChangeAggregator:
             occurred_at=incident.resolved_at or datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         return event
 
@@ -430,9 +463,11 @@ class DataChangeAggregator:
         days: int = 7,
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[DataChangeEvent], int]:
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.ESTIMATED,
+    ) -> Page:
         """
-        Get recent change events with filtering.
+        Get recent change events with filtering, newest first.
 
         Args:
             event_type: Filter by event type (optional)
@@ -440,10 +475,15 @@ class DataChangeAggregator:
             metric: Filter by affected metric (optional)
             days: Number of days to look back
             limit: Maximum results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: next_cursor of the previous page
+            count: How to compute total
 
         Returns:
-            Tuple of (events, total_count)
+            Page of DataChangeEvent
+
+        Raises:
+            InvalidCursorError: cursor cannot be decoded
         """
         since = datetime.now(timezone.utc) - timedelta(days=days)
 
@@ -461,18 +501,16 @@ class DataChangeAggregator:
         if metric:
             query = query.filter(DataChangeEvent.affected_metrics.contains([metric]))
 
-        total = query.count()
-
-        events = (
-            query
-            .order_by(DataChangeEvent.occurred_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        return paginate(
+            query,
+            sort_column=DataChangeEvent.occurred_at,
+            id_column=DataChangeEvent.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            count=count,
         )
 
-        return events, total
-
     def get_freshness_status(self) -> dict:
         """
         Get overall data freshness status.
@@ -921,8 +959,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         logger.info(
             "Recorded sync completed event (simple)",
@@ -973,8 +1010,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         logger.info(
             "Recorded sync failed event (simple)",
@@ -1034,8 +1070,7 @@ class DataChangeAggregator:
             occurred_at=datetime.now(timezone.utc),
         )
 
-        self.db.add(event)
-        self.db.flush()
+        self._save_event(event)
 
         logger.info(
             "Recorded AI action executed event (simple)",
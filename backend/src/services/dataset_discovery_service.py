@@ -10,19 +10,26 @@ Handles Superset unavailability by returning stale cached data with a
 stale flag. Validates existing report configs against current schema
 and returns warnings for missing columns.
 
+Superset access goes through the shared SupersetMetadataCatalog: one
+pooled, authenticated HTTP session, and dataset details cached in Redis
+so a listing only fetches datasets that changed since the last one.
+
 Phase 2A - Dataset Discovery API
 """
 
-import json
 import logging
-import os
 import time
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-import httpx
+from src.services.superset_metadata_catalog import (
+    SupersetDataset,
+    SupersetMetadataCatalog,
+    get_superset_http_session,
+    get_superset_metadata_catalog,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +48,6 @@ DATETIME_DATA_TYPES = frozenset({
 
 CACHE_TTL_SECONDS = 300  # 5 minutes
 MAX_CACHE_ENTRIES = 200  # Bound cache memory
-MAX_PAGINATION_PAGES = 50  # Guard against runaway pagination loops
 
 
 @dataclass
@@ -105,6 +111,17 @@ def classify_column(column_name: str, data_type: str) -> ColumnMetadata:
     )
 
 
+def _classify_columns(dataset: SupersetDataset) -> list[ColumnMetadata]:
+    """Classify a catalog dataset's raw Superset columns."""
+    columns: list[ColumnMetadata] = []
+    for col in dataset.columns:
+        data_type = col.get("type", "VARCHAR") or "VARCHAR"
+        meta = classify_column(col.get("column_name", ""), data_type)
+        meta.description = col.get("description", "") or col.get("verbose_name", "") or ""
+        columns.append(meta)
+    return columns
+
+
 class _BoundedCache:
     """TTL cache with bounded size. Evicts oldest entries when full."""
 
@@ -139,64 +156,15 @@ class DatasetDiscoveryService:
         superset_url: Optional[str] = None,
         superset_username: Optional[str] = None,
         superset_password: Optional[str] = None,
-        timeout_seconds: int = 10,
+        catalog: Optional[SupersetMetadataCatalog] = None,
     ):
-        self._superset_url = (superset_url or os.getenv("SUPERSET_EMBED_URL", "")).rstrip("/")
-        self._username = superset_username or os.getenv("SUPERSET_USERNAME", "admin")
-        self._password = superset_password or os.getenv("SUPERSET_PASSWORD", "admin")
-        self._timeout = timeout_seconds
-        self._token: Optional[str] = None
-        self._csrf: Optional[str] = None
-        self._token_obtained_at: float = 0.0
+        if catalog is None and (superset_url or superset_username or superset_password):
+            catalog = SupersetMetadataCatalog(
+                http=get_superset_http_session(superset_url, superset_username, superset_password),
+            )
+        self._catalog = catalog or get_superset_metadata_catalog()
         self._cache = _BoundedCache()
 
-    def _clear_auth(self) -> None:
-        """Clear cached auth tokens to force re-authentication."""
-        self._token = None
-        self._csrf = None
-        self._token_obtained_at = 0.0
-
-    def _ensure_auth(self, client: httpx.Client) -> None:
-        """Authenticate with Superset. Re-authenticates if token is older than 30 minutes."""
-        token_age = time.time() - self._token_obtained_at
-        if self._token and token_age < 1800:  # 30 minute token lifetime
-            return
-        # Clear stale token and re-authenticate
-        self._clear_auth()
-        resp = client.post(
-            f"{self._superset_url}/api/v1/security/login",
-            json={
-                "username": self._username,
-                "password": self._password,
-                "provider": "db",
-            },
-            timeout=self._timeout,
-        )
-        resp.raise_for_status()
-        self._token = resp.json()["access_token"]
-        self._token_obtained_at = time.time()
-
-        csrf_resp = client.get(
-            f"{self._superset_url}/api/v1/security/csrf_token/",
-            headers={"Authorization": f"Bearer {self._token}"},
-            timeout=self._timeout,
-        )
-        csrf_resp.raise_for_status()
-        self._csrf = csrf_resp.json().get("result", "")
-
-    def _auth_headers(self) -> dict[str, str]:
-        return {
-            "Authorization": f"Bearer {self._token}",
-            "X-CSRFToken": self._csrf or "",
-            "Content-Type": "application/json",
-        }
-
-    def _handle_401(self, resp: httpx.Response) -> None:
-        """Clear auth on 401 so next call re-authenticates."""
-        if resp.status_code == 401:
-            logger.warning("dataset_discovery.superset_401_clearing_token")
-            self._clear_auth()
-
     def discover_datasets(self) -> DatasetDiscoveryResult:
         """
         Fetch all available datasets and their columns from Superset.
@@ -281,80 +249,21 @@ class DatasetDiscoveryService:
         return warnings
 
     def _fetch_datasets_from_superset(self) -> list[DatasetInfo]:
-        """Query Superset API for all available datasets with columns."""
-        datasets: list[DatasetInfo] = []
-        with httpx.Client(timeout=self._timeout) as client:
-            self._ensure_auth(client)
-            page = 0
-            page_size = 100
-            while page < MAX_PAGINATION_PAGES:
-                resp = client.get(
-                    f"{self._superset_url}/api/v1/dataset/",
-                    headers=self._auth_headers(),
-                    params={
-                        "q": json.dumps({
-                            "page": page,
-                            "page_size": page_size,
-                            "columns": [
-                                "id", "table_name", "schema",
-                                "description",
-                            ],
-                        })
-                    },
-                )
-                self._handle_401(resp)
-                resp.raise_for_status()
-                result = resp.json().get("result", [])
-                if not result:
-                    break
-
-                for ds in result:
-                    ds_id = ds.get("id")
-                    columns = self._fetch_columns_from_superset(
-                        ds_id, client=client,
-                    )
-                    datasets.append(DatasetInfo(
-                        dataset_name=ds.get("table_name", ""),
-                        dataset_id=ds_id,
-                        schema=ds.get("schema", ""),
-                        description=ds.get("description", "") or "",
-                        columns=columns,
-                    ))
-
-                if len(result) < page_size:
-                    break
-                page += 1
-
-        return datasets
-
-    def _fetch_columns_from_superset(
-        self,
-        dataset_id: int,
-        client: Optional[httpx.Client] = None,
-    ) -> list[ColumnMetadata]:
-        """Fetch and classify columns for a single dataset."""
-        def _do_fetch(c: httpx.Client) -> list[ColumnMetadata]:
-            resp = c.get(
-                f"{self._superset_url}/api/v1/dataset/{dataset_id}",
-                headers=self._auth_headers(),
+        """Query Superset (via the metadata catalog) for all datasets with columns."""
+        return [
+            DatasetInfo(
+                dataset_name=ds.table_name,
+                dataset_id=ds.id,
+                schema=ds.schema,
+                description=ds.description,
+                columns=_classify_columns(ds),
             )
-            self._handle_401(resp)
-            resp.raise_for_status()
-            ds_data = resp.json().get("result", {})
-            raw_columns = ds_data.get("columns", [])
-            columns: list[ColumnMetadata] = []
-            for col in raw_columns:
-                col_name = col.get("column_name", "")
-                data_type = col.get("type", "VARCHAR") or "VARCHAR"
-                description = col.get("description", "") or col.get("verbose_name", "") or ""
-                meta = classify_column(col_name, data_type)
-                meta.description = description
-                columns.append(meta)
-            return columns
+            for ds in self._catalog.list_datasets()
+        ]
 
-        if client is not None:
-            return _do_fetch(client)
-
-        with httpx.Client(timeout=self._timeout) as new_client:
-            self._ensure_auth(new_client)
-            return _do_fetch(new_client)
+    def _fetch_columns_from_superset(self, dataset_id: int) -> list[ColumnMetadata]:
+        """Fetch and classify columns for a single dataset."""
+        dataset = self._catalog.get_dataset(dataset_id)
+        if dataset is None:
+            return []
+        return _classify_columns(dataset)
@@ -21,6 +21,7 @@ from sqlalchemy.orm import Session
 from src.models.dataset_version import DatasetVersion, DatasetVersionStatus
 from src.monitoring.dataset_alerts import alert_version_rolled_back
 from src.services.audit_logger import emit_dataset_version_rolled_back
+from src.services.superset_metadata_catalog import invalidate_superset_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -224,6 +225,9 @@ class DatasetVersionManager:
         version.sync_completed_at = now
         self.db.flush()
 
+        # Previews and discovery must see the activated column set
+        invalidate_superset_metadata([version.dataset_name], reason="version_activated")
+
         logger.info(
             "dataset_version.activated",
             extra={
@@ -303,6 +307,8 @@ class DatasetVersionManager:
         previous.deactivated_at = None
         self.db.flush()
 
+        invalidate_superset_metadata([dataset_name], reason="version_rolled_back")
+
         rolled_back_version = current_active.version if current_active else "unknown"
         emit_dataset_version_rolled_back(
             self.db,
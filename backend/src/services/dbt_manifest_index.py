@@ -0,0 +1,447 @@
+"""
+Shared, indexed view of the dbt manifest.json.
+
+manifest.json runs to tens of MB on large projects. Schema compatibility
+checks, the dbt run listener, the Superset dataset sync and the backfill
+planner all need the same few things from it: model names, their columns
+and the dependency graph. ManifestIndex holds exactly that in compact form:
+
+- nodes (models, seeds, snapshots, sources) as parallel arrays addressed by
+  a small integer id, with unique_id -> id and name -> id maps
+- parent/child adjacency arrays for upstream/downstream queries
+- per-node column maps (type, description, superset_expose)
+
+load_manifest_index() parses a manifest at most once per artifact version:
+
+- in process, the index is reused while the file's (mtime, size) is unchanged
+- on disk, the index is cached under DBT_MANIFEST_INDEX_CACHE_DIR keyed by
+  the SHA-256 of the manifest bytes (hashed through mmap), so other workers
+  and restarts skip the JSON parse entirely
+
+Usage:
+    index = load_manifest_index("analytics/target/manifest.json")
+    index.downstream(["stg_shopify_orders"])
+    index.columns("fact_orders_current")
+
+Environment variables:
+    DBT_MANIFEST_PATH: Default manifest location
+        (default analytics/target/manifest.json in the repo)
+    DBT_MANIFEST_INDEX_CACHE_DIR: On-disk index cache (default <tmp>/dbt_manifest_index)
+"""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+DBT_MANIFEST_PATH = Path(os.getenv(
+    "DBT_MANIFEST_PATH",
+    str(Path(__file__).resolve().parents[3] / "analytics" / "target" / "manifest.json"),
+))
+DBT_MANIFEST_INDEX_CACHE_DIR = Path(os.getenv(
+    "DBT_MANIFEST_INDEX_CACHE_DIR",
+    os.path.join(tempfile.gettempdir(), "dbt_manifest_index"),
+))
+
+# Bump when the serialized index layout changes
+INDEX_FORMAT_VERSION = 1
+
+_NODE_SECTIONS = ("nodes", "sources")
+
+
+@dataclass(frozen=True)
+class ManifestColumn:
+    """A column as declared in the manifest."""
+
+    name: str
+    data_type: Optional[str]
+    description: str
+    exposed: bool
+
+
+@dataclass(frozen=True)
+class ManifestNode:
+    """Read-only view of one indexed node."""
+
+    unique_id: str
+    name: str
+    resource_type: str
+    materialization: Optional[str]
+    schema: Optional[str]
+    description: str
+    fqn: tuple[str, ...]
+    columns: tuple[ManifestColumn, ...]
+
+
+def _column(name: str, info: Any) -> ManifestColumn:
+    info = info if isinstance(info, dict) else {}
+    meta = info.get("meta") or {}
+    return ManifestColumn(
+        name=name,
+        data_type=info.get("data_type"),
+        description=info.get("description") or "",
+        exposed=bool(meta.get("superset_expose", False)),
+    )
+
+
+class ManifestIndex:
+    """
+    Compact, immutable index of a dbt manifest.
+
+    Build with from_manifest() (parsed dict) or load_manifest_index() (file).
+    """
+
+    def __init__(
+        self,
+        *,
+        unique_ids: list[str],
+        names: list[str],
+        resource_types: list[str],
+        materializations: list[Optional[str]],
+        schemas: list[Optional[str]],
+        descriptions: list[str],
+        fqns: list[tuple[str, ...]],
+        parents: list[tuple[int, ...]],
+        columns: dict[int, tuple[ManifestColumn, ...]],
+        content_hash: str,
+        file_hash: str = "",
+    ):
+        self._unique_ids = unique_ids
+        self._names = names
+        self._resource_types = resource_types
+        self._materializations = materializations
+        self._schemas = schemas
+        self._descriptions = descriptions
+        self._fqns = fqns
+        self._parents = parents
+        self._columns = columns
+        self.content_hash = content_hash
+        self.file_hash = file_hash
+
+        children: list[list[int]] = [[] for _ in unique_ids]
+        for child, node_parents in enumerate(parents):
+            for parent in node_parents:
+                children[parent].append(child)
+        self._children = [tuple(c) for c in children]
+
+        self._id_by_unique_id = {uid: i for i, uid in enumerate(unique_ids)}
+        # Models win name collisions (a source and a model may share a name)
+        self._id_by_name: dict[str, int] = {}
+        for i, name in enumerate(names):
+            if name not in self._id_by_name or resource_types[i] == "model":
+                self._id_by_name[name] = i
+
+    # ------------------------------------------------------------------
+    # Construction and serialization
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_manifest(cls, manifest: dict[str, Any], file_hash: str = "") -> "ManifestIndex":
+        """Index a parsed manifest.json."""
+        raw_nodes: list[tuple[str, dict]] = []
+        for section in _NODE_SECTIONS:
+            for unique_id, node in (manifest.get(section) or {}).items():
+                if isinstance(node, dict):
+                    raw_nodes.append((unique_id, node))
+
+        id_by_unique_id = {uid: i for i, (uid, _) in enumerate(raw_nodes)}
+        parent_map = manifest.get("parent_map") or {}
+
+        parents: list[tuple[int, ...]] = []
+        columns: dict[int, tuple[ManifestColumn, ...]] = {}
+        for i, (unique_id, node) in enumerate(raw_nodes):
+            upstream = parent_map.get(unique_id)
+            if upstream is None:
+                upstream = (node.get("depends_on") or {}).get("nodes") or []
+            parents.append(tuple(
+                id_by_unique_id[p] for p in upstream if p in id_by_unique_id
+            ))
+            node_columns = node.get("columns") or {}
+            if node_columns:
+                columns[i] = tuple(_column(n, c) for n, c in node_columns.items())
+
+        return cls(
+            unique_ids=[uid for uid, _ in raw_nodes],
+            names=[node.get("name", "") for _, node in raw_nodes],
+            resource_types=[
+                node.get("resource_type") or uid.split(".", 1)[0] for uid, node in raw_nodes
+            ],
+            materializations=[
+                (node.get("config") or {}).get("materialized") for _, node in raw_nodes
+            ],
+            schemas=[node.get("schema") for _, node in raw_nodes],
+            descriptions=[node.get("description") or "" for _, node in raw_nodes],
+            fqns=[tuple(node.get("fqn") or ()) for _, node in raw_nodes],
+            parents=parents,
+            columns=columns,
+            content_hash=hashlib.sha256(
+                json.dumps(manifest, sort_keys=True).encode()
+            ).hexdigest(),
+            file_hash=file_hash,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable form for the on-disk cache."""
+        return {
+            "format": INDEX_FORMAT_VERSION,
+            "content_hash": self.content_hash,
+            "file_hash": self.file_hash,
+            "unique_ids": self._unique_ids,
+            "names": self._names,
+            "resource_types": self._resource_types,
+            "materializations": self._materializations,
+            "schemas": self._schemas,
+            "descriptions": self._descriptions,
+            "fqns": self._fqns,
+            "parents": self._parents,
+            "columns": {
+                str(i): [[c.name, c.data_type, c.description, c.exposed] for c in cols]
+                for i, cols in self._columns.items()
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ManifestIndex":
+        if data.get("format") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported manifest index format: {data.get('format')}")
+        return cls(
+            unique_ids=data["unique_ids"],
+            names=data["names"],
+            resource_types=data["resource_types"],
+            materializations=data["materializations"],
+            schemas=data["schemas"],
+            descriptions=data["descriptions"],
+            fqns=[tuple(f) for f in data["fqns"]],
+            parents=[tuple(p) for p in data["parents"]],
+            columns={
+                int(i): tuple(ManifestColumn(*c) for c in cols)
+                for i, cols in data["columns"].items()
+            },
+            content_hash=data["content_hash"],
+            file_hash=data["file_hash"],
+        )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._unique_ids)
+
+    def __contains__(self, name_or_id: str) -> bool:
+        return self._resolve(name_or_id) is not None
+
+    def _resolve(self, name_or_id: str) -> Optional[int]:
+        i = self._id_by_unique_id.get(name_or_id)
+        return i if i is not None else self._id_by_name.get(name_or_id)
+
+    def _node(self, i: int) -> ManifestNode:
+        return ManifestNode(
+            unique_id=self._unique_ids[i],
+            name=self._names[i],
+            resource_type=self._resource_types[i],
+            materialization=self._materializations[i],
+            schema=self._schemas[i],
+            description=self._descriptions[i],
+            fqn=self._fqns[i],
+            columns=self._columns.get(i, ()),
+        )
+
+    def node(self, name_or_id: str) -> Optional[ManifestNode]:
+        """Node by unique_id or name (models preferred), or None."""
+        i = self._resolve(name_or_id)
+        return self._node(i) if i is not None else None
+
+    def nodes(self, resource_type: Optional[str] = None) -> Iterator[ManifestNode]:
+        """All nodes in manifest order, optionally of one resource type."""
+        for i, rtype in enumerate(self._resource_types):
+            if resource_type is None or rtype == resource_type:
+                yield self._node(i)
+
+    def models(self) -> Iterator[ManifestNode]:
+        return self.nodes("model")
+
+    def columns(self, name_or_id: str) -> tuple[ManifestColumn, ...]:
+        """Declared columns of a node (empty if unknown)."""
+        i = self._resolve(name_or_id)
+        return self._columns.get(i, ()) if i is not None else ()
+
+    def parents(self, name_or_id: str) -> list[str]:
+        """Names of the direct upstream nodes."""
+        i = self._resolve(name_or_id)
+        return [self._names[p] for p in self._parents[i]] if i is not None else []
+
+    def children(self, name_or_id: str) -> list[str]:
+        """Names of the direct downstream nodes."""
+        i = self._resolve(name_or_id)
+        return [self._names[c] for c in self._children[i]] if i is not None else []
+
+    # ------------------------------------------------------------------
+    # Graph queries
+    # ------------------------------------------------------------------
+
+    def _walk(
+        self,
+        seeds: Iterable[str],
+        edges: list[tuple[int, ...]],
+        resource_type: Optional[str],
+    ) -> set[str]:
+        start = [i for i in (self._resolve(s) for s in seeds) if i is not None]
+        visited = set(start)
+        queue = deque(start)
+        while queue:
+            for nxt in edges[queue.popleft()]:
+                if nxt not in visited:
+                    visited.add(nxt)
+                    queue.append(nxt)
+        return {
+            self._names[i] for i in visited
+            if resource_type is None or self._resource_types[i] == resource_type
+        }
+
+    def downstream(
+        self,
+        seeds: Iterable[str],
+        resource_type: Optional[str] = "model",
+    ) -> set[str]:
+        """
+        Names of every node reachable downstream of seeds (seeds included).
+
+        Unknown seeds are ignored. Only nodes of resource_type are returned
+        (None for all types); the walk itself passes through every node.
+        """
+        return self._walk(seeds, self._children, resource_type)
+
+    def upstream(
+        self,
+        seeds: Iterable[str],
+        resource_type: Optional[str] = "model",
+    ) -> set[str]:
+        """Names of every node seeds depend on, transitively (seeds included)."""
+        return self._walk(seeds, self._parents, resource_type)
+
+
+def as_manifest_index(manifest: Union[ManifestIndex, dict[str, Any]]) -> ManifestIndex:
+    """Accept either an index or a parsed manifest dict."""
+    if isinstance(manifest, ManifestIndex):
+        return manifest
+    return ManifestIndex.from_manifest(manifest)
+
+
+# ----------------------------------------------------------------------
+# Loading
+# ----------------------------------------------------------------------
+
+# resolved path -> ((mtime_ns, size), index)
+_loaded: dict[str, tuple[tuple[int, int], ManifestIndex]] = {}
+_load_lock = threading.Lock()
+
+
+def _disk_cache_path(file_hash: str) -> Path:
+    return DBT_MANIFEST_INDEX_CACHE_DIR / f"{file_hash}.v{INDEX_FORMAT_VERSION}.json"
+
+
+def _read_disk_cache(file_hash: str) -> Optional[ManifestIndex]:
+    path = _disk_cache_path(file_hash)
+    try:
+        with open(path) as f:
+            return ManifestIndex.from_dict(json.load(f))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(
+            "Ignoring unreadable manifest index cache",
+            extra={"path": str(path), "error": str(e)},
+        )
+        return None
+
+
+def _write_disk_cache(index: ManifestIndex) -> None:
+    path = _disk_cache_path(index.file_hash)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(index.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError as e:
+        logger.warning(
+            "Could not write manifest index cache",
+            extra={"path": str(path), "error": str(e)},
+        )
+
+
+def _index_file(path: Path) -> ManifestIndex:
+    """Hash the manifest through mmap; parse it only on a disk cache miss."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"Manifest is empty: {path}")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            file_hash = hashlib.sha256(mm).hexdigest()
+            cached = _read_disk_cache(file_hash)
+            if cached is not None:
+                return cached
+            manifest = json.loads(mm[:])
+
+    index = ManifestIndex.from_manifest(manifest, file_hash=file_hash)
+    _write_disk_cache(index)
+    logger.info(
+        "Indexed dbt manifest",
+        extra={"manifest_path": str(path), "node_count": len(index), "file_hash": file_hash},
+    )
+    return index
+
+
+def load_manifest_index(manifest_path: Union[str, Path]) -> ManifestIndex:
+    """
+    Index for a manifest file, reused until the file changes.
+
+    Raises:
+        FileNotFoundError: The manifest does not exist
+        ValueError: The manifest is not valid JSON
+    """
+    path = Path(manifest_path)
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Manifest not found: {path}") from None
+    key = str(path.resolve())
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    entry = _loaded.get(key)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    with _load_lock:
+        entry = _loaded.get(key)
+        if entry is not None and entry[0] == signature:
+            return entry[1]
+        index = _index_file(path)
+        _loaded[key] = (signature, index)
+        return index
+
+
+def get_manifest_index(
+    manifest_path: Union[str, Path, None] = None,
+) -> Optional[ManifestIndex]:
+    """Index of the deployed manifest (DBT_MANIFEST_PATH), or None if unavailable."""
+    path = Path(manifest_path) if manifest_path is not None else DBT_MANIFEST_PATH
+    try:
+        return load_manifest_index(path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(
+            "Could not load dbt manifest",
+            extra={"manifest_path": str(path), "error": str(e)},
+        )
+        return None
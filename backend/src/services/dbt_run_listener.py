@@ -8,13 +8,13 @@ and calls on_dbt_run_complete() with the manifest path and run results.
 Story 5.2 — Prompt 5.2.4
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
 from sqlalchemy.orm import Session
 
+from src.services.dbt_manifest_index import load_manifest_index
 from src.services.schema_compatibility_checker import (
     SchemaCompatibilityChecker,
     build_snapshot_from_db,
@@ -80,8 +80,8 @@ class DbtRunListener:
                 errors=[{"stage": "load_manifest", "error": f"Manifest not found: {path}"}],
             )
 
-        with open(path) as f:
-            manifest = json.load(f)
+        # Indexed once here; sync() below reuses the same in-process index
+        manifest = load_manifest_index(path)
         current_state = build_snapshot_from_db(self.db)
 
         compat = self.checker.validate(current_state, manifest)
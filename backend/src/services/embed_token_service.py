@@ -9,6 +9,10 @@ Security Requirements:
 - Silent refresh before expiry
 - Tenant isolation via JWT claims
 - CSP enforcement for Shopify Admin only
+
+Agency users (TENANT_GROUP_MIN_TENANTS or more allowed tenants) get a
+tenant_group_id claim and a group-based rls_filter instead of their full
+allowed_tenants list (see src/services/tenant_group_service.py).
 """
 
 import os
@@ -21,6 +25,13 @@ import jwt
 from pydantic import BaseModel
 
 from src.platform.tenant_context import TenantContext
+from src.services.tenant_group_service import (
+    TENANT_GROUP_MIN_TENANTS,
+    ensure_tenant_group,
+    is_known_tenant_group,
+    tenant_group_id,
+    tenant_group_rls_clause,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +51,7 @@ class EmbedTokenPayload(BaseModel):
     tenant_id: str
     roles: list[str]
     allowed_tenants: list[str]
+    tenant_group_id: Optional[str] = None
     dashboard_id: Optional[str] = None
     jti: Optional[str] = None
     access_surface: Optional[str] = None
@@ -134,7 +146,6 @@ class EmbedTokenService:
             "sub": tenant_context.user_id,
             "tenant_id": tenant_context.tenant_id,
             "roles": tenant_context.roles,
-            "allowed_tenants": tenant_context.allowed_tenants,
             "billing_tier": tenant_context.billing_tier,
             "dashboard_id": dashboard_id,
             "jti": jti,
@@ -146,8 +157,8 @@ class EmbedTokenService:
             "resources": {
                 "dashboard": [dashboard_id]
             },
-            # RLS filter context
-            "rls_filter": tenant_context.get_rls_clause(),
+            # Tenant scope and RLS filter context
+            **self._tenant_scope_claims(tenant_context),
         }
 
         token = jwt.encode(
@@ -196,6 +207,53 @@ class EmbedTokenService:
             dashboard_url=dashboard_url,
         )
 
+    def _tenant_scope_claims(self, tenant_context: TenantContext) -> dict:
+        """
+        allowed_tenants / tenant_group_id / rls_filter claims.
+
+        Users with many tenants get a tenant group: allowed_tenants holds
+        only the active tenant and RLS resolves the group server-side. If
+        the group cannot be stored, the full list is embedded as before.
+        """
+        allowed = tenant_context.allowed_tenants
+        if len(allowed) >= TENANT_GROUP_MIN_TENANTS:
+            try:
+                group_id = self._resolve_tenant_group(allowed)
+            except Exception:
+                logger.warning(
+                    "Failed to resolve tenant group; embedding allowed_tenants",
+                    extra={
+                        "tenant_id": tenant_context.tenant_id,
+                        "allowed_tenant_count": len(allowed),
+                    },
+                    exc_info=True,
+                )
+            else:
+                return {
+                    "allowed_tenants": [tenant_context.tenant_id],
+                    "tenant_group_id": group_id,
+                    "rls_filter": tenant_group_rls_clause(group_id),
+                }
+        return {
+            "allowed_tenants": allowed,
+            "rls_filter": tenant_context.get_rls_clause(),
+        }
+
+    def _resolve_tenant_group(self, tenant_ids: list[str]) -> str:
+        """Group id for tenant_ids, persisting the group on first use."""
+        group_id = tenant_group_id(tenant_ids)
+        if is_known_tenant_group(group_id):
+            return group_id
+
+        from src.database.session import get_db_session_sync
+
+        db_gen = get_db_session_sync()
+        db = next(db_gen)
+        try:
+            return ensure_tenant_group(db, tenant_ids)
+        finally:
+            db.close()
+
     def _build_dashboard_url(self, dashboard_id: str, token: str) -> str:
         """
         Build Superset dashboard URL with embedded mode parameters.
@@ -0,0 +1,92 @@
+"""
+File store for generated exports.
+
+Exports are written as a stream of byte chunks, so no store
+implementation ever needs the whole file in memory. LocalExportStore
+writes to a directory on local disk; an S3-compatible store can
+implement the same interface (multipart upload per chunk batch) and be
+returned from get_export_store().
+
+Writes are atomic: chunks go to a temporary file that is renamed into
+place only after the last chunk, so a reader never sees a partial export.
+
+Environment variables:
+    AUDIT_EXPORT_DIR: Directory for LocalExportStore (default: <tmp>/audit-exports)
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+AUDIT_EXPORT_DIR = os.getenv(
+    "AUDIT_EXPORT_DIR",
+    os.path.join(tempfile.gettempdir(), "audit-exports"),
+)
+
+
+class ExportStore:
+    """Interface for export file stores."""
+
+    def write(self, key: str, chunks: Iterable[bytes]) -> int:
+        """Write chunks under key. Returns bytes written."""
+        raise NotImplementedError
+
+    def exists(self, key: str) -> bool:
+        raise NotImplementedError
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """Filesystem path of the export, or None for remote stores."""
+        return None
+
+
+class LocalExportStore(ExportStore):
+    """Export store on local disk."""
+
+    def __init__(self, base_dir: str = AUDIT_EXPORT_DIR):
+        self._base_dir = Path(base_dir)
+
+    def _path(self, key: str) -> Path:
+        path = (self._base_dir / key).resolve()
+        if self._base_dir.resolve() not in path.parents:
+            raise ValueError(f"Invalid export key: {key}")
+        return path
+
+    def write(self, key: str, chunks: Iterable[bytes]) -> int:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".partial-")
+        written = 0
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    f.write(chunk)
+                    written += len(chunk)
+            os.replace(tmp_name, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_name)
+            except OSError:
+                pass
+            raise
+        return written
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).is_file()
+
+    def local_path(self, key: str) -> Optional[Path]:
+        return self._path(key)
+
+
+_export_store: Optional[ExportStore] = None
+
+
+def get_export_store() -> ExportStore:
+    """Get the configured export store."""
+    global _export_store
+    if _export_store is None:
+        _export_store = LocalExportStore()
+    return _export_store
@@ -0,0 +1,318 @@
+"""
+Cross-tenant batched insight generation.
+
+The per-tenant path (InsightGenerationService) issues two mart queries
+per period type, each with a correlated MAX(period_end) subquery, and
+persists per tenant. For nightly fleet-wide runs InsightBatchGenerator
+does the same work set-wise for a chunk of tenants:
+
+1. One windowed query per mart returns every tenant's rows for its
+   latest period of each period type
+   (MAX(period_end) OVER (PARTITION BY tenant_id, period_type))
+2. The five column-wise detectors (insight_detection) run once over the
+   whole chunk, each row carrying its tenant's tier thresholds
+3. Detected insights are fanned back out per tenant, deduplicated and
+   inserted with one existing-hash lookup and one
+   INSERT ... ON CONFLICT DO NOTHING per batch, then grouped per job
+
+Results are identical to running each job through the per-tenant path,
+which stays in place for on-demand runs.
+
+Environment variables:
+    INSIGHT_BATCH_TENANT_CHUNK: Tenants per batched chunk (default 1000)
+
+Story 8.1 - AI Insight Generation (Read-Only Analytics)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Sequence
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from src.models.ai_insight import AIInsight
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
+from src.services.bulk_insert import (
+    existing_content_hashes_for_tenants,
+    insert_ignoring_duplicates,
+)
+from src.services.insight_detection import (
+    DetectedInsight,
+    MetricFrame,
+    detect_aov_changes,
+    detect_cac_anomalies,
+    detect_revenue_spend_divergence,
+    detect_roas_changes,
+    detect_spend_anomalies,
+)
+from src.services.insight_generation_service import (
+    INSIGHT_DEDUP_COLUMNS,
+    build_insight_row,
+    insight_content_hash,
+)
+from src.services.insight_thresholds import InsightThresholds
+
+
+logger = logging.getLogger(__name__)
+
+INSIGHT_BATCH_TENANT_CHUNK = int(os.getenv("INSIGHT_BATCH_TENANT_CHUNK", "1000"))
+
+DEFAULT_PERIOD_TYPES = ("weekly", "last_30_days")
+
+MARKETING_COLUMNS = (
+    "platform",
+    "currency",
+    "campaign_id",
+    "period_type",
+    "period_start",
+    "period_end",
+    "comparison_type",
+    "spend",
+    "prior_spend",
+    "spend_change",
+    "spend_change_pct",
+    "gross_roas",
+    "prior_gross_roas",
+    "gross_roas_change",
+    "gross_roas_change_pct",
+    "net_roas",
+    "prior_net_roas",
+    "net_roas_change_pct",
+    "cac",
+    "prior_cac",
+    "cac_change",
+    "cac_change_pct",
+    "new_customers",
+    "prior_new_customers",
+    "orders",
+    "prior_orders",
+)
+
+REVENUE_COLUMNS = (
+    "currency",
+    "period_type",
+    "period_start",
+    "period_end",
+    "comparison_type",
+    "gross_revenue",
+    "prior_gross_revenue",
+    "gross_revenue_change",
+    "gross_revenue_change_pct",
+    "net_revenue",
+    "prior_net_revenue",
+    "net_revenue_change",
+    "net_revenue_change_pct",
+    "order_count",
+    "prior_order_count",
+    "order_count_change_pct",
+    "aov",
+    "prior_aov",
+    "aov_change",
+    "aov_change_pct",
+)
+
+
+def _latest_period_query(mart: str, columns: Sequence[str]):
+    """Rows of a mart at each tenant's latest period_end per period_type."""
+    column_list = ", ".join(columns)
+    return text(f"""
+        SELECT tenant_id, {column_list}
+        FROM (
+            SELECT
+                tenant_id,
+                {column_list},
+                MAX(period_end) OVER (
+                    PARTITION BY tenant_id, period_type
+                ) AS latest_period_end
+            FROM marts.{mart}
+            WHERE tenant_id IN :tenant_ids
+              AND period_type IN :period_types
+        ) latest
+        WHERE period_end = latest_period_end
+        ORDER BY tenant_id, period_type
+    """).bindparams(
+        bindparam("tenant_ids", expanding=True),
+        bindparam("period_types", expanding=True),
+    )
+
+
+MARKETING_LATEST_QUERY = _latest_period_query("mart_marketing_metrics", MARKETING_COLUMNS)
+REVENUE_LATEST_QUERY = _latest_period_query("mart_revenue_metrics", REVENUE_COLUMNS)
+
+
+@dataclass(frozen=True)
+class InsightBatchJob:
+    """One tenant's share of a batched run."""
+
+    job_id: str
+    tenant_id: str
+    thresholds: InsightThresholds
+
+
+class InsightBatchGenerator:
+    """
+    Generates insights for many tenants at once.
+
+    Usage:
+        generator = InsightBatchGenerator(db)
+        insights_by_job = generator.generate(jobs)
+
+    SECURITY: tenant_id comes from InsightJob rows (trusted); every mart
+    row and every insight carries its tenant_id through the batch.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        period_types: Sequence[str] = DEFAULT_PERIOD_TYPES,
+    ):
+        self.db = db_session
+        self.period_types = list(period_types)
+
+    def generate(self, jobs: Sequence[InsightBatchJob]) -> dict[str, list[AIInsight]]:
+        """
+        Generate and persist insights for a chunk of jobs.
+
+        Args:
+            jobs: At most one job per tenant
+
+        Returns:
+            Inserted AIInsight objects keyed by job_id (every job present)
+        """
+        jobs_by_tenant: dict[str, InsightBatchJob] = {}
+        for job in jobs:
+            if job.tenant_id in jobs_by_tenant:
+                raise ValueError(f"Multiple jobs for tenant {job.tenant_id} in one batch")
+            jobs_by_tenant[job.tenant_id] = job
+
+        if not jobs_by_tenant:
+            return {}
+
+        marketing_rows, revenue_rows = self.fetch_metrics(list(jobs_by_tenant))
+        detected = self.detect(jobs_by_tenant, marketing_rows, revenue_rows)
+        inserted = self._persist(jobs_by_tenant, detected)
+
+        logger.info(
+            "Batched insights generated",
+            extra={
+                "tenants": len(jobs_by_tenant),
+                "marketing_rows": len(marketing_rows),
+                "revenue_rows": len(revenue_rows),
+                "detected": sum(len(d) for d in detected.values()),
+                "persisted": sum(len(i) for i in inserted.values()),
+            },
+        )
+        return inserted
+
+    def fetch_metrics(
+        self,
+        tenant_ids: list[str],
+    ) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Latest-period marketing and revenue rows for all tenants."""
+        params = {"tenant_ids": tenant_ids, "period_types": self.period_types}
+        marketing = self.db.execute(MARKETING_LATEST_QUERY, params)
+        marketing_rows = [dict(row._mapping) for row in marketing.fetchall()]
+        revenue = self.db.execute(REVENUE_LATEST_QUERY, params)
+        revenue_rows = [dict(row._mapping) for row in revenue.fetchall()]
+        return marketing_rows, revenue_rows
+
+    def detect(
+        self,
+        jobs_by_tenant: dict[str, InsightBatchJob],
+        marketing_rows: list[dict[str, Any]],
+        revenue_rows: list[dict[str, Any]],
+    ) -> dict[str, list[DetectedInsight]]:
+        """
+        Run all detectors over the combined frames.
+
+        Returns:
+            Detected insights keyed by tenant_id (every tenant present)
+        """
+        detected: dict[str, list[DetectedInsight]] = {t: [] for t in jobs_by_tenant}
+
+        marketing = MetricFrame(marketing_rows)
+        marketing_tenants = marketing.column("tenant_id")
+        marketing_periods = marketing.column("period_type")
+        marketing_thresholds = [jobs_by_tenant[t].thresholds for t in marketing_tenants]
+
+        revenue = MetricFrame(revenue_rows)
+        revenue_tenants = revenue.column("tenant_id")
+        revenue_periods = revenue.column("period_type")
+        revenue_thresholds = [jobs_by_tenant[t].thresholds for t in revenue_tenants]
+
+        for detector in (detect_spend_anomalies, detect_roas_changes, detect_cac_anomalies):
+            for i, insight in detector(marketing, marketing_periods, marketing_thresholds):
+                detected[marketing_tenants[i]].append(insight)
+
+        divergence = detect_revenue_spend_divergence(
+            marketing,
+            list(zip(marketing_tenants, marketing_periods)),
+            revenue,
+            list(zip(revenue_tenants, revenue_periods)),
+            revenue_periods,
+            revenue_thresholds,
+        )
+        for i, insight in divergence:
+            detected[revenue_tenants[i]].append(insight)
+
+        for i, insight in detect_aov_changes(revenue, revenue_periods, revenue_thresholds):
+            detected[revenue_tenants[i]].append(insight)
+
+        return detected
+
+    def _persist(
+        self,
+        jobs_by_tenant: dict[str, InsightBatchJob],
+        detected: dict[str, list[DetectedInsight]],
+    ) -> dict[str, list[AIInsight]]:
+        """Insert new insights for all tenants and group them per job."""
+        by_hash: dict[str, tuple[str, DetectedInsight]] = {}
+        for tenant_id, insights in detected.items():
+            for insight in insights:
+                by_hash.setdefault(insight_content_hash(tenant_id, insight), (tenant_id, insight))
+
+        existing = existing_content_hashes_for_tenants(
+            self.db,
+            AIInsight,
+            {tenant_id for tenant_id, _ in by_hash.values()},
+            by_hash,
+        )
+        generated_at = datetime.now(timezone.utc)
+
+        rows = [
+            build_insight_row(
+                tenant_id,
+                insight,
+                jobs_by_tenant[tenant_id].job_id,
+                content_hash,
+                generated_at,
+            )
+            for content_hash, (tenant_id, insight) in by_hash.items()
+            if content_hash not in existing
+        ]
+
+        inserted = insert_ignoring_duplicates(self.db, AIInsight, rows, INSIGHT_DEDUP_COLUMNS)
+
+        by_job: dict[str, list[AIInsight]] = {
+            job.job_id: [] for job in jobs_by_tenant.values()
+        }
+        for insight in inserted:
+            by_job[insight.job_id].append(insight)
+
+        # Unread insight badges refetch once this commits
+        for tenant_id, job in jobs_by_tenant.items():
+            if by_job[job.job_id]:
+                publish_live_event(
+                    LiveEvent(
+                        type=LiveEventType.INSIGHTS,
+                        tenant_id=tenant_id,
+                        data={"count": len(by_job[job.job_id])},
+                    ),
+                    db=self.db,
+                )
+        return by_job
@@ -0,0 +1,441 @@
+"""
+Column-wise insight detectors.
+
+The five detectors (spend, ROAS, CAC, AOV, revenue/spend divergence) are
+written once over a MetricFrame - mart rows viewed as columns - with one
+threshold set per row. InsightGenerationService runs them over a single
+tenant's rows; InsightBatchGenerator runs them once over the rows of
+thousands of tenants and fans the results back out by row index.
+
+Each detector first computes its candidate mask as whole-column
+operations (coerce, compare against the per-row threshold column) and
+only builds DetectedInsight objects for the rows that pass, so the cost
+for the common no-insight row is a few list comprehensions.
+
+Like the data quality kernels these are plain Python: the frames are a
+few rows per tenant and the work is comparisons, not arithmetic.
+
+Story 8.1 - AI Insight Generation (Read-Only Analytics)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Hashable, Sequence
+
+from src.models.ai_insight import InsightType, InsightSeverity
+from src.services.insight_thresholds import InsightThresholds
+
+
+@dataclass
+class MetricChange:
+    """Represents a metric change for analysis."""
+
+    metric_name: str
+    current_value: Decimal
+    prior_value: Decimal
+    delta: Decimal
+    delta_pct: float
+    timeframe: str
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON storage."""
+        return {
+            "metric": self.metric_name,
+            "current_value": float(self.current_value),
+            "prior_value": float(self.prior_value),
+            "delta": float(self.delta),
+            "delta_pct": self.delta_pct,
+            "timeframe": self.timeframe,
+        }
+
+
+@dataclass
+class DetectedInsight:
+    """Intermediate representation of a detected insight."""
+
+    insight_type: InsightType
+    severity: InsightSeverity
+    metrics: list[MetricChange]
+    period_type: str
+    period_start: datetime
+    period_end: datetime
+    comparison_type: str
+    platform: str | None = None
+    campaign_id: str | None = None
+    currency: str | None = None
+    confidence_score: float = 0.0
+
+
+# Row index into the frame the insight was detected on
+IndexedInsight = tuple[int, DetectedInsight]
+
+
+class MetricFrame:
+    """
+    Column view over mart rows.
+
+    Columns are materialized on first access and reused by every detector
+    that reads them.
+    """
+
+    def __init__(self, rows: Sequence[dict[str, Any]]):
+        self.rows = rows
+        self._columns: dict[str, list[Any]] = {}
+        self._floats: dict[str, list[float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def column(self, name: str) -> list[Any]:
+        """Raw values of a column (None where missing)."""
+        values = self._columns.get(name)
+        if values is None:
+            values = self._columns[name] = [row.get(name) for row in self.rows]
+        return values
+
+    def floats(self, name: str) -> list[float]:
+        """Column coerced to float, with NULL/missing as 0."""
+        values = self._floats.get(name)
+        if values is None:
+            values = self._floats[name] = [float(v or 0) for v in self.column(name)]
+        return values
+
+
+def calculate_severity(
+    change_pct: float,
+    warning_threshold: float,
+    critical_threshold: float,
+) -> InsightSeverity:
+    """Calculate severity based on change magnitude."""
+    if change_pct >= critical_threshold:
+        return InsightSeverity.CRITICAL
+    if change_pct >= warning_threshold:
+        return InsightSeverity.WARNING
+    return InsightSeverity.INFO
+
+
+def calculate_confidence(
+    change_pct: float,
+    current_value: float,
+    prior_value: float,
+) -> float:
+    """
+    Calculate confidence score based on statistical significance.
+
+    Higher confidence when:
+    - Both values are non-trivial (not near zero)
+    - Change is larger than threshold
+    """
+    # Low confidence if values are too small
+    if current_value < 100 and prior_value < 100:
+        return 0.5
+
+    # Higher confidence for larger relative changes
+    abs_change = abs(change_pct)
+    if abs_change > 50:
+        return 0.95
+    if abs_change > 30:
+        return 0.85
+    if abs_change > 15:
+        return 0.75
+    return 0.65
+
+
+def _aov_severity(abs_change_pct: float, thresholds: InsightThresholds) -> InsightSeverity:
+    # AOV changes are typically INFO unless very large
+    if abs_change_pct >= 40:
+        return InsightSeverity.CRITICAL
+    if abs_change_pct >= 25:
+        return InsightSeverity.WARNING
+    return InsightSeverity.INFO
+
+
+@dataclass(frozen=True)
+class _ChangeRule:
+    """One single-metric detector: which columns, thresholds and severity."""
+
+    insight_type: InsightType
+    metric_name: str
+    value_column: str
+    prior_column: str
+    change_column: str
+    change_pct_column: str
+    threshold: Callable[[InsightThresholds], float]
+    severity: Callable[[float, InsightThresholds], InsightSeverity]
+    # Rows where both values fall below the floor are skipped; None skips
+    # only rows where both are zero
+    floor: Callable[[InsightThresholds], float] | None = None
+    per_campaign: bool = True
+
+
+SPEND_RULE = _ChangeRule(
+    insight_type=InsightType.SPEND_ANOMALY,
+    metric_name="spend",
+    value_column="spend",
+    prior_column="prior_spend",
+    change_column="spend_change",
+    change_pct_column="spend_change_pct",
+    threshold=lambda t: t.spend_anomaly_pct,
+    severity=lambda pct, t: calculate_severity(pct, t.spend_anomaly_pct, t.spend_critical_pct),
+    floor=lambda t: t.min_spend_for_analysis,
+)
+
+ROAS_RULE = _ChangeRule(
+    insight_type=InsightType.ROAS_CHANGE,
+    metric_name="gross_roas",
+    value_column="gross_roas",
+    prior_column="prior_gross_roas",
+    change_column="gross_roas_change",
+    change_pct_column="gross_roas_change_pct",
+    threshold=lambda t: t.roas_change_pct,
+    severity=lambda pct, t: calculate_severity(pct, t.roas_change_pct, t.roas_critical_pct),
+)
+
+CAC_RULE = _ChangeRule(
+    insight_type=InsightType.CAC_ANOMALY,
+    metric_name="cac",
+    value_column="cac",
+    prior_column="prior_cac",
+    change_column="cac_change",
+    change_pct_column="cac_change_pct",
+    threshold=lambda t: t.cac_anomaly_pct,
+    severity=lambda pct, t: calculate_severity(pct, t.cac_anomaly_pct, t.cac_critical_pct),
+)
+
+AOV_RULE = _ChangeRule(
+    insight_type=InsightType.AOV_CHANGE,
+    metric_name="aov",
+    value_column="aov",
+    prior_column="prior_aov",
+    change_column="aov_change",
+    change_pct_column="aov_change_pct",
+    threshold=lambda t: t.aov_change_pct,
+    severity=_aov_severity,
+    per_campaign=False,
+)
+
+
+def _detect_changes(
+    rule: _ChangeRule,
+    frame: MetricFrame,
+    period_types: Sequence[str],
+    thresholds: Sequence[InsightThresholds],
+) -> list[IndexedInsight]:
+    """Apply a single-metric rule to every row of the frame."""
+    values = frame.floats(rule.value_column)
+    priors = frame.floats(rule.prior_column)
+    change_pcts = frame.floats(rule.change_pct_column)
+    limits = [rule.threshold(t) for t in thresholds]
+
+    if rule.floor is None:
+        has_data = [v != 0 or p != 0 for v, p in zip(values, priors)]
+    else:
+        floors = [rule.floor(t) for t in thresholds]
+        has_data = [v >= f or p >= f for v, p, f in zip(values, priors, floors)]
+
+    hits = [
+        i
+        for i, (ok, pct, limit) in enumerate(zip(has_data, change_pcts, limits))
+        if ok and abs(pct) >= limit
+    ]
+    if not hits:
+        return []
+
+    changes = frame.column(rule.change_column)
+    comparison_types = frame.column("comparison_type")
+    currencies = frame.column("currency")
+    platforms = frame.column("platform")
+    campaign_ids = frame.column("campaign_id")
+
+    insights = []
+    for i in hits:
+        row = frame.rows[i]
+        value, prior, change_pct = values[i], priors[i], change_pcts[i]
+        metrics = [
+            MetricChange(
+                metric_name=rule.metric_name,
+                current_value=Decimal(str(value)),
+                prior_value=Decimal(str(prior)),
+                delta=Decimal(str(changes[i] or 0)),
+                delta_pct=change_pct,
+                timeframe=comparison_types[i] or "period_over_period",
+            )
+        ]
+        insights.append((
+            i,
+            DetectedInsight(
+                insight_type=rule.insight_type,
+                severity=rule.severity(abs(change_pct), thresholds[i]),
+                metrics=metrics,
+                period_type=period_types[i],
+                period_start=row["period_start"],
+                period_end=row["period_end"],
+                comparison_type=comparison_types[i] or "",
+                platform=platforms[i] if rule.per_campaign else None,
+                campaign_id=campaign_ids[i] if rule.per_campaign else None,
+                currency=currencies[i],
+                confidence_score=calculate_confidence(change_pct, value, prior),
+            ),
+        ))
+    return insights
+
+
+def detect_spend_anomalies(
+    frame: MetricFrame,
+    period_types: Sequence[str],
+    thresholds: Sequence[InsightThresholds],
+) -> list[IndexedInsight]:
+    """Detect significant spend changes in marketing rows."""
+    return _detect_changes(SPEND_RULE, frame, period_types, thresholds)
+
+
+def detect_roas_changes(
+    frame: MetricFrame,
+    period_types: Sequence[str],
+    thresholds: Sequence[InsightThresholds],
+) -> list[IndexedInsight]:
+    """Detect significant ROAS changes in marketing rows."""
+    return _detect_changes(ROAS_RULE, frame, period_types, thresholds)
+
+
+def detect_cac_anomalies(
+    frame: MetricFrame,
+    period_types: Sequence[str],
+    thresholds: Sequence[InsightThresholds],
+) -> list[IndexedInsight]:
+    """Detect significant CAC changes in marketing rows."""
+    return _detect_changes(CAC_RULE, frame, period_types, thresholds)
+
+
+def detect_aov_changes(
+    frame: MetricFrame,
+    period_types: Sequence[str],
+    thresholds: Sequence[InsightThresholds],
+) -> list[IndexedInsight]:
+    """Detect significant AOV changes in revenue rows."""
+    return _detect_changes(AOV_RULE, frame, period_types, thresholds)
+
+
+def detect_revenue_spend_divergence(
+    marketing: MetricFrame,
+    marketing_scopes: Sequence[Hashable],
+    revenue: MetricFrame,
+    revenue_scopes: Sequence[Hashable],
+    period_types: Sequence[str],
+    thresholds: Sequence[InsightThresholds],
+) -> list[IndexedInsight]:
+    """
+    Detect when revenue and spend move in opposite directions.
+
+    Marketing spend is summed per (scope, currency) and compared with each
+    revenue row of the same scope and currency. A scope is whatever
+    separates independent datasets in the frames: constant for one
+    tenant and period, (tenant_id, period_type) for a batch.
+
+    Args:
+        period_types, thresholds: Per revenue row
+    """
+    # Aggregate marketing spend by scope and currency
+    spend_by_key: dict[Hashable, dict] = {}
+    spends = marketing.floats("spend")
+    prior_spends = marketing.floats("prior_spend")
+    for i, (scope, currency) in enumerate(zip(marketing_scopes, marketing.column("currency"))):
+        key = (scope, currency or "USD")
+        data = spend_by_key.get(key)
+        if data is None:
+            row = marketing.rows[i]
+            data = spend_by_key[key] = {
+                "spend": 0,
+                "prior_spend": 0,
+                "spend_change_pct": 0,
+                "period_start": row["period_start"],
+                "period_end": row["period_end"],
+                "comparison_type": row.get("comparison_type") or "",
+            }
+        data["spend"] += spends[i]
+        data["prior_spend"] += prior_spends[i]
+
+    # Recalculate percentage after aggregation
+    for data in spend_by_key.values():
+        if data["prior_spend"] > 0:
+            data["spend_change_pct"] = (
+                (data["spend"] - data["prior_spend"]) / data["prior_spend"] * 100
+            )
+
+    revenue_change_pcts = revenue.floats("net_revenue_change_pct")
+    net_revenues = revenue.floats("net_revenue")
+    prior_net_revenues = revenue.floats("prior_net_revenue")
+    keys = [
+        (scope, currency or "USD")
+        for scope, currency in zip(revenue_scopes, revenue.column("currency"))
+    ]
+
+    insights = []
+    for i, key in enumerate(keys):
+        spend_data = spend_by_key.get(key)
+        if spend_data is None:
+            continue
+
+        revenue_change_pct = revenue_change_pcts[i]
+        spend_change_pct = spend_data["spend_change_pct"]
+
+        # Check for divergence: opposite directions with significant magnitude
+        threshold = thresholds[i].divergence_pct
+        is_divergent = (
+            (revenue_change_pct < -threshold and spend_change_pct > threshold)
+            or (revenue_change_pct > threshold and spend_change_pct < -threshold)
+        )
+        if not is_divergent:
+            continue
+
+        # Skip if values are too small
+        net_revenue = net_revenues[i]
+        prior_net_revenue = prior_net_revenues[i]
+        min_revenue = thresholds[i].min_revenue_for_analysis
+        if net_revenue < min_revenue and prior_net_revenue < min_revenue:
+            continue
+
+        rev_row = revenue.rows[i]
+        metrics = [
+            MetricChange(
+                metric_name="net_revenue",
+                current_value=Decimal(str(net_revenue)),
+                prior_value=Decimal(str(prior_net_revenue)),
+                delta=Decimal(str(rev_row.get("net_revenue_change") or 0)),
+                delta_pct=revenue_change_pct,
+                timeframe=rev_row.get("comparison_type") or "period_over_period",
+            ),
+            MetricChange(
+                metric_name="spend",
+                current_value=Decimal(str(spend_data["spend"])),
+                prior_value=Decimal(str(spend_data["prior_spend"])),
+                delta=Decimal(str(spend_data["spend"] - spend_data["prior_spend"])),
+                delta_pct=spend_change_pct,
+                timeframe=spend_data["comparison_type"],
+            ),
+        ]
+
+        # Divergence is always at least WARNING severity
+        severity = InsightSeverity.WARNING
+        if abs(revenue_change_pct) > 25 or abs(spend_change_pct) > 25:
+            severity = InsightSeverity.CRITICAL
+
+        insights.append((
+            i,
+            DetectedInsight(
+                insight_type=InsightType.REVENUE_VS_SPEND_DIVERGENCE,
+                severity=severity,
+                metrics=metrics,
+                period_type=period_types[i],
+                period_start=rev_row["period_start"],
+                period_end=rev_row["period_end"],
+                comparison_type=rev_row.get("comparison_type") or "",
+                currency=key[1],
+                confidence_score=0.85,
+            ),
+        ))
+
+    return insights
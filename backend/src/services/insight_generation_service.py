@@ -17,60 +17,86 @@ from __future__ import annotations
 
 import hashlib
 import logging
-from dataclasses import dataclass, field
+import uuid
 from datetime import datetime, timezone
-from decimal import Decimal
 from typing import Any
 
 from sqlalchemy import text
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
-from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
+from src.models.ai_insight import AIInsight, InsightSeverity
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
+from src.services.bulk_insert import existing_content_hashes, insert_ignoring_duplicates
+from src.services.insight_detection import (
+    DetectedInsight,
+    MetricChange,  # noqa: F401 - re-exported for existing importers
+    MetricFrame,
+    calculate_confidence,
+    calculate_severity,
+    detect_aov_changes,
+    detect_cac_anomalies,
+    detect_revenue_spend_divergence,
+    detect_roas_changes,
+    detect_spend_anomalies,
+)
 from src.services.insight_thresholds import InsightThresholds, DEFAULT_THRESHOLDS
 
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class MetricChange:
-    """Represents a metric change for analysis."""
-
-    metric_name: str
-    current_value: Decimal
-    prior_value: Decimal
-    delta: Decimal
-    delta_pct: float
-    timeframe: str
-
-    def to_dict(self) -> dict:
-        """Convert to dictionary for JSON storage."""
-        return {
-            "metric": self.metric_name,
-            "current_value": float(self.current_value),
-            "prior_value": float(self.prior_value),
-            "delta": float(self.delta),
-            "delta_pct": self.delta_pct,
-            "timeframe": self.timeframe,
-        }
-
-
-@dataclass
-class DetectedInsight:
-    """Intermediate representation of a detected insight."""
-
-    insight_type: InsightType
-    severity: InsightSeverity
-    metrics: list[MetricChange]
-    period_type: str
-    period_start: datetime
-    period_end: datetime
-    comparison_type: str
-    platform: str | None = None
-    campaign_id: str | None = None
-    currency: str | None = None
-    confidence_score: float = 0.0
+# Unique constraint AIInsight rows are deduplicated on
+INSIGHT_DEDUP_COLUMNS = ("tenant_id", "content_hash", "period_end")
+
+
+def insight_content_hash(tenant_id: str, detected: DetectedInsight) -> str:
+    """Generate deterministic hash for deduplication."""
+    parts = [
+        tenant_id,
+        detected.insight_type.value,
+        detected.period_type,
+        detected.period_end.isoformat() if detected.period_end else "",
+        detected.platform or "",
+        detected.campaign_id or "",
+    ]
+    for m in detected.metrics:
+        parts.append(f"{m.metric_name}:{m.delta_pct:.2f}")
+
+    content = "|".join(parts)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+def build_insight_row(
+    tenant_id: str,
+    detected: DetectedInsight,
+    job_id: str,
+    content_hash: str,
+    generated_at: datetime,
+) -> dict[str, Any]:
+    """Column values for one AIInsight insert, with rendered summary text."""
+    from src.services.insight_templates import render_insight_summary, render_why_it_matters
+
+    return {
+        "id": str(uuid.uuid4()),
+        "tenant_id": tenant_id,
+        "insight_type": detected.insight_type,
+        "severity": detected.severity,
+        "summary": render_insight_summary(detected),
+        "why_it_matters": render_why_it_matters(detected),
+        "supporting_metrics": [m.to_dict() for m in detected.metrics],
+        "confidence_score": detected.confidence_score,
+        "period_type": detected.period_type,
+        "period_start": detected.period_start,
+        "period_end": detected.period_end,
+        "comparison_type": detected.comparison_type,
+        "platform": detected.platform,
+        "campaign_id": detected.campaign_id,
+        "currency": detected.currency,
+        "generated_at": generated_at,
+        "job_id": job_id,
+        "content_hash": content_hash,
+        "is_read": 0,
+        "is_dismissed": 0,
+    }
 
 
 class InsightGenerationService:
@@ -138,11 +164,7 @@ class InsightGenerationService:
             )
 
         # Persist insights
-        persisted = []
-        for detected in all_detected:
-            insight = self._persist_insight(detected, job_id)
-            if insight:
-                persisted.append(insight)
+        persisted = self._persist_insights(all_detected, job_id)
 
         logger.info(
             "Insights generated",
@@ -244,61 +266,22 @@ class InsightGenerationService:
 
         return [dict(row._mapping) for row in result.fetchall()]
 
+    def _detect(self, detector, data: list[dict], period_type: str) -> list[DetectedInsight]:
+        """Run a column-wise detector over this tenant's rows."""
+        frame = MetricFrame(data)
+        n = len(frame)
+        return [
+            detected
+            for _, detected in detector(frame, [period_type] * n, [self.thresholds] * n)
+        ]
+
     def _detect_spend_anomalies(
         self,
         marketing_data: list[dict],
         period_type: str,
     ) -> list[DetectedInsight]:
         """Detect significant spend changes."""
-        insights = []
-
-        for row in marketing_data:
-            spend = float(row.get("spend") or 0)
-            prior_spend = float(row.get("prior_spend") or 0)
-            change_pct = float(row.get("spend_change_pct") or 0)
-
-            # Skip if below minimum threshold
-            if spend < self.thresholds.min_spend_for_analysis and \
-               prior_spend < self.thresholds.min_spend_for_analysis:
-                continue
-
-            if abs(change_pct) >= self.thresholds.spend_anomaly_pct:
-                severity = self._calculate_severity(
-                    abs(change_pct),
-                    self.thresholds.spend_anomaly_pct,
-                    self.thresholds.spend_critical_pct,
-                )
-
-                metrics = [
-                    MetricChange(
-                        metric_name="spend",
-                        current_value=Decimal(str(spend)),
-                        prior_value=Decimal(str(prior_spend)),
-                        delta=Decimal(str(row.get("spend_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.SPEND_ANOMALY,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        platform=row.get("platform"),
-                        campaign_id=row.get("campaign_id"),
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, spend, prior_spend
-                        ),
-                    )
-                )
-
-        return insights
+        return self._detect(detect_spend_anomalies, marketing_data, period_type)
 
     def _detect_roas_changes(
         self,
@@ -306,54 +289,7 @@ class InsightGenerationService:
         period_type: str,
     ) -> list[DetectedInsight]:
         """Detect significant ROAS changes."""
-        insights = []
-
-        for row in marketing_data:
-            roas = float(row.get("gross_roas") or 0)
-            prior_roas = float(row.get("prior_gross_roas") or 0)
-            change_pct = float(row.get("gross_roas_change_pct") or 0)
-
-            # Skip if no meaningful ROAS data
-            if roas == 0 and prior_roas == 0:
-                continue
-
-            if abs(change_pct) >= self.thresholds.roas_change_pct:
-                severity = self._calculate_severity(
-                    abs(change_pct),
-                    self.thresholds.roas_change_pct,
-                    self.thresholds.roas_critical_pct,
-                )
-
-                metrics = [
-                    MetricChange(
-                        metric_name="gross_roas",
-                        current_value=Decimal(str(roas)),
-                        prior_value=Decimal(str(prior_roas)),
-                        delta=Decimal(str(row.get("gross_roas_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.ROAS_CHANGE,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        platform=row.get("platform"),
-                        campaign_id=row.get("campaign_id"),
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, roas, prior_roas
-                        ),
-                    )
-                )
-
-        return insights
+        return self._detect(detect_roas_changes, marketing_data, period_type)
 
     def _detect_revenue_spend_divergence(
         self,
@@ -362,103 +298,16 @@ class InsightGenerationService:
         period_type: str,
     ) -> list[DetectedInsight]:
         """Detect when revenue and spend move in opposite directions."""
-        insights = []
-
-        # Aggregate marketing spend by currency
-        spend_by_currency: dict[str, dict] = {}
-        for row in marketing_data:
-            currency = row.get("currency") or "USD"
-            if currency not in spend_by_currency:
-                spend_by_currency[currency] = {
-                    "spend": 0,
-                    "prior_spend": 0,
-                    "spend_change_pct": 0,
-                    "period_start": row["period_start"],
-                    "period_end": row["period_end"],
-                    "comparison_type": row.get("comparison_type") or "",
-                }
-            spend_by_currency[currency]["spend"] += float(row.get("spend") or 0)
-            spend_by_currency[currency]["prior_spend"] += float(
-                row.get("prior_spend") or 0
-            )
-
-        # Recalculate percentage after aggregation
-        for currency, data in spend_by_currency.items():
-            if data["prior_spend"] > 0:
-                data["spend_change_pct"] = (
-                    (data["spend"] - data["prior_spend"]) / data["prior_spend"] * 100
-                )
-
-        for rev_row in revenue_data:
-            currency = rev_row.get("currency") or "USD"
-            revenue_change_pct = float(rev_row.get("net_revenue_change_pct") or 0)
-            net_revenue = float(rev_row.get("net_revenue") or 0)
-            prior_net_revenue = float(rev_row.get("prior_net_revenue") or 0)
-
-            if currency not in spend_by_currency:
-                continue
-
-            spend_data = spend_by_currency[currency]
-            spend_change_pct = spend_data["spend_change_pct"]
-
-            # Check for divergence: opposite directions with significant magnitude
-            threshold = self.thresholds.divergence_pct
-            is_divergent = (
-                (revenue_change_pct < -threshold and spend_change_pct > threshold)
-                or (revenue_change_pct > threshold and spend_change_pct < -threshold)
-            )
-
-            if not is_divergent:
-                continue
-
-            # Skip if values are too small
-            if (
-                net_revenue < self.thresholds.min_revenue_for_analysis
-                and prior_net_revenue < self.thresholds.min_revenue_for_analysis
-            ):
-                continue
-
-            metrics = [
-                MetricChange(
-                    metric_name="net_revenue",
-                    current_value=Decimal(str(net_revenue)),
-                    prior_value=Decimal(str(prior_net_revenue)),
-                    delta=Decimal(str(rev_row.get("net_revenue_change") or 0)),
-                    delta_pct=revenue_change_pct,
-                    timeframe=rev_row.get("comparison_type") or "period_over_period",
-                ),
-                MetricChange(
-                    metric_name="spend",
-                    current_value=Decimal(str(spend_data["spend"])),
-                    prior_value=Decimal(str(spend_data["prior_spend"])),
-                    delta=Decimal(
-                        str(spend_data["spend"] - spend_data["prior_spend"])
-                    ),
-                    delta_pct=spend_change_pct,
-                    timeframe=spend_data["comparison_type"],
-                ),
-            ]
-
-            # Divergence is always at least WARNING severity
-            severity = InsightSeverity.WARNING
-            if abs(revenue_change_pct) > 25 or abs(spend_change_pct) > 25:
-                severity = InsightSeverity.CRITICAL
-
-            insights.append(
-                DetectedInsight(
-                    insight_type=InsightType.REVENUE_VS_SPEND_DIVERGENCE,
-                    severity=severity,
-                    metrics=metrics,
-                    period_type=period_type,
-                    period_start=rev_row["period_start"],
-                    period_end=rev_row["period_end"],
-                    comparison_type=rev_row.get("comparison_type") or "",
-                    currency=currency,
-                    confidence_score=0.85,
-                )
-            )
-
-        return insights
+        n = len(revenue_data)
+        detected = detect_revenue_spend_divergence(
+            MetricFrame(marketing_data),
+            [None] * len(marketing_data),
+            MetricFrame(revenue_data),
+            [None] * n,
+            [period_type] * n,
+            [self.thresholds] * n,
+        )
+        return [insight for _, insight in detected]
 
     def _detect_cac_anomalies(
         self,
@@ -466,54 +315,7 @@ class InsightGenerationService:
         period_type: str,
     ) -> list[DetectedInsight]:
         """Detect significant CAC changes."""
-        insights = []
-
-        for row in marketing_data:
-            cac = float(row.get("cac") or 0)
-            prior_cac = float(row.get("prior_cac") or 0)
-            change_pct = float(row.get("cac_change_pct") or 0)
-
-            # Skip if no CAC data
-            if cac == 0 and prior_cac == 0:
-                continue
-
-            if abs(change_pct) >= self.thresholds.cac_anomaly_pct:
-                severity = self._calculate_severity(
-                    abs(change_pct),
-                    self.thresholds.cac_anomaly_pct,
-                    self.thresholds.cac_critical_pct,
-                )
-
-                metrics = [
-                    MetricChange(
-                        metric_name="cac",
-                        current_value=Decimal(str(cac)),
-                        prior_value=Decimal(str(prior_cac)),
-                        delta=Decimal(str(row.get("cac_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.CAC_ANOMALY,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        platform=row.get("platform"),
-                        campaign_id=row.get("campaign_id"),
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, cac, prior_cac
-                        ),
-                    )
-                )
-
-        return insights
+        return self._detect(detect_cac_anomalies, marketing_data, period_type)
 
     def _detect_aov_changes(
         self,
@@ -521,53 +323,7 @@ class InsightGenerationService:
         period_type: str,
     ) -> list[DetectedInsight]:
         """Detect significant AOV changes."""
-        insights = []
-
-        for row in revenue_data:
-            aov = float(row.get("aov") or 0)
-            prior_aov = float(row.get("prior_aov") or 0)
-            change_pct = float(row.get("aov_change_pct") or 0)
-
-            # Skip if no AOV data
-            if aov == 0 and prior_aov == 0:
-                continue
-
-            if abs(change_pct) >= self.thresholds.aov_change_pct:
-                # AOV changes are typically INFO unless very large
-                severity = InsightSeverity.INFO
-                if abs(change_pct) >= 25:
-                    severity = InsightSeverity.WARNING
-                if abs(change_pct) >= 40:
-                    severity = InsightSeverity.CRITICAL
-
-                metrics = [
-                    MetricChange(
-                        metric_name="aov",
-                        current_value=Decimal(str(aov)),
-                        prior_value=Decimal(str(prior_aov)),
-                        delta=Decimal(str(row.get("aov_change") or 0)),
-                        delta_pct=change_pct,
-                        timeframe=row.get("comparison_type") or "period_over_period",
-                    )
-                ]
-
-                insights.append(
-                    DetectedInsight(
-                        insight_type=InsightType.AOV_CHANGE,
-                        severity=severity,
-                        metrics=metrics,
-                        period_type=period_type,
-                        period_start=row["period_start"],
-                        period_end=row["period_end"],
-                        comparison_type=row.get("comparison_type") or "",
-                        currency=row.get("currency"),
-                        confidence_score=self._calculate_confidence(
-                            change_pct, aov, prior_aov
-                        ),
-                    )
-                )
-
-        return insights
+        return self._detect(detect_aov_changes, revenue_data, period_type)
 
     def _calculate_severity(
         self,
@@ -576,11 +332,7 @@ class InsightGenerationService:
         critical_threshold: float,
     ) -> InsightSeverity:
         """Calculate severity based on change magnitude."""
-        if change_pct >= critical_threshold:
-            return InsightSeverity.CRITICAL
-        if change_pct >= warning_threshold:
-            return InsightSeverity.WARNING
-        return InsightSeverity.INFO
+        return calculate_severity(change_pct, warning_threshold, critical_threshold)
 
     def _calculate_confidence(
         self,
@@ -588,89 +340,58 @@ class InsightGenerationService:
         current_value: float,
         prior_value: float,
     ) -> float:
-        """
-        Calculate confidence score based on statistical significance.
-
-        Higher confidence when:
-        - Both values are non-trivial (not near zero)
-        - Change is larger than threshold
-        """
-        # Low confidence if values are too small
-        if current_value < 100 and prior_value < 100:
-            return 0.5
-
-        # Higher confidence for larger relative changes
-        abs_change = abs(change_pct)
-        if abs_change > 50:
-            return 0.95
-        if abs_change > 30:
-            return 0.85
-        if abs_change > 15:
-            return 0.75
-        return 0.65
+        """Calculate confidence score based on statistical significance."""
+        return calculate_confidence(change_pct, current_value, prior_value)
 
     def _generate_content_hash(self, detected: DetectedInsight) -> str:
         """Generate deterministic hash for deduplication."""
-        parts = [
-            self.tenant_id,
-            detected.insight_type.value,
-            detected.period_type,
-            detected.period_end.isoformat() if detected.period_end else "",
-            detected.platform or "",
-            detected.campaign_id or "",
-        ]
-        for m in detected.metrics:
-            parts.append(f"{m.metric_name}:{m.delta_pct:.2f}")
+        return insight_content_hash(self.tenant_id, detected)
 
-        content = "|".join(parts)
-        return hashlib.sha256(content.encode()).hexdigest()
-
-    def _persist_insight(
+    def _persist_insights(
         self,
-        detected: DetectedInsight,
+        detected_insights: list[DetectedInsight],
         job_id: str,
-    ) -> AIInsight | None:
-        """Persist insight to database, handling deduplication."""
-        from src.services.insight_templates import render_insight_summary, render_why_it_matters
-
-        content_hash = self._generate_content_hash(detected)
-        summary = render_insight_summary(detected)
-        why_it_matters = render_why_it_matters(detected)
-
-        insight = AIInsight(
-            tenant_id=self.tenant_id,
-            insight_type=detected.insight_type,
-            severity=detected.severity,
-            summary=summary,
-            why_it_matters=why_it_matters,
-            supporting_metrics=[m.to_dict() for m in detected.metrics],
-            confidence_score=detected.confidence_score,
-            period_type=detected.period_type,
-            period_start=detected.period_start,
-            period_end=detected.period_end,
-            comparison_type=detected.comparison_type,
-            platform=detected.platform,
-            campaign_id=detected.campaign_id,
-            currency=detected.currency,
-            generated_at=datetime.now(timezone.utc),
-            job_id=job_id,
-            content_hash=content_hash,
-            is_read=0,
-            is_dismissed=0,
-        )
+    ) -> list[AIInsight]:
+        """
+        Persist detected insights in batches, skipping duplicates.
+
+        Hashes already stored are filtered out before rendering templates;
+        the rest go through one INSERT ... ON CONFLICT DO NOTHING per batch,
+        so a duplicate never discards the other insights in the session.
+        """
+        by_hash: dict[str, DetectedInsight] = {}
+        for detected in detected_insights:
+            by_hash.setdefault(self._generate_content_hash(detected), detected)
+
+        existing = existing_content_hashes(self.db, AIInsight, self.tenant_id, by_hash)
+        generated_at = datetime.now(timezone.utc)
 
-        try:
-            self.db.add(insight)
-            self.db.flush()
-            return insight
-        except IntegrityError:
-            # Duplicate constraint violation - insight already exists
-            self.db.rollback()
-            logger.debug(
-                "Insight deduplicated",
-                extra={
-                    "tenant_id": self.tenant_id,
-                    "content_hash": content_hash,
-                },
+        rows = [
+            build_insight_row(self.tenant_id, detected, job_id, content_hash, generated_at)
+            for content_hash, detected in by_hash.items()
+            if content_hash not in existing
+        ]
+
+        inserted = insert_ignoring_duplicates(
+            self.db, AIInsight, rows, INSIGHT_DEDUP_COLUMNS,
+        )
+        if inserted:
+            # Unread insight badges refetch once this commits
+            publish_live_event(
+                LiveEvent(
+                    type=LiveEventType.INSIGHTS,
+                    tenant_id=self.tenant_id,
+                    data={"count": len(inserted)},
+                ),
+                db=self.db,
             )
-            return None
+
+        logger.debug(
+            "Insights deduplicated",
+            extra={
+                "tenant_id": self.tenant_id,
+                "detected": len(detected_insights),
+                "duplicates": len(detected_insights) - len(inserted),
+            },
+        )
+        return inserted
@@ -4,6 +4,13 @@ Job runner for insight generation.
 Processes queued InsightJobs by calling InsightGenerationService.
 Handles job lifecycle: QUEUED -> RUNNING -> SUCCESS/FAILED/SKIPPED.
 
+Two modes:
+- process_queued_jobs(): one InsightGenerationService per job (on-demand
+  and small cycles)
+- process_queued_jobs_batched(): nightly fleet-wide runs; jobs are
+  grouped into chunks of INSIGHT_BATCH_TENANT_CHUNK tenants and each
+  chunk is generated by InsightBatchGenerator in a handful of queries
+
 SECURITY: All operations are tenant-scoped.
 
 Story 8.1 - AI Insight Generation (Read-Only Analytics)
@@ -15,9 +22,18 @@ from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 
 from src.models.insight_job import InsightJob, InsightJobStatus
+from src.services.insight_batch import (
+    DEFAULT_PERIOD_TYPES,
+    INSIGHT_BATCH_TENANT_CHUNK,
+    InsightBatchGenerator,
+    InsightBatchJob,
+)
 from src.services.insight_generation_service import InsightGenerationService
 from src.services.insight_thresholds import get_thresholds_for_tier
-from src.services.billing_entitlements import BillingEntitlementsService
+from src.services.billing_entitlements import (
+    BillingEntitlementsService,
+    resolve_billing_tiers,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -147,8 +163,106 @@ class InsightJobRunner:
         self.db.commit()
         return processed
 
+    def process_queued_jobs_batched(
+        self,
+        limit: int = 10000,
+        chunk_size: int = INSIGHT_BATCH_TENANT_CHUNK,
+    ) -> int:
+        """
+        Process queued insight jobs in cross-tenant chunks.
+
+        Tiers are resolved for all tenants at once. Each chunk runs in a
+        savepoint: if it fails, its jobs are marked FAILED and the other
+        chunks are unaffected. Only the oldest queued job per tenant is
+        taken; any other stays queued for the next cycle.
+
+        Args:
+            limit: Maximum number of jobs to process
+            chunk_size: Tenants per InsightBatchGenerator call
+
+        Returns:
+            Number of jobs processed
+        """
+        queued = (
+            self.db.query(InsightJob)
+            .filter(InsightJob.status == InsightJobStatus.QUEUED)
+            .order_by(InsightJob.created_at.asc())
+            .limit(limit)
+            .all()
+        )
+
+        jobs_by_tenant: dict[str, InsightJob] = {}
+        for job in queued:
+            jobs_by_tenant.setdefault(job.tenant_id, job)
+        jobs = list(jobs_by_tenant.values())
+
+        if not jobs:
+            logger.debug("No queued insight jobs to process")
+            return 0
+
+        tiers = resolve_billing_tiers(self.db, list(jobs_by_tenant))
+        for job in jobs:
+            job.mark_running()
+        self.db.flush()
+
+        generator = InsightBatchGenerator(self.db)
+        for start in range(0, len(jobs), chunk_size):
+            chunk = jobs[start:start + chunk_size]
+            batch_jobs = [
+                InsightBatchJob(
+                    job_id=job.job_id,
+                    tenant_id=job.tenant_id,
+                    thresholds=get_thresholds_for_tier(tiers[job.tenant_id]),
+                )
+                for job in chunk
+            ]
+
+            try:
+                with self.db.begin_nested():
+                    insights_by_job = generator.generate(batch_jobs)
+            except Exception as e:
+                for job in chunk:
+                    job.mark_failed(str(e))
+                self.db.flush()
+
+                logger.error(
+                    "insight_job.batch_failed",
+                    extra={
+                        "job_ids": [job.job_id for job in chunk],
+                        "error": str(e),
+                    },
+                    exc_info=True,
+                )
+                continue
+
+            for job in chunk:
+                job.mark_success(
+                    insights_generated=len(insights_by_job.get(job.job_id, [])),
+                    metadata={
+                        "tier": tiers[job.tenant_id],
+                        "period_types_analyzed": list(DEFAULT_PERIOD_TYPES),
+                        "batched": True,
+                    },
+                )
+            self.db.flush()
+
+        logger.info(
+            "insight_job.batch_completed",
+            extra={
+                "jobs": len(jobs),
+                "chunks": -(-len(jobs) // chunk_size),
+            },
+        )
+
+        self.db.commit()
+        return len(jobs)
+
 
-def run_insight_worker_cycle(db_session: Session, limit: int = 10) -> dict:
+def run_insight_worker_cycle(
+    db_session: Session,
+    limit: int = 10,
+    batched: bool = False,
+) -> dict:
     """
     Run one cycle of the insight worker.
 
@@ -157,12 +271,16 @@ def run_insight_worker_cycle(db_session: Session, limit: int = 10) -> dict:
     Args:
         db_session: Database session
         limit: Maximum jobs to process per cycle
+        batched: Process jobs in cross-tenant chunks (nightly runs)
 
     Returns:
         Dict with processing results
     """
     runner = InsightJobRunner(db_session)
-    processed = runner.process_queued_jobs(limit=limit)
+    if batched:
+        processed = runner.process_queued_jobs_batched(limit=limit)
+    else:
+        processed = runner.process_queued_jobs(limit=limit)
 
     logger.info(
         "Insight worker cycle completed",
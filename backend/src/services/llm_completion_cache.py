@@ -0,0 +1,242 @@
+"""
+Completion cache and request coalescing for LLM routing.
+
+Insight and recommendation renders call the LLM with the same template
+and variables across many tenants (same insight type, same rounded
+deltas), so completions are cached by content:
+
+    llm_completion:{model_id}:{template_key}:{template_version}:{prompt_hash}
+
+prompt_hash covers every message plus max_tokens and temperature, so
+only byte-identical requests to the same model share an answer.
+
+- In-process LRU (TTLCache) in front of Redis; Redis is shared by all
+  instances and bounded by the entry TTL plus the server's
+  maxmemory-policy (allkeys-lru)
+- Concurrent identical requests in one process share a single upstream
+  call: the first caller runs it, the others await its result
+- Only primary-model successes are cached; fallbacks and errors are not
+
+Org config, model registry rows, prompt templates and LLM entitlement are
+memoized per process (get_llm_config_cache) as detached copies so they
+survive session commits. Writes through the LLM config routes call
+invalidate_llm_config(); other changes are picked up within the TTL.
+
+Environment variables:
+    LLM_COMPLETION_CACHE_ENABLED: Set to "false" to always call the LLM
+    LLM_COMPLETION_CACHE_TTL_SECONDS: Redis entry TTL (default 86400)
+    LLM_COMPLETION_LOCAL_TTL_SECONDS: In-process entry TTL (default 600)
+    LLM_COMPLETION_LOCAL_MAX_ENTRIES: In-process LRU capacity (default 5000)
+    LLM_CONFIG_CACHE_TTL_SECONDS: Config/template memo TTL (default 60)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, asdict
+from threading import Lock
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple, TypeVar
+
+from src.platform.request_coalescer import RequestCoalescer
+from src.platform.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+LLM_COMPLETION_CACHE_ENABLED = (
+    os.getenv("LLM_COMPLETION_CACHE_ENABLED", "true").lower() == "true"
+)
+LLM_COMPLETION_CACHE_TTL_SECONDS = int(os.getenv("LLM_COMPLETION_CACHE_TTL_SECONDS", "86400"))
+LLM_COMPLETION_LOCAL_TTL_SECONDS = int(os.getenv("LLM_COMPLETION_LOCAL_TTL_SECONDS", "600"))
+LLM_COMPLETION_LOCAL_MAX_ENTRIES = int(os.getenv("LLM_COMPLETION_LOCAL_MAX_ENTRIES", "5000"))
+LLM_CONFIG_CACHE_TTL_SECONDS = int(os.getenv("LLM_CONFIG_CACHE_TTL_SECONDS", "60"))
+
+T = TypeVar("T")
+
+
+@dataclass
+class CachedCompletion:
+    """A cached primary-model completion."""
+
+    content: str
+    model_id: str
+    input_tokens: int
+    output_tokens: int
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> CachedCompletion:
+        """Deserialize from JSON."""
+        return cls(**json.loads(data))
+
+
+def completion_cache_key(
+    model_id: str,
+    template_key: Optional[str],
+    template_version: Optional[int],
+    messages: Iterable[Any],
+    max_tokens: Optional[int],
+    temperature: Optional[float],
+) -> str:
+    """
+    Content-addressed key for a completion request.
+
+    Args:
+        messages: ChatMessage objects (role/content) sent to the model
+    """
+    material = json.dumps(
+        {
+            "messages": [[m.role, m.content] for m in messages],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        },
+        sort_keys=True,
+    )
+    prompt_hash = hashlib.sha256(material.encode()).hexdigest()
+    return (
+        f"{LLMCompletionCache.KEY_PREFIX}{model_id}:"
+        f"{template_key or '-'}:{template_version or 0}:{prompt_hash}"
+    )
+
+
+class LLMCompletionCache:
+    """
+    Two-level completion cache with in-flight request coalescing.
+
+    Usage:
+        cache = get_llm_completion_cache()
+        key = completion_cache_key(model_id, template_key, version, messages, ...)
+
+        cached = cache.get(key)
+        if cached is None:
+            result, shared = await cache.coalesce(key, call_llm)
+    """
+
+    KEY_PREFIX = "llm_completion:"
+
+    def __init__(
+        self,
+        ttl_seconds: int = LLM_COMPLETION_CACHE_TTL_SECONDS,
+        local_ttl_seconds: int = LLM_COMPLETION_LOCAL_TTL_SECONDS,
+        local_max_entries: int = LLM_COMPLETION_LOCAL_MAX_ENTRIES,
+        enabled: bool = LLM_COMPLETION_CACHE_ENABLED,
+    ):
+        from src.entitlements.cache import RedisClient
+
+        self._redis = RedisClient()
+        self._local: TTLCache[str, CachedCompletion] = TTLCache(
+            max_entries=local_max_entries,
+            ttl_seconds=min(local_ttl_seconds, ttl_seconds),
+            name="llm_completion_local",
+        )
+        self._ttl_seconds = ttl_seconds
+        self._inflight = RequestCoalescer("LLM request")
+        self.enabled = enabled
+
+    def get(self, key: str) -> Optional[CachedCompletion]:
+        """Get a cached completion, or None on miss."""
+        if not self.enabled:
+            return None
+
+        entry = self._local.get(key)
+        if entry is not None:
+            return entry
+
+        data = self._redis.get(key)
+        if not data:
+            return None
+        try:
+            entry = CachedCompletion.from_json(data)
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached LLM completion: {e}")
+            return None
+
+        self._local.set(key, entry)
+        return entry
+
+    def set(self, key: str, completion: CachedCompletion) -> None:
+        """Cache a primary-model completion."""
+        if not self.enabled:
+            return
+        self._redis.set(key, completion.to_json(), self._ttl_seconds)
+        self._local.set(key, completion)
+
+    async def coalesce(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[T]],
+    ) -> Tuple[T, bool]:
+        """
+        Run compute() unless an identical request is already in flight.
+
+        Returns:
+            (result, shared) - shared is True when the result came from
+            another caller's in-flight request. Exceptions from the shared
+            call are raised to every waiter.
+        """
+        return await self._inflight.run(key, compute)
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._local.clear()
+
+
+# Module-level singletons
+_cache_instance: Optional[LLMCompletionCache] = None
+_config_cache: Optional[TTLCache[str, Any]] = None
+_cache_lock = Lock()
+
+
+def get_llm_completion_cache() -> LLMCompletionCache:
+    """Get the singleton LLMCompletionCache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = LLMCompletionCache()
+    return _cache_instance
+
+
+def get_llm_config_cache() -> TTLCache[str, Any]:
+    """
+    Process-wide memo of LLM config lookups.
+
+    Key namespaces:
+    - org_config:{tenant_id}
+    - model:{model_id}
+    - template:{tenant_id}:{template_key}:{version or 'active'}
+    - entitled:{tenant_id}
+    """
+    global _config_cache
+    if _config_cache is None:
+        with _cache_lock:
+            if _config_cache is None:
+                _config_cache = TTLCache(
+                    max_entries=10000,
+                    ttl_seconds=LLM_CONFIG_CACHE_TTL_SECONDS,
+                    name="llm_config",
+                )
+    return _config_cache
+
+
+def invalidate_llm_config(tenant_id: str, template_key: Optional[str] = None) -> None:
+    """
+    Drop memoized LLM config for a tenant.
+
+    Args:
+        tenant_id: Tenant whose org config (and templates) changed
+        template_key: Also drop this template's memoized versions
+    """
+    cache = get_llm_config_cache()
+    cache.delete(f"org_config:{tenant_id}")
+    if template_key:
+        cache.delete_pattern(f"template:{tenant_id}:{template_key}:*")
@@ -9,6 +9,8 @@ DESIGN PRINCIPLES:
 - LLM is opt-in, not required
 - Graceful fallback on LLM failure (use deterministic template)
 - No changes required to existing service signatures
+- Entitlement is memoized per process and identical prompts are served
+  from the completion cache (see llm_completion_cache)
 
 SECURITY:
 - Tenant isolation enforced
@@ -38,11 +40,26 @@ from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
 
 from src.services.billing_entitlements import BillingEntitlementsService, BillingFeature
+from src.services.llm_completion_cache import get_llm_config_cache
 
 
 logger = logging.getLogger(__name__)
 
 
+def _is_entitled(db_session: Session, tenant_id: str) -> bool:
+    """LLM routing entitlement, memoized per process for the config TTL."""
+    cache = get_llm_config_cache()
+    key = f"entitled:{tenant_id}"
+    entry = cache.get_entry(key)
+    if entry is not None:
+        return entry[1]
+
+    entitlements = BillingEntitlementsService(db_session, tenant_id)
+    is_entitled = entitlements.check_feature_entitlement(BillingFeature.LLM_ROUTING).is_entitled
+    cache.set(key, is_entitled)
+    return is_entitled
+
+
 async def enhance_with_llm(
     db_session: Session,
     tenant_id: str,
@@ -75,10 +92,7 @@ async def enhance_with_llm(
         LLM-enhanced content or fallback_content
     """
     # Check entitlement first
-    entitlements = BillingEntitlementsService(db_session, tenant_id)
-    result = entitlements.check_feature_entitlement(BillingFeature.LLM_ROUTING)
-
-    if not result.is_entitled:
+    if not _is_entitled(db_session, tenant_id):
         logger.debug(
             "LLM enhancement skipped - not entitled",
             extra={"tenant_id": tenant_id, "template_key": template_key},
@@ -104,6 +118,7 @@ async def enhance_with_llm(
                 "template_key": template_key,
                 "model_id": result.model_id,
                 "tokens": result.total_tokens,
+                "cached": result.cached,
             },
         )
 
@@ -133,6 +148,4 @@ def is_llm_enabled(db_session: Session, tenant_id: str) -> bool:
     Returns:
         True if tenant has LLM routing entitlement
     """
-    entitlements = BillingEntitlementsService(db_session, tenant_id)
-    result = entitlements.check_feature_entitlement(BillingFeature.LLM_ROUTING)
-    return result.is_entitled
+    return _is_entitled(db_session, tenant_id)
@@ -6,6 +6,7 @@ Provides:
 - Automatic fallback on primary model failure
 - Versioned prompt template rendering
 - Usage logging for audit and cost tracking
+- Completion cache with in-flight coalescing (see llm_completion_cache)
 
 SECURITY:
 - Tenant isolation enforced via tenant_id
@@ -25,15 +26,23 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Optional, List, Dict, Any
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from src.models.llm_routing import (
+    LLMCacheStatus,
     LLMModelRegistry,
     LLMOrgConfig,
     LLMPromptTemplate,
     LLMUsageLog,
     LLMResponseStatus,
 )
+from src.services.llm_completion_cache import (
+    CachedCompletion,
+    completion_cache_key,
+    get_llm_completion_cache,
+    get_llm_config_cache,
+)
 from src.integrations.openrouter import (
     OpenRouterClient,
     get_openrouter_client,
@@ -48,6 +57,16 @@ from src.integrations.openrouter import (
 logger = logging.getLogger(__name__)
 
 
+def _detached_copy(instance):
+    """Transient copy of a loaded row, safe to share across sessions."""
+    if instance is None or not hasattr(type(instance), "__mapper__"):
+        return instance
+    mapper = inspect(type(instance))
+    return type(instance)(**{
+        attr.key: getattr(instance, attr.key) for attr in mapper.column_attrs
+    })
+
+
 @dataclass
 class LLMCompletionResult:
     """Result of an LLM completion request."""
@@ -60,6 +79,7 @@ class LLMCompletionResult:
     cost_usd: Decimal
     was_fallback: bool
     fallback_reason: Optional[str] = None
+    cached: bool = False
 
 
 class LLMRoutingError(Exception):
@@ -121,20 +141,40 @@ class LLMRoutingService:
             self._client = get_openrouter_client()
         return self._client
 
+    def _memoized(self, key: str, load):
+        """
+        Process-wide memo of a config lookup (including "not found").
+
+        Rows are stored as detached copies so they outlive this session.
+        """
+        cache = get_llm_config_cache()
+        entry = cache.get_entry(key)
+        if entry is not None:
+            return entry[1]
+        value = _detached_copy(load())
+        cache.set(key, value)
+        return value
+
     def _get_org_config(self) -> Optional[LLMOrgConfig]:
         """Get cached org configuration."""
         if self._org_config is None:
-            self._org_config = self.db.query(LLMOrgConfig).filter(
-                LLMOrgConfig.tenant_id == self.tenant_id
-            ).first()
+            self._org_config = self._memoized(
+                f"org_config:{self.tenant_id}",
+                lambda: self.db.query(LLMOrgConfig).filter(
+                    LLMOrgConfig.tenant_id == self.tenant_id
+                ).first(),
+            )
         return self._org_config
 
     def _get_model_registry(self, model_id: str) -> Optional[LLMModelRegistry]:
         """Get model from registry by ID."""
-        return self.db.query(LLMModelRegistry).filter(
-            LLMModelRegistry.model_id == model_id,
-            LLMModelRegistry.is_enabled == True,
-        ).first()
+        return self._memoized(
+            f"model:{model_id}",
+            lambda: self.db.query(LLMModelRegistry).filter(
+                LLMModelRegistry.model_id == model_id,
+                LLMModelRegistry.is_enabled == True,
+            ).first(),
+        )
 
     def _get_default_model(self) -> Optional[LLMModelRegistry]:
         """Get default model from registry."""
@@ -203,6 +243,17 @@ class LLMRoutingService:
         Returns:
             LLMPromptTemplate or None if not found
         """
+        return self._memoized(
+            f"template:{self.tenant_id}:{template_key}:{'active' if version is None else version}",
+            lambda: self._load_prompt_template(template_key, version),
+        )
+
+    def _load_prompt_template(
+        self,
+        template_key: str,
+        version: Optional[int],
+    ) -> Optional[LLMPromptTemplate]:
+        """Query the tenant template, falling back to the system template."""
         # Try tenant-specific template first
         query = self.db.query(LLMPromptTemplate).filter(
             LLMPromptTemplate.template_key == template_key,
@@ -265,6 +316,8 @@ class LLMRoutingService:
         template_key: Optional[str] = None,
         template_version: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        cache_status: Optional[str] = None,
+        saved_tokens: int = 0,
     ) -> LLMUsageLog:
         """
         Log LLM usage for audit and cost tracking.
@@ -282,6 +335,8 @@ class LLMRoutingService:
             template_key: Prompt template key used
             template_version: Prompt template version used
             metadata: Additional request metadata
+            cache_status: Completion cache outcome (None when bypassed)
+            saved_tokens: Tokens not spent thanks to the cache
 
         Returns:
             Created LLMUsageLog entry
@@ -301,6 +356,8 @@ class LLMRoutingService:
             request_metadata=metadata or {},
             response_status=status,
             error_message=error_message,
+            cache_status=cache_status,
+            saved_tokens=saved_tokens,
         )
 
         self.db.add(log_entry)
@@ -316,6 +373,8 @@ class LLMRoutingService:
                 "cost_usd": str(cost_usd),
                 "status": status,
                 "was_fallback": was_fallback,
+                "cache_status": cache_status,
+                "saved_tokens": saved_tokens,
             },
         )
 
@@ -334,6 +393,9 @@ class LLMRoutingService:
         Complete a chat request with automatic fallback.
 
         Tries primary model first, falls back on certain errors.
+        Identical requests are answered from the completion cache or share
+        an in-flight upstream call; those are logged with cache_status
+        hit/coalesced and the tokens they saved.
 
         Args:
             messages: Chat messages to send
@@ -362,6 +424,143 @@ class LLMRoutingService:
         if effective_temperature is None:
             effective_temperature = float(org_config.temperature) if org_config else 0.7
 
+        cache = get_llm_completion_cache()
+        if not cache.enabled:
+            return await self._complete_uncached(
+                messages=messages,
+                primary_model=primary_model,
+                fallback_model=fallback_model,
+                max_tokens=effective_max_tokens,
+                temperature=effective_temperature,
+                template_key=template_key,
+                template_version=template_version,
+                metadata=metadata,
+            )
+
+        start_time = time.time()
+        cache_key = completion_cache_key(
+            primary_model.model_id,
+            template_key,
+            template_version,
+            messages,
+            effective_max_tokens,
+            effective_temperature,
+        )
+
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return self._serve_cached(
+                cached,
+                cache_status=LLMCacheStatus.HIT.value,
+                start_time=start_time,
+                template_key=template_key,
+                template_version=template_version,
+                metadata=metadata,
+            )
+
+        async def call_models() -> LLMCompletionResult:
+            result = await self._complete_uncached(
+                messages=messages,
+                primary_model=primary_model,
+                fallback_model=fallback_model,
+                max_tokens=effective_max_tokens,
+                temperature=effective_temperature,
+                template_key=template_key,
+                template_version=template_version,
+                metadata=metadata,
+                cache_status=LLMCacheStatus.MISS.value,
+            )
+            if not result.was_fallback:
+                cache.set(cache_key, CachedCompletion(
+                    content=result.content,
+                    model_id=result.model_id,
+                    input_tokens=result.input_tokens,
+                    output_tokens=result.output_tokens,
+                ))
+            return result
+
+        result, shared = await cache.coalesce(cache_key, call_models)
+        if not shared:
+            return result
+
+        # Another request in this process made the upstream call
+        return self._serve_cached(
+            CachedCompletion(
+                content=result.content,
+                model_id=result.model_id,
+                input_tokens=result.input_tokens,
+                output_tokens=result.output_tokens,
+            ),
+            cache_status=LLMCacheStatus.COALESCED.value,
+            start_time=start_time,
+            template_key=template_key,
+            template_version=template_version,
+            metadata=metadata,
+            was_fallback=result.was_fallback,
+            fallback_reason=result.fallback_reason,
+        )
+
+    def _serve_cached(
+        self,
+        cached: CachedCompletion,
+        cache_status: str,
+        start_time: float,
+        template_key: Optional[str] = None,
+        template_version: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        was_fallback: bool = False,
+        fallback_reason: Optional[str] = None,
+    ) -> LLMCompletionResult:
+        """Log and return a completion served without an upstream call."""
+        latency_ms = int((time.time() - start_time) * 1000)
+        model = self._get_model_registry(cached.model_id)
+        saved_cost = (
+            model.calculate_cost(cached.input_tokens, cached.output_tokens)
+            if model else Decimal("0")
+        )
+
+        self._log_usage(
+            model_id=cached.model_id,
+            input_tokens=0,
+            output_tokens=0,
+            latency_ms=latency_ms,
+            cost_usd=Decimal("0"),
+            status=LLMResponseStatus.SUCCESS.value,
+            was_fallback=was_fallback,
+            fallback_reason=fallback_reason,
+            template_key=template_key,
+            template_version=template_version,
+            metadata={**(metadata or {}), "saved_cost_usd": str(saved_cost)},
+            cache_status=cache_status,
+            saved_tokens=cached.total_tokens,
+        )
+
+        return LLMCompletionResult(
+            content=cached.content,
+            model_id=cached.model_id,
+            input_tokens=0,
+            output_tokens=0,
+            total_tokens=0,
+            latency_ms=latency_ms,
+            cost_usd=Decimal("0"),
+            was_fallback=was_fallback,
+            fallback_reason=fallback_reason,
+            cached=True,
+        )
+
+    async def _complete_uncached(
+        self,
+        messages: List[ChatMessage],
+        primary_model: LLMModelRegistry,
+        fallback_model: Optional[LLMModelRegistry],
+        max_tokens: Optional[int],
+        temperature: float,
+        template_key: Optional[str] = None,
+        template_version: Optional[int] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        cache_status: Optional[str] = None,
+    ) -> LLMCompletionResult:
+        """Call the primary model, then the fallback on retryable errors."""
         client = self._get_client()
         start_time = time.time()
 
@@ -370,8 +569,8 @@ class LLMRoutingService:
             response = await client.chat_completion(
                 messages=messages,
                 model=primary_model.model_id,
-                max_tokens=effective_max_tokens,
-                temperature=effective_temperature,
+                max_tokens=max_tokens,
+                temperature=temperature,
             )
 
             latency_ms = int((time.time() - start_time) * 1000)
@@ -391,6 +590,7 @@ class LLMRoutingService:
                 template_key=template_key,
                 template_version=template_version,
                 metadata=metadata,
+                cache_status=cache_status,
             )
 
             return LLMCompletionResult(
@@ -433,6 +633,7 @@ class LLMRoutingService:
                 template_key=template_key,
                 template_version=template_version,
                 metadata=metadata,
+                cache_status=cache_status,
             )
 
             # Try fallback if available
@@ -442,8 +643,8 @@ class LLMRoutingService:
                     response = await client.chat_completion(
                         messages=messages,
                         model=fallback_model.model_id,
-                        max_tokens=effective_max_tokens,
-                        temperature=effective_temperature,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
                     )
 
                     latency_ms = int((time.time() - start_time) * 1000)
@@ -465,6 +666,7 @@ class LLMRoutingService:
                         template_key=template_key,
                         template_version=template_version,
                         metadata=metadata,
+                        cache_status=cache_status,
                     )
 
                     return LLMCompletionResult(
@@ -516,6 +718,7 @@ class LLMRoutingService:
                 template_key=template_key,
                 template_version=template_version,
                 metadata=metadata,
+                cache_status=cache_status,
             )
 
             raise LLMRoutingError(
@@ -588,7 +791,8 @@ class LLMRoutingService:
             days: Number of days to include (default: 30)
 
         Returns:
-            Dict with usage stats: total_tokens, total_cost, request_count, etc.
+            Dict with usage stats: total_tokens, total_cost, request_count,
+            cache_hit_ratio, saved_tokens, etc.
         """
         from datetime import datetime, timedelta, timezone
         from sqlalchemy import func
@@ -605,16 +809,32 @@ class LLMRoutingService:
             func.count(LLMUsageLog.id).filter(
                 LLMUsageLog.was_fallback == True
             ).label("fallback_count"),
+            func.count(LLMUsageLog.id).filter(
+                LLMUsageLog.cache_status.in_([
+                    LLMCacheStatus.HIT.value,
+                    LLMCacheStatus.COALESCED.value,
+                ])
+            ).label("cache_hit_count"),
+            func.count(LLMUsageLog.id).filter(
+                LLMUsageLog.cache_status == LLMCacheStatus.MISS.value
+            ).label("cache_miss_count"),
+            func.sum(LLMUsageLog.saved_tokens).label("saved_tokens"),
         ).filter(
             LLMUsageLog.tenant_id == self.tenant_id,
             LLMUsageLog.created_at >= cutoff,
         ).first()
 
+        cache_hits = result.cache_hit_count or 0
+        cache_lookups = cache_hits + (result.cache_miss_count or 0)
+
         return {
             "total_tokens": result.total_tokens or 0,
             "total_cost_usd": float(result.total_cost or 0),
             "request_count": result.request_count or 0,
             "success_count": result.success_count or 0,
             "fallback_count": result.fallback_count or 0,
+            "cache_hit_count": cache_hits,
+            "cache_hit_ratio": round(cache_hits / cache_lookups, 4) if cache_lookups else 0.0,
+            "saved_tokens": result.saved_tokens or 0,
             "period_days": days,
         }
@@ -20,9 +20,9 @@ Story 4.3 - Merchant Data Health Trust Layer
 """
 
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy.orm import Session
 
@@ -34,6 +34,9 @@ from src.models.merchant_data_health import (
     get_merchant_message,
 )
 
+if TYPE_CHECKING:
+    from src.services.data_availability_service import DataAvailabilityResult
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +50,10 @@ class MerchantDataHealthResult:
     exports_enabled: bool
     evaluated_at: datetime
     previous_state: Optional[MerchantHealthState] = None
+    # Inputs to the decision (kept for the tenant health snapshot)
+    availability_state: Optional[str] = None
+    quality_state: Optional[str] = None
+    sources: List["DataAvailabilityResult"] = field(default_factory=list)
 
 
 class MerchantDataHealthService:
@@ -71,6 +78,8 @@ class MerchantDataHealthService:
         self.db = db_session
         self.tenant_id = tenant_id
         self.billing_tier = billing_tier
+        # Per-source results from the last availability evaluation
+        self._availability_results: list = []
 
     def evaluate(self) -> MerchantDataHealthResult:
         """
@@ -102,6 +111,9 @@ class MerchantDataHealthService:
             dashboards_enabled=flags["dashboards_enabled"],
             exports_enabled=flags["exports_enabled"],
             evaluated_at=now,
+            availability_state=availability_aggregate,
+            quality_state=quality_aggregate,
+            sources=list(self._availability_results),
         )
 
         logger.info(
@@ -135,6 +147,7 @@ class MerchantDataHealthService:
                 billing_tier=self.billing_tier,
             )
             results = service.evaluate_all()
+            self._availability_results = results
 
             if not results:
                 return AvailabilityState.FRESH.value
@@ -11,7 +11,7 @@ Story 9.1 - Notification Framework (Events → Channels)
 
 import logging
 from datetime import datetime, timezone, date
-from typing import Optional, List, Tuple
+from typing import Optional, List
 
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
@@ -24,6 +24,8 @@ from src.models.notification import (
     EVENT_IMPORTANCE_MAP,
 )
 from src.models.notification_preference import NotificationPreference
+from src.platform.live_events import LiveEvent, LiveEventType, publish_live_event
+from src.platform.pagination import CountMode, Page, paginate
 
 
 logger = logging.getLogger(__name__)
@@ -120,6 +122,8 @@ class NotificationService:
                 },
             )
 
+            self._publish_live_events(event_type, user_id)
+
             return notification
 
         except IntegrityError:
@@ -136,6 +140,31 @@ class NotificationService:
             )
             return None
 
+    def _publish_live_events(
+        self,
+        event_type: NotificationEventType,
+        user_id: Optional[str],
+    ) -> None:
+        """Push count refresh hints to open event streams (sent on commit)."""
+        publish_live_event(
+            LiveEvent(
+                type=LiveEventType.NOTIFICATIONS,
+                tenant_id=self.tenant_id,
+                user_id=user_id,
+                data={"event_type": event_type.value},
+            ),
+            db=self.db,
+        )
+        if event_type == NotificationEventType.ACTION_REQUIRES_APPROVAL:
+            publish_live_event(
+                LiveEvent(
+                    type=LiveEventType.APPROVALS,
+                    tenant_id=self.tenant_id,
+                    data={"event_type": event_type.value},
+                ),
+                db=self.db,
+            )
+
     def notify_connector_failed(
         self,
         connector_id: str,
@@ -354,19 +383,26 @@ class NotificationService:
         status: Optional[NotificationStatus] = None,
         limit: int = 50,
         offset: int = 0,
-    ) -> Tuple[List[Notification], int]:
+        cursor: Optional[str] = None,
+        count: CountMode = CountMode.ESTIMATED,
+    ) -> Page:
         """
-        Get notifications with filtering and pagination.
+        Get notifications with filtering and pagination, newest first.
 
         Args:
             user_id: Filter by user (optional)
             event_type: Filter by event type (optional)
             status: Filter by status (optional)
             limit: Maximum results
-            offset: Pagination offset
+            offset: Pagination offset (ignored when cursor is given)
+            cursor: next_cursor of the previous page
+            count: How to compute total
 
         Returns:
-            Tuple of (notifications, total_count)
+            Page of Notification
+
+        Raises:
+            InvalidCursorError: cursor cannot be decoded
         """
         query = self.db.query(Notification).filter(
             Notification.tenant_id == self.tenant_id
@@ -381,18 +417,16 @@ class NotificationService:
         if status:
             query = query.filter(Notification.status == status)
 
-        total = query.count()
-
-        notifications = (
-            query
-            .order_by(Notification.created_at.desc())
-            .offset(offset)
-            .limit(limit)
-            .all()
+        return paginate(
+            query,
+            sort_column=Notification.created_at,
+            id_column=Notification.id,
+            limit=limit,
+            cursor=cursor,
+            offset=offset,
+            count=count,
         )
 
-        return notifications, total
-
     def get_unread_notifications(
         self,
         user_id: str,
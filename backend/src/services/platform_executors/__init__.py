@@ -11,7 +11,8 @@ Supported Platforms:
 
 Each executor implements the BasePlatformExecutor interface and handles:
 - API authentication
-- Rate limiting with exponential backoff
+- Rate limiting with exponential backoff and per-account token buckets
+- Batched execution and state capture where the platform supports it
 - State capture (before/after)
 - Action execution
 - Rollback instruction generation
@@ -20,6 +21,7 @@ Story 8.5 - Action Execution (Scoped & Reversible)
 """
 
 from src.services.platform_executors.base_executor import (
+    ActionRequest,
     BasePlatformExecutor,
     ExecutionResult,
     ExecutionResultStatus,
@@ -27,6 +29,10 @@ from src.services.platform_executors.base_executor import (
     RetryConfig,
     PlatformAPIError,
 )
+from src.services.platform_executors.rate_limiter import (
+    TokenBucket,
+    get_token_bucket,
+)
 from src.services.platform_executors.meta_executor import (
     MetaAdsExecutor,
     MetaCredentials,
@@ -42,12 +48,16 @@ from src.services.platform_executors.shopify_executor import (
 
 __all__ = [
     # Base
+    "ActionRequest",
     "BasePlatformExecutor",
     "ExecutionResult",
     "ExecutionResultStatus",
     "StateCapture",
     "RetryConfig",
     "PlatformAPIError",
+    # Rate limiting
+    "TokenBucket",
+    "get_token_bucket",
     # Meta
     "MetaAdsExecutor",
     "MetaCredentials",
@@ -23,6 +23,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Optional, TypeVar, Generic
 
+from src.services.platform_executors.rate_limiter import TokenBucket, get_token_bucket
+
 logger = logging.getLogger(__name__)
 
 
@@ -153,6 +155,16 @@ class StateCapture:
         }
 
 
+@dataclass
+class ActionRequest:
+    """A single action handed to an executor as part of a batch."""
+    action_type: str
+    entity_id: str
+    entity_type: str
+    params: dict
+    idempotency_key: str
+
+
 # =============================================================================
 # Retry Configuration
 # =============================================================================
@@ -256,11 +268,19 @@ class BasePlatformExecutor(ABC):
     - get_entity_state(): Fetch current entity state
     - _execute_action_impl(): Execute the actual action
     - generate_rollback_params(): Generate rollback parameters
+
+    Subclasses may also override, for platforms with native batch APIs:
+    - max_batch_size / _execute_batch_impl(): Execute several actions per request
+    - get_entity_states(): Read several entities per request
+    - rate_limit_key: The account whose request budget calls draw from
     """
 
     # Platform identifier (override in subclass)
     platform_name: str = "base"
 
+    # Actions sent per native batch request (1 = no batch support)
+    max_batch_size: int = 1
+
     def __init__(
         self,
         retry_config: Optional[RetryConfig] = None,
@@ -275,6 +295,32 @@ class BasePlatformExecutor(ABC):
         self._request_count = 0
         self._last_request_time: Optional[float] = None
 
+    # =========================================================================
+    # Rate Limiting
+    # =========================================================================
+
+    @property
+    def rate_limit_key(self) -> str:
+        """
+        Account the executor's requests are budgeted against.
+
+        Override in subclass with the ad account or store identifier.
+        """
+        return "default"
+
+    @property
+    def rate_limiter(self) -> TokenBucket:
+        """Token bucket shared by every executor for the same account."""
+        return get_token_bucket(self.platform_name, self.rate_limit_key)
+
+    async def _throttle(self, cost: float = 1.0) -> None:
+        """Wait for request budget before calling the platform."""
+        await self.rate_limiter.acquire(cost)
+
+    async def _on_request(self, request) -> None:
+        """httpx request hook: every outgoing call draws one token."""
+        await self._throttle()
+
     # =========================================================================
     # Abstract Methods (must be implemented by subclasses)
     # =========================================================================
@@ -505,6 +551,14 @@ class BasePlatformExecutor(ABC):
 
             delay = self.retry_config.calculate_delay(attempt, retry_after)
 
+            # Hold back every caller on this account, not just this one
+            rate_limited = (
+                (last_result is not None and last_result.status == ExecutionResultStatus.RATE_LIMITED)
+                or (isinstance(last_error, PlatformAPIError) and last_error.status_code == 429)
+            )
+            if rate_limited:
+                self.rate_limiter.pause(delay)
+
             logger.info(
                 "Retrying action after delay",
                 extra={
@@ -563,6 +617,143 @@ class BasePlatformExecutor(ABC):
         """
         return await self.get_entity_state(entity_id, entity_type)
 
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], StateCapture]:
+        """
+        Get current state of several entities.
+
+        The default reads them one at a time; executors with batched
+        read endpoints override this. Entities whose state could not be
+        read are left out of the result, so callers can fall back to
+        get_entity_state() and surface the error for that entity alone.
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCapture keyed by (entity_id, entity_type)
+        """
+        states: dict[tuple[str, str], StateCapture] = {}
+        for entity_id, entity_type in dict.fromkeys(entities):
+            try:
+                states[(entity_id, entity_type)] = await self.get_entity_state(
+                    entity_id, entity_type
+                )
+            except PlatformAPIError as e:
+                logger.warning(
+                    "Failed to capture entity state",
+                    extra={
+                        "platform": self.platform_name,
+                        "entity_id": entity_id,
+                        "error": str(e),
+                    },
+                )
+        return states
+
+    async def execute_actions(
+        self,
+        requests: list[ActionRequest],
+    ) -> list[ExecutionResult]:
+        """
+        Execute several actions, using the platform's batch API if any.
+
+        Requests are split into chunks of max_batch_size and the chunks
+        are dispatched concurrently, up to the account's concurrency
+        limit; each request still waits on the account's token bucket.
+        Actions that fail retryably inside a batch (or whose whole batch
+        failed) are re-run through execute_action(), so they get the same
+        retry handling and idempotency key as a single execution.
+
+        Args:
+            requests: Actions to execute
+
+        Returns:
+            ExecutionResult per request, in request order
+        """
+        if not requests:
+            return []
+
+        size = max(self.max_batch_size, 1)
+        chunks = [requests[i:i + size] for i in range(0, len(requests), size)]
+        # Shared by every executor (and call) for this account
+        semaphore = self.rate_limiter.concurrency()
+
+        async def run_chunk(chunk: list[ActionRequest]) -> list[ExecutionResult]:
+            async with semaphore:
+                if len(chunk) == 1 or size == 1:
+                    return [await self._execute_request(r) for r in chunk]
+                return await self._execute_chunk(chunk)
+
+        chunk_results = await asyncio.gather(*(run_chunk(c) for c in chunks))
+        return [result for results in chunk_results for result in results]
+
+    async def _execute_chunk(self, chunk: list[ActionRequest]) -> list[ExecutionResult]:
+        """Execute one native batch, retrying failed items individually."""
+        start_time = time.time()
+        try:
+            results = await self._execute_batch_impl(chunk)
+        except Exception as e:
+            logger.warning(
+                "Batch request failed, executing actions individually",
+                extra={
+                    "platform": self.platform_name,
+                    "batch_size": len(chunk),
+                    "error": str(e),
+                },
+            )
+            if isinstance(e, PlatformAPIError) and e.status_code == 429:
+                self.rate_limiter.pause(self.retry_config.calculate_delay(0, e.retry_after))
+            return [await self._execute_request(r) for r in chunk]
+
+        duration_ms = (time.time() - start_time) * 1000
+        final: list[ExecutionResult] = []
+        for request, result in zip(chunk, results):
+            if result is None:
+                # Not something the batch endpoint can carry
+                result = await self._execute_request(request)
+            elif not result.success and result.is_retryable:
+                if result.status == ExecutionResultStatus.RATE_LIMITED:
+                    self.rate_limiter.pause(
+                        self.retry_config.calculate_delay(0, result.retry_after_seconds)
+                    )
+                result = await self._execute_request(request)
+            elif result.duration_ms is None:
+                result.duration_ms = duration_ms
+            final.append(result)
+        return final
+
+    async def _execute_request(self, request: ActionRequest) -> ExecutionResult:
+        """Execute one request through the single-action retry path."""
+        return await self.execute_action(
+            action_type=request.action_type,
+            entity_id=request.entity_id,
+            entity_type=request.entity_type,
+            params=request.params,
+            idempotency_key=request.idempotency_key,
+        )
+
+    async def _execute_batch_impl(
+        self,
+        requests: list[ActionRequest],
+    ) -> list[Optional[ExecutionResult]]:
+        """
+        Execute several actions in one platform request.
+
+        Override together with max_batch_size. Must return one entry per
+        request, in order; None marks a request the batch endpoint cannot
+        carry, which is then executed on its own. Results need not carry
+        confirmed_state; the caller reads after-state for the whole batch
+        at once.
+
+        Raises:
+            PlatformAPIError: If the batch request as a whole fails
+        """
+        raise NotImplementedError(
+            f"{self.platform_name} executor does not support batch execution"
+        )
+
     def generate_rollback_instructions(
         self,
         action_type: str,
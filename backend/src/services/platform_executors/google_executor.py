@@ -22,6 +22,7 @@ from typing import Optional, Any
 import httpx
 
 from src.services.platform_executors.base_executor import (
+    ActionRequest,
     BasePlatformExecutor,
     ExecutionResult,
     ExecutionResultStatus,
@@ -40,6 +41,9 @@ logger = logging.getLogger(__name__)
 GOOGLE_ADS_API_VERSION = "v15"
 GOOGLE_ADS_API_BASE = "https://googleads.googleapis.com"
 
+# Operations per multi-operation mutate, and IDs per batched GAQL read
+GOOGLE_ADS_MAX_BATCH_SIZE = 100
+
 # Google Ads campaign status values
 class GoogleCampaignStatus:
     ENABLED = "ENABLED"
@@ -100,6 +104,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
 
     Rate Limiting:
     - Google Ads uses daily operation limits
+    - Requests share a token bucket per customer ID
     - Executor respects rate limit headers
     - Exponential backoff for 429 responses
 
@@ -109,6 +114,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
     """
 
     platform_name = "google"
+    max_batch_size = GOOGLE_ADS_MAX_BATCH_SIZE
 
     def __init__(
         self,
@@ -140,9 +146,15 @@ class GoogleAdsExecutor(BasePlatformExecutor):
             self._client = httpx.AsyncClient(
                 timeout=self.timeout,
                 headers=self._get_auth_headers(),
+                event_hooks={"request": [self._on_request]},
             )
         return self._client
 
+    @property
+    def rate_limit_key(self) -> str:
+        """Requests are budgeted per customer account."""
+        return self.credentials.customer_id
+
     def _get_auth_headers(self) -> dict:
         """Get authentication headers for Google Ads API."""
         headers = {
@@ -209,7 +221,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
             PlatformAPIError: If API call fails
         """
         # Build GAQL query based on entity type
-        query = self._build_state_query(entity_id, entity_type)
+        query = self._build_state_query([entity_id], entity_type)
 
         url = f"{self.base_url}/customers/{self.credentials.customer_id}/googleAds:searchStream"
 
@@ -249,8 +261,79 @@ class GoogleAdsExecutor(BasePlatformExecutor):
                 is_retryable=True,
             )
 
-    def _build_state_query(self, entity_id: str, entity_type: str) -> str:
-        """Build GAQL query for fetching entity state."""
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], StateCapture]:
+        """
+        Get current state of several Google Ads entities.
+
+        Issues one GAQL query per entity type (WHERE id IN (...)) for up
+        to 100 IDs. If a query fails, those entities are left out of the
+        result.
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCapture keyed by (entity_id, entity_type)
+        """
+        by_type: dict[str, list[str]] = {}
+        for entity_id, entity_type in dict.fromkeys(entities):
+            by_type.setdefault(entity_type, []).append(entity_id)
+
+        url = f"{self.base_url}/customers/{self.credentials.customer_id}/googleAds:searchStream"
+        client = await self._get_client()
+        states: dict[tuple[str, str], StateCapture] = {}
+
+        for entity_type, entity_ids in by_type.items():
+            for i in range(0, len(entity_ids), GOOGLE_ADS_MAX_BATCH_SIZE):
+                chunk = entity_ids[i:i + GOOGLE_ADS_MAX_BATCH_SIZE]
+                query = self._build_state_query(chunk, entity_type)
+                try:
+                    response = await client.post(url, json={"query": query})
+                    data = response.json()
+                except (httpx.RequestError, ValueError) as e:
+                    logger.warning(
+                        "Google Ads batched state read failed",
+                        extra={"entity_type": entity_type, "error": str(e)},
+                    )
+                    continue
+
+                if response.status_code != 200:
+                    logger.warning(
+                        "Google Ads batched state read failed",
+                        extra={
+                            "entity_type": entity_type,
+                            "status_code": response.status_code,
+                        },
+                    )
+                    continue
+
+                by_id = {}
+                for batch in data or []:
+                    for result in batch.get("results", []):
+                        state = self._extract_entity(result, entity_type)
+                        result_id = self._extract_entity_id(state, entity_type)
+                        if result_id is not None:
+                            by_id.setdefault(str(result_id), state)
+
+                for entity_id in chunk:
+                    # IDs we asked for but Google did not return are left
+                    # for the single read, which reports the entity as empty
+                    if entity_id in by_id:
+                        states[(entity_id, entity_type)] = StateCapture(
+                            entity_id=entity_id,
+                            entity_type=entity_type,
+                            platform=self.platform_name,
+                            state=by_id[entity_id],
+                        )
+
+        return states
+
+    def _build_state_query(self, entity_ids: list[str], entity_type: str) -> str:
+        """Build GAQL query for fetching the state of one or more entities."""
+        id_list = ", ".join(str(entity_id) for entity_id in entity_ids)
         if entity_type == "campaign":
             return f"""
                 SELECT
@@ -266,7 +349,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
                     campaign.start_date,
                     campaign.end_date
                 FROM campaign
-                WHERE campaign.id = {entity_id}
+                WHERE campaign.id IN ({id_list})
             """
         elif entity_type == "ad_group":
             return f"""
@@ -279,7 +362,7 @@ class GoogleAdsExecutor(BasePlatformExecutor):
                     ad_group.cpm_bid_micros,
                     ad_group.target_cpa_micros
                 FROM ad_group
-                WHERE ad_group.id = {entity_id}
+                WHERE ad_group.id IN ({id_list})
             """
         elif entity_type == "ad":
             return f"""
@@ -290,14 +373,14 @@ class GoogleAdsExecutor(BasePlatformExecutor):
                     ad_group_ad.ad_group,
                     ad_group_ad.ad.type
                 FROM ad_group_ad
-                WHERE ad_group_ad.ad.id = {entity_id}
+                WHERE ad_group_ad.ad.id IN ({id_list})
             """
         else:
             # Generic campaign query as fallback
             return f"""
                 SELECT campaign.id, campaign.name, campaign.status
                 FROM campaign
-                WHERE campaign.id = {entity_id}
+                WHERE campaign.id IN ({id_list})
             """
 
     def _parse_search_response(self, data: list, entity_type: str) -> dict:
@@ -315,16 +398,26 @@ class GoogleAdsExecutor(BasePlatformExecutor):
             return {}
 
         # Return first result's entity
-        first_result = results[0]
+        return self._extract_entity(results[0], entity_type)
 
+    def _extract_entity(self, result: dict, entity_type: str) -> dict:
+        """Pick the entity out of one GAQL result row."""
         if entity_type == "campaign":
-            return first_result.get("campaign", {})
+            return result.get("campaign", {})
         elif entity_type == "ad_group":
-            return first_result.get("adGroup", {})
+            return result.get("adGroup", {})
         elif entity_type == "ad":
-            return first_result.get("adGroupAd", {})
+            return result.get("adGroupAd", {})
         else:
-            return first_result
+            return result
+
+    def _extract_entity_id(self, state: dict, entity_type: str) -> Optional[str]:
+        """Get the entity ID from an extracted entity."""
+        if entity_type == "ad":
+            return state.get("ad", {}).get("id")
+        if entity_type in ("campaign", "ad_group"):
+            return state.get("id")
+        return state.get("campaign", {}).get("id")
 
     # =========================================================================
     # Action Execution
@@ -730,6 +823,188 @@ class GoogleAdsExecutor(BasePlatformExecutor):
                 is_retryable=True,
             )
 
+    # =========================================================================
+    # Batch Execution
+    # =========================================================================
+
+    def _build_operation(
+        self,
+        request: ActionRequest,
+    ) -> tuple[Optional[tuple[str, dict]], Optional[ExecutionResult]]:
+        """
+        Build the mutate operation for an action.
+
+        Returns:
+            ((resource collection, operation), None), or (None, failure
+            result) if the action is unsupported or missing parameters
+        """
+        customer_path = f"customers/{self.credentials.customer_id}"
+        params = request.params
+
+        if request.action_type in ("pause_campaign", "resume_campaign"):
+            status = (
+                GoogleCampaignStatus.PAUSED
+                if request.action_type == "pause_campaign"
+                else GoogleCampaignStatus.ENABLED
+            )
+            return ("campaigns", {
+                "updateMask": "status",
+                "update": {
+                    "resourceName": f"{customer_path}/campaigns/{request.entity_id}",
+                    "status": status,
+                },
+            }), None
+
+        if request.action_type == "adjust_budget":
+            if params.get("new_budget") is None or params.get("budget_id") is None:
+                return None, ExecutionResult.failure_result(
+                    message="new_budget and budget_id are required for budget adjustment",
+                    error_code="MISSING_PARAMETER",
+                    is_retryable=False,
+                )
+            return ("campaignBudgets", {
+                "updateMask": "amountMicros",
+                "update": {
+                    "resourceName": f"{customer_path}/campaignBudgets/{params['budget_id']}",
+                    "amountMicros": str(int(params["new_budget"] * 1_000_000)),
+                },
+            }), None
+
+        if request.action_type == "adjust_bid" and request.entity_type in ("campaign", "ad_group"):
+            if request.entity_type == "campaign":
+                collection = "campaigns"
+                update = {"resourceName": f"{customer_path}/campaigns/{request.entity_id}"}
+                mask = []
+                if "target_cpa" in params:
+                    update["targetCpa"] = {
+                        "targetCpaMicros": str(int(params["target_cpa"] * 1_000_000))
+                    }
+                    mask.append("targetCpa.targetCpaMicros")
+                if "target_roas" in params:
+                    update["targetRoas"] = {"targetRoas": params["target_roas"]}
+                    mask.append("targetRoas.targetRoas")
+            else:
+                collection = "adGroups"
+                update = {"resourceName": f"{customer_path}/adGroups/{request.entity_id}"}
+                mask = []
+                if "cpc_bid" in params:
+                    update["cpcBidMicros"] = str(int(params["cpc_bid"] * 1_000_000))
+                    mask.append("cpcBidMicros")
+                if "target_cpa" in params:
+                    update["targetCpaMicros"] = str(int(params["target_cpa"] * 1_000_000))
+                    mask.append("targetCpaMicros")
+
+            if not mask:
+                return None, ExecutionResult.failure_result(
+                    message="No bid parameters provided",
+                    error_code="MISSING_PARAMETER",
+                    is_retryable=False,
+                )
+            return (collection, {"updateMask": ",".join(mask), "update": update}), None
+
+        return None, ExecutionResult.failure_result(
+            message=f"Unsupported action type: {request.action_type} on {request.entity_type}",
+            error_code="UNSUPPORTED_ACTION",
+            is_retryable=False,
+        )
+
+    async def _execute_batch_impl(
+        self,
+        requests: list[ActionRequest],
+    ) -> list[ExecutionResult]:
+        """
+        Execute several actions as multi-operation mutates.
+
+        Operations are grouped by resource collection (campaigns,
+        campaignBudgets, adGroups) and sent with partialFailure enabled,
+        so one bad operation does not fail the others.
+
+        Raises:
+            PlatformAPIError: If a mutate request itself fails
+        """
+        results: list[Optional[ExecutionResult]] = [None] * len(requests)
+        by_collection: dict[str, list[tuple[int, dict]]] = {}
+
+        for i, request in enumerate(requests):
+            built, failure = self._build_operation(request)
+            if failure is not None:
+                results[i] = failure
+                continue
+            collection, operation = built
+            by_collection.setdefault(collection, []).append((i, operation))
+
+        client = await self._get_client()
+        customer_url = f"{self.base_url}/customers/{self.credentials.customer_id}"
+
+        for collection, indexed_ops in by_collection.items():
+            url = f"{customer_url}/{collection}:mutate"
+            payload = {
+                "operations": [operation for _, operation in indexed_ops],
+                "partialFailure": True,
+                "validateOnly": False,
+            }
+
+            log_entry = self._log_request("POST", url, {"operations": len(indexed_ops)})
+            logger.info("Executing Google Ads batch mutate", extra=log_entry)
+
+            try:
+                response = await client.post(url, json=payload)
+                data = response.json()
+            except httpx.RequestError as e:
+                raise PlatformAPIError(
+                    message=f"Network error during Google Ads batch mutate: {e}",
+                    platform=self.platform_name,
+                    is_retryable=True,
+                )
+
+            if response.status_code != 200:
+                error = data.get("error", {})
+                raise PlatformAPIError(
+                    message=error.get("message", "Google Ads batch mutate failed"),
+                    platform=self.platform_name,
+                    status_code=response.status_code,
+                    error_code=error.get("status", ""),
+                    response=data,
+                    is_retryable=response.status_code in (429, 500, 502, 503, 504),
+                )
+
+            failed = self._partial_failure_by_index(data.get("partialFailureError"))
+            op_results = data.get("results", [])
+
+            for position, (i, _) in enumerate(indexed_ops):
+                request = requests[i]
+                if position in failed:
+                    results[i] = ExecutionResult.failure_result(
+                        message=failed[position].get("message", "Operation failed"),
+                        error_code="PARTIAL_FAILURE",
+                        error_details={"errors": [failed[position]]},
+                        http_status_code=400,
+                        is_retryable=False,
+                    )
+                else:
+                    results[i] = ExecutionResult.success_result(
+                        message=f"Successfully executed {request.action_type} on {request.entity_type}",
+                        response_data=op_results[position] if position < len(op_results) else {},
+                        http_status_code=response.status_code,
+                    )
+
+        return results
+
+    def _partial_failure_by_index(self, partial_failure: Optional[dict]) -> dict[int, dict]:
+        """Map operation index to its error from a partialFailureError."""
+        failed: dict[int, dict] = {}
+        if not partial_failure:
+            return failed
+
+        for detail in partial_failure.get("details", []):
+            for error in detail.get("errors", []):
+                path = error.get("location", {}).get("fieldPathElements", [])
+                for element in path:
+                    if element.get("fieldName") == "operations" and "index" in element:
+                        failed.setdefault(int(element["index"]), error)
+                        break
+        return failed
+
     def _handle_error_response(
         self,
         status_code: int,
@@ -14,14 +14,17 @@ API Reference: https://developers.facebook.com/docs/marketing-api
 Story 8.5 - Action Execution (Scoped & Reversible)
 """
 
+import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional, Any
+from urllib.parse import urlencode
 
 import httpx
 
 from src.services.platform_executors.base_executor import (
+    ActionRequest,
     BasePlatformExecutor,
     ExecutionResult,
     ExecutionResultStatus,
@@ -40,6 +43,19 @@ logger = logging.getLogger(__name__)
 META_API_VERSION = "v18.0"
 META_GRAPH_API_BASE = "https://graph.facebook.com"
 
+# Graph API limits for batch requests and multi-ID reads
+META_MAX_BATCH_SIZE = 50
+
+
+def _to_minor_units(value: float) -> int:
+    """
+    Convert an amount to the minor units Meta expects (cents for USD).
+
+    Values below 10000 are taken to be in major units already.
+    """
+    return int(value * 100) if value < 10000 else int(value)
+
+
 # Meta campaign status values
 class MetaCampaignStatus:
     ACTIVE = "ACTIVE"
@@ -100,11 +116,14 @@ class MetaAdsExecutor(BasePlatformExecutor):
 
     Rate Limiting:
     - Meta uses a points-based rate limit system
+    - Requests share a token bucket per ad account; each call inside
+      a Graph batch request counts against it
     - Executor respects Retry-After headers
     - Exponential backoff for 429 responses
     """
 
     platform_name = "meta"
+    max_batch_size = META_MAX_BATCH_SIZE
 
     def __init__(
         self,
@@ -134,9 +153,17 @@ class MetaAdsExecutor(BasePlatformExecutor):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                event_hooks={"request": [self._on_request]},
+            )
         return self._client
 
+    @property
+    def rate_limit_key(self) -> str:
+        """Requests are budgeted per ad account."""
+        return self.credentials.ad_account_id
+
     async def close(self):
         """Close HTTP client."""
         if self._client:
@@ -227,6 +254,72 @@ class MetaAdsExecutor(BasePlatformExecutor):
                 is_retryable=True,
             )
 
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], StateCapture]:
+        """
+        Get current state of several Meta entities.
+
+        Uses the Graph API multi-ID read (?ids=a,b,c), one request per
+        entity type and up to 50 IDs. If a read fails, those entities are
+        left out of the result.
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCapture keyed by (entity_id, entity_type)
+        """
+        by_type: dict[str, list[str]] = {}
+        for entity_id, entity_type in dict.fromkeys(entities):
+            by_type.setdefault(entity_type, []).append(entity_id)
+
+        client = await self._get_client()
+        states: dict[tuple[str, str], StateCapture] = {}
+
+        for entity_type, entity_ids in by_type.items():
+            fields = ",".join(self._get_fields_for_entity_type(entity_type))
+            for i in range(0, len(entity_ids), META_MAX_BATCH_SIZE):
+                chunk = entity_ids[i:i + META_MAX_BATCH_SIZE]
+                try:
+                    response = await client.get(
+                        f"{self.base_url}/",
+                        params={
+                            "access_token": self.credentials.access_token,
+                            "ids": ",".join(chunk),
+                            "fields": fields,
+                        },
+                    )
+                    data = response.json()
+                except (httpx.RequestError, ValueError) as e:
+                    logger.warning(
+                        "Meta batched state read failed",
+                        extra={"entity_type": entity_type, "error": str(e)},
+                    )
+                    continue
+
+                if response.status_code != 200:
+                    logger.warning(
+                        "Meta batched state read failed",
+                        extra={
+                            "entity_type": entity_type,
+                            "status_code": response.status_code,
+                        },
+                    )
+                    continue
+
+                for entity_id in chunk:
+                    if entity_id in data:
+                        states[(entity_id, entity_type)] = StateCapture(
+                            entity_id=entity_id,
+                            entity_type=entity_type,
+                            platform=self.platform_name,
+                            state=data[entity_id],
+                        )
+
+        return states
+
     def _get_fields_for_entity_type(self, entity_type: str) -> list[str]:
         """Get relevant fields to fetch for each entity type."""
         base_fields = ["id", "name", "status", "effective_status", "created_time", "updated_time"]
@@ -407,9 +500,7 @@ class MetaAdsExecutor(BasePlatformExecutor):
                 is_retryable=False,
             )
 
-        # Meta expects budget in micro-units (cents for USD)
-        # If the value is already in dollars, convert to cents
-        budget_value = int(new_budget * 100) if new_budget < 10000 else int(new_budget)
+        budget_value = _to_minor_units(new_budget)
 
         url = f"{self.base_url}/{entity_id}"
 
@@ -490,9 +581,7 @@ class MetaAdsExecutor(BasePlatformExecutor):
         }
 
         if "bid_amount" in params:
-            # Convert to micro-units if needed
-            bid_value = params["bid_amount"]
-            payload["bid_amount"] = int(bid_value * 100) if bid_value < 10000 else int(bid_value)
+            payload["bid_amount"] = _to_minor_units(params["bid_amount"])
 
         if "bid_strategy" in params:
             payload["bid_strategy"] = params["bid_strategy"]
@@ -542,6 +631,166 @@ class MetaAdsExecutor(BasePlatformExecutor):
                 is_retryable=True,
             )
 
+    # =========================================================================
+    # Batch Execution
+    # =========================================================================
+
+    def _build_update_fields(
+        self,
+        action_type: str,
+        params: dict,
+    ) -> tuple[Optional[dict], Optional[ExecutionResult]]:
+        """
+        Build the fields POSTed to the entity for an action.
+
+        Returns:
+            (fields, None), or (None, failure result) if the action is
+            unsupported or missing parameters
+        """
+        if action_type == "pause_campaign":
+            return {"status": MetaCampaignStatus.PAUSED}, None
+        if action_type == "resume_campaign":
+            return {"status": MetaCampaignStatus.ACTIVE}, None
+
+        if action_type == "adjust_budget":
+            new_budget = params.get("new_budget")
+            if new_budget is None:
+                return None, ExecutionResult.failure_result(
+                    message="new_budget is required for budget adjustment",
+                    error_code="MISSING_PARAMETER",
+                    is_retryable=False,
+                )
+            budget_field = (
+                "lifetime_budget" if params.get("budget_type") == "lifetime" else "daily_budget"
+            )
+            return {budget_field: _to_minor_units(new_budget)}, None
+
+        if action_type == "adjust_bid":
+            fields = {}
+            if "bid_amount" in params:
+                fields["bid_amount"] = _to_minor_units(params["bid_amount"])
+            if "bid_strategy" in params:
+                fields["bid_strategy"] = params["bid_strategy"]
+            if not fields:
+                return None, ExecutionResult.failure_result(
+                    message="Either bid_amount or bid_strategy is required",
+                    error_code="MISSING_PARAMETER",
+                    is_retryable=False,
+                )
+            return fields, None
+
+        return None, ExecutionResult.failure_result(
+            message=f"Unsupported action type: {action_type}",
+            error_code="UNSUPPORTED_ACTION",
+            is_retryable=False,
+        )
+
+    async def _execute_batch_impl(
+        self,
+        requests: list[ActionRequest],
+    ) -> list[ExecutionResult]:
+        """
+        Execute several actions in one Graph API batch request.
+
+        Each action becomes a POST /{entity_id} entry in the batch. Meta
+        answers each entry separately (or with null when it timed out,
+        which is reported as retryable).
+
+        Raises:
+            PlatformAPIError: If the batch request itself fails
+        """
+        results: list[Optional[ExecutionResult]] = [None] * len(requests)
+        batch: list[dict] = []
+        batch_index: list[int] = []
+
+        for i, request in enumerate(requests):
+            fields, failure = self._build_update_fields(request.action_type, request.params)
+            if failure is not None:
+                results[i] = failure
+                continue
+            batch.append({
+                "method": "POST",
+                "relative_url": request.entity_id,
+                "body": urlencode(fields),
+            })
+            batch_index.append(i)
+
+        if batch:
+            log_entry = self._log_request(
+                "POST", self.base_url, {"batch": batch},
+            )
+            logger.info("Executing Meta batch request", extra=log_entry)
+
+            # The request hook draws one token; Meta counts every entry
+            await self._throttle(len(batch) - 1)
+
+            client = await self._get_client()
+            try:
+                response = await client.post(
+                    f"{self.base_url}/",
+                    data={
+                        "access_token": self.credentials.access_token,
+                        "batch": json.dumps(batch),
+                        "include_headers": "false",
+                    },
+                )
+                data = response.json()
+            except httpx.RequestError as e:
+                raise PlatformAPIError(
+                    message=f"Network error during Meta batch request: {e}",
+                    platform=self.platform_name,
+                    is_retryable=True,
+                )
+
+            if response.status_code != 200 or not isinstance(data, list):
+                error = data.get("error", {}) if isinstance(data, dict) else {}
+                raise PlatformAPIError(
+                    message=error.get("message", "Meta batch request failed"),
+                    platform=self.platform_name,
+                    status_code=response.status_code,
+                    error_code=str(error.get("code", "")),
+                    response=data if isinstance(data, dict) else {},
+                    is_retryable=response.status_code in (429, 500, 502, 503, 504),
+                )
+
+            for i, item in zip(batch_index, data):
+                results[i] = self._parse_batch_item(requests[i], item)
+
+        return [
+            result or ExecutionResult.failure_result(
+                message="No response for batch entry",
+                is_retryable=True,
+            )
+            for result in results
+        ]
+
+    def _parse_batch_item(self, request: ActionRequest, item: Optional[dict]) -> ExecutionResult:
+        """Turn one Graph batch response entry into an ExecutionResult."""
+        if item is None:
+            return ExecutionResult.failure_result(
+                message="Meta batch entry timed out",
+                is_retryable=True,
+            )
+
+        status_code = item.get("code", 500)
+        try:
+            body = json.loads(item.get("body") or "{}")
+        except ValueError:
+            body = {}
+
+        if status_code == 200 and body.get("success", False):
+            return ExecutionResult.success_result(
+                message=f"Successfully executed {request.action_type} on {request.entity_type}",
+                response_data=body,
+                http_status_code=status_code,
+            )
+
+        return self._handle_error_response(
+            status_code,
+            body.get("error", {}),
+            f"Failed to execute {request.action_type} on {request.entity_type}",
+        )
+
     def _handle_error_response(
         self,
         status_code: int,
@@ -0,0 +1,177 @@
+"""
+Per-account rate limiting for platform executors.
+
+Every executor talking to the same ad account or store shares one token
+bucket, so concurrent actions (and concurrent jobs in the same process)
+draw from a single request budget. A rate-limited response pauses the
+whole bucket, not just the request that hit it.
+
+Configuration:
+- ACTION_EXECUTION_RATE_LIMITS: requests per second per account, by
+  platform, in "meta=4,google=5,shopify=2" format
+- ACTION_EXECUTION_MAX_CONCURRENCY: requests in flight per account (default: 4)
+
+Story 8.5 - Action Execution (Scoped & Reversible)
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+DEFAULT_RATE_LIMITS = {
+    "meta": 4.0,
+    "google": 5.0,
+    "shopify": 2.0,
+}
+DEFAULT_RATE_PER_SECOND = 2.0
+DEFAULT_MAX_CONCURRENCY = 4
+
+
+def _parse_rate_limits(raw: str) -> dict[str, float]:
+    """
+    Parse per-platform rates from "meta=4,google=5" format.
+
+    Malformed entries are ignored with a warning.
+    """
+    limits: dict[str, float] = {}
+    for entry in raw.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, sep, value = entry.partition("=")
+        try:
+            if not sep:
+                raise ValueError(entry)
+            limits[name.strip()] = float(value)
+        except ValueError:
+            logger.warning(
+                "Ignoring malformed platform rate limit",
+                extra={"entry": entry},
+            )
+    return limits
+
+
+PLATFORM_RATE_LIMITS = {
+    **DEFAULT_RATE_LIMITS,
+    **_parse_rate_limits(os.getenv("ACTION_EXECUTION_RATE_LIMITS", "")),
+}
+ACTION_EXECUTION_MAX_CONCURRENCY = int(
+    os.getenv("ACTION_EXECUTION_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+)
+
+
+class TokenBucket:
+    """
+    Async token bucket.
+
+    Refills at rate_per_second up to capacity. acquire() waits until
+    enough tokens are available; pause() blocks all callers until the
+    platform's Retry-After window has passed. concurrency() is the
+    semaphore capping requests in flight for the account.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: Optional[float] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ):
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity if capacity is not None else max(rate_per_second, 1.0)
+        self.max_concurrency = max(max_concurrency, 1)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _bind_loop(self) -> None:
+        # Buckets outlive event loops (one per job run); rebind the
+        # asyncio primitives to the running loop
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._loop = loop
+
+    def _get_lock(self) -> asyncio.Lock:
+        self._bind_loop()
+        return self._lock
+
+    def concurrency(self) -> asyncio.Semaphore:
+        """Semaphore shared by every executor using this bucket."""
+        self._bind_loop()
+        return self._semaphore
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated_at, 0.0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_second)
+        self._updated_at = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """
+        Wait until the given number of tokens can be taken.
+
+        Requests costing more than the capacity (a large native batch)
+        are admitted once the bucket is full, leaving it in debt so the
+        following requests wait for the balance.
+        """
+        async with self._get_lock():
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+                self._refill(now)
+                needed = min(tokens, self.capacity)
+                if self._tokens >= needed:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((needed - self._tokens) / self.rate_per_second)
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquirers for the given number of seconds."""
+        if seconds <= 0:
+            return
+        until = time.monotonic() + seconds
+        if until > self._paused_until:
+            self._paused_until = until
+            self._tokens = 0.0
+
+
+_buckets: dict[tuple[str, str], TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(platform: str, account_key: str) -> TokenBucket:
+    """
+    Get the shared token bucket for a platform account.
+
+    The bucket also carries the account's in-flight semaphore, so both
+    limits are shared per (platform, account).
+    """
+    key = (platform, account_key)
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate_per_second=PLATFORM_RATE_LIMITS.get(platform, DEFAULT_RATE_PER_SECOND),
+                max_concurrency=ACTION_EXECUTION_MAX_CONCURRENCY,
+            )
+            _buckets[key] = bucket
+        return bucket
+
+
+def reset_token_buckets() -> None:
+    """Drop all shared buckets (tests)."""
+    with _buckets_lock:
+        _buckets.clear()
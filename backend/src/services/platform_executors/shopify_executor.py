@@ -23,6 +23,7 @@ from typing import Optional, Any
 import httpx
 
 from src.services.platform_executors.base_executor import (
+    ActionRequest,
     BasePlatformExecutor,
     ExecutionResult,
     ExecutionResultStatus,
@@ -40,6 +41,43 @@ logger = logging.getLogger(__name__)
 
 SHOPIFY_API_VERSION = "2024-01"
 
+# Aliased mutations per GraphQL document, and IDs per nodes() read. Kept
+# well under the 1000-point single query cost limit.
+SHOPIFY_MAX_BATCH_SIZE = 10
+
+# Product fields captured for before/after state
+PRODUCT_STATE_FIELDS = """
+    id
+    title
+    handle
+    status
+    productType
+    vendor
+    tags
+    createdAt
+    updatedAt
+    variants(first: 10) {
+        edges {
+            node {
+                id
+                title
+                price
+                compareAtPrice
+                sku
+                inventoryQuantity
+            }
+        }
+    }
+"""
+
+# Action types that can share one GraphQL document:
+# action_type -> (mutation field, input type, result selection)
+BATCHABLE_MUTATIONS = {
+    "update_product": ("productUpdate", "ProductInput!", "product { id title status updatedAt }"),
+    "update_product_status": ("productUpdate", "ProductInput!", "product { id title status updatedAt }"),
+    "update_price": ("productVariantUpdate", "ProductVariantInput!", "productVariant { id price compareAtPrice }"),
+}
+
 # Shopify product status values
 class ShopifyProductStatus:
     ACTIVE = "ACTIVE"
@@ -96,11 +134,13 @@ class ShopifyExecutor(BasePlatformExecutor):
 
     Rate Limiting:
     - Shopify uses a bucket-based rate limit system
+    - Requests share a token bucket per store
     - Executor respects Retry-After headers
     - Exponential backoff for 429 responses
     """
 
     platform_name = "shopify"
+    max_batch_size = SHOPIFY_MAX_BATCH_SIZE
 
     def __init__(
         self,
@@ -132,9 +172,17 @@ class ShopifyExecutor(BasePlatformExecutor):
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                event_hooks={"request": [self._on_request]},
+            )
         return self._client
 
+    @property
+    def rate_limit_key(self) -> str:
+        """Requests are budgeted per store."""
+        return self.credentials.shop_domain
+
     async def close(self):
         """Close HTTP client."""
         if self._client:
@@ -311,6 +359,58 @@ class ShopifyExecutor(BasePlatformExecutor):
             state=state,
         )
 
+    async def get_entity_states(
+        self,
+        entities: list[tuple[str, str]],
+    ) -> dict[tuple[str, str], StateCapture]:
+        """
+        Get current state of several Shopify entities.
+
+        Products are read together through nodes(ids:); other entity
+        types fall back to one query each. If a read fails, those
+        entities are left out of the result.
+
+        Args:
+            entities: (entity_id, entity_type) pairs
+
+        Returns:
+            StateCapture keyed by (entity_id, entity_type)
+        """
+        unique = list(dict.fromkeys(entities))
+        products = [entity_id for entity_id, entity_type in unique if entity_type == "product"]
+        others = [(entity_id, entity_type) for entity_id, entity_type in unique if entity_type != "product"]
+
+        states = await super().get_entity_states(others) if others else {}
+
+        query = (
+            "query getProducts($ids: [ID!]!) { nodes(ids: $ids) { ... on Product {"
+            + PRODUCT_STATE_FIELDS
+            + "} } }"
+        )
+        for i in range(0, len(products), SHOPIFY_MAX_BATCH_SIZE):
+            chunk = products[i:i + SHOPIFY_MAX_BATCH_SIZE]
+            gids = [self._ensure_gid(entity_id, "product") for entity_id in chunk]
+            try:
+                data = await self._execute_graphql(query, {"ids": gids})
+            except PlatformAPIError as e:
+                logger.warning(
+                    "Shopify batched state read failed",
+                    extra={"entity_type": "product", "error": str(e)},
+                )
+                continue
+
+            # nodes() answers in request order, with null for unknown IDs
+            for entity_id, node in zip(chunk, data.get("nodes") or []):
+                if node:
+                    states[(entity_id, "product")] = StateCapture(
+                        entity_id=entity_id,
+                        entity_type="product",
+                        platform=self.platform_name,
+                        state=node,
+                    )
+
+        return states
+
     def _ensure_gid(self, entity_id: str, entity_type: str) -> str:
         """Ensure entity ID is in Shopify GID format."""
         if entity_id.startswith("gid://"):
@@ -332,33 +432,11 @@ class ShopifyExecutor(BasePlatformExecutor):
     def _get_state_query(self, entity_type: str) -> str:
         """Get GraphQL query for fetching entity state."""
         if entity_type == "product":
-            return """
-            query getProduct($id: ID!) {
-                product(id: $id) {
-                    id
-                    title
-                    handle
-                    status
-                    productType
-                    vendor
-                    tags
-                    createdAt
-                    updatedAt
-                    variants(first: 10) {
-                        edges {
-                            node {
-                                id
-                                title
-                                price
-                                compareAtPrice
-                                sku
-                                inventoryQuantity
-                            }
-                        }
-                    }
-                }
-            }
-            """
+            return (
+                "query getProduct($id: ID!) { product(id: $id) {"
+                + PRODUCT_STATE_FIELDS
+                + "} }"
+            )
         elif entity_type in ("discount", "discount_code"):
             return """
             query getDiscount($id: ID!) {
@@ -520,8 +598,6 @@ class ShopifyExecutor(BasePlatformExecutor):
         Returns:
             ExecutionResult with outcome
         """
-        gid = self._ensure_gid(entity_id, "product")
-
         mutation = """
         mutation productUpdate($input: ProductInput!) {
             productUpdate(input: $input) {
@@ -539,13 +615,7 @@ class ShopifyExecutor(BasePlatformExecutor):
         }
         """
 
-        # Build input from params
-        product_input = {"id": gid}
-        allowed_fields = ["title", "productType", "vendor", "tags", "status"]
-
-        for field in allowed_fields:
-            if field in params:
-                product_input[field] = params[field]
+        product_input = self._product_input(entity_id, params)
 
         # Log request (sanitized)
         log_entry = self._log_request("POST", self.graphql_url, product_input)
@@ -1045,8 +1115,6 @@ class ShopifyExecutor(BasePlatformExecutor):
                 is_retryable=False,
             )
 
-        gid = self._ensure_gid(entity_id, "variant")
-
         mutation = """
         mutation productVariantUpdate($input: ProductVariantInput!) {
             productVariantUpdate(input: $input) {
@@ -1063,13 +1131,7 @@ class ShopifyExecutor(BasePlatformExecutor):
         }
         """
 
-        variant_input = {
-            "id": gid,
-            "price": str(price),
-        }
-
-        if "compare_at_price" in params:
-            variant_input["compareAtPrice"] = str(params["compare_at_price"])
+        variant_input = self._variant_input(entity_id, params)
 
         log_entry = self._log_request("POST", self.graphql_url, variant_input)
         logger.info("Executing Shopify price update", extra=log_entry)
@@ -1107,6 +1169,127 @@ class ShopifyExecutor(BasePlatformExecutor):
                 is_retryable=False,
             )
 
+    def _product_input(self, entity_id: str, params: dict) -> dict:
+        """Build ProductInput from action params."""
+        product_input = {"id": self._ensure_gid(entity_id, "product")}
+        allowed_fields = ["title", "productType", "vendor", "tags", "status"]
+
+        for field in allowed_fields:
+            if field in params:
+                product_input[field] = params[field]
+        return product_input
+
+    def _variant_input(self, entity_id: str, params: dict) -> dict:
+        """Build ProductVariantInput from action params."""
+        variant_input = {
+            "id": self._ensure_gid(entity_id, "variant"),
+            "price": str(params["price"]),
+        }
+        if "compare_at_price" in params:
+            variant_input["compareAtPrice"] = str(params["compare_at_price"])
+        return variant_input
+
+    # =========================================================================
+    # Batch Execution
+    # =========================================================================
+
+    def _build_batch_input(self, request: ActionRequest) -> tuple[Optional[dict], Optional[ExecutionResult]]:
+        """
+        Build the mutation input for a batchable action.
+
+        Returns:
+            (input, None), or (None, failure result) if parameters are missing
+        """
+        params = request.params
+        if request.action_type == "update_product_status":
+            if not params.get("status"):
+                return None, ExecutionResult.failure_result(
+                    message="status is required for product status change",
+                    error_code="MISSING_PARAMETER",
+                    is_retryable=False,
+                )
+            return self._product_input(request.entity_id, {"status": params["status"].upper()}), None
+        if request.action_type == "update_price":
+            if params.get("price") is None:
+                return None, ExecutionResult.failure_result(
+                    message="price is required for price update",
+                    error_code="MISSING_PARAMETER",
+                    is_retryable=False,
+                )
+            return self._variant_input(request.entity_id, params), None
+        return self._product_input(request.entity_id, params), None
+
+    async def _execute_batch_impl(
+        self,
+        requests: list[ActionRequest],
+    ) -> list[Optional[ExecutionResult]]:
+        """
+        Execute product and price updates as aliased mutations in one
+        GraphQL document.
+
+        Shopify's bulkOperationRunMutation needs a staged JSONL upload
+        and is asynchronous, which does not fit approval-sized batches;
+        aliasing gives one round trip per batch instead. Other action
+        types are returned as None and run individually.
+
+        Raises:
+            PlatformAPIError: If the GraphQL request itself fails
+        """
+        results: list[Optional[ExecutionResult]] = [None] * len(requests)
+        var_defs: list[str] = []
+        fields: list[str] = []
+        variables: dict = {}
+        aliased: list[tuple[int, str, str]] = []
+
+        for i, request in enumerate(requests):
+            mutation = BATCHABLE_MUTATIONS.get(request.action_type)
+            if mutation is None:
+                continue
+            mutation_field, input_type, selection = mutation
+            mutation_input, failure = self._build_batch_input(request)
+            if failure is not None:
+                results[i] = failure
+                continue
+            alias = f"m{i}"
+            var_defs.append(f"$input{i}: {input_type}")
+            fields.append(
+                f"{alias}: {mutation_field}(input: $input{i}) "
+                f"{{ {selection} userErrors {{ field message }} }}"
+            )
+            variables[f"input{i}"] = mutation_input
+            aliased.append((i, alias, selection.split(" ", 1)[0]))
+
+        if not aliased:
+            return results
+
+        document = f"mutation batchUpdate({', '.join(var_defs)}) {{ {' '.join(fields)} }}"
+
+        log_entry = self._log_request("POST", self.graphql_url, {"mutations": len(aliased)})
+        logger.info("Executing Shopify batch mutation", extra=log_entry)
+
+        data = await self._execute_graphql(document, variables)
+
+        for i, alias, result_key in aliased:
+            request = requests[i]
+            result = data.get(alias) or {}
+            user_errors = result.get("userErrors", [])
+            if user_errors:
+                error_msg = "; ".join(e.get("message", "") for e in user_errors)
+                results[i] = ExecutionResult.failure_result(
+                    message=f"{request.action_type} failed: {error_msg}",
+                    error_code="USER_ERROR",
+                    error_details={"userErrors": user_errors},
+                    is_retryable=False,
+                )
+            else:
+                results[i] = ExecutionResult.success_result(
+                    message=f"Successfully executed {request.action_type}",
+                    response_data=result.get(result_key) or {},
+                    http_status_code=200,
+                )
+
+        return results
+
     # =========================================================================
     # Rollback Generation
     # =========================================================================
@@ -22,12 +22,12 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import uuid
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
 from src.models.ai_recommendation import (
@@ -38,6 +38,7 @@ from src.models.ai_recommendation import (
     RiskLevel,
     AffectedEntityType,
 )
+from src.services.bulk_insert import existing_content_hashes, insert_ignoring_duplicates
 from src.services.recommendation_rules import (
     get_applicable_recommendations,
     calculate_priority,
@@ -132,11 +133,7 @@ class RecommendationGenerationService:
             insights_processed += 1
 
         # Persist recommendations
-        persisted = []
-        for detected in all_detected:
-            recommendation = self._persist_recommendation(detected, job_id)
-            if recommendation:
-                persisted.append(recommendation)
+        persisted = self._persist_recommendations(all_detected, job_id)
 
         logger.info(
             "Recommendations generated",
@@ -337,14 +334,57 @@ class RecommendationGenerationService:
         content = "|".join(parts)
         return hashlib.sha256(content.encode()).hexdigest()
 
-    def _persist_recommendation(
+    def _persist_recommendations(
         self,
-        detected: DetectedRecommendation,
+        detected_recommendations: list[DetectedRecommendation],
         job_id: str,
-    ) -> AIRecommendation | None:
-        """Persist recommendation to database, handling deduplication."""
-        content_hash = self._generate_content_hash(detected)
+    ) -> list[AIRecommendation]:
+        """
+        Persist detected recommendations in batches, skipping duplicates.
+
+        Text is rendered only for hashes not already stored; inserts use
+        ON CONFLICT DO NOTHING so a duplicate never discards the batch.
+        """
+        by_hash: dict[str, DetectedRecommendation] = {}
+        for detected in detected_recommendations:
+            by_hash.setdefault(self._generate_content_hash(detected), detected)
+
+        existing = existing_content_hashes(
+            self.db, AIRecommendation, self.tenant_id, by_hash,
+        )
+        generated_at = datetime.now(timezone.utc)
 
+        rows = [
+            self._build_recommendation_row(detected, content_hash, job_id, generated_at)
+            for content_hash, detected in by_hash.items()
+            if content_hash not in existing
+        ]
+
+        inserted = insert_ignoring_duplicates(
+            self.db,
+            AIRecommendation,
+            rows,
+            ("tenant_id", "content_hash", "related_insight_id"),
+        )
+
+        logger.debug(
+            "Recommendations deduplicated",
+            extra={
+                "tenant_id": self.tenant_id,
+                "detected": len(detected_recommendations),
+                "duplicates": len(detected_recommendations) - len(inserted),
+            },
+        )
+        return inserted
+
+    def _build_recommendation_row(
+        self,
+        detected: DetectedRecommendation,
+        content_hash: str,
+        job_id: str,
+        generated_at: datetime,
+    ) -> dict[str, Any]:
+        """Render text and build column values for one new recommendation."""
         # Render recommendation text and rationale
         recommendation_text = render_recommendation_text(detected)
         rationale = render_rationale(detected)
@@ -371,42 +411,26 @@ class RecommendationGenerationService:
             except ValueError:
                 pass
 
-        recommendation = AIRecommendation(
-            tenant_id=self.tenant_id,
-            related_insight_id=detected.source_insight_id,
-            recommendation_type=detected.recommendation_type,
-            priority=detected.priority,
-            recommendation_text=recommendation_text,
-            rationale=rationale,
-            estimated_impact=detected.estimated_impact,
-            risk_level=detected.risk_level,
-            confidence_score=detected.confidence_score,
-            affected_entity=detected.affected_entity,
-            affected_entity_type=affected_entity_type_enum,
-            currency=detected.currency,
-            generated_at=datetime.now(timezone.utc),
-            job_id=job_id,
-            content_hash=content_hash,
-            is_accepted=0,
-            is_dismissed=0,
-        )
-
-        try:
-            self.db.add(recommendation)
-            self.db.flush()
-            return recommendation
-        except IntegrityError:
-            # Duplicate constraint violation - recommendation already exists
-            self.db.rollback()
-            logger.debug(
-                "Recommendation deduplicated",
-                extra={
-                    "tenant_id": self.tenant_id,
-                    "content_hash": content_hash,
-                    "insight_id": detected.source_insight_id,
-                },
-            )
-            return None
+        return {
+            "id": str(uuid.uuid4()),
+            "tenant_id": self.tenant_id,
+            "related_insight_id": detected.source_insight_id,
+            "recommendation_type": detected.recommendation_type,
+            "priority": detected.priority,
+            "recommendation_text": recommendation_text,
+            "rationale": rationale,
+            "estimated_impact": detected.estimated_impact,
+            "risk_level": detected.risk_level,
+            "confidence_score": detected.confidence_score,
+            "affected_entity": detected.affected_entity,
+            "affected_entity_type": affected_entity_type_enum,
+            "currency": detected.currency,
+            "generated_at": generated_at,
+            "job_id": job_id,
+            "content_hash": content_hash,
+            "is_accepted": 0,
+            "is_dismissed": 0,
+        }
 
     def generate_for_single_insight(
         self,
@@ -425,8 +449,6 @@ class RecommendationGenerationService:
         Returns:
             List of generated AIRecommendation objects
         """
-        import uuid
-
         if not job_id:
             job_id = str(uuid.uuid4())
 
@@ -24,6 +24,11 @@ from typing import Any
 from sqlalchemy.orm import Session
 
 from src.models.dataset_version import DatasetVersion, DatasetVersionStatus
+from src.services.dbt_manifest_index import (
+    ManifestIndex,
+    as_manifest_index,
+    load_manifest_index,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -98,32 +103,18 @@ def _is_semantic_view(model_name: str) -> bool:
     return False
 
 
-def _parse_manifest_models(manifest: dict[str, Any]) -> dict[str, DatasetViewSchema]:
+def _parse_manifest_models(manifest: ManifestIndex | dict[str, Any]) -> dict[str, DatasetViewSchema]:
     """Extract semantic view schemas from dbt manifest."""
-    nodes = manifest.get("nodes", {})
     result: dict[str, DatasetViewSchema] = {}
 
-    for node_id, node in nodes.items():
-        if not node_id.startswith("model."):
+    for node in as_manifest_index(manifest).models():
+        if not _is_semantic_view(node.name):
             continue
-        name = node.get("name", "")
-        if not _is_semantic_view(name):
-            continue
-
-        columns_raw = node.get("columns", {})
-        columns: list[ColumnSchema] = []
-        for col_name, col_info in columns_raw.items():
-            meta = col_info.get("meta", {}) if isinstance(col_info, dict) else {}
-            exposed = meta.get("superset_expose", False) if meta else False
-            data_type = (
-                col_info.get("data_type", "VARCHAR")
-                if isinstance(col_info, dict)
-                else "VARCHAR"
-            )
-            columns.append(
-                ColumnSchema(name=col_name, data_type=str(data_type), exposed=exposed)
-            )
-        result[name] = DatasetViewSchema(name=name, columns=tuple(columns))
+        columns = tuple(
+            ColumnSchema(name=c.name, data_type=str(c.data_type or "VARCHAR"), exposed=c.exposed)
+            for c in node.columns
+        )
+        result[node.name] = DatasetViewSchema(name=node.name, columns=columns)
 
     return result
 
@@ -141,7 +132,7 @@ class SchemaCompatibilityChecker:
     def validate(
         self,
         current_state: DatasetSchemaSnapshot,
-        new_manifest: dict[str, Any],
+        new_manifest: ManifestIndex | dict[str, Any],
     ) -> CompatibilityResult:
         """
         Compare current dataset state to new manifest.
@@ -229,15 +220,10 @@ class SchemaCompatibilityChecker:
         manifest_path: str | Path,
     ) -> CompatibilityResult:
         """Load manifest from file and run validation."""
-        path = Path(manifest_path)
-        if not path.exists():
-            raise FileNotFoundError(f"Manifest not found: {path}")
-        with open(path) as f:
-            manifest = json.load(f)
-        return self.validate(current_state, manifest)
+        return self.validate(current_state, load_manifest_index(manifest_path))
 
 
-def build_snapshot_from_manifest(manifest: dict[str, Any]) -> DatasetSchemaSnapshot:
+def build_snapshot_from_manifest(manifest: ManifestIndex | dict[str, Any]) -> DatasetSchemaSnapshot:
     """Build a DatasetSchemaSnapshot from a dbt manifest (e.g. for tests or CI)."""
     datasets = _parse_manifest_models(manifest)
     return DatasetSchemaSnapshot(datasets=datasets)
@@ -22,6 +22,7 @@ import os
 import httpx
 
 from src.integrations.airbyte.client import AirbyteClient, get_airbyte_client
+from src.integrations.airbyte.job_watcher import watcher_for_client
 from src.integrations.airbyte.models import (
     AirbyteSyncResult,
     AirbyteJobStatus,
@@ -270,10 +271,14 @@ class ShopifyIngestionService:
             )
 
             if wait_for_completion:
-                # Trigger and wait for completion
-                sync_result = await airbyte_client.sync_and_wait(
-                    connection_id=connection_info.airbyte_connection_id,
+                # Trigger, then wait on the shared job watcher (no per-sync poll loop)
+                job_id = await airbyte_client.trigger_sync(
+                    connection_info.airbyte_connection_id
+                )
+                sync_result = await watcher_for_client(airbyte_client).wait_for_job(
+                    job_id=job_id,
                     timeout_seconds=timeout_seconds,
+                    connection_id=connection_info.airbyte_connection_id,
                 )
 
                 result = SyncResult(
@@ -0,0 +1,258 @@
+"""
+Processing for Shopify billing and lifecycle webhooks.
+
+Applies verified webhook payloads to stores and subscriptions. Used by
+the webhook inbox worker for queued events and by the webhook routes
+when the inbox is disabled (WEBHOOK_INBOX_ENABLED=false).
+
+Processors raise on failure so the caller decides whether to retry; each
+commits its own changes. Shopify delivers webhooks at least once and the
+inbox may retry, so every processor is safe to run twice.
+"""
+
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Webhook topics we handle
+WEBHOOK_TOPIC_SUBSCRIPTION_UPDATE = "app_subscriptions/update"
+WEBHOOK_TOPIC_APP_UNINSTALLED = "app/uninstalled"
+WEBHOOK_TOPIC_SHOP_REDACT = "shop/redact"
+
+
+def process_subscription_update(
+    session: Session,
+    shop_domain: str,
+    data: Dict[str, Any],
+) -> str:
+    """
+    Apply an app_subscriptions/update webhook.
+
+    Sent when a subscription is activated, cancelled, frozen (payment
+    failed), declined or renewed.
+
+    Returns:
+        Processing message for the webhook response / inbox log
+    """
+    # Extract subscription data
+    subscription_gid = data.get("app_subscription", {}).get("admin_graphql_api_id")
+    subscription_status = data.get("app_subscription", {}).get("status")
+
+    if not subscription_gid:
+        logger.warning("Webhook missing subscription ID", extra={
+            "shop_domain": shop_domain,
+            "data_keys": list(data.keys())
+        })
+        return "Missing subscription ID"
+
+    logger.info("Processing subscription update", extra={
+        "shop_domain": shop_domain,
+        "subscription_gid": subscription_gid,
+        "status": subscription_status
+    })
+
+    # Find store by shop domain
+    from src.models.store import ShopifyStore
+    store = session.query(ShopifyStore).filter(
+        ShopifyStore.shop_domain == shop_domain
+    ).first()
+
+    if not store:
+        logger.warning("Store not found for webhook", extra={
+            "shop_domain": shop_domain
+        })
+        return "Store not found"
+
+    # Process based on status
+    from src.services.billing_service import BillingService
+
+    billing_service = BillingService(session, store.tenant_id)
+
+    if subscription_status == "ACTIVE":
+        # Subscription activated
+        current_period_end = None
+        if data.get("app_subscription", {}).get("current_period_end"):
+            current_period_end = datetime.fromisoformat(
+                data["app_subscription"]["current_period_end"].replace("Z", "+00:00")
+            )
+
+        billing_service.activate_subscription(
+            shopify_subscription_id=subscription_gid,
+            current_period_end=current_period_end
+        )
+        logger.info("Subscription activated via webhook", extra={
+            "shop_domain": shop_domain,
+            "subscription_gid": subscription_gid
+        })
+
+    elif subscription_status == "CANCELLED":
+        # Subscription cancelled
+        billing_service.cancel_subscription(
+            shopify_subscription_id=subscription_gid,
+            cancelled_at=datetime.now(timezone.utc)
+        )
+        logger.info("Subscription cancelled via webhook", extra={
+            "shop_domain": shop_domain,
+            "subscription_gid": subscription_gid
+        })
+
+    elif subscription_status == "FROZEN":
+        # Payment failed
+        billing_service.freeze_subscription(
+            shopify_subscription_id=subscription_gid,
+            reason="payment_failed"
+        )
+        logger.warning("Subscription frozen via webhook", extra={
+            "shop_domain": shop_domain,
+            "subscription_gid": subscription_gid
+        })
+
+    elif subscription_status == "DECLINED":
+        # Merchant declined charge
+        billing_service.cancel_subscription(
+            shopify_subscription_id=subscription_gid
+        )
+        logger.info("Subscription declined via webhook", extra={
+            "shop_domain": shop_domain,
+            "subscription_gid": subscription_gid
+        })
+
+    else:
+        logger.info("Unhandled subscription status", extra={
+            "shop_domain": shop_domain,
+            "status": subscription_status
+        })
+
+    return f"Processed status: {subscription_status}"
+
+
+def process_app_uninstalled(
+    session: Session,
+    shop_domain: str,
+    data: Dict[str, Any],
+) -> str:
+    """
+    Apply an app/uninstalled webhook.
+
+    Cancels open subscriptions and marks the store uninstalled; data is
+    retained for potential reinstallation until shop/redact arrives.
+
+    Returns:
+        Processing message for the webhook response / inbox log
+    """
+    from src.models.store import ShopifyStore
+    from src.models.subscription import Subscription, SubscriptionStatus
+
+    # Find and update store
+    store = session.query(ShopifyStore).filter(
+        ShopifyStore.shop_domain == shop_domain
+    ).first()
+
+    if not store:
+        logger.warning("Store not found for uninstall webhook", extra={
+            "shop_domain": shop_domain
+        })
+        return "App uninstalled processed"
+
+    store.status = "uninstalled"
+    store.uninstalled_at = datetime.now(timezone.utc)
+    # Clear access token for security
+    store.access_token_encrypted = None
+
+    # Cancel any active subscriptions
+    subscriptions = session.query(Subscription).filter(
+        Subscription.store_id == store.id,
+        Subscription.status.in_([
+            SubscriptionStatus.ACTIVE.value,
+            SubscriptionStatus.PENDING.value,
+            SubscriptionStatus.FROZEN.value
+        ])
+    ).all()
+
+    for sub in subscriptions:
+        sub.status = SubscriptionStatus.CANCELLED.value
+        sub.cancelled_at = datetime.now(timezone.utc)
+
+    session.commit()
+
+    logger.info("Store marked as uninstalled", extra={
+        "shop_domain": shop_domain,
+        "store_id": store.id,
+        "subscriptions_cancelled": len(subscriptions)
+    })
+
+    return "App uninstalled processed"
+
+
+def process_shop_redact(
+    session: Session,
+    shop_domain: str,
+    data: Dict[str, Any],
+) -> str:
+    """
+    Apply a shop/redact webhook (GDPR compliance).
+
+    Deletes all data associated with the shop (sent 48 hours after
+    uninstall).
+
+    Returns:
+        Processing message for the webhook response / inbox log
+    """
+    from src.models.store import ShopifyStore
+    from src.models.subscription import Subscription
+    from src.models.billing_event import BillingEvent
+    from src.models.usage import UsageRecord
+
+    # Find the store
+    store = session.query(ShopifyStore).filter(
+        ShopifyStore.shop_domain == shop_domain
+    ).first()
+
+    if not store:
+        logger.info("Shop not found for redact - may already be deleted", extra={
+            "shop_domain": shop_domain
+        })
+        return "Shop redact completed - all data deleted"
+
+    store_id = store.id
+    tenant_id = store.tenant_id
+
+    # Delete related records (order matters for foreign keys)
+    usage_deleted = session.query(UsageRecord).filter(
+        UsageRecord.store_id == store_id
+    ).delete(synchronize_session=False)
+
+    billing_events_deleted = session.query(BillingEvent).filter(
+        BillingEvent.store_id == store_id
+    ).delete(synchronize_session=False)
+
+    subscriptions_deleted = session.query(Subscription).filter(
+        Subscription.store_id == store_id
+    ).delete(synchronize_session=False)
+
+    # Delete the store itself
+    session.delete(store)
+    session.commit()
+
+    logger.info("Shop data deleted per GDPR request", extra={
+        "shop_domain": shop_domain,
+        "store_id": store_id,
+        "tenant_id": tenant_id,
+        "usage_records_deleted": usage_deleted,
+        "billing_events_deleted": billing_events_deleted,
+        "subscriptions_deleted": subscriptions_deleted
+    })
+
+    return "Shop redact completed - all data deleted"
+
+
+# Topic -> processor, used by the webhook inbox worker
+SHOPIFY_WEBHOOK_PROCESSORS: Dict[str, Callable[[Session, str, Dict[str, Any]], str]] = {
+    WEBHOOK_TOPIC_SUBSCRIPTION_UPDATE: process_subscription_update,
+    WEBHOOK_TOPIC_APP_UNINSTALLED: process_app_uninstalled,
+    WEBHOOK_TOPIC_SHOP_REDACT: process_shop_redact,
+}
@@ -8,7 +8,6 @@ means no partial apply: we record failure and do not update remaining datasets.
 Story 5.2 — Prompt 5.2.4
 """
 
-import hashlib
 import json
 import logging
 import time
@@ -21,6 +20,11 @@ import httpx
 from sqlalchemy.orm import Session
 
 from src.models.dataset_metrics import DatasetSyncStatus
+from src.services.dbt_manifest_index import (
+    ManifestIndex,
+    as_manifest_index,
+    load_manifest_index,
+)
 from src.monitoring.dataset_alerts import alert_compatibility_failure, alert_sync_failure
 from src.services.audit_logger import (
     emit_dataset_sync_completed,
@@ -35,6 +39,7 @@ from src.services.schema_compatibility_checker import (
     DatasetSchemaSnapshot,
     build_snapshot_from_db,
 )
+from src.services.superset_metadata_catalog import invalidate_superset_metadata
 
 logger = logging.getLogger(__name__)
 
@@ -57,13 +62,9 @@ class SyncResult:
     pre_deploy_checks: list[dict[str, Any]] = field(default_factory=list)
 
 
-def _parse_manifest(manifest_path: str | Path) -> dict[str, Any]:
-    """Load and parse dbt manifest.json."""
-    path = Path(manifest_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Manifest not found: {path}")
-    with open(path) as f:
-        return json.load(f)
+def _parse_manifest(manifest_path: str | Path) -> ManifestIndex:
+    """Load the indexed dbt manifest.json."""
+    return load_manifest_index(manifest_path)
 
 
 def _is_semantic_view(name: str) -> bool:
@@ -74,51 +75,41 @@ def _is_semantic_view(name: str) -> bool:
     return False
 
 
-def _get_semantic_models_with_exposed_columns(manifest: dict[str, Any]) -> dict[str, list[dict]]:
+def _get_semantic_models_with_exposed_columns(
+    manifest: ManifestIndex | dict[str, Any],
+) -> dict[str, list[dict]]:
     """Extract semantic view name -> list of {column_name, description, data_type} for exposed only."""
-    nodes = manifest.get("nodes", {})
     result: dict[str, list[dict]] = {}
 
-    for node_id, node in nodes.items():
-        if not node_id.startswith("model."):
-            continue
-        name = node.get("name", "")
-        if not _is_semantic_view(name):
+    for node in as_manifest_index(manifest).models():
+        if not _is_semantic_view(node.name):
             continue
-
-        columns = []
-        for col_name, col_info in node.get("columns", {}).items():
-            meta = col_info.get("meta", {}) if isinstance(col_info, dict) else {}
-            if not meta.get("superset_expose", False):
-                continue
-            columns.append({
-                "column_name": col_name,
-                "description": col_info.get("description", "") if isinstance(col_info, dict) else "",
-                "data_type": col_info.get("data_type", "VARCHAR") if isinstance(col_info, dict) else "VARCHAR",
-            })
-        result[name] = columns
+        result[node.name] = [
+            {
+                "column_name": c.name,
+                "description": c.description,
+                "data_type": c.data_type or "VARCHAR",
+            }
+            for c in node.columns
+            if c.exposed
+        ]
 
     return result
 
 
-def _get_column_snapshot_for_version(manifest: dict[str, Any], dataset_name: str) -> list[dict]:
+def _get_column_snapshot_for_version(
+    manifest: ManifestIndex | dict[str, Any],
+    dataset_name: str,
+) -> list[dict]:
     """Build full column list for DatasetVersion.column_snapshot (column_name, type, superset_expose)."""
-    node_id = f"model.markinsight.{dataset_name}"
-    node = (manifest.get("nodes", {}) or {}).get(node_id, {})
-    columns_raw = node.get("columns", {})
-    snapshot: list[dict] = []
-    for col_name, col_info in columns_raw.items():
-        if not isinstance(col_info, dict):
-            continue
-        meta = col_info.get("meta", {}) or {}
-        data_type = col_info.get("data_type", "VARCHAR") or "VARCHAR"
-        exposed = bool(meta.get("superset_expose", False))
-        snapshot.append({
-            "column_name": col_name,
-            "type": data_type,
-            "superset_expose": exposed,
-        })
-    return snapshot
+    return [
+        {
+            "column_name": c.name,
+            "type": c.data_type or "VARCHAR",
+            "superset_expose": c.exposed,
+        }
+        for c in as_manifest_index(manifest).columns(f"model.markinsight.{dataset_name}")
+    ]
 
 
 class SupersetApiClient:
@@ -357,11 +348,8 @@ class SupersetDatasetSync:
             result.duration_seconds = time.perf_counter() - start
             return result
 
-        manifest_hash = hashlib.sha256(
-            json.dumps(manifest, sort_keys=True).encode()
-        ).hexdigest()
+        manifest_hash = manifest.content_hash
         schema_name = "semantic"
-        nodes = manifest.get("nodes", {}) or {}
 
         for dataset_name, columns in models.items():
             t0 = time.perf_counter()
@@ -376,9 +364,9 @@ class SupersetDatasetSync:
             emit_dataset_sync_started(self.db, dataset_name, "v1")
             try:
                 existing = self.client.get_dataset(dataset_name, schema_name)
-                node = nodes.get(f"model.markinsight.{dataset_name}", {})
-                description = node.get("description", "") or f"Semantic view: {dataset_name}"
-                total_column_count = len(node.get("columns", {}))
+                node = manifest.node(f"model.markinsight.{dataset_name}")
+                description = (node.description if node else "") or f"Semantic view: {dataset_name}"
+                total_column_count = len(node.columns) if node else 0
 
                 if existing:
                     self.client.update_dataset(existing["id"], description)
@@ -397,6 +385,13 @@ class SupersetDatasetSync:
                     if existing:
                         self.client.refresh_dataset_columns(existing["id"])
 
+                # Superset's columns (and, for a new dataset, its id) changed
+                invalidate_superset_metadata(
+                    [dataset_name],
+                    [existing["id"]] if existing else [],
+                    reason="dataset_sync",
+                )
+
                 self.version_manager.activate_version(version.id)
                 duration = time.perf_counter() - t0
                 emit_dataset_sync_completed(self.db, dataset_name, "v1", duration)
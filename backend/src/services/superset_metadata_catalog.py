@@ -0,0 +1,802 @@
+"""
+Shared Superset metadata catalog.
+
+Dataset discovery and chart previews both need Superset dataset metadata
+(dataset id by table name, column lists). Each used to open its own
+httpx.Client per call, log in again, and fetch every dataset's columns
+one request at a time. The catalog holds that metadata for the process:
+
+- One pooled, authenticated HTTP session per Superset URL (keep-alive
+  connections, login + CSRF token reused for SUPERSET_TOKEN_TTL_SECONDS,
+  one transparent re-login on 401)
+- Dataset id by table name and dataset detail (with columns) cached in
+  Redis, shared by all instances, behind a short in-process LRU
+- Change detection for listings: the dataset list is fetched with each
+  dataset's changed_on timestamp; cached details whose timestamp still
+  matches are reused (one Redis MGET for the whole page) and only new or
+  changed datasets are fetched from Superset
+
+Superset's dataset list endpoint cannot select a dataset's columns (they
+are only returned by GET /api/v1/dataset/{id}), so each new or changed
+dataset still costs one detail request. A page's detail requests are sent
+together over the pooled session, so a cold listing takes one round trip
+per page rather than one per dataset; a warm listing makes none.
+
+A warm chart preview therefore makes exactly one Superset call (the
+chart data query). Async callers (chart previews) use the same caches
+through aget_dataset_id()/aget_dataset() and an AsyncSupersetHttpSession
+with its own httpx.AsyncClient pool.
+
+Key schema (Redis):
+- superset_meta:dataset_id:{table_name} -> dataset id
+- superset_meta:dataset:{dataset_id}    -> JSON SupersetDataset
+
+INVALIDATION:
+SupersetDatasetSync.sync() (after updating a dataset in Superset) and
+DatasetVersionManager (activation, rollback) call
+invalidate_superset_metadata(). Entries are dropped from Redis and the
+invalidation is published so every instance evicts its LRU front.
+Changes made directly in Superset are picked up by the next listing
+(changed_on differs) or within the entry TTL.
+
+Environment variables:
+    SUPERSET_METADATA_CACHE_ENABLED: Set to "false" to always ask Superset
+    SUPERSET_METADATA_CACHE_TTL_SECONDS: Redis entry TTL (default 3600)
+    SUPERSET_METADATA_LOCAL_TTL_SECONDS: In-process entry TTL (default 60)
+    SUPERSET_TOKEN_TTL_SECONDS: Reuse a Superset login for (default 1800)
+    SUPERSET_HTTP_MAX_CONNECTIONS: Pooled connections per session (default 20)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict, field
+from threading import Lock
+from typing import Any, Iterable, Optional
+
+import httpx
+
+from src.platform.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+SUPERSET_METADATA_CACHE_ENABLED = (
+    os.getenv("SUPERSET_METADATA_CACHE_ENABLED", "true").lower() == "true"
+)
+SUPERSET_METADATA_CACHE_TTL_SECONDS = int(
+    os.getenv("SUPERSET_METADATA_CACHE_TTL_SECONDS", "3600")
+)
+SUPERSET_METADATA_LOCAL_TTL_SECONDS = int(
+    os.getenv("SUPERSET_METADATA_LOCAL_TTL_SECONDS", "60")
+)
+SUPERSET_TOKEN_TTL_SECONDS = int(os.getenv("SUPERSET_TOKEN_TTL_SECONDS", "1800"))
+SUPERSET_HTTP_MAX_CONNECTIONS = int(os.getenv("SUPERSET_HTTP_MAX_CONNECTIONS", "20"))
+
+DEFAULT_TIMEOUT_SECONDS = 10
+LIST_PAGE_SIZE = 100
+MAX_PAGINATION_PAGES = 50  # Guard against runaway pagination loops
+
+INVALIDATION_CHANNEL = "superset_meta:invalidations"
+
+
+class SupersetHttpSession:
+    """
+    Pooled, authenticated HTTP session for the Superset REST API.
+
+    Usage:
+        session = get_superset_http_session()
+        resp = session.request("GET", "/api/v1/dataset/", params=...)
+        resp.raise_for_status()
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        token_ttl_seconds: int = SUPERSET_TOKEN_TTL_SECONDS,
+        max_connections: int = SUPERSET_HTTP_MAX_CONNECTIONS,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._username = username
+        self._password = password
+        self._token_ttl_seconds = token_ttl_seconds
+        self._client = httpx.Client(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._token: Optional[str] = None
+        self._csrf: Optional[str] = None
+        self._token_obtained_at: float = 0.0
+        self._auth_lock = Lock()
+
+    def _clear_auth(self) -> None:
+        self._token = None
+        self._csrf = None
+        self._token_obtained_at = 0.0
+
+    def _ensure_auth(self) -> None:
+        """Log in unless the current token is younger than the token TTL."""
+        with self._auth_lock:
+            token_age = time.time() - self._token_obtained_at
+            if self._token and token_age < self._token_ttl_seconds:
+                return
+            self._clear_auth()
+            resp = self._client.post(
+                f"{self.base_url}/api/v1/security/login",
+                json={
+                    "username": self._username,
+                    "password": self._password,
+                    "provider": "db",
+                },
+            )
+            resp.raise_for_status()
+            token = resp.json()["access_token"]
+
+            csrf_resp = self._client.get(
+                f"{self.base_url}/api/v1/security/csrf_token/",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            csrf_resp.raise_for_status()
+            self._csrf = csrf_resp.json().get("result", "")
+            self._token = token
+            self._token_obtained_at = time.time()
+
+    def _auth_headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._token}",
+            "X-CSRFToken": self._csrf or "",
+            "Content-Type": "application/json",
+        }
+
+    def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send an authenticated request; re-login and retry once on 401.
+
+        Args:
+            path: API path starting with "/api/v1/"
+        """
+        for attempt in range(2):
+            self._ensure_auth()
+            resp = self._client.request(
+                method,
+                f"{self.base_url}{path}",
+                headers=self._auth_headers(),
+                **kwargs,
+            )
+            if resp.status_code != 401 or attempt:
+                return resp
+            logger.warning("superset_http.401_reauthenticating")
+            with self._auth_lock:
+                self._clear_auth()
+        return resp
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._client.close()
+
+
+class AsyncSupersetHttpSession:
+    """
+    Async counterpart of SupersetHttpSession for request handlers.
+
+    Shares one httpx.AsyncClient connection pool, so awaiting a Superset
+    call never blocks the event loop. Bound to the event loop that first
+    uses it (the application loop).
+
+    Usage:
+        session = get_async_superset_http_session()
+        resp = await session.request("POST", "/api/v1/chart/data", json=...)
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: str,
+        password: str,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        token_ttl_seconds: int = SUPERSET_TOKEN_TTL_SECONDS,
+        max_connections: int = SUPERSET_HTTP_MAX_CONNECTIONS,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self._username = username
+        self._password = password
+        self._token_ttl_seconds = token_ttl_seconds
+        self._client = httpx.AsyncClient(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._token: Optional[str] = None
+        self._csrf: Optional[str] = None
+        self._token_obtained_at: float = 0.0
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+    def _clear_auth(self) -> None:
+        self._token = None
+        self._csrf = None
+        self._token_obtained_at = 0.0
+
+    async def _ensure_auth(self) -> None:
+        """Log in unless the current token is younger than the token TTL."""
+        if self._auth_lock is None:
+            self._auth_lock = asyncio.Lock()
+        async with self._auth_lock:
+            token_age = time.time() - self._token_obtained_at
+            if self._token and token_age < self._token_ttl_seconds:
+                return
+            self._clear_auth()
+            resp = await self._client.post(
+                f"{self.base_url}/api/v1/security/login",
+                json={
+                    "username": self._username,
+                    "password": self._password,
+                    "provider": "db",
+                },
+            )
+            resp.raise_for_status()
+            token = resp.json()["access_token"]
+
+            csrf_resp = await self._client.get(
+                f"{self.base_url}/api/v1/security/csrf_token/",
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            csrf_resp.raise_for_status()
+            self._csrf = csrf_resp.json().get("result", "")
+            self._token = token
+            self._token_obtained_at = time.time()
+
+    def _auth_headers(self) -> dict[str, str]:
+        return {
+            "Authorization": f"Bearer {self._token}",
+            "X-CSRFToken": self._csrf or "",
+            "Content-Type": "application/json",
+        }
+
+    async def request(self, method: str, path: str, **kwargs: Any) -> httpx.Response:
+        """
+        Send an authenticated request; re-login and retry once on 401.
+
+        Args:
+            path: API path starting with "/api/v1/"
+        """
+        for attempt in range(2):
+            await self._ensure_auth()
+            sent_token = self._token
+            resp = await self._client.request(
+                method,
+                f"{self.base_url}{path}",
+                headers=self._auth_headers(),
+                **kwargs,
+            )
+            if resp.status_code != 401 or attempt:
+                return resp
+            logger.warning("superset_http.401_reauthenticating")
+            if self._token == sent_token:
+                # Another request may already have logged in again
+                self._clear_auth()
+        return resp
+
+    async def close(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+
+
+@dataclass
+class SupersetDataset:
+    """Superset dataset metadata as cached by the catalog."""
+
+    id: int
+    table_name: str
+    schema: str = ""
+    description: str = ""
+    changed_on: Optional[str] = None
+    # Raw Superset column dicts: column_name, type, description, verbose_name
+    columns: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def column_names(self) -> set[str]:
+        return {c["column_name"] for c in self.columns if c.get("column_name")}
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        return json.dumps(asdict(self))
+
+    @classmethod
+    def from_json(cls, data: str) -> SupersetDataset:
+        """Deserialize from JSON."""
+        return cls(**json.loads(data))
+
+
+def _column_fields(col: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "column_name": col.get("column_name", ""),
+        "type": col.get("type"),
+        "description": col.get("description"),
+        "verbose_name": col.get("verbose_name"),
+    }
+
+
+class SupersetMetadataCatalog:
+    """
+    Two-level cache of Superset dataset metadata.
+
+    Usage:
+        catalog = get_superset_metadata_catalog()
+        dataset_id = catalog.get_dataset_id("fact_orders_current")
+        dataset = catalog.get_dataset(dataset_id)
+        all_datasets = catalog.list_datasets()
+
+        # From async request handlers
+        dataset_id = await catalog.aget_dataset_id("fact_orders_current")
+        dataset = await catalog.aget_dataset(dataset_id)
+    """
+
+    ID_KEY_PREFIX = "superset_meta:dataset_id:"
+    DATASET_KEY_PREFIX = "superset_meta:dataset:"
+
+    def __init__(
+        self,
+        http: Optional[SupersetHttpSession] = None,
+        async_http: Optional[AsyncSupersetHttpSession] = None,
+        ttl_seconds: int = SUPERSET_METADATA_CACHE_TTL_SECONDS,
+        local_ttl_seconds: int = SUPERSET_METADATA_LOCAL_TTL_SECONDS,
+        enabled: bool = SUPERSET_METADATA_CACHE_ENABLED,
+    ):
+        from src.entitlements.cache import RedisClient
+
+        self._http = http
+        self._async_http = async_http
+        self._redis = RedisClient()
+        # "id:{table_name}" -> int, "dataset:{id}" -> SupersetDataset
+        self._local: TTLCache[str, Any] = TTLCache(
+            max_entries=2000,
+            ttl_seconds=min(local_ttl_seconds, ttl_seconds),
+            name="superset_metadata_local",
+        )
+        self._ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        if self.enabled:
+            self._redis.subscribe(INVALIDATION_CHANNEL, self._on_invalidation_message)
+
+    @property
+    def http(self) -> SupersetHttpSession:
+        if self._http is None:
+            self._http = get_superset_http_session()
+        return self._http
+
+    @property
+    def async_http(self) -> AsyncSupersetHttpSession:
+        if self._async_http is None:
+            self._async_http = get_async_superset_http_session()
+        return self._async_http
+
+    # ------------------------------------------------------------------
+    # Cache plumbing
+    # ------------------------------------------------------------------
+
+    def _cached_datasets(self, dataset_ids: list[int]) -> dict[int, SupersetDataset]:
+        """Cached details for many datasets: LRU first, then one MGET."""
+        found: dict[int, SupersetDataset] = {}
+        if not self.enabled:
+            return found
+
+        missing = []
+        for dataset_id in dataset_ids:
+            entry = self._local.get(f"dataset:{dataset_id}")
+            if entry is not None:
+                found[dataset_id] = entry
+            else:
+                missing.append(dataset_id)
+
+        if missing:
+            values = self._redis.mget([f"{self.DATASET_KEY_PREFIX}{i}" for i in missing])
+            for dataset_id, data in zip(missing, values):
+                if not data:
+                    continue
+                try:
+                    entry = SupersetDataset.from_json(data)
+                except Exception as e:
+                    logger.warning(f"Failed to deserialize cached Superset dataset: {e}")
+                    continue
+                self._local.set(f"dataset:{dataset_id}", entry)
+                found[dataset_id] = entry
+        return found
+
+    def _store_dataset(self, dataset: SupersetDataset) -> None:
+        if not self.enabled:
+            return
+        self._redis.set(f"{self.DATASET_KEY_PREFIX}{dataset.id}", dataset.to_json(), self._ttl_seconds)
+        self._redis.set(f"{self.ID_KEY_PREFIX}{dataset.table_name}", str(dataset.id), self._ttl_seconds)
+        self._local.set(f"dataset:{dataset.id}", dataset)
+        self._local.set(f"id:{dataset.table_name}", dataset.id)
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _cached_dataset_id(self, table_name: str) -> Optional[int]:
+        if not self.enabled:
+            return None
+        dataset_id = self._local.get(f"id:{table_name}")
+        if dataset_id is not None:
+            return dataset_id
+        data = self._redis.get(f"{self.ID_KEY_PREFIX}{table_name}")
+        if data:
+            self._local.set(f"id:{table_name}", int(data))
+            return int(data)
+        return None
+
+    def _store_dataset_id(self, table_name: str, dataset_id: int) -> None:
+        if not self.enabled:
+            return
+        self._redis.set(f"{self.ID_KEY_PREFIX}{table_name}", str(dataset_id), self._ttl_seconds)
+        self._local.set(f"id:{table_name}", dataset_id)
+
+    @staticmethod
+    def _dataset_id_params(table_name: str) -> dict[str, str]:
+        return {
+            "q": json.dumps({
+                "filters": [{"col": "table_name", "opr": "eq", "value": table_name}],
+                "columns": ["id"],
+            })
+        }
+
+    def _dataset_id_from_response(self, table_name: str, resp: httpx.Response) -> Optional[int]:
+        resp.raise_for_status()
+        results = resp.json().get("result", [])
+        if not results:
+            return None
+        dataset_id = results[0]["id"]
+        self._store_dataset_id(table_name, dataset_id)
+        return dataset_id
+
+    def _dataset_from_response(
+        self,
+        dataset_id: int,
+        resp: httpx.Response,
+        changed_on: Optional[str],
+    ) -> Optional[SupersetDataset]:
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
+        ds = resp.json().get("result", {})
+        dataset = SupersetDataset(
+            id=dataset_id,
+            table_name=ds.get("table_name", ""),
+            schema=ds.get("schema", "") or "",
+            description=ds.get("description", "") or "",
+            changed_on=changed_on or ds.get("changed_on"),
+            columns=[_column_fields(c) for c in ds.get("columns", [])],
+        )
+        self._store_dataset(dataset)
+        return dataset
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get_dataset_id(self, table_name: str) -> Optional[int]:
+        """Superset dataset id for a table name, or None if Superset has none."""
+        dataset_id = self._cached_dataset_id(table_name)
+        if dataset_id is not None:
+            return dataset_id
+        resp = self.http.request(
+            "GET", "/api/v1/dataset/", params=self._dataset_id_params(table_name),
+        )
+        return self._dataset_id_from_response(table_name, resp)
+
+    def get_dataset(self, dataset_id: int) -> Optional[SupersetDataset]:
+        """Dataset detail with columns, or None if Superset has no such dataset."""
+        cached = self._cached_datasets([dataset_id]).get(dataset_id)
+        if cached is not None:
+            return cached
+        return self._fetch_dataset(dataset_id)
+
+    def _uses_redis(self) -> bool:
+        return self.enabled and self._redis.available
+
+    async def aget_dataset_id(self, table_name: str) -> Optional[int]:
+        """
+        Async get_dataset_id(); a cache miss awaits the async session.
+
+        Redis round trips run in a worker thread so they never block the
+        event loop; LRU hits are answered inline.
+        """
+        dataset_id = self._local.get(f"id:{table_name}") if self.enabled else None
+        if dataset_id is None and self._uses_redis():
+            dataset_id = await asyncio.to_thread(self._cached_dataset_id, table_name)
+        if dataset_id is not None:
+            return dataset_id
+        resp = await self.async_http.request(
+            "GET", "/api/v1/dataset/", params=self._dataset_id_params(table_name),
+        )
+        if self._uses_redis():
+            return await asyncio.to_thread(self._dataset_id_from_response, table_name, resp)
+        return self._dataset_id_from_response(table_name, resp)
+
+    async def aget_dataset(self, dataset_id: int) -> Optional[SupersetDataset]:
+        """Async get_dataset(); Redis round trips run in a worker thread."""
+        cached = self._local.get(f"dataset:{dataset_id}") if self.enabled else None
+        if cached is None and self._uses_redis():
+            cached = (
+                await asyncio.to_thread(self._cached_datasets, [dataset_id])
+            ).get(dataset_id)
+        if cached is not None:
+            return cached
+        resp = await self.async_http.request("GET", f"/api/v1/dataset/{dataset_id}")
+        if self._uses_redis():
+            return await asyncio.to_thread(self._dataset_from_response, dataset_id, resp, None)
+        return self._dataset_from_response(dataset_id, resp, None)
+
+    def _fetch_dataset(
+        self,
+        dataset_id: int,
+        changed_on: Optional[str] = None,
+    ) -> Optional[SupersetDataset]:
+        """
+        Fetch and cache one dataset's detail.
+
+        Args:
+            changed_on: Timestamp from the dataset list, stored so the next
+                listing can tell whether the dataset changed
+        """
+        resp = self.http.request("GET", f"/api/v1/dataset/{dataset_id}")
+        return self._dataset_from_response(dataset_id, resp, changed_on)
+
+    def _fetch_datasets(
+        self,
+        changed: list[tuple[int, Optional[str]]],
+    ) -> dict[int, Optional[SupersetDataset]]:
+        """
+        Fetch and cache several datasets' details at once.
+
+        Superset has no bulk detail endpoint, so the requests are sent
+        concurrently over the pooled session; responses are parsed and
+        cached on the calling thread.
+
+        Args:
+            changed: (dataset id, changed_on from the dataset list) pairs
+        """
+        if not changed:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(len(changed), SUPERSET_HTTP_MAX_CONNECTIONS),
+            thread_name_prefix="superset-meta",
+        ) as pool:
+            responses = list(pool.map(
+                lambda item: self.http.request("GET", f"/api/v1/dataset/{item[0]}"),
+                changed,
+            ))
+        return {
+            dataset_id: self._dataset_from_response(dataset_id, resp, changed_on)
+            for (dataset_id, changed_on), resp in zip(changed, responses)
+        }
+
+    def list_datasets(self) -> list[SupersetDataset]:
+        """
+        All datasets with columns.
+
+        Lists datasets page by page with their changed_on timestamps and
+        fetches details, concurrently per page, only for datasets that are
+        not cached or whose timestamp changed since they were cached.
+        """
+        datasets: list[SupersetDataset] = []
+        fetched = 0
+        page = 0
+        while page < MAX_PAGINATION_PAGES:
+            resp = self.http.request(
+                "GET",
+                "/api/v1/dataset/",
+                params={
+                    "q": json.dumps({
+                        "page": page,
+                        "page_size": LIST_PAGE_SIZE,
+                        "columns": [
+                            "id", "table_name", "schema",
+                            "description", "changed_on_utc",
+                        ],
+                    })
+                },
+            )
+            resp.raise_for_status()
+            result = resp.json().get("result", [])
+            if not result:
+                break
+
+            cached = self._cached_datasets([ds["id"] for ds in result])
+            changed = [
+                (ds["id"], ds.get("changed_on_utc")) for ds in result
+                if ds["id"] not in cached
+                or cached[ds["id"]].changed_on != ds.get("changed_on_utc")
+            ]
+            cached.update(self._fetch_datasets(changed))
+            fetched += len(changed)
+            datasets.extend(
+                cached[ds["id"]] for ds in result if cached.get(ds["id"]) is not None
+            )
+
+            if len(result) < LIST_PAGE_SIZE:
+                break
+            page += 1
+
+        logger.info(
+            "superset_metadata.listed",
+            extra={"datasets": len(datasets), "details_fetched": fetched},
+        )
+        return datasets
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def invalidate(
+        self,
+        table_names: Iterable[str] = (),
+        dataset_ids: Iterable[int] = (),
+        reason: Optional[str] = None,
+    ) -> None:
+        """
+        Drop cached metadata for datasets by table name and/or id.
+
+        Args:
+            table_names: Dataset table names (their id mapping is dropped too)
+            dataset_ids: Dataset ids
+            reason: Optional reason for logging
+        """
+        table_names = {n for n in table_names if n}
+        dataset_ids = {int(i) for i in dataset_ids if i is not None}
+        if not table_names and not dataset_ids:
+            return
+
+        for name in table_names:
+            dataset_id = self._local.get(f"id:{name}") or self._redis.get(
+                f"{self.ID_KEY_PREFIX}{name}"
+            )
+            if dataset_id:
+                dataset_ids.add(int(dataset_id))
+
+        if self._redis.available:
+            keys = [f"{self.ID_KEY_PREFIX}{n}" for n in table_names]
+            keys += [f"{self.DATASET_KEY_PREFIX}{i}" for i in dataset_ids]
+            self._redis.delete(*keys)
+            self._redis.publish(
+                INVALIDATION_CHANNEL,
+                json.dumps({
+                    "table_names": sorted(table_names),
+                    "dataset_ids": sorted(dataset_ids),
+                }),
+            )
+
+        self._evict_local(table_names, dataset_ids)
+
+        logger.info(
+            "Invalidated Superset metadata cache",
+            extra={
+                "table_names": sorted(table_names),
+                "dataset_ids": sorted(dataset_ids),
+                "reason": reason,
+            },
+        )
+
+    def _evict_local(self, table_names: set[str], dataset_ids: set[int]) -> None:
+        for name in table_names:
+            self._local.delete(f"id:{name}")
+        for dataset_id in dataset_ids:
+            self._local.delete(f"dataset:{dataset_id}")
+        if table_names:
+            self._local.delete_where(
+                lambda key, entry: isinstance(entry, SupersetDataset)
+                and entry.table_name in table_names
+            )
+
+    def _on_invalidation_message(self, message: dict) -> None:
+        """Evict the LRU front when another instance invalidates."""
+        try:
+            payload = json.loads(message["data"])
+            self._evict_local(
+                set(payload.get("table_names", [])),
+                {int(i) for i in payload.get("dataset_ids", [])},
+            )
+        except Exception as e:
+            logger.warning(f"Bad Superset metadata invalidation message: {e}")
+
+    def clear(self) -> None:
+        """Clear the in-process LRU (Redis entries expire via TTL)."""
+        self._local.clear()
+
+
+# Module-level singletons
+_catalog_instance: Optional[SupersetMetadataCatalog] = None
+_http_sessions: dict[tuple[str, str], SupersetHttpSession] = {}
+_async_http_sessions: dict[tuple[str, str], AsyncSupersetHttpSession] = {}
+_lock = Lock()
+
+
+def _session_settings(
+    superset_url: Optional[str],
+    username: Optional[str],
+    password: Optional[str],
+) -> tuple[str, str, str]:
+    return (
+        (superset_url or os.getenv("SUPERSET_EMBED_URL", "")).rstrip("/"),
+        username or os.getenv("SUPERSET_USERNAME", "admin"),
+        password or os.getenv("SUPERSET_PASSWORD", "admin"),
+    )
+
+
+def get_superset_http_session(
+    superset_url: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+) -> SupersetHttpSession:
+    """
+    Shared HTTP session for a Superset URL and user.
+
+    Defaults to SUPERSET_EMBED_URL / SUPERSET_USERNAME / SUPERSET_PASSWORD.
+    """
+    url, user, pw = _session_settings(superset_url, username, password)
+    session = _http_sessions.get((url, user))
+    if session is None:
+        with _lock:
+            session = _http_sessions.get((url, user))
+            if session is None:
+                session = _http_sessions[(url, user)] = SupersetHttpSession(url, user, pw)
+    return session
+
+
+def get_async_superset_http_session(
+    superset_url: Optional[str] = None,
+    username: Optional[str] = None,
+    password: Optional[str] = None,
+) -> AsyncSupersetHttpSession:
+    """Shared async HTTP session for a Superset URL and user (same defaults)."""
+    url, user, pw = _session_settings(superset_url, username, password)
+    session = _async_http_sessions.get((url, user))
+    if session is None:
+        with _lock:
+            session = _async_http_sessions.get((url, user))
+            if session is None:
+                session = _async_http_sessions[(url, user)] = AsyncSupersetHttpSession(
+                    url, user, pw,
+                )
+    return session
+
+
+def get_superset_metadata_catalog() -> SupersetMetadataCatalog:
+    """Get the singleton SupersetMetadataCatalog (default Superset session)."""
+    global _catalog_instance
+    if _catalog_instance is None:
+        with _lock:
+            if _catalog_instance is None:
+                _catalog_instance = SupersetMetadataCatalog()
+    return _catalog_instance
+
+
+def invalidate_superset_metadata(
+    table_names: Iterable[str] = (),
+    dataset_ids: Iterable[int] = (),
+    reason: Optional[str] = None,
+) -> None:
+    """
+    Drop cached Superset metadata for datasets on every instance.
+
+    Call after a dataset's columns or identity change in Superset.
+    Failures are logged, never raised: entries still expire via TTL.
+    """
+    try:
+        get_superset_metadata_catalog().invalidate(table_names, dataset_ids, reason=reason)
+    except Exception as e:
+        logger.warning(f"Superset metadata invalidation failed: {e}")
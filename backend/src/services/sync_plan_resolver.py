@@ -16,7 +16,7 @@ SECURITY: tenant_id MUST come from JWT (org_id), never from client input.
 
 import logging
 from datetime import datetime, timezone, timedelta
-from typing import Optional
+from typing import Iterable, Optional
 
 from sqlalchemy import select
 from sqlalchemy.orm import Session
@@ -47,6 +47,40 @@ _PLAN_NAME_TO_TIER: dict[str, int] = {
     "enterprise": 3,
 }
 
+# Tenants per IN (...) clause when resolving tiers in bulk.
+TIER_LOOKUP_BATCH_SIZE = 1000
+
+
+def _tier_for_plan_name(plan_name: Optional[str]) -> Optional[int]:
+    """Map a plan name to its tier, or None if the name is unrecognized."""
+    return _PLAN_NAME_TO_TIER.get((plan_name or "").lower().strip())
+
+
+def is_due_for_interval(
+    last_sync_at: Optional[datetime],
+    interval_minutes: int,
+    now: Optional[datetime] = None,
+) -> bool:
+    """
+    Check whether a sync is due given an already-resolved interval.
+
+    Naive timestamps (as returned by SQLite) are treated as UTC.
+
+    Args:
+        last_sync_at: Timestamp of last successful sync (None = never synced)
+        interval_minutes: Minimum minutes between syncs
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        True if connection should be synced
+    """
+    if last_sync_at is None:
+        return True
+    if last_sync_at.tzinfo is None:
+        last_sync_at = last_sync_at.replace(tzinfo=timezone.utc)
+    now = now or datetime.now(timezone.utc)
+    return now >= last_sync_at + timedelta(minutes=interval_minutes)
+
 
 class SyncPlanResolver:
     """
@@ -108,10 +142,70 @@ class SyncPlanResolver:
             return True
 
         interval_minutes = self.get_sync_interval_minutes(tenant_id)
-        threshold = last_sync_at + timedelta(minutes=interval_minutes)
-        now = datetime.now(timezone.utc)
+        return is_due_for_interval(last_sync_at, interval_minutes)
+
+    def get_sync_intervals(self, tenant_ids: Iterable[str]) -> dict[str, int]:
+        """
+        Resolve sync intervals for many tenants at once.
+
+        Set-based counterpart of get_sync_interval_minutes() used by the
+        batched scheduler; see resolve_plan_tiers().
 
-        return now >= threshold
+        Args:
+            tenant_ids: Tenant IDs (trusted, from the database)
+
+        Returns:
+            Mapping of tenant_id to minimum sync interval in minutes
+        """
+        return {
+            tenant_id: SYNC_INTERVAL_BY_TIER.get(tier, DEFAULT_SYNC_INTERVAL_MINUTES)
+            for tenant_id, tier in self.resolve_plan_tiers(tenant_ids).items()
+        }
+
+    def resolve_plan_tiers(self, tenant_ids: Iterable[str]) -> dict[str, int]:
+        """
+        Look up plan tiers for many tenants with one query per batch.
+
+        Applies the same rules as _resolve_plan_tier(): the most recent
+        active subscription wins, and tenants without one (or with an
+        unknown plan name) fall back to tier 0 (Free).
+
+        Args:
+            tenant_ids: Tenant IDs (trusted, from the database)
+
+        Returns:
+            Mapping of every requested tenant_id to its plan tier
+        """
+        unique_ids = list(dict.fromkeys(tenant_ids))
+        tiers: dict[str, int] = {}
+
+        for start in range(0, len(unique_ids), TIER_LOOKUP_BATCH_SIZE):
+            batch = unique_ids[start:start + TIER_LOOKUP_BATCH_SIZE]
+            stmt = (
+                select(Subscription.tenant_id, Plan.name)
+                .join(Plan, Subscription.plan_id == Plan.id)
+                .where(
+                    Subscription.tenant_id.in_(batch),
+                    Subscription.status == SubscriptionStatus.ACTIVE.value,
+                )
+                .order_by(Subscription.tenant_id, Subscription.created_at.desc())
+            )
+            for tenant_id, plan_name in self.db.execute(stmt):
+                if tenant_id in tiers:
+                    continue  # older subscription for an already-resolved tenant
+                tier = _tier_for_plan_name(plan_name)
+                if tier is None:
+                    logger.warning(
+                        "Unknown plan name, defaulting to free tier",
+                        extra={"tenant_id": tenant_id, "plan_name": plan_name},
+                    )
+                    tier = 0
+                tiers[tenant_id] = tier
+
+        for tenant_id in unique_ids:
+            tiers.setdefault(tenant_id, 0)
+
+        return tiers
 
     def _resolve_plan_tier(self, tenant_id: str) -> int:
         """
@@ -149,8 +243,7 @@ class SyncPlanResolver:
             return 0
 
         # Derive tier from plan name
-        plan_name = (plan.name or "").lower().strip()
-        tier = _PLAN_NAME_TO_TIER.get(plan_name)
+        tier = _tier_for_plan_name(plan.name)
 
         if tier is not None:
             return tier
@@ -0,0 +1,120 @@
+"""
+Tenant groups for agency RLS in embedded analytics.
+
+Agency embed tokens reference a tenant group instead of listing every
+allowed tenant. The group id is a hash of the sorted tenant ids, so:
+
+- the same tenant set always maps to the same group (and the same
+  Superset RLS clause and cache key), whoever the user is
+- a group's membership is immutable; when an agency gains or loses a
+  store its users get a new group id, so no cached result computed for
+  the old set is ever served for the new one
+
+Groups are persisted once (INSERT ... ON CONFLICT DO NOTHING) and
+remembered per process, so issuing a token for a known group costs no
+database round-trip.
+
+Environment variables:
+    TENANT_GROUP_MIN_TENANTS: Use a group when a user may see at least
+        this many tenants (default 2)
+"""
+
+import hashlib
+import logging
+import os
+from typing import Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.models.tenant_group import TenantGroup, TenantGroupMember
+from src.platform.ttl_cache import TTLCache
+from src.services.bulk_insert import insert_ignoring_duplicates
+
+logger = logging.getLogger(__name__)
+
+TENANT_GROUP_MIN_TENANTS = int(os.getenv("TENANT_GROUP_MIN_TENANTS", "2"))
+
+TENANT_GROUP_ID_PREFIX = "tg_"
+
+# Group ids already persisted by this process
+_known_groups: TTLCache[str, bool] = TTLCache(
+    max_entries=10000, ttl_seconds=86400, name="tenant_groups",
+)
+
+
+def tenant_group_id(tenant_ids: Iterable[str]) -> str:
+    """Stable group id for a set of tenant ids (order and duplicates ignored)."""
+    members = "\n".join(sorted(set(tenant_ids)))
+    return TENANT_GROUP_ID_PREFIX + hashlib.sha256(members.encode()).hexdigest()[:32]
+
+
+def is_tenant_group_id(value: Optional[str]) -> bool:
+    """True if value is a well-formed tenant group id (safe to render into SQL)."""
+    if not isinstance(value, str) or not value.startswith(TENANT_GROUP_ID_PREFIX):
+        return False
+    digest = value[len(TENANT_GROUP_ID_PREFIX):]
+    return len(digest) == 32 and all(c in "0123456789abcdef" for c in digest)
+
+
+def tenant_group_rls_clause(group_id: str) -> str:
+    """RLS clause restricting rows to the members of a tenant group."""
+    if not is_tenant_group_id(group_id):
+        raise ValueError(f"Invalid tenant group id: {group_id!r}")
+    return f"tenant_id = ANY(group_members('{group_id}'))"
+
+
+def is_known_tenant_group(group_id: str) -> bool:
+    """True if this process already persisted the group."""
+    return bool(_known_groups.get(group_id))
+
+
+def ensure_tenant_group(db: Session, tenant_ids: Iterable[str]) -> str:
+    """
+    Persist the group for a tenant set if needed and return its id.
+
+    Args:
+        db: Database session; committed here when a new group is stored
+
+    Returns:
+        The tenant group id
+    """
+    members = sorted(set(tenant_ids))
+    if not members:
+        raise ValueError("A tenant group needs at least one tenant")
+    group_id = tenant_group_id(members)
+    if _known_groups.get(group_id):
+        return group_id
+
+    exists = db.execute(
+        select(TenantGroup.group_id).where(TenantGroup.group_id == group_id)
+    ).first()
+    if exists is None:
+        insert_ignoring_duplicates(
+            db, TenantGroup,
+            [{"group_id": group_id, "member_count": len(members)}],
+            conflict_columns=["group_id"],
+        )
+        insert_ignoring_duplicates(
+            db, TenantGroupMember,
+            [{"group_id": group_id, "tenant_id": t} for t in members],
+            conflict_columns=["group_id", "tenant_id"],
+        )
+        db.commit()
+        logger.info(
+            "Created tenant group",
+            extra={"tenant_group_id": group_id, "member_count": len(members)},
+        )
+
+    _known_groups.set(group_id, True)
+    return group_id
+
+
+def get_tenant_group_members(db: Session, group_id: str) -> list[str]:
+    """Tenant ids of a group (empty for unknown groups)."""
+    rows = db.execute(
+        select(TenantGroupMember.tenant_id)
+        .where(TenantGroupMember.group_id == group_id)
+        .order_by(TenantGroupMember.tenant_id)
+    )
+    return [tenant_id for (tenant_id,) in rows]
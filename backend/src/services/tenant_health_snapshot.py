@@ -0,0 +1,636 @@
+"""
+Precomputed per-tenant data health snapshot.
+
+MerchantDataHealthService.evaluate() (availability for every source plus the
+DQ sync health summary) used to run inside the health guards on every
+guarded request. The result only changes when:
+
+- a sync completes or fails
+- a DQ incident opens or resolves
+- time passes a source's SLA warn/error threshold
+
+so it is materialized once per tenant (tenant_health_snapshots) and read
+through a two-level cache:
+
+- In-process TTL front (short TTL) absorbs bursts on one instance
+- Redis behind it is shared by all API instances
+
+Writers call mark_tenant_health_dirty(session, tenant_id, trigger); the
+snapshot is recomputed once per tenant after that session commits. Each
+snapshot carries refresh_due_at (the next threshold crossing, capped at
+HEALTH_SNAPSHOT_MAX_AGE_SECONDS) and the sweep job recomputes rows once it
+passes. A reader that finds a due or missing snapshot recomputes it inline,
+so a lagging sweep costs latency, never correctness.
+
+Recomputes run in their own session bound to the caller's engine and
+commit independently, so request sessions are never committed by a guard.
+
+Key schema (Redis):
+- health_snapshot:{tenant_id} -> JSON (HealthSnapshot.to_json)
+
+Environment variables:
+    HEALTH_SNAPSHOT_CACHE_TTL_SECONDS: Redis entry TTL (default 300)
+    HEALTH_SNAPSHOT_LOCAL_TTL_SECONDS: In-process entry TTL (default 5)
+    HEALTH_SNAPSHOT_MAX_AGE_SECONDS: Upper bound between recomputes (default 900)
+    HEALTH_SNAPSHOT_SWEEP_BATCH_SIZE: Tenants recomputed per sweep pass (default 200)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+from typing import Iterable, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from src.models.data_availability import AvailabilityReason, AvailabilityState
+from src.models.merchant_data_health import (
+    FEATURE_FLAGS,
+    MerchantHealthState,
+    get_merchant_message,
+)
+from src.models.tenant_health_snapshot import TenantHealthSnapshot
+from src.platform.ttl_cache import TTLCache
+from src.services.data_availability_service import (
+    DataAvailabilityResult,
+    get_sla_thresholds,
+)
+from src.services.merchant_data_health import (
+    MerchantDataHealthResult,
+    MerchantDataHealthService,
+)
+
+logger = logging.getLogger(__name__)
+
+HEALTH_SNAPSHOT_CACHE_TTL_SECONDS = int(
+    os.getenv("HEALTH_SNAPSHOT_CACHE_TTL_SECONDS", "300")
+)
+HEALTH_SNAPSHOT_LOCAL_TTL_SECONDS = int(
+    os.getenv("HEALTH_SNAPSHOT_LOCAL_TTL_SECONDS", "5")
+)
+HEALTH_SNAPSHOT_MAX_AGE_SECONDS = int(
+    os.getenv("HEALTH_SNAPSHOT_MAX_AGE_SECONDS", "900")
+)
+HEALTH_SNAPSHOT_SWEEP_BATCH_SIZE = int(
+    os.getenv("HEALTH_SNAPSHOT_SWEEP_BATCH_SIZE", "200")
+)
+
+UPDATES_CHANNEL = "health_snapshot:updates"
+
+# session.info key holding tenants to recompute after commit
+_PENDING_INFO_KEY = "health_snapshot_pending_tenants"
+
+
+class HealthSnapshotTrigger:
+    """Reasons recorded on a snapshot recompute."""
+    SYNC_COMPLETED = "sync_completed"
+    SYNC_FAILED = "sync_failed"
+    DQ_INCIDENT_OPENED = "dq_incident_opened"
+    DQ_INCIDENT_RESOLVED = "dq_incident_resolved"
+    SWEEP = "sweep"
+    READ = "read"
+
+
+def _as_utc(ts: datetime) -> datetime:
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class HealthSnapshot:
+    """Cached view of one tenant's health (mirrors a TenantHealthSnapshot row)."""
+
+    tenant_id: str
+    merchant_state: str
+    availability_state: str
+    quality_state: str
+    billing_tier: str
+    computed_at: datetime
+    refresh_due_at: datetime
+    sources: List[dict] = field(default_factory=list)
+    trigger: Optional[str] = None
+
+    def is_due(self, now: Optional[datetime] = None) -> bool:
+        """True once time alone may have changed the state."""
+        now = now or datetime.now(timezone.utc)
+        return self.refresh_due_at <= now
+
+    def merchant_result(self) -> MerchantDataHealthResult:
+        """The snapshot as a MerchantDataHealthService result."""
+        state = MerchantHealthState(self.merchant_state)
+        flags = FEATURE_FLAGS[state]
+        return MerchantDataHealthResult(
+            state=state,
+            message=get_merchant_message(state),
+            ai_insights_enabled=flags["ai_insights_enabled"],
+            dashboards_enabled=flags["dashboards_enabled"],
+            exports_enabled=flags["exports_enabled"],
+            evaluated_at=self.computed_at,
+            availability_state=self.availability_state,
+            quality_state=self.quality_state,
+            sources=[DataAvailabilityResult.from_dict(s) for s in self.sources],
+        )
+
+    def availability_results(
+        self,
+        source_types: Optional[Iterable[str]] = None,
+    ) -> List[DataAvailabilityResult]:
+        """
+        Per-source availability, optionally limited to source_types.
+
+        A requested source the tenant has no connection for is reported
+        UNAVAILABLE / never_synced, as DataAvailabilityService would.
+        """
+        by_source = {
+            s["source_type"]: DataAvailabilityResult.from_dict(s)
+            for s in self.sources
+        }
+        if source_types is None:
+            return list(by_source.values())
+
+        results = []
+        for source_type in source_types:
+            result = by_source.get(source_type)
+            if result is None:
+                warn, error = get_sla_thresholds(source_type, self.billing_tier)
+                result = DataAvailabilityResult(
+                    tenant_id=self.tenant_id,
+                    source_type=source_type,
+                    state=AvailabilityState.UNAVAILABLE.value,
+                    reason=AvailabilityReason.NEVER_SYNCED.value,
+                    warn_threshold_minutes=warn,
+                    error_threshold_minutes=error,
+                    last_sync_at=None,
+                    last_sync_status=None,
+                    minutes_since_sync=None,
+                    state_changed_at=self.computed_at,
+                    previous_state=None,
+                    evaluated_at=self.computed_at,
+                    billing_tier=self.billing_tier,
+                )
+            results.append(result)
+        return results
+
+    def to_json(self) -> str:
+        """Serialize to JSON."""
+        data = asdict(self)
+        data["computed_at"] = self.computed_at.isoformat()
+        data["refresh_due_at"] = self.refresh_due_at.isoformat()
+        return json.dumps(data)
+
+    @classmethod
+    def from_json(cls, data: str) -> HealthSnapshot:
+        """Deserialize from JSON."""
+        payload = json.loads(data)
+        payload["computed_at"] = datetime.fromisoformat(payload["computed_at"])
+        payload["refresh_due_at"] = datetime.fromisoformat(payload["refresh_due_at"])
+        return cls(**payload)
+
+    @classmethod
+    def from_row(cls, row: TenantHealthSnapshot) -> HealthSnapshot:
+        """Build from a TenantHealthSnapshot row."""
+        return cls(
+            tenant_id=row.tenant_id,
+            merchant_state=row.merchant_state,
+            availability_state=row.availability_state,
+            quality_state=row.quality_state,
+            billing_tier=row.billing_tier,
+            computed_at=_as_utc(row.computed_at),
+            refresh_due_at=_as_utc(row.refresh_due_at),
+            sources=list(row.sources or []),
+            trigger=row.trigger,
+        )
+
+
+def next_refresh_due(
+    sources: Iterable[DataAvailabilityResult],
+    computed_at: datetime,
+    max_age_seconds: int = HEALTH_SNAPSHOT_MAX_AGE_SECONDS,
+) -> datetime:
+    """
+    Earliest time a source crosses its next SLA threshold without a new sync.
+
+    FRESH sources turn STALE at last_sync_at + warn; STALE sources turn
+    UNAVAILABLE at last_sync_at + error. Capped at computed_at + max_age so
+    time-based DQ freshness and backfill state are picked up too.
+    """
+    due = computed_at + timedelta(seconds=max_age_seconds)
+    # Never due immediately, so a sweep pass cannot re-select what it just did
+    earliest = computed_at + timedelta(minutes=1)
+    for source in sources:
+        if source.last_sync_at is None:
+            continue
+        last_sync_at = _as_utc(source.last_sync_at)
+        if source.state == AvailabilityState.FRESH.value:
+            crossing = last_sync_at + timedelta(minutes=source.warn_threshold_minutes)
+        elif source.state == AvailabilityState.STALE.value:
+            crossing = last_sync_at + timedelta(minutes=source.error_threshold_minutes)
+        else:
+            continue
+        due = min(due, max(crossing, earliest))
+    return due
+
+
+class HealthSnapshotCache:
+    """
+    Two-level cache of HealthSnapshot by tenant.
+
+    Usage:
+        cache = get_health_snapshot_cache()
+        snapshot = cache.get(tenant_id)
+        if snapshot is None:
+            ...  # load or recompute
+            cache.set(snapshot)
+    """
+
+    KEY_PREFIX = "health_snapshot:"
+
+    def __init__(
+        self,
+        ttl_seconds: int = HEALTH_SNAPSHOT_CACHE_TTL_SECONDS,
+        local_ttl_seconds: int = HEALTH_SNAPSHOT_LOCAL_TTL_SECONDS,
+    ):
+        from src.entitlements.cache import RedisClient
+
+        self._redis = RedisClient()
+        self._local: TTLCache[str, HealthSnapshot] = TTLCache(
+            max_entries=10000,
+            ttl_seconds=local_ttl_seconds,
+            name="health_snapshot_local",
+        )
+        self._ttl_seconds = ttl_seconds
+        self._redis.subscribe(UPDATES_CHANNEL, self._on_update_message)
+
+    def _key(self, tenant_id: str) -> str:
+        return f"{self.KEY_PREFIX}{tenant_id}"
+
+    def get(self, tenant_id: str) -> Optional[HealthSnapshot]:
+        """Get the cached snapshot, or None on miss."""
+        snapshot = self._local.get(tenant_id)
+        if snapshot is not None:
+            return snapshot
+
+        data = self._redis.get(self._key(tenant_id))
+        if not data:
+            return None
+        try:
+            snapshot = HealthSnapshot.from_json(data)
+        except Exception as e:
+            logger.warning(f"Failed to deserialize cached health snapshot: {e}")
+            return None
+
+        self._local.set(tenant_id, snapshot)
+        return snapshot
+
+    def set(self, snapshot: HealthSnapshot, publish: bool = False) -> None:
+        """
+        Cache a snapshot.
+
+        Args:
+            snapshot: Snapshot to cache
+            publish: Evict other instances' in-process entries (use when
+                the snapshot replaces a persisted one)
+        """
+        if self._redis.available:
+            self._redis.set(self._key(snapshot.tenant_id), snapshot.to_json(), self._ttl_seconds)
+            if publish:
+                self._redis.publish(UPDATES_CHANNEL, snapshot.tenant_id)
+        self._local.set(snapshot.tenant_id, snapshot)
+
+    def invalidate(self, tenant_id: str) -> None:
+        """Drop a tenant's snapshot from both levels."""
+        self._redis.delete(self._key(tenant_id))
+        self._local.delete(tenant_id)
+
+    def _on_update_message(self, message: dict) -> None:
+        """Evict the in-process entry when another instance recomputes."""
+        tenant_id = message.get("data")
+        if isinstance(tenant_id, bytes):
+            tenant_id = tenant_id.decode()
+        if tenant_id:
+            self._local.delete(tenant_id)
+
+    def clear(self) -> None:
+        """Clear the in-process front (Redis entries expire via TTL)."""
+        self._local.clear()
+
+
+# Module-level singleton
+_cache_instance: Optional[HealthSnapshotCache] = None
+_cache_lock = Lock()
+
+
+def get_health_snapshot_cache() -> HealthSnapshotCache:
+    """Get the singleton HealthSnapshotCache instance."""
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_lock:
+            if _cache_instance is None:
+                _cache_instance = HealthSnapshotCache()
+    return _cache_instance
+
+
+class TenantHealthSnapshotService:
+    """
+    Reads and recomputes tenant health snapshots.
+
+    SECURITY: tenant_id must originate from JWT (org_id) or a trusted
+    background job.
+
+    Usage:
+        service = TenantHealthSnapshotService(db_session)
+        snapshot = service.get(tenant_id, billing_tier="growth")
+        if snapshot.merchant_state != "healthy":
+            ...
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        cache: Optional[HealthSnapshotCache] = None,
+    ):
+        self.db = db_session
+        self.cache = cache or get_health_snapshot_cache()
+
+    # ── Reads ────────────────────────────────────────────────────────────
+
+    def get(
+        self,
+        tenant_id: str,
+        billing_tier: Optional[str] = None,
+    ) -> HealthSnapshot:
+        """
+        Return the tenant's current snapshot.
+
+        Cache, then the snapshot row; recomputes (in its own session) when
+        the snapshot is missing, due, or was evaluated for another tier.
+        """
+        if not tenant_id:
+            raise ValueError("tenant_id is required")
+
+        snapshot = self.cache.get(tenant_id)
+        if snapshot is None:
+            row = self._get_row(self.db, tenant_id)
+            if row is not None:
+                snapshot = HealthSnapshot.from_row(row)
+                self.cache.set(snapshot)
+
+        if (
+            snapshot is None
+            or snapshot.is_due()
+            or (billing_tier and snapshot.billing_tier != billing_tier)
+        ):
+            snapshot = self._refresh_isolated(
+                tenant_id, billing_tier, HealthSnapshotTrigger.READ,
+            )
+        return snapshot
+
+    # ── Recompute ────────────────────────────────────────────────────────
+
+    def refresh(
+        self,
+        tenant_id: str,
+        billing_tier: Optional[str] = None,
+        trigger: Optional[str] = None,
+    ) -> HealthSnapshot:
+        """
+        Recompute and persist the snapshot on this session, then commit.
+
+        Use from background jobs that own their session; request paths go
+        through get() or mark_tenant_health_dirty().
+        """
+        row = self._get_row(self.db, tenant_id)
+        tier = billing_tier or (row.billing_tier if row else None) or self._lookup_tier(tenant_id)
+
+        result = MerchantDataHealthService(
+            db_session=self.db,
+            tenant_id=tenant_id,
+            billing_tier=tier,
+        ).evaluate()
+
+        computed_at = result.evaluated_at
+        snapshot = HealthSnapshot(
+            tenant_id=tenant_id,
+            merchant_state=result.state.value,
+            availability_state=result.availability_state or AvailabilityState.FRESH.value,
+            quality_state=result.quality_state or "pass",
+            billing_tier=tier,
+            computed_at=computed_at,
+            refresh_due_at=next_refresh_due(result.sources, computed_at),
+            sources=[s.to_dict() for s in result.sources],
+            trigger=trigger,
+        )
+
+        # evaluate() may commit (availability audit events), so reload
+        row = self._get_row(self.db, tenant_id)
+        if row is None:
+            row = TenantHealthSnapshot(tenant_id=tenant_id)
+            self.db.add(row)
+        previous_state = row.merchant_state
+        row.merchant_state = snapshot.merchant_state
+        row.availability_state = snapshot.availability_state
+        row.quality_state = snapshot.quality_state
+        row.sources = snapshot.sources
+        row.billing_tier = snapshot.billing_tier
+        row.trigger = trigger
+        row.computed_at = snapshot.computed_at
+        row.refresh_due_at = snapshot.refresh_due_at
+        self.db.commit()
+
+        self.cache.set(snapshot, publish=True)
+
+        if previous_state != snapshot.merchant_state:
+            logger.info(
+                "Tenant health snapshot state changed",
+                extra={
+                    "tenant_id": tenant_id,
+                    "previous_state": previous_state,
+                    "merchant_state": snapshot.merchant_state,
+                    "trigger": trigger,
+                },
+            )
+        return snapshot
+
+    def sweep(
+        self,
+        now: Optional[datetime] = None,
+        limit: int = HEALTH_SNAPSHOT_SWEEP_BATCH_SIZE,
+    ) -> int:
+        """
+        Recompute snapshots whose refresh_due_at has passed.
+
+        Also seeds snapshots for tenants with enabled connections that do
+        not have one yet. Returns the number of tenants recomputed.
+        """
+        now = now or datetime.now(timezone.utc)
+        tenant_ids = list(
+            self.db.execute(
+                select(TenantHealthSnapshot.tenant_id)
+                .where(TenantHealthSnapshot.refresh_due_at <= now)
+                .order_by(TenantHealthSnapshot.refresh_due_at)
+                .limit(limit)
+            ).scalars()
+        )
+        if len(tenant_ids) < limit:
+            tenant_ids += self._tenants_without_snapshot(limit - len(tenant_ids))
+
+        refreshed = 0
+        for tenant_id in tenant_ids:
+            try:
+                self.refresh(tenant_id, trigger=HealthSnapshotTrigger.SWEEP)
+                refreshed += 1
+            except Exception:
+                self.db.rollback()
+                logger.warning(
+                    "Tenant health snapshot sweep failed for tenant",
+                    extra={"tenant_id": tenant_id},
+                    exc_info=True,
+                )
+        return refreshed
+
+    # ── Internal helpers ─────────────────────────────────────────────────
+
+    def _refresh_isolated(
+        self,
+        tenant_id: str,
+        billing_tier: Optional[str],
+        trigger: str,
+    ) -> HealthSnapshot:
+        """refresh() in a separate session so the caller's is never committed."""
+        with Session(bind=self.db.get_bind()) as session:
+            return TenantHealthSnapshotService(session, self.cache).refresh(
+                tenant_id, billing_tier, trigger,
+            )
+
+    @staticmethod
+    def _get_row(db: Session, tenant_id: str) -> Optional[TenantHealthSnapshot]:
+        return db.execute(
+            select(TenantHealthSnapshot).where(TenantHealthSnapshot.tenant_id == tenant_id)
+        ).scalars().first()
+
+    def _lookup_tier(self, tenant_id: str) -> str:
+        try:
+            from src.services.billing_entitlements import BillingEntitlementsService
+
+            return BillingEntitlementsService(self.db, tenant_id).get_billing_tier()
+        except Exception:
+            logger.warning(
+                "Billing tier lookup failed for health snapshot, using free",
+                extra={"tenant_id": tenant_id},
+                exc_info=True,
+            )
+            return "free"
+
+    def _tenants_without_snapshot(self, limit: int) -> List[str]:
+        from src.models.airbyte_connection import TenantAirbyteConnection
+
+        stmt = (
+            select(TenantAirbyteConnection.tenant_id)
+            .where(TenantAirbyteConnection.is_enabled.is_(True))
+            .where(
+                ~select(TenantHealthSnapshot.id)
+                .where(TenantHealthSnapshot.tenant_id == TenantAirbyteConnection.tenant_id)
+                .exists()
+            )
+            .distinct()
+            .limit(limit)
+        )
+        return list(self.db.execute(stmt).scalars())
+
+
+def snapshot_availability_results(
+    db_session: Session,
+    tenant_id: str,
+    billing_tier: str = "free",
+    source_types: Optional[List[str]] = None,
+) -> List[DataAvailabilityResult]:
+    """
+    Per-source availability for guards, read from the health snapshot.
+
+    Falls back to DataAvailabilityService if the snapshot cannot be read
+    (e.g. Redis and the snapshot table both unreachable).
+    """
+    try:
+        snapshot = TenantHealthSnapshotService(db_session).get(
+            tenant_id, billing_tier=billing_tier,
+        )
+        return snapshot.availability_results(source_types)
+    except Exception:
+        logger.warning(
+            "Tenant health snapshot unavailable; evaluating directly",
+            extra={"tenant_id": tenant_id},
+            exc_info=True,
+        )
+
+    from src.services.data_availability_service import DataAvailabilityService
+
+    service = DataAvailabilityService(
+        db_session=db_session,
+        tenant_id=tenant_id,
+        billing_tier=billing_tier,
+    )
+    if source_types:
+        return [service.get_data_availability(st) for st in source_types]
+    return service.evaluate_all()
+
+
+def mark_tenant_health_dirty(
+    session: Optional[Session],
+    tenant_id: Optional[str],
+    trigger: str,
+) -> None:
+    """
+    Recompute a tenant's health snapshot once session commits.
+
+    Call from code paths that change sync state or DQ incidents. Multiple
+    calls in one transaction recompute each tenant once; a rollback drops
+    them. Without an open transaction the snapshot is recomputed now.
+
+    Args:
+        session: Session carrying the change
+        tenant_id: Tenant whose health may have changed
+        trigger: HealthSnapshotTrigger value, recorded on the snapshot
+    """
+    if not tenant_id or not isinstance(session, Session):
+        return
+
+    if not session.in_transaction():
+        _refresh_after_commit(session.get_bind(), {tenant_id: trigger})
+        return
+
+    # Drained by the Session-level listeners below, so repeated calls add no
+    # per-transaction listeners
+    session.info.setdefault(_PENDING_INFO_KEY, {})[tenant_id] = trigger
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    pending = session.info.pop(_PENDING_INFO_KEY, None)
+    if pending:
+        _refresh_after_commit(session.get_bind(), pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    session.info.pop(_PENDING_INFO_KEY, None)
+
+
+def _refresh_after_commit(bind, pending: dict) -> None:
+    # The committing session cannot emit SQL here; use a fresh one per tenant
+    for tenant_id, trigger in pending.items():
+        try:
+            with Session(bind=bind) as session:
+                TenantHealthSnapshotService(session).refresh(tenant_id, trigger=trigger)
+        except Exception:
+            # The sweep or the next read recomputes it
+            get_health_snapshot_cache().invalidate(tenant_id)
+            logger.warning(
+                "Tenant health snapshot refresh failed",
+                extra={"tenant_id": tenant_id, "trigger": trigger},
+                exc_info=True,
+            )
@@ -25,6 +25,7 @@ from src.models.tenant import Tenant, TenantStatus
 from src.models.user import User
 from src.models.user_tenant_roles import UserTenantRole
 from src.services.clerk_sync_service import ClerkSyncService
+from src.platform.tenant_resolution_cache import invalidate_tenant_resolution
 from src.constants.permissions import Role
 
 logger = logging.getLogger(__name__)
@@ -175,6 +176,10 @@ class TenantMembersService:
         # Validate role
         validated_role = self._validate_role(role)
 
+        invalidate_tenant_resolution(
+            self.session, clerk_user_ids=[user.clerk_user_id], reason="access_granted"
+        )
+
         # Check for existing role
         existing = self.session.query(UserTenantRole).filter(
             UserTenantRole.user_id == user.id,
@@ -288,6 +293,9 @@ class TenantMembersService:
             # Fallback: immediate deactivation if revocation service not available
             for role in roles:
                 role.is_active = False
+            invalidate_tenant_resolution(
+                self.session, clerk_user_ids=[user.clerk_user_id], reason="access_revoked"
+            )
 
         logger.info(
             "Revoked tenant access (grace period)",
@@ -348,6 +356,10 @@ class TenantMembersService:
         for role in current_roles:
             role.is_active = False
 
+        invalidate_tenant_resolution(
+            self.session, clerk_user_ids=[user.clerk_user_id], reason="role_updated"
+        )
+
         # Create or reactivate new role
         existing_new_role = self.session.query(UserTenantRole).filter(
             UserTenantRole.user_id == user.id,
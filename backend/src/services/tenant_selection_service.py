@@ -23,6 +23,7 @@ from sqlalchemy.orm import Session
 from src.models.user import User
 from src.models.tenant import Tenant, TenantStatus
 from src.models.user_tenant_roles import UserTenantRole
+from src.platform.tenant_resolution_cache import invalidate_tenant_resolution
 from src.platform.audit import (
     AuditAction,
     AuditEvent,
@@ -240,6 +241,11 @@ class TenantSelectionService:
         user.extra_metadata = metadata
         self.session.flush()
 
+        # The stored selection feeds middleware tenant resolution
+        invalidate_tenant_resolution(
+            self.session, clerk_user_ids=[clerk_user_id], reason="active_tenant_selected"
+        )
+
         # Emit successful selection audit event
         self._emit_tenant_selected(
             clerk_user_id=clerk_user_id,
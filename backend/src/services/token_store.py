@@ -12,6 +12,10 @@ Key schema:
 - embed:revoked:{jti}            -> "1" (TTL matches original token expiry)
 - embed:user_tokens:{user_id}:{tenant_id} -> Redis SET of active JTIs
 
+Revocations are also published on REVOCATION_CHANNEL as JSON
+{jti, ttl} so Superset workers can update their in-process revocation
+set immediately (docker/superset/security/token_cache.py).
+
 Phase 1 - JWT Issuance System for Superset Embedding
 """
 
@@ -25,6 +29,8 @@ import redis
 
 logger = logging.getLogger(__name__)
 
+REVOCATION_CHANNEL = "embed:revocations"
+
 
 class EmbedTokenStore:
     """
@@ -132,6 +138,10 @@ class EmbedTokenStore:
 
             self._redis.setex(revoked_key, remaining_ttl, "1")
             self._redis.delete(token_key)
+            self._redis.publish(
+                REVOCATION_CHANNEL,
+                json.dumps({"jti": jti, "ttl": remaining_ttl}),
+            )
 
             logger.info(
                 "Revoked embed token JTI",
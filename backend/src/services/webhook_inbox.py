@@ -0,0 +1,288 @@
+"""
+Durable webhook inbox.
+
+Webhook routes verify the signature, call enqueue_webhook() and return
+200 immediately, so install/uninstall storms and GDPR redactions never
+hold a request open against Shopify's 5 second timeout. The webhook
+inbox worker then claims and processes events:
+
+- Per-key ordering: only the oldest open event for a (source,
+  ordering_key) is claimable, so a shop's webhooks apply in arrival order
+  and a failing event holds back later ones for that shop only
+- Claims use FOR UPDATE SKIP LOCKED plus a lease (locked_until), so
+  several workers can run side by side and a crashed worker's events are
+  reclaimed once the lease expires
+- Failures retry with exponential backoff up to WEBHOOK_INBOX_MAX_ATTEMPTS,
+  then the event is marked dead; ValueError (bad payload) and unknown
+  topics go straight to dead
+
+Environment variables:
+    WEBHOOK_INBOX_ENABLED: Queue webhooks (default true); false processes
+        them inline in the request as before
+    WEBHOOK_INBOX_MAX_ATTEMPTS: Attempts before an event is dead (default 8)
+    WEBHOOK_INBOX_RETRY_BASE_SECONDS: First retry delay, doubled per attempt (default 5)
+    WEBHOOK_INBOX_RETRY_MAX_SECONDS: Retry delay cap (default 900)
+    WEBHOOK_INBOX_LEASE_SECONDS: Claim lease before an event is reclaimable (default 300)
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, exists, func, or_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from src.models.webhook_inbox import (
+    OPEN_INBOX_STATUSES,
+    WebhookInboxEvent,
+    WebhookInboxStatus,
+    WebhookSource,
+)
+from src.monitoring.webhook_metrics import get_webhook_metrics
+
+logger = logging.getLogger(__name__)
+
+WEBHOOK_INBOX_ENABLED = os.getenv("WEBHOOK_INBOX_ENABLED", "true").lower() == "true"
+WEBHOOK_INBOX_MAX_ATTEMPTS = int(os.getenv("WEBHOOK_INBOX_MAX_ATTEMPTS", "8"))
+WEBHOOK_INBOX_RETRY_BASE_SECONDS = float(os.getenv("WEBHOOK_INBOX_RETRY_BASE_SECONDS", "5"))
+WEBHOOK_INBOX_RETRY_MAX_SECONDS = float(os.getenv("WEBHOOK_INBOX_RETRY_MAX_SECONDS", "900"))
+WEBHOOK_INBOX_LEASE_SECONDS = int(os.getenv("WEBHOOK_INBOX_LEASE_SECONDS", "300"))
+
+
+def payload_fingerprint(*parts: bytes) -> str:
+    """SHA-256 over the given parts; event id for deliveries without one."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def enqueue_webhook(
+    db: Session,
+    source: WebhookSource,
+    event_id: str,
+    topic: str,
+    ordering_key: str,
+    payload: bytes,
+) -> bool:
+    """
+    Write a verified webhook to the inbox.
+
+    Args:
+        db: Database session
+        source: Delivering provider
+        event_id: Provider delivery id (X-Shopify-Webhook-Id / svix-id)
+        topic: Webhook topic or Clerk event type
+        ordering_key: Key whose events must apply in order
+        payload: Raw request body
+
+    Returns:
+        True if queued, False if this event id was already in the inbox
+    """
+    event = WebhookInboxEvent(
+        source=source.value,
+        event_id=event_id,
+        topic=topic,
+        ordering_key=ordering_key,
+        payload=payload.decode("utf-8"),
+    )
+    db.add(event)
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        get_webhook_metrics().record_received(source.value, topic, duplicate=True)
+        logger.info("Duplicate webhook ignored", extra={
+            "source": source.value,
+            "event_id": event_id,
+            "topic": topic,
+        })
+        return False
+
+    get_webhook_metrics().record_received(source.value, topic, duplicate=False)
+    return True
+
+
+def claim_events(db: Session, worker_id: str, limit: int) -> List[WebhookInboxEvent]:
+    """
+    Claim up to limit due events, each the oldest open event for its key.
+
+    Candidate rows are locked with FOR UPDATE SKIP LOCKED and the
+    PROCESSING transition (with lease) is committed immediately.
+    PROCESSING events whose lease expired (crashed worker) are claimable
+    again.
+    """
+    now = datetime.now(timezone.utc)
+    earlier = aliased(WebhookInboxEvent)
+
+    # An older open event for the same key holds this one back
+    held_back = exists().where(
+        earlier.source == WebhookInboxEvent.source,
+        earlier.ordering_key == WebhookInboxEvent.ordering_key,
+        earlier.status.in_(OPEN_INBOX_STATUSES),
+        or_(
+            earlier.received_at < WebhookInboxEvent.received_at,
+            and_(
+                earlier.received_at == WebhookInboxEvent.received_at,
+                earlier.id < WebhookInboxEvent.id,
+            ),
+        ),
+    )
+
+    events = (
+        db.query(WebhookInboxEvent)
+        .filter(
+            or_(
+                and_(
+                    WebhookInboxEvent.status.in_([
+                        WebhookInboxStatus.PENDING.value,
+                        WebhookInboxStatus.RETRY.value,
+                    ]),
+                    WebhookInboxEvent.next_attempt_at <= now,
+                ),
+                and_(
+                    WebhookInboxEvent.status == WebhookInboxStatus.PROCESSING.value,
+                    WebhookInboxEvent.locked_until < now,
+                ),
+            ),
+            ~held_back,
+        )
+        .order_by(WebhookInboxEvent.received_at.asc())
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .all()
+    )
+    if not events:
+        db.rollback()
+        return []
+
+    for event in events:
+        event.status = WebhookInboxStatus.PROCESSING.value
+        event.claimed_by = worker_id
+        event.locked_until = now + timedelta(seconds=WEBHOOK_INBOX_LEASE_SECONDS)
+        event.attempts += 1
+    db.commit()
+    return events
+
+
+def _dispatch(db: Session, event: WebhookInboxEvent) -> str:
+    """Run the processor for an event's source and topic."""
+    payload = json.loads(event.payload)
+
+    if event.source == WebhookSource.SHOPIFY.value:
+        from src.services.shopify_webhook_processor import SHOPIFY_WEBHOOK_PROCESSORS
+
+        processor = SHOPIFY_WEBHOOK_PROCESSORS.get(event.topic)
+        if processor is None:
+            raise ValueError(f"Unsupported Shopify webhook topic: {event.topic}")
+        return processor(db, event.ordering_key, payload)
+
+    if event.source == WebhookSource.CLERK.value:
+        from src.services.clerk_webhook_handler import ClerkWebhookHandler
+
+        result = ClerkWebhookHandler(db).handle_event(event.topic, payload)
+        return result.get("status", "processed")
+
+    raise ValueError(f"Unsupported webhook source: {event.source}")
+
+
+def retry_delay_seconds(attempts: int) -> float:
+    """Exponential backoff for the given (1-based) attempt count."""
+    return min(
+        WEBHOOK_INBOX_RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)),
+        WEBHOOK_INBOX_RETRY_MAX_SECONDS,
+    )
+
+
+def process_event(db: Session, event: WebhookInboxEvent) -> str:
+    """
+    Process one claimed event and record the outcome.
+
+    Returns:
+        Resulting WebhookInboxStatus value
+    """
+    event_id = event.id
+    source, topic = event.source, event.topic
+    metrics = get_webhook_metrics()
+
+    try:
+        message = _dispatch(db, event)
+    except Exception as exc:
+        db.rollback()
+        event = db.get(WebhookInboxEvent, event_id)
+        retryable = not isinstance(exc, (ValueError, json.JSONDecodeError))
+        event.last_error = str(exc)[:2000]
+        event.locked_until = None
+
+        if retryable and event.attempts < WEBHOOK_INBOX_MAX_ATTEMPTS:
+            delay = retry_delay_seconds(event.attempts)
+            event.status = WebhookInboxStatus.RETRY.value
+            event.next_attempt_at = datetime.now(timezone.utc) + timedelta(seconds=delay)
+            db.commit()
+            metrics.record_retry(source, topic, event.attempts, delay)
+            logger.warning("Webhook processing failed, will retry", extra={
+                "inbox_id": event_id,
+                "source": source,
+                "topic": topic,
+                "attempts": event.attempts,
+                "error": str(exc),
+            })
+        else:
+            event.status = WebhookInboxStatus.DEAD.value
+            db.commit()
+            metrics.record_dead(source, topic, event.attempts, str(exc))
+            logger.error("Webhook processing gave up", extra={
+                "inbox_id": event_id,
+                "source": source,
+                "topic": topic,
+                "attempts": event.attempts,
+                "error": str(exc),
+            }, exc_info=True)
+        return event.status
+
+    event = db.get(WebhookInboxEvent, event_id)
+    now = datetime.now(timezone.utc)
+    event.status = WebhookInboxStatus.PROCESSED.value
+    event.processed_at = now
+    event.locked_until = None
+    event.last_error = None
+    db.commit()
+
+    received_at = event.received_at
+    if received_at.tzinfo is None:
+        received_at = received_at.replace(tzinfo=timezone.utc)
+    metrics.record_processed(
+        source, topic, event.attempts, (now - received_at).total_seconds() * 1000,
+    )
+    logger.info("Webhook processed", extra={
+        "inbox_id": event_id,
+        "source": source,
+        "topic": topic,
+        "result": message,
+    })
+    return event.status
+
+
+def get_inbox_lag(db: Session, now: Optional[datetime] = None) -> Dict[str, Any]:
+    """
+    Backlog of open (pending, processing, retry) events.
+
+    Returns:
+        Dict with open_events and oldest_age_seconds (0 when empty)
+    """
+    now = now or datetime.now(timezone.utc)
+    count, oldest = (
+        db.query(func.count(WebhookInboxEvent.id), func.min(WebhookInboxEvent.received_at))
+        .filter(WebhookInboxEvent.status.in_(OPEN_INBOX_STATUSES))
+        .one()
+    )
+    if oldest is not None and oldest.tzinfo is None:
+        oldest = oldest.replace(tzinfo=timezone.utc)
+    return {
+        "open_events": count or 0,
+        "oldest_age_seconds": (now - oldest).total_seconds() if oldest else 0.0,
+    }
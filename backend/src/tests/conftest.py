@@ -50,6 +50,15 @@ def _httpx_app_kwarg_patch():
         httpx.Client.__init__ = original_init
 
 
+@pytest.fixture(autouse=True)
+def _reset_tenant_resolution_cache():
+    """Cached tenant resolutions must not leak between tests."""
+    from src.platform.tenant_resolution_cache import get_tenant_resolution_cache
+
+    get_tenant_resolution_cache().clear()
+    yield
+
+
 def _get_test_database_url() -> str:
     """Get database URL for tests."""
     database_url = os.getenv("DATABASE_URL")
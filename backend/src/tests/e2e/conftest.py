@@ -27,6 +27,8 @@ from httpx import AsyncClient
 os.environ["ENV"] = "test"
 os.environ["SHOPIFY_API_SECRET"] = "test-webhook-secret-for-hmac"
 os.environ["SHOPIFY_BILLING_TEST_MODE"] = "true"
+# Webhook tests assert on the processed state in the same request
+os.environ["WEBHOOK_INBOX_ENABLED"] = "false"
 os.environ.setdefault("CLERK_SECRET_KEY", "test-clerk-secret-key")
 os.environ.setdefault("CLERK_PUBLISHABLE_KEY", "test-clerk-publishable-key")
 os.environ.setdefault("ENCRYPTION_KEY", "dGVzdC1lbmNyeXB0aW9uLWtleS0zMi1ieXRlcw==")
@@ -297,6 +299,7 @@ def test_app(db_session, mock_clerk, mock_shopify, mock_airbyte, mock_openrouter
     """
     from main import app
     from src.api.routes.webhooks_shopify import get_db_session
+    from src.database.session import get_async_db_session
     from src.platform.tenant_context import TenantContextMiddleware
 
     original_overrides = app.dependency_overrides.copy()
@@ -306,6 +309,8 @@ def test_app(db_session, mock_clerk, mock_shopify, mock_airbyte, mock_openrouter
         yield db_session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    # Routes migrated to the async path accept a sync Session via run_db
+    app.dependency_overrides[get_async_db_session] = override_get_db_session
 
     # Store mock references for access in tests
     app.state.mock_clerk = mock_clerk
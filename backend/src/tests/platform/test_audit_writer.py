@@ -0,0 +1,164 @@
+"""
+Tests for the background batched audit writer.
+
+Tests cover:
+- Group commit: queued events land in batches on the writer's own session
+- write_audit_log_sync queues only when the caller session has no other work
+- Backpressure overflow and failed rows go to the fallback logger
+- drain() flushes everything queued
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.models.user import User
+from src.platform import audit_writer as audit_writer_module
+from src.platform.audit import AuditAction, AuditEvent, AuditLog, write_audit_log_sync
+from src.platform.audit_writer import AuditWriter
+
+
+def _event(tenant_id="tenant-1", **overrides):
+    fields = dict(
+        tenant_id=tenant_id,
+        action=AuditAction.STORE_CONNECTED,
+        metadata={"shop_domain": "example.myshopify.com"},
+    )
+    fields.update(overrides)
+    return AuditEvent(**fields)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    AuditLog.__table__.create(bind=engine)
+    User.__table__.create(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def writer(session_factory):
+    writer = AuditWriter(
+        session_factory=session_factory,
+        batch_size=50,
+        flush_interval_ms=20,
+    )
+    writer.start()
+    yield writer
+    writer.drain(timeout=5)
+
+
+def _count(session_factory) -> int:
+    with session_factory() as session:
+        return session.scalar(select(func.count()).select_from(AuditLog))
+
+
+class TestAuditWriter:
+    """Queueing and group commit."""
+
+    def test_events_are_group_committed(self, writer, session_factory):
+        with patch("src.platform.audit_writer.get_audit_metrics") as mock_metrics:
+            ids = [writer.submit(_event()) for _ in range(120)]
+            writer.drain(timeout=5)
+
+        assert _count(session_factory) == 120
+        assert len(set(ids)) == 120
+        flushes = mock_metrics.return_value.record_batch_flush.call_args_list
+        assert sum(c.kwargs["batch_size"] for c in flushes) == 120
+        assert all(c.kwargs["batch_size"] <= 50 for c in flushes)
+
+    def test_submit_returns_none_when_not_running(self, session_factory):
+        assert AuditWriter(session_factory=session_factory).submit(_event()) is None
+
+    def test_metadata_redacted_at_enqueue(self, writer, session_factory):
+        event = _event(metadata={"email": "owner@example.com"})
+        audit_id = writer.submit(event)
+        event.metadata["email"] = "mutated@example.com"
+        writer.drain(timeout=5)
+
+        with session_factory() as session:
+            row = session.get(AuditLog, audit_id)
+        assert row.event_metadata["email"] not in ("owner@example.com", "mutated@example.com")
+
+    def test_failed_rows_fall_back_without_dropping_batch(self, writer, session_factory):
+        with patch("src.platform.audit_writer._write_fallback_log") as mock_fallback:
+            writer.submit(_event())
+            writer.submit(_event(tenant_id=None))
+            writer.submit(_event())
+            writer.drain(timeout=5)
+
+        assert _count(session_factory) == 2
+        mock_fallback.assert_called_once()
+
+    def test_full_queue_overflows_to_fallback(self, session_factory):
+        release = threading.Event()
+
+        def blocking_factory():
+            release.wait(5)
+            return session_factory()
+
+        writer = AuditWriter(
+            session_factory=blocking_factory,
+            queue_size=2,
+            batch_size=1,
+            flush_interval_ms=1,
+            enqueue_timeout_ms=1,
+        )
+        writer.start()
+        with patch("src.platform.audit_writer._write_fallback_log") as mock_fallback:
+            ids = [writer.submit(_event()) for _ in range(10)]
+            release.set()
+            writer.drain(timeout=5)
+
+        assert all(ids)
+        assert mock_fallback.call_count + _count(session_factory) == 10
+        assert mock_fallback.call_count > 0
+
+
+class TestWriteAuditLogRouting:
+    """write_audit_log_sync uses the writer only for clean sessions."""
+
+    @pytest.fixture(autouse=True)
+    def _global_writer(self, writer):
+        with patch.object(audit_writer_module, "_audit_writer", writer):
+            yield
+
+    def test_clean_session_is_not_committed(self, writer, session_factory):
+        db = session_factory()
+        with patch.object(db, "commit") as mock_commit:
+            result = write_audit_log_sync(db, _event())
+        writer.drain(timeout=5)
+
+        mock_commit.assert_not_called()
+        assert result.id is not None
+        assert _count(session_factory) == 1
+
+    def test_pending_changes_keep_inline_commit(self, writer, session_factory):
+        db = session_factory()
+        db.add(User(id="u-1", clerk_user_id="clerk-1"))
+
+        write_audit_log_sync(db, _event())
+
+        assert writer.queue_depth == 0
+        with session_factory() as other:
+            assert other.get(User, "u-1") is not None
+
+    def test_flushed_changes_keep_inline_commit(self, writer, session_factory):
+        db = session_factory()
+        db.add(User(id="u-2", clerk_user_id="clerk-2"))
+        db.flush()
+
+        write_audit_log_sync(db, _event())
+        db.close()
+
+        with session_factory() as other:
+            assert other.get(User, "u-2") is not None
@@ -0,0 +1,240 @@
+"""
+Tests for the live event fan-out and SSE stream.
+
+Tests cover:
+- Events on a Session are sent after COMMIT and dropped on rollback
+- Broker delivery is tenant-scoped and honours user-scoped events
+- Slow streams drop the oldest buffered event
+- /api/events/stream frames and stream lifetime
+- Publishers (notifications, data changes, insights, changelog) emit events
+"""
+
+import asyncio
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI, Request
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.api.routes import live_events as live_events_routes
+from src.models.user import User
+from src.platform import live_events
+from src.platform.live_events import (
+    LiveEvent,
+    LiveEventBroker,
+    LiveEventType,
+    publish_live_event,
+)
+from src.platform.tenant_context import TenantContext
+
+
+def _event(tenant_id="tenant-1", user_id=None, **data):
+    return LiveEvent(
+        type=LiveEventType.NOTIFICATIONS,
+        tenant_id=tenant_id,
+        user_id=user_id,
+        data=data,
+    )
+
+
+@pytest.fixture
+def broker():
+    broker = LiveEventBroker(queue_size=2)
+    with patch.object(live_events, "_broker", broker), \
+            patch.object(live_events.RedisClient, "subscribe", return_value=False):
+        yield broker
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    User.__table__.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+class TestPublishOnCommit:
+    """Transactional publishing."""
+
+    def test_sent_after_commit(self, session):
+        with patch("src.platform.live_events._send") as mock_send:
+            session.add(User(id="u-1", clerk_user_id="clerk-1"))
+            session.flush()
+            publish_live_event(_event(), db=session)
+            mock_send.assert_not_called()
+
+            session.commit()
+
+        mock_send.assert_called_once()
+
+    def test_dropped_on_rollback(self, session):
+        with patch("src.platform.live_events._send") as mock_send:
+            session.add(User(id="u-1", clerk_user_id="clerk-1"))
+            session.flush()
+            publish_live_event(_event(), db=session)
+            session.rollback()
+            session.commit()
+
+        mock_send.assert_not_called()
+
+    def test_sent_immediately_without_transaction(self):
+        with patch("src.platform.live_events._send") as mock_send:
+            publish_live_event(_event(), db=Mock())
+        mock_send.assert_called_once()
+
+    def test_round_trip(self):
+        event = _event(user_id="user-1", count=3)
+        assert LiveEvent.from_json(event.to_json()) == event
+        assert event.to_sse() == 'event: notifications\ndata: {"count": 3}\n\n'
+
+
+class TestBroker:
+    """Local delivery to open streams."""
+
+    async def test_tenant_and_user_scoping(self, broker):
+        with broker.subscription("tenant-1", "user-1") as mine, \
+                broker.subscription("tenant-1", "user-2") as colleague, \
+                broker.subscription("tenant-2", "user-1") as other_tenant:
+            broker.dispatch(_event(user_id="user-1", n=1))
+            broker.dispatch(_event(n=2))
+            await asyncio.sleep(0)
+
+            assert [mine.get_nowait().data["n"] for _ in range(2)] == [1, 2]
+            assert colleague.get_nowait().data["n"] == 2
+            assert colleague.empty()
+            assert other_tenant.empty()
+
+        assert broker.subscriber_count == 0
+
+    async def test_slow_stream_drops_oldest(self, broker):
+        with broker.subscription("tenant-1") as queue:
+            for n in range(4):
+                broker.dispatch(_event(n=n))
+            await asyncio.sleep(0)
+
+            assert [queue.get_nowait().data["n"] for _ in range(2)] == [2, 3]
+
+
+class TestStreamRoute:
+    """GET /api/events/stream."""
+
+    @pytest.fixture
+    def app(self, broker):
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def tenant(request: Request, call_next):
+            request.state.tenant_context = TenantContext(
+                tenant_id="tenant-1", user_id="user-1", roles=["admin"], org_id="tenant-1",
+            )
+            return await call_next(request)
+
+        app.include_router(live_events_routes.router)
+        return app
+
+    async def test_stream_delivers_events_until_lifetime(self, app, broker):
+        subscribed = asyncio.Event()
+        subscription = broker.subscription
+
+        @contextmanager
+        def signalling_subscription(*args, **kwargs):
+            with subscription(*args, **kwargs) as queue:
+                subscribed.set()
+                yield queue
+
+        async def publish_soon():
+            await asyncio.wait_for(subscribed.wait(), timeout=2)
+            broker.dispatch(_event(user_id="user-1", count=5))
+
+        with patch.object(live_events_routes, "LIVE_EVENTS_MAX_STREAM_SECONDS", 0.3), \
+                patch.object(live_events_routes, "LIVE_EVENTS_HEARTBEAT_SECONDS", 0.1), \
+                patch.object(broker, "subscription", signalling_subscription):
+            publisher = asyncio.create_task(publish_soon())
+            async with httpx.AsyncClient(app=app, base_url="http://test") as client:
+                response = await client.get("/api/events/stream")
+            await publisher
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        body = response.text
+        assert body.startswith("retry: ")
+        assert "event: ready" in body
+        assert 'event: notifications\ndata: {"count": 5}' in body
+        assert ": keepalive" in body
+        assert broker.subscriber_count == 0
+
+
+class TestPublishers:
+    """Services publish refresh hints."""
+
+    def test_notify_publishes_notification_and_approval_events(self):
+        from src.models.notification import NotificationEventType
+        from src.services.notification_service import NotificationService
+
+        service = NotificationService(Mock(), "tenant-1")
+        with patch("src.services.notification_service.publish_live_event") as mock_publish, \
+                patch.object(service, "_should_send_email", return_value=False):
+            service.notify(
+                event_type=NotificationEventType.ACTION_REQUIRES_APPROVAL,
+                title="Approve",
+                message="Please approve",
+                user_id="user-1",
+            )
+
+        types = [c.args[0].type for c in mock_publish.call_args_list]
+        assert types == [LiveEventType.NOTIFICATIONS, LiveEventType.APPROVALS]
+        assert mock_publish.call_args_list[0].args[0].user_id == "user-1"
+
+    def test_data_change_publishes_critical_flag(self):
+        from src.services.data_change_aggregator import DataChangeAggregator
+
+        aggregator = DataChangeAggregator(Mock(), "tenant-1")
+        sync_run = Mock(
+            rows_synced=10, error_message="boom", connector_id="conn-1",
+            run_id="run-1", completed_at=None, started_at=None,
+        )
+        with patch("src.services.data_change_aggregator.publish_live_event") as mock_publish:
+            aggregator.record_sync_failed(sync_run, "Shopify")
+
+        [call] = mock_publish.call_args_list
+        event = call.args[0]
+        assert event.type == LiveEventType.CHANGES
+        assert event.data == {"event_type": "sync_failed", "critical": True}
+
+    def test_new_insights_publish_insights_event(self):
+        from src.services.insight_generation_service import InsightGenerationService
+
+        service = InsightGenerationService(Mock(), "tenant-1")
+        with patch(
+            "src.services.insight_generation_service.existing_content_hashes",
+            return_value=set(),
+        ), patch(
+            "src.services.insight_generation_service.insert_ignoring_duplicates",
+            side_effect=[[Mock(), Mock()], []],
+        ), patch("src.services.insight_generation_service.publish_live_event") as mock_publish:
+            service._persist_insights([], "job-1")
+            service._persist_insights([], "job-2")
+
+        [call] = mock_publish.call_args_list
+        event = call.args[0]
+        assert (event.type, event.tenant_id, event.data) == (
+            LiveEventType.INSIGHTS, "tenant-1", {"count": 2},
+        )
+
+    def test_changelog_read_publishes_user_scoped_event(self):
+        from src.services.changelog_service import ChangelogService
+
+        db = Mock()
+        # Published entry found, not yet read
+        db.query.return_value.filter.return_value.first.side_effect = [Mock(), None]
+        service = ChangelogService(db, "tenant-1", "user-1")
+        with patch("src.services.changelog_service.publish_live_event") as mock_publish:
+            assert service.mark_as_read("entry-1") is True
+
+        event = mock_publish.call_args.args[0]
+        assert (event.type, event.user_id) == (LiveEventType.CHANGELOG, "user-1")
+        assert mock_publish.call_args.kwargs["db"] is db
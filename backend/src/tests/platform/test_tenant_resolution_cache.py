@@ -0,0 +1,269 @@
+"""
+Tests for the tenant-resolution cache in TenantContextMiddleware.
+
+Tests cover:
+- TenantResolutionCache get/set, claims fingerprinting, LRU + TTL
+- Invalidation by Clerk user, internal user ID and tenant
+- Invalidation replayed after the session commits
+- Subscription status/plan changes invalidate their tenant
+- Middleware: repeat requests skip DB authorization; denials and role
+  changes are not cached
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI, Request, status
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db_base import Base
+from src.models.subscription import Subscription, SubscriptionStatus
+from src.models.user import User
+from src.platform.tenant_context import TenantContextMiddleware, get_tenant_context
+from src.platform.tenant_resolution_cache import (
+    CachedTenantResolution,
+    TenantResolutionCache,
+    claims_fingerprint,
+    get_tenant_resolution_cache,
+    invalidate_tenant_resolution,
+)
+from src.tests.platform.conftest import create_mock_authz_result
+
+
+JWT_PAYLOAD = {
+    "sub": "user-123",
+    "org_id": "org-456",
+    "org_role": "org:admin",
+    "metadata": {"roles": ["merchant_admin"]},
+    "iss": "https://test.clerk.accounts.dev",
+    "exp": 9999999999,
+}
+
+
+def _entry(tenant_id="tenant-1", **overrides):
+    fields = dict(tenant_id=tenant_id, roles=["MERCHANT_ADMIN"], billing_tier="growth")
+    fields.update(overrides)
+    return CachedTenantResolution(**fields)
+
+
+@pytest.fixture
+def cache():
+    return TenantResolutionCache(ttl_seconds=60, local_ttl_seconds=60, local_max_entries=3)
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine, tables=[User.__table__, Subscription.__table__])
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+# =============================================================================
+# Cache
+# =============================================================================
+
+
+class TestTenantResolutionCache:
+    """TenantResolutionCache behaviour without Redis."""
+
+    def test_round_trip(self, cache):
+        cache.set("user-1", "org-1", "fp", _entry(allowed_tenants=["tenant-1", "tenant-2"]))
+
+        cached = cache.get("user-1", "org-1", "fp")
+
+        assert cached.tenant_id == "tenant-1"
+        assert cached.allowed_tenants == ["tenant-1", "tenant-2"]
+        assert cached.billing_tier == "growth"
+
+    def test_different_claims_miss(self, cache):
+        fp = claims_fingerprint("tenant-1", "org:admin", ["b", "a"], ["ADMIN"], "free")
+        cache.set("user-1", "org-1", fp, _entry())
+
+        assert fp == claims_fingerprint("tenant-1", "org:admin", ["a", "b"], ["ADMIN"], "free")
+        other = claims_fingerprint("tenant-2", "org:admin", ["a", "b"], ["ADMIN"], "free")
+        assert cache.get("user-1", "org-1", other) is None
+
+    def test_expired_entry_is_a_miss(self):
+        cache = TenantResolutionCache(ttl_seconds=0, local_ttl_seconds=0)
+        cache.set("user-1", "org-1", "fp", _entry())
+
+        assert cache.get("user-1", "org-1", "fp") is None
+
+    def test_lru_evicts_least_recently_used(self, cache):
+        for i in range(3):
+            cache.set(f"user-{i}", "org", "fp", _entry())
+        cache.get("user-0", "org", "fp")
+
+        cache.set("user-3", "org", "fp", _entry())
+
+        assert cache.get("user-0", "org", "fp") is not None
+        assert cache.get("user-1", "org", "fp") is None
+
+    def test_disabled_cache_never_hits(self):
+        cache = TenantResolutionCache(enabled=False)
+        cache.set("user-1", "org-1", "fp", _entry())
+
+        assert cache.get("user-1", "org-1", "fp") is None
+
+    def test_invalidate_user(self, cache):
+        cache.set("user-1", "org-1", "fp", _entry())
+        cache.set("user-2", "org-1", "fp", _entry())
+
+        cache.invalidate(clerk_user_ids=["user-1"])
+
+        assert cache.get("user-1", "org-1", "fp") is None
+        assert cache.get("user-2", "org-1", "fp") is not None
+
+    def test_invalidate_tenant_covers_allowed_tenants(self, cache):
+        cache.set("agency", "org-a", "fp", _entry("tenant-a", allowed_tenants=["tenant-a", "tenant-b"]))
+        cache.set("merchant", "org-c", "fp", _entry("tenant-c"))
+
+        cache.invalidate(tenant_ids=["tenant-b"])
+
+        assert cache.get("agency", "org-a", "fp") is None
+        assert cache.get("merchant", "org-c", "fp") is not None
+
+
+# =============================================================================
+# invalidate_tenant_resolution
+# =============================================================================
+
+
+class TestInvalidateTenantResolution:
+    """Module-level invalidation hook used by services."""
+
+    def test_maps_internal_user_ids_to_clerk_ids(self, db_session):
+        db_session.add(User(id="u-1", clerk_user_id="clerk-1"))
+        db_session.commit()
+        cache = get_tenant_resolution_cache()
+        cache.set("clerk-1", "org", "fp", _entry())
+
+        invalidate_tenant_resolution(db_session, user_ids=["u-1"])
+
+        assert cache.get("clerk-1", "org", "fp") is None
+
+    def test_replayed_after_commit(self, db_session):
+        cache = get_tenant_resolution_cache()
+
+        invalidate_tenant_resolution(db_session, clerk_user_ids=["clerk-1"])
+        # A concurrent request re-caches pre-commit state
+        cache.set("clerk-1", "org", "fp", _entry())
+        db_session.commit()
+
+        assert cache.get("clerk-1", "org", "fp") is None
+
+    def test_subscription_status_change_invalidates_tenant(self, db_session):
+        subscription = Subscription(
+            id="sub-1", tenant_id="tenant-1", plan_id="plan-growth",
+            status=SubscriptionStatus.ACTIVE.value,
+        )
+        db_session.add(subscription)
+        db_session.commit()
+        cache = get_tenant_resolution_cache()
+        cache.set("clerk-1", "org", "fp", _entry())
+        cache.set("clerk-2", "org", "fp", _entry(tenant_id="tenant-2"))
+
+        subscription.status = SubscriptionStatus.FROZEN.value
+        db_session.flush()
+        # A concurrent request re-caches pre-commit state
+        cache.set("clerk-1", "org", "fp", _entry())
+        db_session.commit()
+
+        assert cache.get("clerk-1", "org", "fp") is None
+        assert cache.get("clerk-2", "org", "fp") is not None
+
+    def test_mock_session_invalidates_immediately(self):
+        cache = get_tenant_resolution_cache()
+        cache.set("clerk-1", "org", "fp", _entry())
+
+        invalidate_tenant_resolution(MagicMock(), clerk_user_ids=["clerk-1", MagicMock()])
+
+        assert cache.get("clerk-1", "org", "fp") is None
+
+
+# =============================================================================
+# Middleware
+# =============================================================================
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setenv("CLERK_FRONTEND_API", "test.clerk.accounts.dev")
+    app = FastAPI()
+    app.middleware("http")(TenantContextMiddleware())
+
+    @app.get("/api/data")
+    async def get_data(request: Request):
+        ctx = get_tenant_context(request)
+        return {"tenant_id": ctx.tenant_id, "billing_tier": ctx.billing_tier}
+
+    return app
+
+
+@patch("src.platform.tenant_context.jwt.decode", return_value=JWT_PAYLOAD)
+@patch("src.platform.tenant_context.ClerkJWKSClient.get_signing_key", return_value=MagicMock(key="k"))
+class TestMiddlewareCaching:
+    """TenantContextMiddleware serves repeat requests from the cache."""
+
+    def _get(self, app):
+        return TestClient(app).get("/api/data", headers={"Authorization": "Bearer token"})
+
+    def test_second_request_skips_db_authorization(
+        self, mock_key, mock_decode, app, mock_authorization_enforcement
+    ):
+        first = self._get(app)
+        with patch.object(
+            TenantContextMiddleware, "_resolve_tenant_from_db"
+        ) as mock_resolve:
+            second = self._get(app)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.json() == first.json()
+        assert mock_authorization_enforcement.enforce_authorization.call_count == 1
+        mock_resolve.assert_not_called()
+
+    def test_invalidation_forces_db_authorization(
+        self, mock_key, mock_decode, app, mock_authorization_enforcement
+    ):
+        self._get(app)
+        invalidate_tenant_resolution(clerk_user_ids=["user-123"], reason="test")
+        mock_authorization_enforcement.enforce_authorization.return_value = (
+            create_mock_authz_result(is_authorized=False)
+        )
+
+        response = self._get(app)
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        assert mock_authorization_enforcement.enforce_authorization.call_count == 2
+
+    def test_denials_are_not_cached(
+        self, mock_key, mock_decode, app, mock_authorization_enforcement
+    ):
+        mock_authorization_enforcement.enforce_authorization.return_value = (
+            create_mock_authz_result(is_authorized=False)
+        )
+
+        assert self._get(app).status_code == status.HTTP_403_FORBIDDEN
+        assert self._get(app).status_code == status.HTTP_403_FORBIDDEN
+        assert mock_authorization_enforcement.enforce_authorization.call_count == 2
+
+    def test_role_changes_are_not_cached(
+        self, mock_key, mock_decode, app, mock_authorization_enforcement
+    ):
+        from src.platform.audit import AuditAction
+
+        result = create_mock_authz_result()
+        result.roles_changed = True
+        result.audit_action = AuditAction.IDENTITY_ROLE_CHANGE_ENFORCED
+        mock_authorization_enforcement.enforce_authorization.return_value = result
+
+        assert self._get(app).status_code == status.HTTP_200_OK
+        assert self._get(app).status_code == status.HTTP_200_OK
+        # Every request re-enforces and audits the role change
+        assert mock_authorization_enforcement.enforce_authorization.call_count == 2
+        assert mock_authorization_enforcement.emit_enforcement_audit_event.call_count == 2
@@ -0,0 +1,162 @@
+"""
+Tests for the shared in-process TTLCache.
+
+Tests cover:
+- LRU eviction and per-entry TTL / max_age reads
+- Expiry heap reclaiming entries without reads
+- Namespace-indexed delete_prefix / delete_pattern
+- Hit/miss/eviction/expiration counters and the stats registry
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.entitlements.cache import InMemoryCache
+from src.monitoring.cache_metrics import CacheMetrics
+from src.platform.ttl_cache import TTLCache, get_cache_stats
+
+
+@pytest.fixture
+def clock():
+    """Patch time.time() in ttl_cache with a settable clock."""
+    now = [1000.0]
+    with patch("src.platform.ttl_cache.time.time", side_effect=lambda: now[0]):
+        yield now
+
+
+class TestTTLCache:
+    """Core get/set/expiry behaviour."""
+
+    def test_lru_evicts_least_recently_used(self):
+        cache = TTLCache(max_entries=2, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.stats().evictions == 1
+
+    def test_entry_expires_after_ttl(self, clock):
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        cache.set("a", 1)
+        cache.set("b", 2, ttl_seconds=120)
+
+        clock[0] += 61
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_max_age_is_stricter_than_ttl(self, clock):
+        cache = TTLCache(max_entries=10, ttl_seconds=300)
+        cache.set("a", 1)
+        clock[0] += 30
+
+        assert cache.get("a", max_age=60) == 1
+        assert cache.get_entry("a") == (1000.0, 1)
+        assert cache.get("a", max_age=10) is None
+
+    def test_expired_entries_reclaimed_on_write(self, clock):
+        cache = TTLCache(max_entries=10, ttl_seconds=10)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+        clock[0] += 11
+
+        cache.set("fresh", 1)
+
+        assert len(cache) == 1
+        assert cache.stats().expirations == 5
+
+    def test_overwrite_is_not_expired_by_stale_heap_item(self, clock):
+        cache = TTLCache(max_entries=10, ttl_seconds=10)
+        cache.set("a", 1)
+        clock[0] += 5
+        cache.set("a", 2)
+        clock[0] += 6
+
+        cache.set("b", 3)
+
+        assert cache.get("a") == 2
+
+    def test_heap_is_compacted_on_repeated_overwrites(self):
+        cache = TTLCache(max_entries=10, ttl_seconds=60)
+        for i in range(1000):
+            cache.set("a", i)
+
+        assert len(cache._expiry_heap) <= 2 * 64 + 1
+        assert cache.get("a") == 999
+
+
+class TestTTLCacheInvalidation:
+    """Namespace index and pattern deletes."""
+
+    @pytest.fixture
+    def cache(self):
+        cache = TTLCache(max_entries=100, ttl_seconds=60)
+        cache.set("entitlement:t1", 1)
+        cache.set("entitlement:t2", 2)
+        cache.set("other:t1", 3)
+        cache.set(("user-1", "org:fp"), 4)
+        cache.set(("user-2", "org:fp"), 5)
+        return cache
+
+    def test_delete_pattern_namespace(self, cache):
+        assert cache.delete_pattern("entitlement:*") == 2
+        assert cache.get("other:t1") == 3
+
+    def test_delete_pattern_within_namespace(self, cache):
+        assert cache.delete_pattern("entitlement:t?") == 2
+        assert cache.delete_pattern("*:t1") == 1
+        assert cache.get("other:t1") is None
+
+    def test_delete_prefix_tuple_keys(self, cache):
+        assert cache.delete_prefix("user-1") == 1
+        assert cache.get(("user-1", "org:fp")) is None
+        assert cache.get(("user-2", "org:fp")) == 5
+
+    def test_delete_where(self, cache):
+        assert cache.delete_where(lambda key, value: value % 2 == 0) == 2
+        assert cache.get("entitlement:t2") is None
+
+    def test_namespace_index_tracks_evictions(self):
+        cache = TTLCache(max_entries=1, ttl_seconds=60)
+        cache.set("ns:a", 1)
+        cache.set("ns:b", 2)
+
+        assert cache.delete_prefix("ns:") == 1
+        assert len(cache) == 0
+
+
+class TestCacheStats:
+    """Counters and monitoring registry."""
+
+    def test_hit_miss_counters(self):
+        cache = TTLCache(max_entries=10, ttl_seconds=60, name="test_counters")
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("missing")
+
+        stats = cache.stats()
+
+        assert (stats.hits, stats.misses, stats.size) == (1, 1, 1)
+        assert stats.hit_ratio == 0.5
+
+    def test_named_caches_are_registered(self):
+        cache = TTLCache(max_entries=10, ttl_seconds=60, name="test_registered")
+
+        assert "test_registered" in {s.name for s in get_cache_stats()}
+        with patch("src.monitoring.cache_metrics.metrics_logger") as mock_logger:
+            snapshots = CacheMetrics.get_instance().emit_all()
+
+        assert cache.stats() in snapshots
+        assert mock_logger.info.call_count == len(snapshots)
+
+    def test_entitlements_memory_cache_exposes_stats(self):
+        cache = InMemoryCache(max_size=10)
+        cache.set("entitlement:t1", "{}")
+        cache.get("entitlement:t1", 60)
+
+        assert cache.stats().hits == 1
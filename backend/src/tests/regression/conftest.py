@@ -26,6 +26,8 @@ from fastapi.testclient import TestClient
 os.environ["ENV"] = "test"
 os.environ["SHOPIFY_API_SECRET"] = "test-webhook-secret-for-hmac"
 os.environ["SHOPIFY_BILLING_TEST_MODE"] = "true"
+# Webhook tests assert on the processed state in the same request
+os.environ["WEBHOOK_INBOX_ENABLED"] = "false"
 
 # Fixed test webhook secret - used for HMAC computation
 TEST_WEBHOOK_SECRET = "test-webhook-secret-for-hmac"
@@ -644,10 +644,15 @@ class TestSyncOperations:
             bytes_synced=250000,
             duration_seconds=120.5,
         )
-        mock_airbyte_client.sync_and_wait.return_value = mock_result
+        mock_airbyte_client.trigger_sync = AsyncMock(return_value="job-456")
+        mock_watcher = MagicMock()
+        mock_watcher.wait_for_job = AsyncMock(return_value=mock_result)
+        service._job_watcher = mock_watcher
 
         status = await service.sync_and_wait(account.id)
 
+        mock_airbyte_client.trigger_sync.assert_awaited_once_with(airbyte_conn_id)
+        mock_watcher.wait_for_job.assert_awaited_once()
         assert status.job_id == "job-456"
         assert status.is_successful is True
         assert status.records_synced == 5000
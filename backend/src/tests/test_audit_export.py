@@ -9,18 +9,28 @@ ACCEPTANCE CRITERIA:
 - CSV and JSON formats
 """
 
+import csv
+import gzip
+import io
 import json
 import uuid
 import pytest
 from datetime import datetime, timezone, timedelta
 from unittest.mock import Mock, MagicMock, patch
 
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
 from src.services.audit_exporter import (
     AuditExporterService,
     ExportFormat,
     ExportResult,
 )
+from src.services.export_store import LocalExportStore
+from src.models.audit_export import AuditExportStatus, GAAuditExport
 from src.models.audit_log import GAAuditLog
+from src.platform.pagination import CountMode
+from src.workers.audit_export_job import AuditExportWorker, claim_next_export
 
 
 # ============================================================================
@@ -230,7 +240,7 @@ class TestExportExecution:
         mock_result.total = 15_000  # Over threshold
         with patch.object(
             exporter._query_service, "query_logs", return_value=mock_result
-        ):
+        ) as mock_query:
             result = exporter.export(
                 tenant_id="tenant-123",
                 fmt=ExportFormat.CSV,
@@ -239,6 +249,8 @@ class TestExportExecution:
         assert result.success is True
         assert result.is_async is True
         assert result.content is None
+        # The threshold is checked against an exact count, never an estimate
+        assert mock_query.call_args.kwargs["count"] == CountMode.EXACT
 
     @patch.object(AuditExporterService, "_audit_export_attempt")
     def test_export_failure_returns_error(self, mock_audit, mock_db):
@@ -330,3 +342,134 @@ class TestExportTenantScoping:
             call_kwargs = mock_query.call_args[1]
             assert call_kwargs["tenant_id"] == "tenant-123"
             assert call_kwargs["is_super_admin"] is False
+
+
+# ============================================================================
+# TEST SUITE: STREAMING EXPORT
+# ============================================================================
+
+@pytest.fixture
+def sqlite_session_factory():
+    engine = create_engine("sqlite:///:memory:")
+    GAAuditLog.__table__.create(bind=engine)
+    GAAuditExport.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    session = factory()
+    base = datetime(2024, 6, 15, tzinfo=timezone.utc)
+    for i in range(25):
+        session.add(GAAuditLog(
+            id=f"log-{i:03d}",
+            event_type="auth.login_success",
+            tenant_id="tenant-123" if i % 5 else "tenant-other",
+            user_id="user-1",
+            event_metadata={"n": i},
+            # Pairs share a timestamp to exercise the (created_at, id) tiebreak
+            created_at=base + timedelta(seconds=i // 2),
+        ))
+    session.commit()
+    session.close()
+    yield factory
+    engine.dispose()
+
+
+class TestStreamingExport:
+    """Keyset-paginated streaming export."""
+
+    @pytest.fixture
+    def exporter(self, sqlite_session_factory):
+        exporter = AuditExporterService(sqlite_session_factory())
+        exporter.EXPORT_PAGE_SIZE = 3
+        exporter.EXPORT_CHUNK_BYTES = 100
+        return exporter
+
+    def test_keyset_pages_cover_every_row_once(self, exporter):
+        rows = list(exporter.iter_export_rows("tenant-123"))
+
+        ids = [row.id for row in rows]
+        assert len(ids) == 20
+        assert ids == sorted(ids)
+
+    def test_super_admin_exports_all_tenants(self, exporter):
+        assert len(list(exporter.iter_export_rows(None, is_super_admin=True))) == 25
+
+    @patch.object(AuditExporterService, "_audit_export_attempt")
+    def test_csv_stream_in_chunks(self, mock_audit, exporter):
+        result, chunks = exporter.stream_export("tenant-123", ExportFormat.CSV)
+        parts = list(chunks)
+
+        reader = list(csv.reader(io.StringIO(b"".join(parts).decode())))
+        assert len(parts) > 1
+        assert reader[0][:2] == ["id", "event_type"]
+        assert len(reader) == 21
+        assert json.loads(reader[1][7]) == {"n": 1}
+        assert mock_audit.call_args.kwargs["record_count"] == 20
+        assert result.record_count == 20
+
+    @patch.object(AuditExporterService, "_audit_export_attempt")
+    def test_json_stream_is_valid_document(self, mock_audit, exporter):
+        _, chunks = exporter.stream_export("tenant-123", ExportFormat.JSON)
+
+        data = json.loads(b"".join(chunks))
+        assert data["count"] == 20
+        assert data["audit_logs"][0]["id"] == "log-001"
+
+    @patch.object(AuditExporterService, "_audit_export_attempt")
+    def test_gzip_ndjson_stream(self, mock_audit, exporter):
+        _, chunks = exporter.stream_export(
+            "tenant-123", ExportFormat.NDJSON, compress=True
+        )
+
+        lines = gzip.decompress(b"".join(chunks)).decode().splitlines()
+        assert len(lines) == 20
+        assert json.loads(lines[-1])["id"] == "log-024"
+
+    @patch.object(AuditExporterService, "_audit_export_attempt")
+    def test_rate_limited_stream_returns_no_iterator(self, mock_audit, exporter):
+        for _ in range(3):
+            exporter._record_export("tenant-123")
+
+        result, chunks = exporter.stream_export("tenant-123")
+
+        assert chunks is None
+        assert "rate limit" in result.error.lower()
+
+
+class TestQueuedExportWorker:
+    """Async exports are queued and produced by the worker."""
+
+    @patch.object(AuditExporterService, "_audit_export_attempt")
+    def test_large_export_is_queued(self, mock_audit, mock_db):
+        exporter = AuditExporterService(mock_db)
+        mock_result = Mock(items=[], total=15_000)
+        with patch.object(
+            exporter._query_service, "query_logs", return_value=mock_result
+        ):
+            result = exporter.export(tenant_id="tenant-123", fmt=ExportFormat.NDJSON)
+
+        queued = mock_db.add.call_args[0][0]
+        assert isinstance(queued, GAAuditExport)
+        assert queued.id == result.export_id
+        assert queued.status == AuditExportStatus.QUEUED.value
+        mock_db.commit.assert_called()
+
+    def test_worker_claims_and_writes_file(self, sqlite_session_factory, tmp_path):
+        session = sqlite_session_factory()
+        session.add(GAAuditExport(
+            id="export-1", tenant_id="tenant-123", format="csv", compress=True,
+            filters={"start_date": "2024-06-15T00:00:05+00:00"},
+        ))
+        session.commit()
+        session.close()
+        store = LocalExportStore(str(tmp_path))
+
+        with patch.object(AuditExporterService, "_audit_export_attempt"):
+            processed = AuditExportWorker(sqlite_session_factory, store)._poll_and_process()
+
+        session = sqlite_session_factory()
+        export = session.get(GAAuditExport, "export-1")
+        assert processed == 1
+        assert export.status == AuditExportStatus.COMPLETED.value
+        assert export.record_count == 12
+        content = gzip.decompress(store.local_path(export.storage_key).read_bytes())
+        assert len(content.decode().splitlines()) == 13
+        assert claim_next_export(session, "worker") is None
@@ -249,9 +249,9 @@ class TestCustomDashboardService:
         service.publish_dashboard(d2.id)
         service.archive_dashboard(d2.id)
 
-        dashboards, total = service.list_dashboards()
-        assert total == 1
-        assert dashboards[0].id == d1.id
+        page = service.list_dashboards()
+        assert page.total == 1
+        assert page.items[0].id == d1.id
 
     def test_update_dashboard_increments_version(self, db_session):
         service = self._service(db_session)
@@ -581,18 +581,17 @@ class TestEntitlementPolicyConfig:
     
     def test_load_config_missing_file(self, mock_db_session, tmp_path):
         """Test loading config when file doesn't exist."""
-        # Temporarily change config path to non-existent file
-        import src.entitlements.policy as policy_module
-        original_path = policy_module.Path
-        
-        # Mock Path to point to non-existent file
-        with patch.object(policy_module.Path, 'exists', return_value=False):
+        from src.config.registry import ConfigRegistry, compile_plans_config
+
+        registry = ConfigRegistry(check_interval_seconds=0)
+        missing = registry.get(tmp_path / "plans.json", compile_plans_config, default=None)
+
+        with patch("src.entitlements.policy.get_plans_config", return_value=missing):
             policy = EntitlementPolicy(mock_db_session)
-            # Clear cache
-            policy._config_cache = None
             config = policy._load_config()
             # Should return empty dict or handle gracefully
             assert isinstance(config, dict)
+            assert policy._grace_period_days == 3
     
     def test_check_plan_feature_enabled(self, mock_db_session, mock_plan_feature_enabled):
         """Test checking plan feature when enabled."""
@@ -0,0 +1,359 @@
+"""
+Tests for the concurrent ingestion job executor.
+
+Covers:
+- Bounded concurrency: up to max_in_flight jobs run at once
+- Per-tenant and per-source-type concurrency caps
+- Cross-process claiming: claimed jobs are not handed out twice
+- Stale claims become reclaimable after the lease expires
+- Retry claiming resets failed jobs to QUEUED
+
+Story: Ingestion Orchestration - Concurrent Executor
+"""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from src.db_base import Base
+from src.ingestion.jobs.dispatcher import (
+    claim_global_queued_jobs,
+    claim_global_failed_jobs_for_retry,
+)
+from src.ingestion.jobs.executor import (
+    ConcurrentJobExecutor,
+    ExecutorConfig,
+    _parse_source_type_limits,
+)
+from src.ingestion.jobs.models import IngestionJob, JobStatus
+from src.ingestion.jobs.runner import JobRunner
+from src.ingestion.airbyte.client import IngestionAirbyteClient, SyncJobResult
+from src.integrations.airbyte.models import AirbyteJobStatus
+from src.models.airbyte_connection import TenantAirbyteConnection
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """File-backed SQLite so each job gets a genuinely separate session."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'executor.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[IngestionJob.__table__, TenantAirbyteConnection.__table__],
+    )
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _add_job(factory, tenant_id, source_type="shopify", status=JobStatus.QUEUED, **kwargs):
+    """Insert a connection and a job for it; returns the job_id."""
+    session = factory()
+    connector_id = f"conn-{uuid.uuid4().hex[:8]}"
+    session.add(TenantAirbyteConnection(
+        id=connector_id,
+        tenant_id=tenant_id,
+        airbyte_connection_id=f"ab-{connector_id}",
+        connection_name="Test",
+        source_type=source_type,
+    ))
+    job = IngestionJob(
+        tenant_id=tenant_id,
+        connector_id=connector_id,
+        external_account_id="acct-1",
+        status=status,
+        retry_count=kwargs.pop("retry_count", 0),
+        **kwargs,
+    )
+    session.add(job)
+    session.commit()
+    job_id = job.job_id
+    session.close()
+    return job_id
+
+
+class _GatedAirbyteClient:
+    """Fake Airbyte client whose syncs block until released."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+        self.release = asyncio.Event()
+
+    async def trigger_sync(self, airbyte_connection_id, connector_id, external_account_id=None):
+        return SyncJobResult(
+            run_id=f"run-{connector_id}",
+            connection_id=airbyte_connection_id,
+            started_at=datetime.now(timezone.utc),
+        )
+
+    async def wait_for_sync(self, run_id, connection_id, timeout_seconds):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await self.release.wait()
+        finally:
+            self.running -= 1
+        return SyncJobResult(
+            run_id=run_id,
+            connection_id=connection_id,
+            started_at=datetime.now(timezone.utc),
+            status=AirbyteJobStatus.SUCCEEDED,
+        )
+
+
+async def _run_until_idle(executor, client, coro, settle_rounds=20):
+    """Run ``coro`` while releasing gated syncs once the pool is saturated."""
+    task = asyncio.create_task(coro)
+    for _ in range(settle_rounds):
+        await asyncio.sleep(0)
+    client.release.set()
+    return await task
+
+
+@pytest.fixture(autouse=True)
+def _patch_runner_lookups():
+    with patch.object(JobRunner, "_check_entitlement", return_value=True), \
+         patch.object(
+             JobRunner,
+             "_get_airbyte_connection_id",
+             side_effect=lambda tenant_id, connector_id: f"ab-{connector_id}",
+         ):
+        yield
+
+
+# =============================================================================
+# Concurrency
+# =============================================================================
+
+class TestConcurrentExecution:
+    """Jobs run in parallel up to the configured caps."""
+
+    @pytest.mark.asyncio
+    async def test_runs_jobs_concurrently_up_to_max_in_flight(self, session_factory):
+        for i in range(5):
+            _add_job(session_factory, tenant_id=f"tenant-{i}")
+
+        client = _GatedAirbyteClient()
+        executor = ConcurrentJobExecutor(
+            session_factory=session_factory,
+            airbyte_client=client,
+            config=ExecutorConfig(max_in_flight=3, max_per_tenant=0),
+            worker_id="worker-a",
+        )
+
+        processed = await _run_until_idle(
+            executor, client, executor.process_queued_jobs(limit=5)
+        )
+
+        assert processed == 5
+        assert client.peak == 3
+
+        session = session_factory()
+        jobs = session.query(IngestionJob).all()
+        assert {job.status for job in jobs} == {JobStatus.SUCCESS}
+        assert all(job.claimed_by is None for job in jobs)
+        session.close()
+
+    @pytest.mark.asyncio
+    async def test_per_tenant_cap_limits_parallelism(self, session_factory):
+        for _ in range(3):
+            _add_job(session_factory, tenant_id="tenant-busy")
+
+        client = _GatedAirbyteClient()
+        executor = ConcurrentJobExecutor(
+            session_factory=session_factory,
+            airbyte_client=client,
+            config=ExecutorConfig(max_in_flight=5, max_per_tenant=1),
+            worker_id="worker-a",
+        )
+
+        processed = await _run_until_idle(
+            executor, client, executor.process_queued_jobs(limit=3)
+        )
+
+        assert processed == 3
+        assert client.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_source_type_cap_limits_parallelism(self, session_factory):
+        for i in range(3):
+            _add_job(session_factory, tenant_id=f"tenant-{i}", source_type="shopify")
+        _add_job(session_factory, tenant_id="tenant-ads", source_type="meta_ads")
+
+        client = _GatedAirbyteClient()
+        executor = ConcurrentJobExecutor(
+            session_factory=session_factory,
+            airbyte_client=client,
+            config=ExecutorConfig(
+                max_in_flight=5,
+                max_per_tenant=0,
+                source_type_limits={"shopify": 1},
+            ),
+            worker_id="worker-a",
+        )
+
+        processed = await _run_until_idle(
+            executor, client, executor.process_queued_jobs(limit=4)
+        )
+
+        assert processed == 4
+        # One shopify sync plus the meta_ads sync
+        assert client.peak == 2
+
+    @pytest.mark.asyncio
+    async def test_unexpected_error_marks_job_failed(self, session_factory):
+        job_id = _add_job(session_factory, tenant_id="tenant-1")
+
+        client = MagicMock(spec=IngestionAirbyteClient)
+        client.trigger_sync.side_effect = RuntimeError("boom")
+        executor = ConcurrentJobExecutor(
+            session_factory=session_factory,
+            airbyte_client=client,
+            config=ExecutorConfig(max_in_flight=2),
+            worker_id="worker-a",
+        )
+
+        processed = await executor.process_queued_jobs(limit=1)
+
+        assert processed == 1
+        session = session_factory()
+        job = session.get(IngestionJob, job_id)
+        assert job.status == JobStatus.FAILED
+        assert job.error_code == "unknown"
+        assert job.claimed_by is None
+        session.close()
+
+    @pytest.mark.asyncio
+    async def test_empty_queue_returns_zero(self, session_factory):
+        executor = ConcurrentJobExecutor(
+            session_factory=session_factory,
+            airbyte_client=_GatedAirbyteClient(),
+            config=ExecutorConfig(),
+            worker_id="worker-a",
+        )
+
+        assert await executor.process_queued_jobs(limit=5) == 0
+
+
+# =============================================================================
+# Claiming
+# =============================================================================
+
+class TestJobClaiming:
+    """Claims keep executors from double-running a job."""
+
+    def test_claimed_job_not_claimed_again(self, session_factory):
+        _add_job(session_factory, tenant_id="tenant-1")
+
+        first = claim_global_queued_jobs(session_factory(), worker_id="worker-a")
+        second = claim_global_queued_jobs(session_factory(), worker_id="worker-b")
+
+        assert len(first) == 1
+        assert first[0][1] == "shopify"
+        assert second == []
+
+    def test_stale_claim_is_reclaimable(self, session_factory):
+        _add_job(
+            session_factory,
+            tenant_id="tenant-1",
+            claimed_by="worker-dead",
+            claimed_at=datetime.now(timezone.utc) - timedelta(hours=1),
+        )
+
+        claimed = claim_global_queued_jobs(
+            session_factory(), worker_id="worker-b", lease_seconds=600
+        )
+
+        assert len(claimed) == 1
+        assert claimed[0][0].claimed_by == "worker-b"
+
+    def test_claim_filter_rejects_candidates(self, session_factory):
+        _add_job(session_factory, tenant_id="tenant-1")
+        _add_job(session_factory, tenant_id="tenant-2")
+
+        claimed = claim_global_queued_jobs(
+            session_factory(),
+            worker_id="worker-a",
+            can_claim=lambda job, source_type: job.tenant_id == "tenant-2",
+        )
+
+        assert [job.tenant_id for job, _ in claimed] == ["tenant-2"]
+
+    def test_retry_claim_resets_to_queued(self, session_factory):
+        job_id = _add_job(
+            session_factory,
+            tenant_id="tenant-1",
+            status=JobStatus.FAILED,
+            retry_count=1,
+            next_retry_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+
+        claimed = claim_global_failed_jobs_for_retry(session_factory(), worker_id="worker-a")
+
+        assert len(claimed) == 1
+        session = session_factory()
+        job = session.get(IngestionJob, job_id)
+        assert job.status == JobStatus.QUEUED
+        assert job.next_retry_at is None
+        assert job.claimed_by == "worker-a"
+        session.close()
+
+    def test_retry_claim_skips_connector_with_active_job(self, session_factory):
+        job_id = _add_job(
+            session_factory,
+            tenant_id="tenant-1",
+            status=JobStatus.FAILED,
+            retry_count=1,
+            next_retry_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+        )
+        session = session_factory()
+        # SQLite ignores the partial predicate of the active-job unique index
+        session.execute(text("DROP INDEX ix_ingestion_jobs_active_unique"))
+        failed = session.get(IngestionJob, job_id)
+        session.add(IngestionJob(
+            tenant_id="tenant-1",
+            connector_id=failed.connector_id,
+            external_account_id="acct-1",
+            status=JobStatus.RUNNING,
+        ))
+        session.commit()
+        session.close()
+
+        claimed = claim_global_failed_jobs_for_retry(session_factory(), worker_id="worker-a")
+
+        assert claimed == []
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+class TestExecutorConfig:
+    """Tests for ExecutorConfig parsing."""
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("WORKER_MAX_CONCURRENT_SYNCS", "8")
+        monkeypatch.setenv("WORKER_MAX_SYNCS_PER_TENANT", "3")
+        monkeypatch.setenv("WORKER_SOURCE_TYPE_SYNC_LIMITS", "shopify=4, meta_ads=2")
+
+        config = ExecutorConfig.from_env()
+
+        assert config.max_in_flight == 8
+        assert config.max_per_tenant == 3
+        assert config.limit_for_source_type("shopify") == 4
+        assert config.limit_for_source_type("meta_ads") == 2
+        assert config.limit_for_source_type("google_ads") == 0
+
+    def test_malformed_source_type_limits_ignored(self):
+        assert _parse_source_type_limits("shopify=3,bad,meta=x") == {"shopify": 3}
@@ -244,11 +244,15 @@ class TestTriggerInitialSync:
             duration_seconds=120.0,
         )
 
-        with patch("src.services.shopify_ingestion.get_airbyte_client") as mock_get_client:
+        with patch("src.services.shopify_ingestion.get_airbyte_client") as mock_get_client, \
+             patch("src.services.shopify_ingestion.watcher_for_client") as mock_get_watcher:
             mock_client = AsyncMock()
-            mock_client.sync_and_wait = AsyncMock(return_value=mock_sync_result)
+            mock_client.trigger_sync = AsyncMock(return_value="job-123")
             mock_client.close = AsyncMock()
             mock_get_client.return_value = mock_client
+            mock_get_watcher.return_value.wait_for_job = AsyncMock(
+                return_value=mock_sync_result
+            )
 
             result = await ingestion_service.trigger_initial_sync(
                 connection_id=mock_connection_info.id,
@@ -260,6 +264,7 @@ class TestTriggerInitialSync:
             assert result.records_synced == 1000
             assert result.bytes_synced == 5000000
             ingestion_service._airbyte_service.record_sync_success.assert_called_once()
+            mock_get_watcher.assert_called_once_with(mock_client)
 
     @pytest.mark.asyncio
     async def test_trigger_sync_success_no_wait(
@@ -314,11 +319,15 @@ class TestTriggerInitialSync:
             error_message="Sync failed",
         )
 
-        with patch("src.services.shopify_ingestion.get_airbyte_client") as mock_get_client:
+        with patch("src.services.shopify_ingestion.get_airbyte_client") as mock_get_client, \
+             patch("src.services.shopify_ingestion.watcher_for_client") as mock_get_watcher:
             mock_client = AsyncMock()
-            mock_client.sync_and_wait = AsyncMock(return_value=mock_sync_result)
+            mock_client.trigger_sync = AsyncMock(return_value="job-123")
             mock_client.close = AsyncMock()
             mock_get_client.return_value = mock_client
+            mock_get_watcher.return_value.wait_for_job = AsyncMock(
+                return_value=mock_sync_result
+            )
 
             result = await ingestion_service.trigger_initial_sync(
                 connection_id=mock_connection_info.id,
@@ -333,13 +342,15 @@ class TestTriggerInitialSync:
         self, ingestion_service, mock_connection_info
     ):
         """Should raise SyncExecutionError when Airbyte API error occurs."""
-        with patch("src.services.shopify_ingestion.get_airbyte_client") as mock_get_client:
+        with patch("src.services.shopify_ingestion.get_airbyte_client") as mock_get_client, \
+             patch("src.services.shopify_ingestion.watcher_for_client") as mock_get_watcher:
             mock_client = AsyncMock()
-            mock_client.sync_and_wait = AsyncMock(
-                side_effect=AirbyteSyncError("Sync timeout", job_id="job-123")
-            )
+            mock_client.trigger_sync = AsyncMock(return_value="job-123")
             mock_client.close = AsyncMock()
             mock_get_client.return_value = mock_client
+            mock_get_watcher.return_value.wait_for_job = AsyncMock(
+                side_effect=AirbyteSyncError("Sync timeout", job_id="job-123")
+            )
 
             with pytest.raises(SyncExecutionError, match="Sync failed"):
                 await ingestion_service.trigger_initial_sync(
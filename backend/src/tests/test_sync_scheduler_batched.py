@@ -0,0 +1,295 @@
+"""
+Tests for the set-based (batched) sync scheduler.
+
+Covers:
+- SyncPlanResolver.resolve_plan_tiers: one query for many tenants
+- run_scheduler_batched: due/not-due per plan tier, active-job anti-join,
+  per-tenant entitlement memoization, multi-row job insert
+- Parity with the per-connection scheduler on the same data
+
+Story: Ingestion Orchestration - Batched Scheduler
+"""
+
+import uuid
+from datetime import datetime, timezone, timedelta
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from src.db_base import Base
+from src.ingestion.jobs.models import IngestionJob, JobStatus
+from src.models.airbyte_connection import TenantAirbyteConnection
+from src.models.plan import Plan, PlanFeature
+from src.models.subscription import Subscription, SubscriptionStatus
+from src.services.sync_plan_resolver import SyncPlanResolver
+from src.workers import sync_scheduler
+from src.workers.sync_scheduler import run_scheduler_batched
+
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(
+        bind=engine,
+        tables=[
+            Plan.__table__,
+            PlanFeature.__table__,
+            Subscription.__table__,
+            TenantAirbyteConnection.__table__,
+            IngestionJob.__table__,
+        ],
+    )
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(db_session):
+    """Record every SQL statement issued on the session's engine."""
+    issued = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        issued.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    yield issued
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+def _add_plan(session, name, features=("premium_analytics",)):
+    plan = Plan(id=f"plan_{name}", name=name, display_name=name.title(), is_active=True)
+    session.add(plan)
+    for feature in features:
+        session.add(PlanFeature(
+            id=str(uuid.uuid4()),
+            plan_id=plan.id,
+            feature_key=feature,
+            is_enabled=True,
+        ))
+    session.flush()
+    return plan
+
+
+def _subscribe(session, tenant_id, plan, status=SubscriptionStatus.ACTIVE.value):
+    session.add(Subscription(tenant_id=tenant_id, plan_id=plan.id, status=status))
+    session.flush()
+
+
+def _add_connection(session, tenant_id, last_sync_at=None, source_type="shopify"):
+    conn = TenantAirbyteConnection(
+        id=f"conn-{uuid.uuid4().hex[:8]}",
+        tenant_id=tenant_id,
+        airbyte_connection_id=f"ab-{uuid.uuid4().hex[:8]}",
+        connection_name="Test",
+        source_type=source_type,
+        last_sync_at=last_sync_at,
+    )
+    session.add(conn)
+    session.flush()
+    return conn
+
+
+def _queued_jobs(session):
+    return session.query(IngestionJob).filter(
+        IngestionJob.status == JobStatus.QUEUED
+    ).all()
+
+
+# =============================================================================
+# Bulk tier resolution
+# =============================================================================
+
+class TestResolvePlanTiers:
+    """SyncPlanResolver bulk lookups."""
+
+    def test_resolves_tiers_in_one_query(self, db_session, statements):
+        growth = _add_plan(db_session, "growth")
+        pro = _add_plan(db_session, "pro")
+        _subscribe(db_session, "tenant-growth", growth)
+        _subscribe(db_session, "tenant-pro", pro)
+        db_session.commit()
+        statements.clear()
+
+        tiers = SyncPlanResolver(db_session).resolve_plan_tiers(
+            ["tenant-growth", "tenant-pro", "tenant-none"]
+        )
+
+        assert tiers == {"tenant-growth": 1, "tenant-pro": 2, "tenant-none": 0}
+        assert len(statements) == 1
+
+    def test_ignores_inactive_subscriptions(self, db_session):
+        enterprise = _add_plan(db_session, "enterprise")
+        _subscribe(
+            db_session, "tenant-1", enterprise, status=SubscriptionStatus.CANCELLED.value
+        )
+        db_session.commit()
+
+        intervals = SyncPlanResolver(db_session).get_sync_intervals(["tenant-1"])
+
+        assert intervals == {"tenant-1": 1440}
+
+
+# =============================================================================
+# Batched scheduler
+# =============================================================================
+
+class TestRunSchedulerBatched:
+    """run_scheduler_batched() dispatch behaviour."""
+
+    def test_dispatches_due_connections_by_plan_tier(self, db_session):
+        growth = _add_plan(db_session, "growth")
+        enterprise = _add_plan(db_session, "enterprise")
+        _subscribe(db_session, "tenant-growth", growth)
+        _subscribe(db_session, "tenant-ent", enterprise)
+
+        never = _add_connection(db_session, "tenant-growth", last_sync_at=None)
+        _add_connection(db_session, "tenant-growth", last_sync_at=NOW - timedelta(hours=2))
+        ent_due = _add_connection(db_session, "tenant-ent", last_sync_at=NOW - timedelta(hours=2))
+        _add_connection(db_session, "tenant-ent", last_sync_at=NOW - timedelta(minutes=30))
+        db_session.commit()
+
+        stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.jobs_dispatched == 2
+        assert stats.jobs_skipped_not_due == 1  # growth synced 2h ago
+        assert stats.errors == 0
+        jobs = _queued_jobs(db_session)
+        assert {job.connector_id for job in jobs} == {never.id, ent_due.id}
+        job = next(j for j in jobs if j.connector_id == never.id)
+        assert job.external_account_id == never.airbyte_connection_id
+        assert job.job_metadata["trigger"] == "scheduler"
+        assert job.job_metadata["source_type"] == "shopify"
+
+    def test_skips_connections_with_active_job(self, db_session):
+        pro = _add_plan(db_session, "pro")
+        _subscribe(db_session, "tenant-1", pro)
+        busy = _add_connection(db_session, "tenant-1")
+        idle = _add_connection(db_session, "tenant-1")
+        db_session.add(IngestionJob(
+            tenant_id="tenant-1",
+            connector_id=busy.id,
+            external_account_id="acct",
+            status=JobStatus.RUNNING,
+        ))
+        db_session.commit()
+
+        stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.jobs_dispatched == 1
+        assert [job.connector_id for job in _queued_jobs(db_session)] == [idle.id]
+
+    def test_non_entitled_tenant_skipped(self, db_session):
+        free = _add_plan(db_session, "free", features=())
+        pro = _add_plan(db_session, "pro")
+        _subscribe(db_session, "tenant-free", free)
+        _subscribe(db_session, "tenant-pro", pro)
+        _add_connection(db_session, "tenant-free")
+        _add_connection(db_session, "tenant-free")
+        allowed = _add_connection(db_session, "tenant-pro")
+        db_session.commit()
+
+        stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.jobs_dispatched == 1
+        assert stats.jobs_skipped_entitlement == 2
+        assert [job.connector_id for job in _queued_jobs(db_session)] == [allowed.id]
+
+    def test_entitlement_evaluated_once_per_tenant(self, db_session):
+        pro = _add_plan(db_session, "pro")
+        _subscribe(db_session, "tenant-1", pro)
+        for _ in range(5):
+            _add_connection(db_session, "tenant-1")
+        db_session.commit()
+
+        with patch(
+            "src.jobs.job_entitlements.JobEntitlementChecker.check_job_entitlement",
+            autospec=True,
+        ) as mock_check:
+            mock_check.return_value.is_allowed = True
+            stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.jobs_dispatched == 5
+        assert mock_check.call_count == 1
+
+    def test_query_count_independent_of_connection_count(self, db_session, statements):
+        pro = _add_plan(db_session, "pro")
+        for i in range(40):
+            _subscribe(db_session, f"tenant-{i}", pro)
+            _add_connection(db_session, f"tenant-{i}")
+        db_session.commit()
+        statements.clear()
+
+        with patch.object(sync_scheduler, "_check_entitlements", side_effect=lambda db, ids: {
+            tenant_id: True for tenant_id in ids
+        }):
+            stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.jobs_dispatched == 40
+        inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+        # Candidates + tiers + one multi-row INSERT (plus savepoint bookkeeping)
+        assert len(inserts) == 1
+        assert len(statements) <= 6
+
+    def test_conflicting_chunk_falls_back_to_row_inserts(self, db_session):
+        pro = _add_plan(db_session, "pro")
+        _subscribe(db_session, "tenant-1", pro)
+        first = _add_connection(db_session, "tenant-1")
+        second = _add_connection(db_session, "tenant-1")
+        db_session.commit()
+
+        real_candidates = sync_scheduler._get_schedulable_connections
+
+        def _candidates_then_race(session, now):
+            rows = real_candidates(session, now)
+            # Another dispatcher queues a job for the first connection
+            session.add(IngestionJob(
+                tenant_id="tenant-1",
+                connector_id=first.id,
+                external_account_id="acct",
+                status=JobStatus.QUEUED,
+            ))
+            session.flush()
+            return rows
+
+        with patch.object(
+            sync_scheduler, "_get_schedulable_connections", side_effect=_candidates_then_race
+        ):
+            stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.jobs_dispatched == 1
+        assert stats.jobs_skipped_active == 1
+        connector_ids = sorted(job.connector_id for job in _queued_jobs(db_session))
+        assert connector_ids == sorted([first.id, second.id])
+
+    def test_disabled_connections_ignored(self, db_session):
+        pro = _add_plan(db_session, "pro")
+        _subscribe(db_session, "tenant-1", pro)
+        conn = _add_connection(db_session, "tenant-1")
+        conn.is_enabled = False
+        db_session.commit()
+
+        stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.connections_evaluated == 0
+        assert stats.jobs_dispatched == 0
+
+    def test_error_rolls_back_and_counts(self, db_session):
+        with patch.object(
+            sync_scheduler, "_get_schedulable_connections", side_effect=RuntimeError("db down")
+        ):
+            stats = run_scheduler_batched(db_session, now=NOW)
+
+        assert stats.errors == 1
+        assert stats.jobs_dispatched == 0
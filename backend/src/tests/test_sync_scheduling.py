@@ -483,6 +483,20 @@ class TestSyncExecutor:
         assert result["total_errors"] == 1
         assert "uptime_seconds" in result
 
+    def test_pool_sized_for_max_concurrent_syncs(self, monkeypatch):
+        from src.workers import sync_executor
+
+        monkeypatch.setenv("DATABASE_URL", "postgresql://localhost/test")
+        monkeypatch.setenv("WORKER_MAX_CONCURRENT_SYNCS", "8")
+        monkeypatch.setattr(sync_executor, "_session_factory", None)
+
+        with patch("src.workers.sync_executor.create_engine") as mock_create:
+            sync_executor._get_session_factory()
+
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["pool_size"] == 10
+        assert kwargs["max_overflow"] == 8
+
 
 # =============================================================================
 # Scheduler Stats Tests
@@ -0,0 +1,318 @@
+"""
+Unit tests for the shared Airbyte job watcher.
+
+Tests cover:
+- Batched status lookups for all watched jobs in one listing call
+- Per-job reconcile lookups for jobs missing from the listing
+- Fallback to per-job lookups when listing is unsupported
+- Webhook push completion
+- Timeouts and callbacks
+- IngestionAirbyteClient.wait_for_sync delegating to the watcher
+- One shared watcher per Airbyte account, and the webhook route
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.integrations.airbyte.client import AirbyteClient
+from src.integrations.airbyte.exceptions import AirbyteNotFoundError, AirbyteSyncError
+from src.integrations.airbyte.job_watcher import (
+    AirbyteJobWatcher,
+    get_job_watcher,
+    reset_job_watchers,
+    watcher_for_client,
+)
+from src.integrations.airbyte.models import (
+    AirbyteJob,
+    AirbyteJobAttempt,
+    AirbyteJobStatus,
+)
+
+
+def _job(job_id, status, records=0, bytes_synced=0):
+    attempts = []
+    if records or bytes_synced:
+        attempts = [AirbyteJobAttempt(
+            attempt_number=0,
+            status=status,
+            records_synced=records,
+            bytes_synced=bytes_synced,
+        )]
+    return AirbyteJob(
+        job_id=job_id,
+        config_type="sync",
+        config_id="conn-1",
+        status=status,
+        attempts=attempts,
+    )
+
+
+@pytest.fixture
+def mock_client():
+    client = MagicMock(spec=AirbyteClient)
+    client.list_jobs = AsyncMock(return_value=[])
+    client.get_job = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def watcher(mock_client):
+    return AirbyteJobWatcher(
+        client=mock_client,
+        poll_interval_seconds=3600,  # drive ticks manually via poll_once
+        reconcile_after_seconds=3600,
+    )
+
+
+class TestBatchedLookups:
+    """Tests for batched status refresh."""
+
+    @pytest.mark.asyncio
+    async def test_single_listing_resolves_all_watched_jobs(self, watcher, mock_client):
+        first = watcher.subscribe("job-1", connection_id="conn-a")
+        second = watcher.subscribe("job-2", connection_id="conn-b")
+        mock_client.list_jobs.return_value = [
+            _job("job-1", AirbyteJobStatus.SUCCEEDED, records=10, bytes_synced=100),
+            _job("job-2", AirbyteJobStatus.FAILED),
+            _job("job-unrelated", AirbyteJobStatus.SUCCEEDED),
+        ]
+
+        completed = await watcher.poll_once()
+
+        assert completed == 2
+        mock_client.list_jobs.assert_awaited_once()
+        mock_client.get_job.assert_not_awaited()
+        assert first.result().is_successful is True
+        assert first.result().records_synced == 10
+        assert first.result().connection_id == "conn-a"
+        assert second.result().status == AirbyteJobStatus.FAILED
+        assert watcher.watched_job_ids == []
+
+    @pytest.mark.asyncio
+    async def test_running_jobs_stay_watched(self, watcher, mock_client):
+        future = watcher.subscribe("job-1")
+        mock_client.list_jobs.return_value = [_job("job-1", AirbyteJobStatus.RUNNING)]
+
+        completed = await watcher.poll_once()
+
+        assert completed == 0
+        assert not future.done()
+        assert watcher.watched_job_ids == ["job-1"]
+        await watcher.close()
+
+    @pytest.mark.asyncio
+    async def test_unseen_job_reconciled_individually(self, mock_client):
+        watcher = AirbyteJobWatcher(
+            client=mock_client,
+            poll_interval_seconds=3600,
+            reconcile_after_seconds=0,
+        )
+        future = watcher.subscribe("job-1")
+        mock_client.get_job.return_value = _job("job-1", AirbyteJobStatus.SUCCEEDED)
+
+        await watcher.poll_once()
+
+        mock_client.get_job.assert_awaited_once_with("job-1")
+        assert future.result().is_successful is True
+
+    @pytest.mark.asyncio
+    async def test_listing_not_supported_falls_back_to_get_job(self, watcher, mock_client):
+        future = watcher.subscribe("job-1")
+        mock_client.list_jobs.side_effect = AirbyteNotFoundError("no such endpoint")
+        mock_client.get_job.return_value = _job("job-1", AirbyteJobStatus.CANCELLED)
+
+        await watcher.poll_once()
+
+        mock_client.get_job.assert_awaited_once_with("job-1")
+        assert future.result().status == AirbyteJobStatus.CANCELLED
+
+        # Subsequent ticks skip the listing entirely
+        watcher.subscribe("job-2")
+        mock_client.get_job.return_value = _job("job-2", AirbyteJobStatus.SUCCEEDED)
+        await watcher.poll_once()
+        assert mock_client.list_jobs.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_background_task_polls_and_exits(self, mock_client):
+        watcher = AirbyteJobWatcher(client=mock_client, poll_interval_seconds=0.01)
+        mock_client.list_jobs.return_value = [_job("job-1", AirbyteJobStatus.SUCCEEDED)]
+
+        result = await watcher.wait_for_job("job-1", timeout_seconds=5)
+
+        assert result.is_successful is True
+        await asyncio.sleep(0.05)
+        assert watcher._task.done()
+
+
+class TestPushAndTimeouts:
+    """Tests for webhook completion, callbacks and timeouts."""
+
+    @pytest.mark.asyncio
+    async def test_webhook_resolves_waiter(self, watcher):
+        future = watcher.subscribe("123")
+
+        resolved = watcher.handle_webhook({
+            "data": {
+                "jobId": 123,
+                "success": True,
+                "connection": {"id": "conn-1"},
+                "recordsCommitted": 42,
+                "bytesEmitted": 4200,
+            }
+        })
+
+        assert resolved is True
+        result = future.result()
+        assert result.is_successful is True
+        assert result.records_synced == 42
+        assert result.bytes_synced == 4200
+
+    @pytest.mark.asyncio
+    async def test_webhook_for_unwatched_job_ignored(self, watcher):
+        assert watcher.handle_webhook({"jobId": "999", "status": "succeeded"}) is False
+        assert watcher.handle_webhook({"success": True}) is False
+
+    @pytest.mark.asyncio
+    async def test_callback_invoked_on_completion(self, watcher):
+        received = []
+        watcher.subscribe("job-1", callback=received.append)
+
+        watcher.handle_job_update(_job("job-1", AirbyteJobStatus.SUCCEEDED))
+
+        assert len(received) == 1
+        assert received[0].job_id == "job-1"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_job_timeout(self, watcher):
+        with pytest.raises(AirbyteSyncError, match="timed out"):
+            await watcher.wait_for_job("job-1", timeout_seconds=0.05)
+
+        assert watcher.watched_job_ids == []
+
+
+class TestIngestionClientUsesWatcher:
+    """IngestionAirbyteClient.wait_for_sync subscribes to the watcher."""
+
+    @pytest.mark.asyncio
+    async def test_wait_for_sync_delegates_to_watcher(self, watcher):
+        import src.ingestion.jobs  # noqa: F401 - resolve import order
+        from src.ingestion.airbyte.client import IngestionAirbyteClient
+
+        client = IngestionAirbyteClient(job_watcher=watcher)
+        task = asyncio.create_task(
+            client.wait_for_sync(run_id="job-1", connection_id="conn-1")
+        )
+        await asyncio.sleep(0)
+        watcher.handle_job_update(
+            _job("job-1", AirbyteJobStatus.SUCCEEDED, records=5, bytes_synced=50)
+        )
+
+        result = await task
+
+        assert result.status == AirbyteJobStatus.SUCCEEDED
+        assert result.records_synced == 5
+        assert result.error_category is None
+
+
+class TestSharedWatchers:
+    """watcher_for_client shares one watcher per Airbyte account."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_registry(self, monkeypatch):
+        monkeypatch.setenv("AIRBYTE_API_TOKEN", "token-a")
+        monkeypatch.setenv("AIRBYTE_WORKSPACE_ID", "ws-1")
+        monkeypatch.delenv("AIRBYTE_BASE_URL", raising=False)
+        reset_job_watchers()
+        yield
+        reset_job_watchers()
+
+    @pytest.mark.asyncio
+    async def test_clients_for_same_account_share_watcher(self):
+        first, second = AirbyteClient(), AirbyteClient()
+        other = AirbyteClient(api_token="token-b")
+
+        assert watcher_for_client(first) is watcher_for_client(second)
+        assert watcher_for_client(first) is get_job_watcher()
+        assert watcher_for_client(other) is not get_job_watcher()
+        for client in (first, second, other):
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_ingestion_client_uses_shared_watcher(self):
+        import src.ingestion.jobs  # noqa: F401 - resolve import order
+        from src.ingestion.airbyte.client import IngestionAirbyteClient
+
+        client = IngestionAirbyteClient(airbyte_client=AirbyteClient())
+
+        assert client._get_job_watcher() is get_job_watcher()
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_replaced(self):
+        client = AirbyteClient()
+        watcher = watcher_for_client(client)
+        await client.close()
+
+        replacement = watcher._get_client()
+
+        assert replacement is not client
+        assert replacement.api_token == "token-a"
+        await replacement.close()
+
+    def test_webhook_route(self, monkeypatch):
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+
+        from src.api.routes import webhooks_airbyte
+
+        app = FastAPI()
+        app.include_router(webhooks_airbyte.router)
+        http = TestClient(app)
+        body = {"data": {"jobId": 1, "success": True}}
+
+        assert http.post("/api/webhooks/airbyte", json=body).status_code == 404
+
+        monkeypatch.setenv("AIRBYTE_WEBHOOK_SECRET", "s3cret")
+        with patch.object(webhooks_airbyte, "handle_webhook", return_value=True) as handle:
+            assert http.post("/api/webhooks/airbyte?token=nope", json=body).status_code == 401
+            response = http.post("/api/webhooks/airbyte?token=s3cret", json=body)
+
+        assert response.json() == {"received": True, "resolved": True}
+        handle.assert_called_once_with(body)
+
+
+class TestListJobs:
+    """Tests for AirbyteClient.list_jobs."""
+
+    @pytest.mark.asyncio
+    async def test_list_jobs_params_and_parsing(self, monkeypatch):
+        from datetime import datetime, timezone
+
+        monkeypatch.setenv("AIRBYTE_API_TOKEN", "test-token")
+        monkeypatch.setenv("AIRBYTE_WORKSPACE_ID", "ws-1")
+        client = AirbyteClient()
+
+        with patch.object(client, "_request", new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {
+                "data": [{
+                    "jobId": 7,
+                    "status": "succeeded",
+                    "jobType": "sync",
+                    "connectionId": "conn-1",
+                    "rowsSynced": 12,
+                    "bytesSynced": 340,
+                }]
+            }
+
+            jobs = await client.list_jobs(
+                updated_at_start=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            )
+
+        params = mock_request.call_args.kwargs["params"]
+        assert params["workspaceIds"] == "ws-1"
+        assert params["updatedAtStart"] == "2026-01-01T00:00:00Z"
+        assert jobs[0].job_id == "7"
+        assert jobs[0].config_id == "conn-1"
+        assert jobs[0].sync_totals == (12, 340)
@@ -0,0 +1,427 @@
+"""
+Tests for rate-limited, batched action execution.
+
+Tests cover:
+- TokenBucket waits for budget and honours pause()
+- BasePlatformExecutor.execute_actions batching, per-item fallback and ordering
+- Native batch request building/parsing for Meta, Google Ads and Shopify
+- ActionExecutionService.execute_batch waves, batched state capture and
+  idempotency/rollback bookkeeping
+"""
+
+import json
+import time
+import uuid
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import httpx
+import pytest
+
+from src.models.ai_action import AIAction, ActionStatus, ActionType, ActionTargetEntityType
+from src.services.action_execution_service import ActionExecutionService
+from src.services.action_safety_service import RateLimitStatus, SafetyCheckResult
+from src.services.platform_executors import (
+    ActionRequest,
+    BasePlatformExecutor,
+    ExecutionResult,
+    GoogleAdsCredentials,
+    GoogleAdsExecutor,
+    MetaAdsExecutor,
+    MetaCredentials,
+    RetryConfig,
+    ShopifyCredentials,
+    ShopifyExecutor,
+    StateCapture,
+    TokenBucket,
+)
+from src.services.platform_executors.rate_limiter import reset_token_buckets
+
+
+@pytest.fixture(autouse=True)
+def _fresh_buckets():
+    reset_token_buckets()
+    yield
+    reset_token_buckets()
+
+
+def _request(entity_id="c1", action_type="pause_campaign", params=None):
+    return ActionRequest(
+        action_type=action_type,
+        entity_id=entity_id,
+        entity_type="campaign",
+        params=params or {},
+        idempotency_key=f"key-{entity_id}",
+    )
+
+
+class FakeExecutor(BasePlatformExecutor):
+    """In-memory executor with a native batch path."""
+
+    platform_name = "fake"
+    max_batch_size = 10
+
+    def __init__(self, batch_results=None):
+        super().__init__(RetryConfig(max_retries=0))
+        self.batch_results = batch_results
+        self.batches = []
+        self.single_calls = []
+        self.state_reads = []
+        self.state = {}
+
+    def validate_credentials(self):
+        return True
+
+    async def get_entity_state(self, entity_id, entity_type):
+        self.state_reads.append([entity_id])
+        return StateCapture(entity_id, entity_type, self.platform_name, dict(self.state.get(entity_id, {"status": "ACTIVE"})))
+
+    async def get_entity_states(self, entities):
+        self.state_reads.append([entity_id for entity_id, _ in entities])
+        return {
+            (entity_id, entity_type): StateCapture(
+                entity_id, entity_type, self.platform_name,
+                dict(self.state.get(entity_id, {"status": "ACTIVE"})),
+            )
+            for entity_id, entity_type in entities
+        }
+
+    async def _execute_action_impl(self, action_type, entity_id, entity_type, params, idempotency_key):
+        self.single_calls.append((entity_id, idempotency_key))
+        self.state[entity_id] = {"status": "PAUSED"}
+        return ExecutionResult.success_result(message="single")
+
+    async def _execute_batch_impl(self, requests):
+        self.batches.append([(r.entity_id, r.idempotency_key) for r in requests])
+        if self.batch_results is not None:
+            return self.batch_results(requests)
+        for r in requests:
+            self.state[r.entity_id] = {"status": "PAUSED"}
+        return [ExecutionResult.success_result(message="batched") for _ in requests]
+
+    def generate_rollback_params(self, action_type, before_state):
+        return {"status": before_state.get("status")}
+
+
+class TestTokenBucket:
+    """Per-account request budget."""
+
+    async def test_waits_when_empty(self):
+        bucket = TokenBucket(rate_per_second=20, capacity=1)
+        await bucket.acquire()
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    async def test_pause_blocks_acquirers(self):
+        bucket = TokenBucket(rate_per_second=1000, capacity=10)
+        bucket.pause(0.05)
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+
+    async def test_concurrency_shared_per_account(self):
+        from src.services.platform_executors.rate_limiter import get_token_bucket
+
+        bucket = get_token_bucket("meta", "act_1")
+
+        assert bucket.concurrency() is get_token_bucket("meta", "act_1").concurrency()
+        assert bucket.concurrency() is not get_token_bucket("meta", "act_2").concurrency()
+
+
+class TestExecuteActions:
+    """BasePlatformExecutor.execute_actions."""
+
+    async def test_chunks_by_batch_size_in_order(self):
+        executor = FakeExecutor()
+        executor.max_batch_size = 2
+        requests = [_request(f"c{i}") for i in range(5)]
+
+        results = await executor.execute_actions(requests)
+
+        assert [len(b) for b in executor.batches] == [2, 2]
+        assert executor.single_calls == [("c4", "key-c4")]
+        assert all(r.success for r in results)
+        assert len(results) == 5
+
+    async def test_retryable_and_unbatchable_items_run_individually(self):
+        def batch_results(requests):
+            return [
+                ExecutionResult.success_result(message="ok"),
+                ExecutionResult.failure_result(message="timeout", is_retryable=True),
+                None,
+                ExecutionResult.failure_result(message="bad", error_code="USER_ERROR"),
+            ]
+
+        executor = FakeExecutor(batch_results)
+        results = await executor.execute_actions([_request(f"c{i}") for i in range(4)])
+
+        # Retried items keep their idempotency key
+        assert executor.single_calls == [("c1", "key-c1"), ("c2", "key-c2")]
+        assert [r.success for r in results] == [True, True, True, False]
+
+    async def test_whole_batch_failure_falls_back(self):
+        def batch_results(requests):
+            raise httpx.ConnectError("boom")
+
+        executor = FakeExecutor(batch_results)
+        results = await executor.execute_actions([_request("c1"), _request("c2")])
+
+        assert len(executor.single_calls) == 2
+        assert all(r.success for r in results)
+
+    async def test_in_flight_cap_spans_calls(self):
+        import asyncio
+
+        in_flight = peak = 0
+
+        class SlowExecutor(FakeExecutor):
+            max_batch_size = 1
+
+            async def _execute_action_impl(self, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return ExecutionResult.success_result(message="single")
+
+        first, second = SlowExecutor(), SlowExecutor()
+        first.rate_limiter.max_concurrency = 2
+        first.rate_limiter.rate_per_second = first.rate_limiter.capacity = 1000
+        first.rate_limiter._loop = None
+
+        await asyncio.gather(
+            first.execute_actions([_request(f"a{i}") for i in range(3)]),
+            second.execute_actions([_request(f"b{i}") for i in range(3)]),
+        )
+
+        assert first.rate_limiter is second.rate_limiter
+        assert peak == 2
+
+
+def _mock_client(handler):
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestMetaBatch:
+    """Graph API batch requests."""
+
+    async def test_batch_request_and_per_entry_results(self):
+        seen = {}
+
+        def handler(request):
+            form = dict(httpx.QueryParams(request.content.decode()))
+            seen["batch"] = json.loads(form["batch"])
+            return httpx.Response(200, json=[
+                {"code": 200, "body": json.dumps({"success": True})},
+                {"code": 400, "body": json.dumps({"error": {"code": 100, "message": "Invalid"}})},
+                None,
+            ])
+
+        executor = MetaAdsExecutor(MetaCredentials("token", "123"))
+        executor._client = _mock_client(handler)
+
+        results = await executor._execute_batch_impl([
+            _request("c1"),
+            _request("c2", "adjust_budget", {"new_budget": 50}),
+            _request("c3", "resume_campaign"),
+            _request("c4", "adjust_budget"),
+        ])
+
+        assert seen["batch"][0] == {"method": "POST", "relative_url": "c1", "body": "status=PAUSED"}
+        assert seen["batch"][1]["body"] == "daily_budget=5000"
+        assert len(seen["batch"]) == 3
+        assert results[0].success
+        assert not results[1].success and results[1].error_code == "100"
+        assert results[2].is_retryable
+        assert results[3].error_code == "MISSING_PARAMETER"
+
+    async def test_multi_id_state_read(self):
+        def handler(request):
+            assert request.url.params["ids"] == "c1,c2"
+            return httpx.Response(200, json={"c1": {"id": "c1", "status": "ACTIVE"}})
+
+        executor = MetaAdsExecutor(MetaCredentials("token", "123"))
+        executor._client = _mock_client(handler)
+
+        states = await executor.get_entity_states([("c1", "campaign"), ("c2", "campaign")])
+
+        assert list(states) == [("c1", "campaign")]
+        assert states[("c1", "campaign")].state["status"] == "ACTIVE"
+
+
+class TestGoogleBatch:
+    """Multi-operation mutates with partial failure."""
+
+    async def test_partial_failure_maps_to_operation(self):
+        def handler(request):
+            body = json.loads(request.content)
+            assert request.url.path.endswith("/campaigns:mutate")
+            assert body["partialFailure"] is True
+            assert len(body["operations"]) == 2
+            return httpx.Response(200, json={
+                "results": [{"resourceName": "customers/1234567890/campaigns/1"}, {}],
+                "partialFailureError": {"details": [{"errors": [{
+                    "message": "Campaign not found",
+                    "location": {"fieldPathElements": [{"fieldName": "operations", "index": 1}]},
+                }]}]},
+            })
+
+        executor = GoogleAdsExecutor(GoogleAdsCredentials(
+            "token", "refresh", "id", "secret", "dev", "123-456-7890",
+        ))
+        executor._client = _mock_client(handler)
+
+        results = await executor._execute_batch_impl([_request("1"), _request("2", "resume_campaign")])
+
+        assert results[0].success
+        assert not results[1].success
+        assert results[1].message == "Campaign not found"
+
+    def test_state_query_uses_in_list(self):
+        executor = GoogleAdsExecutor(GoogleAdsCredentials(
+            "token", "refresh", "id", "secret", "dev", "1234567890",
+        ))
+        assert "campaign.id IN (1, 2)" in executor._build_state_query(["1", "2"], "campaign")
+
+
+class TestShopifyBatch:
+    """Aliased GraphQL mutations."""
+
+    async def test_aliased_mutations_and_unbatchable(self):
+        seen = {}
+
+        def handler(request):
+            body = json.loads(request.content)
+            seen.update(body)
+            return httpx.Response(200, json={"data": {
+                "m0": {"product": {"id": "gid://shopify/Product/1"}, "userErrors": []},
+                "m2": {"productVariant": None, "userErrors": [{"field": ["price"], "message": "Invalid"}]},
+            }})
+
+        executor = ShopifyExecutor(ShopifyCredentials("token", "shop.myshopify.com"))
+        executor._client = _mock_client(handler)
+
+        results = await executor._execute_batch_impl([
+            ActionRequest("update_product_status", "1", "product", {"status": "draft"}, "k0"),
+            ActionRequest("delete_discount", "9", "discount", {}, "k1"),
+            ActionRequest("update_price", "5", "variant", {"price": -1}, "k2"),
+        ])
+
+        assert "m0: productUpdate(input: $input0)" in seen["query"]
+        assert "m2: productVariantUpdate(input: $input2)" in seen["query"]
+        assert seen["variables"]["input0"] == {"id": "gid://shopify/Product/1", "status": "DRAFT"}
+        assert results[0].success
+        assert results[1] is None
+        assert results[2].error_code == "USER_ERROR"
+
+
+class TestExecuteBatchService:
+    """ActionExecutionService.execute_batch."""
+
+    def _action(self, entity_id, tenant_id="tenant-1", platform="meta"):
+        action = AIAction(
+            id=str(uuid.uuid4()),
+            tenant_id=tenant_id,
+            recommendation_id=str(uuid.uuid4()),
+            action_type=ActionType.PAUSE_CAMPAIGN,
+            platform=platform,
+            target_entity_id=entity_id,
+            target_entity_type=ActionTargetEntityType.CAMPAIGN,
+            action_params={},
+            status=ActionStatus.PENDING_APPROVAL,
+            content_hash=uuid.uuid4().hex,
+        )
+        action.approve("user-1")
+        return action
+
+    def _service(self, actions, executor, remaining=-1):
+        by_id = {a.id: a for a in actions}
+        credentials = Mock()
+        credentials.get_executor_for_platform.return_value = executor
+        service = ActionExecutionService(MagicMock(), "tenant-1", credentials_service=credentials)
+        service._get_action = by_id.__getitem__
+        service._safety_service = MagicMock()
+        service._safety_service.check_action_safety.return_value = SafetyCheckResult(allowed=True)
+        service._safety_service.get_rate_limit_status.return_value = RateLimitStatus(
+            count=0, limit=remaining, remaining=remaining, reset_at=None, is_limited=False,
+        )
+        service._data_change_aggregator = MagicMock()
+        return service
+
+    async def test_batches_state_and_mutations(self):
+        actions = [self._action(f"c{i}") for i in range(3)]
+        executor = FakeExecutor()
+        service = self._service(actions, executor)
+
+        with patch(
+            "src.services.action_execution_service.is_kill_switch_active",
+            AsyncMock(return_value=False),
+        ):
+            results = await service.execute_batch([a.id for a in actions])
+
+        assert [r.action_id for r in results] == [a.id for a in actions]
+        assert all(r.success for r in results)
+        assert len(executor.batches) == 1
+        assert executor.state_reads == [["c0", "c1", "c2"], ["c0", "c1", "c2"]]
+        for action, result in zip(actions, results):
+            assert action.status == ActionStatus.SUCCEEDED
+            assert action.idempotency_key in [key for _, key in executor.batches[0]]
+            assert result.before_state["state"] == {"status": "ACTIVE"}
+            assert result.after_state["state"] == {"status": "PAUSED"}
+            assert result.rollback_instructions["params"] == {"status": "ACTIVE"}
+
+    async def test_same_entity_and_quota_split_waves(self):
+        actions = [self._action("c1"), self._action("c1"), self._action("c2")]
+        executor = FakeExecutor()
+        service = self._service(actions, executor, remaining=5)
+
+        with patch(
+            "src.services.action_execution_service.is_kill_switch_active",
+            AsyncMock(return_value=False),
+        ):
+            await service.execute_batch([a.id for a in actions])
+
+        # Second action on c1 waits for the first to finish
+        assert [[e for e, _ in b] for b in executor.batches] == [["c1", "c2"]]
+        assert executor.single_calls[0][0] == "c1"
+        assert service._safety_service.check_action_safety.call_count == 3
+
+    async def test_kill_switch_blocks_all(self):
+        actions = [self._action("c1"), self._action("c2")]
+        executor = FakeExecutor()
+        service = self._service(actions, executor)
+
+        with patch(
+            "src.services.action_execution_service.is_kill_switch_active",
+            AsyncMock(return_value=True),
+        ):
+            results = await service.execute_batch([a.id for a in actions])
+
+        assert [r.error_code for r in results] == ["KILL_SWITCH_ACTIVE"] * 2
+        assert executor.batches == []
+
+    async def test_failing_platform_batch_fails_only_its_actions(self):
+        meta_actions = [self._action("c1"), self._action("c2")]
+        google_action = self._action("g1", platform="google")
+        meta, google = FakeExecutor(), FakeExecutor()
+        meta.get_entity_states = AsyncMock(side_effect=RuntimeError("meta down"))
+        service = self._service(meta_actions + [google_action], meta)
+        service.credentials_service.get_executor_for_platform.side_effect = (
+            lambda platform, **kwargs: meta if platform.value == "meta" else google
+        )
+
+        with patch(
+            "src.services.action_execution_service.is_kill_switch_active",
+            AsyncMock(return_value=False),
+        ):
+            results = await service.execute_batch(
+                [a.id for a in meta_actions + [google_action]]
+            )
+
+        assert [r.success for r in results] == [False, False, True]
+        assert all(a.status == ActionStatus.FAILED for a in meta_actions)
+        assert results[0].message == "meta down"
+        assert google_action.status == ActionStatus.SUCCEEDED
+        assert meta.batches == []
@@ -0,0 +1,261 @@
+"""
+Unit tests for the async database session path.
+
+Tests cover:
+- Async URL rewriting (asyncpg / aiosqlite, sslmode -> ssl)
+- Pool sizing read from the environment
+- get_async_db_session yielding AsyncSession, or Session when disabled
+- run_db running Session-based code on either session type
+- Entitlement subscription lookup only uses the request's session
+- /api/insights served from a real AsyncSession
+"""
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import Session
+
+from src.database import session as db_session_module
+from src.database.session import (
+    _env_int,
+    _get_async_database_url,
+    get_async_db_session,
+    run_db,
+)
+from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
+from src.platform.tenant_context import TenantContext
+
+
+@pytest.fixture(autouse=True)
+def _reset_engines():
+    """Each test gets fresh engine singletons."""
+    db_session_module._engine = None
+    db_session_module._SessionLocal = None
+    db_session_module._async_engine = None
+    db_session_module._AsyncSessionLocal = None
+    yield
+    db_session_module._engine = None
+    db_session_module._SessionLocal = None
+    db_session_module._async_engine = None
+    db_session_module._AsyncSessionLocal = None
+
+
+@pytest.fixture
+async def async_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(AIInsight.__table__.create)
+    yield engine
+    await engine.dispose()
+
+
+def _insight(insight_id, tenant_id="tenant-1", **overrides):
+    fields = dict(
+        id=insight_id,
+        tenant_id=tenant_id,
+        insight_type=InsightType.SPEND_ANOMALY,
+        severity=InsightSeverity.WARNING,
+        summary=f"Insight {insight_id}",
+        supporting_metrics=[],
+        confidence_score=0.9,
+        period_type="weekly",
+        period_start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        period_end=datetime(2024, 1, 7, tzinfo=timezone.utc),
+        comparison_type="week_over_week",
+        generated_at=datetime(2024, 1, 8, tzinfo=timezone.utc),
+        content_hash=uuid.uuid4().hex,
+        is_read=0,
+        is_dismissed=0,
+    )
+    fields.update(overrides)
+    return AIInsight(**fields)
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+
+class TestAsyncDatabaseUrl:
+    """Tests for _get_async_database_url."""
+
+    def test_render_postgres_url_uses_asyncpg(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgres://u:p@db.example.com:5432/app")
+        assert _get_async_database_url() == "postgresql+asyncpg://u:p@db.example.com:5432/app"
+
+    def test_sslmode_renamed_for_asyncpg(self, monkeypatch):
+        monkeypatch.setenv(
+            "DATABASE_URL", "postgresql://u:p@db/app?sslmode=require&application_name=api"
+        )
+        assert _get_async_database_url() == (
+            "postgresql+asyncpg://u:p@db/app?ssl=require&application_name=api"
+        )
+
+    def test_sqlite_uses_aiosqlite(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "sqlite:///tmp/app.db")
+        assert _get_async_database_url() == "sqlite+aiosqlite:///tmp/app.db"
+
+    def test_env_int_falls_back_on_invalid(self, monkeypatch):
+        monkeypatch.setenv("DB_POOL_SIZE_TEST", "lots")
+        assert _env_int("DB_POOL_SIZE_TEST", 7) == 7
+        monkeypatch.setenv("DB_POOL_SIZE_TEST", "12")
+        assert _env_int("DB_POOL_SIZE_TEST", 7) == 12
+
+    def test_async_engine_uses_configured_pool_size(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "postgresql://u:p@db/app")
+        monkeypatch.setattr(db_session_module, "DB_ASYNC_POOL_SIZE", 17)
+        monkeypatch.setattr(db_session_module, "DB_ASYNC_MAX_OVERFLOW", 3)
+
+        engine = db_session_module.get_async_engine()
+
+        assert engine.pool.size() == 17
+        assert engine.pool._max_overflow == 3
+
+
+# =============================================================================
+# Dependency and bridge
+# =============================================================================
+
+
+class TestGetAsyncDbSession:
+    """Tests for the get_async_db_session dependency."""
+
+    @pytest.mark.asyncio
+    async def test_yields_async_session(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+        monkeypatch.setattr(db_session_module, "DB_ASYNC_ENABLED", True)
+
+        gen = get_async_db_session()
+        session = await gen.__anext__()
+        try:
+            assert isinstance(session, AsyncSession)
+            assert (await session.execute(text("SELECT 1"))).scalar() == 1
+        finally:
+            await gen.aclose()
+
+    @pytest.mark.asyncio
+    async def test_yields_sync_session_when_disabled(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("DATABASE_URL", f"sqlite:///{tmp_path / 'app.db'}")
+        monkeypatch.setattr(db_session_module, "DB_ASYNC_ENABLED", False)
+
+        gen = get_async_db_session()
+        session = await gen.__anext__()
+        try:
+            assert isinstance(session, Session)
+            assert await run_db(session, lambda s: s.execute(text("SELECT 1")).scalar()) == 1
+        finally:
+            await gen.aclose()
+
+    @pytest.mark.asyncio
+    async def test_raises_503_without_database_url(self, monkeypatch):
+        from fastapi import HTTPException
+
+        monkeypatch.delenv("DATABASE_URL", raising=False)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await get_async_db_session().__anext__()
+
+        assert exc_info.value.status_code == 503
+
+
+class TestRunDb:
+    """Tests for run_db."""
+
+    @pytest.mark.asyncio
+    async def test_runs_legacy_query_code_on_async_session(self, async_engine):
+        async with AsyncSession(async_engine) as session:
+            session.add(_insight("i-1"))
+            await session.commit()
+
+            def _legacy(db, tenant_id):
+                assert isinstance(db, Session)
+                return db.query(AIInsight).filter(AIInsight.tenant_id == tenant_id).count()
+
+            assert await run_db(session, _legacy, "tenant-1") == 1
+            assert await run_db(session, _legacy, tenant_id="tenant-2") == 0
+
+    @pytest.mark.asyncio
+    async def test_calls_fn_directly_for_sync_session(self):
+        session = MagicMock(spec=Session)
+
+        result = await run_db(session, lambda s, value: (s, value), 42)
+
+        assert result == (session, 42)
+
+
+class TestEntitlementSubscriptionLookup:
+    """EntitlementMiddleware._get_subscription on a cache miss."""
+
+    @pytest.mark.asyncio
+    async def test_uses_request_session(self):
+        from src.entitlements.middleware import EntitlementMiddleware
+
+        db = MagicMock(spec=Session)
+        request = MagicMock()
+        request.state.db = db
+
+        subscription = await EntitlementMiddleware._get_subscription(None, request, "tenant-1")
+
+        assert subscription is db.query.return_value.filter.return_value.first.return_value
+
+    @pytest.mark.asyncio
+    async def test_no_request_session_opens_none(self):
+        from src.entitlements.middleware import EntitlementMiddleware
+
+        request = MagicMock()
+        request.state.db = None
+
+        with patch.object(db_session_module, "get_async_session_factory") as factory:
+            assert await EntitlementMiddleware._get_subscription(None, request, "tenant-1") is None
+
+        factory.assert_not_called()
+
+
+# =============================================================================
+# Migrated route
+# =============================================================================
+
+
+class TestInsightsOnAsyncSession:
+    """/api/insights runs against a real AsyncSession."""
+
+    @pytest.mark.asyncio
+    async def test_list_and_mark_read(self, async_engine):
+        from src.api.routes.insights import router, check_ai_insights_entitlement
+
+        async with AsyncSession(async_engine, expire_on_commit=False) as setup:
+            setup.add_all([_insight("i-1"), _insight("i-2"), _insight("i-x", tenant_id="tenant-2")])
+            await setup.commit()
+
+        async def _override():
+            async with AsyncSession(async_engine, expire_on_commit=False) as session:
+                yield session
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[check_ai_insights_entitlement] = _override
+        tenant_ctx = TenantContext(
+            tenant_id="tenant-1", user_id="user-1", roles=["admin"], org_id="org-1"
+        )
+
+        with patch("src.api.routes.insights.get_tenant_context", return_value=tenant_ctx):
+            client = TestClient(app)
+            listed = client.get("/api/insights?limit=1")
+            marked = client.patch("/api/insights/i-1/read")
+            missing = client.patch("/api/insights/i-x/read")
+
+        assert listed.status_code == 200
+        assert listed.json()["total"] == 2
+        assert listed.json()["has_more"] is True
+        assert marked.status_code == 200
+        assert missing.status_code == 404
+
+        async with AsyncSession(async_engine) as check:
+            insight = await check.get(AIInsight, "i-1")
+            assert insight.is_read == 1
@@ -0,0 +1,161 @@
+"""
+Unit tests for the chart preview cache and async preview pipeline.
+
+Tests cover:
+- Stale results are served immediately and refreshed in the background
+- Concurrent identical previews share one Superset query
+- Failed queries never replace a cached result
+- Cached entries round-trip through Redis JSON
+"""
+
+import asyncio
+
+import httpx
+
+from src.services.chart_query_service import (
+    CachedPreview,
+    ChartConfig,
+    ChartPreviewCache,
+    ChartPreviewResult,
+    ChartQueryService,
+)
+from src.services.superset_metadata_catalog import SupersetMetadataCatalog
+
+
+def _response(status_code=200, payload=None):
+    return httpx.Response(
+        status_code,
+        json=payload or {},
+        request=httpx.Request("POST", "http://superset"),
+    )
+
+
+class SlowSuperset:
+    """Async Superset stub whose chart data query waits on an event."""
+
+    def __init__(self):
+        self.chart_calls = 0
+        self.revenue = 1
+        self.fail = False
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def request(self, method, path, **kwargs):
+        if path == "/api/v1/dataset/":
+            return _response(payload={"result": [{"id": 7}]})
+        if path == "/api/v1/dataset/7":
+            return _response(payload={"result": {
+                "table_name": "fact_orders_current",
+                "columns": [{"column_name": "revenue"}],
+            }})
+        self.chart_calls += 1
+        await self.release.wait()
+        if self.fail:
+            return _response(500)
+        return _response(payload={"result": [
+            {"data": [{"revenue": self.revenue}], "colnames": ["revenue"]},
+        ]})
+
+
+def _service(superset, cache=None):
+    catalog = SupersetMetadataCatalog(http=None, async_http=superset)
+    return ChartQueryService(catalog=catalog, cache=cache or ChartPreviewCache())
+
+
+def _config():
+    return ChartConfig(dataset_name="fact_orders_current", metrics=["revenue"])
+
+
+async def _drain(service):
+    while service._refresh_tasks:
+        await asyncio.gather(*service._refresh_tasks.values())
+
+
+class TestStaleWhileRevalidate:
+    """Tests for stale preview handling."""
+
+    async def test_stale_result_served_then_refreshed(self):
+        superset = SlowSuperset()
+        service = _service(superset, ChartPreviewCache(fresh_ttl_seconds=0, stale_ttl_seconds=600))
+        await service.execute_preview(_config(), "tenant-1")
+
+        superset.revenue = 2
+        superset.release.clear()
+        stale = await service.execute_preview(_config(), "tenant-1")
+        assert stale.data == [{"revenue": 1}]
+
+        superset.release.set()
+        await _drain(service)
+        refreshed = await service.execute_preview(_config(), "tenant-1")
+        await _drain(service)
+
+        assert refreshed.data == [{"revenue": 2}]
+        assert superset.chart_calls == 3
+
+    async def test_concurrent_stale_hits_share_one_refresh(self):
+        superset = SlowSuperset()
+        service = _service(superset, ChartPreviewCache(fresh_ttl_seconds=0, stale_ttl_seconds=600))
+        await service.execute_preview(_config(), "tenant-1")
+
+        superset.release.clear()
+        await asyncio.gather(*(service.execute_preview(_config(), "tenant-1") for _ in range(5)))
+        superset.release.set()
+        await _drain(service)
+
+        assert superset.chart_calls == 2
+
+    async def test_failed_refresh_keeps_stale_result(self):
+        superset = SlowSuperset()
+        cache = ChartPreviewCache(fresh_ttl_seconds=0, stale_ttl_seconds=600)
+        service = _service(superset, cache)
+        await service.execute_preview(_config(), "tenant-1")
+
+        superset.fail = True
+        await service.execute_preview(_config(), "tenant-1")
+        await _drain(service)
+        result = await service.execute_preview(_config(), "tenant-1")
+        await _drain(service)
+
+        assert result.data == [{"revenue": 1}]
+
+
+class TestCoalescing:
+    """Tests for in-flight preview coalescing."""
+
+    async def test_identical_previews_share_one_query(self):
+        superset = SlowSuperset()
+        service = _service(superset)
+        superset.release.clear()
+
+        pending = [asyncio.ensure_future(service.execute_preview(_config(), "tenant-1")) for _ in range(5)]
+        await asyncio.sleep(0)
+        superset.release.set()
+        results = await asyncio.gather(*pending)
+
+        assert superset.chart_calls == 1
+        assert all(r.data == [{"revenue": 1}] for r in results)
+
+    async def test_tenants_do_not_share_queries(self):
+        superset = SlowSuperset()
+        service = _service(superset)
+
+        await asyncio.gather(
+            service.execute_preview(_config(), "tenant-1"),
+            service.execute_preview(_config(), "tenant-2"),
+        )
+
+        assert superset.chart_calls == 2
+
+
+class TestCachedPreview:
+    """Tests for CachedPreview serialization."""
+
+    def test_json_round_trip(self):
+        entry = CachedPreview(
+            result=ChartPreviewResult(data=[{"revenue": 1}], columns=["revenue"], row_count=1),
+            cached_at=123.0,
+        )
+
+        restored = CachedPreview.from_json(entry.to_json())
+
+        assert restored == entry
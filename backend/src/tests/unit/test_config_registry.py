@@ -0,0 +1,111 @@
+"""
+Unit tests for the process-wide config registry.
+
+Tests cover:
+- Files are parsed once and returned frozen
+- mtime changes and explicit reloads swap the value
+- A broken file keeps the previous value
+- plans.json defaults and typed accessors
+"""
+
+import json
+import os
+
+import pytest
+
+from src.config.registry import (
+    ConfigRegistry,
+    DEFAULT_PREMIUM_JOBS,
+    FrozenDict,
+    compile_plans_config,
+)
+
+
+def _write(path, content, mtime=None):
+    path.write_text(content)
+    if mtime is not None:
+        os.utime(path, (mtime, mtime))
+
+
+@pytest.fixture
+def registry():
+    return ConfigRegistry(check_interval_seconds=0)
+
+
+class TestConfigRegistry:
+    """Tests for ConfigRegistry."""
+
+    def test_parses_once_and_freezes(self, registry, tmp_path, monkeypatch):
+        path = tmp_path / "consumers.yaml"
+        _write(path, "dashboards:\n  main:\n    metrics: {revenue: current}\n    tags: [a, b]\n")
+
+        first = registry.get(path)
+        monkeypatch.setattr("src.config.registry._read_file", pytest.fail)
+        second = registry.get(path)
+
+        assert first is second
+        assert isinstance(first["dashboards"], dict)
+        assert first["dashboards"]["main"]["tags"] == ("a", "b")
+        with pytest.raises(TypeError):
+            first["dashboards"]["main"]["metrics"]["revenue"] = "v2"
+
+    def test_mtime_change_swaps_value(self, registry, tmp_path):
+        path = tmp_path / "metrics.yaml"
+        _write(path, "version: 1\n", mtime=1000)
+        assert registry.get(path)["version"] == 1
+
+        assert registry.check_for_changes() == 0
+        _write(path, "version: 2\n", mtime=2000)
+
+        assert registry.check_for_changes() == 1
+        assert registry.get(path)["version"] == 2
+
+    def test_reload_rereads_unchanged_files(self, registry, tmp_path):
+        path = tmp_path / "metrics.yaml"
+        _write(path, "version: 1\n", mtime=1000)
+        registry.get(path)
+
+        _write(path, "version: 2\n", mtime=1000)
+
+        assert registry.reload() == 1
+        assert registry.get(path)["version"] == 2
+
+    def test_broken_file_keeps_previous_value(self, registry, tmp_path):
+        path = tmp_path / "plans.json"
+        _write(path, json.dumps({"grace_period_days": 5}), mtime=1000)
+        assert registry.get(path, compile_plans_config, default=None).grace_period_days == 5
+
+        _write(path, "{not json", mtime=2000)
+
+        assert registry.check_for_changes() == 0
+        assert registry.get(path, compile_plans_config, default=None).grace_period_days == 5
+
+    def test_missing_file_without_default_raises(self, registry, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            registry.get(tmp_path / "missing.yaml")
+
+
+class TestPlansConfig:
+    """Tests for the compiled plans.json accessor."""
+
+    def test_missing_file_uses_default_premium_jobs(self, registry, tmp_path):
+        plans = registry.get(tmp_path / "plans.json", compile_plans_config, default=None)
+
+        assert dict(plans.premium_jobs) == DEFAULT_PREMIUM_JOBS
+        assert plans.grace_period_days is None
+        assert plans.canceled_behavior == "immediate"
+
+    def test_typed_fields(self, registry, tmp_path):
+        path = tmp_path / "plans.json"
+        _write(path, json.dumps({
+            "grace_period_days": "7",
+            "canceled_behavior": "end_of_period",
+            "premium_jobs": {"export": {"required_feature": "data_export"}},
+        }))
+
+        plans = registry.get(path, compile_plans_config, default=None)
+
+        assert plans.grace_period_days == 7
+        assert plans.canceled_behavior == "end_of_period"
+        assert isinstance(plans.premium_jobs, FrozenDict)
+        assert plans.premium_jobs["export"]["required_feature"] == "data_export"
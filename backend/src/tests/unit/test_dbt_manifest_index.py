@@ -0,0 +1,153 @@
+"""
+Unit tests for the shared dbt manifest index.
+
+Tests cover:
+- Upstream/downstream queries over the manifest DAG
+- Column maps
+- Process and on-disk caching keyed by the manifest hash
+- BackfillPlanner walking the manifest DAG instead of MODEL_REGISTRY
+"""
+
+import json
+from datetime import date
+
+import pytest
+
+import src.services.dbt_manifest_index as manifest_module
+from src.services.backfill_planner import BackfillPlanner, ModelLayer
+from src.services.dbt_manifest_index import ManifestIndex, load_manifest_index
+
+
+def _model(name, layer_dir, parents, materialized="view", columns=None):
+    return {
+        "unique_id": f"model.markinsight.{name}",
+        "resource_type": "model",
+        "name": name,
+        "fqn": ["markinsight", layer_dir, name],
+        "config": {"materialized": materialized},
+        "depends_on": {"nodes": parents},
+        "columns": columns or {},
+    }
+
+
+def _manifest():
+    models = [
+        _model("stg_shopify_orders", "staging", ["source.markinsight.shopify.orders"]),
+        _model("orders", "canonical", ["model.markinsight.stg_shopify_orders"], "incremental"),
+        _model("fct_new_metric", "metrics", ["model.markinsight.orders"]),
+        _model(
+            "fact_orders_current", "semantic_views", ["model.markinsight.orders"],
+            columns={
+                "tenant_id": {"data_type": "VARCHAR", "meta": {"superset_expose": True}},
+                "revenue": {"data_type": None, "description": "Gross revenue"},
+            },
+        ),
+        _model("stg_google_ads_performance", "staging", []),
+    ]
+    return {
+        "nodes": {m["unique_id"]: m for m in models},
+        "sources": {
+            "source.markinsight.shopify.orders": {
+                "resource_type": "source", "name": "orders",
+                "fqn": ["markinsight", "shopify", "orders"],
+            },
+        },
+    }
+
+
+@pytest.fixture
+def manifest_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(manifest_module, "DBT_MANIFEST_INDEX_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(manifest_module, "_loaded", {})
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(_manifest()))
+    return path
+
+
+class TestManifestIndex:
+    """Tests for ManifestIndex graph and column queries."""
+
+    def test_downstream_and_upstream(self):
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert index.downstream(["stg_shopify_orders"]) == {
+            "stg_shopify_orders", "orders", "fct_new_metric", "fact_orders_current",
+        }
+        assert index.upstream(["fct_new_metric"]) == {
+            "fct_new_metric", "orders", "stg_shopify_orders",
+        }
+        assert index.upstream(["fct_new_metric"], resource_type=None) >= {"orders"}
+        assert index.downstream(["unknown"]) == set()
+
+    def test_name_lookup_prefers_models(self):
+        index = ManifestIndex.from_manifest(_manifest())
+
+        assert index.node("orders").resource_type == "model"
+        assert index.node("source.markinsight.shopify.orders").resource_type == "source"
+
+    def test_column_map(self):
+        index = ManifestIndex.from_manifest(_manifest())
+
+        columns = {c.name: c for c in index.columns("fact_orders_current")}
+
+        assert columns["tenant_id"].exposed is True
+        assert columns["revenue"].data_type is None
+        assert columns["revenue"].description == "Gross revenue"
+
+    def test_round_trips_through_dict(self):
+        index = ManifestIndex.from_manifest(_manifest(), file_hash="abc")
+
+        restored = ManifestIndex.from_dict(json.loads(json.dumps(index.to_dict())))
+
+        assert restored.downstream(["orders"]) == index.downstream(["orders"])
+        assert restored.columns("fact_orders_current") == index.columns("fact_orders_current")
+        assert restored.content_hash == index.content_hash
+
+
+class TestLoadManifestIndex:
+    """Tests for load_manifest_index caching."""
+
+    def test_reuses_index_until_file_changes(self, manifest_path):
+        first = load_manifest_index(manifest_path)
+        assert load_manifest_index(manifest_path) is first
+
+        manifest = _manifest()
+        del manifest["nodes"]["model.markinsight.fct_new_metric"]
+        manifest_path.write_text(json.dumps(manifest))
+
+        assert "fct_new_metric" not in load_manifest_index(manifest_path)
+
+    def test_disk_cache_skips_json_parse(self, manifest_path, monkeypatch):
+        first = load_manifest_index(manifest_path)
+        monkeypatch.setattr(manifest_module, "_loaded", {})
+        monkeypatch.setattr(
+            manifest_module.ManifestIndex, "from_manifest",
+            classmethod(lambda cls, *a, **k: pytest.fail("manifest re-parsed")),
+        )
+
+        second = load_manifest_index(manifest_path)
+
+        assert second is not first
+        assert second.file_hash == first.file_hash
+        assert second.downstream(["orders"]) == first.downstream(["orders"])
+
+    def test_missing_manifest_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            load_manifest_index(tmp_path / "missing.json")
+
+
+class TestBackfillPlannerWithManifest:
+    """Tests for BackfillPlanner on the manifest DAG."""
+
+    def test_plan_includes_models_missing_from_static_registry(self):
+        planner = BackfillPlanner(ManifestIndex.from_manifest(_manifest()))
+
+        plan = planner.plan("t1", "shopify", date(2024, 1, 1), date(2024, 1, 7))
+
+        assert "fct_new_metric" in plan.affected_models
+        assert "stg_shopify_customers" not in plan.affected_models
+        layers = [ModelLayer(step.layer).order for step in plan.execution_steps]
+        assert layers == sorted(layers)
+        orders_step = next(s for s in plan.execution_steps if s.model_name == "orders")
+        assert orders_step.materialization == "incremental"
+        assert orders_step.depends_on == ["stg_shopify_orders"]
@@ -0,0 +1,134 @@
+"""
+Unit tests for the shared DQ statistics kernels.
+
+Tests cover:
+- Batch JSD matches the single-pair result and is symmetric
+- Percentage change, median/MAD, robust z-score and seasonal baselines
+- DQService batch checks agree with the single-item checks
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+from src.api.dq import kernels
+from src.api.dq.service import DQService
+
+
+class TestJensenShannonKernel:
+    """jensen_shannon_divergences."""
+
+    def test_batch_matches_single(self):
+        pairs = [
+            ({"a": 0.5, "b": 0.5}, {"a": 0.5, "b": 0.5}),
+            ({"a": 1.0}, {"b": 1.0}),
+            ({"a": 0.7, "b": 0.3}, {"a": 0.4, "b": 0.4, "c": 0.2}),
+            ({}, {}),
+        ]
+        scores = kernels.jensen_shannon_divergences(pairs)
+        assert scores == [kernels.jensen_shannon_divergence(p, q) for p, q in pairs]
+        assert scores[0] == 0.0
+        assert scores[1] == pytest.approx(1.0, abs=1e-6)
+        assert scores[3] == 0.0
+
+    def test_symmetric(self):
+        p = {"a": 0.6, "b": 0.3, "c": 0.1}
+        q = {"a": 0.2, "b": 0.5, "d": 0.3}
+        assert kernels.jensen_shannon_divergence(p, q) == kernels.jensen_shannon_divergence(q, p)
+
+    def test_top_movers(self):
+        movers = kernels.top_movers({"a": 0.5, "b": 0.5}, {"a": 0.1, "b": 0.6, "c": 0.3}, top_n=2)
+        assert movers == [
+            {"category": "a", "change": -0.4},
+            {"category": "c", "change": 0.3},
+        ]
+
+
+class TestSeriesKernels:
+    """Means, percentage changes and robust baselines."""
+
+    def test_pct_changes(self):
+        assert kernels.pct_changes([100.0, 0.0, None], [50, 10, 10]) == [50.0, None, None]
+
+    def test_means_handles_empty_series(self):
+        assert kernels.means([[1, 2, 3], []]) == [2.0, None]
+
+    def test_median_mad_ignores_single_outlier(self):
+        [(median, mad)] = kernels.median_mads([[100, 102, 98, 101, 0, 99, 100]])
+        assert median == 100
+        assert mad == 1
+
+    def test_robust_z_scores(self):
+        z = kernels.robust_z_scores([[100, 102, 98, 101, 99], [5, 5, 5]], [90, 5])
+        assert z[0] == pytest.approx(-10 / kernels.MAD_SCALE)
+        assert z[1] is None
+
+    def test_seasonal_baselines_use_same_weekday(self):
+        # Two weeks where day 0 of the week is the low day
+        week = [10, 100, 100, 100, 100, 100, 100]
+        assert kernels.seasonal_baselines([week * 2, week[:3]]) == [10, None]
+
+
+@pytest.fixture
+def dq_service():
+    session = Mock()
+    connector = Mock()
+    connector.connection_name = "Test Shopify"
+    query = Mock()
+    query.filter = Mock(return_value=query)
+    query.first = Mock(return_value=connector)
+    session.query = Mock(return_value=query)
+    return DQService(session, "tenant-kernels")
+
+
+@pytest.fixture
+def loader():
+    loader = Mock()
+    loader.get_volume_anomaly_threshold.return_value = 50.0
+    loader.get_distribution_drift_threshold.return_value = 0.15
+    loader.get_cardinality_shift_threshold.return_value = 50.0
+    loader.resolve_severity_label.return_value = "low"
+    with patch("src.api.dq.service.get_quality_thresholds_loader", return_value=loader):
+        yield loader
+
+
+class TestBatchChecks:
+    """DQService batch checks."""
+
+    def test_volume_batch_matches_single(self, dq_service, loader):
+        series = {
+            "conn-1": ([1000] * 7, 950),
+            "conn-2": ([1000] * 7, 100),
+            "conn-3": ([0] * 7, 10),
+        }
+        batch = dq_service.check_volume_anomalies(series)
+        single = [
+            dq_service.check_volume_anomaly(cid, counts, today)
+            for cid, (counts, today) in series.items()
+        ]
+        assert [r.connector_id for r in batch] == ["conn-1", "conn-2", "conn-3"]
+        assert [r.is_anomaly for r in batch] == [False, True, False]
+        assert [r.metadata for r in batch] == [r.metadata for r in single]
+
+    def test_volume_metadata_has_robust_baselines(self, dq_service, loader):
+        counts = [500, 1000, 1000, 1000, 1000, 1000, 1000] * 2
+        [result] = dq_service.check_volume_anomalies({"conn-1": (counts, 520)})
+        assert result.metadata["rolling_median"] == 1000
+        assert result.metadata["seasonal_baseline"] == 500
+        assert result.metadata["mad"] == 0
+        assert result.metadata["robust_z"] is None
+
+    def test_drift_and_cardinality_batches(self, dq_service, loader):
+        drifts = dq_service.check_distribution_drifts("conn-1", {
+            "channel": ({"a": 0.5, "b": 0.5}, {"a": 0.5, "b": 0.5}),
+            "campaign_type": ({"a": 1.0}, {"b": 1.0}),
+        })
+        assert [r.metadata["dimension"] for r in drifts] == ["channel", "campaign_type"]
+        assert [r.is_anomaly for r in drifts] == [False, True]
+
+        shifts = dq_service.check_cardinality_shifts("conn-1", {
+            "sku": (100, 30),
+            "campaign_id": (0, 10),
+        })
+        assert shifts[0].metadata["pct_change"] == 70.0
+        assert shifts[0].is_anomaly is True
+        assert shifts[1].metadata["pct_change"] == 0.0
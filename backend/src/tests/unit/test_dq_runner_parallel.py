@@ -0,0 +1,145 @@
+"""
+Tests for the parallel, sharded DQ runner.
+
+Tests cover:
+- --shard i/n parsing and stable tenant partitioning
+- Connector metadata prefetched once per tenant
+- Parallel run (per-tenant sessions) records every tenant's results
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+
+from src.api.dq.service import DQService
+from src.jobs.dq_runner import DQRunner, parse_shard, tenant_in_shard
+from src.models.airbyte_connection import ConnectionStatus, TenantAirbyteConnection
+from src.models.dq_models import DQCheck, DQCheckType, DQIncident, DQResult
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'dq.db'}",
+        connect_args={"check_same_thread": False},
+    )
+    for model in (TenantAirbyteConnection, DQCheck, DQResult, DQIncident):
+        model.__table__.create(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+def _seed(session_factory, tenants=6, connectors_per_tenant=3):
+    now = datetime.now(timezone.utc)
+    with session_factory() as session:
+        session.add(DQCheck(
+            check_name="shopify_orders_freshness",
+            check_type=DQCheckType.FRESHNESS.value,
+            source_type="shopify_orders",
+        ))
+        for t in range(tenants):
+            for c in range(connectors_per_tenant):
+                session.add(TenantAirbyteConnection(
+                    tenant_id=f"tenant-{t}",
+                    airbyte_connection_id=f"ab-{t}-{c}",
+                    connection_name=f"Shopify {t}-{c}",
+                    source_type="shopify",
+                    status=ConnectionStatus.ACTIVE,
+                    last_sync_at=now - timedelta(minutes=10),
+                    is_enabled=True,
+                ))
+        session.commit()
+
+
+def _count_selects(engine, table):
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _record(conn, cursor, statement, *args):
+        if statement.lstrip().upper().startswith("SELECT") and table in statement:
+            statements.append(statement)
+
+    return statements
+
+
+class TestSharding:
+    """Shard spec parsing and tenant assignment."""
+
+    def test_parse_shard(self):
+        assert parse_shard("2/4") == (2, 4)
+
+    @pytest.mark.parametrize("value", ["4/4", "-1/2", "1/0", "1", "a/b"])
+    def test_parse_shard_rejects_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+    def test_shards_partition_tenants(self):
+        tenants = [f"tenant-{i}" for i in range(200)]
+        owners = [
+            [i for i in range(4) if tenant_in_shard(t, (i, 4))] for t in tenants
+        ]
+        assert all(len(o) == 1 for o in owners)
+        assert {o[0] for o in owners} == {0, 1, 2, 3}
+
+
+class TestConnectorPrefetch:
+    """Connector metadata is loaded once per tenant."""
+
+    def test_freshness_uses_prefetched_connectors(self, session_factory):
+        _seed(session_factory, tenants=1, connectors_per_tenant=5)
+        with session_factory() as session:
+            selects = _count_selects(session.get_bind(), "tenant_airbyte_connections")
+            service = DQService(session, "tenant-0")
+            service.prefetch_connectors()
+            results = service.check_all_freshness()
+
+        assert len(results) == 5
+        assert len(selects) == 1
+
+
+class TestParallelRun:
+    """Parallel runs cover every tenant in the shard."""
+
+    @pytest.fixture(autouse=True)
+    def _no_alerts(self):
+        with patch("src.jobs.dq_runner.get_alert_router"):
+            yield
+
+    async def test_parallel_run_records_all_tenants(self, session_factory):
+        _seed(session_factory)
+        with session_factory() as session:
+            runner = DQRunner(session, session_factory=session_factory, workers=3)
+            stats = await runner.run()
+
+        assert stats["errors"] == 0
+        assert stats["tenants_processed"] == 6
+        assert stats["connectors_checked"] == 18
+        with session_factory() as session:
+            run_ids = session.scalars(select(DQResult.run_id)).all()
+        assert len(run_ids) == 18
+        assert set(run_ids) == {runner.run_id}
+
+    async def test_shard_limits_tenants(self, session_factory):
+        _seed(session_factory)
+        expected = sum(tenant_in_shard(f"tenant-{t}", (1, 2)) for t in range(6))
+        with session_factory() as session:
+            runner = DQRunner(
+                session, session_factory=session_factory, workers=2, shard=(1, 2)
+            )
+            stats = await runner.run()
+
+        assert stats["tenants_processed"] == expected
+        with session_factory() as session:
+            count = session.scalar(select(func.count()).select_from(DQResult))
+        assert count == expected * 3
+
+    async def test_serial_run_without_factory(self, session_factory):
+        _seed(session_factory, tenants=2)
+        with session_factory() as session:
+            stats = await DQRunner(session).run()
+
+        assert stats["tenants_processed"] == 2
+        assert stats["connectors_checked"] == 6
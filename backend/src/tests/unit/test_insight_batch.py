@@ -0,0 +1,258 @@
+"""
+Unit tests for cross-tenant batched insight generation.
+
+Tests cover:
+- Batched detection matches the per-tenant service
+- Per-tenant thresholds and divergence scoping within a batch
+- Fan-out of persisted insights per job
+- Batched job runner lifecycle
+
+Story 8.1 - AI Insight Generation (Read-Only Analytics)
+"""
+
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+from src.models.ai_insight import AIInsight, InsightType
+from src.models.insight_job import InsightJob, InsightJobCadence, InsightJobStatus
+from src.services.insight_batch import InsightBatchGenerator, InsightBatchJob
+from src.services.insight_generation_service import (
+    InsightGenerationService,
+    insight_content_hash,
+)
+from src.services.insight_job_runner import InsightJobRunner
+from src.services.insight_thresholds import DEFAULT_THRESHOLDS, ENTERPRISE_THRESHOLDS
+
+PERIOD = {
+    "period_start": datetime(2024, 1, 1, tzinfo=timezone.utc),
+    "period_end": datetime(2024, 1, 7, tzinfo=timezone.utc),
+    "comparison_type": "week_over_week",
+    "currency": "USD",
+}
+
+
+def marketing_row(tenant_id, period_type="weekly", spend_pct=0.0, roas_pct=0.0, cac_pct=0.0):
+    return {
+        **PERIOD,
+        "tenant_id": tenant_id,
+        "period_type": period_type,
+        "platform": "meta_ads",
+        "campaign_id": None,
+        "spend": 1000 * (1 + spend_pct / 100),
+        "prior_spend": 1000,
+        "spend_change": 10 * spend_pct,
+        "spend_change_pct": spend_pct,
+        "gross_roas": 3.0,
+        "prior_gross_roas": 3.0 / (1 + roas_pct / 100),
+        "gross_roas_change": 0.1,
+        "gross_roas_change_pct": roas_pct,
+        "cac": 40.0,
+        "prior_cac": 40.0 / (1 + cac_pct / 100),
+        "cac_change": 1.0,
+        "cac_change_pct": cac_pct,
+    }
+
+
+def revenue_row(tenant_id, period_type="weekly", revenue_pct=0.0, aov_pct=0.0):
+    return {
+        **PERIOD,
+        "tenant_id": tenant_id,
+        "period_type": period_type,
+        "net_revenue": 10000 * (1 + revenue_pct / 100),
+        "prior_net_revenue": 10000,
+        "net_revenue_change": 100 * revenue_pct,
+        "net_revenue_change_pct": revenue_pct,
+        "aov": 80.0,
+        "prior_aov": 80.0 / (1 + aov_pct / 100),
+        "aov_change": 2.0,
+        "aov_change_pct": aov_pct,
+    }
+
+
+def per_tenant_hashes(tenant_id, thresholds, marketing_rows, revenue_rows):
+    """Content hashes the per-tenant service detects for the same rows."""
+    service = InsightGenerationService(MagicMock(), tenant_id, thresholds)
+    hashes = set()
+    for period_type in {r["period_type"] for r in marketing_rows + revenue_rows}:
+        marketing = [r for r in marketing_rows if r["period_type"] == period_type]
+        revenue = [r for r in revenue_rows if r["period_type"] == period_type]
+        detected = (
+            service._detect_spend_anomalies(marketing, period_type)
+            + service._detect_roas_changes(marketing, period_type)
+            + service._detect_revenue_spend_divergence(marketing, revenue, period_type)
+            + service._detect_cac_anomalies(marketing, period_type)
+            + service._detect_aov_changes(revenue, period_type)
+        )
+        hashes.update(service._generate_content_hash(d) for d in detected)
+    return hashes
+
+
+class TestBatchDetection:
+    """Tests for InsightBatchGenerator.detect."""
+
+    def test_matches_per_tenant_detection(self):
+        """Test every tenant gets exactly what the per-tenant path detects."""
+        jobs = {
+            "tenant-a": InsightBatchJob("job-a", "tenant-a", DEFAULT_THRESHOLDS),
+            "tenant-b": InsightBatchJob("job-b", "tenant-b", ENTERPRISE_THRESHOLDS),
+        }
+        marketing = [
+            marketing_row("tenant-a", spend_pct=40.0, roas_pct=-20.0),
+            marketing_row("tenant-a", "last_30_days", cac_pct=35.0),
+            marketing_row("tenant-b", spend_pct=12.0, cac_pct=12.0),
+        ]
+        revenue = [
+            revenue_row("tenant-a", revenue_pct=-30.0, aov_pct=9.0),
+            revenue_row("tenant-b", aov_pct=9.0),
+        ]
+
+        detected = InsightBatchGenerator(MagicMock()).detect(jobs, marketing, revenue)
+
+        for tenant_id, job in jobs.items():
+            rows_m = [r for r in marketing if r["tenant_id"] == tenant_id]
+            rows_r = [r for r in revenue if r["tenant_id"] == tenant_id]
+            batch_hashes = {insight_content_hash(tenant_id, d) for d in detected[tenant_id]}
+            assert batch_hashes == per_tenant_hashes(tenant_id, job.thresholds, rows_m, rows_r)
+            assert batch_hashes
+
+    def test_thresholds_apply_per_tenant(self):
+        """Test a 12% spend change only fires for the enterprise tenant."""
+        jobs = {
+            "tenant-a": InsightBatchJob("job-a", "tenant-a", DEFAULT_THRESHOLDS),
+            "tenant-b": InsightBatchJob("job-b", "tenant-b", ENTERPRISE_THRESHOLDS),
+        }
+        marketing = [
+            marketing_row("tenant-a", spend_pct=12.0),
+            marketing_row("tenant-b", spend_pct=12.0),
+        ]
+
+        detected = InsightBatchGenerator(MagicMock()).detect(jobs, marketing, [])
+
+        assert detected["tenant-a"] == []
+        assert [d.insight_type for d in detected["tenant-b"]] == [InsightType.SPEND_ANOMALY]
+
+    def test_divergence_does_not_cross_tenants(self):
+        """Test one tenant's spend is never compared with another's revenue."""
+        jobs = {
+            "tenant-a": InsightBatchJob("job-a", "tenant-a", DEFAULT_THRESHOLDS),
+            "tenant-b": InsightBatchJob("job-b", "tenant-b", DEFAULT_THRESHOLDS),
+        }
+        marketing = [marketing_row("tenant-a", spend_pct=40.0)]
+        revenue = [revenue_row("tenant-b", revenue_pct=-30.0)]
+
+        detected = InsightBatchGenerator(MagicMock()).detect(jobs, marketing, revenue)
+
+        all_types = [d.insight_type for ds in detected.values() for d in ds]
+        assert InsightType.REVENUE_VS_SPEND_DIVERGENCE not in all_types
+
+
+class TestBatchGenerate:
+    """Tests for InsightBatchGenerator.generate."""
+
+    def test_fetches_one_query_per_mart(self):
+        """Test metrics for every tenant come from two queries."""
+        db = MagicMock()
+        db.execute.return_value.fetchall.return_value = []
+
+        generator = InsightBatchGenerator(db)
+        generator.fetch_metrics([f"tenant-{i}" for i in range(50)])
+
+        assert db.execute.call_count == 2
+
+    def test_rejects_two_jobs_for_one_tenant(self):
+        """Test a batch holds at most one job per tenant."""
+        jobs = [
+            InsightBatchJob("job-1", "tenant-a", DEFAULT_THRESHOLDS),
+            InsightBatchJob("job-2", "tenant-a", DEFAULT_THRESHOLDS),
+        ]
+        with pytest.raises(ValueError, match="Multiple jobs"):
+            InsightBatchGenerator(MagicMock()).generate(jobs)
+
+    def test_persists_and_fans_out_per_job(self, db_session):
+        """Test insights are stored per tenant and grouped by job."""
+        jobs = [
+            InsightBatchJob("job-a", "tenant-a", DEFAULT_THRESHOLDS),
+            InsightBatchJob("job-b", "tenant-b", DEFAULT_THRESHOLDS),
+        ]
+        marketing = [marketing_row("tenant-a", spend_pct=40.0)]
+        generator = InsightBatchGenerator(db_session)
+
+        with patch.object(generator, "fetch_metrics", return_value=(marketing, [])):
+            first = generator.generate(jobs)
+            second = generator.generate(jobs)
+
+        assert [i.tenant_id for i in first["job-a"]] == ["tenant-a"]
+        assert first["job-b"] == []
+        assert second == {"job-a": [], "job-b": []}
+        assert db_session.query(AIInsight).count() == 1
+
+
+class TestBatchedJobRunner:
+    """Tests for InsightJobRunner.process_queued_jobs_batched."""
+
+    @pytest.fixture
+    def jobs(self):
+        return [
+            InsightJob(
+                job_id=f"job-{i}",
+                tenant_id=f"tenant-{i % 2}",
+                cadence=InsightJobCadence.DAILY,
+                status=InsightJobStatus.QUEUED,
+                insights_generated=0,
+                job_metadata={},
+            )
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def mock_db_session(self, jobs):
+        db = MagicMock()
+        db.query.return_value.filter.return_value.order_by.return_value.limit.return_value.all.return_value = jobs
+        return db
+
+    @patch("src.services.insight_job_runner.InsightBatchGenerator")
+    @patch("src.services.insight_job_runner.resolve_billing_tiers")
+    def test_processes_one_job_per_tenant(
+        self, mock_tiers, mock_generator, mock_db_session, jobs
+    ):
+        """Test jobs run in chunks and a tenant's second job stays queued."""
+        mock_tiers.return_value = {"tenant-0": "enterprise", "tenant-1": "growth"}
+        mock_generator.return_value.generate.side_effect = lambda batch: {
+            job.job_id: [MagicMock()] for job in batch
+        }
+
+        runner = InsightJobRunner(mock_db_session)
+        processed = runner.process_queued_jobs_batched(chunk_size=1)
+
+        assert processed == 2
+        assert mock_generator.return_value.generate.call_count == 2
+        assert [j.status for j in jobs] == [
+            InsightJobStatus.SUCCESS,
+            InsightJobStatus.SUCCESS,
+            InsightJobStatus.QUEUED,
+        ]
+        assert jobs[0].insights_generated == 1
+        assert jobs[0].job_metadata["tier"] == "enterprise"
+        thresholds = mock_generator.return_value.generate.call_args_list[0].args[0][0].thresholds
+        assert thresholds == ENTERPRISE_THRESHOLDS
+        mock_db_session.commit.assert_called_once()
+
+    @patch("src.services.insight_job_runner.InsightBatchGenerator")
+    @patch("src.services.insight_job_runner.resolve_billing_tiers")
+    def test_failed_chunk_only_fails_its_jobs(
+        self, mock_tiers, mock_generator, mock_db_session, jobs
+    ):
+        """Test a failing chunk marks its jobs FAILED and others still succeed."""
+        mock_tiers.return_value = {"tenant-0": "growth", "tenant-1": "growth"}
+        mock_generator.return_value.generate.side_effect = [
+            RuntimeError("mart unavailable"),
+            {"job-1": []},
+        ]
+
+        runner = InsightJobRunner(mock_db_session)
+        runner.process_queued_jobs_batched(chunk_size=1)
+
+        assert jobs[0].status == InsightJobStatus.FAILED
+        assert "mart unavailable" in jobs[0].error_message
+        assert jobs[1].status == InsightJobStatus.SUCCESS
@@ -16,7 +16,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 from unittest.mock import MagicMock, patch
 
-from src.models.ai_insight import InsightType, InsightSeverity
+from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
 from src.services.insight_thresholds import (
     InsightThresholds,
     DEFAULT_THRESHOLDS,
@@ -359,6 +359,43 @@ class TestInsightGenerationService:
 
         assert hash1 != hash2
 
+    def test_persist_insights_skips_duplicates_and_keeps_batch(self, db_session):
+        """Test duplicates are skipped without discarding other insights."""
+        service = InsightGenerationService(db_session, tenant_id="test-tenant-123")
+
+        def detected(delta_pct):
+            return DetectedInsight(
+                insight_type=InsightType.SPEND_ANOMALY,
+                severity=InsightSeverity.WARNING,
+                metrics=[
+                    MetricChange(
+                        metric_name="spend",
+                        current_value=Decimal("1500"),
+                        prior_value=Decimal("1000"),
+                        delta=Decimal("500"),
+                        delta_pct=delta_pct,
+                        timeframe="week_over_week",
+                    )
+                ],
+                period_type="weekly",
+                period_start=datetime(2024, 1, 1, tzinfo=timezone.utc),
+                period_end=datetime(2024, 1, 7, tzinfo=timezone.utc),
+                comparison_type="week_over_week",
+                platform="meta_ads",
+                currency="USD",
+                confidence_score=0.85,
+            )
+
+        first = service._persist_insights([detected(50.0)], job_id="job-1")
+        second = service._persist_insights(
+            [detected(50.0), detected(60.0), detected(60.0)], job_id="job-2",
+        )
+
+        assert len(first) == 1
+        assert [i.supporting_metrics[0]["delta_pct"] for i in second] == [60.0]
+        assert second[0].summary
+        assert db_session.query(AIInsight).count() == 2
+
 
 class TestSpendAnomalyDetection:
     """Tests for spend anomaly detection."""
@@ -0,0 +1,122 @@
+"""
+Unit tests for the LLM completion cache.
+
+Tests cover:
+- Content-addressed cache keys
+- In-process cache round trip
+- In-flight request coalescing
+"""
+
+import asyncio
+
+import pytest
+
+from src.integrations.openrouter import ChatMessage
+from src.services.llm_completion_cache import (
+    CachedCompletion,
+    LLMCompletionCache,
+    completion_cache_key,
+    get_llm_config_cache,
+    invalidate_llm_config,
+)
+
+
+def _key(content="ROAS fell 12%", model_id="openai/gpt-4", version=1, temperature=0.7):
+    return completion_cache_key(
+        model_id,
+        "insight_analysis",
+        version,
+        [ChatMessage(role="user", content=content)],
+        512,
+        temperature,
+    )
+
+
+class TestCompletionCacheKey:
+    """Tests for completion_cache_key."""
+
+    def test_identical_requests_share_key(self):
+        assert _key() == _key()
+
+    def test_key_covers_model_version_prompt_and_params(self):
+        base = _key()
+        assert _key(model_id="anthropic/claude-3-haiku") != base
+        assert _key(version=2) != base
+        assert _key(content="ROAS fell 13%") != base
+        assert _key(temperature=0.2) != base
+
+
+class TestLLMCompletionCache:
+    """Tests for LLMCompletionCache."""
+
+    def test_set_then_get(self):
+        cache = LLMCompletionCache()
+        completion = CachedCompletion("answer", "openai/gpt-4", 100, 50)
+
+        cache.set("llm_completion:k", completion)
+
+        assert cache.get("llm_completion:k") == completion
+        assert cache.get("llm_completion:other") is None
+
+    def test_disabled_cache_never_hits(self):
+        cache = LLMCompletionCache(enabled=False)
+        cache.set("llm_completion:k", CachedCompletion("answer", "openai/gpt-4", 1, 1))
+
+        assert cache.get("llm_completion:k") is None
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_call(self):
+        cache = LLMCompletionCache()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*[cache.coalesce("k", compute) for _ in range(5)])
+
+        assert calls == 1
+        assert [r for r, _ in results] == ["answer"] * 5
+        assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_failure_raised_to_every_waiter(self):
+        cache = LLMCompletionCache()
+
+        async def compute():
+            await asyncio.sleep(0.01)
+            raise ValueError("upstream failed")
+
+        results = await asyncio.gather(
+            *[cache.coalesce("k", compute) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+        # Nothing left in flight, so the next request calls upstream again
+        async def recover():
+            return "answer"
+
+        assert await cache.coalesce("k", recover) == ("answer", False)
+
+
+class TestInvalidateLLMConfig:
+    """Tests for invalidate_llm_config."""
+
+    def test_drops_org_config_and_template_versions(self):
+        cache = get_llm_config_cache()
+        cache.clear()
+        cache.set("org_config:tenant-1", None)
+        cache.set("template:tenant-1:insight_analysis:active", None)
+        cache.set("template:tenant-1:insight_analysis:2", None)
+        cache.set("template:tenant-2:insight_analysis:active", None)
+
+        invalidate_llm_config("tenant-1", "insight_analysis")
+
+        assert cache.get_entry("org_config:tenant-1") is None
+        assert cache.get_entry("template:tenant-1:insight_analysis:2") is None
+        assert cache.get_entry("template:tenant-2:insight_analysis:active") is not None
+        cache.clear()
@@ -26,6 +26,10 @@ from src.services.llm_routing_service import (
     LLMRoutingError,
     LLMCompletionResult,
 )
+from src.services.llm_completion_cache import (
+    get_llm_completion_cache,
+    get_llm_config_cache,
+)
 from src.integrations.openrouter import (
     ChatMessage,
     ChatCompletionResponse,
@@ -36,6 +40,16 @@ from src.integrations.openrouter import (
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_llm_caches():
+    """Config memo and completion cache are process-wide."""
+    get_llm_config_cache().clear()
+    get_llm_completion_cache().clear()
+    yield
+    get_llm_config_cache().clear()
+    get_llm_completion_cache().clear()
+
+
 class TestLLMModelRegistry:
     """Tests for LLMModelRegistry model."""
 
@@ -474,6 +488,136 @@ class TestLLMRoutingServiceComplete:
         assert result.fallback_reason == "OpenRouterRateLimitError"
 
 
+class TestLLMRoutingServiceCompletionCache:
+    """Tests for the completion cache and config memoization."""
+
+    @staticmethod
+    def _model():
+        return LLMModelRegistry(
+            model_id="anthropic/claude-3-haiku",
+            display_name="Claude 3 Haiku",
+            provider="anthropic",
+            cost_per_input_token=Decimal("0.00001"),
+            cost_per_output_token=Decimal("0.00003"),
+            is_enabled=True,
+        )
+
+    @staticmethod
+    def _client(content="Cached answer"):
+        response = ChatCompletionResponse(
+            id="chat-123",
+            model="anthropic/claude-3-haiku",
+            choices=[ChatChoice(index=0, message=ChatMessage(role="assistant", content=content))],
+            usage=TokenUsage(prompt_tokens=100, completion_tokens=50, total_tokens=150),
+        )
+        client = AsyncMock()
+        client.chat_completion.return_value = response
+        return client
+
+    @staticmethod
+    def _logged(session):
+        return [call.args[0] for call in session.add.call_args_list]
+
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache_across_tenants(self):
+        """Second identical request skips the LLM and logs saved tokens."""
+        client = self._client()
+        first_session, second_session = MagicMock(), MagicMock()
+        first_session.query.return_value.filter.return_value.first.side_effect = [None, self._model()]
+        second_session.query.return_value.filter.return_value.first.return_value = None
+
+        messages = [ChatMessage(role="user", content="ROAS fell 12%")]
+        first = await LLMRoutingService(first_session, "tenant-a", client=client).complete(
+            messages, template_key="insight_analysis", template_version=1,
+        )
+        second = await LLMRoutingService(second_session, "tenant-b", client=client).complete(
+            messages, template_key="insight_analysis", template_version=1,
+        )
+
+        assert client.chat_completion.await_count == 1
+        assert (first.cached, second.cached) == (False, True)
+        assert second.content == "Cached answer"
+        assert second.total_tokens == 0
+
+        [miss] = self._logged(first_session)
+        [hit] = self._logged(second_session)
+        assert miss.cache_status == "miss"
+        assert miss.input_tokens == 100
+        assert hit.cache_status == "hit"
+        assert hit.tenant_id == "tenant-b"
+        assert hit.saved_tokens == 150
+        assert hit.cost_usd == Decimal("0")
+        assert hit.request_metadata["saved_cost_usd"] == "0.00250"
+
+    @pytest.mark.asyncio
+    async def test_different_template_version_misses(self):
+        """Template version is part of the cache key."""
+        client = self._client()
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.side_effect = [None, self._model()]
+        service = LLMRoutingService(session, "tenant-a", client=client)
+
+        messages = [ChatMessage(role="user", content="ROAS fell 12%")]
+        await service.complete(messages, template_key="insight_analysis", template_version=1)
+        await service.complete(messages, template_key="insight_analysis", template_version=2)
+
+        assert client.chat_completion.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_response_not_cached(self):
+        """Only primary-model answers are cached."""
+        config = LLMOrgConfig(
+            tenant_id="tenant-123",
+            primary_model_id="openai/gpt-4",
+            fallback_model_id="anthropic/claude-3-haiku",
+            temperature=Decimal("0.7"),
+        )
+        primary = LLMModelRegistry(
+            model_id="openai/gpt-4",
+            display_name="GPT-4",
+            provider="openai",
+            cost_per_input_token=Decimal("0.00001"),
+            cost_per_output_token=Decimal("0.00003"),
+        )
+        client = self._client("Fallback response!")
+        client.chat_completion.side_effect = [
+            OpenRouterRateLimitError("Rate limited"),
+            client.chat_completion.return_value,
+            client.chat_completion.return_value,
+        ]
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.side_effect = [
+            config, primary, self._model(),
+        ]
+        service = LLMRoutingService(session, "tenant-123", client=client)
+
+        messages = [ChatMessage(role="user", content="Hi")]
+        first = await service.complete(messages)
+        second = await service.complete(messages)
+
+        assert first.was_fallback is True
+        assert second.cached is False
+        assert client.chat_completion.await_count == 3
+
+    def test_org_config_memoized_across_services(self):
+        """Org config is loaded once per process, then invalidated on write."""
+        from src.services.llm_completion_cache import invalidate_llm_config
+
+        config = LLMOrgConfig(tenant_id="tenant-123", primary_model_id="openai/gpt-4")
+        session = MagicMock()
+        session.query.return_value.filter.return_value.first.return_value = config
+
+        LLMRoutingService(session, "tenant-123")._get_org_config()
+        cached = LLMRoutingService(session, "tenant-123")._get_org_config()
+        assert cached.primary_model_id == "openai/gpt-4"
+        assert cached is not config
+        assert session.query.call_count == 1
+
+        invalidate_llm_config("tenant-123")
+        LLMRoutingService(session, "tenant-123")._get_org_config()
+        assert session.query.call_count == 2
+
+
 class TestLLMRoutingServiceUsageStats:
     """Tests for usage statistics."""
 
@@ -488,6 +632,9 @@ class TestLLMRoutingServiceUsageStats:
         mock_result.request_count = 100
         mock_result.success_count = 95
         mock_result.fallback_count = 5
+        mock_result.cache_hit_count = 20
+        mock_result.cache_miss_count = 60
+        mock_result.saved_tokens = 4000
 
         mock_session.query.return_value.filter.return_value.first.return_value = mock_result
 
@@ -499,4 +646,7 @@ class TestLLMRoutingServiceUsageStats:
         assert stats["request_count"] == 100
         assert stats["success_count"] == 95
         assert stats["fallback_count"] == 5
+        assert stats["cache_hit_count"] == 20
+        assert stats["cache_hit_ratio"] == 0.25
+        assert stats["saved_tokens"] == 4000
         assert stats["period_days"] == 30
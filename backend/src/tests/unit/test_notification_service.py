@@ -269,10 +269,11 @@ class TestNotificationQueries:
         mock_db_session.query.return_value = mock_query
 
         service = NotificationService(mock_db_session, tenant_id)
-        notifications, total = service.get_notifications(user_id=user_id, limit=50)
+        page = service.get_notifications(user_id=user_id, limit=50)
 
-        assert notifications == mock_notifications
-        assert total == 10
+        assert page.items == mock_notifications
+        assert page.total == 10
+        assert page.has_more is False
 
     def test_get_unread_count(self, mock_db_session, tenant_id, user_id):
         """Should return unread count for user."""
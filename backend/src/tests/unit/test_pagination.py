@@ -0,0 +1,211 @@
+"""
+Unit tests for keyset pagination.
+
+Tests cover:
+- Cursor round-trip and rejection of malformed cursors
+- Walking every page with cursors, including ties on the sort column
+- Legacy offset paging and count modes
+- Bounded counts
+- Planner estimates binding parameters like normal execution
+"""
+
+import enum
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Column, DateTime, Enum, Integer, String, create_engine, event
+from sqlalchemy.orm import Session, declarative_base
+
+from src.platform.pagination import (
+    CountMode,
+    InvalidCursorError,
+    count_rows,
+    decode_cursor,
+    encode_cursor,
+    estimate_count,
+    paginate,
+    _planner_row_estimate,
+)
+
+Base = declarative_base()
+
+
+class Status(enum.Enum):
+    ACTIVE = "active"
+    ARCHIVED = "archived"
+
+
+class Row(Base):
+    __tablename__ = "rows"
+
+    id = Column(String(36), primary_key=True)
+    tenant_id = Column(String(36), nullable=False)
+    created_at = Column(DateTime(timezone=True), nullable=False)
+    position = Column(Integer, nullable=False)
+    status = Column(Enum(Status), nullable=False, default=Status.ACTIVE)
+
+
+T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as s:
+        for i in range(25):
+            # Pairs of rows share a timestamp so ties need the id tie-breaker
+            s.add(Row(
+                id=f"row-{i:03d}",
+                tenant_id="t1",
+                created_at=T0 + timedelta(minutes=i // 2),
+                position=i,
+            ))
+        s.add(Row(id="other", tenant_id="t2", created_at=T0, position=0))
+        s.commit()
+        yield s
+
+
+def _query(session):
+    return session.query(Row).filter(Row.tenant_id == "t1")
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        assert decode_cursor(encode_cursor(T0, "abc")) == (T0, "abc")
+        assert decode_cursor(encode_cursor(7, 12)) == (7, 12)
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "", "W10", encode_cursor(1, 2)[:-3]])
+    def test_malformed_cursor_raises(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor)
+
+    @pytest.mark.parametrize("cursor", [
+        encode_cursor({"a": 1}, "row-001"),
+        encode_cursor("2024-01-01T00:00:00", "row-001"),
+        encode_cursor(T0, ["row-001"]),
+        encode_cursor(T0, 7),
+        encode_cursor(T0, None),
+    ])
+    def test_cursor_not_matching_column_types_raises(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, Row.created_at, Row.id)
+
+    def test_integer_sort_column(self):
+        assert decode_cursor(encode_cursor(3, "a"), Row.position, Row.id) == (3, "a")
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(encode_cursor(True, "a"), Row.position, Row.id)
+
+
+class TestPaginate:
+    """Tests for paginate()."""
+
+    def test_cursor_walk_returns_every_row_once(self, session):
+        seen = []
+        cursor = None
+        while True:
+            page = paginate(
+                _query(session),
+                sort_column=Row.created_at,
+                id_column=Row.id,
+                limit=4,
+                cursor=cursor,
+                count=CountMode.NONE,
+            )
+            seen.extend(r.position for r in page.items)
+            if not page.has_more:
+                assert page.next_cursor is None
+                break
+            cursor = page.next_cursor
+
+        assert seen == sorted(range(25), reverse=True)
+
+    def test_ascending(self, session):
+        page = paginate(
+            _query(session),
+            sort_column=Row.created_at,
+            id_column=Row.id,
+            limit=3,
+            descending=False,
+            count=CountMode.NONE,
+        )
+        after = paginate(
+            _query(session),
+            sort_column=Row.created_at,
+            id_column=Row.id,
+            limit=3,
+            cursor=page.next_cursor,
+            descending=False,
+            count=CountMode.NONE,
+        )
+
+        assert [r.position for r in page.items + after.items] == [0, 1, 2, 3, 4, 5]
+
+    def test_offset_still_supported(self, session):
+        page = paginate(
+            _query(session),
+            sort_column=Row.created_at,
+            id_column=Row.id,
+            limit=10,
+            offset=20,
+            count=CountMode.EXACT,
+        )
+
+        assert [r.position for r in page.items] == [4, 3, 2, 1, 0]
+        assert page.total == 25
+        assert page.has_more is False
+
+    def test_count_modes(self, session):
+        kwargs = dict(sort_column=Row.created_at, id_column=Row.id, limit=5)
+
+        none = paginate(_query(session), count=CountMode.NONE, **kwargs)
+        estimated = paginate(_query(session), count=CountMode.ESTIMATED, **kwargs)
+
+        assert none.total is None
+        # Not PostgreSQL: no planner estimate, counted exactly
+        assert (estimated.total, estimated.total_is_estimate) == (25, False)
+        assert estimate_count(_query(session)) == (25, False)
+
+    def test_invalid_cursor_raises(self, session):
+        with pytest.raises(InvalidCursorError):
+            paginate(
+                _query(session),
+                sort_column=Row.created_at,
+                id_column=Row.id,
+                limit=5,
+                cursor="garbage",
+            )
+
+
+class TestPlannerEstimate:
+    """Tests for _planner_row_estimate()."""
+
+    def test_enum_filter_is_bound_like_execution(self, session):
+        statements = []
+
+        @event.listens_for(session.get_bind(), "before_cursor_execute")
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("EXPLAIN"):
+                statements.append((statement, parameters))
+
+        query = _query(session).filter(Row.status == Status.ARCHIVED)
+
+        # SQLite has no EXPLAIN (FORMAT JSON): no estimate, caller unaffected
+        assert _planner_row_estimate(query) is None
+        assert count_rows(query) == 0
+
+        (statement, parameters), = statements
+        assert "rows.status = ?" in statement
+        assert "ARCHIVED" in parameters
+        assert not any(isinstance(p, Status) for p in parameters)
+
+
+class TestCountRows:
+    """Tests for count_rows()."""
+
+    def test_exact_and_bounded(self, session):
+        assert count_rows(_query(session)) == 25
+        assert count_rows(_query(session), limit=11) == 11
+        assert count_rows(_query(session), limit=100) == 25
@@ -0,0 +1,311 @@
+"""
+Unit tests for monthly partition management and partition-drop retention.
+
+Tests cover:
+- Partition naming, month arithmetic and bound parsing
+- Future partition creation skips months already covered
+- Rows stranded in the DEFAULT partition move into the month created for them
+- Expired partitions are detached and dropped; dry run only reports
+- Non-PostgreSQL / unconverted tables are left to batched deletes
+- RetentionCleanup and AuditRetentionJob use partition drops when available
+- Partition maintenance job isolates per-table failures and alerts when
+  the partition horizon is below one month
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.config.retention import get_max_retention_days
+from src.database.partitioning import (
+    PartitionManager,
+    month_start,
+    parse_partition_bound,
+    partition_name,
+)
+
+
+def _bound(lower, upper):
+    lo = "MINVALUE" if lower is None else f"'{lower} 00:00:00+00'"
+    return f"FOR VALUES FROM ({lo}) TO ('{upper} 00:00:00+00')"
+
+
+class FakePartitionSession:
+    """Session stand-in that answers the catalog queries PartitionManager issues."""
+
+    def __init__(
+        self, partitions=None, partitioned=True, dialect="postgresql", trim_rows=0, stranded=0,
+    ):
+        self.partitions = partitions or []
+        self.partitioned = partitioned
+        self.dialect = dialect
+        self.trim_rows = trim_rows
+        self.stranded = stranded
+        self.statements = []
+        self.commits = 0
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name=self.dialect))
+
+    def execute(self, statement, params=None):
+        sql = " ".join(str(statement).split())
+        self.statements.append(sql)
+        result = MagicMock()
+        if "pg_partitioned_table" in sql:
+            result.first.return_value = (1,) if self.partitioned else None
+        elif "pg_inherits" in sql:
+            result.fetchall.return_value = list(self.partitions)
+        elif sql.startswith("DELETE"):
+            result.rowcount = self.trim_rows
+            self.trim_rows = 0
+        elif sql.startswith("SELECT 1 FROM"):
+            result.first.return_value = (1,) if self.stranded else None
+        elif sql.startswith("WITH moved"):
+            result.rowcount = self.stranded
+            self.stranded = 0
+        return result
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        pass
+
+    def ddl(self):
+        return [s for s in self.statements if s.startswith(("CREATE", "ALTER", "DROP"))]
+
+
+NOW = datetime(2026, 10, 16, 12, 0, tzinfo=timezone.utc)
+
+
+class TestPartitionHelpers:
+    def test_month_start_truncates_to_utc_month(self):
+        value = datetime(2026, 10, 16, 23, 30, tzinfo=timezone(timedelta(hours=-5)))
+        assert month_start(value) == datetime(2026, 10, 17, tzinfo=timezone.utc).replace(day=1)
+
+    def test_partition_name(self):
+        assert partition_name("dq_results", datetime(2026, 3, 1)) == "dq_results_p202603"
+
+    def test_parse_range_bound(self):
+        lower, upper, is_default = parse_partition_bound(_bound("2026-10-01", "2026-11-01"))
+        assert lower == datetime(2026, 10, 1, tzinfo=timezone.utc)
+        assert upper == datetime(2026, 11, 1, tzinfo=timezone.utc)
+        assert is_default is False
+
+    def test_parse_legacy_bound_is_unbounded_below(self):
+        lower, upper, _ = parse_partition_bound(_bound(None, "2026-11-01"))
+        assert lower is None
+        assert upper == datetime(2026, 11, 1, tzinfo=timezone.utc)
+
+    def test_parse_default_and_invalid(self):
+        assert parse_partition_bound("DEFAULT") == (None, None, True)
+        with pytest.raises(ValueError):
+            parse_partition_bound("FOR VALUES IN ('a')")
+
+
+class TestPartitionManager:
+    def test_not_partitioned_on_other_dialects(self):
+        session = FakePartitionSession(dialect="sqlite")
+        manager = PartitionManager(session)
+
+        assert manager.is_partitioned("dq_results") is False
+        assert manager.ensure_future_partitions("dq_results", 3, now=NOW) == []
+        assert session.statements == []
+
+    def test_unregistered_table_rejected(self):
+        with pytest.raises(ValueError):
+            PartitionManager(FakePartitionSession()).is_partitioned("dq_checks")
+
+    def test_ensure_future_partitions_creates_only_missing_months(self):
+        session = FakePartitionSession(partitions=[
+            ("dq_results_legacy", _bound(None, "2026-11-01")),
+            ("dq_results_p202611", _bound("2026-11-01", "2026-12-01")),
+        ])
+
+        created = PartitionManager(session).ensure_future_partitions("dq_results", 3, now=NOW)
+
+        assert created == ["dq_results_p202612", "dq_results_p202701"]
+        ddl = session.ddl()
+        assert len(ddl) == 2
+        assert 'PARTITION OF "public"."dq_results"' in ddl[0]
+        assert "FROM ('2026-12-01T00:00:00+00:00') TO ('2027-01-01T00:00:00+00:00')" in ddl[0]
+
+    def test_default_partition_rows_moved_into_new_month(self):
+        session = FakePartitionSession(partitions=[
+            ("audit_logs_default", "DEFAULT"),
+            ("audit_logs_p202610", _bound("2026-10-01", "2026-11-01")),
+        ], stranded=4)
+
+        created = PartitionManager(session).ensure_future_partitions("audit_logs", 1, now=NOW)
+
+        assert created == ["audit_logs_p202611"]
+        ddl = session.ddl()
+        assert ddl[0].startswith("CREATE TEMP TABLE _partition_move")
+        assert ddl[1].startswith('CREATE TABLE IF NOT EXISTS "public"."audit_logs_p202611"')
+        move = next(s for s in session.statements if s.startswith("WITH moved"))
+        assert 'DELETE FROM "public"."audit_logs_default"' in move
+        assert '"timestamp" >= :lower AND "timestamp" < :upper' in move
+        assert session.statements[-1] == (
+            'INSERT INTO "public"."audit_logs" SELECT * FROM _partition_move'
+        )
+        assert session.commits == 1
+
+    def test_empty_default_partition_creates_directly(self):
+        session = FakePartitionSession(partitions=[
+            ("audit_logs_default", "DEFAULT"),
+            ("audit_logs_p202610", _bound("2026-10-01", "2026-11-01")),
+        ])
+
+        PartitionManager(session).ensure_future_partitions("audit_logs", 1, now=NOW)
+
+        assert not any("_partition_move" in s for s in session.statements)
+        assert len(session.ddl()) == 1
+
+    def test_horizon_is_latest_monthly_upper_bound(self):
+        session = FakePartitionSession(partitions=[
+            ("sync_runs_default", "DEFAULT"),
+            ("sync_runs_legacy", _bound(None, "2026-10-01")),
+            ("sync_runs_p202610", _bound("2026-10-01", "2026-11-01")),
+        ])
+        horizon = PartitionManager(session).horizon("sync_runs")
+
+        assert horizon == datetime(2026, 11, 1, tzinfo=timezone.utc)
+
+    def test_drop_partitions_before_detaches_and_drops_expired(self):
+        session = FakePartitionSession(partitions=[
+            ("sync_runs_p202510", _bound("2025-10-01", "2025-11-01")),
+            ("sync_runs_legacy", _bound(None, "2025-10-01")),
+            ("sync_runs_p202511", _bound("2025-11-01", "2025-12-01")),
+        ])
+        cutoff = datetime(2025, 11, 16, tzinfo=timezone.utc)
+
+        dropped = PartitionManager(session).drop_partitions_before("sync_runs", cutoff)
+
+        assert dropped == ["sync_runs_legacy", "sync_runs_p202510"]
+        ddl = session.ddl()
+        assert ddl == [
+            'ALTER TABLE "public"."sync_runs" DETACH PARTITION "public"."sync_runs_legacy"',
+            'DROP TABLE "public"."sync_runs_legacy"',
+            'ALTER TABLE "public"."sync_runs" DETACH PARTITION "public"."sync_runs_p202510"',
+            'DROP TABLE "public"."sync_runs_p202510"',
+        ]
+
+    def test_drop_partitions_dry_run_reports_only(self):
+        session = FakePartitionSession(partitions=[
+            ("audit_logs_p202401", _bound("2024-01-01", "2024-02-01")),
+        ])
+
+        dropped = PartitionManager(session).drop_partitions_before(
+            "audit_logs", NOW, dry_run=True,
+        )
+
+        assert dropped == ["audit_logs_p202401"]
+        assert session.ddl() == []
+
+    def test_trim_partition_deletes_in_batches(self):
+        session = FakePartitionSession(trim_rows=5)
+
+        deleted = PartitionManager(session).trim_partition(
+            "dq_results", "dq_results_legacy", NOW, batch_size=5,
+        )
+
+        assert deleted == 5
+        deletes = [s for s in session.statements if s.startswith("DELETE")]
+        assert len(deletes) == 2
+        assert '"public"."dq_results_legacy"' in deletes[0]
+        assert '"executed_at" < :cutoff' in deletes[0]
+
+
+class TestRetentionCleanupPartitions:
+    def test_partitioned_tables_drop_partitions_and_trim_legacy(self):
+        from src.jobs.retention_cleanup import RetentionCleanup
+
+        session = FakePartitionSession(partitions=[
+            ("dq_results_legacy", _bound(None, "2026-11-01")),
+        ], trim_rows=3)
+        cleanup = RetentionCleanup(session, retention_months=13)
+
+        with patch.object(cleanup, "_delete_in_batches") as batched:
+            deleted = cleanup.cleanup_dq_results()
+
+        batched.assert_not_called()
+        assert deleted == 3
+        assert cleanup.stats["partitions_dropped"] == 0
+
+    def test_unpartitioned_tables_fall_back_to_batched_delete(self):
+        from src.jobs.retention_cleanup import RetentionCleanup
+
+        session = FakePartitionSession(partitioned=False)
+        cleanup = RetentionCleanup(session, retention_months=13)
+
+        with patch.object(cleanup, "_delete_in_batches", return_value=7) as batched:
+            deleted = cleanup.cleanup_sync_runs()
+
+        batched.assert_called_once()
+        assert deleted == 7
+
+
+class TestAuditPartitionRetention:
+    def test_max_retention_is_longest_plan(self):
+        assert get_max_retention_days() == 365
+
+    def test_drops_partitions_past_longest_plan_retention(self):
+        from src.jobs.audit_retention_job import AuditRetentionJob
+
+        job = AuditRetentionJob(FakePartitionSession(), dry_run=False)
+
+        with patch.object(job.partitions, "drop_partitions_before", return_value=["audit_logs_p202409"]) as drop:
+            assert job.drop_expired_partitions() == 1
+
+        table, cutoff = drop.call_args[0]
+        assert table == "audit_logs"
+        expected = datetime.now(timezone.utc) - timedelta(days=365)
+        assert abs((cutoff - expected).total_seconds()) < 60
+        assert drop.call_args.kwargs["dry_run"] is False
+
+
+class TestPartitionMaintenanceJob:
+    def test_skips_unpartitioned_tables(self):
+        from src.jobs.partition_maintenance import ensure_partitions
+
+        stats = ensure_partitions(FakePartitionSession(partitioned=False))
+
+        assert stats == {
+            "partitions_created": 0, "tables_skipped": 3, "horizon_alerts": 0, "errors": 0,
+        }
+
+    def test_failure_on_one_table_does_not_stop_others(self):
+        from src.jobs import partition_maintenance
+
+        def fake_ensure(self, table, months_ahead, now=None):
+            if table == "sync_runs":
+                raise RuntimeError("lock timeout")
+            return [f"{table}_p202701"]
+
+        with patch.object(
+            partition_maintenance.PartitionManager, "ensure_future_partitions", fake_ensure,
+        ), patch.object(
+            partition_maintenance.PartitionManager, "horizon",
+            return_value=datetime(2027, 2, 1, tzinfo=timezone.utc),
+        ):
+            stats = partition_maintenance.ensure_partitions(
+                FakePartitionSession(), months_ahead=3, now=NOW,
+            )
+
+        assert stats == {
+            "partitions_created": 2, "tables_skipped": 0, "horizon_alerts": 0, "errors": 1,
+        }
+
+    def test_alerts_when_horizon_below_one_month(self):
+        from src.jobs.partition_maintenance import ensure_partitions
+
+        session = FakePartitionSession(partitions=[
+            ("dq_results_p202610", _bound("2026-10-01", "2026-11-01")),
+        ])
+
+        with patch.object(PartitionManager, "ensure_future_partitions", return_value=[]):
+            stats = ensure_partitions(session, months_ahead=3, now=NOW)
+
+        assert stats["horizon_alerts"] == 3
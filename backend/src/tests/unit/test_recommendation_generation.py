@@ -18,7 +18,6 @@ from unittest.mock import MagicMock, patch
 from decimal import Decimal
 
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 
 from src.models.ai_insight import AIInsight, InsightType, InsightSeverity
 from src.models.ai_recommendation import (
@@ -420,15 +419,55 @@ class TestRecommendationGenerationService:
 
         assert insights_processed == 1
 
-    def test_deduplication_handles_integrity_error(
-        self, mock_db_session, tenant_id, sample_roas_decline_insight
+    def test_deduplication_skips_duplicates_without_discarding_batch(
+        self, db_session, tenant_id, sample_roas_decline_insight
     ):
-        """Should handle IntegrityError for duplicate recommendations."""
-        service = RecommendationGenerationService(mock_db_session, tenant_id)
+        """Duplicates are skipped; the rest of the batch is still inserted."""
+        db_session.add(sample_roas_decline_insight)
+        db_session.flush()
+        service = RecommendationGenerationService(db_session, tenant_id)
+
+        def detected(recommendation_type):
+            return DetectedRecommendation(
+                recommendation_type=recommendation_type,
+                source_insight_id=sample_roas_decline_insight.id,
+                source_insight_type=InsightType.ROAS_CHANGE,
+                source_severity=InsightSeverity.WARNING,
+                direction="decrease",
+                priority=RecommendationPriority.MEDIUM,
+                estimated_impact=EstimatedImpact.MODERATE,
+                risk_level=RiskLevel.MEDIUM,
+                confidence_score=0.8,
+            )
+
+        first = service._persist_recommendations(
+            [detected(RecommendationType.REDUCE_SPEND)], job_id="job-1",
+        )
+        second = service._persist_recommendations(
+            [
+                detected(RecommendationType.REDUCE_SPEND),
+                detected(RecommendationType.REVIEW_CREATIVE),
+                detected(RecommendationType.REVIEW_CREATIVE),
+            ],
+            job_id="job-2",
+        )
+
+        assert [r.recommendation_type for r in first] == [RecommendationType.REDUCE_SPEND]
+        assert [r.recommendation_type for r in second] == [RecommendationType.REVIEW_CREATIVE]
+        assert second[0].job_id == "job-2"
+        assert db_session.query(AIRecommendation).filter(
+            AIRecommendation.tenant_id == tenant_id
+        ).count() == 2
 
+    @patch("src.services.recommendation_generation_service.render_recommendation_text")
+    def test_existing_recommendations_are_not_rendered(
+        self, render_text, mock_db_session, tenant_id
+    ):
+        """Templates are rendered only for hashes not already stored."""
+        service = RecommendationGenerationService(mock_db_session, tenant_id)
         detected = DetectedRecommendation(
             recommendation_type=RecommendationType.REDUCE_SPEND,
-            source_insight_id=sample_roas_decline_insight.id,
+            source_insight_id="insight-123",
             source_insight_type=InsightType.ROAS_CHANGE,
             source_severity=InsightSeverity.WARNING,
             direction="decrease",
@@ -437,16 +476,15 @@ class TestRecommendationGenerationService:
             risk_level=RiskLevel.MEDIUM,
             confidence_score=0.8,
         )
+        mock_db_session.execute.return_value.all.return_value = [
+            (service._generate_content_hash(detected),)
+        ]
 
-        # Mock flush to raise IntegrityError (duplicate)
-        mock_db_session.flush.side_effect = IntegrityError(
-            "duplicate key", None, None
-        )
-
-        result = service._persist_recommendation(detected, job_id="job-123")
+        result = service._persist_recommendations([detected], job_id="job-123")
 
-        assert result is None
-        mock_db_session.rollback.assert_called_once()
+        assert result == []
+        render_text.assert_not_called()
+        mock_db_session.rollback.assert_not_called()
 
 
 # =============================================================================
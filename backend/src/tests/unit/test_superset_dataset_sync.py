@@ -74,11 +74,12 @@ def _mock_db_empty_baseline(db: MagicMock) -> None:
 class TestParseManifest:
     def test_parse_manifest_loads_json(self):
         with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump({"nodes": {}}, f)
+            json.dump(_minimal_manifest_one_model(), f)
             path = f.name
         try:
             out = _parse_manifest(path)
-            assert out == {"nodes": {}}
+            assert [node.name for node in out.models()] == ["fact_orders_current"]
+            assert out is _parse_manifest(path)
         finally:
             Path(path).unlink(missing_ok=True)
 
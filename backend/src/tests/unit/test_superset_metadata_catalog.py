@@ -0,0 +1,295 @@
+"""
+Unit tests for the shared Superset metadata catalog.
+
+Tests cover:
+- Pooled sync and async sessions re-authenticate once on 401
+- Listings only fetch datasets that changed, a page's details concurrently
+- Invalidation
+- Warm chart previews make a single Superset call
+- Async lookups and previews keep Redis round trips off the event loop
+"""
+
+import json
+import threading
+
+import httpx
+
+from src.services.chart_query_service import ChartConfig, ChartPreviewCache, ChartQueryService
+from src.services.superset_metadata_catalog import (
+    AsyncSupersetHttpSession,
+    SupersetHttpSession,
+    SupersetMetadataCatalog,
+)
+
+
+def _response(status_code=200, payload=None):
+    return httpx.Response(
+        status_code,
+        json=payload or {},
+        request=httpx.Request("GET", "http://superset"),
+    )
+
+
+def _detail(dataset_id, table_name, columns=("order_date", "revenue")):
+    return {
+        "result": {
+            "table_name": table_name,
+            "schema": "semantic",
+            "description": "",
+            "columns": [{"column_name": c, "type": "NUMERIC"} for c in columns],
+        }
+    }
+
+
+class FakeSuperset:
+    """Records catalog requests and answers them from fixtures."""
+
+    def __init__(self, datasets):
+        # id -> (table_name, changed_on)
+        self.datasets = datasets
+        self.calls = []
+
+    def request(self, method, path, **kwargs):
+        self.calls.append((method, path))
+        if path == "/api/v1/chart/data":
+            return _response(payload={"result": [{"data": [{"revenue": 1}], "colnames": ["revenue"]}]})
+        if path == "/api/v1/dataset/":
+            q = json.loads(kwargs["params"]["q"])
+            if "filters" in q:
+                name = q["filters"][0]["value"]
+                ids = [i for i, (t, _) in self.datasets.items() if t == name]
+                return _response(payload={"result": [{"id": i} for i in ids]})
+            if q["page"] > 0:
+                return _response(payload={"result": []})
+            return _response(payload={"result": [
+                {"id": i, "table_name": t, "changed_on_utc": changed}
+                for i, (t, changed) in self.datasets.items()
+            ]})
+        dataset_id = int(path.rsplit("/", 1)[1])
+        if dataset_id not in self.datasets:
+            return _response(404)
+        return _response(payload=_detail(dataset_id, self.datasets[dataset_id][0]))
+
+
+class AsyncFakeSuperset:
+    """Async view of a FakeSuperset, sharing its fixtures and call log."""
+
+    def __init__(self, fake):
+        self.fake = fake
+
+    async def request(self, method, path, **kwargs):
+        return self.fake.request(method, path, **kwargs)
+
+
+def _catalog(fake):
+    return SupersetMetadataCatalog(http=fake, async_http=AsyncFakeSuperset(fake))
+
+
+class TestSupersetHttpSession:
+    """Tests for SupersetHttpSession."""
+
+    def test_reauthenticates_once_on_401(self):
+        logins = []
+        data_calls = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/security/login":
+                logins.append(request)
+                return httpx.Response(200, json={"access_token": f"token-{len(logins)}"})
+            if request.url.path == "/api/v1/security/csrf_token/":
+                return httpx.Response(200, json={"result": "csrf"})
+            data_calls.append(request.headers["Authorization"])
+            if len(data_calls) == 1:
+                return httpx.Response(401)
+            return httpx.Response(200, json={"result": []})
+
+        session = SupersetHttpSession("http://superset", "admin", "admin")
+        session._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        resp = session.request("GET", "/api/v1/dataset/")
+        session.request("GET", "/api/v1/dataset/")
+
+        assert resp.status_code == 200
+        assert len(logins) == 2
+        assert data_calls == ["Bearer token-1", "Bearer token-2", "Bearer token-2"]
+
+
+class TestAsyncSupersetHttpSession:
+    """Tests for AsyncSupersetHttpSession."""
+
+    async def test_reauthenticates_once_on_401(self):
+        logins = []
+        data_calls = []
+
+        def handler(request):
+            if request.url.path == "/api/v1/security/login":
+                logins.append(request)
+                return httpx.Response(200, json={"access_token": f"token-{len(logins)}"})
+            if request.url.path == "/api/v1/security/csrf_token/":
+                return httpx.Response(200, json={"result": "csrf"})
+            data_calls.append(request.headers["Authorization"])
+            if len(data_calls) == 1:
+                return httpx.Response(401)
+            return httpx.Response(200, json={"result": []})
+
+        session = AsyncSupersetHttpSession("http://superset", "admin", "admin")
+        session._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        resp = await session.request("GET", "/api/v1/dataset/")
+        await session.request("GET", "/api/v1/dataset/")
+        await session.close()
+
+        assert resp.status_code == 200
+        assert len(logins) == 2
+        assert data_calls == ["Bearer token-1", "Bearer token-2", "Bearer token-2"]
+
+
+class TestSupersetMetadataCatalog:
+    """Tests for SupersetMetadataCatalog."""
+
+    def test_listing_only_fetches_changed_datasets(self):
+        fake = FakeSuperset({1: ("fact_orders_current", "t1"), 2: ("fact_ads_current", "t1")})
+        catalog = _catalog(fake)
+
+        first = catalog.list_datasets()
+        fake.calls.clear()
+        fake.datasets[2] = ("fact_ads_current", "t2")
+        second = catalog.list_datasets()
+
+        assert [d.table_name for d in first] == ["fact_orders_current", "fact_ads_current"]
+        assert [d.id for d in second] == [1, 2]
+        assert ("GET", "/api/v1/dataset/2") in fake.calls
+        assert ("GET", "/api/v1/dataset/1") not in fake.calls
+
+    def test_cold_listing_fetches_page_details_concurrently(self):
+        fake = FakeSuperset({i: (f"table_{i}", "t1") for i in range(1, 4)})
+        barrier = threading.Barrier(3, timeout=5)
+        request = fake.request
+
+        def detail_waits_for_others(method, path, **kwargs):
+            if path != "/api/v1/dataset/":
+                barrier.wait()
+            return request(method, path, **kwargs)
+
+        fake.request = detail_waits_for_others
+
+        datasets = _catalog(fake).list_datasets()
+
+        assert [d.id for d in datasets] == [1, 2, 3]
+        assert [d.table_name for d in datasets] == ["table_1", "table_2", "table_3"]
+
+    def test_invalidate_drops_id_and_detail(self):
+        fake = FakeSuperset({7: ("fact_orders_current", "t1")})
+        catalog = _catalog(fake)
+        assert catalog.get_dataset(catalog.get_dataset_id("fact_orders_current")).id == 7
+
+        catalog.invalidate(["fact_orders_current"])
+        fake.calls.clear()
+        catalog.get_dataset(catalog.get_dataset_id("fact_orders_current"))
+
+        assert [path for _, path in fake.calls] == ["/api/v1/dataset/", "/api/v1/dataset/7"]
+
+    def test_missing_dataset_returns_none(self):
+        catalog = _catalog(FakeSuperset({}))
+
+        assert catalog.get_dataset_id("unknown") is None
+        assert catalog.get_dataset(99) is None
+
+
+class TestChartPreviewWithCatalog:
+    """Tests for ChartQueryService on top of the catalog."""
+
+    async def test_warm_preview_makes_one_superset_call(self):
+        fake = FakeSuperset({7: ("fact_orders_current", "t1")})
+        service = ChartQueryService(catalog=_catalog(fake))
+
+        cold = await service.execute_preview(
+            ChartConfig(dataset_name="fact_orders_current", metrics=["revenue"]), "tenant-1",
+        )
+        fake.calls.clear()
+        warm = await service.execute_preview(
+            ChartConfig(dataset_name="fact_orders_current", metrics=["revenue"], viz_type="bar"),
+            "tenant-1",
+        )
+
+        assert cold.row_count == 1
+        assert warm.row_count == 1
+        assert fake.calls == [("POST", "/api/v1/chart/data")]
+
+    async def test_unknown_column_uses_cached_columns(self):
+        fake = FakeSuperset({7: ("fact_orders_current", "t1")})
+        service = ChartQueryService(catalog=_catalog(fake))
+        await service.execute_preview(
+            ChartConfig(dataset_name="fact_orders_current", metrics=["revenue"]), "tenant-1",
+        )
+        fake.calls.clear()
+
+        result = await service.execute_preview(
+            ChartConfig(dataset_name="fact_orders_current", metrics=["margin"]), "tenant-1",
+        )
+
+        assert "margin" in result.message
+        assert fake.calls == []
+
+
+class ThreadRecordingRedis:
+    """In-memory stand-in for RedisClient that records the calling thread."""
+
+    available = True
+
+    def __init__(self):
+        self.data = {}
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return self.data.get(key)
+
+    def mget(self, keys):
+        self.threads.add(threading.get_ident())
+        return [self.data.get(k) for k in keys]
+
+    def set(self, key, value, ttl_seconds=None):
+        self.threads.add(threading.get_ident())
+        self.data[key] = value
+        return True
+
+
+class TestRedisOffEventLoop:
+    """Redis round trips on the async path run in worker threads."""
+
+    async def test_preview_redis_calls_run_in_threads(self):
+        fake = FakeSuperset({7: ("fact_orders_current", "t1")})
+        redis = ThreadRecordingRedis()
+        catalog = _catalog(fake)
+        catalog._redis = redis
+        cache = ChartPreviewCache()
+        cache._redis = redis
+        service = ChartQueryService(catalog=catalog, cache=cache)
+
+        result = await service.execute_preview(
+            ChartConfig(dataset_name="fact_orders_current", metrics=["revenue"]), "tenant-1",
+        )
+
+        assert result.row_count == 1
+        assert any(key.startswith(ChartPreviewCache.KEY_PREFIX) for key in redis.data)
+        assert redis.threads
+        assert threading.get_ident() not in redis.threads
+
+    async def test_shared_entries_are_read_in_threads(self):
+        fake = FakeSuperset({7: ("fact_orders_current", "t1")})
+        redis = ThreadRecordingRedis()
+        warm = _catalog(fake)
+        warm._redis = redis
+        await warm.aget_dataset(await warm.aget_dataset_id("fact_orders_current"))
+        redis.threads.clear()
+        fake.calls.clear()
+
+        # A second worker finds the entries in Redis, not in its LRU
+        other = _catalog(fake)
+        other._redis = redis
+        dataset = await other.aget_dataset(await other.aget_dataset_id("fact_orders_current"))
+
+        assert dataset.id == 7
+        assert fake.calls == []
+        assert redis.threads and threading.get_ident() not in redis.threads
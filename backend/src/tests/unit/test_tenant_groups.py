@@ -0,0 +1,122 @@
+"""
+Unit tests for tenant groups (agency RLS in embedded analytics).
+
+Tests cover:
+- Group ids are stable per tenant set
+- Group RLS clauses only accept well-formed group ids
+- Groups are persisted once
+- Agency embed tokens carry the group id instead of the tenant list
+"""
+
+import jwt
+import pytest
+from unittest.mock import patch
+
+from src.models.tenant_group import TenantGroup, TenantGroupMember
+from src.platform.tenant_context import TenantContext
+from src.services import tenant_group_service
+from src.services.embed_token_service import EmbedTokenConfig, EmbedTokenService
+from src.services.tenant_group_service import (
+    ensure_tenant_group,
+    get_tenant_group_members,
+    is_tenant_group_id,
+    tenant_group_id,
+    tenant_group_rls_clause,
+)
+
+SECRET = "test-secret-key-for-testing-only"
+
+
+@pytest.fixture(autouse=True)
+def _clear_known_groups():
+    tenant_group_service._known_groups.clear()
+    yield
+    tenant_group_service._known_groups.clear()
+
+
+class TestTenantGroupId:
+    """Tests for tenant_group_id and tenant_group_rls_clause."""
+
+    def test_same_set_same_id(self):
+        assert tenant_group_id(["t2", "t1", "t1"]) == tenant_group_id(["t1", "t2"])
+        assert tenant_group_id(["t1", "t2"]) != tenant_group_id(["t1", "t3"])
+        assert is_tenant_group_id(tenant_group_id(["t1"]))
+
+    def test_rls_clause(self):
+        group_id = tenant_group_id(["t1", "t2"])
+
+        assert tenant_group_rls_clause(group_id) == (
+            f"tenant_id = ANY(group_members('{group_id}'))"
+        )
+
+    def test_rls_clause_rejects_malformed_id(self):
+        with pytest.raises(ValueError):
+            tenant_group_rls_clause("tg_x') OR 1=1 --")
+
+
+class TestEnsureTenantGroup:
+    """Tests for ensure_tenant_group."""
+
+    def test_persists_group_once(self, db_session):
+        first = ensure_tenant_group(db_session, ["t2", "t1"])
+        tenant_group_service._known_groups.clear()
+        second = ensure_tenant_group(db_session, ["t1", "t2"])
+
+        assert first == second
+        assert db_session.query(TenantGroup).count() == 1
+        assert db_session.query(TenantGroupMember).count() == 2
+        assert get_tenant_group_members(db_session, first) == ["t1", "t2"]
+
+    def test_known_group_skips_database(self):
+        group_id = tenant_group_id(["t1", "t2"])
+        tenant_group_service._known_groups.set(group_id, True)
+
+        assert ensure_tenant_group(None, ["t1", "t2"]) == group_id
+
+
+class TestEmbedTokenTenantScope:
+    """Tests for tenant scope claims in embed tokens."""
+
+    def _claims(self, ctx, group_error=None):
+        service = EmbedTokenService(config=EmbedTokenConfig(jwt_secret=SECRET))
+        with patch.object(
+            service, "_resolve_tenant_group",
+            side_effect=group_error or (lambda tenant_ids: tenant_group_id(tenant_ids)),
+        ), patch("src.services.token_store.get_token_store"):
+            result = service.generate_embed_token(ctx, dashboard_id="dash-1")
+        return jwt.decode(result.jwt_token, SECRET, algorithms=["HS256"], issuer="ai-growth-analytics")
+
+    def test_agency_token_carries_group_not_list(self):
+        tenants = [f"tenant-{i:03d}" for i in range(200)]
+        ctx = TenantContext(
+            tenant_id="tenant-000", user_id="user-1", roles=["agency_admin"],
+            org_id="agency-1", allowed_tenants=tenants,
+        )
+
+        claims = self._claims(ctx)
+
+        assert claims["allowed_tenants"] == ["tenant-000"]
+        assert claims["tenant_group_id"] == tenant_group_id(tenants)
+        assert claims["rls_filter"] == tenant_group_rls_clause(claims["tenant_group_id"])
+
+    def test_merchant_token_unchanged(self):
+        ctx = TenantContext(
+            tenant_id="tenant-1", user_id="user-1", roles=["merchant_admin"], org_id="org-1",
+        )
+
+        claims = self._claims(ctx)
+
+        assert "tenant_group_id" not in claims
+        assert claims["rls_filter"] == "tenant_id = 'tenant-1'"
+
+    def test_falls_back_to_list_when_group_unavailable(self):
+        ctx = TenantContext(
+            tenant_id="tenant-1", user_id="user-1", roles=["agency_admin"],
+            org_id="agency-1", allowed_tenants=["tenant-1", "tenant-2"],
+        )
+
+        claims = self._claims(ctx, group_error=RuntimeError("db down"))
+
+        assert "tenant_group_id" not in claims
+        assert claims["allowed_tenants"] == ["tenant-1", "tenant-2"]
+        assert "tenant_id IN" in claims["rls_filter"]
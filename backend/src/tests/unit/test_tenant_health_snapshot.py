@@ -0,0 +1,304 @@
+"""
+Tests for the precomputed tenant health snapshot.
+
+Tests cover:
+- refresh() persists the row and fills the cache; get() serves from cache
+- Due, missing, or other-tier snapshots are recomputed on read
+- mark_tenant_health_dirty recomputes once per tenant after commit, not on rollback
+- Sync status ingestion marks the tenant dirty only when sync state changed
+- next_refresh_due tracks the next SLA threshold crossing
+- Snapshot availability results for guards (including unconnected sources)
+- Sweep recomputes due snapshots
+- Merchant health guard reads the snapshot and falls back on errors
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.models.merchant_data_health import MerchantHealthState
+from src.models.tenant_health_snapshot import TenantHealthSnapshot
+from src.models.user import User
+from src.services import tenant_health_snapshot as snapshot_module
+from src.services.data_availability_service import DataAvailabilityResult
+from src.services.merchant_data_health import MerchantDataHealthResult
+from src.services.tenant_health_snapshot import (
+    HealthSnapshot,
+    HealthSnapshotCache,
+    HealthSnapshotTrigger,
+    TenantHealthSnapshotService,
+    mark_tenant_health_dirty,
+    next_refresh_due,
+)
+
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _source(state="fresh", last_sync_at=NOW - timedelta(minutes=30), warn=60, error=120):
+    return DataAvailabilityResult(
+        tenant_id="tenant-1",
+        source_type="shopify_orders",
+        state=state,
+        reason="sync_ok",
+        warn_threshold_minutes=warn,
+        error_threshold_minutes=error,
+        last_sync_at=last_sync_at,
+        last_sync_status="success",
+        minutes_since_sync=30,
+        state_changed_at=NOW,
+        previous_state=None,
+        evaluated_at=NOW,
+        billing_tier="free",
+    )
+
+
+def _evaluation(state=MerchantHealthState.HEALTHY, sources=None):
+    return MerchantDataHealthResult(
+        state=state,
+        message="",
+        ai_insights_enabled=state == MerchantHealthState.HEALTHY,
+        dashboards_enabled=state != MerchantHealthState.UNAVAILABLE,
+        exports_enabled=state == MerchantHealthState.HEALTHY,
+        evaluated_at=datetime.now(timezone.utc),
+        availability_state="fresh",
+        quality_state="pass",
+        sources=sources if sources is not None else [_source()],
+    )
+
+
+@pytest.fixture
+def cache():
+    cache = HealthSnapshotCache()
+    with patch.object(snapshot_module, "_cache_instance", cache):
+        yield cache
+
+
+@pytest.fixture
+def session(cache):
+    engine = create_engine("sqlite://")
+    TenantHealthSnapshot.__table__.create(bind=engine)
+    User.__table__.create(bind=engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def evaluate():
+    with patch(
+        "src.services.tenant_health_snapshot.MerchantDataHealthService.evaluate",
+        return_value=_evaluation(),
+    ) as mock_evaluate:
+        yield mock_evaluate
+
+
+class TestReadPath:
+    """get() and refresh()."""
+
+    def test_refresh_persists_and_caches(self, session, cache, evaluate):
+        snapshot = TenantHealthSnapshotService(session, cache).refresh(
+            "tenant-1", billing_tier="growth", trigger=HealthSnapshotTrigger.SYNC_COMPLETED,
+        )
+
+        row = session.query(TenantHealthSnapshot).one()
+        assert row.merchant_state == "healthy"
+        assert row.billing_tier == "growth"
+        assert row.trigger == "sync_completed"
+        assert row.sources[0]["source_type"] == "shopify_orders"
+        assert cache.get("tenant-1") == snapshot
+
+    def test_get_serves_cached_snapshot(self, session, cache, evaluate):
+        service = TenantHealthSnapshotService(session, cache)
+        service.refresh("tenant-1", billing_tier="free")
+        evaluate.reset_mock()
+
+        for _ in range(3):
+            assert service.get("tenant-1", billing_tier="free").merchant_state == "healthy"
+
+        evaluate.assert_not_called()
+
+    def test_get_loads_row_when_cache_cold(self, session, cache, evaluate):
+        service = TenantHealthSnapshotService(session, cache)
+        service.refresh("tenant-1", billing_tier="free")
+        cache.clear()
+        evaluate.reset_mock()
+
+        assert service.get("tenant-1", billing_tier="free").tenant_id == "tenant-1"
+        evaluate.assert_not_called()
+
+    def test_missing_due_or_other_tier_recomputes(self, session, cache, evaluate):
+        service = TenantHealthSnapshotService(session, cache)
+        service.get("tenant-1", billing_tier="free")
+        assert evaluate.call_count == 1
+
+        service.get("tenant-1", billing_tier="growth")
+        assert evaluate.call_count == 2
+
+        cache.get("tenant-1").refresh_due_at = datetime.now(timezone.utc) - timedelta(seconds=1)
+        service.get("tenant-1", billing_tier="growth")
+        assert evaluate.call_count == 3
+
+
+class TestMarkDirty:
+    """Event-driven recompute on commit."""
+
+    def test_recomputes_once_after_commit(self, session, evaluate):
+        session.add(User(id="u-1", clerk_user_id="clerk-1"))
+        session.flush()
+        mark_tenant_health_dirty(session, "tenant-1", HealthSnapshotTrigger.SYNC_FAILED)
+        mark_tenant_health_dirty(session, "tenant-1", HealthSnapshotTrigger.DQ_INCIDENT_OPENED)
+        evaluate.assert_not_called()
+
+        session.commit()
+
+        assert evaluate.call_count == 1
+        row = session.query(TenantHealthSnapshot).one()
+        assert row.trigger == "dq_incident_opened"
+
+    def test_dropped_on_rollback(self, session, evaluate):
+        session.add(User(id="u-1", clerk_user_id="clerk-1"))
+        session.flush()
+        mark_tenant_health_dirty(session, "tenant-1", HealthSnapshotTrigger.SYNC_FAILED)
+        session.rollback()
+        session.commit()
+
+        evaluate.assert_not_called()
+
+    def test_listeners_do_not_accumulate(self, session, evaluate):
+        from sqlalchemy import event
+
+        from src.services import tenant_health_snapshot
+
+        for i in range(3):
+            session.add(User(id=f"u-{i}", clerk_user_id=f"clerk-{i}"))
+            session.flush()
+            mark_tenant_health_dirty(session, "tenant-1", HealthSnapshotTrigger.SYNC_FAILED)
+            session.commit()
+
+        assert evaluate.call_count == 3
+        assert not event.contains(session, "after_commit", tenant_health_snapshot._on_after_commit)
+
+    def test_ignores_non_session(self, evaluate):
+        mark_tenant_health_dirty(MagicMock(), "tenant-1", HealthSnapshotTrigger.SYNC_FAILED)
+        evaluate.assert_not_called()
+
+    def test_sync_status_ingestion_marks_only_changes(self):
+        from src.ingestion.sync_status_ingestor import SyncStatusIngestor, SyncStatusResult
+
+        connection = MagicMock(tenant_id="tenant-1", last_sync_at=NOW, last_sync_status="success")
+        ingestor = SyncStatusIngestor(MagicMock(), "tenant-1", airbyte_client=MagicMock())
+        result = SyncStatusResult(
+            connection_id="conn-1",
+            airbyte_connection_id="ab-1",
+            source_type="shopify",
+            last_successful_sync_at=NOW,
+            last_sync_status="success",
+        )
+
+        with patch("src.ingestion.sync_status_ingestor.mark_tenant_health_dirty") as mark:
+            ingestor._persist_sync_status(connection, result)
+            mark.assert_not_called()
+
+            result.last_sync_status = "failed"
+            ingestor._persist_sync_status(connection, result)
+
+        mark.assert_called_once_with(
+            ingestor.db, "tenant-1", HealthSnapshotTrigger.SYNC_FAILED,
+        )
+
+
+class TestRefreshDue:
+    """next_refresh_due()."""
+
+    def test_fresh_source_due_at_warn_threshold(self):
+        due = next_refresh_due([_source()], NOW, max_age_seconds=3600)
+        assert due == NOW + timedelta(minutes=30)
+
+    def test_stale_source_due_at_error_threshold(self):
+        source = _source(state="stale", last_sync_at=NOW - timedelta(minutes=90))
+        assert next_refresh_due([source], NOW, max_age_seconds=3600) == NOW + timedelta(minutes=30)
+
+    def test_capped_by_max_age(self):
+        assert next_refresh_due([], NOW, max_age_seconds=600) == NOW + timedelta(minutes=10)
+
+
+class TestSnapshotViews:
+    """Guard-facing views of a snapshot."""
+
+    def test_unconnected_source_is_unavailable(self):
+        snapshot = HealthSnapshot(
+            tenant_id="tenant-1",
+            merchant_state="healthy",
+            availability_state="fresh",
+            quality_state="pass",
+            billing_tier="free",
+            computed_at=NOW,
+            refresh_due_at=NOW,
+            sources=[_source().to_dict()],
+        )
+
+        results = snapshot.availability_results(["shopify_orders", "google_ads"])
+
+        assert [(r.source_type, r.state) for r in results] == [
+            ("shopify_orders", "fresh"),
+            ("google_ads", "unavailable"),
+        ]
+        assert HealthSnapshot.from_json(snapshot.to_json()) == snapshot
+
+
+class TestSweep:
+    """Periodic sweep."""
+
+    def test_recomputes_due_rows_only(self, session, cache, evaluate):
+        service = TenantHealthSnapshotService(session, cache)
+        service.refresh("tenant-1", billing_tier="free")
+        service.refresh("tenant-2", billing_tier="free")
+        row = session.query(TenantHealthSnapshot).filter_by(tenant_id="tenant-1").one()
+        row.refresh_due_at = NOW
+        session.commit()
+        evaluate.reset_mock()
+
+        with patch.object(service, "_tenants_without_snapshot", return_value=[]):
+            assert service.sweep() == 1
+
+        evaluate.assert_called_once()
+        assert session.query(TenantHealthSnapshot).filter_by(tenant_id="tenant-1").one().trigger == "sweep"
+
+
+class TestMerchantHealthGuard:
+    """The guard reads the snapshot."""
+
+    def _request(self, db):
+        request = MagicMock()
+        request.state = MagicMock(spec=["db"])
+        request.state.db = db
+        return request
+
+    def test_guard_uses_snapshot(self, session, evaluate):
+        from src.middleware.merchant_health_guard import _evaluate_merchant_health
+
+        ctx = MagicMock(tenant_id="tenant-1", billing_tier="free")
+        with patch("src.middleware.merchant_health_guard.get_tenant_context", return_value=ctx):
+            first = _evaluate_merchant_health(self._request(session))
+            second = _evaluate_merchant_health(self._request(session))
+
+        assert first.state == second.state == MerchantHealthState.HEALTHY
+        assert evaluate.call_count == 1
+
+    def test_guard_falls_back_when_snapshot_fails(self):
+        from src.middleware.merchant_health_guard import _evaluate_merchant_health
+
+        ctx = MagicMock(tenant_id="tenant-1", billing_tier="free")
+        with patch("src.middleware.merchant_health_guard.get_tenant_context", return_value=ctx), \
+                patch.object(TenantHealthSnapshotService, "get", side_effect=RuntimeError("down")), \
+                patch(
+                    "src.services.merchant_data_health.MerchantDataHealthService.evaluate",
+                    return_value=_evaluation(MerchantHealthState.DELAYED),
+                ):
+            result = _evaluate_merchant_health(self._request(MagicMock()))
+
+        assert result.state == MerchantHealthState.DELAYED
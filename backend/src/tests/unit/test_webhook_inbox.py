@@ -0,0 +1,283 @@
+"""
+Tests for the durable webhook inbox.
+
+Tests cover:
+- enqueue_webhook dedupes on (source, event_id)
+- claim_events hands out only the oldest open event per ordering key
+- Processing marks events processed and releases the next event for the key
+- Failures retry with backoff, hold back the key, and go dead after max attempts
+- Non-retryable errors (bad payload, unknown topic) go straight to dead
+- Expired claim leases are reclaimable
+- Inbox lag reporting
+- Shopify route queues verified webhooks and acknowledges duplicates
+- Clerk ordering keys
+"""
+
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.routes import webhooks_shopify
+from src.api.routes.webhooks_clerk import clerk_ordering_key
+from src.models.webhook_inbox import WebhookInboxEvent, WebhookInboxStatus, WebhookSource
+from src.services import shopify_webhook_processor
+from src.services import webhook_inbox
+from src.services.webhook_inbox import (
+    claim_events,
+    enqueue_webhook,
+    get_inbox_lag,
+    process_event,
+    retry_delay_seconds,
+)
+from src.workers.webhook_inbox_worker import WebhookInboxWorker
+
+T0 = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool,
+    )
+    WebhookInboxEvent.__table__.create(bind=engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def session(session_factory):
+    session = session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def processors():
+    calls = []
+
+    def ok(db, shop_domain, data):
+        calls.append((shop_domain, data))
+        return "ok"
+
+    table = {"app/uninstalled": ok, "shop/redact": ok}
+    registry = shopify_webhook_processor.SHOPIFY_WEBHOOK_PROCESSORS
+    with patch.dict(registry, table, clear=True):
+        yield registry, calls
+
+
+def _add(session, event_id, shop="a.myshopify.com", topic="app/uninstalled", offset=0, payload=None):
+    event = WebhookInboxEvent(
+        source=WebhookSource.SHOPIFY.value,
+        event_id=event_id,
+        topic=topic,
+        ordering_key=shop,
+        payload=json.dumps(payload if payload is not None else {"n": event_id}),
+        received_at=T0 + timedelta(seconds=offset),
+        next_attempt_at=T0,
+    )
+    session.add(event)
+    session.commit()
+    return event
+
+
+class TestEnqueue:
+    def test_duplicate_event_id_is_dropped(self, session):
+        args = dict(
+            source=WebhookSource.SHOPIFY, event_id="wh-1", topic="app/uninstalled",
+            ordering_key="a.myshopify.com", payload=b'{"id": 1}',
+        )
+        assert enqueue_webhook(session, **args) is True
+        assert enqueue_webhook(session, **args) is False
+
+        rows = session.query(WebhookInboxEvent).all()
+        assert len(rows) == 1
+        assert rows[0].payload == '{"id": 1}'
+        assert rows[0].status == WebhookInboxStatus.PENDING.value
+
+    def test_same_event_id_from_other_source_is_kept(self, session):
+        common = dict(event_id="e-1", topic="t", ordering_key="k", payload=b"{}")
+        assert enqueue_webhook(session, source=WebhookSource.SHOPIFY, **common)
+        assert enqueue_webhook(session, source=WebhookSource.CLERK, **common)
+
+
+class TestClaimOrdering:
+    def test_only_oldest_open_event_per_key_is_claimed(self, session):
+        _add(session, "a1", offset=0)
+        _add(session, "a2", offset=1)
+        _add(session, "b1", shop="b.myshopify.com", offset=2)
+
+        claimed = claim_events(session, "w", limit=10)
+
+        assert sorted(e.event_id for e in claimed) == ["a1", "b1"]
+        assert all(e.status == WebhookInboxStatus.PROCESSING.value for e in claimed)
+        assert all(e.attempts == 1 for e in claimed)
+        # Heads are now processing; nothing else is claimable
+        assert claim_events(session, "w", limit=10) == []
+
+    def test_processing_releases_next_event(self, session, processors):
+        _, calls = processors
+        _add(session, "a1", offset=0)
+        _add(session, "a2", offset=1)
+
+        for expected in ("a1", "a2"):
+            [event] = claim_events(session, "w", limit=10)
+            assert event.event_id == expected
+            assert process_event(session, event) == WebhookInboxStatus.PROCESSED.value
+
+        assert [data["n"] for _, data in calls] == ["a1", "a2"]
+        assert session.query(WebhookInboxEvent).filter_by(status="processed").count() == 2
+
+    def test_expired_lease_is_reclaimed(self, session):
+        event = _add(session, "a1")
+        event.status = WebhookInboxStatus.PROCESSING.value
+        event.attempts = 1
+        event.locked_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+        session.commit()
+
+        [claimed] = claim_events(session, "w2", limit=10)
+
+        assert claimed.claimed_by == "w2"
+        assert claimed.attempts == 2
+
+
+class TestFailures:
+    def test_failure_retries_and_holds_back_key(self, session, processors):
+        table, _ = processors
+        table["app/uninstalled"] = lambda db, shop, data: (_ for _ in ()).throw(RuntimeError("db down"))
+        _add(session, "a1", offset=0)
+        _add(session, "a2", topic="shop/redact", offset=1)
+        _add(session, "b1", shop="b.myshopify.com", topic="shop/redact", offset=2)
+
+        for event in claim_events(session, "w", limit=10):
+            process_event(session, event)
+
+        a1 = session.query(WebhookInboxEvent).filter_by(event_id="a1").one()
+        assert a1.status == WebhookInboxStatus.RETRY.value
+        assert a1.last_error == "db down"
+        assert a1.next_attempt_at.replace(tzinfo=timezone.utc) > datetime.now(timezone.utc)
+        assert session.query(WebhookInboxEvent).filter_by(event_id="b1").one().status == "processed"
+        # a2 waits behind the retrying a1
+        assert claim_events(session, "w", limit=10) == []
+
+    def test_gives_up_after_max_attempts(self, session, processors):
+        table, _ = processors
+        table["app/uninstalled"] = lambda db, shop, data: (_ for _ in ()).throw(RuntimeError("boom"))
+        event = _add(session, "a1")
+        event.attempts = webhook_inbox.WEBHOOK_INBOX_MAX_ATTEMPTS - 1
+        session.commit()
+
+        [claimed] = claim_events(session, "w", limit=10)
+        assert process_event(session, claimed) == WebhookInboxStatus.DEAD.value
+
+    def test_bad_payload_and_unknown_topic_are_dead_and_release_key(self, session, processors):
+        _add(session, "a1", topic="orders/create", offset=0)
+        _add(session, "a2", offset=1)
+
+        [first] = claim_events(session, "w", limit=10)
+        assert process_event(session, first) == WebhookInboxStatus.DEAD.value
+
+        [second] = claim_events(session, "w", limit=10)
+        assert second.event_id == "a2"
+
+    def test_retry_delay_doubles_up_to_cap(self):
+        with patch.object(webhook_inbox, "WEBHOOK_INBOX_RETRY_BASE_SECONDS", 5), \
+                patch.object(webhook_inbox, "WEBHOOK_INBOX_RETRY_MAX_SECONDS", 30):
+            assert [retry_delay_seconds(n) for n in (1, 2, 3, 4)] == [5, 10, 20, 30]
+
+
+class TestLagAndWorker:
+    def test_inbox_lag_counts_open_events(self, session):
+        _add(session, "a1", offset=0)
+        done = _add(session, "a2", offset=5)
+        done.status = WebhookInboxStatus.PROCESSED.value
+        session.commit()
+
+        lag = get_inbox_lag(session, now=T0 + timedelta(seconds=60))
+
+        assert lag == {"open_events": 1, "oldest_age_seconds": 60.0}
+
+    def test_worker_batch_processes_claimed_events(self, session_factory, processors):
+        session = session_factory()
+        _add(session, "a1")
+        _add(session, "b1", shop="b.myshopify.com", offset=1)
+        session.close()
+
+        worker = WebhookInboxWorker(session_factory, workers=1, claim_batch=10)
+
+        assert worker.process_batch("t0") == 2
+        assert worker.process_batch("t0") == 0
+
+
+class TestRoutes:
+    SECRET = "inbox-test-secret"
+
+    @pytest.fixture
+    def client(self, session, monkeypatch):
+        monkeypatch.setenv("SHOPIFY_API_SECRET", self.SECRET)
+        monkeypatch.setattr(webhooks_shopify, "WEBHOOK_INBOX_ENABLED", True)
+        app = FastAPI()
+        app.include_router(webhooks_shopify.router)
+        app.dependency_overrides[webhooks_shopify.get_db_session] = lambda: session
+        return TestClient(app)
+
+    def _post(self, client, body, webhook_id="wh-1"):
+        signature = base64.b64encode(
+            hmac.new(self.SECRET.encode(), body, hashlib.sha256).digest()
+        ).decode()
+        return client.post(
+            "/api/webhooks/shopify/shop-redact",
+            content=body,
+            headers={
+                "X-Shopify-Hmac-Sha256": signature,
+                "X-Shopify-Shop-Domain": "a.myshopify.com",
+                "X-Shopify-Webhook-Id": webhook_id,
+            },
+        )
+
+    def test_verified_webhook_is_queued_not_processed(self, client, session):
+        body = b'{"shop_id": 1}'
+        with patch.object(webhooks_shopify, "process_shop_redact") as inline:
+            first = self._post(client, body)
+            second = self._post(client, body)
+
+        inline.assert_not_called()
+        assert first.status_code == 200
+        assert first.json()["message"] == "Webhook queued"
+        assert second.json()["message"] == "Duplicate webhook ignored"
+        [event] = session.query(WebhookInboxEvent).all()
+        assert (event.topic, event.ordering_key, event.payload) == (
+            "shop/redact", "a.myshopify.com", body.decode(),
+        )
+
+    def test_invalid_signature_is_not_queued(self, client, session):
+        response = client.post(
+            "/api/webhooks/shopify/shop-redact",
+            content=b"{}",
+            headers={
+                "X-Shopify-Hmac-Sha256": "bad",
+                "X-Shopify-Shop-Domain": "a.myshopify.com",
+            },
+        )
+
+        assert response.status_code == 401
+        assert session.query(WebhookInboxEvent).count() == 0
+
+
+class TestClerkOrderingKey:
+    def test_membership_events_order_per_organization(self):
+        payload = {"data": {"id": "mem_1", "organization": {"id": "org_1"}}}
+        assert clerk_ordering_key("organizationMembership.created", payload) == "org_1"
+
+    def test_organization_and_user_events_use_object_id(self):
+        assert clerk_ordering_key("organization.updated", {"data": {"id": "org_2"}}) == "org_2"
+        assert clerk_ordering_key("user.created", {"data": {"id": "user_1"}}) == "user_1"
@@ -2,7 +2,9 @@
 Async audit export worker.
 
 Handles large exports (>10K rows) that would block the API.
-Runs as a polling worker that picks up queued export jobs from the DB.
+Runs as a polling worker that claims queued ga_audit_exports rows with
+SELECT ... FOR UPDATE SKIP LOCKED (several workers can run side by side)
+and streams each export into the export file store.
 
 LOCKED RULES:
 - Export respects tenant scoping
@@ -12,18 +14,26 @@ LOCKED RULES:
 
 import logging
 import os
+import socket
 import time
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from typing import Optional
 
+from sqlalchemy import and_, or_
 from sqlalchemy.orm import Session
 
+from src.models.audit_export import AuditExportStatus, GAAuditExport
 from src.services.audit_exporter import AuditExporterService, ExportFormat
+from src.services.export_store import ExportStore, get_export_store
 
 logger = logging.getLogger(__name__)
 
 # Poll interval (seconds)
 POLL_INTERVAL = int(os.getenv("AUDIT_EXPORT_POLL_INTERVAL", "30"))
 
+# Age after which a RUNNING export is presumed abandoned and reclaimable (seconds)
+CLAIM_LEASE_SECONDS = int(os.getenv("AUDIT_EXPORT_CLAIM_LEASE_SECONDS", "3600"))
+
 
 class AuditExportJob:
     """
@@ -135,6 +145,80 @@ class AuditExportJob:
                 "error": str(exc),
             }
 
+    def run_queued(
+        self,
+        export: GAAuditExport,
+        store: Optional[ExportStore] = None,
+    ) -> GAAuditExport:
+        """
+        Produce a claimed GAAuditExport into the file store.
+
+        Streams rows straight from the DB cursor into the store, then
+        marks the export completed (or failed) and commits.
+        """
+        start_time = time.monotonic()
+        try:
+            export.record_count = self._exporter.export_to_store(
+                export, store or get_export_store()
+            )
+            export.status = AuditExportStatus.COMPLETED.value
+            export.error = None
+        except Exception as exc:
+            self.db.rollback()
+            logger.error(
+                "audit_export_job_exception",
+                extra={"export_id": export.id, "error": str(exc)},
+                exc_info=True,
+            )
+            export.status = AuditExportStatus.FAILED.value
+            export.error = str(exc)
+        export.completed_at = datetime.now(timezone.utc)
+        self.db.commit()
+
+        logger.info(
+            "audit_export_job_finished",
+            extra={
+                "export_id": export.id,
+                "status": export.status,
+                "record_count": export.record_count,
+                "elapsed_seconds": round(time.monotonic() - start_time, 2),
+            },
+        )
+        return export
+
+
+def claim_next_export(db: Session, worker_id: str) -> Optional[GAAuditExport]:
+    """
+    Claim the oldest queued export.
+
+    The candidate row is locked with FOR UPDATE SKIP LOCKED, so concurrent
+    workers never claim the same export; the RUNNING transition is
+    committed immediately. RUNNING exports older than the claim lease
+    (crashed worker) are claimable again.
+    """
+    stale_before = datetime.now(timezone.utc) - timedelta(seconds=CLAIM_LEASE_SECONDS)
+    export = (
+        db.query(GAAuditExport)
+        .filter(or_(
+            GAAuditExport.status == AuditExportStatus.QUEUED.value,
+            and_(
+                GAAuditExport.status == AuditExportStatus.RUNNING.value,
+                GAAuditExport.started_at < stale_before,
+            ),
+        ))
+        .order_by(GAAuditExport.created_at.asc())
+        .with_for_update(skip_locked=True)
+        .first()
+    )
+    if export is None:
+        db.rollback()
+        return None
+    export.status = AuditExportStatus.RUNNING.value
+    export.claimed_by = worker_id
+    export.started_at = datetime.now(timezone.utc)
+    db.commit()
+    return export
+
 
 class AuditExportWorker:
     """
@@ -145,8 +229,10 @@ class AuditExportWorker:
     would be backed by a job queue table.
     """
 
-    def __init__(self, db_session_factory):
+    def __init__(self, db_session_factory, store: Optional[ExportStore] = None):
         self._db_session_factory = db_session_factory
+        self._store = store
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
         self._running = True
 
     def stop(self):
@@ -167,14 +253,22 @@ class AuditExportWorker:
             time.sleep(POLL_INTERVAL)
         logger.info("audit_export_worker_stopped")
 
-    def _poll_and_process(self):
+    def _poll_and_process(self) -> int:
         """
-        Poll for queued export jobs and process them.
+        Claim and produce queued exports until none are left.
 
-        In GA scope, this is a placeholder that demonstrates the pattern.
-        Production implementation would query a job table.
+        Returns:
+            Number of exports processed
         """
-        # GA: No persistent job table yet.
-        # This worker exists to handle the async export pattern.
-        # Jobs are dispatched directly in the API layer for now.
-        pass
+        processed = 0
+        while self._running:
+            db = self._db_session_factory()
+            try:
+                export = claim_next_export(db, self._worker_id)
+                if export is None:
+                    return processed
+                AuditExportJob(db).run_queued(export, self._store)
+                processed += 1
+            finally:
+                db.close()
+        return processed
@@ -12,6 +12,11 @@ to the existing ingestion infrastructure:
 - JobDispatcher: isolation enforcement (one active per connection)
 - JobEntitlementChecker: billing-gated execution
 
+Jobs run concurrently (ConcurrentJobExecutor): up to
+WORKER_MAX_CONCURRENT_SYNCS in flight, capped per tenant and per source
+type, with rows claimed via FOR UPDATE SKIP LOCKED so several executor
+processes can run side by side.
+
 CONSTRAINTS:
 - One active sync per connection (enforced by JobRunner/JobDispatcher)
 - No Celery, no Temporal — driven by Postgres job state
@@ -30,6 +35,7 @@ import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from typing import Callable, Optional
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
@@ -70,18 +76,42 @@ class ExecutorStats:
         }
 
 
-def _get_database_session() -> Session:
-    """Create database session for executor."""
-    database_url = os.getenv("DATABASE_URL")
-    if not database_url:
-        raise ValueError("DATABASE_URL environment variable is required")
+_session_factory: Optional[sessionmaker] = None
 
-    if database_url.startswith("postgres://"):
-        database_url = database_url.replace("postgres://", "postgresql://", 1)
 
-    engine = create_engine(database_url, pool_pre_ping=True)
-    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return session_factory()
+def _get_session_factory() -> sessionmaker:
+    """
+    Get the process-wide session factory for the executor.
+
+    The engine is created once so concurrent jobs share one connection pool
+    sized for the executor's in-flight limit (WORKER_MAX_CONCURRENT_SYNCS).
+    """
+    from src.ingestion.jobs.executor import ExecutorConfig
+
+    global _session_factory
+    if _session_factory is None:
+        database_url = os.getenv("DATABASE_URL")
+        if not database_url:
+            raise ValueError("DATABASE_URL environment variable is required")
+
+        if database_url.startswith("postgres://"):
+            database_url = database_url.replace("postgres://", "postgresql://", 1)
+
+        max_in_flight = ExecutorConfig.from_env().max_in_flight
+        engine = create_engine(
+            database_url,
+            pool_pre_ping=True,
+            # One session per in-flight job, plus claim and cycle sessions
+            pool_size=max_in_flight + 2,
+            max_overflow=max_in_flight,
+        )
+        _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    return _session_factory
+
+
+def _get_database_session() -> Session:
+    """Create database session for executor."""
+    return _get_session_factory()()
 
 
 def _update_last_sync_timestamps(db_session: Session) -> None:
@@ -131,7 +161,11 @@ def _update_last_sync_timestamps(db_session: Session) -> None:
         )
 
 
-async def run_cycle(db_session: Session, stats: ExecutorStats) -> None:
+async def run_cycle(
+    db_session: Session,
+    stats: ExecutorStats,
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> None:
     """
     Run one executor cycle: process queued jobs, then retry jobs.
 
@@ -140,10 +174,17 @@ async def run_cycle(db_session: Session, stats: ExecutorStats) -> None:
     Args:
         db_session: Database session
         stats: Cumulative stats tracker
+        session_factory: Optional session factory; when provided, jobs run
+            concurrently, each on its own session
     """
     from src.ingestion.jobs.runner import JobRunner
+    from src.ingestion.jobs.executor import ExecutorConfig
 
-    runner = JobRunner(db_session=db_session)
+    runner = JobRunner(
+        db_session=db_session,
+        session_factory=session_factory,
+        executor_config=ExecutorConfig.from_env() if session_factory else None,
+    )
 
     try:
         queued = await runner.process_queued_jobs(limit=MAX_JOBS_PER_CYCLE)
@@ -198,10 +239,12 @@ async def run_executor() -> None:
         },
     )
 
+    session_factory = _get_session_factory()
+
     while not shutdown_event.is_set():
-        session = _get_database_session()
+        session = session_factory()
         try:
-            await run_cycle(session, stats)
+            await run_cycle(session, stats, session_factory=session_factory)
         finally:
             session.close()
 
@@ -12,6 +12,15 @@ FLOW:
 4. JobDispatcher enforces one-active-sync-per-connection isolation
 5. Entitlements are checked at execution time by the executor
 
+BATCHED MODE (default, SYNC_SCHEDULER_MODE=batched):
+The same rules applied set-wise, so a tick costs a handful of queries
+regardless of connection count:
+1. One anti-join selects enabled connections with no queued/running job
+   that could be due under the shortest plan interval
+2. Plan tiers and latest subscriptions are resolved for all tenants at once
+3. Entitlements are evaluated once per tenant and memoized
+4. All due IngestionJob rows are written with multi-row INSERTs
+
 CONSTRAINTS:
 - One active sync per connection at a time (enforced by JobDispatcher)
 - Plan limits are respected strictly (via SyncPlanResolver)
@@ -29,12 +38,15 @@ Deployed as a Render cron job in render.yaml.
 
 import os
 import sys
+import uuid
 import asyncio
 import logging
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timezone, timedelta
+from typing import Iterable, Optional
 
-from sqlalchemy import create_engine, select
+from sqlalchemy import create_engine, select, exists, insert, or_, and_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import sessionmaker, Session
 
 logging.basicConfig(
@@ -46,6 +58,15 @@ logger = logging.getLogger(__name__)
 # Maximum connections to evaluate per scheduler run (guard against runaway queries)
 MAX_CONNECTIONS_PER_RUN = 500
 
+# Scheduling mode: "batched" (set-based) or "per_connection" (legacy loop)
+SCHEDULER_MODE = os.getenv("SYNC_SCHEDULER_MODE", "batched").strip().lower()
+
+# Upper bound on candidates the batched mode loads per tick
+BATCH_MAX_CONNECTIONS_PER_RUN = int(os.getenv("SYNC_SCHEDULER_BATCH_MAX_CONNECTIONS", "100000"))
+
+# Rows per multi-row INSERT (keeps bind parameters well under driver limits)
+JOB_INSERT_BATCH_SIZE = 1000
+
 
 @dataclass
 class SchedulerStats:
@@ -128,6 +149,264 @@ def _check_entitlement(db_session: Session, tenant_id: str) -> bool:
     return result.is_allowed
 
 
+def _latest_subscriptions(db_session: Session, tenant_ids: list[str]) -> dict:
+    """
+    Fetch the most recent subscription (any status) for each tenant.
+
+    Mirrors the lookup JobEntitlementChecker performs per tenant, batched so
+    the checker can be handed the subscription instead of querying for it.
+
+    Returns:
+        Mapping of tenant_id to Subscription for tenants that have one.
+    """
+    from src.models.subscription import Subscription
+    from src.services.sync_plan_resolver import TIER_LOOKUP_BATCH_SIZE
+
+    latest: dict = {}
+    for start in range(0, len(tenant_ids), TIER_LOOKUP_BATCH_SIZE):
+        batch = tenant_ids[start:start + TIER_LOOKUP_BATCH_SIZE]
+        stmt = (
+            select(Subscription)
+            .where(Subscription.tenant_id.in_(batch))
+            .order_by(Subscription.tenant_id, Subscription.created_at.desc())
+        )
+        for subscription in db_session.execute(stmt).scalars():
+            latest.setdefault(subscription.tenant_id, subscription)
+    return latest
+
+
+def _check_entitlements(db_session: Session, tenant_ids: Iterable[str]) -> dict[str, bool]:
+    """
+    Evaluate the sync entitlement once per tenant.
+
+    Uses a single JobEntitlementChecker (so plans.json is read once) and
+    prefetched subscriptions. The outcome depends only on the subscription's
+    status, plan and grace period, so tenants sharing those are evaluated
+    once. A failure for one tenant denies that tenant only.
+
+    Returns:
+        Mapping of tenant_id to whether sync jobs are allowed.
+    """
+    from src.jobs.job_entitlements import JobEntitlementChecker, JobType
+
+    unique_ids = list(dict.fromkeys(tenant_ids))
+    subscriptions = _latest_subscriptions(db_session, unique_ids)
+    checker = JobEntitlementChecker(db_session)
+
+    allowed: dict[str, bool] = {}
+    by_subscription: dict[tuple, bool] = {}
+    for tenant_id in unique_ids:
+        subscription = subscriptions.get(tenant_id)
+        key = (
+            (subscription.status, subscription.plan_id, subscription.grace_period_ends_on)
+            if subscription is not None
+            else None
+        )
+        if key in by_subscription:
+            allowed[tenant_id] = by_subscription[key]
+            continue
+        try:
+            result = checker.check_job_entitlement(
+                tenant_id,
+                JobType.SYNC,
+                subscription=subscription,
+            )
+            allowed[tenant_id] = by_subscription[key] = result.is_allowed
+        except Exception:
+            logger.exception(
+                "scheduler.entitlement_error",
+                extra={"tenant_id": tenant_id},
+            )
+            allowed[tenant_id] = False
+    return allowed
+
+
+def _get_schedulable_connections(
+    db_session: Session,
+    now: datetime,
+    limit: int = BATCH_MAX_CONNECTIONS_PER_RUN,
+):
+    """
+    Select connections that may need a sync, in one anti-join.
+
+    Filters out connections that already have a queued or running job and
+    connections synced more recently than the shortest plan interval (those
+    cannot be due on any plan). Only the columns needed to dispatch are
+    loaded.
+
+    Returns:
+        List of rows with id, tenant_id, airbyte_connection_id, source_type,
+        connection_name and last_sync_at.
+    """
+    from src.models.airbyte_connection import (
+        TenantAirbyteConnection,
+        ConnectionStatus,
+    )
+    from src.ingestion.jobs.models import IngestionJob, JobStatus
+    from src.services.sync_plan_resolver import SYNC_INTERVAL_BY_TIER
+
+    shortest_interval = min(SYNC_INTERVAL_BY_TIER.values())
+    earliest_due = now - timedelta(minutes=shortest_interval)
+
+    active_job = exists().where(
+        and_(
+            IngestionJob.tenant_id == TenantAirbyteConnection.tenant_id,
+            IngestionJob.connector_id == TenantAirbyteConnection.id,
+            IngestionJob.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+        )
+    )
+
+    stmt = (
+        select(
+            TenantAirbyteConnection.id,
+            TenantAirbyteConnection.tenant_id,
+            TenantAirbyteConnection.airbyte_connection_id,
+            TenantAirbyteConnection.source_type,
+            TenantAirbyteConnection.connection_name,
+            TenantAirbyteConnection.last_sync_at,
+        )
+        .where(
+            TenantAirbyteConnection.is_enabled.is_(True),
+            TenantAirbyteConnection.status.in_([
+                ConnectionStatus.ACTIVE,
+                ConnectionStatus.PENDING,
+            ]),
+            or_(
+                TenantAirbyteConnection.last_sync_at.is_(None),
+                TenantAirbyteConnection.last_sync_at <= earliest_due,
+            ),
+            ~active_job,
+        )
+        .order_by(TenantAirbyteConnection.last_sync_at.asc().nullsfirst())
+        .limit(limit)
+    )
+
+    return db_session.execute(stmt).all()
+
+
+def _insert_jobs(db_session: Session, rows: list[dict]) -> int:
+    """
+    Insert queued IngestionJob rows with multi-row INSERT statements.
+
+    If a chunk collides with the active-job unique index (a job was
+    dispatched for one of its connections since the anti-join ran), that
+    chunk is retried row by row so only the conflicting connections are
+    skipped.
+
+    Returns:
+        Number of jobs inserted.
+    """
+    from src.ingestion.jobs.models import IngestionJob
+
+    inserted = 0
+    for start in range(0, len(rows), JOB_INSERT_BATCH_SIZE):
+        chunk = rows[start:start + JOB_INSERT_BATCH_SIZE]
+        try:
+            with db_session.begin_nested():
+                db_session.execute(insert(IngestionJob.__table__), chunk)
+            inserted += len(chunk)
+        except IntegrityError:
+            logger.warning(
+                "scheduler.batch_insert_conflict",
+                extra={"chunk_size": len(chunk)},
+            )
+            for row in chunk:
+                try:
+                    with db_session.begin_nested():
+                        db_session.execute(insert(IngestionJob.__table__), [row])
+                    inserted += 1
+                except IntegrityError:
+                    pass
+    return inserted
+
+
+def run_scheduler_batched(
+    db_session: Session,
+    now: Optional[datetime] = None,
+) -> SchedulerStats:
+    """
+    Set-based scheduler tick: same rules as run_scheduler(), in bulk.
+
+    Query count is independent of the number of connections (apart from
+    fixed-size batching), so a tick stays near-constant time as the
+    connection count grows.
+
+    Stats note: connections filtered by the anti-join (active job, or
+    synced within the shortest plan interval) are not loaded, so they are
+    not counted in connections_evaluated or the skip counters.
+
+    Args:
+        db_session: Database session
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        SchedulerStats with run summary
+    """
+    from src.services.sync_plan_resolver import SyncPlanResolver, is_due_for_interval
+    from src.ingestion.jobs.models import JobStatus
+
+    stats = SchedulerStats()
+    now = now or datetime.now(timezone.utc)
+
+    try:
+        candidates = _get_schedulable_connections(db_session, now)
+        stats.connections_evaluated = len(candidates)
+
+        logger.info(
+            "Batched scheduler run started",
+            extra={"candidate_count": len(candidates)},
+        )
+
+        if not candidates:
+            logger.info("Scheduler run completed", extra=stats.to_dict())
+            return stats
+
+        tenant_ids = list(dict.fromkeys(row.tenant_id for row in candidates))
+        intervals = SyncPlanResolver(db_session).get_sync_intervals(tenant_ids)
+
+        due = []
+        for row in candidates:
+            if is_due_for_interval(row.last_sync_at, intervals[row.tenant_id], now):
+                due.append(row)
+            else:
+                stats.jobs_skipped_not_due += 1
+
+        entitled = _check_entitlements(db_session, {row.tenant_id for row in due})
+
+        job_rows = []
+        for row in due:
+            if not entitled[row.tenant_id]:
+                stats.jobs_skipped_entitlement += 1
+                continue
+            job_rows.append({
+                "job_id": str(uuid.uuid4()),
+                "tenant_id": row.tenant_id,
+                "connector_id": row.id,
+                "external_account_id": row.airbyte_connection_id,
+                "status": JobStatus.QUEUED,
+                "retry_count": 0,
+                "job_metadata": {
+                    "trigger": "scheduler",
+                    "source_type": row.source_type,
+                    "connection_name": row.connection_name,
+                },
+            })
+
+        inserted = _insert_jobs(db_session, job_rows)
+        db_session.commit()
+
+        stats.jobs_dispatched = inserted
+        stats.jobs_skipped_active = len(job_rows) - inserted
+
+    except Exception:
+        stats.errors += 1
+        db_session.rollback()
+        logger.exception("scheduler.batch_error")
+
+    logger.info("Scheduler run completed", extra=stats.to_dict())
+    return stats
+
+
 def run_scheduler(db_session: Session) -> SchedulerStats:
     """
     Evaluate all enabled connections and dispatch sync jobs for those due.
@@ -230,7 +509,10 @@ async def run_scheduler_async() -> dict:
     """
     session = _get_database_session()
     try:
-        stats = run_scheduler(session)
+        if SCHEDULER_MODE == "per_connection":
+            stats = run_scheduler(session)
+        else:
+            stats = run_scheduler_batched(session)
         return stats.to_dict()
     finally:
         session.close()
@@ -0,0 +1,156 @@
+"""
+Webhook inbox worker.
+
+Long-lived worker that processes webhooks queued by the Shopify and Clerk
+webhook routes (see src.services.webhook_inbox). A pool of threads each
+claims a batch of due events - at most one per shop / Clerk organization,
+the oldest open one - and processes them on its own DB session. Several
+worker processes can run side by side.
+
+The main thread emits the webhook_inbox_lag metric (open events and the
+age of the oldest) every WEBHOOK_INBOX_LAG_INTERVAL_SECONDS.
+
+Usage:
+    python -m src.workers.webhook_inbox_worker
+
+Configuration:
+- WEBHOOK_INBOX_WORKERS: Processing threads (default: 4)
+- WEBHOOK_INBOX_CLAIM_BATCH: Events claimed per thread per poll (default: 10)
+- WEBHOOK_INBOX_POLL_INTERVAL_SECONDS: Idle sleep between polls (default: 1)
+- WEBHOOK_INBOX_LAG_INTERVAL_SECONDS: Lag metric interval (default: 30)
+"""
+
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+from typing import Callable
+
+from sqlalchemy.orm import Session
+
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+WEBHOOK_INBOX_WORKERS = int(os.getenv("WEBHOOK_INBOX_WORKERS", "4"))
+WEBHOOK_INBOX_CLAIM_BATCH = int(os.getenv("WEBHOOK_INBOX_CLAIM_BATCH", "10"))
+WEBHOOK_INBOX_POLL_INTERVAL_SECONDS = float(os.getenv("WEBHOOK_INBOX_POLL_INTERVAL_SECONDS", "1"))
+WEBHOOK_INBOX_LAG_INTERVAL_SECONDS = float(os.getenv("WEBHOOK_INBOX_LAG_INTERVAL_SECONDS", "30"))
+
+
+class WebhookInboxWorker:
+    """Thread pool draining the webhook inbox."""
+
+    def __init__(
+        self,
+        db_session_factory: Callable[[], Session],
+        workers: int = WEBHOOK_INBOX_WORKERS,
+        claim_batch: int = WEBHOOK_INBOX_CLAIM_BATCH,
+    ):
+        self._db_session_factory = db_session_factory
+        self._workers = max(1, workers)
+        self._claim_batch = claim_batch
+        self._worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop = threading.Event()
+
+    def stop(self):
+        """Signal all threads to stop after their current batch."""
+        self._stop.set()
+
+    def process_batch(self, thread_name: str) -> int:
+        """
+        Claim and process one batch of events.
+
+        Returns:
+            Number of events processed (any outcome)
+        """
+        from src.services.webhook_inbox import claim_events, process_event
+
+        db = self._db_session_factory()
+        try:
+            events = claim_events(db, f"{self._worker_id}:{thread_name}", self._claim_batch)
+            for event in events:
+                process_event(db, event)
+            return len(events)
+        finally:
+            db.close()
+
+    def _run_thread(self, thread_name: str):
+        while not self._stop.is_set():
+            try:
+                processed = self.process_batch(thread_name)
+            except Exception:
+                logger.error("webhook_inbox_poll_error", exc_info=True)
+                processed = 0
+            if processed < self._claim_batch:
+                self._stop.wait(WEBHOOK_INBOX_POLL_INTERVAL_SECONDS)
+
+    def emit_lag(self):
+        """Emit the webhook_inbox_lag metric."""
+        from src.monitoring.webhook_metrics import get_webhook_metrics
+        from src.services.webhook_inbox import get_inbox_lag
+
+        db = self._db_session_factory()
+        try:
+            lag = get_inbox_lag(db)
+        finally:
+            db.close()
+        get_webhook_metrics().record_lag(lag["open_events"], lag["oldest_age_seconds"])
+
+    def run(self):
+        """Start the processing threads and report lag until stopped."""
+        logger.info("Webhook inbox worker starting", extra={
+            "workers": self._workers,
+            "claim_batch": self._claim_batch,
+        })
+        threads = [
+            threading.Thread(
+                target=self._run_thread,
+                args=(f"t{index}",),
+                name=f"webhook-inbox-{index}",
+                daemon=True,
+            )
+            for index in range(self._workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        while not self._stop.is_set():
+            try:
+                self.emit_lag()
+            except Exception:
+                logger.error("webhook_inbox_lag_error", exc_info=True)
+            self._stop.wait(WEBHOOK_INBOX_LAG_INTERVAL_SECONDS)
+
+        for thread in threads:
+            thread.join()
+        logger.info("Webhook inbox worker stopped")
+
+
+def main():
+    """Entry point for running the worker from the command line."""
+    from src.database.session import get_session_factory
+
+    worker = WebhookInboxWorker(get_session_factory())
+
+    def _shutdown(signum, frame):
+        logger.info("Shutdown signal received", extra={"signal": signum})
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    try:
+        worker.run()
+        sys.exit(0)
+    except Exception as e:
+        logger.error("Webhook inbox worker crashed", extra={"error": str(e)})
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
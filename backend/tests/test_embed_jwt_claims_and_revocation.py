@@ -295,6 +295,18 @@ class TestEmbedTokenStore:
         assert call_args[2] == "1"
         mock_redis.delete.assert_called_with("embed:token:jti-abc")
 
+    def test_revoke_token_publishes_revocation(self):
+        """revoke_token publishes the JTI so Superset workers update immediately."""
+        mock_redis = Mock()
+        mock_redis.ttl.return_value = 1800
+        store = self._create_store(mock_redis)
+
+        store.revoke_token("jti-abc")
+
+        channel, message = mock_redis.publish.call_args[0]
+        assert channel == "embed:revocations"
+        assert json.loads(message) == {"jti": "jti-abc", "ttl": 1800}
+
     def test_revoke_all_for_user(self):
         """revoke_all_for_user revokes all active JTIs for a user."""
         mock_redis = Mock()
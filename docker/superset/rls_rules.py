@@ -4,7 +4,12 @@ These rules enforce tenant isolation at the dataset level.
 
 ROLE-BASED RLS STRATEGY:
 - Merchant users: tenant_id = '{{ current_user.tenant_id }}'
-- Agency users: tenant_id IN ({{ current_user.allowed_tenants | tojson }})
+- Agency users: tenant_id = ANY(group_members('{{ current_user.tenant_group_id }}'))
+  The embed JWT carries only the tenant group id; members are resolved
+  server-side from tenant_group_members (backend migration 0066), so the
+  rendered clause and Superset's cache key are shared per tenant group.
+  Tokens without a group (issued before groups, or when the backend could
+  not store one) fall back to tenant_id IN (allowed_tenants).
 - Super admin: 1=1 (no filtering)
 
 DENY-BY-DEFAULT:
@@ -34,10 +39,20 @@ class UserRoleType(Enum):
 DENY_BY_DEFAULT_CLAUSE = "1=0"
 
 
+# Agency clause: tenant group resolved server-side, inline list as fallback
+AGENCY_GROUP_CLAUSE_TEMPLATE = (
+    "{% if current_user.tenant_group_id %}"
+    "tenant_id = ANY(group_members('{{ current_user.tenant_group_id }}'))"
+    "{% else %}"
+    "tenant_id IN ({{ current_user.allowed_tenants | tojson }})"
+    "{% endif %}"
+)
+
+
 # Base RLS clause templates by role type
 RLS_CLAUSE_TEMPLATES = {
     UserRoleType.MERCHANT: "tenant_id = '{{ current_user.tenant_id }}'",
-    UserRoleType.AGENCY: "tenant_id IN ({{ current_user.allowed_tenants | tojson }})",
+    UserRoleType.AGENCY: AGENCY_GROUP_CLAUSE_TEMPLATE,
     UserRoleType.SUPER_ADMIN: "1=1",  # No filtering for super admin
 }
 
@@ -191,10 +206,10 @@ WHERE tenant_id != '{{ current_user.tenant_id }}';
 # SQL to validate agency RLS enforcement
 RLS_AGENCY_VALIDATION_SQL = """
 -- Run this query as an agency user
--- Expected result: 0 rows (only assigned tenants visible)
+-- Expected result: 0 rows (only the tenant group's members visible)
 SELECT COUNT(*) as unauthorized_tenant_rows
 FROM fact_orders
-WHERE tenant_id NOT IN ({{ current_user.allowed_tenants | tojson }});
+WHERE NOT (tenant_id = ANY(group_members('{{ current_user.tenant_group_id }}')));
 """
 
 
@@ -331,7 +346,7 @@ def create_role_based_rls_rules(superset_client):
 
     Creates RLS rules for each role type:
     - merchant_admin/merchant_viewer: Single tenant isolation
-    - agency_admin/agency_viewer: Multi-tenant isolation via allowed_tenants
+    - agency_admin/agency_viewer: Multi-tenant isolation via tenant group
     - super_admin: No filtering
 
     Args:
@@ -447,12 +462,14 @@ def get_user_context():
     Returns dict with:
     - tenant_id: Current active tenant
     - allowed_tenants: List of accessible tenants (for agency users)
+    - tenant_group_id: Tenant group of an agency user
     - is_agency_user: Boolean flag
     '''
     user = g.user
     return {
         'tenant_id': getattr(user, 'tenant_id', None),
         'allowed_tenants': getattr(user, 'allowed_tenants', []),
+        'tenant_group_id': getattr(user, 'tenant_group_id', None),
         'is_agency_user': getattr(user, 'is_agency_user', False),
     }
 """
@@ -14,29 +14,47 @@ JWT CLAIMS EXPECTED (from backend EmbedTokenService):
 - sub: user_id
 - tenant_id: active tenant
 - roles: list of role strings
-- allowed_tenants: list of accessible tenant IDs
+- allowed_tenants: list of accessible tenant IDs (only the active tenant
+  when tenant_group_id is set)
+- tenant_group_id: tenant group of an agency user; RLS resolves its members
+  server-side with group_members()
 - billing_tier: billing plan tier
 - dashboard_id: scoped dashboard
 - rls_filter: pre-computed RLS WHERE clause
 - iss: issuer ("ai-growth-analytics")
 - iat: issued at (unix timestamp)
 - exp: expiration (unix timestamp, max 60 min)
+
+Verified tokens and revoked JTIs are cached per process
+(security/token_cache.py), so the many chart/data requests of one
+dashboard load verify the JWT once.
 """
 
 import json
 import os
 import logging
+import re
 from datetime import datetime, timezone
 from typing import Optional
 
 import jwt as pyjwt
 import redis
 
+from security.token_cache import (
+    EMBED_AUTH_CACHE_ENABLED,
+    REVOKED_KEY_PREFIX,
+    RevocationSet,
+    VerifiedTokenCache,
+)
+
 logger = logging.getLogger(__name__)
 
 # Maximum allowed token lifetime (seconds) — enforced even if exp is further out
 MAX_TOKEN_LIFETIME_SECONDS = 3600  # 60 minutes
 
+# Tenant group ids are rendered into RLS SQL, so only this exact shape is accepted
+TENANT_GROUP_ID_PATTERN = re.compile(r"^tg_[0-9a-f]{32}$")
+
 # Redis connection for JTI revocation checks (lazy-initialized)
 _redis_client = None
 
@@ -55,14 +73,26 @@ def _get_redis() -> redis.Redis:
     return _redis_client
 
 
+# Per-process auth caches (see security/token_cache.py)
+_verified_tokens = VerifiedTokenCache()
+_revocations = RevocationSet(_get_redis)
+
+
 def is_jti_revoked(jti: str) -> bool:
-    """Check if a JTI has been revoked in Redis.
+    """Check if a JTI has been revoked.
+
+    Answered from the in-process revocation set while its Redis subscriber
+    is connected, otherwise from Redis directly.
 
     Returns False on Redis errors (fail-open) so that Redis outages
     do not lock out all embedded dashboard users.
     """
+    if EMBED_AUTH_CACHE_ENABLED:
+        # Started lazily so the subscriber thread is created after fork
+        _revocations.start()
+        return _revocations.is_revoked(jti)
     try:
-        return bool(_get_redis().exists(f"embed:revoked:{jti}"))
+        return bool(_get_redis().exists(f"{REVOKED_KEY_PREFIX}{jti}"))
     except Exception:
         logger.warning(
             "Redis unavailable for JTI revocation check - allowing token (fail-open)",
@@ -104,6 +134,7 @@ class EmbedUser:
     Exposes attributes consumed by Superset RLS Jinja templates in rls_rules.py:
     - current_user.tenant_id
     - current_user.allowed_tenants
+    - current_user.tenant_group_id
     - current_user.is_agency_user
 
     Implements Flask-Login user interface for Superset compatibility.
@@ -116,6 +147,7 @@ class EmbedUser:
         roles: list[str],
         allowed_tenants: list[str],
         billing_tier: str = "free",
+        tenant_group_id: Optional[str] = None,
     ):
         self.id = user_id
         self.username = user_id
@@ -123,7 +155,14 @@ class EmbedUser:
         self.roles = roles
         self.allowed_tenants = allowed_tenants if allowed_tenants else [tenant_id]
         self.billing_tier = billing_tier
-        self.is_agency_user = len(self.allowed_tenants) > 1
+        # Malformed group ids are dropped (RLS then uses allowed_tenants,
+        # which for group tokens holds only the active tenant)
+        self.tenant_group_id = (
+            tenant_group_id
+            if tenant_group_id and TENANT_GROUP_ID_PATTERN.match(tenant_group_id)
+            else None
+        )
+        self.is_agency_user = len(self.allowed_tenants) > 1 or bool(self.tenant_group_id)
 
         # Flask-Login interface
         self.is_authenticated = True
@@ -134,6 +173,11 @@ class EmbedUser:
         return self.id
 
     def __repr__(self) -> str:
+        if self.tenant_group_id:
+            return (
+                f"EmbedUser(id={self.id}, tenant={self.tenant_id}, "
+                f"agency=True, group={self.tenant_group_id})"
+            )
         if self.is_agency_user:
             return (
                 f"EmbedUser(id={self.id}, tenant={self.tenant_id}, "
@@ -205,6 +249,26 @@ def verify_embed_jwt(token: str) -> Optional[dict]:
     return None
 
 
+def verify_embed_jwt_cached(token: str) -> Optional[dict]:
+    """verify_embed_jwt() with per-process caching of verified tokens.
+
+    A token verified once is served from memory until its exp claim.
+    Failed verifications are never cached.
+    """
+    if not EMBED_AUTH_CACHE_ENABLED:
+        return verify_embed_jwt(token)
+
+    secrets = _get_jwt_secrets()
+    payload = _verified_tokens.get(token, secrets)
+    if payload is not None:
+        return payload
+
+    payload = verify_embed_jwt(token)
+    if payload is not None:
+        _verified_tokens.set(token, secrets, payload)
+    return payload
+
+
 def extract_token_from_request() -> Optional[str]:
     """Extract JWT token from a Flask request.
 
@@ -241,6 +305,7 @@ def authenticate_embed_request():
     - g.user: EmbedUser instance (accessed as current_user in Jinja)
     - g.tenant_id: active tenant ID
     - g.allowed_tenants: list of accessible tenant IDs
+    - g.tenant_group_id: tenant group of an agency user (or None)
     - g.rls_filter: pre-computed RLS WHERE clause
     """
     from flask import g, request, abort
@@ -265,7 +330,7 @@ def authenticate_embed_request():
         )
         abort(401, description="Authentication required")
 
-    payload = verify_embed_jwt(token)
+    payload = verify_embed_jwt_cached(token)
     if not payload:
         logger.warning(
             "Invalid or expired JWT",
@@ -301,6 +366,7 @@ def authenticate_embed_request():
         roles=payload.get("roles", []),
         allowed_tenants=payload.get("allowed_tenants", []),
         billing_tier=payload.get("billing_tier", "free"),
+        tenant_group_id=payload.get("tenant_group_id"),
     )
 
     # Validate tenant_id is in allowed_tenants (runtime guard)
@@ -324,6 +390,7 @@ def authenticate_embed_request():
     g.user = user
     g.tenant_id = user.tenant_id
     g.allowed_tenants = user.allowed_tenants
+    g.tenant_group_id = user.tenant_group_id
     g.rls_filter = payload.get("rls_filter")
     if not g.rls_filter:
         g.rls_filter = "1=0"  # Safe default if claim is missing
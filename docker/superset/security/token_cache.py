@@ -0,0 +1,263 @@
+"""
+Per-process caches for embed JWT authentication.
+
+A single embedded dashboard load fans out into dozens of chart and data
+requests carrying the same embed JWT. authenticate_embed_request runs for
+each of them, so this module keeps the two expensive steps off the hot path:
+
+- VerifiedTokenCache: payloads of tokens that passed verify_embed_jwt,
+  keyed by SHA-256 of the token (raw tokens are never held as keys) and
+  dropped at the token's exp. Cleared when the signing secrets change.
+- RevocationSet: revoked JTIs held in process. Loaded with a SCAN of
+  embed:revoked:* and kept current from the backend's publishes on
+  REVOCATION_CHANNEL (EmbedTokenStore.revoke_token), with a periodic full
+  resync in case a message was missed. While the subscriber is not
+  connected, lookups fall back to a Redis EXISTS per request (fail-open,
+  as before).
+
+Revocations therefore take effect as soon as the publish arrives (and
+within EMBED_REVOCATION_RESYNC_SECONDS at worst), while an authenticated
+request costs two dict lookups.
+
+Environment variables:
+    EMBED_AUTH_CACHE_ENABLED: Set to "false" to verify every request
+    EMBED_AUTH_CACHE_MAX_ENTRIES: Verified tokens kept per process (default 10000)
+    EMBED_REVOCATION_RESYNC_SECONDS: Full revocation resync interval (default 60)
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+EMBED_AUTH_CACHE_ENABLED = os.getenv("EMBED_AUTH_CACHE_ENABLED", "true").lower() == "true"
+EMBED_AUTH_CACHE_MAX_ENTRIES = int(os.getenv("EMBED_AUTH_CACHE_MAX_ENTRIES", "10000"))
+EMBED_REVOCATION_RESYNC_SECONDS = int(os.getenv("EMBED_REVOCATION_RESYNC_SECONDS", "60"))
+
+# Must match src/services/token_store.py in the backend
+REVOKED_KEY_PREFIX = "embed:revoked:"
+REVOCATION_CHANNEL = "embed:revocations"
+
+# Retry delay after the subscriber loses its Redis connection
+_RECONNECT_DELAY_SECONDS = 5
+_SCAN_BATCH_SIZE = 1000
+
+
+def token_cache_key(token: str) -> bytes:
+    """Cache key for a raw token."""
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of verified token payloads, each valid until its exp.
+
+    Thread-safe; only successful verifications are stored.
+    """
+
+    def __init__(self, max_entries: int = EMBED_AUTH_CACHE_MAX_ENTRIES):
+        self._max_entries = max_entries
+        # key -> (payload, exp)
+        self._entries: "OrderedDict[bytes, tuple[dict, float]]" = OrderedDict()
+        self._secrets_fingerprint: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+    def _check_secrets(self, secrets: list[str]) -> None:
+        """Drop every entry when the signing secrets change (rotation/removal)."""
+        fingerprint = hashlib.sha256("\0".join(secrets).encode()).digest()
+        if fingerprint != self._secrets_fingerprint:
+            self._entries.clear()
+            self._secrets_fingerprint = fingerprint
+
+    def get(self, token: str, secrets: list[str]) -> Optional[dict]:
+        """Cached payload for token, or None if not cached or expired."""
+        key = token_cache_key(token)
+        with self._lock:
+            self._check_secrets(secrets)
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            payload, exp = entry
+            if exp <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return payload
+
+    def set(self, token: str, secrets: list[str], payload: dict) -> None:
+        """Store a verified payload until its exp claim."""
+        exp = payload.get("exp")
+        if not isinstance(exp, (int, float)) or exp <= time.time():
+            return
+        key = token_cache_key(token)
+        with self._lock:
+            self._check_secrets(secrets)
+            self._entries[key] = (payload, float(exp))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RevocationSet:
+    """
+    Revoked JTIs held in process, kept current via Redis pub/sub.
+
+    Usage:
+        revocations = RevocationSet(get_redis_client)
+        revocations.start()
+        if revocations.is_revoked(jti): ...
+    """
+
+    def __init__(
+        self,
+        redis_factory: Callable,
+        resync_seconds: int = EMBED_REVOCATION_RESYNC_SECONDS,
+    ):
+        self._redis_factory = redis_factory
+        self._resync_seconds = resync_seconds
+        # jti -> (expires_at, added_at)
+        self._revoked: dict[str, tuple[float, float]] = {}
+        self._lock = threading.Lock()
+        self._live = False
+        self._started = False
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    @property
+    def live(self) -> bool:
+        """True while the local set is loaded and the subscriber is connected."""
+        return self._live
+
+    def start(self) -> None:
+        """Start the subscriber thread (idempotent; call after fork)."""
+        if self._started:
+            return
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+            self._thread = threading.Thread(
+                target=self._run, name="embed-revocation-subscriber", daemon=True,
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Whether jti is revoked.
+
+        Answered from the local set while live; otherwise falls back to a
+        Redis EXISTS, returning False on Redis errors (fail-open).
+        """
+        if self._live:
+            entry = self._revoked.get(jti)
+            return entry is not None and entry[0] > time.time()
+        try:
+            return bool(self._redis_factory().exists(f"{REVOKED_KEY_PREFIX}{jti}"))
+        except Exception:
+            logger.warning(
+                "Redis unavailable for JTI revocation check - allowing token (fail-open)",
+                extra={"jti": jti},
+            )
+            return False
+
+    def add(self, jti: str, ttl_seconds: float) -> None:
+        """Record a revocation (from a pub/sub message)."""
+        now = time.time()
+        with self._lock:
+            self._revoked[jti] = (now + max(ttl_seconds, 1), now)
+
+    # ------------------------------------------------------------------
+    # Subscriber
+    # ------------------------------------------------------------------
+
+    def resync(self, client) -> int:
+        """Replace the local set with a SCAN of embed:revoked:* keys."""
+        started_at = time.time()
+        scanned: dict[str, tuple[float, float]] = {}
+        batch: list[bytes] = []
+
+        def flush() -> None:
+            pipe = client.pipeline(transaction=False)
+            for key in batch:
+                pipe.ttl(key)
+            for key, ttl in zip(batch, pipe.execute()):
+                name = key.decode() if isinstance(key, bytes) else key
+                jti = name[len(REVOKED_KEY_PREFIX):]
+                # -1: no expiry; -2: expired between SCAN and TTL
+                if ttl == -2:
+                    continue
+                expires_at = started_at + (ttl if ttl and ttl > 0 else 86400)
+                scanned[jti] = (expires_at, started_at)
+            batch.clear()
+
+        for key in client.scan_iter(match=f"{REVOKED_KEY_PREFIX}*", count=_SCAN_BATCH_SIZE):
+            batch.append(key)
+            if len(batch) >= _SCAN_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+
+        with self._lock:
+            # Keep revocations published while the SCAN was running
+            for jti, entry in self._revoked.items():
+                if entry[1] >= started_at and jti not in scanned:
+                    scanned[jti] = entry
+            self._revoked = scanned
+        return len(scanned)
+
+    def _on_message(self, data) -> None:
+        try:
+            message = json.loads(data)
+            self.add(message["jti"], float(message.get("ttl", 86400)))
+        except Exception as e:
+            logger.warning(f"Bad embed revocation message: {e}")
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                client = self._redis_factory()
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                # Subscribe before scanning so no revocation falls in between
+                pubsub.subscribe(REVOCATION_CHANNEL)
+                count = self.resync(client)
+                self._live = True
+                logger.info("Embed revocation set loaded", extra={"revoked_count": count})
+                last_sync = time.time()
+
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        self._on_message(message["data"])
+                    if time.time() - last_sync >= self._resync_seconds:
+                        self.resync(client)
+                        last_sync = time.time()
+            except Exception:
+                logger.warning(
+                    "Embed revocation subscriber disconnected; checking Redis per request",
+                    exc_info=True,
+                )
+            finally:
+                self._live = False
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop.wait(_RECONNECT_DELAY_SECONDS)
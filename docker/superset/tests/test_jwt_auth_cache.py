@@ -0,0 +1,183 @@
+"""
+Tests for security/token_cache.py and cached embed JWT verification.
+
+Validates:
+- VerifiedTokenCache: expiry at exp, LRU bound, secret rotation
+- RevocationSet: SCAN load, pub/sub updates, Redis fallback when not live
+- verify_embed_jwt_cached: verifies once per token, never caches failures
+"""
+
+import json
+import sys
+import os
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt as pyjwt
+import pytest
+
+# Add parent directory to path for Superset module imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from security import jwt_auth
+from security.token_cache import RevocationSet, VerifiedTokenCache
+
+SECRET = "test-secret"
+
+
+def _token(secret=SECRET, lifetime=600, **claims):
+    now = int(time.time())
+    payload = {
+        "sub": "user_001",
+        "tenant_id": "tenant_abc",
+        "roles": ["merchant_admin"],
+        "iat": now,
+        "exp": now + lifetime,
+        **claims,
+    }
+    return pyjwt.encode(payload, secret, algorithm="HS256"), payload
+
+
+# =============================================================================
+# VERIFIED TOKEN CACHE
+# =============================================================================
+
+
+class TestVerifiedTokenCache:
+    """Test VerifiedTokenCache."""
+
+    def test_returns_payload_until_exp(self):
+        cache = VerifiedTokenCache()
+        cache.set("tok", [SECRET], {"sub": "u", "exp": time.time() + 60})
+
+        assert cache.get("tok", [SECRET])["sub"] == "u"
+        with patch("security.token_cache.time.time", return_value=time.time() + 61):
+            assert cache.get("tok", [SECRET]) is None
+
+    def test_expired_payload_not_stored(self):
+        cache = VerifiedTokenCache()
+        cache.set("tok", [SECRET], {"sub": "u", "exp": time.time() - 1})
+
+        assert len(cache) == 0
+
+    def test_bounded_lru(self):
+        cache = VerifiedTokenCache(max_entries=2)
+        exp = time.time() + 60
+        for tok in ("a", "b", "c"):
+            cache.set(tok, [SECRET], {"sub": tok, "exp": exp})
+
+        assert cache.get("a", [SECRET]) is None
+        assert cache.get("c", [SECRET])["sub"] == "c"
+
+    def test_secret_change_clears_cache(self):
+        cache = VerifiedTokenCache()
+        cache.set("tok", [SECRET, "old"], {"sub": "u", "exp": time.time() + 60})
+
+        assert cache.get("tok", [SECRET]) is None
+
+
+# =============================================================================
+# REVOCATION SET
+# =============================================================================
+
+
+def _redis_with_revoked(keys_to_ttl):
+    client = MagicMock()
+    client.scan_iter.return_value = list(keys_to_ttl)
+    pipe = MagicMock()
+    pipe.execute.return_value = list(keys_to_ttl.values())
+    client.pipeline.return_value = pipe
+    return client
+
+
+class TestRevocationSet:
+    """Test RevocationSet."""
+
+    def test_resync_loads_scanned_keys(self):
+        client = _redis_with_revoked({b"embed:revoked:jti-1": 300, b"embed:revoked:jti-2": -2})
+        revocations = RevocationSet(lambda: client)
+
+        assert revocations.resync(client) == 1
+        revocations._live = True
+
+        assert revocations.is_revoked("jti-1") is True
+        assert revocations.is_revoked("jti-2") is False
+        client.exists.assert_not_called()
+
+    def test_published_revocation_applies_locally(self):
+        client = _redis_with_revoked({})
+        revocations = RevocationSet(lambda: client)
+        revocations.resync(client)
+        revocations._live = True
+
+        revocations._on_message(json.dumps({"jti": "jti-9", "ttl": 60}))
+
+        assert revocations.is_revoked("jti-9") is True
+
+    def test_resync_keeps_revocations_published_during_scan(self):
+        client = _redis_with_revoked({})
+        revocations = RevocationSet(lambda: client)
+        client.scan_iter.side_effect = lambda **kw: (
+            revocations.add("jti-late", 60) or iter(())
+        )
+
+        revocations.resync(client)
+        revocations._live = True
+
+        assert revocations.is_revoked("jti-late") is True
+
+    def test_falls_back_to_redis_when_not_live(self):
+        client = MagicMock()
+        client.exists.return_value = 1
+        revocations = RevocationSet(lambda: client)
+
+        assert revocations.is_revoked("jti-1") is True
+        client.exists.assert_called_once_with("embed:revoked:jti-1")
+
+    def test_fail_open_when_redis_down(self):
+        client = MagicMock()
+        client.exists.side_effect = ConnectionError("down")
+        revocations = RevocationSet(lambda: client)
+
+        assert revocations.is_revoked("jti-1") is False
+
+
+# =============================================================================
+# CACHED VERIFICATION
+# =============================================================================
+
+
+class TestVerifyEmbedJwtCached:
+    """Test verify_embed_jwt_cached."""
+
+    @pytest.fixture(autouse=True)
+    def _env(self, monkeypatch):
+        monkeypatch.setenv("SUPERSET_JWT_SECRET_CURRENT", SECRET)
+        monkeypatch.delenv("SUPERSET_JWT_SECRET_PREVIOUS", raising=False)
+        monkeypatch.setattr(jwt_auth, "_verified_tokens", VerifiedTokenCache())
+
+    def test_verifies_once_per_token(self):
+        token, _ = _token()
+
+        with patch.object(jwt_auth, "verify_embed_jwt", wraps=jwt_auth.verify_embed_jwt) as verify:
+            first = jwt_auth.verify_embed_jwt_cached(token)
+            second = jwt_auth.verify_embed_jwt_cached(token)
+
+        assert first["sub"] == second["sub"] == "user_001"
+        assert verify.call_count == 1
+
+    def test_invalid_token_not_cached(self):
+        token, _ = _token(secret="wrong-secret")
+
+        assert jwt_auth.verify_embed_jwt_cached(token) is None
+        assert len(jwt_auth._verified_tokens) == 0
+
+    def test_rotated_out_secret_forces_reverification(self, monkeypatch):
+        monkeypatch.setenv("SUPERSET_JWT_SECRET_CURRENT", "new-secret")
+        monkeypatch.setenv("SUPERSET_JWT_SECRET_PREVIOUS", SECRET)
+        token, _ = _token()
+        assert jwt_auth.verify_embed_jwt_cached(token) is not None
+
+        monkeypatch.delenv("SUPERSET_JWT_SECRET_PREVIOUS")
+
+        assert jwt_auth.verify_embed_jwt_cached(token) is None
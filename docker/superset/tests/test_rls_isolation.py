@@ -23,6 +23,7 @@ from unittest.mock import MagicMock, patch
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from rls_rules import (
+    AGENCY_GROUP_CLAUSE_TEMPLATE,
     UserRoleType,
     DENY_BY_DEFAULT_CLAUSE,
     RLS_CLAUSE_TEMPLATES,
@@ -148,12 +149,13 @@ class TestPositiveAccess:
         assert "IN" not in clause
 
     def test_agency_sees_assigned_tenants(self, agency_context):
-        """CRITICAL: Agency user gets multi-tenant IN clause."""
+        """CRITICAL: Agency user gets the tenant group clause (IN-list fallback)."""
         clause = get_rls_clause_for_user(
             is_agency_user=agency_context["is_agency_user"],
             is_super_admin=agency_context["is_super_admin"],
         )
-        assert clause == "tenant_id IN ({{ current_user.allowed_tenants | tojson }})"
+        assert clause == AGENCY_GROUP_CLAUSE_TEMPLATE
+        assert "group_members('{{ current_user.tenant_group_id }}')" in clause
         assert "IN" in clause
 
     def test_super_admin_sees_all_data(self, super_admin_context):
@@ -530,6 +532,35 @@ class TestJWTIntegration:
         assert len(user.allowed_tenants) == 3
         assert user.billing_tier == "enterprise"
 
+    def test_embed_user_with_tenant_group(self):
+        """EmbedUser from a group token is an agency user scoped by group id."""
+        from security.jwt_auth import EmbedUser
+
+        user = EmbedUser(
+            user_id="user_agency_001",
+            tenant_id="tenant_abc",
+            roles=["agency_admin"],
+            allowed_tenants=["tenant_abc"],
+            tenant_group_id="tg_" + "0" * 32,
+        )
+        assert user.is_agency_user is True
+        assert user.tenant_group_id == "tg_" + "0" * 32
+
+    def test_embed_user_rejects_malformed_tenant_group(self):
+        """CRITICAL: Group ids are rendered into SQL, so malformed ones are dropped."""
+        from security.jwt_auth import EmbedUser
+
+        user = EmbedUser(
+            user_id="user_agency_001",
+            tenant_id="tenant_abc",
+            roles=["agency_admin"],
+            allowed_tenants=["tenant_abc"],
+            tenant_group_id="tg_x') OR 1=1 --",
+        )
+        assert user.tenant_group_id is None
+        assert user.allowed_tenants == ["tenant_abc"]
+        assert user.is_agency_user is False
+
     def test_embed_user_default_allowed_tenants(self):
         """EmbedUser with empty allowed_tenants defaults to [tenant_id]."""
         sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
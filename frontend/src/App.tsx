@@ -27,6 +27,7 @@ import { AgencyProvider } from './contexts/AgencyContext';
 import { Root } from './components/layout/Root';
 import { useAutoOrganization } from './hooks/useAutoOrganization';
 import { useClerkToken } from './hooks/useClerkToken';
+import { useLiveEventStream } from './hooks/useLiveEvents';
 import { useEntitlements } from './hooks/useEntitlements';
 import { isFeatureEntitled } from './services/entitlementsApi';
 import type { EntitlementsResponse } from './services/entitlementsApi';
@@ -136,6 +137,8 @@ function AuthenticatedApp() {
 function AppWithOrg() {
   const { isTokenReady } = useClerkToken();
   const { entitlements, loading: entitlementsLoading, error: entitlementsError, refetch: refetchEntitlements } = useEntitlements(isTokenReady);
+  // Push channel for counts and sync progress (replaces timer polling)
+  useLiveEventStream(isTokenReady);
 
   if (!isTokenReady) {
     return <SkeletonPage />;
@@ -10,6 +10,7 @@
 import { useEffect, useState } from 'react';
 import { Badge, Spinner, InlineStack, Text, Tooltip } from '@shopify/polaris';
 import { getPendingProposalsCount } from '../../services/actionProposalsApi';
+import { useLiveRefresh } from '../../hooks/useLiveEvents';
 
 interface PendingApprovalsBadgeProps {
   /**
@@ -18,6 +19,8 @@ interface PendingApprovalsBadgeProps {
   onClick?: () => void;
   /**
    * Refresh interval in milliseconds. Set to 0 to disable auto-refresh.
+   * Only used while the live event stream is down; otherwise the count
+   * is refetched when an "approvals" event arrives.
    * Default: 60000 (1 minute)
    */
   refreshInterval?: number;
@@ -56,12 +59,9 @@ export function PendingApprovalsBadge({
 
   useEffect(() => {
     fetchCount();
+  }, []);
 
-    if (refreshInterval > 0) {
-      const interval = setInterval(fetchCount, refreshInterval);
-      return () => clearInterval(interval);
-    }
-  }, [refreshInterval]);
+  useLiveRefresh('approvals', fetchCount, { pollIntervalMs: refreshInterval });
 
   if (isLoading) {
     return <Spinner size="small" />;
@@ -2,7 +2,8 @@
  * ChangelogBadge Component
  *
  * Displays a badge showing the count of unread changelog entries.
- * Auto-refreshes at a configurable interval.
+ * Refreshes on live changelog events, polling at a configurable interval
+ * only while the live event stream is down.
  *
  * Story 9.7 - In-App Changelog & Release Notes
  */
@@ -37,6 +38,7 @@ export function ChangelogBadge({
       fetchCount={fetchCount}
       onClick={onClick}
       refreshInterval={refreshInterval}
+      liveTopic="changelog"
       showLabel={showLabel}
       label={label}
       singularNoun="new update"
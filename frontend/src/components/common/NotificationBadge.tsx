@@ -9,6 +9,8 @@
 
 import { useState, useEffect, useCallback } from 'react';
 import { Badge, Spinner, InlineStack, Text, Tooltip } from '@shopify/polaris';
+import { useLiveRefresh } from '../../hooks/useLiveEvents';
+import type { LiveEventTopic } from '../../services/liveEvents';
 
 interface NotificationBadgeProps {
   /**
@@ -21,9 +23,15 @@ interface NotificationBadgeProps {
   onClick?: () => void;
   /**
    * Refresh interval in milliseconds. Set to 0 to disable auto-refresh.
+   * With liveTopic set, only used while the live event stream is down.
    * Default: 60000 (1 minute)
    */
   refreshInterval?: number;
+  /**
+   * Live event topic that signals the count changed. When set, the count
+   * is refetched on push instead of on a timer.
+   */
+  liveTopic?: LiveEventTopic;
   /**
    * Show text label alongside count.
    */
@@ -56,6 +64,7 @@ export function NotificationBadge({
   fetchCount,
   onClick,
   refreshInterval = 60000,
+  liveTopic,
   showLabel = false,
   label = 'Notifications',
   tone = 'attention',
@@ -81,12 +90,9 @@ export function NotificationBadge({
 
   useEffect(() => {
     loadCount();
+  }, [loadCount]);
 
-    if (refreshInterval > 0) {
-      const interval = setInterval(loadCount, refreshInterval);
-      return () => clearInterval(interval);
-    }
-  }, [loadCount, refreshInterval]);
+  useLiveRefresh(liveTopic ?? null, loadCount, { pollIntervalMs: refreshInterval });
 
   // Loading state
   if (isLoading && count === null) {
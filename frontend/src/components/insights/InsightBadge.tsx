@@ -17,6 +17,7 @@ interface InsightBadgeProps {
   onClick?: () => void;
   /**
    * Refresh interval in milliseconds. Set to 0 to disable auto-refresh.
+   * Only used while the live event stream is down.
    * Default: 60000 (1 minute)
    */
   refreshInterval?: number;
@@ -41,6 +42,7 @@ export function InsightBadge({
       fetchCount={getUnreadInsightsCount}
       onClick={onClick}
       refreshInterval={refreshInterval}
+      liveTopic="insights"
       showLabel={showLabel}
       label={label}
       singularNoun="unread insight"
@@ -80,6 +80,7 @@ export function AppHeader() {
             fetchCount={getUnreadInsightsCount}
             onClick={handleInsightsClick}
             refreshInterval={60000}
+            liveTopic="insights"
             singularNoun="insight"
             pluralNoun="insights"
             tone="info"
@@ -12,6 +12,7 @@ import { Button, Badge, Tooltip } from '@shopify/polaris';
 import { QuestionCircleIcon } from '@shopify/polaris-icons';
 import { WhatChangedPanel } from './WhatChangedPanel';
 import { hasCriticalIssues } from '../../services/whatChangedApi';
+import { useLiveRefresh } from '../../hooks/useLiveEvents';
 
 interface WhatChangedButtonProps {
   variant?: 'floating' | 'inline';
@@ -40,10 +41,13 @@ export function WhatChangedButton({
 
   useEffect(() => {
     checkCritical();
+  }, [checkCritical]);
 
-    const intervalId = setInterval(checkCritical, refreshInterval);
-    return () => clearInterval(intervalId);
-  }, [checkCritical, refreshInterval]);
+  // Recheck when a change that can affect health is pushed; poll while offline
+  useLiveRefresh('changes', checkCritical, {
+    pollIntervalMs: refreshInterval,
+    filter: (data) => data.critical === true || data.event_type === 'sync_completed',
+  });
 
   const handleClick = () => {
     setIsPanelOpen(true);
@@ -2,10 +2,10 @@
  * useDataSources Hooks
  *
  * QueryClientLite-based hooks for data source management:
- * - useDataSources: Connection list with 30s polling
+ * - useDataSources: Connection list, refreshed on pushed sync events (30s polling fallback)
  * - useDataSourceCatalog: Platform catalog (static)
  * - useConnection: Single connection detail
- * - useSyncProgress: Sync progress with 3s polling
+ * - useSyncProgress: Sync progress, pushed state changes plus polling while running
  * - useOAuthFlow: OAuth initiation mutation
  * - useDisconnectSource: Disconnect mutation with cache invalidation
  * - useSyncConfigMutation: Sync config mutation
@@ -18,6 +18,7 @@
 
 import { useCallback, useEffect, useRef } from 'react';
 import { useQueryLite, useMutationLite, useQueryClientLite } from './queryClientLite';
+import { useLiveEvent, useLiveEventsConnected, useLiveRefresh } from './useLiveEvents';
 import {
   getConnections,
   getAvailableSources,
@@ -51,7 +52,7 @@ const GLOBAL_SETTINGS_KEY = ['global-sync-settings'] as const;
 export { SOURCES_KEY, CATALOG_KEY, GLOBAL_SETTINGS_KEY };
 
 // =============================================================================
-// useDataSources — Connection list with 30s polling
+// useDataSources — Connection list, refreshed on sync events (30s polling fallback)
 // =============================================================================
 
 interface UseDataSourcesResult {
@@ -70,16 +71,10 @@ export function useDataSources(): UseDataSourcesResult {
     queryFn: getConnections,
   });
 
-  const refetchRef = useRef(query.refetch);
-  refetchRef.current = query.refetch;
-
-  // 30s polling interval
-  useEffect(() => {
-    const interval = setInterval(() => {
-      refetchRef.current().catch(() => {});
-    }, 30_000);
-    return () => clearInterval(interval);
-  }, []);
+  // Refetch on pushed sync state changes; 30s polling while the stream is down
+  useLiveRefresh('sync', () => query.refetch().catch(() => {}), {
+    pollIntervalMs: 30_000,
+  });
 
   const sources = query.data ?? [];
 
@@ -145,9 +140,14 @@ export function useConnection(connectionId: string): UseConnectionResult {
 }
 
 // =============================================================================
-// useSyncProgress — 3s polling when enabled, stops when not running
+// useSyncProgress — pushed state changes + polling when enabled, stops when not running
 // =============================================================================
 
+// Progress polling while a sync runs: fast without the live stream, slow
+// with it (state transitions arrive as "sync" events)
+const SYNC_PROGRESS_POLL_MS = 3_000;
+const SYNC_PROGRESS_LIVE_POLL_MS = 15_000;
+
 interface UseSyncProgressResult {
   progress: SyncProgress | null;
   isLoading: boolean;
@@ -167,7 +167,16 @@ export function useSyncProgress(connectionId: string, enabled: boolean): UseSync
   const statusRef = useRef(query.data?.status);
   statusRef.current = query.data?.status;
 
-  // 3s polling when enabled and status is still running
+  // Refetch immediately when this connection's sync job changes state
+  useLiveEvent(enabled ? 'sync' : null, (data) => {
+    if (data.connector_id === connectionId) {
+      refetchRef.current().catch(() => {});
+    }
+  });
+
+  const connected = useLiveEventsConnected();
+
+  // Poll while enabled and status is still running
   useEffect(() => {
     if (!enabled) return;
 
@@ -178,10 +187,10 @@ export function useSyncProgress(connectionId: string, enabled: boolean): UseSync
         return;
       }
       refetchRef.current().catch(() => {});
-    }, 3_000);
+    }, connected ? SYNC_PROGRESS_LIVE_POLL_MS : SYNC_PROGRESS_POLL_MS);
 
     return () => clearInterval(interval);
-  }, [enabled]);
+  }, [enabled, connected]);
 
   return {
     progress: query.data ?? null,
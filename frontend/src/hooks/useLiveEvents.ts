@@ -0,0 +1,98 @@
+/**
+ * Live Events Hooks
+ *
+ * React bindings for the live event stream (services/liveEvents):
+ * - useLiveEventStream: open/close the stream (call once at app root)
+ * - useLiveEventsConnected: current connection status
+ * - useLiveEvent: run a handler for each event on a topic
+ * - useLiveRefresh: refetch on events, poll only while disconnected
+ */
+
+import { useEffect, useRef, useState } from 'react';
+import {
+  isLiveEventsConnected,
+  startLiveEvents,
+  stopLiveEvents,
+  subscribeLiveEvent,
+  subscribeLiveEventsStatus,
+} from '../services/liveEvents';
+import type { LiveEventData, LiveEventTopic } from '../services/liveEvents';
+
+export function useLiveEventStream(enabled: boolean): void {
+  useEffect(() => {
+    if (!enabled) return;
+    startLiveEvents();
+    return () => stopLiveEvents();
+  }, [enabled]);
+}
+
+export function useLiveEventsConnected(): boolean {
+  const [connected, setConnected] = useState(isLiveEventsConnected);
+
+  useEffect(() => {
+    setConnected(isLiveEventsConnected());
+    return subscribeLiveEventsStatus(setConnected);
+  }, []);
+
+  return connected;
+}
+
+export function useLiveEvent(
+  topic: LiveEventTopic | null,
+  handler: (data: LiveEventData) => void,
+): void {
+  const handlerRef = useRef(handler);
+  handlerRef.current = handler;
+
+  useEffect(() => {
+    if (!topic) return;
+    return subscribeLiveEvent(topic, (data) => handlerRef.current(data));
+  }, [topic]);
+}
+
+interface UseLiveRefreshOptions {
+  /** Polling interval while the stream is down (0 disables polling). */
+  pollIntervalMs: number;
+  /** Only refresh for events this returns true for. */
+  filter?: (data: LiveEventData) => boolean;
+}
+
+/**
+ * Call refresh when an event arrives on topic, and once on (re)connect
+ * to pick up anything missed. Without a topic, or while the stream is
+ * disconnected, falls back to polling every pollIntervalMs.
+ */
+export function useLiveRefresh(
+  topic: LiveEventTopic | null,
+  refresh: () => unknown,
+  { pollIntervalMs, filter }: UseLiveRefreshOptions,
+): void {
+  const connected = useLiveEventsConnected();
+  const pushed = topic !== null && connected;
+
+  const refreshRef = useRef(refresh);
+  refreshRef.current = refresh;
+  const filterRef = useRef(filter);
+  filterRef.current = filter;
+
+  useLiveEvent(topic, (data) => {
+    if (!filterRef.current || filterRef.current(data)) {
+      refreshRef.current();
+    }
+  });
+
+  // Catch up on events missed while disconnected
+  const wasPushed = useRef(pushed);
+  useEffect(() => {
+    if (pushed && !wasPushed.current) {
+      refreshRef.current();
+    }
+    wasPushed.current = pushed;
+  }, [pushed]);
+
+  useEffect(() => {
+    if (pushed || pollIntervalMs <= 0) return;
+    const interval = setInterval(() => refreshRef.current(), pollIntervalMs);
+    return () => clearInterval(interval);
+  }, [pushed, pollIntervalMs]);
+}
@@ -0,0 +1,195 @@
+/**
+ * Live Events Stream Client
+ *
+ * One server-sent event stream per tab (GET /api/events/stream) replaces
+ * timer polling of counts and sync progress. The backend pushes refetch
+ * hints on these topics:
+ * - notifications: unread notification count changed (current user)
+ * - approvals: pending approvals count changed
+ * - sync: ingestion job state transition ({ job_id, connector_id, status })
+ * - changes: What Changed event recorded ({ event_type, critical })
+ * - insights: insights generated, read or dismissed ({ count })
+ * - changelog: current user's changelog read status changed
+ *
+ * Uses fetch streaming rather than EventSource so the Clerk bearer token
+ * can be sent. The server closes each stream after a few minutes; the
+ * client reconnects with a fresh token. While disconnected, consumers
+ * fall back to their polling intervals (see useLiveEvents).
+ */
+
+import { API_BASE_URL, createHeadersAsync } from './apiUtils';
+
+export type LiveEventTopic =
+  | 'notifications'
+  | 'approvals'
+  | 'sync'
+  | 'changes'
+  | 'insights'
+  | 'changelog';
+
+export type LiveEventData = Record<string, unknown>;
+
+type LiveEventHandler = (data: LiveEventData) => void;
+type StatusHandler = (connected: boolean) => void;
+
+const STREAM_PATH = '/api/events/stream';
+const MIN_RECONNECT_DELAY_MS = 3_000;
+const MAX_RECONNECT_DELAY_MS = 60_000;
+
+const topicHandlers = new Map<LiveEventTopic, Set<LiveEventHandler>>();
+const statusHandlers = new Set<StatusHandler>();
+
+let connected = false;
+let abortController: AbortController | null = null;
+let reconnectTimer: ReturnType<typeof setTimeout> | null = null;
+let reconnectDelayMs = MIN_RECONNECT_DELAY_MS;
+
+function setConnected(value: boolean): void {
+  if (connected === value) return;
+  connected = value;
+  statusHandlers.forEach((handler) => handler(value));
+}
+
+function dispatch(topic: string, rawData: string): void {
+  const handlers = topicHandlers.get(topic as LiveEventTopic);
+  if (!handlers || handlers.size === 0) return;
+
+  let data: LiveEventData = {};
+  try {
+    data = rawData ? JSON.parse(rawData) : {};
+  } catch {
+    return;
+  }
+  handlers.forEach((handler) => handler(data));
+}
+
+/**
+ * Parse complete SSE frames from the buffer; returns the unparsed tail.
+ */
+function consumeFrames(buffer: string): string {
+  let boundary = buffer.indexOf('\n\n');
+  while (boundary !== -1) {
+    const frame = buffer.slice(0, boundary);
+    buffer = buffer.slice(boundary + 2);
+
+    let eventName = 'message';
+    const dataLines: string[] = [];
+    for (const line of frame.split('\n')) {
+      if (line.startsWith(':')) continue; // keep-alive comment
+      if (line.startsWith('event:')) eventName = line.slice(6).trim();
+      else if (line.startsWith('data:')) dataLines.push(line.slice(5).trim());
+      else if (line.startsWith('retry:')) {
+        const retry = Number.parseInt(line.slice(6).trim(), 10);
+        if (!Number.isNaN(retry)) reconnectDelayMs = Math.max(retry, MIN_RECONNECT_DELAY_MS);
+      }
+    }
+
+    if (eventName === 'ready') {
+      setConnected(true);
+    } else {
+      dispatch(eventName, dataLines.join('\n'));
+    }
+    boundary = buffer.indexOf('\n\n');
+  }
+  return buffer;
+}
+
+async function runStream(controller: AbortController): Promise<void> {
+  const response = await fetch(`${API_BASE_URL}${STREAM_PATH}`, {
+    headers: await createHeadersAsync(),
+    signal: controller.signal,
+  });
+  if (!response.ok || !response.body) {
+    throw new Error(`Live events stream failed: ${response.status}`);
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  for (;;) {
+    const { done, value } = await reader.read();
+    if (done) return;
+    buffer = consumeFrames(buffer + decoder.decode(value, { stream: true }));
+  }
+}
+
+function scheduleReconnect(delayMs: number): void {
+  if (!abortController) return;
+  reconnectTimer = setTimeout(() => {
+    reconnectTimer = null;
+    connect();
+  }, delayMs);
+}
+
+function connect(): void {
+  const controller = new AbortController();
+  abortController = controller;
+
+  runStream(controller)
+    .then(() => {
+      // Server closed the stream at the end of its lifetime: reconnect now
+      setConnected(false);
+      reconnectDelayMs = MIN_RECONNECT_DELAY_MS;
+      if (abortController === controller) scheduleReconnect(0);
+    })
+    .catch(() => {
+      setConnected(false);
+      if (abortController === controller) {
+        scheduleReconnect(reconnectDelayMs);
+        reconnectDelayMs = Math.min(reconnectDelayMs * 2, MAX_RECONNECT_DELAY_MS);
+      }
+    });
+}
+
+/**
+ * Open the stream (idempotent). Call once authentication is ready.
+ */
+export function startLiveEvents(): void {
+  if (abortController) return;
+  if (typeof fetch === 'undefined' || typeof TextDecoder === 'undefined') return;
+  reconnectDelayMs = MIN_RECONNECT_DELAY_MS;
+  connect();
+}
+
+/**
+ * Close the stream and stop reconnecting (sign out / unmount).
+ */
+export function stopLiveEvents(): void {
+  const controller = abortController;
+  abortController = null;
+  if (reconnectTimer) {
+    clearTimeout(reconnectTimer);
+    reconnectTimer = null;
+  }
+  controller?.abort();
+  setConnected(false);
+}
+
+export function isLiveEventsConnected(): boolean {
+  return connected;
+}
+
+/**
+ * Register a handler for a topic. Returns an unsubscribe function.
+ */
+export function subscribeLiveEvent(topic: LiveEventTopic, handler: LiveEventHandler): () => void {
+  let handlers = topicHandlers.get(topic);
+  if (!handlers) {
+    handlers = new Set();
+    topicHandlers.set(topic, handlers);
+  }
+  handlers.add(handler);
+  return () => {
+    handlers?.delete(handler);
+  };
+}
+
+/**
+ * Register a handler for connection status changes. Returns an unsubscribe function.
+ */
+export function subscribeLiveEventsStatus(handler: StatusHandler): () => void {
+  statusHandlers.add(handler);
+  return () => {
+    statusHandlers.delete(handler);
+  };
+}
@@ -11,6 +11,7 @@ import userEvent from '@testing-library/user-event';
 import { AppProvider } from '@shopify/polaris';
 import '@shopify/polaris/build/esm/styles.css';
 
+import { getUnreadInsightsCount } from '../services/insightsApi';
 import { InsightCard } from '../components/insights/InsightCard';
 import { InsightBadge } from '../components/insights/InsightBadge';
 import { RecommendationCard } from '../components/recommendations/RecommendationCard';
@@ -81,6 +82,19 @@ vi.mock('../services/insightsApi', () => ({
   getUnreadInsightsCount: vi.fn().mockResolvedValue(5),
 }));
 
+// Connected live event stream; tests push events through liveHandlers
+const liveHandlers = vi.hoisted(
+  () => new Map<string, (data: Record<string, unknown>) => void>(),
+);
+vi.mock('../services/liveEvents', () => ({
+  isLiveEventsConnected: () => true,
+  subscribeLiveEventsStatus: () => () => {},
+  subscribeLiveEvent: (topic: string, handler: (data: Record<string, unknown>) => void) => {
+    liveHandlers.set(topic, handler);
+    return () => liveHandlers.delete(topic);
+  },
+}));
+
 describe('InsightCard', () => {
   describe('rendering', () => {
     it('displays insight summary and details', () => {
@@ -255,6 +269,26 @@ describe('InsightBadge', () => {
       expect(screen.getByText('My Insights')).toBeInTheDocument();
     });
   });
+
+  it('refreshes on an insights live event instead of polling', async () => {
+    vi.mocked(getUnreadInsightsCount).mockResolvedValueOnce(5).mockResolvedValueOnce(7);
+
+    renderWithPolaris(<InsightBadge refreshInterval={20} />);
+
+    await waitFor(() => {
+      expect(screen.getByText('5')).toBeInTheDocument();
+    });
+    // Stream is connected: the refresh interval does not poll
+    await new Promise((resolve) => setTimeout(resolve, 100));
+    expect(getUnreadInsightsCount).toHaveBeenCalledTimes(1);
+
+    liveHandlers.get('insights')?.({ count: 2 });
+
+    await waitFor(() => {
+      expect(screen.getByText('7')).toBeInTheDocument();
+    });
+    expect(getUnreadInsightsCount).toHaveBeenCalledTimes(2);
+  });
 });
 
 describe('RecommendationCard', () => {
@@ -0,0 +1,110 @@
+/**
+ * Tests for the live events stream client and hooks
+ *
+ * Covers SSE frame parsing and topic dispatch over a streamed fetch body,
+ * connection status, and useLiveRefresh falling back to polling while
+ * the stream is down.
+ */
+
+import { renderHook, waitFor, act } from '@testing-library/react';
+import { afterEach, describe, expect, it, vi } from 'vitest';
+
+vi.mock('../services/apiUtils', () => ({
+  API_BASE_URL: '',
+  createHeadersAsync: vi.fn().mockResolvedValue({ Authorization: 'Bearer test' }),
+}));
+
+import {
+  isLiveEventsConnected,
+  startLiveEvents,
+  stopLiveEvents,
+  subscribeLiveEvent,
+} from '../services/liveEvents';
+import { useLiveRefresh } from '../hooks/useLiveEvents';
+
+function streamResponse(chunks: string[]): Response {
+  const encoder = new TextEncoder();
+  const body = new ReadableStream<Uint8Array>({
+    start(controller) {
+      chunks.forEach((chunk) => controller.enqueue(encoder.encode(chunk)));
+      // Leave the stream open, like a live server
+    },
+  });
+  return new Response(body, { status: 200, headers: { 'Content-Type': 'text/event-stream' } });
+}
+
+afterEach(() => {
+  stopLiveEvents();
+  vi.restoreAllMocks();
+  vi.useRealTimers();
+});
+
+describe('live events stream', () => {
+  it('dispatches topic events split across chunks', async () => {
+    vi.spyOn(globalThis, 'fetch').mockResolvedValue(
+      streamResponse([
+        'retry: 3000\nevent: ready\ndata: {}\n\n: keepalive\n\nevent: sy',
+        'nc\ndata: {"connector_id": "conn-1", "status": "success"}\n\n',
+      ]),
+    );
+    const handler = vi.fn();
+    const unsubscribe = subscribeLiveEvent('sync', handler);
+
+    startLiveEvents();
+
+    await waitFor(() => expect(handler).toHaveBeenCalledTimes(1));
+    expect(handler).toHaveBeenCalledWith({ connector_id: 'conn-1', status: 'success' });
+    expect(isLiveEventsConnected()).toBe(true);
+    expect(fetch).toHaveBeenCalledWith(
+      '/api/events/stream',
+      expect.objectContaining({ headers: { Authorization: 'Bearer test' } }),
+    );
+    unsubscribe();
+  });
+
+  it('reports disconnected after stop', async () => {
+    vi.spyOn(globalThis, 'fetch').mockResolvedValue(streamResponse(['event: ready\ndata: {}\n\n']));
+
+    startLiveEvents();
+    await waitFor(() => expect(isLiveEventsConnected()).toBe(true));
+
+    stopLiveEvents();
+    expect(isLiveEventsConnected()).toBe(false);
+  });
+});
+
+describe('useLiveRefresh', () => {
+  it('polls while the stream is down', () => {
+    vi.useFakeTimers();
+    const refresh = vi.fn();
+
+    renderHook(() => useLiveRefresh('approvals', refresh, { pollIntervalMs: 1000 }));
+
+    act(() => {
+      vi.advanceTimersByTime(3000);
+    });
+    expect(refresh).toHaveBeenCalledTimes(3);
+  });
+
+  it('refreshes on matching pushed events instead of polling', async () => {
+    vi.spyOn(globalThis, 'fetch').mockResolvedValue(
+      streamResponse([
+        'event: ready\ndata: {}\n\n',
+        'event: changes\ndata: {"critical": false}\n\n',
+        'event: changes\ndata: {"critical": true}\n\n',
+      ]),
+    );
+    const refresh = vi.fn();
+
+    renderHook(() =>
+      useLiveRefresh('changes', refresh, {
+        pollIntervalMs: 60_000,
+        filter: (data) => data.critical === true,
+      }),
+    );
+    startLiveEvents();
+
+    // One catch-up refresh on connect, one for the critical event
+    await waitFor(() => expect(refresh).toHaveBeenCalledTimes(2));
+  });
+});